@@ -1,18 +1,36 @@
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, Response, g, request, jsonify
 from flask_cors import CORS
 import requests
-from bs4 import BeautifulSoup
 import os
-from datetime import datetime, timezone
-import aisuite as ai
+from datetime import datetime, timedelta, timezone
+import hashlib
 import json
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
-import pickle
 import logging
+import re
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from urllib.parse import urlsplit
 from dotenv import load_dotenv
+from googleapiclient.errors import HttpError
+from batch_parse import BatchParser
+from calendar_batch import batch_insert_events
+from calendar_mirror import CalendarMirror, FullSyncRequired, event_fingerprint, to_utc
+from event_prompt import EVENT_SYSTEM_PROMPT, FIELD_DESCRIPTIONS, event_prompt
+from exporters import WRITERS, get_writer, iter_export_events
+from fetcher import fetcher_from_env
+from ics_import import ICSError, ICSImporter, parse_day, read_chunks
+from job_queue import QueueFull, queue_from_env
+from llm_client import LLMClient, LLMOutputError, ModelCascade, fields_schema
+import metrics
+from parse_cache import cache_from_env, make_cache_key
+from resilience import UpstreamUnavailable, upstreams_from_env
+from static_assets import IMMUTABLE_PREFIX, StaticAssets
+from structured_data import EVENT_FIELDS, extract_structured_event, summarize_description
+from tenants import tenants_from_env
+from text_extract import extract_text
+from watcher import changed_materially, watcher_from_env
 
 # Load environment variables from .env file
 load_dotenv()
@@ -20,53 +38,154 @@ load_dotenv()
 # Get environment variables
 ANTHROPIC_API_KEY = os.getenv('ANTHROPIC_API_KEY')
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+# Set up logging; every line carries the id of the request it belongs to
+log_handler = logging.StreamHandler()
+log_handler.addFilter(metrics.RequestIdFilter())
+logging.basicConfig(
+    level=logging.INFO, format='%(levelname)s:%(name)s:%(request_id)s:%(message)s', handlers=[log_handler]
+)
 logger = logging.getLogger(__name__)
 
+# Prometheus metrics, served on /metrics
+metrics_registry = metrics.Registry()
+stage_seconds = metrics_registry.histogram(
+    'cohere_stage_seconds', 'Time spent in each pipeline stage', ['stage']
+)
+request_seconds = metrics_registry.histogram(
+    'cohere_http_request_seconds', 'API request latency', ['endpoint', 'method', 'status']
+)
+fetch_outcomes = metrics_registry.counter(
+    'cohere_page_fetch_total', 'Page fetches by outcome', ['outcome']
+)
+llm_call_seconds = metrics_registry.histogram(
+    'cohere_llm_call_seconds', 'Latency of each model tier call', ['style', 'model', 'outcome']
+)
+llm_tokens = metrics_registry.counter(
+    'cohere_llm_tokens_total', 'Tokens used per model tier', ['style', 'model', 'kind']
+)
+
+def record_llm_call(style, model, seconds, outcome, usage):
+    llm_call_seconds.observe(seconds, style, model, outcome)
+    for kind, count in usage.items():
+        llm_tokens.inc(style, model, kind.replace('_tokens', ''), amount=count)
+
 # Initialize Flask app
-app = Flask(__name__, static_folder='dist', static_url_path='')
+app = Flask(__name__, static_folder=None)
 app.config['TESTING'] = True
 
+# The built frontend (vite writes it to backend/dist), served from memory
+frontend_assets = StaticAssets(os.path.join(app.root_path, 'dist'))
+
+@app.before_request
+def start_request():
+    # Callers such as the bot pass their own id so one message can be traced end to end
+    g.request_id = request.headers.get('X-Request-ID') or metrics.new_request_id()
+    g.request_id_token = metrics.request_id_var.set(g.request_id)
+    g.request_started = time.perf_counter()
+    # Which calendar the request is for, by API key or, for the bot, by chat
+    g.tenant = tenants.resolve(request.headers.get('X-API-Key'), request.headers.get('X-Chat-ID'))
+    if g.tenant is None:
+        return jsonify({'error': 'Unknown API key'}), 401
+
+@app.after_request
+def finish_request(response):
+    endpoint = request.url_rule.rule if request.url_rule else 'unmatched'
+    request_seconds.observe(
+        time.perf_counter() - g.request_started, endpoint, request.method, str(response.status_code)
+    )
+    response.headers['X-Request-ID'] = g.request_id
+    if response.status_code == 503 and 'Retry-After' not in response.headers:
+        # Bodies built by upstream_error_response say when the upstream is worth trying again
+        retry_after = (response.get_json(silent=True) or {}).get('retry_after')
+        if retry_after:
+            response.headers['Retry-After'] = str(retry_after)
+    return response
+
+@app.teardown_request
+def end_request(exc):
+    token = g.pop('request_id_token', None)
+    if token is not None:
+        metrics.request_id_var.reset(token)
+
 @app.route('/')
 def serve_frontend():
-    return app.send_static_file('index.html')
+    return frontend_assets.response('index.html', request) or ({'error': 'Frontend not built'}, 404)
 
 # Catch all routes to handle React Router
 @app.route('/<path:path>')
 def catch_all(path):
     if path.startswith('api/'):
         return {'error': 'Not found'}, 404
-    return app.send_static_file('index.html')
+    response = frontend_assets.response(path, request)
+    if response is not None:
+        return response
+    if path.startswith(IMMUTABLE_PREFIX):
+        # An asset from an older build; the SPA page would only confuse the browser
+        return {'error': 'Not found'}, 404
+    return serve_frontend()
 
-# If modifying these scopes, delete the file token.pickle.
-SCOPES = ['https://www.googleapis.com/auth/calendar']
+# Calendars served, with their time zones and Google tokens; clients are pooled per tenant and built on first use
+tenants = tenants_from_env()
+BULK_CREATE_MAX_EVENTS = int(os.getenv('BULK_CREATE_MAX_EVENTS', 500))
+ICS_IMPORT_MAX_EVENTS = int(os.getenv('ICS_IMPORT_MAX_EVENTS', 5000))
+ICS_IMPORT_BATCH_SIZE = int(os.getenv('ICS_IMPORT_BATCH_SIZE', 100))
+ICS_IMPORT_DAYS = int(os.getenv('ICS_IMPORT_DAYS', 365))
 
-def get_calendar_service():
-    creds = None
-    if os.path.exists('token.pickle'):
-        with open('token.pickle', 'rb') as token:
-            creds = pickle.load(token)
-    
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-        else:
-            flow = InstalledAppFlow.from_client_secrets_file(
-                'credentials.json', SCOPES)
-            creds = flow.run_local_server(port=0)
-        with open('token.pickle', 'wb') as token:
-            pickle.dump(creds, token)
-    
-    return build('calendar', 'v3', credentials=creds)
-
-# Initialize calendar service if credentials exist
-calendar_service = None
-try:
-    if os.path.exists('credentials.json'):
-        calendar_service = get_calendar_service()
-except Exception as e:
-    logger.warning(f"Failed to initialize calendar service: {e}")
+# Local copy of the calendar, used for listing and to skip duplicates
+calendar_mirror = CalendarMirror(
+    os.getenv('CALENDAR_MIRROR_PATH', 'calendar_mirror.sqlite3'), tenants.default.timezone,
+    history_days=int(os.getenv('CALENDAR_MIRROR_HISTORY_DAYS', 30))
+)
+CALENDAR_SYNC_INTERVAL = int(os.getenv('CALENDAR_SYNC_INTERVAL', 300))
+# Seconds clients are asked to wait while a calendar copy loads for the first time
+CALENDAR_FULL_SYNC_RETRY_AFTER = 10
+# Tenants whose calendar copy is being fully synced in the background
+full_syncs = set()
+full_syncs_lock = threading.Lock()
+
+FEED_EXTENSIONS = {writer.extension: name for name, writer in WRITERS.items()}
+# Channel link of the RSS feed; without it each host the feed is requested at gets its own
+FEED_LINK = os.getenv('FEED_LINK')
+# Last rendered body per tenant, feed format and RSS link, reused until the mirror version changes
+FEED_CACHE_MAX_ENTRIES = 64
+feed_cache = OrderedDict()
+feed_cache_lock = threading.Lock()
+
+# Rate limits, retries and circuit breakers for the LLM, page hosts and Calendar
+upstreams = upstreams_from_env()
+
+# Parsed results keyed by URL, page text and description style
+parse_cache = cache_from_env()
+
+# Upper bound on page text sent to the AI, in approximate tokens
+PROMPT_MAX_TOKENS = int(os.getenv('PROMPT_MAX_TOKENS', 6000))
+
+# Pooled HTTP client used for every page fetch
+page_fetcher = fetcher_from_env()
+
+# One LLM client, and its connection pool, shared by every parse
+llm_client = LLMClient(upstreams=upstreams)
+LLM_MODEL = os.getenv('LLM_MODEL', 'anthropic:claude-3-5-sonnet-20240620')
+LLM_MAX_TOKENS = int(os.getenv('LLM_MAX_TOKENS', 5000))
+LLM_FAST_MODEL = os.getenv('LLM_FAST_MODEL', 'anthropic:claude-3-5-haiku-20241022')
+
+# (model, max_tokens) tiers per description style, cheapest first
+LLM_TIERS = {
+    'default': [(LLM_FAST_MODEL, 2000), (LLM_MODEL, LLM_MAX_TOKENS)],
+    'telegram': [(LLM_FAST_MODEL, 800), (LLM_MODEL, 1500)],
+}
+LLM_TIERS.update(json.loads(os.getenv('LLM_TIERS', '{}')))
+LLM_TIERS = {
+    style: [tuple(tier) for tier in tiers if tier[0]] for style, tiers in LLM_TIERS.items()
+}
+llm_cascade = ModelCascade(llm_client, LLM_TIERS, on_call=record_llm_call)
+
+# Caps AI parses running at once across all requests in this process
+llm_slots = threading.BoundedSemaphore(int(os.getenv('LLM_CONCURRENCY', 4)))
+
+# How each parse was served (structured data, AI, cache)
+parse_path_counts = Counter()
+parse_path_lock = threading.Lock()
 
 def validate_event_details(event_details):
     """Validate the parsed event details and return any issues."""
@@ -103,211 +222,605 @@ def validate_event_details(event_details):
         logger.error(f"Validation error: {str(e)}")
         return {'errors': [str(e)], 'warnings': []}
 
-def parse_event_with_ai(page_content, source_url, description_style="default"):
-    client = ai.Client()
-    
-    description_prompts = {
-        "default": "A comprehensive description that includes all relevant details about the event. Include any important information like agenda, speakers, requirements, or special notes.",
-        "telegram": "A brief, concise summary of the event (2-3 sentences max) highlighting only the most important details. Focus on what, when, and why someone might want to attend."
-    }
-    
-    description_prompt = description_prompts.get(description_style, description_prompts["default"])
-    
-    prompt = f"""Extract event details from the following webpage content and return ONLY a JSON object with these fields:
-    - title: event title
-    - description: {description_prompt} Start the description with 'Source: {source_url}\n\n' followed by the description.
-    - start_time: start time in ISO format
-    - end_time: end time in ISO format
-    - location: event location
+# Lists every field whatever is requested, so the tool definition is part of the static prompt prefix
+EVENT_SCHEMA = fields_schema(FIELD_DESCRIPTIONS, required=[])
 
-    IMPORTANT: Return ONLY the JSON object with NO explanatory text before or after. The response must be valid JSON that can be parsed directly.
+def parse_event_with_ai(page_content, source_url, description_style="default", fields=None, known_details=None,
+                        temperature=0.5):
+    """Ask the AI for event details. `fields` limits the request to the missing
+    fields; `known_details` are values already found on the page, given as context.
 
-    Webpage content:
-    {page_content}
+    Returns an LLMResult whose `details` is a dict of the requested fields.
     """
+    requested = list(fields or EVENT_FIELDS)
+    prompt = event_prompt(page_content, source_url, description_style, requested, known_details)
     
-    messages = [{
-        "role": "system",
-        "content": "You are an AI assistant that helps users parse events from webpages. Return ONLY valid JSON with the specified fields, with no additional text. Use ISO format for dates (YYYY-MM-DDTHH:MM:SS+HH:MM). For descriptions, be comprehensive and include all relevant details from the source, properly formatted for readability."
-    }]
-    
-    messages.append({
-        "role": "user",
-        "content": prompt
-    })
+    def validate(details):
+        return validate_event_details({**details, **(known_details or {})})['errors']
     
     try:
-        response = client.chat.completions.create(
-            messages=messages,
-            model="anthropic:claude-3-5-sonnet-20240620",
-            max_tokens=5000,
-            temperature=0.5
+        result, model = llm_cascade.extract(
+            description_style, EVENT_SYSTEM_PROMPT, prompt, EVENT_SCHEMA,
+            temperature=temperature, validate=validate, fields=requested
         )
-        
-        # Clean up the response to extract just the JSON object
-        content = response.choices[0].message.content.strip()
-        
-        return content
+        logger.info(f"Parsed with {model}")
+        return result
     except Exception as e:
-        logger.error(e)
         logger.error(f"AI parsing error: {str(e)}")
         raise
 
-def clean_json_response(content):
-    """Clean up AI response to extract just the JSON object"""
-    content = content.strip()
-    
-    # Remove common LLM prefixes
-    prefixes_to_remove = [
-        "Here is the JSON object with the extracted event details:",
-        "Here's the JSON object:",
-        "Here is a JSON object with the extracted event details:",
-        "Here is the event information in JSON format:",
-        "The extracted event details in JSON format:"
-    ]
-    
-    for prefix in prefixes_to_remove:
-        if content.lower().startswith(prefix.lower()):
-            content = content[len(prefix):].strip()
-    
-    # Remove any markdown code block formatting
-    if content.startswith("```json"):
-        content = content[7:]
-    if content.startswith("```"):
-        content = content[3:]
-    if content.endswith("```"):
-        content = content[:-3]
-    
-    return content.strip()
-
 def get_page_content(url):
     """Fetch webpage content"""
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.9',
-        'Accept-Encoding': 'gzip, deflate, br',
-        'Cache-Control': 'no-cache',
-        'Pragma': 'no-cache',
-        'sec-ch-ua': '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
-        'sec-ch-ua-mobile': '?0',
-        'sec-ch-ua-platform': '"macOS"',
-        'Sec-Fetch-Dest': 'document',
-        'Sec-Fetch-Mode': 'navigate',
-        'Sec-Fetch-Site': 'none',
-        'Sec-Fetch-User': '?1',
-        'Upgrade-Insecure-Requests': '1',
-        'Referer': 'https://app.actualize.earth/',
-        'Origin': 'https://app.actualize.earth',
-        'Host': 'app.actualize.earth',
-        'Connection': 'keep-alive'
-    }
+    host = (urlsplit(url).hostname or '').lower()
+    try:
+        with metrics.timed(stage_seconds, 'fetch'):
+            result = upstreams.call(f'fetch:{host}', lambda: page_fetcher.fetch(url))
+    except UpstreamUnavailable:
+        fetch_outcomes.inc('unavailable')
+        raise
+    except Exception:
+        fetch_outcomes.inc('error')
+        raise
+    fetch_outcomes.inc('not_modified' if result.not_modified else 'truncated' if result.truncated else 'ok')
+    return result.text
 
-    # Customize headers based on the domain
-    domain = url.split('/')[2]
-    if domain != 'app.actualize.earth':
-        # Remove site-specific headers for other domains
-        headers.pop('Referer', None)
-        headers.pop('Origin', None)
-        headers.pop('Host', None)
+def extract_text_content(page_content):
+    """Extract readable text from a page, one block per line"""
+    return extract_text(page_content, max_tokens=PROMPT_MAX_TOKENS)
 
-    session = requests.Session()
-    try:
-        response = session.get(url, headers=headers, allow_redirects=True)
-        response.raise_for_status()
-        return response.text
-    except requests.exceptions.SSLError:
-        logger.warning(f"SSL verification failed for {url}, retrying without verification")
-        # If SSL verification fails, try again without verification
-        response = session.get(url, headers=headers, allow_redirects=True, verify=False)
-        response.raise_for_status()
-        return response.text
+def structured_event_details(structured, url, description_style='default'):
+    """Format fields from a page's structured data the way the AI returns them"""
+    details = dict(structured)
+    if details.get('description'):
+        description = details['description']
+        if description_style == 'telegram':
+            description = summarize_description(description)
+        details['description'] = f"Source: {url}\n\n{description}"
+    return details
 
-@app.route('/parse-event', methods=['POST'])
-def parse_event():
-    url = request.json.get('url')
-    description_style = request.json.get('description_style', 'default')
-    if not url:
-        return jsonify({'error': 'URL is required'}), 400
+def validation_response(parsed_details):
+    """Validate parsed event details and build the (response body, status code) tuple"""
+    with metrics.timed(stage_seconds, 'validate'):
+        validation_result = validate_event_details(parsed_details)
     
+    if validation_result['errors']:
+        logger.warning(f"Validation issues found: {validation_result}")
+        return {
+            'error': 'Event parsing issues detected',
+            'issues': validation_result['errors'],
+            'warnings': validation_result['warnings'],
+            'parsed_details': parsed_details  # Include the parsed details even if there are issues
+        }, 422
+    
+    # If we only have warnings, return 200 with warnings
+    if validation_result['warnings']:
+        logger.info(f"Validation warnings found: {validation_result['warnings']}")
+        return {
+            'warnings': validation_result['warnings'],
+            **parsed_details
+        }, 200
+    
+    return parsed_details, 200
+
+def parse_event_text(text_content, url, description_style='default', known_details=None, temperature=0.5):
+    """Parse and validate event details from page text.
+
+    Fields in `known_details` are kept as-is and only the rest are requested from
+    the AI. Returns a (response body, status code) tuple in the shape served by
+    /parse-event.
+    """
+    known_details = known_details or {}
+    missing_fields = [field for field in EVENT_FIELDS if field not in known_details]
+    event_details = None
     try:
-        # Fetch webpage content
-        logger.info(f"Fetching content from URL: {url}")
-        page_content = get_page_content(url)
-        
-        soup = BeautifulSoup(page_content, 'html.parser')
-        
-        # Get text content, preserving some structure
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
-            
-        # Get text with some basic formatting preserved
-        lines = []
-        for element in soup.find_all(['p', 'div', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'li']):
-            text = element.get_text(strip=True)
-            if text:  # Only add non-empty lines
-                lines.append(text)
-        
-        text_content = "\n\n".join(lines)  # Join with double newlines for better separation
-        
         # Use AI to parse the event details
-        logger.info("Parsing event details with AI")
-        event_details = parse_event_with_ai(text_content, url, description_style)
-        
-        # Clean up and parse the JSON response
+        logger.info(f"Parsing event details with AI: {missing_fields}")
         try:
-            cleaned_response = clean_json_response(event_details)
-            parsed_details = json.loads(cleaned_response)
-            logger.info(f"Successfully parsed JSON: {parsed_details}")
-        except json.JSONDecodeError as e:
+            with metrics.timed(stage_seconds, 'llm_queue'):
+                llm_slots.acquire()
+            try:
+                with metrics.timed(stage_seconds, 'llm'):
+                    result = parse_event_with_ai(
+                        text_content, url, description_style,
+                        fields=missing_fields, known_details=known_details, temperature=temperature
+                    )
+            finally:
+                llm_slots.release()
+        except LLMOutputError as e:
             logger.error(f"Failed to parse JSON: {str(e)}")
-            return jsonify({
+            return {
                 'error': 'Invalid JSON response from AI',
                 'details': str(e),
-                'raw_response': event_details,
-                'cleaned_response': cleaned_response if 'cleaned_response' in locals() else None
-            }), 422
-        
-        # Validate the parsed details
-        validation_result = validate_event_details(parsed_details)
-        
-        if validation_result['errors']:
-            logger.warning(f"Validation issues found: {validation_result}")
-            return jsonify({
-                'error': 'Event parsing issues detected',
-                'issues': validation_result['errors'],
-                'warnings': validation_result['warnings'],
-                'parsed_details': parsed_details  # Include the parsed details even if there are issues
-            }), 422
-        
-        # If we only have warnings, return 200 with warnings
-        if validation_result['warnings']:
-            logger.info(f"Validation warnings found: {validation_result['warnings']}")
-            return jsonify({
-                'warnings': validation_result['warnings'],
-                **parsed_details
-            })
+                'raw_response': e.raw
+            }, 422
+        event_details = result.raw
+        parsed_details = result.details
+        logger.info(f"Successfully parsed JSON: {parsed_details}")
         
-        return jsonify(parsed_details)
+        return validation_response({**parsed_details, **known_details})
         
-    except requests.RequestException as e:
+    except UpstreamUnavailable as e:
+        return upstream_error_response(e)
+    except Exception as e:
+        logger.error(f"Event parsing error: {str(e)}")
+        return {
+            'error': 'Failed to parse event details',
+            'details': str(e),
+            'raw_response': event_details
+        }, 500
+
+def fetch_event_page(url):
+    """Fetch a webpage and collect what the parse stage needs from it.
+
+    Returns the fields found in the page's structured data and, unless those
+    already describe the whole event, the page's extracted text.
+    """
+    logger.info(f"Fetching content from URL: {url}")
+    page_content = get_page_content(url)
+    with metrics.timed(stage_seconds, 'structured_data'):
+        structured = extract_structured_event(page_content)
+    text_content = None
+    if len(structured) < len(EVENT_FIELDS):
+        with metrics.timed(stage_seconds, 'extract_text'):
+            text_content = extract_text_content(page_content)
+    return {'structured': structured, 'text': text_content}
+
+def upstream_error_response(e, error=None):
+    """Map an UpstreamUnavailable to a 503 (response body, status code) tuple"""
+    logger.warning(f"Upstream unavailable: {str(e)}")
+    return {
+        'error': error or f'{e.upstream} is temporarily unavailable, try again later',
+        'details': str(e),
+        'upstream': e.upstream,
+        'retry_after': max(1, int(e.retry_after + 0.999))
+    }, 503
+
+def fetch_error_response(e):
+    """Map a failure while fetching a page to a (response body, status code) tuple"""
+    if isinstance(e, UpstreamUnavailable):
+        return upstream_error_response(e, 'Failed to fetch webpage, try again later')
+    if isinstance(e, requests.RequestException):
         logger.error(f"URL fetch error: {str(e)}")
-        return jsonify({
+        return {
             'error': 'Failed to fetch webpage',
             'details': str(e)
-        }), 400
+        }, 400
+    logger.error(f"Event parsing error: {str(e)}")
+    return {
+        'error': 'Failed to parse event details',
+        'details': str(e),
+        'raw_response': None
+    }, 500
+
+def record_parse_path(path):
+    with parse_path_lock:
+        parse_path_counts[path] += 1
+
+def parse_event_page(page, url, description_style='default', temperature=0.5):
+    """Parse a fetched page, skipping the AI when structured data is enough.
+
+    Returns (response body, status code, path), where path says what served the
+    request: 'structured', 'structured+llm', 'llm' or 'cache'. A successful
+    body carries the page's `page_hash`, which /create-event hands to the
+    event's watch as the version of the page the event was parsed from.
+    """
+    known_details = structured_event_details(page['structured'], url, description_style)
+    if page['text'] is None:
+        logger.info("Event details found in structured data, skipping AI")
+        body, status = validation_response(known_details)
+        record_parse_path('structured')
+        return with_page_hash(body, status, page), status, 'structured'
+    
+    path = 'structured+llm' if known_details else 'llm'
+    computed = []
+    
+    def compute():
+        computed.append(True)
+        return parse_event_text(page['text'], url, description_style, known_details, temperature)
+    
+    # Identical page content for the same link and style is only sent to the AI once
+    cache_key = make_cache_key(url, page['text'], description_style, json.dumps(known_details, sort_keys=True))
+    body, status = parse_cache.get_or_compute(
+        cache_key, compute, cacheable=lambda result: result[1] == 200
+    )
+    if not computed:
+        path = 'cache'
+    record_parse_path(path)
+    return with_page_hash(body, status, page), status, path
+
+def with_page_hash(body, status, page):
+    # A copy, since the body may be the parse cache's own
+    return {**body, 'page_hash': page_hash(page)} if status == 200 else body
+
+batch_parser = BatchParser(
+    fetch=fetch_event_page,
+    parse=parse_event_page,
+    on_fetch_error=fetch_error_response,
+    fetch_workers=int(os.getenv('BATCH_FETCH_WORKERS', 16)),
+    parse_workers=int(os.getenv('BATCH_PARSE_WORKERS', 8)),
+    per_host=int(os.getenv('BATCH_PER_HOST_LIMIT', 4))
+)
+BATCH_MAX_URLS = int(os.getenv('BATCH_MAX_URLS', 100))
+
+@app.route('/parse-event', methods=['POST'])
+def parse_event():
+    url = request.json.get('url')
+    description_style = request.json.get('description_style', 'default')
+    if not url:
+        return jsonify({'error': 'URL is required'}), 400
+    
+    try:
+        page = fetch_event_page(url)
     except Exception as e:
-        logger.error(f"Event parsing error: {str(e)}")
+        body, status = fetch_error_response(e)
+        return jsonify(body), status
+    
+    body, status, path = parse_event_page(page, url, description_style)
+    return jsonify(body), status, {'X-Parse-Path': path}
+
+@app.route('/parse-events', methods=['POST'])
+def parse_events():
+    urls = request.json.get('urls')
+    description_style = request.json.get('description_style', 'default')
+    if not urls or not isinstance(urls, list) or not all(isinstance(url, str) and url for url in urls):
+        return jsonify({'error': 'A non-empty list of URLs is required'}), 400
+    if len(urls) > BATCH_MAX_URLS:
+        return jsonify({'error': f'At most {BATCH_MAX_URLS} URLs can be parsed per request'}), 400
+    
+    logger.info(f"Parsing batch of {len(urls)} URLs")
+    results = batch_parser.run(urls, description_style)
+    succeeded = sum(1 for result in results if result['status'] == 200)
+    return jsonify({
+        'results': results,
+        'succeeded': succeeded,
+        'failed': len(results) - succeeded
+    })
+
+def run_parse_job(url, description_style, progress):
+    """Run the /parse-event pipeline for a background job"""
+    progress('fetching')
+    try:
+        page = fetch_event_page(url)
+    except Exception as e:
+        body, status = fetch_error_response(e)
+        return body, status, None
+    progress('parsing')
+    return parse_event_page(page, url, description_style)
+
+parse_jobs = queue_from_env(run_parse_job)
+
+@app.route('/parse-jobs', methods=['POST'])
+def submit_parse_job():
+    url = request.json.get('url')
+    description_style = request.json.get('description_style', 'default')
+    if not url:
+        return jsonify({'error': 'URL is required'}), 400
+    
+    try:
+        job = parse_jobs.submit(url, description_style)
+    except QueueFull as e:
+        logger.warning(f"Parse job rejected, queue full: {str(e)}")
         return jsonify({
-            'error': 'Failed to parse event details',
-            'details': str(e),
-            'raw_response': event_details if 'event_details' in locals() else None
-        }), 500
+            'error': 'Too many parse jobs queued, try again later',
+            'queue_depth': parse_jobs.depth(),
+            'max_queue_depth': parse_jobs.max_depth
+        }), 429, {'Retry-After': '30'}
+    
+    status_url = f"/parse-jobs/{job['job_id']}"
+    return jsonify({**job, 'status_url': status_url}), 202, {'Location': status_url}
+
+@app.route('/parse-jobs/<job_id>', methods=['GET'])
+def get_parse_job(job_id):
+    job = parse_jobs.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    return jsonify(job)
+
+@app.route('/parse-jobs/<job_id>', methods=['DELETE'])
+def cancel_parse_job(job_id):
+    job = parse_jobs.cancel(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    if job['status'] in ('succeeded', 'failed'):
+        return jsonify({'error': 'Job already finished', **job}), 409
+    return jsonify(job)
+
+@app.route('/parse-cache/stats', methods=['GET'])
+def parse_cache_stats():
+    return jsonify(parse_cache.stats())
+
+@app.route('/parse-stats', methods=['GET'])
+def parse_stats():
+    with parse_path_lock:
+        paths = dict(parse_path_counts)
+    total = sum(paths.values())
+    avoided = total - paths.get('llm', 0) - paths.get('structured+llm', 0)
+    return jsonify({
+        'paths': paths,
+        'llm_avoidance_rate': round(avoided / total, 4) if total else 0.0,
+        'llm_tiers': llm_cascade.stats()
+    })
+
+@app.route('/upstream-stats', methods=['GET'])
+def upstream_stats():
+    return jsonify(upstreams.stats())
+
+def collect_pipeline_stats():
+    """Existing stats, exposed as metrics at scrape time"""
+    with parse_path_lock:
+        paths = dict(parse_path_counts)
+    yield ('cohere_parse_path_total', 'counter', 'Parses by what served them', ['path'],
+           [((path,), count) for path, count in sorted(paths.items())])
+    cache = parse_cache.stats()
+    yield ('cohere_parse_cache_lookups_total', 'counter', 'Parse cache lookups by result', ['result'],
+           [((result,), cache[result]) for result in ('memory_hits', 'disk_hits', 'coalesced', 'misses')])
+    yield ('cohere_parse_cache_entries', 'gauge', 'Entries in the in-memory parse cache', [],
+           [((), cache['memory_entries'])])
+    yield ('cohere_parse_cache_seconds_saved_total', 'counter', 'Compute time served from the parse cache', [],
+           [((), cache['seconds_saved'])])
+    yield ('cohere_parse_jobs_active', 'gauge', 'Background parse jobs queued or running', [],
+           [((), parse_jobs.depth())])
+    tenant_stats = tenants.stats()
+    yield ('cohere_tenant_clients', 'gauge', 'Tenants whose Calendar clients are pooled', [],
+           [((), tenant_stats['pooled_clients'])])
+    yield ('cohere_tenant_client_builds_total', 'counter', 'Tenant Calendar client factories built and evicted',
+           ['event'], [(('built',), tenant_stats['clients_built']), (('evicted',), tenant_stats['clients_evicted'])])
+    watches = event_watcher.stats()
+    yield ('cohere_watched_events', 'gauge', 'Created events whose source page is watched', [],
+           [((), watches['watched'])])
+    yield ('cohere_watch_checks_total', 'counter', 'Checks, page changes and calendar patches of watched events',
+           ['result'], [((result,), watches[result]) for result in ('checks', 'changes', 'patches')])
+    upstream_stats = upstreams.stats()
+    yield ('cohere_upstream_calls_total', 'counter', 'Upstream calls by outcome', ['upstream', 'outcome'],
+           [((name, outcome), stats[outcome]) for name, stats in upstream_stats.items()
+            for outcome in ('succeeded', 'failed', 'retried', 'rejected', 'throttled')])
+    yield ('cohere_upstream_circuit_open', 'gauge', 'Whether the circuit breaker is rejecting calls', ['upstream'],
+           [((name,), int(stats['state'] != 'closed')) for name, stats in upstream_stats.items()])
+
+metrics_registry.add_collector(collect_pipeline_stats)
+
+@app.route('/metrics', methods=['GET'])
+def metrics_endpoint():
+    return Response(metrics_registry.render(), content_type=metrics.CONTENT_TYPE)
+
+class CalendarCopyLoading(UpstreamUnavailable):
+    """Raised while a tenant's calendar copy is still being loaded for the first time."""
+
+def sync_calendar_mirror(tenant):
+    """Sync the tenant's calendar copy if it's older than CALENDAR_SYNC_INTERVAL.
+
+    Only incremental syncs run in the request. When a full one is needed (the
+    first sync, or an expired sync token) it's started in the background and
+    the copy is used as it is meanwhile; a copy that was never synced raises
+    CalendarCopyLoading instead.
+    """
+    def sync():
+        with tenants.clients(tenant).client() as service:
+            return calendar_mirror.sync_if_stale(service, tenant.calendar_id, CALENDAR_SYNC_INTERVAL, full=False)
+
+    try:
+        with metrics.timed(stage_seconds, 'calendar_sync'):
+            # A sync stores its token only once complete, so a failed one can simply be run again
+            upstreams.call(f'calendar:{tenant.name}', sync)
+    except FullSyncRequired:
+        start_full_sync(tenant)
+        if not calendar_mirror.synced_at(tenant.calendar_id):
+            raise CalendarCopyLoading(
+                f'calendar:{tenant.name}', 'the calendar copy is still loading', CALENDAR_FULL_SYNC_RETRY_AFTER
+            )
+
+def start_full_sync(tenant):
+    """Fully sync the tenant's calendar copy in a background thread, unless that's already running."""
+    with full_syncs_lock:
+        if tenant.name in full_syncs:
+            return
+        full_syncs.add(tenant.name)
+
+    def sync():
+        with tenants.clients(tenant).client() as service:
+            return calendar_mirror.sync(service, tenant.calendar_id)
+
+    def run():
+        try:
+            with metrics.timed(stage_seconds, 'calendar_full_sync'):
+                upstreams.call(f'calendar:{tenant.name}', sync)
+        except Exception as e:
+            logger.warning(f"Full sync of {tenant.name}'s calendar copy failed: {str(e)}")
+        finally:
+            with full_syncs_lock:
+                full_syncs.discard(tenant.name)
+
+    threading.Thread(target=run, name=f'calendar-full-sync-{tenant.name}', daemon=True).start()
+
+def start_first_sync():
+    """Start loading the default tenant's calendar copy if it was never synced, so its listings needn't wait."""
+    tenant = tenants.default
+    if tenants.clients(tenant).available() and not calendar_mirror.synced_at(tenant.calendar_id):
+        start_full_sync(tenant)
+
+def build_calendar_event(event_details, tenant):
+    """Build a Calendar API event resource from parsed event details"""
+    return {
+        'summary': event_details['title'],
+        'location': event_details['location'],
+        'description': event_details['description'],
+        'start': {
+            'dateTime': event_details['start_time'],
+            'timeZone': tenant.timezone,
+        },
+        'end': {
+            'dateTime': event_details['end_time'],
+            'timeZone': tenant.timezone,
+        },
+    }
+
+def details_fingerprint(event_details, tenant):
+    return event_fingerprint(
+        event_details.get('title'), event_details.get('start_time'),
+        event_details.get('location'), tenant.timezone
+    )
+
+SOURCE_LINE = re.compile(r'^Source: (\S+)')
+
+def event_epoch(value, tenant):
+    moment = to_utc(value, tenant.timezone)
+    return moment.timestamp() if moment else None
+
+def watch_created_event(event_id, event_details, tenant):
+    """Watch the page an event was parsed from, taken from `source_url` or the description's Source line.
+
+    The `page_hash` returned by the parse is the version of the page the event
+    reflects, so a change made before the first check is still caught.
+    """
+    source = SOURCE_LINE.match(event_details.get('description') or '')
+    url = event_details.get('source_url') or (source.group(1) if source else None)
+    if not url:
+        return
+    try:
+        event_watcher.watch(
+            event_id, tenant.calendar_id, url, {field: event_details.get(field) for field in EVENT_FIELDS},
+            event_epoch(event_details.get('start_time'), tenant), event_epoch(event_details.get('end_time'), tenant),
+            event_details.get('description_style', 'default'), event_details.get('page_hash')
+        )
+    except Exception as e:
+        # The event exists either way; it just won't follow changes to its page
+        logger.warning(f"Could not watch {url} for event {event_id}: {str(e)}")
+
+def record_created_event(event, event_details, tenant):
+    """Add an event just inserted to the calendar copy and watch its page.
+
+    Best effort: the event is on the calendar either way, and failing the
+    request now would get it created again when the caller retries.
+    """
+    try:
+        calendar_mirror.add(tenant.calendar_id, event, tenant.timezone)
+    except Exception as e:
+        logger.warning(f"Could not add event {event['id']} to the calendar copy: {str(e)}")
+    watch_created_event(event['id'], event_details, tenant)
+
+def page_hash(page):
+    """Hash of what the parse stage would see of a fetched page"""
+    content = json.dumps([page['structured'], page['text']], sort_keys=True)
+    return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+# Parsed field -> Calendar API event field
+CALENDAR_FIELDS = {
+    'title': 'summary', 'location': 'location', 'description': 'description',
+    'start_time': 'start', 'end_time': 'end',
+}
+
+def calendar_patch(old_details, new_details, tenant):
+    """Return (patch body, changed fields) for fields whose parsed value changed"""
+    event = build_calendar_event(new_details, tenant)
+    patch, changed = {}, []
+    for field, calendar_field in CALENDAR_FIELDS.items():
+        before, after = old_details.get(field), new_details.get(field)
+        if not after:
+            continue
+        if field in ('start_time', 'end_time'):
+            same = to_utc(before, tenant.timezone) == to_utc(after, tenant.timezone)
+        else:
+            same = (before or '').strip() == after.strip()
+        if not same:
+            patch[calendar_field] = event[calendar_field]
+            changed.append(field)
+    return patch, changed
+
+def check_watched_event(watch):
+    """Re-check a watched event's page and patch the calendar if it changed (see watcher.EventWatcher)"""
+    metrics.request_id_var.set(f"watch-{watch['event_id']}")
+    tenant = tenants.for_calendar(watch['calendar_id'])
+    if tenant is None:
+        raise ValueError(f"No tenant serves calendar {watch['calendar_id']}")
+    page = fetch_event_page(watch['url'])
+    text_hash = page_hash(page)
+    outcome = {'text_hash': text_hash, 'page_text': page['text'], 'details': None, 'patched': []}
+    if text_hash == watch['text_hash']:
+        return outcome
+    
+    # At temperature 0 the parts of the page that didn't change parse the same way again
+    body, status, _ = parse_event_page(page, watch['url'], watch['description_style'], temperature=0)
+    if status != 200:
+        raise ValueError(f"Parse returned {status}: {body.get('error')}")
+    details = {field: body.get(field) for field in EVENT_FIELDS}
+    if watch['text_hash'] is None:
+        # Watched without the version of the page the event came from: this is the baseline
+        return {**outcome, 'details': details}
+    
+    if not changed_materially(watch['page_text'], page['text'], WATCH_MATERIAL_CHANGE):
+        # The description is the model's wording of the page; a small edit to the page shouldn't rewrite it
+        details['description'] = watch['details'].get('description')
+    patch, changed = calendar_patch(watch['details'], details, tenant)
+    outcome = {**outcome, 'details': details, 'patched': changed}
+    if not patch:
+        return outcome
+    
+    def patch_event():
+        with tenants.clients(tenant).client() as service:
+            return service.events().patch(
+                calendarId=watch['calendar_id'], eventId=watch['event_id'], body=patch
+            ).execute()
+    
+    try:
+        with metrics.timed(stage_seconds, 'calendar_patch'):
+            event = upstreams.call(f'calendar:{tenant.name}', patch_event)
+    except HttpError as e:
+        if e.resp.status in (404, 410):
+            return {**outcome, 'gone': True}
+        raise
+    if event.get('status') == 'cancelled':
+        return {**outcome, 'gone': True}
+    calendar_mirror.add(watch['calendar_id'], event, tenant.timezone)
+    outcome['start'] = event_epoch(details['start_time'], tenant)
+    outcome['end'] = event_epoch(details['end_time'], tenant)
+    return outcome
+
+# Created events whose source pages are re-checked for changes. The serving process starts the
+# checks (see wsgi.py); WATCH_WORKERS=0 leaves them to other processes
+event_watcher = watcher_from_env(check_watched_event)
+# Share of a page's text that must change before a watch rewrites the event's description
+WATCH_MATERIAL_CHANGE = float(os.getenv('WATCH_MATERIAL_CHANGE', 0.05))
+
+@app.route('/watches', methods=['GET'])
+def list_watches():
+    limit = request.args.get('limit', 100, type=int)
+    return jsonify({'watches': event_watcher.list(limit, g.tenant.calendar_id), **event_watcher.stats()})
+
+@app.route('/watches', methods=['POST'])
+def add_watch():
+    event_id = request.json.get('event_id')
+    url = request.json.get('url')
+    if not event_id or not url:
+        return jsonify({'error': 'event_id and url are required'}), 400
+    event = calendar_mirror.get(g.tenant.calendar_id, event_id)
+    if event is None:
+        return jsonify({'error': 'Event not found'}), 404
+    start, end = event['start'], event['end']
+    details = {
+        'title': event.get('summary', ''),
+        'description': event.get('description', ''),
+        'start_time': start.get('dateTime', start.get('date')),
+        'end_time': end.get('dateTime', end.get('date')),
+        'location': event.get('location', ''),
+    }
+    event_watcher.watch(
+        event_id, g.tenant.calendar_id, url, details,
+        event_epoch(details['start_time'], g.tenant), event_epoch(details['end_time'], g.tenant),
+        request.json.get('description_style', 'default')
+    )
+    return jsonify(event_watcher.get(event_id)), 201
+
+@app.route('/watches/<event_id>', methods=['DELETE'])
+def remove_watch(event_id):
+    watch = event_watcher.get(event_id)
+    if watch is None or watch['calendar_id'] != g.tenant.calendar_id or not event_watcher.unwatch(event_id):
+        return jsonify({'error': 'Watch not found'}), 404
+    return jsonify({'event_id': event_id, 'watched': False})
 
 @app.route('/create-event', methods=['POST'])
 def create_event():
     event_details = request.json
+    tenant = g.tenant
     
     try:
         # Validate event details before creating
@@ -318,27 +831,34 @@ def create_event():
                 'issues': issues['errors']
             }), 400
             
-        if calendar_service is None:
+        if not tenants.clients(tenant).available():
             return jsonify({
                 'error': 'Google Calendar is not configured'
             }), 500
         
-        event = {
-            'summary': event_details['title'],
-            'location': event_details['location'],
-            'description': event_details['description'],
-            'start': {
-                'dateTime': event_details['start_time'],
-                'timeZone': 'America/Chicago',
-            },
-            'end': {
-                'dateTime': event_details['end_time'],
-                'timeZone': 'America/Chicago',
-            },
-        }
+        event = build_calendar_event(event_details, tenant)
+        # Our own id makes the insert safe to retry: if an attempt that timed out went
+        # through after all, the retry gets a 409 and the event already exists. With an
+        # Idempotency-Key the id comes from the key, so repeated requests find the same event
+        key = request.headers.get('Idempotency-Key')
+        event['id'] = idempotent_event_id(tenant, key) if key else uuid.uuid4().hex
+
+        def insert():
+            with tenants.clients(tenant).client() as service:
+                try:
+                    return service.events().insert(calendarId=tenant.calendar_id, body=event).execute()
+                except HttpError as e:
+                    if e.resp.status != 409:
+                        raise
+                    return service.events().get(calendarId=tenant.calendar_id, eventId=event['id']).execute()
 
-        event = calendar_service.events().insert(calendarId='cohere@unforced.org', body=event).execute()
+        with metrics.timed(stage_seconds, 'calendar_insert'):
+            event = upstreams.call(f'calendar:{tenant.name}', insert)
+        record_created_event(event, event_details, tenant)
         return jsonify({'eventId': event.get('id')})
+    except UpstreamUnavailable as e:
+        body, status = upstream_error_response(e)
+        return jsonify(body), status
     except Exception as e:
         logger.error(f"Calendar event creation error: {str(e)}")
         return jsonify({
@@ -346,5 +866,284 @@ def create_event():
             'details': str(e)
         }), 500
 
+def idempotent_event_id(tenant, key):
+    """Calendar event id for a client's Idempotency-Key: the same key always names the same event."""
+    # Hex digits are valid Calendar ids (base32hex, 5 to 1024 characters)
+    return hashlib.sha1(f"{tenant.calendar_id}\0{key}".encode('utf-8')).hexdigest()
+
+def listed_tenant(public=False):
+    """Tenant whose events a listing or feed shows: the one named by `tenant`, else the request's.
+
+    Feed subscriptions can't send headers, so `public` feeds may name any
+    tenant; other listings only the caller's own. None if unknown or not allowed.
+    """
+    name = request.args.get('tenant')
+    if not name:
+        return g.tenant
+    return tenants.get(name) if public or name == g.tenant.name else None
+
+@app.route('/events', methods=['GET'])
+def list_events():
+    tenant = listed_tenant()
+    if tenant is None:
+        return jsonify({'error': 'Unknown tenant'}), 404
+    if tenants.clients(tenant).available():
+        try:
+            sync_calendar_mirror(tenant)
+        except CalendarCopyLoading as e:
+            body, status = upstream_error_response(e, 'The calendar is still loading, try again shortly')
+            return jsonify(body), status
+        except Exception as e:
+            # Serve the last synced copy rather than failing the listing
+            logger.warning(f"Calendar sync error: {str(e)}")
+    
+    limit = request.args.get('limit', type=int)
+    events = [
+        {
+            'id': event['id'],
+            'title': event.get('summary', ''),
+            'description': event.get('description', ''),
+            'start_time': event['start'].get('dateTime', event['start'].get('date')),
+            'end_time': event['end'].get('dateTime', event['end'].get('date')),
+            'location': event.get('location', ''),
+            'htmlLink': event.get('htmlLink', '')
+        }
+        for event in calendar_mirror.upcoming(tenant.calendar_id, limit=limit)
+    ]
+    return jsonify({'events': events})
+
+@app.route('/feed.<extension>', methods=['GET'])
+def event_feed(extension):
+    format_name = FEED_EXTENSIONS.get(extension)
+    if format_name is None:
+        return jsonify({'error': f"Unknown feed format: {extension}"}), 404
+    tenant = listed_tenant(public=True)
+    if tenant is None:
+        return jsonify({'error': 'Unknown tenant'}), 404
+    if tenants.clients(tenant).available():
+        try:
+            sync_calendar_mirror(tenant)
+        except CalendarCopyLoading as e:
+            body, status = upstream_error_response(e, 'The calendar is still loading, try again shortly')
+            return jsonify(body), status
+        except Exception as e:
+            logger.warning(f"Calendar sync error: {str(e)}")
+    
+    version, last_modified = calendar_mirror.upcoming_version(tenant.calendar_id)
+    etag = f"{version}-{extension}"
+    link = (FEED_LINK or request.host_url) if format_name == 'rss' else None
+    key = (tenant.name, extension, link)
+    with feed_cache_lock:
+        cached = feed_cache.get(key)
+    if cached is None or cached[0] != etag:
+        writer = get_writer(format_name, **({'link': link} if link else {}))
+        events = iter_export_events(calendar_mirror.upcoming(tenant.calendar_id), tenant.feed_timezone)
+        cached = (etag, ''.join(writer.render(events)).encode('utf-8'), writer.content_type)
+        with feed_cache_lock:
+            feed_cache[key] = cached
+            feed_cache.move_to_end(key)
+            while len(feed_cache) > FEED_CACHE_MAX_ENTRIES:
+                feed_cache.popitem(last=False)
+    
+    response = Response(cached[1], content_type=cached[2])
+    response.set_etag(etag)
+    if last_modified:
+        response.last_modified = last_modified
+    response.cache_control.public = True
+    response.cache_control.max_age = CALENDAR_SYNC_INTERVAL
+    return response.make_conditional(request)
+
+@app.route('/create-events', methods=['POST'])
+def create_events():
+    events = request.json.get('events')
+    if not events or not isinstance(events, list):
+        return jsonify({'error': 'A non-empty list of events is required'}), 400
+    if len(events) > BULK_CREATE_MAX_EVENTS:
+        return jsonify({'error': f'At most {BULK_CREATE_MAX_EVENTS} events can be created per request'}), 400
+    tenant = g.tenant
+    if not tenants.clients(tenant).available():
+        return jsonify({
+            'error': 'Google Calendar is not configured'
+        }), 500
+    
+    try:
+        sync_calendar_mirror(tenant)
+    except UpstreamUnavailable as e:
+        body, status = upstream_error_response(e)
+        return jsonify(body), status
+    except Exception as e:
+        logger.error(f"Calendar sync error: {str(e)}")
+        return jsonify({
+            'error': 'Failed to load existing calendar events',
+            'details': str(e)
+        }), 500
+    
+    try:
+        results = insert_calendar_events(events, tenant)
+    except UpstreamUnavailable as e:
+        body, status = upstream_error_response(e)
+        return jsonify(body), status
+    return jsonify(bulk_summary(results))
+
+def bulk_summary(results, statuses=('created', 'duplicate', 'invalid', 'failed')):
+    summary = Counter(result['status'] for result in results)
+    return {
+        'results': [{'index': index, **result} for index, result in enumerate(results)],
+        **{status: summary.get(status, 0) for status in statuses}
+    }
+
+def insert_calendar_events(events, tenant, dry_run=False, seen=None, first_index=0):
+    """Validate, de-duplicate and batch insert events in the /create-event format into the tenant's calendar.
+
+    Returns one result per event. The calendar copy should be synced first.
+    With `dry_run`, events that would be inserted get a `valid` result instead.
+    Pass the same `seen` dict, and each batch's `first_index`, to catch
+    duplicates across batches of one import.
+    """
+    results = [None] * len(events)
+    to_insert = {}
+    seen = {} if seen is None else seen
+    for index, event_details in enumerate(events):
+        if not isinstance(event_details, dict):
+            results[index] = {'status': 'invalid', 'issues': ['Event must be an object']}
+            continue
+        issues = validate_event_details(event_details)
+        if issues['errors']:
+            results[index] = {'status': 'invalid', 'issues': issues['errors']}
+            continue
+        
+        fingerprint = details_fingerprint(event_details, tenant)
+        existing_id = calendar_mirror.find_by_fingerprint(tenant.calendar_id, fingerprint)
+        if existing_id:
+            results[index] = {'status': 'duplicate', 'eventId': existing_id}
+        elif fingerprint in seen:
+            results[index] = {'status': 'duplicate', 'duplicateOf': seen[fingerprint]}
+        else:
+            seen[fingerprint] = first_index + index
+            to_insert[str(index)] = build_calendar_event(event_details, tenant)
+    
+    if dry_run:
+        for key in to_insert:
+            results[int(key)] = {'status': 'valid'}
+        return results
+    
+    logger.info(f"Bulk inserting {len(to_insert)} of {len(events)} events")
+    def insert_batch():
+        with tenants.clients(tenant).client() as service:
+            return batch_insert_events(service, tenant.calendar_id, to_insert)
+
+    # batch_insert_events retries failed items itself; the upstream adds the breaker and rate limit
+    with metrics.timed(stage_seconds, 'calendar_batch_insert'):
+        inserted = upstreams.call(f'calendar:{tenant.name}', insert_batch, retry=False)
+    for key, outcome in inserted.items():
+        if 'eventId' in outcome:
+            record_created_event(outcome['event'], events[int(key)], tenant)
+            results[int(key)] = {'status': 'created', 'eventId': outcome['eventId']}
+        else:
+            results[int(key)] = {'status': 'failed', 'error': outcome['error']}
+    return results
+
+@app.route('/import-ics', methods=['POST'])
+def import_ics():
+    """Create the events of an iCalendar feed without the AI.
+
+    The feed is the request body (`text/calendar`, or a multipart `file`) or is
+    fetched from `url` in a JSON body; `after`, `before` and `dry_run` come from
+    the JSON body or the query string. Events are parsed as the feed streams in
+    and created in batches, so the feed is never held in memory.
+    """
+    options = (request.get_json(silent=True) if request.is_json else request.args) or {}
+    try:
+        after = parse_day(options['after']) if options.get('after') else datetime.now(timezone.utc)
+        before = parse_day(options['before']) if options.get('before') else after + timedelta(days=ICS_IMPORT_DAYS)
+    except (TypeError, ValueError) as e:
+        return jsonify({'error': 'Invalid after or before date', 'details': str(e)}), 400
+    dry_run = str(options.get('dry_run', '')).lower() in ('1', 'true', 'yes')
+    url = options.get('url') if request.is_json else None
+    if request.is_json and not url:
+        return jsonify({'error': 'A feed url or an iCalendar request body is required'}), 400
+    
+    tenant = g.tenant
+    if tenants.clients(tenant).available():
+        try:
+            sync_calendar_mirror(tenant)
+        except UpstreamUnavailable as e:
+            body, status = upstream_error_response(e)
+            return jsonify(body), status
+        except Exception as e:
+            logger.error(f"Calendar sync error: {str(e)}")
+            return jsonify({
+                'error': 'Failed to load existing calendar events',
+                'details': str(e)
+            }), 500
+    elif not dry_run:
+        return jsonify({
+            'error': 'Google Calendar is not configured'
+        }), 500
+    
+    feed = None
+    if url:
+        host = (urlsplit(url).hostname or '').lower()
+        try:
+            feed = upstreams.call(f'fetch:{host}', lambda: page_fetcher.open(url))
+        except Exception as e:
+            body, status = fetch_error_response(e)
+            return jsonify(body), status
+        chunks = feed.iter_content(64 * 1024)
+    elif 'file' in request.files:
+        chunks = read_chunks(request.files['file'].stream)
+    else:
+        chunks = read_chunks(request.stream)
+    
+    importer = ICSImporter(after, before, tenant.timezone)
+    results, batch, seen = [], [], {}
+    truncated = False
+    
+    def create_batch():
+        created = insert_calendar_events(batch, tenant, dry_run, seen, len(results))
+        for details, result in zip(batch, created):
+            if details['all_day'] and result['status'] in ('created', 'valid'):
+                result['warnings'] = ['All-day event, created as a timed event from midnight to midnight']
+            results.append({
+                'uid': details['uid'], 'title': details['title'], 'start_time': details['start_time'], **result
+            })
+        batch.clear()
+    
+    error = None
+    try:
+        for details in importer.events(chunks):
+            if len(results) + len(batch) >= ICS_IMPORT_MAX_EVENTS:
+                truncated = True
+                break
+            batch.append(details)
+            if len(batch) >= ICS_IMPORT_BATCH_SIZE:
+                create_batch()
+        if batch:
+            create_batch()
+    except ICSError as e:
+        error = {'error': 'Invalid iCalendar feed', 'details': str(e)}, 400
+    except UpstreamUnavailable as e:
+        error = upstream_error_response(e)
+    except requests.RequestException as e:
+        error = fetch_error_response(e)
+    finally:
+        if feed is not None:
+            feed.close()
+    
+    logger.info(f"ICS import of {len(results)} events ({importer.skipped} outside the window), dry run: {dry_run}")
+    summary = {
+        **bulk_summary(results, ('created', 'valid', 'duplicate', 'invalid', 'failed')),
+        'skipped': importer.skipped,
+        'truncated': truncated,
+    }
+    if error:
+        # Events created before the failure are still reported
+        body, status = error
+        return jsonify({**body, **summary}), status
+    return jsonify(summary)
+
 if __name__ == '__main__':
+    parse_jobs.start()
+    event_watcher.start()
+    start_first_sync()
     app.run()
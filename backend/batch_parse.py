@@ -0,0 +1,88 @@
+"""Concurrent parsing of many event links at once.
+
+Pages are fetched on a thread pool with a cap on simultaneous requests to any
+one host, so a large import can't flood a single site. Each fetched page is
+handed to a second pool for parsing, so fetch threads go straight on to the
+next link instead of waiting for the AI, which the parse stage caps
+separately, process-wide.
+"""
+import contextvars
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+
+class HostLimiter:
+    """Limit the number of concurrent requests made to each host."""
+
+    def __init__(self, per_host):
+        self.per_host = per_host
+        self._lock = threading.Lock()
+        self._slots = {}  # host -> [semaphore, users]
+
+    @contextmanager
+    def slot(self, url):
+        host = (urlsplit(url).hostname or '').lower()
+        with self._lock:
+            entry = self._slots.setdefault(host, [threading.BoundedSemaphore(self.per_host), 0])
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del self._slots[host]
+
+
+class BatchParser:
+    """Run the fetch and parse stages for a list of URLs concurrently, each on its own pool.
+
+    `fetch(url)` returns a fetched page and may raise; `on_fetch_error(exc)`
+    turns a fetch failure into a (body, status) tuple and
+    `parse(page, url, style)` returns a (body, status, path) tuple for a page.
+    """
+
+    def __init__(self, fetch, parse, on_fetch_error, fetch_workers=16, parse_workers=8, per_host=4):
+        self.fetch = fetch
+        self.parse = parse
+        self.on_fetch_error = on_fetch_error
+        self.fetch_workers = fetch_workers
+        self.parse_workers = parse_workers
+        self.hosts = HostLimiter(per_host)
+
+    def _fetch_one(self, url):
+        """Return (page, None), or (None, (body, status, path)) if the fetch failed."""
+        try:
+            with self.hosts.slot(url):
+                return self.fetch(url), None
+        except Exception as e:
+            body, status = self.on_fetch_error(e)
+            return None, (body, status, None)
+
+    def run(self, urls, description_style='default'):
+        """Parse every URL and return a result dict per URL, in input order."""
+        if not urls:
+            return []
+        with ThreadPoolExecutor(min(self.fetch_workers, len(urls)), 'batch-fetch') as fetch_pool, \
+                ThreadPoolExecutor(min(self.parse_workers, len(urls)), 'batch-parse') as parse_pool:
+
+            def fetch(url, context):
+                page, failure = context.run(self._fetch_one, url)
+                if failure is not None:
+                    return failure
+                # Queued once this thread has left the context, which can only be entered by one at a time
+                return parse_pool.submit(context.run, self.parse, page, url, description_style)
+
+            # Each URL runs in a copy of the caller's context, so request ids follow it into both pools
+            fetches = [fetch_pool.submit(fetch, url, contextvars.copy_context()) for url in urls]
+            outcomes = []
+            for future in fetches:
+                outcome = future.result()
+                outcomes.append(outcome.result() if isinstance(outcome, Future) else outcome)
+        return [
+            {'url': url, 'status': status, 'path': path, 'result': body}
+            for url, (body, status, path) in zip(urls, outcomes)
+        ]
@@ -0,0 +1,144 @@
+"""Compare page text extraction against the original BeautifulSoup approach.
+
+Runs every saved page in the corpus through the legacy find_all/get_text loop
+and through text_extract.extract_text, and reports time and output size. With
+no saved pages it uses the generated ones from corpus_pages.py. First, a few
+small pages check that boilerplate filtering keeps the event and drops the
+chrome, with each parser backend; it exits 1 if one doesn't.
+
+    python benchmarks/bench_extract.py                      # benchmark the corpus
+    python benchmarks/bench_extract.py --save URL [URL ...]  # add pages to the corpus
+"""
+import argparse
+import hashlib
+import os
+import statistics
+import sys
+import time
+from urllib.parse import urlsplit
+
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from corpus_pages import CORPUS_DIR, load_pages  # noqa: E402
+from text_extract import CHARS_PER_TOKEN, etree, extract_text  # noqa: E402
+
+
+def legacy_extract(page_content):
+    """The extraction loop parse_event used before text_extract."""
+    soup = BeautifulSoup(page_content, 'html.parser')
+    for script in soup(["script", "style"]):
+        script.decompose()
+    lines = []
+    for element in soup.find_all(['p', 'div', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'li']):
+        text = element.get_text(strip=True)
+        if text:
+            lines.append(text)
+    return "\n\n".join(lines)
+
+
+EVENT = '<h1>Harvest Potluck</h1><p>Sat, Sep 20, 5:30 PM at Eastside Community Hall.</p>'
+
+# (name, html, text that must be extracted, text that must not be)
+CHECKS = [
+    ('boilerplate class on body', f'<html><body class="page social-events">{EVENT}</body></html>',
+     'Eastside Community Hall', None),
+    ('share container around the event',
+     f'<html><body><div class="event-share-container">{EVENT}</div></body></html>',
+     'Eastside Community Hall', None),
+    ('boilerplate class on main', f'<html><body><main id="share" class="promo">{EVENT}</main></body></html>',
+     'Eastside Community Hall', None),
+    ('cookie banner and share buttons',
+     f'<html><body>{EVENT}<div id="cookie-banner">We use cookies</div>'
+     '<ul class="share_buttons"><li>Share on Facebook</li></ul></body></html>',
+     'Eastside Community Hall', 'cookies'),
+]
+
+
+def run_checks():
+    """Return the failures of CHECKS, for every available backend."""
+    failures = []
+    for backend in ('lxml', 'stdlib') if etree is not None else ('stdlib',):
+        for name, html, expected, unexpected in CHECKS:
+            text = extract_text(html, backend=backend)
+            if expected not in text:
+                failures.append(f"{name} ({backend}): lost {expected!r}, got {text!r}")
+            if unexpected and unexpected in text:
+                failures.append(f"{name} ({backend}): kept {unexpected!r}")
+    return failures
+
+
+def save_pages(urls, corpus_dir):
+    from fetcher import PageFetcher
+
+    os.makedirs(corpus_dir, exist_ok=True)
+    fetcher = PageFetcher()
+    for url in urls:
+        host = urlsplit(url).hostname or 'page'
+        name = f"{host}-{hashlib.sha1(url.encode()).hexdigest()[:8]}.html"
+        text = fetcher.fetch(url, conditional=False).text
+        with open(os.path.join(corpus_dir, name), 'w', encoding='utf-8') as f:
+            f.write(text)
+        print(f"Saved {url} -> {name}")
+
+
+def time_extractor(extract, html, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        output = extract(html)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings), output
+
+
+def run(corpus_dir, repeat, max_tokens):
+    pages = load_pages(corpus_dir)
+    extractors = [('legacy', legacy_extract)]
+    if etree is not None:
+        extractors.append(('lxml', lambda html: extract_text(html, max_tokens, backend='lxml')))
+    extractors.append(('stdlib', lambda html: extract_text(html, max_tokens, backend='stdlib')))
+
+    header = f"{'page':<40} {'html KB':>8}"
+    for name, _ in extractors:
+        header += f" {name + ' ms':>11} {name + ' tok':>11}"
+    print(header)
+
+    totals = {name: [0.0, 0] for name, _ in extractors}
+    for page, html in pages.items():
+        row = f"{page[:40]:<40} {len(html) / 1024:>8.1f}"
+        for name, extract in extractors:
+            seconds, output = time_extractor(extract, html, repeat)
+            tokens = len(output) // CHARS_PER_TOKEN
+            totals[name][0] += seconds
+            totals[name][1] += tokens
+            row += f" {seconds * 1000:>11.2f} {tokens:>11}"
+        print(row)
+
+    row = f"{'TOTAL':<40} {'':>8}"
+    for name, _ in extractors:
+        row += f" {totals[name][0] * 1000:>11.2f} {totals[name][1]:>11}"
+    print(row)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--corpus', default=CORPUS_DIR, help='directory of saved .html pages')
+    parser.add_argument('--repeat', type=int, default=5, help='runs per page; the median is reported')
+    parser.add_argument('--max-tokens', type=int, default=6000, help='token budget for extract_text')
+    parser.add_argument('--save', nargs='+', metavar='URL', help='fetch pages into the corpus and exit')
+    args = parser.parse_args()
+
+    if args.save:
+        save_pages(args.save, args.corpus)
+        return
+    failures = run_checks()
+    for failure in failures:
+        print(f"FAILED: {failure}")
+    if failures:
+        sys.exit(1)
+    run(args.corpus, args.repeat, args.max_tokens)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+"""Benchmark ICS feed parsing: throughput and peak memory against feed size.
+
+Generates synthetic feeds of one-off events, and the same feeds with one
+event in --series-every a weekly recurring series (with EXDATEs and moved
+occurrences), streams each through ics_import.ICSImporter in 64 KB chunks,
+and reports events per second and peak traced memory. Series are held until
+the feed ends, so only the one-off feeds should stay flat; exits 1 if the
+largest one-off feed's peak is more than --max-growth times the smallest's.
+
+    python benchmarks/bench_ics_import.py
+    python benchmarks/bench_ics_import.py --events 1000 10000 50000
+"""
+import argparse
+import io
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ics_import import ICSImporter, read_chunks  # noqa: E402
+
+START = datetime(2030, 1, 1, tzinfo=timezone.utc)
+
+
+def write_feed(f, events, series_every=0):
+    """Write a feed with `events` VEVENTs, one in `series_every` (if set) a weekly series."""
+    f.write(b'BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//Bench//EN\r\nX-WR-TIMEZONE:America/Chicago\r\n')
+    description = ('A long description that gets folded over several content lines, ' * 6).strip()
+    for index in range(events):
+        start = START + timedelta(hours=7 * index % (300 * 24))
+        lines = [
+            'BEGIN:VEVENT',
+            f'UID:event-{index}@bench.invalid',
+            f"DTSTART;TZID=America/Chicago:{start.strftime('%Y%m%dT%H%M%S')}",
+            f"DTEND;TZID=America/Chicago:{(start + timedelta(hours=2)).strftime('%Y%m%dT%H%M%S')}",
+            f'SUMMARY:Event {index}\\, with an escaped comma',
+            f'LOCATION:Room {index % 40}',
+        ]
+        recurring = series_every and index % series_every == 0
+        if recurring:
+            lines.append('RRULE:FREQ=WEEKLY;COUNT=20')
+            lines.append(f"EXDATE;TZID=America/Chicago:{(start + timedelta(weeks=3)).strftime('%Y%m%dT%H%M%S')}")
+        line = f'DESCRIPTION:{description}'
+        lines += [line[:75]] + [' ' + line[cut:cut + 74] for cut in range(75, len(line), 74)]
+        lines.append('END:VEVENT')
+        if recurring:
+            moved = start + timedelta(weeks=5)
+            lines += [
+                'BEGIN:VEVENT',
+                f'UID:event-{index}@bench.invalid',
+                f"RECURRENCE-ID;TZID=America/Chicago:{moved.strftime('%Y%m%dT%H%M%S')}",
+                f"DTSTART;TZID=America/Chicago:{(moved + timedelta(days=1)).strftime('%Y%m%dT%H%M%S')}",
+                'DURATION:PT3H',
+                f'SUMMARY:Event {index} (moved)',
+                'END:VEVENT',
+            ]
+        f.write(('\r\n'.join(lines) + '\r\n').encode())
+    f.write(b'END:VCALENDAR\r\n')
+
+
+def run(events, series_every):
+    feed = io.BytesIO()
+    write_feed(feed, events, series_every)
+    size = feed.tell()
+
+    def parse():
+        feed.seek(0)
+        importer = ICSImporter(START, START + timedelta(days=400), 'America/Chicago')
+        return sum(1 for _ in importer.events(read_chunks(feed)))
+
+    started = time.perf_counter()
+    count = parse()
+    elapsed = time.perf_counter() - started
+    # Traced separately; tracing slows parsing several times over
+    tracemalloc.start()
+    parse()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size, count, elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--events', type=int, nargs='+', default=[1000, 5000, 20000], help='VEVENTs per feed')
+    parser.add_argument('--max-growth', type=float, default=3.0,
+                        help='largest allowed ratio of peak memory between the largest and smallest one-off feed')
+    parser.add_argument('--series-every', type=int, default=50, help='one event in this many recurs')
+    args = parser.parse_args()
+
+    peaks = []
+    for events in sorted(args.events):
+        for label, series_every in (('one-off', 0), ('series', args.series_every)):
+            size, count, elapsed, peak = run(events, series_every)
+            if not series_every:
+                peaks.append(peak)
+            print(
+                f"{events:>7} VEVENTs {label:<8} {size / 1e6:6.1f} MB  {count:>7} events out  "
+                f"{count / elapsed:8.0f} events/s  peak {peak / 1e6:6.2f} MB"
+            )
+    growth = peaks[-1] / peaks[0]
+    print(f"one-off peak memory grew {growth:.1f}x from the smallest to the largest feed")
+    if growth > args.max_growth:
+        sys.exit(f"FAILED: peak memory should stay flat (limit {args.max_growth}x)")
+
+
+if __name__ == '__main__':
+    main()
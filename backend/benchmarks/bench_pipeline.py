@@ -0,0 +1,356 @@
+"""End-to-end benchmark of /parse-event and /create-event, fully offline.
+
+Replays the saved pages in benchmarks/corpus (or, if there are none, the
+generated pages from corpus_pages.py) through the Flask test client.
+Page fetches are served from the corpus, and the LLM and Google Calendar are
+replaced by deterministic stubs with a configurable delay, so results depend
+only on our own code and the chosen latencies. For each concurrency level it
+reports throughput, p50/p95/p99 latency for the whole request and for each
+pipeline stage (from the stage timers behind /metrics), and peak traced
+memory.
+
+    python benchmarks/bench_pipeline.py --concurrency 1 4 16 --output results.json
+    python benchmarks/bench_pipeline.py --baseline results.json --threshold 0.15
+
+With --baseline, the run fails (exit status 1) if p95 request latency rose
+or throughput fell by more than the threshold at any concurrency level.
+Add pages to the corpus with bench_extract.py --save.
+"""
+import argparse
+import json
+import logging
+import math
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BENCH_HOST = 'https://bench.invalid/'
+
+sys.path.insert(0, BACKEND_DIR)
+
+from corpus_pages import CORPUS_DIR, load_pages  # noqa: E402
+
+
+def percentile(samples, fraction):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, math.ceil(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(samples):
+    return {
+        'count': len(samples),
+        'p50_ms': round(percentile(samples, 0.50) * 1000, 2),
+        'p95_ms': round(percentile(samples, 0.95) * 1000, 2),
+        'p99_ms': round(percentile(samples, 0.99) * 1000, 2),
+    }
+
+
+# The fields a parse or repair prompt asks for
+REQUESTED_FIELDS = re.compile(r'with the(?:se)? fields:? ([a-z_]+(?:, [a-z_]+)*)')
+
+
+def requested_fields(prompt):
+    return REQUESTED_FIELDS.search(prompt).group(1).split(', ')
+
+
+class StubLLMProvider:
+    """Returns the requested fields after a fixed delay, built from the prompt."""
+
+    def __init__(self, latency):
+        self.latency = latency
+
+    def complete(self, model, system, messages, schema, max_tokens, temperature):
+        time.sleep(self.latency)
+        prompt = messages[-1]['content']
+        page_line = next((line.strip() for line in prompt.split('Webpage content:')[-1].splitlines() if line.strip()), 'Event')
+        values = {
+            'title': page_line[:80],
+            'description': f"Source: {BENCH_HOST}\n\n{page_line}",
+            'start_time': '2030-05-01T18:00:00-06:00',
+            'end_time': '2030-05-01T20:00:00-06:00',
+            'location': 'Benchmark Hall',
+        }
+        details = {field: values[field] for field in requested_fields(prompt)}
+        usage = {'input_tokens': len(prompt) // 4, 'output_tokens': 100, 'cache_read_tokens': 0, 'cache_write_tokens': 0}
+        return details, json.dumps(details), usage
+
+
+class StubCalendar:
+    """Just enough of the Calendar API for /create-event(s) and mirror syncs.
+
+    Like the real API, an insert with an id that was already used fails with
+    409, and the events created are kept so callers can count them.
+    """
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.created = {}
+        self._ids = iter(range(1, 1 << 62))
+        self._lock = threading.Lock()
+
+    def events(self):
+        return self
+
+    def insert(self, calendarId, body):
+        return _Call(self, lambda: self._created(body))
+
+    def get(self, calendarId, eventId):
+        return _Call(self, lambda: self.created[eventId])
+
+    def list(self, **params):
+        return _Call(self, lambda: {'items': [], 'nextSyncToken': 'bench', 'timeZone': 'UTC'})
+
+    def new_batch_http_request(self, callback):
+        return _Batch(self, callback)
+
+    def _created(self, body):
+        with self._lock:
+            event_id = body.get('id') or f"bench{next(self._ids)}"
+            if event_id in self.created:
+                raise HttpError(httplib2.Response({'status': 409}), b'{"error": {"errors": [{"reason": "duplicate"}]}}')
+            event = dict(body, id=event_id, htmlLink=f"{BENCH_HOST}{event_id}", updated='2030-01-01T00:00:00Z')
+            self.created[event_id] = event
+        return event
+
+
+class StubClients:
+    """Stands in for a tenant's CalendarClientFactory."""
+
+    def __init__(self, calendar):
+        self.calendar = calendar
+
+    def available(self):
+        return True
+
+    @contextmanager
+    def client(self):
+        yield self.calendar
+
+
+class _Call:
+    def __init__(self, calendar, result):
+        self.calendar = calendar
+        self.result = result
+
+    def execute(self):
+        time.sleep(self.calendar.latency)
+        return self.result()
+
+
+class _Batch:
+    """Runs its calls in one round trip and reports each to the callback, like BatchHttpRequest."""
+
+    def __init__(self, calendar, callback):
+        self.calendar = calendar
+        self.callback = callback
+        self.calls = []
+
+    def add(self, call, request_id):
+        self.calls.append((request_id, call))
+
+    def execute(self):
+        time.sleep(self.calendar.latency)
+        for outcome in self._run():
+            self.callback(*outcome)
+
+    def _run(self):
+        """Make the calls, returning (request_id, response, exception) for each."""
+        outcomes = []
+        for request_id, call in self.calls:
+            try:
+                outcomes.append((request_id, call.result(), None))
+            except HttpError as e:
+                outcomes.append((request_id, None, e))
+        return outcomes
+
+
+def install_stubs(app_module, fetch, llm_latency, calendar_latency):
+    """Replace page fetches, every LLM provider and Google Calendar in the app."""
+    from llm_client import LLMClient
+
+    app_module.page_fetcher.fetch = fetch
+    llm = StubLLMProvider(llm_latency)
+    app_module.llm_cascade.client = LLMClient({
+        model.partition(':')[0]: llm for tiers in app_module.LLM_TIERS.values() for model, _ in tiers
+    }, upstreams=app_module.upstreams)
+    clients = StubClients(StubCalendar(calendar_latency))
+    app_module.tenants.clients = lambda tenant: clients
+
+
+def load_app(workdir, args):
+    """Import app against scratch state and swap the network for stubs."""
+    os.chdir(workdir)
+    os.environ.setdefault('PARSE_CACHE_PATH', '')
+    os.environ.setdefault('FETCH_CACHE_PATH', '')
+    os.environ['LLM_CONCURRENCY'] = str(args.llm_concurrency)
+    # Measure our own code, not the upstream rate limits
+    for prefix in ('LLM', 'FETCH', 'CALENDAR'):
+        os.environ.setdefault(f'{prefix}_RATE_LIMIT', '0')
+
+    import app as app_module
+    from fetcher import FetchResult
+
+    # Per-request log lines would dominate the timings
+    logging.getLogger().setLevel(logging.INFO if args.verbose else logging.WARNING)
+
+    pages = {BENCH_HOST + name: html for name, html in load_pages(args.corpus).items()}
+
+    def fetch(url, conditional=True):
+        time.sleep(args.fetch_latency)
+        return FetchResult(url, pages[url], 200, False, False)
+
+    install_stubs(app_module, fetch, args.llm_latency, args.calendar_latency)
+    return app_module, list(pages)
+
+
+def run_level(app_module, urls, concurrency, requests_per_level, create):
+    """Send `requests_per_level` parses (and creates) with `concurrency` threads."""
+    stage_samples = defaultdict(list)
+    samples_lock = threading.Lock()
+    observe = app_module.stage_seconds.observe
+
+    def recording_observe(value, *labels):
+        with samples_lock:
+            stage_samples[labels[0]].append(value)
+        observe(value, *labels)
+
+    app_module.stage_seconds.observe = recording_observe
+    app_module.parse_cache.clear()
+    clients = threading.local()
+    request_samples = []
+    errors = defaultdict(int)
+
+    def one(index):
+        client = getattr(clients, 'client', None)
+        if client is None:
+            client = clients.client = app_module.app.test_client()
+        url = urls[index % len(urls)]
+        started = time.perf_counter()
+        response = client.post('/parse-event', json={'url': url})
+        if response.status_code == 200 and create:
+            response = client.post('/create-event', json=response.get_json())
+        elapsed = time.perf_counter() - started
+        with samples_lock:
+            request_samples.append(elapsed)
+            if response.status_code != 200:
+                errors[str(response.status_code)] += 1
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            list(pool.map(one, range(requests_per_level)))
+        wall = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        app_module.stage_seconds.observe = observe
+
+    return {
+        'concurrency': concurrency,
+        'requests': requests_per_level,
+        'seconds': round(wall, 3),
+        'throughput_rps': round(requests_per_level / wall, 2),
+        'errors': dict(errors),
+        'peak_traced_memory_bytes': peak,
+        'latency': {'request': summarize(request_samples)},
+        'stages': {stage: summarize(samples) for stage, samples in sorted(stage_samples.items())},
+    }
+
+
+def compare(results, baseline, threshold):
+    """Return a list of regressions against a previous run's results."""
+    previous = {level['concurrency']: level for level in baseline['levels']}
+    regressions = []
+    for level in results['levels']:
+        before = previous.get(level['concurrency'])
+        if before is None:
+            continue
+        p95, old_p95 = level['latency']['request']['p95_ms'], before['latency']['request']['p95_ms']
+        if old_p95 and p95 > old_p95 * (1 + threshold):
+            regressions.append(f"c={level['concurrency']}: p95 {old_p95} ms -> {p95} ms")
+        rps, old_rps = level['throughput_rps'], before['throughput_rps']
+        if rps < old_rps * (1 - threshold):
+            regressions.append(f"c={level['concurrency']}: throughput {old_rps} -> {rps} req/s")
+    return regressions
+
+
+def report(level):
+    request = level['latency']['request']
+    print(
+        f"c={level['concurrency']:<4} {level['throughput_rps']:>8.1f} req/s  "
+        f"p50 {request['p50_ms']:>8.1f}  p95 {request['p95_ms']:>8.1f}  p99 {request['p99_ms']:>8.1f} ms  "
+        f"peak {level['peak_traced_memory_bytes'] / 1e6:.1f} MB  errors {level['errors'] or 0}"
+    )
+    for stage, stats in level['stages'].items():
+        print(f"    {stage:<22} p50 {stats['p50_ms']:>8.1f}  p95 {stats['p95_ms']:>8.1f}  p99 {stats['p99_ms']:>8.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--corpus', default=CORPUS_DIR)
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 4, 16])
+    parser.add_argument('--requests', type=int, default=100, help='requests per concurrency level')
+    parser.add_argument('--llm-latency', type=float, default=0.5, help='seconds per stubbed LLM call')
+    parser.add_argument('--calendar-latency', type=float, default=0.2, help='seconds per stubbed Calendar call')
+    parser.add_argument('--fetch-latency', type=float, default=0.1, help='seconds per stubbed page fetch')
+    parser.add_argument('--llm-concurrency', type=int, default=int(os.getenv('LLM_CONCURRENCY', 4)))
+    parser.add_argument('--no-create', action='store_true', help='only benchmark /parse-event')
+    parser.add_argument('--verbose', action='store_true', help="keep the app's info logging")
+    parser.add_argument('--output', help='write results to this JSON file')
+    parser.add_argument('--baseline', help='compare against a previous --output file')
+    parser.add_argument('--threshold', type=float, default=0.1, help='allowed relative regression')
+    args = parser.parse_args()
+    args.corpus = os.path.abspath(args.corpus)
+    output = os.path.abspath(args.output) if args.output else None
+    baseline_path = os.path.abspath(args.baseline) if args.baseline else None
+
+    with tempfile.TemporaryDirectory() as workdir:
+        app_module, urls = load_app(workdir, args)
+        results = {
+            'config': {
+                'pages': len(urls),
+                'requests_per_level': args.requests,
+                'llm_latency': args.llm_latency,
+                'calendar_latency': args.calendar_latency,
+                'fetch_latency': args.fetch_latency,
+                'llm_concurrency': args.llm_concurrency,
+                'create': not args.no_create,
+            },
+            'levels': [],
+        }
+        for concurrency in args.concurrency:
+            level = run_level(app_module, urls, concurrency, args.requests, not args.no_create)
+            results['levels'].append(level)
+            report(level)
+
+    if output:
+        with open(output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {output}")
+
+    if baseline_path:
+        with open(baseline_path) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+        print("No regressions against baseline")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""Measure app startup with and without Google credentials present.
+
+Each run imports app in a fresh interpreter inside a scratch directory, so the
+timing covers everything a gunicorn worker does at boot. With credentials,
+the first Calendar client build (from the bundled discovery document) is
+timed separately, along with the eager build app.py used to do at import.
+
+    python benchmarks/bench_startup.py                  # dummy, unexpired token
+    python benchmarks/bench_startup.py --token token.pickle
+"""
+import argparse
+import json
+import os
+import pickle
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+STARTUP_SCRIPT = """
+import json, sys, time
+sys.path.insert(0, {backend!r})
+started = time.perf_counter()
+import app
+timings = {{'import': time.perf_counter() - started}}
+clients = app.tenants.clients(app.tenants.default)
+if clients.available():
+    started = time.perf_counter()
+    with clients.client():
+        pass
+    timings['first_client'] = time.perf_counter() - started
+    import pickle
+    from googleapiclient.discovery import build
+    with open('token.pickle', 'rb') as token:
+        creds = pickle.load(token)
+    started = time.perf_counter()
+    build('calendar', 'v3', credentials=creds)
+    timings['legacy_build'] = time.perf_counter() - started
+print(json.dumps(timings))
+"""
+
+
+def dummy_token(path):
+    from google.oauth2.credentials import Credentials
+    creds = Credentials(
+        token='dummy', refresh_token=None, token_uri='https://oauth2.googleapis.com/token',
+        client_id='dummy', client_secret='dummy', expiry=datetime.utcnow() + timedelta(hours=1)
+    )
+    with open(path, 'wb') as token:
+        pickle.dump(creds, token)
+
+
+def run(workdir, repeat):
+    script = STARTUP_SCRIPT.format(backend=BACKEND_DIR)
+    samples = []
+    for _ in range(repeat):
+        output = subprocess.run(
+            [sys.executable, '-c', script], cwd=workdir, capture_output=True, text=True, check=True
+        ).stdout
+        samples.append(json.loads(output.strip().splitlines()[-1]))
+    return {key: statistics.median(sample[key] for sample in samples) for key in samples[0]}
+
+
+def report(label, timings):
+    parts = ', '.join(f"{key} {value * 1000:.1f} ms" for key, value in timings.items())
+    print(f"{label:<20} {parts}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--token', help='real token.pickle to use instead of a dummy one')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        report('no credentials', run(workdir, args.repeat))
+        token_path = os.path.join(workdir, 'token.pickle')
+        if args.token:
+            shutil.copy(args.token, token_path)
+        else:
+            dummy_token(token_path)
+        report('with credentials', run(workdir, args.repeat))
+
+
+if __name__ == '__main__':
+    main()
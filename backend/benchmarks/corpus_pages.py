@@ -0,0 +1,189 @@
+"""Deterministic event pages for the benchmarks when no saved corpus exists.
+
+Pages saved with bench_extract.py --save are the real test, but they aren't
+committed (other people's pages, and they go stale). These stand-ins cover
+the shapes that matter for extraction and parsing: a ticketing page with
+JSON-LD and heavy chrome, a microdata page, a blog post with only OpenGraph
+tags, a long listing, a script-heavy app shell and a deeply nested div page.
+The same seed always produces the same bytes, so numbers are comparable
+between runs and machines.
+
+    python benchmarks/corpus_pages.py            # write them into benchmarks/corpus
+    python benchmarks/corpus_pages.py OUT_DIR
+"""
+import json
+import os
+import random
+import sys
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'corpus')
+
+WORDS = (
+    'community garden potluck workshop music neighbors volunteer evening bring share local '
+    'kids welcome free tickets doors open parking accessible venue hall park library dance '
+    'songs stories coffee food art talk panel meet learn repair bikes seeds harvest season'
+).split()
+
+
+def _sentence(rng, words=14):
+    text = ' '.join(rng.choice(WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + '.'
+
+
+def _paragraphs(rng, count, sentences=4):
+    return '\n'.join(f"<p>{' '.join(_sentence(rng) for _ in range(sentences))}</p>" for _ in range(count))
+
+
+def _chrome(rng, title, body, head=''):
+    """Wrap `body` in the scripts, navigation, cookie banner and footer most sites carry."""
+    script = 'window.__STATE__=' + json.dumps({'items': [_sentence(rng) for _ in range(200)]}) + ';'
+    nav = ''.join(f'<li><a href="/section/{index}">{rng.choice(WORDS).title()}</a></li>' for index in range(40))
+    footer = ''.join(f'<li><a href="/about/{index}">{_sentence(rng, 3)}</a></li>' for index in range(30))
+    return (
+        f'<!DOCTYPE html><html lang="en"><head><meta charset="utf-8"><title>{title}</title>{head}'
+        f'<style>{"body{margin:0}.x{color:#333}" * 200}</style><script>{script}</script></head><body>'
+        f'<header><nav class="site-nav"><ul>{nav}</ul></nav></header>'
+        f'<div id="cookie-banner" class="cookie-consent"><p>We use cookies. {_sentence(rng)}</p></div>'
+        f'<main>{body}</main>'
+        f'<footer class="site-footer"><ul>{footer}</ul></footer>'
+        f'<script src="/static/app.js"></script></body></html>'
+    )
+
+
+def ticketing_page(rng):
+    event = {
+        '@context': 'https://schema.org',
+        '@type': 'Event',
+        'name': 'Harvest Potluck and Seed Swap',
+        'startDate': '2030-09-20T17:30:00-06:00',
+        'endDate': '2030-09-20T20:30:00-06:00',
+        'description': ' '.join(_sentence(rng) for _ in range(6)),
+        'location': {
+            '@type': 'Place',
+            'name': 'Eastside Community Hall',
+            'address': {'@type': 'PostalAddress', 'streetAddress': '1200 Elm St', 'addressLocality': 'Boulder'},
+        },
+    }
+    head = f'<script type="application/ld+json">{json.dumps(event)}</script>'
+    body = (
+        '<h1>Harvest Potluck and Seed Swap</h1>'
+        '<div class="event-meta"><div><div><span>Sat, Sep 20, 5:30 PM - 8:30 PM MDT</span></div></div></div>'
+        f'<section class="description">{_paragraphs(rng, 8)}</section>'
+        f'<aside class="related"><h2>More events</h2>{_paragraphs(rng, 12, 2)}</aside>'
+    )
+    return _chrome(rng, 'Harvest Potluck and Seed Swap | Tickets', body, head)
+
+
+def microdata_page(rng):
+    body = (
+        '<div itemscope itemtype="https://schema.org/Event">'
+        '<h1 itemprop="name">Bike Repair Night</h1>'
+        '<time itemprop="startDate" datetime="2030-10-02T18:00:00-06:00">Oct 2, 6 PM</time>'
+        '<time itemprop="endDate" datetime="2030-10-02T21:00:00-06:00">9 PM</time>'
+        '<div itemprop="location" itemscope itemtype="https://schema.org/Place">'
+        '<span itemprop="name">Library Workshop Room</span>'
+        '<div itemprop="address">1001 Arapahoe Ave, Boulder</div></div>'
+        f'<div itemprop="description">{_paragraphs(rng, 5)}</div>'
+        '</div>'
+        + ''.join(f'<div class="card"><div class="card-body"><div>{_sentence(rng)}</div></div></div>' for _ in range(60))
+    )
+    return _chrome(rng, 'Bike Repair Night - Meetup', body)
+
+
+def blog_page(rng):
+    head = (
+        '<meta property="og:title" content="Join us for the spring garden workday">'
+        '<meta property="og:description" content="Short">'
+        '<meta property="og:type" content="article">'
+    )
+    body = (
+        '<article><h1>Join us for the spring garden workday</h1>'
+        '<p>We are meeting on Saturday, April 12th from 9am until noon at the Northside garden, '
+        '2040 Pine St. Bring gloves; tools and coffee are provided.</p>'
+        f'{_paragraphs(rng, 10)}</article>'
+        f'<section class="comments">{_paragraphs(rng, 20, 2)}</section>'
+    )
+    return _chrome(rng, 'Spring garden workday', body, head)
+
+
+def listing_page(rng):
+    rows = []
+    for index in range(120):
+        day = 1 + index % 28
+        rows.append(
+            f'<li class="event"><h3>{_sentence(rng, 5)}</h3>'
+            f'<p>2030-11-{day:02d}, {6 + index % 4}:00 PM at {rng.choice(WORDS).title()} Hall</p>'
+            f'<p>{_sentence(rng, 25)}</p></li>'
+        )
+    body = f"<h1>Community calendar</h1><ul class=\"events\">{''.join(rows)}</ul>"
+    return _chrome(rng, 'Community calendar', body)
+
+
+def app_shell_page(rng):
+    head = (
+        '<meta property="event:start_time" content="2030-08-14T19:00:00-06:00">'
+        '<meta property="event:end_time" content="2030-08-14T21:00:00-06:00">'
+        '<meta property="event:location" content="Central Park Bandshell">'
+        '<meta property="og:title" content="Summer Songs in the Park">'
+        '<meta property="og:description" content="An evening of local music.">'
+    )
+    bundle = ''.join(f'function f{index}(a){{return a*{index}+{rng.randint(0, 999)}}}' for index in range(3000))
+    body = (
+        f'<div id="root"><noscript>You need JavaScript to view this page.</noscript></div>'
+        f'<script>{bundle}</script>'
+        '<div class="ssr"><h1>Summer Songs in the Park</h1><p>Bring a blanket.</p></div>'
+    )
+    return _chrome(rng, 'Summer Songs in the Park', body, head)
+
+
+def nested_div_page(rng, depth=8):
+    """The worst case for the old find_all/get_text loop, which re-emitted every nested div."""
+    blocks = []
+    for _ in range(40):
+        inner = f'<p>{_sentence(rng, 20)}</p>'
+        for _ in range(depth):
+            inner = f'<div>{inner}</div>'
+        blocks.append(inner)
+    return _chrome(rng, 'Neighborhood Dance Night', f"<h1>Neighborhood Dance Night</h1>{''.join(blocks)}")
+
+
+GENERATORS = {
+    'ticketing-jsonld.html': ticketing_page,
+    'meetup-microdata.html': microdata_page,
+    'blog-opengraph.html': blog_page,
+    'community-listing.html': listing_page,
+    'app-shell-meta.html': app_shell_page,
+    'nested-divs.html': nested_div_page,
+}
+
+
+def generate_pages(seed=2030):
+    """Return {file name: html} for the generated pages."""
+    return {name: generate(random.Random(f'{seed}:{name}')) for name, generate in GENERATORS.items()}
+
+
+def load_pages(corpus_dir=CORPUS_DIR):
+    """Return {file name: html} for the saved pages in `corpus_dir`, or the generated ones if it has none."""
+    names = sorted(name for name in os.listdir(corpus_dir) if name.endswith('.html')) \
+        if os.path.isdir(corpus_dir) else []
+    if not names:
+        print(f"No .html files in {corpus_dir}; using {len(GENERATORS)} generated pages")
+        return generate_pages()
+    pages = {}
+    for name in names:
+        with open(os.path.join(corpus_dir, name), encoding='utf-8', errors='replace') as f:
+            pages[name] = f.read()
+    return pages
+
+
+def main():
+    out_dir = sys.argv[1] if len(sys.argv) > 1 else CORPUS_DIR
+    os.makedirs(out_dir, exist_ok=True)
+    for name, html in generate_pages().items():
+        with open(os.path.join(out_dir, name), 'w', encoding='utf-8') as f:
+            f.write(html)
+        print(f"Wrote {name} ({len(html) / 1024:.0f} KB)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,192 @@
+"""Check structured output, prompt caching and the repair call against a local fake Anthropic API.
+
+Installs a fake Messages client under the app's AnthropicProvider and runs
+parse_event_with_ai for several pages, links, description styles and field
+subsets. The fake caches the way the API does: the prefix up to the
+cache_control breakpoint (tools, then system) is cached once it is at least
+the model's minimum length, and a later request with the same prefix reads it
+instead of paying for it. It checks that:
+
+- the tool and system prefix is identical across pages, links, styles and
+  field subsets, with the per-request parts in the user message only;
+- a breakpoint is only sent when the prefix is long enough to be cached, so a
+  short prompt never pays the cache write premium;
+- a prefix that is long enough is cached and read back by the next request;
+- fields come back as a structured tool call, from one provider instance;
+- an unusable reply gets one repair call that doesn't resend the page.
+
+Exits 1 if any check fails.
+
+    python benchmarks/fake_anthropic.py
+"""
+import hashlib
+import json
+import logging
+import os
+import sys
+import tempfile
+from types import SimpleNamespace
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+sys.path.insert(0, os.path.join(BACKEND_DIR, 'benchmarks'))
+
+from bench_pipeline import requested_fields  # noqa: E402
+from text_extract import CHARS_PER_TOKEN  # noqa: E402
+
+# Shortest prefix the API will cache, in tokens
+MIN_CACHEABLE_TOKENS = {'haiku': 2048}
+DEFAULT_MIN_CACHEABLE_TOKENS = 1024
+
+PAGES = [
+    ('https://drill.invalid/potluck', 'default',
+     'Harvest Potluck and Seed Swap. Sat, Sep 20, 5:30 PM - 8:30 PM MDT. Eastside Community Hall.'),
+    ('https://drill.invalid/potluck', 'telegram',
+     'Harvest Potluck and Seed Swap. Sat, Sep 20, 5:30 PM - 8:30 PM MDT. Eastside Community Hall.'),
+    ('https://drill.invalid/workday', 'default',
+     'Spring garden workday, April 12th, 9 till noon at the Northside garden. Bring gloves!'),
+    ('https://drill.invalid/repair', 'telegram',
+     'Bike repair night, Oct 2 from 6 to 9 PM at the library workshop room.'),
+]
+
+
+def tokens(value):
+    return len(json.dumps(value)) // CHARS_PER_TOKEN
+
+
+def min_cacheable(model):
+    return next(
+        (minimum for family, minimum in MIN_CACHEABLE_TOKENS.items() if family in model),
+        DEFAULT_MIN_CACHEABLE_TOKENS
+    )
+
+
+class FakeMessages:
+    """messages.create with the API's prompt caching accounting and a forced tool reply."""
+
+    def __init__(self):
+        self.requests = []
+        self.cached = set()
+        self.garble_next = False
+
+    def create(self, model, system, messages, tools, tool_choice, max_tokens, temperature, extra_headers=None):
+        request = {'model': model, 'system': system, 'messages': messages, 'tools': tools}
+        prefix = [tools] + [block for block in system]
+        breakpoint_index = max(
+            (index for index, block in enumerate(prefix) if isinstance(block, dict) and 'cache_control' in block),
+            default=None
+        )
+        cache_read = cache_write = 0
+        uncached = tokens(request)
+        request['prefix_tokens'] = tokens(prefix)
+        request['breakpoint'] = breakpoint_index is not None
+        if breakpoint_index is not None:
+            cached_part = prefix[:breakpoint_index + 1]
+            size = tokens(cached_part)
+            if size >= min_cacheable(model):
+                key = hashlib.sha1(json.dumps([model, cached_part], sort_keys=True).encode()).hexdigest()
+                if key in self.cached:
+                    cache_read = size
+                else:
+                    cache_write = size
+                    self.cached.add(key)
+                uncached -= size
+        request['cache_read'] = cache_read
+        self.requests.append(request)
+
+        usage = SimpleNamespace(
+            input_tokens=uncached, output_tokens=60,
+            cache_read_input_tokens=cache_read, cache_creation_input_tokens=cache_write,
+        )
+        if self.garble_next:
+            self.garble_next = False
+            return SimpleNamespace(content=[SimpleNamespace(type='text', text='Sure! The event is on Saturday.')], usage=usage)
+        prompt = messages[-1]['content']
+        url = next((line.split(': ', 1)[1] for line in prompt.splitlines() if line.startswith('Source URL: ')), '')
+        values = {
+            'title': 'Drill Event',
+            'description': f'Source: {url}\n\nA drill.',
+            'start_time': '2030-09-20T17:30:00-06:00',
+            'end_time': '2030-09-20T20:30:00-06:00',
+            'location': 'Eastside Community Hall',
+        }
+        details = {field: values[field] for field in requested_fields(prompt)}
+        return SimpleNamespace(content=[SimpleNamespace(type='tool_use', input=details)], usage=usage)
+
+
+def main():
+    os.environ.setdefault('PARSE_CACHE_PATH', '')
+    os.environ.setdefault('FETCH_CACHE_PATH', '')
+    problems = []
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        import app as app_module
+        from llm_client import AnthropicProvider, LLMClient
+
+        logging.getLogger().setLevel(logging.CRITICAL)
+        fake = FakeMessages()
+        provider = AnthropicProvider(client=SimpleNamespace(messages=fake))
+        app_module.llm_cascade.client = LLMClient({'anthropic': provider}, upstreams=app_module.upstreams)
+
+        for url, style, page in PAGES:
+            result = app_module.parse_event_with_ai(page, url, style)
+            if not isinstance(result.details, dict) or not result.details['description'].startswith(f'Source: {url}'):
+                problems.append(f'{url} ({style}): expected structured fields, got {result.raw!r}')
+        # Only the missing fields, as when structured data found the rest
+        for url, style, page in PAGES[:2]:
+            known = {'title': 'Drill Event', 'start_time': '2030-09-20T17:30:00-06:00', 'location': 'Hall'}
+            app_module.parse_event_with_ai(page, url, style, ['description', 'end_time'], known)
+
+        prefixes = {json.dumps([request['tools'], request['system']], sort_keys=True) for request in fake.requests}
+        if len(prefixes) != 1:
+            problems.append(f'parses sent {len(prefixes)} different tool/system prefixes')
+        for request in fake.requests:
+            static = json.dumps([request['tools'], request['system']])
+            if 'drill.invalid' in static or 'Webpage content' in static:
+                problems.append('per-request text leaked into the cached prefix')
+                break
+        for request in fake.requests:
+            cacheable = request['prefix_tokens'] >= min_cacheable(request['model'])
+            if request['breakpoint'] != cacheable:
+                problems.append(
+                    f"{request['model']}: prefix of ~{request['prefix_tokens']} tokens sent "
+                    f"{'with' if request['breakpoint'] else 'without'} a cache breakpoint"
+                )
+                break
+
+        # A prefix long enough to cache is marked, and read back by the next request
+        long_system = app_module.EVENT_SYSTEM_PROMPT + '\n' + 'Keep the organizer\'s wording. ' * 400
+        model = 'claude-3-5-sonnet-20240620'
+        before = len(fake.requests)
+        for url, style, page in PAGES[:2]:
+            messages = [{'role': 'user', 'content': app_module.event_prompt(page, url, style)}]
+            provider.complete(model, long_system, messages, app_module.EVENT_SCHEMA, 1000, 0)
+        if not fake.requests[-1]['cache_read'] or len(fake.requests) - before != 2:
+            problems.append(f"a ~{fake.requests[-1]['prefix_tokens']}-token prefix was not read from the cache")
+
+        if app_module.llm_cascade.client.provider('anthropic') is not provider:
+            problems.append('the provider was not reused')
+
+        before = len(fake.requests)
+        fake.garble_next = True
+        url, style, page = PAGES[2]
+        result = app_module.parse_event_with_ai(page, url, style)
+        repair = fake.requests[before + 1:]
+        if len(fake.requests) - before != 2 or not result.repaired:
+            problems.append(f'an unusable reply should get exactly one repair call, got {len(fake.requests) - before - 1}')
+        elif page in repair[0]['messages'][-1]['content']:
+            problems.append('the repair call resent the page')
+
+    reads = sum(request['cache_read'] for request in fake.requests)
+    print(
+        f"{len(fake.requests)} requests, app prefix ~{fake.requests[0]['prefix_tokens']} tokens, "
+        f"{sum(1 for request in fake.requests if request['cache_read'])} cache reads ({reads} tokens)"
+    )
+    for problem in problems:
+        print(f"FAILED: {problem}")
+    if problems:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
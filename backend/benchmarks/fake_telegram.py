@@ -0,0 +1,257 @@
+"""Run bot replicas in webhook mode against a local fake Telegram, fully offline.
+
+Starts a fake Bot API (which also plays the parse/create API the bot calls)
+and several `bot.py` processes with BOT_MODE=webhook sharing one state file.
+It posts event links to the replicas' webhooks, then an admin's 👍 on each
+parsed event, sending a share of the updates to two replicas as Telegram does
+when it redelivers. It reports how fast the webhooks acknowledged updates and
+checks that every update was handled exactly once. Exits 1 if not.
+
+    python benchmarks/fake_telegram.py
+    python benchmarks/fake_telegram.py --replicas 3 --messages 100 --redeliver 0.5
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+import httpx
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TOKEN = '123456:fake-token'
+SECRET = 'drill-secret'
+CHAT = {'id': -1001, 'type': 'supergroup', 'title': 'Drill'}
+ADMIN = {'id': 7, 'is_bot': False, 'first_name': 'Admin', 'username': 'drill_admin'}
+EVENT = {
+    'title': 'Fault Drill', 'description': 'Source: https://drill.invalid/\n\nRehearsal.', 'location': 'Here',
+    'start_time': '2030-05-01T18:00:00-06:00', 'end_time': '2030-05-01T20:00:00-06:00',
+}
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+class FakeTelegram(ThreadingHTTPServer):
+    """Bot API methods the bot calls, plus /parse-event and /create-event."""
+
+    daemon_threads = True
+
+    def __init__(self, api_latency):
+        self.api_latency = api_latency
+        self.calls = []
+        self.message_ids = iter(range(1000, 1 << 30))
+        self.lock = threading.Lock()
+        super().__init__(('127.0.0.1', 0), FakeHandler)
+
+    def record(self, method, params):
+        with self.lock:
+            self.calls.append((method, params))
+
+    def called(self, method, text=None):
+        with self.lock:
+            return [params for name, params in self.calls
+                    if name == method and (text is None or text in params.get('text', ''))]
+
+
+class FakeHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        if self.path in ('/parse-event', '/create-event'):
+            self.server.record(self.path, {**json.loads(body), 'idempotency_key': self.headers.get('Idempotency-Key')})
+            time.sleep(self.server.api_latency)
+            self._reply(EVENT if self.path == '/parse-event' else {'eventId': 'drill'})
+            return
+        method = self.path.rsplit('/', 1)[-1]
+        if 'json' in self.headers.get('Content-Type', ''):
+            params = json.loads(body or b'{}')
+        else:
+            params = {key: values[0] for key, values in parse_qs(body.decode()).items()}
+        if method == 'getMe':
+            result = {'id': 42, 'is_bot': True, 'first_name': 'Drill', 'username': 'drill_bot'}
+        elif method == 'sendMessage':
+            with self.server.lock:
+                message_id = next(self.server.message_ids)
+            result = {'message_id': message_id, 'date': int(time.time()), 'chat': CHAT, 'text': params.get('text', '')}
+            params['sent_message_id'] = message_id
+        else:
+            result = True
+        self.server.record(method, params)
+        self._reply({'ok': True, 'result': result})
+
+    def _reply(self, payload):
+        data = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def message_update(update_id, message_id):
+    return {'update_id': update_id, 'message': {
+        'message_id': message_id, 'date': int(time.time()), 'chat': CHAT,
+        'from': {'id': 8, 'is_bot': False, 'first_name': 'Member'},
+        'text': f'Come along! https://drill.invalid/events/{message_id}',
+    }}
+
+
+def reaction_update(update_id, message_id):
+    return {'update_id': update_id, 'message_reaction': {
+        'chat': CHAT, 'message_id': message_id, 'user': ADMIN, 'date': int(time.time()),
+        'old_reaction': [], 'new_reaction': [{'type': 'emoji', 'emoji': '👍'}],
+    }}
+
+
+async def deliver(webhooks, updates, redeliver, concurrency):
+    """Post each update to one replica, and some to a second one; return ack latencies."""
+    slots = asyncio.Semaphore(concurrency)
+    acks, statuses = [], Counter()
+
+    async with httpx.AsyncClient(timeout=30) as client:
+        async def post(url, update):
+            async with slots:
+                started = time.perf_counter()
+                response = await client.post(
+                    url, json=update, headers={'X-Telegram-Bot-Api-Secret-Token': SECRET}
+                )
+                acks.append(time.perf_counter() - started)
+                statuses[response.status_code] += 1
+
+        posts = []
+        for index, update in enumerate(updates):
+            first = index % len(webhooks)
+            posts.append(post(webhooks[first], update))
+            if len(webhooks) > 1 and random.random() < redeliver:
+                posts.append(post(webhooks[(first + 1) % len(webhooks)], update))
+        await asyncio.gather(*posts)
+    return acks, statuses
+
+
+def wait_for(condition, timeout):
+    deadline = time.time() + timeout
+    while not condition():
+        if time.time() > deadline:
+            return False
+        time.sleep(0.1)
+    return True
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[max(0, min(len(ordered) - 1, int(fraction * len(ordered) + 0.5) - 1))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--replicas', type=int, default=2)
+    parser.add_argument('--messages', type=int, default=40)
+    parser.add_argument('--redeliver', type=float, default=0.3, help='share of updates also sent to a second replica')
+    parser.add_argument('--concurrency', type=int, default=20, help='webhook posts in flight')
+    parser.add_argument('--api-latency', type=float, default=0.5, help='seconds the fake parse/create API takes')
+    parser.add_argument('--timeout', type=float, default=120)
+    parser.add_argument('--verbose', action='store_true', help="show the replicas' logs")
+    args = parser.parse_args()
+
+    fake = FakeTelegram(args.api_latency)
+    threading.Thread(target=fake.serve_forever, daemon=True).start()
+    fake_url = f'http://127.0.0.1:{fake.server_address[1]}'
+    problems = []
+
+    with tempfile.TemporaryDirectory() as workdir:
+        ports = [free_port() for _ in range(args.replicas)]
+        replicas = []
+        for port in ports:
+            env = dict(
+                os.environ,
+                TELEGRAM_BOT_TOKEN=TOKEN,
+                TELEGRAM_API_URL=f'{fake_url}/bot',
+                API_URL=fake_url,
+                BOT_MODE='webhook',
+                BOT_WEBHOOK_URL=f'{fake_url}/hook',
+                BOT_WEBHOOK_LISTEN='127.0.0.1',
+                BOT_WEBHOOK_PORT=str(port),
+                BOT_WEBHOOK_SECRET=SECRET,
+                ADMIN_USERNAMES=ADMIN['username'],
+                PENDING_STORE='sqlite',
+                PENDING_DB_PATH=os.path.join(workdir, 'bot_state.sqlite3'),
+            )
+            output = None if args.verbose else subprocess.DEVNULL
+            replicas.append(subprocess.Popen(
+                [sys.executable, os.path.join(BACKEND_DIR, 'bot.py')],
+                cwd=workdir, env=env, stdout=output, stderr=output
+            ))
+        try:
+            if not wait_for(lambda: len(fake.called('setWebhook')) >= args.replicas, 60):
+                sys.exit('Replicas did not start')
+            webhook = fake.called('setWebhook')[0]
+            print(f"{args.replicas} replicas registered {webhook['url']} for {webhook.get('allowed_updates')}")
+            webhooks = [f'http://127.0.0.1:{port}/telegram' for port in ports]
+
+            started = time.perf_counter()
+            updates = [message_update(index + 1, index + 1) for index in range(args.messages)]
+            acks, statuses = asyncio.run(deliver(webhooks, updates, args.redeliver, args.concurrency))
+            if not wait_for(lambda: len(fake.called('sendMessage', 'Event Detected')) >= args.messages, args.timeout):
+                problems.append('not every link got a reply')
+            replies = fake.called('sendMessage', 'Event Detected')
+
+            reactions = [
+                reaction_update(args.messages + index + 1, reply['sent_message_id'])
+                for index, reply in enumerate(replies)
+            ]
+            more_acks, more_statuses = asyncio.run(deliver(webhooks, reactions, args.redeliver, args.concurrency))
+            acks += more_acks
+            statuses.update(more_statuses)
+            if not wait_for(lambda: len(fake.called('sendMessage', 'added to the calendar')) >= len(reactions), args.timeout):
+                problems.append('not every approval was confirmed')
+            time.sleep(1)  # let stray duplicates show up
+            elapsed = time.perf_counter() - started
+        finally:
+            for replica in replicas:
+                replica.terminate()
+            for replica in replicas:
+                replica.wait(timeout=30)
+
+    deliveries = sum(statuses.values())
+    print(
+        f"{deliveries} deliveries of {len(updates) + len(reactions)} updates in {elapsed:.1f}s  "
+        f"statuses {dict(statuses)}  ack p50 {percentile(acks, 0.5) * 1000:.1f} ms  "
+        f"p95 {percentile(acks, 0.95) * 1000:.1f} ms (API takes {args.api_latency * 1000:.0f} ms)"
+    )
+    counts = {
+        'parse-event calls': (len(fake.called('/parse-event')), args.messages),
+        'event replies': (len(fake.called('sendMessage', 'Event Detected')), args.messages),
+        'create-event calls': (len(fake.called('/create-event')), len(reactions)),
+        'idempotency keys': (len({params['idempotency_key'] for params in fake.called('/create-event')
+                                  if params['idempotency_key']}), len(reactions)),
+        'approval replies': (len(fake.called('sendMessage', 'added to the calendar')), len(reactions)),
+    }
+    for name, (seen, expected) in counts.items():
+        print(f"    {name:<20} {seen} (expected {expected})")
+        if seen != expected:
+            problems.append(f"{name}: {seen}, expected {expected}")
+    if set(statuses) != {200}:
+        problems.append(f"webhook answered {dict(statuses)}")
+    for problem in problems:
+        print(f"FAILED: {problem}")
+    if problems:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,283 @@
+"""Check how the API copes with failing upstreams, fully offline.
+
+Runs /parse-event, /create-event and /create-events through the Flask test
+client with the stubs from bench_pipeline, wrapped so they fail on cue: rate
+limited with a Retry-After, flaky connections, quota errors, batch responses
+lost after the inserts went through, or down for a while. Each
+scenario prints the status codes returned, latency and the upstream retry
+and circuit breaker counts from /upstream-stats, and checks them against
+what the resilience layer should do. Exits 1 if any check fails.
+
+    python benchmarks/fault_injection.py
+    python benchmarks/fault_injection.py --scenarios llm-outage calendar-outage
+"""
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import httplib2
+import requests
+from googleapiclient.errors import HttpError
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_pipeline import StubCalendar, StubClients, _Batch, _Call, install_stubs, percentile  # noqa: E402
+
+import metrics  # noqa: E402
+
+PAGE = "<html><body><h1>Fault Drill {n}</h1><p>An event used to rehearse upstream failures.</p></body></html>"
+BULK_EVENTS = 5
+
+
+class StubAPIError(Exception):
+    """Shaped like the Anthropic SDK's status errors."""
+
+    def __init__(self, status_code, retry_after=None):
+        super().__init__(f"Error code: {status_code}")
+        self.status_code = status_code
+        self.response = SimpleNamespace(headers={'retry-after': retry_after} if retry_after else {})
+
+
+def calendar_error(status, reason, retry_after=None):
+    headers = {'status': status}
+    if retry_after:
+        headers['retry-after'] = retry_after
+    return HttpError(httplib2.Response(headers), f'{{"error": {{"errors": [{{"reason": "{reason}"}}]}}}}'.encode())
+
+
+class Faults:
+    """Decides, per upstream call, whether to fail it and with what.
+
+    A rule gets the attempt number of the call within the current API request
+    (from its request id) and the seconds since the scenario started.
+    """
+
+    def __init__(self, rules):
+        self.rules = rules  # upstream -> rule(attempt, elapsed) -> exception or None
+        self.calls = Counter()
+        self.started = time.monotonic()
+        self._lock = threading.Lock()
+
+    def check(self, upstream):
+        rule = self.rules.get(upstream)
+        with self._lock:
+            key = (upstream, metrics.request_id_var.get())
+            self.calls[key] += 1
+            attempt = self.calls[key]
+        error = rule(attempt, time.monotonic() - self.started) if rule else None
+        if error is not None:
+            raise error
+
+
+class FaultyLLM:
+    def __init__(self, provider, faults):
+        self.provider = provider
+        self.faults = faults
+
+    def complete(self, *args):
+        self.faults.check('llm')
+        return self.provider.complete(*args)
+
+
+class FaultyCalendar(StubCalendar):
+    def __init__(self, latency, faults):
+        super().__init__(latency)
+        self.faults = faults
+
+    def insert(self, calendarId, body):
+        def created():
+            self.faults.check('calendar')
+            return self._created(body)
+        return _Call(self, created)
+
+    def new_batch_http_request(self, callback):
+        return _FaultyBatch(self, callback)
+
+
+class _FaultyBatch(_Batch):
+    """Fails, if told to, after its inserts were made: the response was lost, not the request."""
+
+    def execute(self):
+        time.sleep(self.calendar.latency)
+        outcomes = self._run()
+        self.calendar.faults.check('calendar-batch')
+        for outcome in outcomes:
+            self.callback(*outcome)
+
+
+def first_attempt(error):
+    return lambda attempt, elapsed: error() if attempt == 1 else None
+
+
+def until(seconds, error):
+    return lambda attempt, elapsed: error() if elapsed < seconds else None
+
+
+def always(error):
+    return lambda attempt, elapsed: error()
+
+
+# name -> (fault rules, what to send ('parse', 'create' or 'bulk'),
+#          check(statuses, upstream stats, stub calendar) -> problems)
+SCENARIOS = {
+    'llm-rate-limited': (
+        {'llm': first_attempt(lambda: StubAPIError(429, '0.2'))},
+        'parse',
+        lambda statuses, stats, calendar: [] if set(statuses) == {200} and _sum(stats, 'llm', 'retried') else
+        ['429s with a short Retry-After should all be retried to a 200'],
+    ),
+    'llm-outage': (
+        {'llm': until(1.0, lambda: StubAPIError(529))},
+        'parse',
+        lambda statuses, stats, calendar: (
+            ([] if statuses.get(503) else ['an outage should surface as 503s'])
+            + ([] if statuses.get(200) else ['parses should recover once the model is back'])
+            + ([] if _sum(stats, 'llm', 'rejected') else ['the breaker should reject calls while open'])
+            + ([] if set(statuses) <= {200, 503} else [f'unexpected statuses {dict(statuses)}'])
+        ),
+    ),
+    'fetch-flaky': (
+        {'fetch': first_attempt(lambda: requests.ConnectionError('connection reset'))},
+        'parse',
+        lambda statuses, stats, calendar: [] if set(statuses) == {200} and _sum(stats, 'fetch', 'retried') else
+        ['dropped connections should be retried'],
+    ),
+    'calendar-quota': (
+        {'calendar': first_attempt(lambda: calendar_error(403, 'rateLimitExceeded', '0.1'))},
+        'create',
+        lambda statuses, stats, calendar: [] if set(statuses) == {200} and _sum(stats, 'calendar', 'retried') else
+        ['rate-limit 403s from Calendar should be retried'],
+    ),
+    'calendar-outage': (
+        {'calendar': always(lambda: calendar_error(503, 'backendError'))},
+        'create',
+        lambda statuses, stats, calendar: (
+            ([] if set(statuses) == {503} else [f'creates should fail with 503, got {dict(statuses)}'])
+            + ([] if _sum(stats, 'calendar', 'rejected') else ['the breaker should reject calls while open'])
+        ),
+    ),
+    'calendar-batch-lost': (
+        {'calendar-batch': first_attempt(lambda: TimeoutError('timed out reading the batch response'))},
+        'bulk',
+        lambda statuses, stats, calendar: (
+            ([] if set(statuses) == {200} else [f'every event should be reported created, got {dict(statuses)}'])
+            + ([] if len({event['summary'] for event in calendar.created.values()}) == len(calendar.created)
+               else ['retried batches should not insert an event twice'])
+        ),
+    ),
+}
+
+
+def _sum(stats, prefix, outcome):
+    return sum(upstream[outcome] for name, upstream in stats.items() if name.split(':')[0] == prefix)
+
+
+def run_scenario(app_module, name, args):
+    from fetcher import FetchResult
+    from resilience import upstreams_from_env
+
+    rules, mode, check = SCENARIOS[name]
+    faults = Faults(rules)
+    # Fresh breakers and counters for every scenario
+    app_module.upstreams = upstreams_from_env()
+    app_module.parse_cache.clear()
+
+    def fetch(url, conditional=True):
+        faults.check('fetch')
+        time.sleep(args.fetch_latency)
+        return FetchResult(url, PAGE.format(n=url.rsplit('/', 1)[-1]), 200, False, False)
+
+    install_stubs(app_module, fetch, args.llm_latency, args.calendar_latency)
+    client = app_module.llm_cascade.client
+    for provider_name, provider in list(client._providers.items()):
+        client._providers[provider_name] = FaultyLLM(provider, faults)
+    calendar = FaultyCalendar(args.calendar_latency, faults)
+    clients = StubClients(calendar)
+    app_module.tenants.clients = lambda tenant: clients
+    # Load the calendar copy first, as a serving process does when it starts
+    app_module.calendar_mirror.sync(calendar, app_module.tenants.default.calendar_id)
+
+    statuses = Counter()
+    latencies = []
+    lock = threading.Lock()
+    valid_event = {
+        'title': 'Fault Drill', 'description': 'Source: https://drill.invalid/', 'location': 'Here',
+        'start_time': '2030-05-01T18:00:00-06:00', 'end_time': '2030-05-01T20:00:00-06:00',
+    }
+
+    def one(index):
+        test_client = app_module.app.test_client()
+        started = time.perf_counter()
+        if mode == 'create':
+            response = test_client.post('/create-event', json=valid_event)
+        elif mode == 'bulk':
+            events = [dict(valid_event, title=f'Fault Drill {index}.{n}') for n in range(BULK_EVENTS)]
+            response = test_client.post('/create-events', json={'events': events})
+        else:
+            response = test_client.post('/parse-event', json={'url': f'https://drill.invalid/{name}/{index}'})
+        if response.status_code == 503 and 'Retry-After' not in response.headers:
+            status = '503 without Retry-After'
+        elif mode == 'bulk' and response.status_code == 200 and response.get_json()['created'] != BULK_EVENTS:
+            status = f"200 with {BULK_EVENTS - response.get_json()['created']} not created"
+        else:
+            status = response.status_code
+        with lock:
+            statuses[status] += 1
+            latencies.append(time.perf_counter() - started)
+        # Spread the requests out so an outage has a start, a middle and an end
+        time.sleep(args.spacing)
+
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        list(pool.map(one, range(args.requests)))
+
+    stats = app_module.app.test_client().get('/upstream-stats').get_json()
+    problems = check(statuses, stats, calendar)
+    print(
+        f"{name:<18} {dict(statuses)}  p50 {percentile(latencies, 0.5) * 1000:.0f} ms  "
+        f"p95 {percentile(latencies, 0.95) * 1000:.0f} ms  {'ok' if not problems else 'FAILED'}"
+    )
+    for upstream, upstream_stats in stats.items():
+        print(f"    {upstream:<48} {upstream_stats}")
+    for problem in problems:
+        print(f"    FAILED: {problem}")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scenarios', nargs='+', choices=sorted(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument('--requests', type=int, default=40, help='requests per scenario')
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--spacing', type=float, default=0.25, help='pause after each request, per thread')
+    parser.add_argument('--llm-latency', type=float, default=0.05)
+    parser.add_argument('--fetch-latency', type=float, default=0.01)
+    parser.add_argument('--calendar-latency', type=float, default=0.02)
+    args = parser.parse_args()
+
+    # Short delays and reset times so a scenario takes seconds, not minutes
+    os.environ.setdefault('RETRY_MAX_DELAY', '0.5')
+    os.environ.setdefault('BREAKER_RESET_TIMEOUT', '1')
+    os.environ.setdefault('PARSE_CACHE_PATH', '')
+    os.environ.setdefault('FETCH_CACHE_PATH', '')
+    failed = []
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        import app as app_module
+
+        logging.getLogger().setLevel(logging.CRITICAL)
+        for name in args.scenarios:
+            if run_scenario(app_module, name, args):
+                failed.append(name)
+    if failed:
+        sys.exit(f"Failed scenarios: {', '.join(failed)}")
+
+
+if __name__ == '__main__':
+    main()
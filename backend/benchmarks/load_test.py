@@ -0,0 +1,175 @@
+"""Load test the sync and gevent serving modes against each other.
+
+Starts gunicorn on stub_wsgi:app (page fetch, LLM and Calendar stubbed with
+fixed delays) once with sync workers and once with gevent, fires the same
+number of concurrent /parse-event requests at each, and reports throughput,
+latency, peak requests in flight and peak RSS of all gunicorn processes.
+
+    python benchmarks/load_test.py --requests 400 --concurrency 200
+    python benchmarks/load_test.py --modes async --concurrency 500 --requests 1000
+"""
+import argparse
+import asyncio
+import math
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import httpx
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.dirname(BENCH_DIR)
+
+MODES = {
+    'sync': lambda workers: ['--workers', str(workers)],
+    'async': lambda workers: ['-c', os.path.join(BACKEND_DIR, 'gunicorn_async.conf.py')],
+}
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def process_tree_rss(pid):
+    """Resident memory in bytes of `pid` and its children, from /proc."""
+    children = {}
+    for entry in os.listdir('/proc'):
+        if entry.isdigit():
+            try:
+                with open(f'/proc/{entry}/stat') as f:
+                    ppid = int(f.read().rsplit(')', 1)[1].split()[1])
+            except (OSError, IndexError, ValueError):
+                continue
+            children.setdefault(ppid, []).append(int(entry))
+    total, pending = 0, [pid]
+    while pending:
+        current = pending.pop()
+        pending.extend(children.get(current, []))
+        try:
+            with open(f'/proc/{current}/status') as f:
+                for line in f:
+                    if line.startswith('VmRSS:'):
+                        total += int(line.split()[1]) * 1024
+        except OSError:
+            pass
+    return total
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[max(0, min(len(ordered) - 1, math.ceil(fraction * len(ordered)) - 1))]
+
+
+async def fire(base_url, requests, concurrency, timeout):
+    slots = asyncio.Semaphore(concurrency)
+    latencies, statuses = [], {}
+    in_flight = peak_in_flight = 0
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits) as client:
+        async def one(index):
+            nonlocal in_flight, peak_in_flight
+            async with slots:
+                in_flight += 1
+                peak_in_flight = max(peak_in_flight, in_flight)
+                started = time.perf_counter()
+                try:
+                    response = await client.post('/parse-event', json={'url': f'https://bench.invalid/{index}'})
+                    status = str(response.status_code)
+                except httpx.HTTPError as e:
+                    status = type(e).__name__
+                latencies.append(time.perf_counter() - started)
+                statuses[status] = statuses.get(status, 0) + 1
+                in_flight -= 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one(index) for index in range(requests)))
+        wall = time.perf_counter() - started
+    return wall, latencies, statuses, peak_in_flight
+
+
+def run_mode(mode, args):
+    port = free_port()
+    env = dict(
+        os.environ,
+        PARSE_CACHE_PATH='',
+        FETCH_CACHE_PATH='',
+        STUB_FETCH_LATENCY=str(args.fetch_latency),
+        STUB_LLM_LATENCY=str(args.llm_latency),
+        STUB_CALENDAR_LATENCY=str(args.calendar_latency),
+        LLM_RATE_LIMIT='0',
+        FETCH_RATE_LIMIT='0',
+        CALENDAR_RATE_LIMIT='0',
+    )
+    with tempfile.TemporaryDirectory() as workdir:
+        command = [
+            sys.executable, '-m', 'gunicorn', 'stub_wsgi:app',
+            '--pythonpath', f'{BENCH_DIR},{BACKEND_DIR}',
+            '--bind', f'127.0.0.1:{port}', '--log-level', 'warning',
+            *MODES[mode](args.sync_workers),
+        ]
+        server = subprocess.Popen(command, cwd=workdir, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            base_url = f'http://127.0.0.1:{port}'
+            deadline = time.time() + 60
+            while True:
+                try:
+                    httpx.get(f'{base_url}/parse-stats', timeout=2)
+                    break
+                except httpx.HTTPError:
+                    if time.time() > deadline or server.poll() is not None:
+                        raise RuntimeError(f'{mode} server did not start')
+                    time.sleep(0.2)
+
+            peak_rss = process_tree_rss(server.pid)
+            stop = threading.Event()
+
+            def sample_rss():
+                nonlocal peak_rss
+                while not stop.wait(0.2):
+                    peak_rss = max(peak_rss, process_tree_rss(server.pid))
+
+            sampler = threading.Thread(target=sample_rss, daemon=True)
+            sampler.start()
+            wall, latencies, statuses, peak_in_flight = asyncio.run(
+                fire(base_url, args.requests, args.concurrency, args.timeout)
+            )
+            stop.set()
+            sampler.join()
+        finally:
+            server.send_signal(signal.SIGTERM)
+            server.wait(timeout=30)
+
+    label = f'sync x{args.sync_workers}' if mode == 'sync' else 'async (gevent x1)'
+    print(
+        f"{label:<18} {args.requests / wall:>7.1f} req/s  "
+        f"p50 {percentile(latencies, 0.5) * 1000:>7.0f}  p95 {percentile(latencies, 0.95) * 1000:>7.0f} ms  "
+        f"client in flight {peak_in_flight:>4}  peak RSS {peak_rss / 1e6:>6.1f} MB  {statuses}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--modes', nargs='+', choices=sorted(MODES), default=['sync', 'async'])
+    parser.add_argument('--requests', type=int, default=400)
+    parser.add_argument('--concurrency', type=int, default=200)
+    parser.add_argument('--sync-workers', type=int, default=4, help='processes in sync mode')
+    parser.add_argument('--llm-latency', type=float, default=1.0)
+    parser.add_argument('--fetch-latency', type=float, default=0.1)
+    parser.add_argument('--calendar-latency', type=float, default=0.2)
+    parser.add_argument('--timeout', type=float, default=300)
+    args = parser.parse_args()
+
+    for mode in args.modes:
+        run_mode(mode, args)
+
+
+if __name__ == '__main__':
+    main()
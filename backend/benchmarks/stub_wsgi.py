@@ -0,0 +1,39 @@
+"""The app with page fetches, the LLM and Google Calendar replaced by stubs.
+
+Used by load_test.py as the gunicorn entry point. Stub latencies come from
+STUB_FETCH_LATENCY, STUB_LLM_LATENCY and STUB_CALENDAR_LATENCY (seconds).
+"""
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_pipeline import install_stubs  # noqa: E402
+
+import app as app_module  # noqa: E402
+from fetcher import FetchResult  # noqa: E402
+
+PAGE = (
+    "<html><body><h1>Community Potluck {n}</h1>"
+    "<p>Bring a dish to share. Music, games and good company in the park for everyone.</p>"
+    "</body></html>"
+)
+
+
+def fetch(url, conditional=True):
+    time.sleep(float(os.getenv('STUB_FETCH_LATENCY', 0.1)))
+    return FetchResult(url, PAGE.format(n=url.rsplit('/', 1)[-1]), 200, False, False)
+
+
+install_stubs(
+    app_module, fetch,
+    llm_latency=float(os.getenv('STUB_LLM_LATENCY', 1.0)),
+    calendar_latency=float(os.getenv('STUB_CALENDAR_LATENCY', 0.2)),
+)
+
+# Per-request log lines would dominate the timings
+logging.getLogger().setLevel(logging.WARNING)
+
+app = app_module.app
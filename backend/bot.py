@@ -1,22 +1,34 @@
 #!/usr/bin/env python
 import os
 import re
+import asyncio
 import logging
-import requests
+import time
+import httpx
 from dotenv import load_dotenv
+import metrics
+from resilience import backoff_delay, parse_retry_after
+from pending_store import store_from_env
+from update_log import update_log_from_env
 from telegram import Update, ReactionTypeEmoji
 from telegram.ext import (
     Application,
+    ApplicationHandlerStop,
     CommandHandler,
     MessageHandler,
+    TypeHandler,
     filters,
     ContextTypes,
     MessageReactionHandler,
 )
 
-# Enable logging
+# Enable logging; each line carries the request id sent to the API
+log_handler = logging.StreamHandler()
+log_handler.addFilter(metrics.RequestIdFilter())
 logging.basicConfig(
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s", level=logging.INFO
+    format="%(asctime)s - %(name)s - %(levelname)s - %(request_id)s - %(message)s",
+    level=logging.INFO,
+    handlers=[log_handler],
 )
 # Set higher logging level for httpx to avoid all GET and POST requests being logged
 logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -27,12 +39,113 @@ logger = logging.getLogger(__name__)
 load_dotenv()
 TELEGRAM_BOT_TOKEN = os.getenv('TELEGRAM_BOT_TOKEN')
 API_URL = os.getenv('API_URL', 'http://127.0.0.1:8080').rstrip('/')  # Default to port 8080 to match Railway
+# Sent with every API call when the API serves several calendars; the chat id then picks the calendar
+API_KEY = os.getenv('BOT_API_KEY')
+# Override to point the bot at another Bot API server, e.g. a local one
+TELEGRAM_API_URL = os.getenv('TELEGRAM_API_URL', 'https://api.telegram.org/bot')
+
+# `polling` for a single process, or `webhook` to receive updates over HTTPS, possibly on several replicas
+BOT_MODE = os.getenv('BOT_MODE', 'polling')
+WEBHOOK_URL = os.getenv('BOT_WEBHOOK_URL')  # public URL Telegram posts updates to
+WEBHOOK_LISTEN = os.getenv('BOT_WEBHOOK_LISTEN', '0.0.0.0')
+WEBHOOK_PORT = int(os.getenv('BOT_WEBHOOK_PORT', os.getenv('PORT', 8443)))
+WEBHOOK_SECRET = os.getenv('BOT_WEBHOOK_SECRET')
+# Updates received but not yet handled; when full, the webhook stops acknowledging and Telegram backs off
+UPDATE_QUEUE_SIZE = int(os.getenv('BOT_UPDATE_QUEUE_SIZE', 1000))
+
+# Only the updates the handlers below use
+ALLOWED_UPDATES = [Update.MESSAGE, Update.MESSAGE_REACTION]
 
 # Admin list - usernames without @ symbol
 ADMIN_USERNAMES = os.getenv('ADMIN_USERNAMES', '').split(',')
 
-# Store pending events
-pending_events = {}
+# Concurrency limits and timeouts for calls to the API
+MAX_CONCURRENT_UPDATES = int(os.getenv('BOT_MAX_CONCURRENT_UPDATES', 16))
+MAX_CONCURRENT_URLS = int(os.getenv('BOT_MAX_CONCURRENT_URLS', 4))
+API_TIMEOUT = httpx.Timeout(float(os.getenv('BOT_API_TIMEOUT', 120)), connect=10.0)
+# Retries of API calls answered with 503/429 (an upstream is down or busy)
+API_RETRIES = int(os.getenv('BOT_API_RETRIES', 2))
+API_MAX_RETRY_DELAY = float(os.getenv('BOT_API_MAX_RETRY_DELAY', 60))
+
+# Events awaiting admin approval, keyed by (chat_id, bot message id). The stores block
+# (SQLite waits on file locks, Redis on the network), so handlers call them in a thread.
+pending_events = store_from_env()
+
+# Update ids already dispatched, shared between replicas like the pending events
+update_log = update_log_from_env()
+
+# Shared HTTP client for API calls, created when the application starts
+http_client = None
+
+# Bounds the number of URLs being parsed at once across all chats
+url_slots = asyncio.Semaphore(MAX_CONCURRENT_URLS)
+
+# Prometheus metrics, served on BOT_METRICS_PORT when it's set
+bot_metrics = metrics.Registry()
+handler_seconds = bot_metrics.histogram(
+    'cohere_bot_handler_seconds', 'Time spent handling each kind of update', ['handler']
+)
+api_seconds = bot_metrics.histogram(
+    'cohere_bot_api_seconds', 'Latency of calls to the API', ['path', 'status']
+)
+updates_received = bot_metrics.counter(
+    'cohere_bot_updates_total', 'Updates received, by whether they were handled or skipped as redelivered', ['outcome']
+)
+
+async def open_http_client(application: Application) -> None:
+    """Create the pooled HTTP client used for API calls."""
+    global http_client
+    http_client = httpx.AsyncClient(
+        base_url=API_URL,
+        timeout=API_TIMEOUT,
+        limits=httpx.Limits(max_connections=MAX_CONCURRENT_URLS * 2, max_keepalive_connections=MAX_CONCURRENT_URLS),
+    )
+
+async def close_http_client(application: Application) -> None:
+    """Close the pooled HTTP client."""
+    if http_client is not None:
+        await http_client.aclose()
+
+async def api_post(path: str, payload: dict, chat_id: int, idempotency_key: str = None) -> dict:
+    """POST JSON to the API and return the decoded response.
+
+    The current request id goes with it, so the API's logs match the bot's,
+    and the chat id, which the API routes to that chat's calendar.
+    A 503 or 429 is retried after its Retry-After, plus jitter so messages
+    held up by the same outage don't all come back at once. Requests sent
+    with the same `idempotency_key` take effect once.
+    """
+    headers = {'X-Request-ID': metrics.request_id_var.get(), 'X-Chat-ID': str(chat_id)}
+    if API_KEY:
+        headers['X-API-Key'] = API_KEY
+    if idempotency_key:
+        headers['Idempotency-Key'] = idempotency_key
+    for attempt in range(1, API_RETRIES + 2):
+        started = time.perf_counter()
+        status = 'error'
+        try:
+            response = await http_client.post(path, json=payload, headers=headers)
+            status = str(response.status_code)
+        finally:
+            api_seconds.observe(time.perf_counter() - started, path, status)
+        if response.status_code not in (429, 503) or attempt > API_RETRIES:
+            break
+        delay = backoff_delay(attempt, 1.0, API_MAX_RETRY_DELAY, parse_retry_after(response.headers.get('Retry-After')))
+        if delay > API_MAX_RETRY_DELAY:
+            break
+        logger.warning("%s answered %s, retrying in %.1fs", path, response.status_code, delay)
+        await asyncio.sleep(delay)
+    response.raise_for_status()
+    return response.json()
+
+async def skip_redelivered(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Stop an update another delivery (possibly to another replica) already dispatched."""
+    if await asyncio.to_thread(update_log.first_delivery, update.update_id):
+        updates_received.inc('handled')
+        return
+    updates_received.inc('duplicate')
+    logger.info("Skipping update %s, already delivered", update.update_id)
+    raise ApplicationHandlerStop
 
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Send a message when the command /start is issued."""
@@ -41,25 +154,30 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
 
 async def handle_link(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle messages containing URLs."""
+    metrics.request_id_var.set(f"tg-{update.message.chat_id}-{update.message.message_id}")
     logger.info("Handle link called: %s", update.message.text)
     message = update.message.text
     url_pattern = r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
     urls = re.findall(url_pattern, message)
     
     if urls:
-        # Add eyes reaction to acknowledge URL detection
-        await update.message.set_reaction("👀")
-        url = urls[0]
-        try:
+        with metrics.timed(handler_seconds, 'link'):
+            # Add eyes reaction to acknowledge URL detection
+            await update.message.set_reaction("👀")
+            # Parse every distinct link in the message concurrently
+            await asyncio.gather(*(process_url(update, url) for url in dict.fromkeys(urls)))
+
+async def process_url(update: Update, url: str) -> None:
+    """Parse one event link and post the result for approval."""
+    try:
+        async with url_slots:
             # Make request to our parse-event endpoint
-            response = requests.post(f'{API_URL}/parse-event', 
-                                  json={'url': url, 'description_style': 'telegram'})
-            response.raise_for_status()
-            
-            event_details = response.json()
-            
-            # Send formatted message to Telegram
-            message_text = f"""
+            event_details = await api_post(
+                '/parse-event', {'url': url, 'description_style': 'telegram'}, update.message.chat_id
+            )
+        
+        # Send formatted message to Telegram
+        message_text = f"""
 Event Detected! 🎉
 Title: {event_details['title']}
 Time: {event_details['start_time']} - {event_details['end_time']}
@@ -68,14 +186,14 @@ Location: {event_details['location']}
 {event_details['description'][:500] + ('...' if len(event_details['description']) > 500 else '')}
 
 👍 Admins can approve this event to add it to the calendar.
-            """
-            # Store the bot's response message ID instead of the original message ID
-            bot_message = await update.message.reply_text(message_text)
-            pending_events[bot_message.message_id] = event_details
-            logger.info(f"Stored event with message ID {bot_message.message_id}")
-        except Exception as e:
-            logger.error("Error processing link: %s", str(e))
-            # await update.message.reply_text(f"Sorry, I couldn't parse that event link. Error: {str(e)}")
+        """
+        # Store the bot's response message ID instead of the original message ID
+        bot_message = await update.message.reply_text(message_text)
+        await asyncio.to_thread(pending_events.put, bot_message.chat_id, bot_message.message_id, event_details)
+        logger.info(f"Stored event with message ID {bot_message.message_id}")
+    except Exception as e:
+        logger.error("Error processing link %s: %s", url, str(e))
+        # await update.message.reply_text(f"Sorry, I couldn't parse that event link. Error: {str(e)}")
 
 async def handle_reaction(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle reactions to messages."""
@@ -101,45 +219,87 @@ async def handle_reaction(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     logger.info("Has thumbs up: %s", has_thumbs_up)
     
     if has_thumbs_up:
+        chat_id = update.message_reaction.chat.id
         message_id = update.message_reaction.message_id
+        metrics.request_id_var.set(f"tg-{chat_id}-{message_id}-approve")
         logger.info("Message ID: %s", message_id)
-        logger.info("Pending events: %s", pending_events)
         
-        if message_id in pending_events:
-            event_details = pending_events[message_id]
-            try:
-                # Post to calendar
-                logger.info("Posting to calendar: %s", event_details)
-                response = requests.post(f'{API_URL}/create-event', json=event_details)
-                response.raise_for_status()
-                
-                await context.bot.send_message(
-                    chat_id=update.message_reaction.chat.id,
-                    text="✅ Event has been added to the calendar!"
-                )
-                # Remove from pending events
-                del pending_events[message_id]
-                logger.info("Event successfully added to calendar")
-            except Exception as e:
-                logger.error("Error creating calendar event: %s", str(e))
-                await context.bot.send_message(
-                    chat_id=update.message_reaction.chat.id,
-                    text=f"❌ Failed to add event to calendar: {str(e)}"
+        # Claim the event so concurrent approvals can't create it twice
+        event_details = await asyncio.to_thread(pending_events.claim, chat_id, message_id)
+        if event_details is None:
+            logger.info("No unclaimed pending event for message %s", message_id)
+            return
+        
+        try:
+            # Post to calendar
+            logger.info("Posting to calendar: %s", event_details)
+            with metrics.timed(handler_seconds, 'approve'):
+                # The style lets the API re-parse the event the same way if its page changes. A claim
+                # can go stale while retries are still running; the pending event's key makes a second
+                # approval find the event this one created instead of adding it again
+                await api_post(
+                    '/create-event', {**event_details, 'description_style': 'telegram'}, chat_id,
+                    idempotency_key=f"tg-{chat_id}-{message_id}"
                 )
+            
+            # Remove from pending events
+            await asyncio.to_thread(pending_events.delete, chat_id, message_id)
+            await context.bot.send_message(
+                chat_id=chat_id,
+                text="✅ Event has been added to the calendar!"
+            )
+            logger.info("Event successfully added to calendar")
+        except Exception as e:
+            logger.error("Error creating calendar event: %s", str(e))
+            await asyncio.to_thread(pending_events.release, chat_id, message_id)
+            await context.bot.send_message(
+                chat_id=chat_id,
+                text=f"❌ Failed to add event to calendar: {str(e)}"
+            )
 
 def main() -> None:
     """Start the bot."""
     # Create the Application and pass it your bot's token.
-    application = Application.builder().token(TELEGRAM_BOT_TOKEN).build()
+    # Updates from different chats are handled concurrently, at most MAX_CONCURRENT_UPDATES at a time
+    application = (
+        Application.builder()
+        .token(TELEGRAM_BOT_TOKEN)
+        .base_url(TELEGRAM_API_URL)
+        .update_queue(asyncio.Queue(maxsize=UPDATE_QUEUE_SIZE))
+        .concurrent_updates(MAX_CONCURRENT_UPDATES)
+        .post_init(open_http_client)
+        .post_shutdown(close_http_client)
+        .build()
+    )
+
+    # Runs before every other handler
+    application.add_handler(TypeHandler(Update, skip_redelivered), group=-1)
 
     # Add handlers
     application.add_handler(CommandHandler("start", start))
     application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handle_link))
     application.add_handler(MessageReactionHandler(callback=handle_reaction))
 
+    if os.getenv('BOT_METRICS_PORT'):
+        metrics.start_http_server(bot_metrics, int(os.getenv('BOT_METRICS_PORT')))
+
     # Run the bot until the user presses Ctrl-C
-    logger.info("Starting bot with allowed_updates: %s", Update.ALL_TYPES)
-    application.run_polling(allowed_updates=Update.ALL_TYPES)
+    if BOT_MODE == 'webhook':
+        # The webhook answers 200 as soon as an update is queued; handlers run afterwards.
+        # Every replica registers the same URL, so running more of them is safe.
+        logger.info("Starting webhook on port %s with allowed_updates: %s", WEBHOOK_PORT, ALLOWED_UPDATES)
+        application.run_webhook(
+            listen=WEBHOOK_LISTEN,
+            port=WEBHOOK_PORT,
+            url_path='telegram',
+            webhook_url=f"{WEBHOOK_URL.rstrip('/')}/telegram" if WEBHOOK_URL else None,
+            secret_token=WEBHOOK_SECRET,
+            allowed_updates=ALLOWED_UPDATES,
+            max_connections=MAX_CONCURRENT_UPDATES,
+        )
+    else:
+        logger.info("Starting bot with allowed_updates: %s", ALLOWED_UPDATES)
+        application.run_polling(allowed_updates=ALLOWED_UPDATES)
 
 if __name__ == "__main__":
     main()
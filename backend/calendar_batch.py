@@ -0,0 +1,95 @@
+"""Bulk event insertion through Google API batch requests.
+
+Inserts are grouped into batch HTTP requests (one round trip per chunk instead
+of one per event). Items that fail with a rate limit or server error are
+retried on their own with exponential backoff, waiting at least as long as
+any Retry-After the API sent; other failures are reported per item.
+
+Every event gets a client-generated id before the first attempt, so retrying
+a batch whose response was lost can't create it twice: the retry gets a 409
+for each insert that went through.
+"""
+import logging
+import time
+import uuid
+
+from googleapiclient.errors import HttpError
+
+from resilience import is_transient, retry_after
+
+logger = logging.getLogger(__name__)
+
+# Google recommends at most 50 calls per batch request
+BATCH_SIZE = 50
+
+
+def _is_retryable(exception):
+    if not isinstance(exception, HttpError):
+        # Transport errors affect the whole batch and are worth another try
+        return True
+    return is_transient(exception)
+
+
+def _error_message(exception):
+    if isinstance(exception, HttpError):
+        return f"{exception.resp.status}: {exception.reason}"
+    return str(exception)
+
+
+def batch_insert_events(service, calendar_id, bodies, batch_size=BATCH_SIZE, max_attempts=3, backoff=1.0):
+    """Insert event bodies with batch requests.
+
+    `bodies` maps a string key to an event resource. Returns a dict mapping each
+    key to {'eventId': ..., 'event': <created resource>} on success or
+    {'error': ...} on failure. Bodies without an 'id' are given one.
+    """
+    results = {}
+    pending = {key: dict(body, id=body.get('id') or uuid.uuid4().hex) for key, body in bodies.items()}
+    errors = {}
+
+    for attempt in range(1, max_attempts + 1):
+        retry = {}
+        waits = []
+        items = list(pending.items())
+        for offset in range(0, len(items), batch_size):
+            chunk = items[offset:offset + batch_size]
+
+            def callback(request_id, response, exception):
+                if exception is None:
+                    results[request_id] = {'eventId': response.get('id'), 'event': response}
+                elif isinstance(exception, HttpError) and exception.resp.status == 409:
+                    # An earlier attempt went through; the mirror picks up the full resource on its next sync
+                    body = pending[request_id]
+                    logger.info(f"Event {body['id']} was already inserted by an earlier attempt")
+                    results[request_id] = {'eventId': body['id'], 'event': body}
+                elif _is_retryable(exception):
+                    retry[request_id] = pending[request_id]
+                    errors[request_id] = _error_message(exception)
+                    waits.append(retry_after(exception) or 0)
+                else:
+                    results[request_id] = {'error': _error_message(exception)}
+
+            batch = service.new_batch_http_request(callback=callback)
+            for key, body in chunk:
+                batch.add(service.events().insert(calendarId=calendar_id, body=body), request_id=key)
+            try:
+                batch.execute()
+            except Exception as e:
+                logger.warning(f"Calendar batch request failed: {str(e)}")
+                for key, body in chunk:
+                    if key not in results:
+                        retry[key] = body
+                        errors[key] = _error_message(e)
+
+        if not retry:
+            break
+        pending = retry
+        if attempt < max_attempts:
+            delay = max([backoff * 2 ** (attempt - 1)] + waits)
+            logger.info(f"Retrying {len(retry)} failed calendar inserts in {delay}s")
+            time.sleep(delay)
+    else:
+        for key in pending:
+            results[key] = {'error': errors.get(key, 'Insert failed')}
+
+    return results
@@ -0,0 +1,204 @@
+"""Lazily built, thread-safe Google Calendar clients.
+
+Nothing touches the network until a client is first asked for; `available()`
+only reads the saved token. Clients are built from the discovery document bundled with
+google-api-python-client, so building one never fetches it. httplib2 isn't
+thread-safe, so a client is lent to one caller at a time from a bounded pool
+and returned for reuse. Under gevent every request runs in its own greenlet,
+where a per-thread client would be rebuilt on every request; the pool reuses
+them there too, and callers wait for a free client once `pool_size` are in
+use. A background thread refreshes the factory's credentials shortly before
+they expire, so requests don't stall on a token refresh. Each client has its
+own copy, brought up to the refreshed token whenever it's lent, because
+httplib2's AuthorizedHttp refreshes its credentials on a 401 without any lock.
+
+Run `python calendar_client.py` once to authorize in a browser and save the
+token used by the app and event_list.py, or `python calendar_client.py
+<tenant>` for a tenant's own token (see tenants.py).
+"""
+import copy
+import logging
+import os
+import pickle
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+import google_auth_httplib2
+import httplib2
+from google.auth.transport.requests import Request
+from google_auth_oauthlib.flow import InstalledAppFlow
+from googleapiclient.discovery import build
+
+logger = logging.getLogger(__name__)
+
+# If modifying these scopes, delete the file token.pickle.
+SCOPES = ['https://www.googleapis.com/auth/calendar']
+
+
+class CalendarUnavailable(Exception):
+    """Raised when no usable Google credentials are available."""
+
+
+class CalendarClientFactory:
+    """Lends Calendar API clients from a pool of at most `pool_size`, built on first use.
+
+    With `interactive=True` a missing or unrefreshable token starts the
+    browser OAuth flow; otherwise CalendarUnavailable is raised.
+    """
+
+    def __init__(self, token_path='token.pickle', credentials_path='credentials.json',
+                 interactive=False, refresh_margin=300, http_timeout=30, pool_size=10):
+        self.token_path = token_path
+        self.credentials_path = credentials_path
+        self.interactive = interactive
+        self.refresh_margin = refresh_margin
+        self.http_timeout = http_timeout
+        self._creds = None
+        self._lock = threading.Lock()
+        self._idle = []  # (client, its credentials) not lent out, most recently returned last
+        self._slots = threading.BoundedSemaphore(pool_size)
+        self._refresher = None
+        self._closed = threading.Event()
+
+    def available(self):
+        """Whether a client can be built without a browser, or with one when interactive.
+
+        True once credentials are loaded, when the saved token is valid or can
+        be refreshed, or when interactive auth can create one. Doesn't touch
+        the network.
+        """
+        if self._creds is not None:
+            return True
+        if self.interactive and os.path.exists(self.credentials_path):
+            return True
+        creds = self._read_token()
+        return bool(creds and (creds.valid or creds.refresh_token))
+
+    def _read_token(self):
+        if not os.path.exists(self.token_path):
+            return None
+        with open(self.token_path, 'rb') as token:
+            return pickle.load(token)
+
+    def _save(self, creds):
+        with open(self.token_path, 'wb') as token:
+            pickle.dump(creds, token)
+
+    def _load(self):
+        creds = self._read_token()
+        if creds and creds.valid:
+            return creds
+        if creds and creds.expired and creds.refresh_token:
+            creds.refresh(Request())
+        elif self.interactive and os.path.exists(self.credentials_path):
+            flow = InstalledAppFlow.from_client_secrets_file(self.credentials_path, SCOPES)
+            creds = flow.run_local_server(port=0)
+        else:
+            raise CalendarUnavailable(
+                f"No valid Google token in {self.token_path}; run calendar_client.py to authorize"
+            )
+        self._save(creds)
+        return creds
+
+    def credentials(self):
+        """Load (and if needed refresh) the shared credentials once."""
+        if self._creds is not None:
+            return self._creds
+        with self._lock:
+            if self._creds is None:
+                self._creds = self._load()
+                self._start_refresher()
+            return self._creds
+
+    def _start_refresher(self):
+        if self._refresher is None and self._creds.refresh_token:
+            self._refresher = threading.Thread(
+                target=self._refresh_loop, name='calendar-token-refresh', daemon=True
+            )
+            self._refresher.start()
+
+    def _seconds_until_refresh(self):
+        expiry = self._creds.expiry
+        if expiry is None:
+            return None
+        # google-auth keeps expiry as naive UTC
+        remaining = (expiry.replace(tzinfo=timezone.utc) - datetime.now(timezone.utc)).total_seconds()
+        return max(remaining - self.refresh_margin, 0)
+
+    def _refresh_loop(self):
+        while True:
+            with self._lock:
+                delay = self._seconds_until_refresh()
+            if delay is None:
+                return
+            if self._closed.wait(max(delay, 1)):
+                return
+            try:
+                with self._lock:
+                    self._creds.refresh(Request())
+                    self._save(self._creds)
+                logger.info("Refreshed Google Calendar credentials")
+            except Exception as e:
+                logger.warning(f"Google credential refresh failed: {e}")
+                if self._closed.wait(60):
+                    return
+
+    def close(self):
+        """Stop refreshing the token. Clients already handed out work until it expires."""
+        self._closed.set()
+
+    def _build(self):
+        creds = copy.copy(self.credentials())
+        http = google_auth_httplib2.AuthorizedHttp(creds, http=httplib2.Http(timeout=self.http_timeout))
+        return build('calendar', 'v3', http=http, static_discovery=True, cache_discovery=False), creds
+
+    def _update(self, creds):
+        """Give a client's credentials the shared token if it's newer than theirs."""
+        with self._lock:
+            shared = self._creds
+            if shared.expiry and (creds.expiry is None or shared.expiry > creds.expiry):
+                creds.token = shared.token
+                creds.expiry = shared.expiry
+
+    @contextmanager
+    def client(self):
+        """Lend a Calendar client for the duration of the block, building one if none is idle.
+
+        Waits for another caller to return one once `pool_size` are lent out.
+        """
+        with self._slots:
+            try:
+                service, creds = self._idle.pop()
+            except IndexError:
+                service, creds = self._build()
+            self._update(creds)
+            try:
+                yield service
+            finally:
+                self._idle.append((service, creds))
+
+
+def factory_from_env(interactive=False):
+    """Build the client factory from GOOGLE_* environment variables."""
+    return CalendarClientFactory(
+        token_path=os.getenv('GOOGLE_TOKEN_PATH', 'token.pickle'),
+        credentials_path=os.getenv('GOOGLE_CREDENTIALS_PATH', 'credentials.json'),
+        interactive=interactive,
+        pool_size=int(os.getenv('CALENDAR_CLIENT_POOL_SIZE', 10)),
+    )
+
+
+if __name__ == '__main__':
+    import sys
+    from tenants import tenants_from_env
+
+    logging.basicConfig(level=logging.INFO)
+    if len(sys.argv) > 1:
+        tenant = tenants_from_env().get(sys.argv[1])
+        if tenant is None:
+            sys.exit(f"Unknown tenant: {sys.argv[1]}")
+        CalendarClientFactory(tenant.token_path, tenant.credentials_path, interactive=True).credentials()
+    else:
+        factory_from_env(interactive=True).credentials()
+    print("Google Calendar authorized")
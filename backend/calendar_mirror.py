@@ -0,0 +1,328 @@
+"""Local SQLite mirror of a Google Calendar.
+
+The first sync pages through every event that ended in the last
+`history_days`, writing each page as it arrives; later syncs pass the stored
+`syncToken` so the API only returns events changed since the previous run.
+Listing upcoming events and checking for duplicates then become local
+queries instead of API calls.
+
+Duplicate checks use fingerprints: a hash of the normalized title, start time
+and location, so the same event parsed twice (or imported from two sources)
+matches even if its whitespace, capitalization or time zone notation differ.
+"""
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+from googleapiclient.errors import HttpError
+
+from local_db import busy_timeout
+
+logger = logging.getLogger(__name__)
+
+NON_WORD = re.compile(r'[\W_]+', re.UNICODE)
+
+
+def _normalize_text(value):
+    return NON_WORD.sub(' ', (value or '').casefold()).strip()
+
+
+def to_utc(value, default_timezone='UTC'):
+    """Parse an ISO date or datetime into an aware UTC datetime, or None.
+
+    Naive values and all-day dates are read in `default_timezone`.
+    """
+    try:
+        parsed = datetime.fromisoformat((value or '').replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=ZoneInfo(default_timezone))
+    return parsed.astimezone(timezone.utc)
+
+
+def event_fingerprint(title, start_time, location, default_timezone='UTC'):
+    """Fingerprint an event by its title, start time and location.
+
+    Naive start times are read in `default_timezone`, the zone the calendar
+    would give them.
+    """
+    start = to_utc(start_time, default_timezone)
+    parts = (
+        _normalize_text(title),
+        start.strftime('%Y-%m-%dT%H:%M') if start else (start_time or '').strip(),
+        _normalize_text(location),
+    )
+    return hashlib.sha1('\0'.join(parts).encode('utf-8')).hexdigest()
+
+
+def _event_time(event, key):
+    value = event.get(key, {})
+    return value.get('dateTime', value.get('date')), value.get('timeZone')
+
+
+def calendar_event_fingerprint(event, default_timezone='UTC'):
+    """Fingerprint an event resource returned by the Calendar API."""
+    start, start_timezone = _event_time(event, 'start')
+    return event_fingerprint(
+        event.get('summary'), start, event.get('location'), start_timezone or default_timezone
+    )
+
+
+class FullSyncRequired(Exception):
+    """Raised by a sync that may only be incremental when the calendar needs a full one."""
+
+
+class CalendarMirror:
+    """SQLite copy of one or more calendars kept current with sync tokens."""
+
+    def __init__(self, path, default_timezone='UTC', history_days=30):
+        self.default_timezone = default_timezone
+        # A full sync only fetches events that ended at most this many days ago (None for all)
+        self.history_days = history_days
+        # Guards the shared connection, and is only held for local queries and writes
+        self._lock = threading.Lock()
+        # One per calendar, held through a sync's API calls so a calendar isn't synced twice at once
+        self._sync_locks = {}
+        self._db = sqlite3.connect(path, timeout=busy_timeout(10), isolation_level=None, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS mirror_events ('
+            ' calendar_id TEXT NOT NULL,'
+            ' id TEXT NOT NULL,'
+            ' start_utc TEXT,'
+            ' end_utc TEXT,'
+            ' fingerprint TEXT NOT NULL,'
+            ' updated TEXT,'
+            ' resource TEXT NOT NULL,'
+            ' seen_at REAL,'
+            ' PRIMARY KEY (calendar_id, id))'
+        )
+        self._db.execute('CREATE INDEX IF NOT EXISTS mirror_events_end ON mirror_events (calendar_id, end_utc)')
+        self._db.execute('CREATE INDEX IF NOT EXISTS mirror_events_fingerprint ON mirror_events (calendar_id, fingerprint)')
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS mirror_sync_state ('
+            ' calendar_id TEXT PRIMARY KEY,'
+            ' sync_token TEXT,'
+            ' synced_at REAL NOT NULL,'
+            ' changed_at REAL)'
+        )
+
+    def _row(self, calendar_id, event, default_timezone):
+        start, start_timezone = _event_time(event, 'start')
+        end, end_timezone = _event_time(event, 'end')
+        start_utc = to_utc(start, start_timezone or default_timezone)
+        end_utc = to_utc(end, end_timezone or default_timezone)
+        return (
+            calendar_id,
+            event['id'],
+            start_utc.isoformat() if start_utc else None,
+            end_utc.isoformat() if end_utc else None,
+            calendar_event_fingerprint(event, default_timezone),
+            event.get('updated'),
+            json.dumps(event),
+        )
+
+    def _apply(self, calendar_id, events, default_timezone=None, seen_at=None):
+        """Write a page of API results: upsert live events, delete cancelled ones.
+
+        All-day and naive times are read in `default_timezone`, normally the
+        calendar's own zone as reported by the API. Upserted rows are stamped
+        with `seen_at` (default now).
+        """
+        default_timezone = default_timezone or self.default_timezone
+        seen_at = seen_at or time.time()
+        for event in events:
+            if event.get('status') == 'cancelled':
+                self._db.execute(
+                    'DELETE FROM mirror_events WHERE calendar_id = ? AND id = ?', (calendar_id, event['id'])
+                )
+            else:
+                self._db.execute(
+                    'INSERT OR REPLACE INTO mirror_events'
+                    ' (calendar_id, id, start_utc, end_utc, fingerprint, updated, resource, seen_at)'
+                    ' VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                    (*self._row(calendar_id, event, default_timezone), seen_at)
+                )
+
+    def _write(self, statements):
+        """Run `statements()` in one write transaction on the shared connection."""
+        with self._lock:
+            self._db.execute('BEGIN IMMEDIATE')
+            try:
+                result = statements()
+                self._db.execute('COMMIT')
+            except Exception:
+                self._db.execute('ROLLBACK')
+                raise
+        return result
+
+    def sync_token(self, calendar_id):
+        row = self._db.execute(
+            'SELECT sync_token, synced_at FROM mirror_sync_state WHERE calendar_id = ?', (calendar_id,)
+        ).fetchone()
+        return (row['sync_token'], row['synced_at']) if row else (None, 0.0)
+
+    def synced_at(self, calendar_id):
+        """Time of the last completed sync of the calendar, or 0.0 if it was never synced."""
+        with self._lock:
+            return self.sync_token(calendar_id)[1]
+
+    def sync(self, service, calendar_id, full=True):
+        """Bring the mirror up to date and return the number of events changed.
+
+        Uses the stored sync token when there is one, falling back to a full
+        resync if Google reports it expired (HTTP 410). With `full` false, a
+        sync that would have to be full raises FullSyncRequired instead. Each
+        page is written as it arrives, in its own short transaction, so a
+        full sync never holds the whole calendar in memory and other
+        calendars' queries only wait for one page's writes.
+        """
+        with self._lock:
+            sync_lock = self._sync_locks.setdefault(calendar_id, threading.Lock())
+        with sync_lock:
+            with self._lock:
+                token, _ = self.sync_token(calendar_id)
+            if token is None and not full:
+                raise FullSyncRequired(calendar_id)
+            try:
+                changed = self._sync_pages(service, calendar_id, token)
+            except HttpError as e:
+                if token is None or e.resp.status != 410:
+                    raise
+                if not full:
+                    raise FullSyncRequired(calendar_id) from e
+                logger.info(f"Sync token for {calendar_id} expired, running a full sync")
+                token = None
+                changed = self._sync_pages(service, calendar_id, None)
+        logger.info(f"{'Incremental' if token else 'Full'} sync of {calendar_id}: {changed} events changed")
+        return changed
+
+    def _sync_pages(self, service, calendar_id, token):
+        """Apply the changes since `token`, or every event in the window if None, page by page.
+
+        A full sync then drops the events it didn't see. The new sync token is
+        only stored once every page is written, so a sync that fails part way
+        is simply run again.
+        """
+        started = time.time()
+        params = {'calendarId': calendar_id, 'singleEvents': True, 'maxResults': 2500}
+        if token:
+            params['syncToken'] = token
+        elif self.history_days is not None:
+            # Google filters on the end time, so events still running are included
+            params['timeMin'] = (datetime.now(timezone.utc) - timedelta(days=self.history_days)).isoformat()
+        changed = 0
+        while True:
+            result = service.events().list(**params).execute()
+            items = result.get('items', [])
+            self._write(lambda: self._apply(calendar_id, items, result.get('timeZone'), started))
+            changed += len(items)
+            if not result.get('nextPageToken'):
+                break
+            params['pageToken'] = result['nextPageToken']
+
+        def finish():
+            nonlocal changed
+            if token is None:
+                # Rows that add() or another process's sync wrote meanwhile are newer and stay
+                changed += self._db.execute(
+                    'DELETE FROM mirror_events WHERE calendar_id = ? AND (seen_at IS NULL OR seen_at < ?)',
+                    (calendar_id, started)
+                ).rowcount
+            # changed_at only moves when the sync brought changes, deletions included
+            now = time.time()
+            self._db.execute(
+                'INSERT INTO mirror_sync_state (calendar_id, sync_token, synced_at, changed_at) VALUES (?, ?, ?, ?)'
+                ' ON CONFLICT (calendar_id) DO UPDATE SET sync_token = excluded.sync_token,'
+                ' synced_at = excluded.synced_at, changed_at = COALESCE(excluded.changed_at, changed_at)',
+                (calendar_id, result.get('nextSyncToken'), now, now if changed else None)
+            )
+
+        self._write(finish)
+        return changed
+
+    def sync_if_stale(self, service, calendar_id, max_age=300, full=True):
+        """Sync unless the last sync was less than `max_age` seconds ago."""
+        if time.time() - self.synced_at(calendar_id) >= max_age:
+            return self.sync(service, calendar_id, full)
+        return 0
+
+    def add(self, calendar_id, event, default_timezone=None):
+        """Record an event we just created so it's visible before the next sync."""
+        with self._lock:
+            self._apply(calendar_id, [event], default_timezone)
+
+    def get(self, calendar_id, event_id):
+        """Return the mirrored event resource, or None."""
+        with self._lock:
+            row = self._db.execute(
+                'SELECT resource FROM mirror_events WHERE calendar_id = ? AND id = ?', (calendar_id, event_id)
+            ).fetchone()
+        return json.loads(row['resource']) if row else None
+
+    def find_by_fingerprint(self, calendar_id, fingerprint):
+        """Return the id of a mirrored event with this fingerprint, or None."""
+        with self._lock:
+            row = self._db.execute(
+                'SELECT id FROM mirror_events WHERE calendar_id = ? AND fingerprint = ? LIMIT 1',
+                (calendar_id, fingerprint)
+            ).fetchone()
+        return row['id'] if row else None
+
+    def upcoming(self, calendar_id, after=None, limit=None):
+        """Yield event resources that end after `after` (default now), by start time."""
+        after = after or datetime.now(timezone.utc)
+        query = (
+            'SELECT resource FROM mirror_events WHERE calendar_id = ? AND end_utc > ?'
+            ' ORDER BY start_utc'
+        )
+        params = [calendar_id, after.astimezone(timezone.utc).isoformat()]
+        if limit:
+            query += ' LIMIT ?'
+            params.append(limit)
+        with self._lock:
+            rows = self._db.execute(query, params).fetchall()
+        for row in rows:
+            yield json.loads(row['resource'])
+
+    def upcoming_version(self, calendar_id, after=None):
+        """Return (version, last_modified) for the events `upcoming` would yield.
+
+        The version is a hash of their ids and update times, so it changes
+        whenever an upcoming event is added, edited, deleted or ends, without
+        loading any event resources. `last_modified` is the latest time the
+        list changed, as a UTC datetime, or None: the newest `updated` among
+        the events, the end of the last event to drop out, or the last sync
+        that changed the copy. Deleted events leave no `updated` time behind,
+        so only the sync time shows them.
+        """
+        after = (after or datetime.now(timezone.utc)).astimezone(timezone.utc).isoformat()
+        with self._lock:
+            rows = self._db.execute(
+                'SELECT id, updated FROM mirror_events WHERE calendar_id = ? AND end_utc > ?'
+                ' ORDER BY start_utc',
+                (calendar_id, after)
+            ).fetchall()
+            last_ended = self._db.execute(
+                'SELECT MAX(end_utc) FROM mirror_events WHERE calendar_id = ? AND end_utc <= ?', (calendar_id, after)
+            ).fetchone()[0]
+            state = self._db.execute(
+                'SELECT changed_at FROM mirror_sync_state WHERE calendar_id = ?', (calendar_id,)
+            ).fetchone()
+        digest = hashlib.sha1(calendar_id.encode('utf-8'))
+        for row in rows:
+            digest.update(f"\0{row['id']}\0{row['updated'] or ''}".encode('utf-8'))
+        times = [to_utc(row['updated']) for row in rows if row['updated']]
+        if last_ended:
+            times.append(to_utc(last_ended))
+        if state and state['changed_at']:
+            times.append(datetime.fromtimestamp(state['changed_at'], timezone.utc))
+        return digest.hexdigest(), max((moment for moment in times if moment), default=None)
@@ -1,86 +1,40 @@
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
-import pickle
+import argparse
 import os
-from datetime import datetime, timezone
-import pytz
-
-SCOPES = ['https://www.googleapis.com/auth/calendar']
-CALENDAR_ID = 'cohere@unforced.org'
-
-def get_calendar_service():
-    creds = None
-    if os.path.exists('token.pickle'):
-        with open('token.pickle', 'rb') as token:
-            creds = pickle.load(token)
-    
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-        else:
-            flow = InstalledAppFlow.from_client_secrets_file(
-                'credentials.json', SCOPES)
-            creds = flow.run_local_server(port=0)
-        with open('token.pickle', 'wb') as token:
-            pickle.dump(creds, token)
-    
-    return build('calendar', 'v3', credentials=creds)
-
-def format_time(dt_str):
-    dt = datetime.fromisoformat(dt_str.replace('Z', '+00:00'))
-    mountain = pytz.timezone('America/Denver')
-    dt_mountain = dt.astimezone(mountain)
-    return dt_mountain.strftime("%-I:%M%p").lower()
-
-def format_date(dt_str):
-    dt = datetime.fromisoformat(dt_str.replace('Z', '+00:00'))
-    mountain = pytz.timezone('America/Denver')
-    dt_mountain = dt.astimezone(mountain)
-    return dt_mountain.strftime("%-m/%-d")
+from calendar_client import CalendarClientFactory
+from calendar_mirror import CalendarMirror
+from exporters import WRITERS, get_writer, write_events
+from tenants import tenants_from_env
 
 def main():
-    service = get_calendar_service()
-    
-    # Get current time in UTC ISO format
-    now = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
-    
-    # Get events from the calendar
-    events_result = service.events().list(
-        calendarId=CALENDAR_ID,
-        timeMin=now,
-        maxResults=100,
-        singleEvents=True,
-        orderBy='startTime'
-    ).execute()
-    
-    events = events_result.get('items', [])
-    
-    if not events:
+    parser = argparse.ArgumentParser(description='Export upcoming calendar events')
+    parser.add_argument('--format', dest='formats', action='append', choices=sorted(WRITERS),
+                        help='output format, may be repeated (default: markdown)')
+    parser.add_argument('--tenant', help='tenant whose calendar to export (default: the default tenant)')
+    parser.add_argument('--timezone', help="zone event times are shown in (default: the tenant's feed zone)")
+    args = parser.parse_args()
+    
+    tenants = tenants_from_env()
+    tenant = tenants.get(args.tenant) if args.tenant else tenants.default
+    if tenant is None:
+        parser.error(f"Unknown tenant: {args.tenant}")
+    clients = CalendarClientFactory(tenant.token_path, tenant.credentials_path, interactive=True)
+    
+    # Bring the local mirror up to date; after the first run only changed events are fetched
+    mirror = CalendarMirror(os.getenv('CALENDAR_MIRROR_PATH', 'calendar_mirror.sqlite3'), tenant.timezone)
+    with clients.client() as service:
+        mirror.sync(service, tenant.calendar_id)
+    
+    if next(mirror.upcoming(tenant.calendar_id, limit=1), None) is None:
         print('No upcoming events found.')
         return
     
-    # Create markdown content
-    markdown_content = "# Upcoming Events\n\n"
-    
-    for event in events:
-        start = event['start'].get('dateTime', event['start'].get('date'))
-        end = event['end'].get('dateTime', event['end'].get('date'))
-        location = event.get('location', 'No location specified')
-        title = event['summary']
-        description = event.get('description', '')
-        html_link = event.get('htmlLink', '')
-        
-        # Format the event line
-        event_line = f"* {format_date(start)} {format_time(start)}-{format_time(end)} at {location} - [{title}]({html_link})\n"
-        markdown_content += event_line
-    
-    # Write to file
-    with open('events.md', 'w') as f:
-        f.write(markdown_content)
-    
-    print("Events have been written to events.md")
+    # Events stream from the mirror straight into each file
+    for format_name in args.formats or ['markdown']:
+        writer = get_writer(format_name)
+        filename = f"events.{writer.extension}"
+        with open(filename, 'w', newline='') as f:
+            write_events(mirror.upcoming(tenant.calendar_id), writer, f, args.timezone or tenant.feed_timezone)
+        print(f"Events have been written to {filename}")
 
 if __name__ == '__main__':
     main()
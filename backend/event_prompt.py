@@ -0,0 +1,55 @@
+"""Prompt for parsing an event from page text with the LLM.
+
+The instructions are the same for every parse: the system prompt holds them,
+with both description styles, and the tool schema always lists every field.
+Only the user message changes between requests. It names the fields wanted,
+the description style, the link and any fields already known, followed by
+the page text. Providers that cache prompt prefixes can then reuse the
+instructions whatever is being asked for.
+"""
+import json
+
+DESCRIPTION_STYLES = {
+    'default': "A comprehensive description that includes all relevant details about the event. Include any important information like agenda, speakers, requirements, or special notes.",
+    'telegram': "A brief, concise summary of the event (2-3 sentences max) highlighting only the most important details. Focus on what, when, and why someone might want to attend.",
+}
+
+EVENT_SYSTEM_PROMPT = (
+    "You are an AI assistant that helps users parse events from webpages. Return ONLY valid JSON with the "
+    "specified fields, with no additional text. Use ISO format for dates (YYYY-MM-DDTHH:MM:SS+HH:MM). For "
+    "descriptions, be comprehensive and include all relevant details from the source, properly formatted "
+    "for readability.\n\n"
+    "Each request names the fields to return; return only those. The description is written in the "
+    "description style the request names:\n"
+    + "".join(f"- {style}: {prompt}\n" for style, prompt in DESCRIPTION_STYLES.items())
+    + "Start the description with 'Source: ' followed by the request's source URL and a blank line, "
+    "followed by the description."
+)
+
+# The same on every request, so the tool definition is part of the static prefix
+FIELD_DESCRIPTIONS = {
+    'title': 'event title',
+    'description': "description in the requested style, starting with 'Source: <source URL>' and a blank line",
+    'start_time': 'start time in ISO format',
+    'end_time': 'end time in ISO format',
+    'location': 'event location',
+}
+
+
+def event_prompt(page_content, source_url, description_style='default', fields=None, known_details=None):
+    """The user message for one parse: everything that changes between requests."""
+    style = description_style if description_style in DESCRIPTION_STYLES else 'default'
+    known = ''
+    if known_details:
+        known = (
+            "Already known from the page's structured data (for context, do not return these):\n"
+            f"{json.dumps(known_details)}\n\n"
+        )
+    return (
+        "Extract event details from the following webpage content and return ONLY a JSON object with these "
+        f"fields: {', '.join(fields or FIELD_DESCRIPTIONS)}\n"
+        f"Description style: {style}\n"
+        f"Source URL: {source_url}\n\n"
+        f"{known}"
+        f"Webpage content:\n{page_content}\n"
+    )
@@ -0,0 +1,200 @@
+"""Export calendar events as Markdown, iCalendar, JSON or RSS.
+
+Events are streamed from a generator into a writer that yields the output in
+chunks, so a feed is never assembled by repeated string concatenation. Time
+zone objects and parsed datetimes are cached, so each event's times are
+parsed once no matter how many fields or formats use them.
+"""
+import json
+from collections import namedtuple
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from functools import lru_cache
+from xml.sax.saxutils import escape as xml_escape
+from zoneinfo import ZoneInfo
+
+ExportEvent = namedtuple(
+    'ExportEvent',
+    ['id', 'title', 'description', 'location', 'link', 'start', 'end', 'all_day', 'updated']
+)
+
+
+@lru_cache(maxsize=None)
+def get_timezone(name):
+    return ZoneInfo(name)
+
+
+@lru_cache(maxsize=4096)
+def parse_datetime(value, tz_name):
+    """Parse an ISO date or datetime in the zone `tz_name`.
+
+    Naive values and all-day dates are taken to be in that zone.
+    """
+    tz = get_timezone(tz_name)
+    parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=tz)
+    return parsed.astimezone(tz)
+
+
+def iter_export_events(resources, tz_name):
+    """Turn Calendar API event resources into ExportEvents in zone `tz_name`."""
+    for event in resources:
+        start = event['start'].get('dateTime', event['start'].get('date'))
+        end = event['end'].get('dateTime', event['end'].get('date'))
+        updated = event.get('updated')
+        yield ExportEvent(
+            id=event.get('iCalUID') or event['id'],
+            title=event.get('summary', ''),
+            description=event.get('description', ''),
+            location=event.get('location', 'No location specified'),
+            link=event.get('htmlLink', ''),
+            start=parse_datetime(start, tz_name),
+            end=parse_datetime(end, tz_name),
+            all_day='dateTime' not in event['start'],
+            updated=parse_datetime(updated, 'UTC') if updated else None,
+        )
+
+
+class MarkdownWriter:
+    content_type = 'text/markdown; charset=utf-8'
+    extension = 'md'
+
+    def render(self, events):
+        yield "# Upcoming Events\n\n"
+        for event in events:
+            start_time = event.start.strftime("%-I:%M%p").lower()
+            end_time = event.end.strftime("%-I:%M%p").lower()
+            yield (
+                f"* {event.start.strftime('%-m/%-d')} {start_time}-{end_time} "
+                f"at {event.location} - [{event.title}]({event.link})\n"
+            )
+
+
+def _ics_text(value):
+    return (value or '').replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,').replace('\n', '\\n')
+
+
+def _ics_line(line):
+    """Fold a content line to 75 octets as RFC 5545 requires."""
+    encoded = line.encode('utf-8')
+    if len(encoded) <= 75:
+        return line + '\r\n'
+    parts = []
+    while encoded:
+        limit = 75 if not parts else 74
+        cut = min(limit, len(encoded))
+        # Don't split a multi-byte character
+        while cut < len(encoded) and (encoded[cut] & 0xC0) == 0x80:
+            cut -= 1
+        parts.append(encoded[:cut].decode('utf-8'))
+        encoded = encoded[cut:]
+    return '\r\n '.join(parts) + '\r\n'
+
+
+def _ics_time(value, all_day):
+    if all_day:
+        return f";VALUE=DATE:{value.strftime('%Y%m%d')}"
+    return f":{value.astimezone(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}"
+
+
+class ICalendarWriter:
+    content_type = 'text/calendar; charset=utf-8'
+    extension = 'ics'
+
+    def __init__(self, name='Upcoming Events'):
+        self.name = name
+
+    def render(self, events):
+        stamp = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+        yield 'BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//Cohere Events//EN\r\nCALSCALE:GREGORIAN\r\n'
+        yield _ics_line(f'X-WR-CALNAME:{_ics_text(self.name)}')
+        for event in events:
+            lines = [
+                'BEGIN:VEVENT',
+                f'UID:{event.id}',
+                f"DTSTAMP:{event.updated.strftime('%Y%m%dT%H%M%SZ') if event.updated else stamp}",
+                f'DTSTART{_ics_time(event.start, event.all_day)}',
+                f'DTEND{_ics_time(event.end, event.all_day)}',
+                f'SUMMARY:{_ics_text(event.title)}',
+                f'LOCATION:{_ics_text(event.location)}',
+            ]
+            if event.description:
+                lines.append(f'DESCRIPTION:{_ics_text(event.description)}')
+            if event.link:
+                lines.append(f'URL:{event.link}')
+            lines.append('END:VEVENT')
+            yield ''.join(_ics_line(line) for line in lines)
+        yield 'END:VCALENDAR\r\n'
+
+
+class JSONWriter:
+    content_type = 'application/json'
+    extension = 'json'
+
+    def render(self, events):
+        yield '{"events": ['
+        separator = ''
+        for event in events:
+            yield separator + json.dumps({
+                'id': event.id,
+                'title': event.title,
+                'description': event.description,
+                'start_time': event.start.isoformat(),
+                'end_time': event.end.isoformat(),
+                'all_day': event.all_day,
+                'location': event.location,
+                'htmlLink': event.link,
+            })
+            separator = ', '
+        yield ']}\n'
+
+
+class RSSWriter:
+    content_type = 'application/rss+xml; charset=utf-8'
+    extension = 'rss'
+
+    def __init__(self, title='Upcoming Events', link='', description='Upcoming community events'):
+        self.title = title
+        self.link = link
+        self.description = description
+
+    def render(self, events):
+        yield (
+            '<?xml version="1.0" encoding="UTF-8"?>\n<rss version="2.0"><channel>'
+            f'<title>{xml_escape(self.title)}</title><link>{xml_escape(self.link)}</link>'
+            f'<description>{xml_escape(self.description)}</description>'
+        )
+        for event in events:
+            when = event.start.strftime('%a %-m/%-d %-I:%M%p')
+            summary = f"{when} at {event.location}\n\n{event.description}"
+            yield (
+                f'<item><title>{xml_escape(event.title)}</title>'
+                f'<link>{xml_escape(event.link)}</link>'
+                f'<guid isPermaLink="false">{xml_escape(event.id)}</guid>'
+                f'<description>{xml_escape(summary)}</description>'
+                f'<pubDate>{format_datetime(event.updated or event.start)}</pubDate></item>'
+            )
+        yield '</channel></rss>\n'
+
+
+WRITERS = {
+    'markdown': MarkdownWriter,
+    'ics': ICalendarWriter,
+    'json': JSONWriter,
+    'rss': RSSWriter,
+}
+
+
+def get_writer(format_name, **options):
+    """Return a writer instance for 'markdown', 'ics', 'json' or 'rss'."""
+    writer_class = WRITERS[format_name]
+    if writer_class in (ICalendarWriter, RSSWriter):
+        return writer_class(**options)
+    return writer_class()
+
+
+def write_events(resources, writer, out, tz_name):
+    """Stream event resources through `writer` into the text stream `out`."""
+    for chunk in writer.render(iter_export_events(resources, tz_name)):
+        out.write(chunk)
@@ -0,0 +1,231 @@
+"""Shared HTTP fetcher for event pages.
+
+One pooled `requests.Session` is reused for every fetch so TCP/TLS connections
+to a host are kept alive between requests. Bodies are streamed and reading
+stops at a size cap, and pages are kept in a SQLite HTTP cache so a page that
+was fetched before is revalidated with a conditional GET (ETag/Last-Modified)
+instead of being downloaded again.
+"""
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import namedtuple
+from urllib.parse import urlsplit
+
+import charset_normalizer
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+
+from local_db import busy_timeout
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    # Only advertise encodings urllib3 can decode here (br needs the brotli package)
+    'Accept-Encoding': ACCEPT_ENCODING,
+    'Cache-Control': 'no-cache',
+    'Pragma': 'no-cache',
+    'sec-ch-ua': '"Not_A Brand";v="8", "Chromium";v="120", "Google Chrome";v="120"',
+    'sec-ch-ua-mobile': '?0',
+    'sec-ch-ua-platform': '"macOS"',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Sec-Fetch-User': '?1',
+    'Upgrade-Insecure-Requests': '1',
+    'Connection': 'keep-alive'
+}
+
+# Extra headers sent to specific hosts
+HOST_PROFILES = {
+    'app.actualize.earth': {
+        'Referer': 'https://app.actualize.earth/',
+        'Origin': 'https://app.actualize.earth',
+        'Host': 'app.actualize.earth',
+    },
+}
+
+# Hosts fetched without TLS certificate verification. Empty by default; a
+# failed verification fails the fetch everywhere else.
+INSECURE_HOSTS = frozenset()
+
+FetchResult = namedtuple('FetchResult', ['url', 'text', 'status_code', 'not_modified', 'truncated'])
+
+
+class PageCache:
+    """SQLite store of fetched pages and their validators. Failures are logged and treated as misses."""
+
+    def __init__(self, path, max_entries=2000):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._db = sqlite3.connect(path, timeout=busy_timeout(5), check_same_thread=False)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS http_cache ('
+            ' url TEXT PRIMARY KEY,'
+            ' etag TEXT,'
+            ' last_modified TEXT,'
+            ' body TEXT NOT NULL,'
+            ' truncated INTEGER NOT NULL DEFAULT 0,'
+            ' fetched_at REAL NOT NULL)'
+        )
+        self._db.commit()
+
+    def get(self, url):
+        try:
+            with self._lock:
+                row = self._db.execute(
+                    'SELECT etag, last_modified, body, truncated FROM http_cache WHERE url = ?', (url,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"HTTP cache read failed: {e}")
+            return None
+        if row is None:
+            return None
+        return {'etag': row[0], 'last_modified': row[1], 'body': row[2], 'truncated': bool(row[3])}
+
+    def put(self, url, etag, last_modified, body, truncated):
+        try:
+            with self._lock:
+                self._db.execute(
+                    'INSERT OR REPLACE INTO http_cache (url, etag, last_modified, body, truncated, fetched_at)'
+                    ' VALUES (?, ?, ?, ?, ?, ?)',
+                    (url, etag, last_modified, body, int(truncated), time.time())
+                )
+                self._writes += 1
+                if self._writes % 100 == 0:
+                    self._db.execute(
+                        'DELETE FROM http_cache WHERE url IN ('
+                        ' SELECT url FROM http_cache ORDER BY fetched_at DESC LIMIT -1 OFFSET ?)',
+                        (self.max_entries,)
+                    )
+                self._db.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"HTTP cache write failed: {e}")
+
+    def touch(self, url):
+        try:
+            with self._lock:
+                self._db.execute('UPDATE http_cache SET fetched_at = ? WHERE url = ?', (time.time(), url))
+                self._db.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"HTTP cache write failed: {e}")
+
+
+class PageFetcher:
+    """Fetch pages over a shared connection pool with timeouts and a size cap."""
+
+    def __init__(self, connect_timeout=5, read_timeout=20, max_bytes=5 * 1024 * 1024,
+                 pool_size=10, cache_path=None, host_profiles=None, insecure_hosts=None):
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_bytes = max_bytes
+        self.host_profiles = HOST_PROFILES if host_profiles is None else host_profiles
+        self.insecure_hosts = INSECURE_HOSTS if insecure_hosts is None else frozenset(insecure_hosts)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.cache = None
+        if cache_path:
+            try:
+                self.cache = PageCache(cache_path)
+            except sqlite3.Error as e:
+                logger.warning(f"HTTP cache disabled: {e}")
+
+    def headers_for(self, url):
+        """Return the request headers for `url`, including its host profile."""
+        headers = dict(DEFAULT_HEADERS)
+        host = (urlsplit(url).hostname or '').lower()
+        headers.update(self.host_profiles.get(host, {}))
+        return headers
+
+    def _read_body(self, response):
+        """Read the response body, stopping once it exceeds max_bytes."""
+        chunks = []
+        size = 0
+        # Read one byte past the cap: a body of exactly max_bytes isn't truncated, a longer one is
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > self.max_bytes:
+                break
+        truncated = size > self.max_bytes
+        body = b''.join(chunks)[:self.max_bytes]
+        if truncated:
+            logger.warning(f"Response from {response.url} exceeded {self.max_bytes} bytes, truncated")
+
+        encoding = response.encoding
+        if encoding is None:
+            best = charset_normalizer.from_bytes(body[:64 * 1024]).best()
+            encoding = best.encoding if best else 'utf-8'
+        return body.decode(encoding, errors='replace'), truncated
+
+    def _get(self, url, headers):
+        host = (urlsplit(url).hostname or '').lower()
+        return self.session.get(
+            url, headers=headers, allow_redirects=True, timeout=self.timeout,
+            stream=True, verify=host not in self.insecure_hosts
+        )
+
+    def open(self, url):
+        """Start a GET of `url` for a body too large to hold, like a calendar feed.
+
+        Returns the streamed response, which the caller reads and closes. Not
+        cached and not capped at max_bytes.
+        """
+        headers = self.headers_for(url)
+        headers['Accept'] = 'text/calendar,*/*;q=0.8'
+        response = self._get(url, headers)
+        try:
+            response.raise_for_status()
+        except requests.HTTPError:
+            response.close()
+            raise
+        return response
+
+    def fetch(self, url, conditional=True):
+        """Fetch `url` and return a FetchResult.
+
+        When the page is cached and `conditional` is true, validators are sent and
+        a 304 answer is served from the cache with `not_modified` set.
+        """
+        headers = self.headers_for(url)
+        cached = self.cache.get(url) if self.cache and conditional else None
+        if cached:
+            if cached['etag']:
+                headers['If-None-Match'] = cached['etag']
+            if cached['last_modified']:
+                headers['If-Modified-Since'] = cached['last_modified']
+
+        response = self._get(url, headers)
+        with response:
+            if response.status_code == 304 and cached:
+                self.cache.touch(url)
+                return FetchResult(response.url, cached['body'], 304, True, cached['truncated'])
+            response.raise_for_status()
+            text, truncated = self._read_body(response)
+
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if self.cache and (etag or last_modified):
+            self.cache.put(url, etag, last_modified, text, truncated)
+        return FetchResult(response.url, text, response.status_code, False, truncated)
+
+
+def fetcher_from_env():
+    """Build the page fetcher from FETCH_* environment variables."""
+    return PageFetcher(
+        connect_timeout=float(os.getenv('FETCH_CONNECT_TIMEOUT', 5)),
+        read_timeout=float(os.getenv('FETCH_READ_TIMEOUT', 20)),
+        max_bytes=int(os.getenv('FETCH_MAX_BYTES', 5 * 1024 * 1024)),
+        pool_size=int(os.getenv('FETCH_POOL_SIZE', 10)),
+        cache_path=os.getenv('FETCH_CACHE_PATH', 'http_cache.sqlite3') or None,
+        insecure_hosts=[host.strip().lower() for host in os.getenv('FETCH_INSECURE_HOSTS', '').split(',') if host.strip()],
+    )
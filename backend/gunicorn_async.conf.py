@@ -0,0 +1,32 @@
+"""Gunicorn settings for the async serving mode.
+
+    gunicorn -c gunicorn_async.conf.py wsgi:app --bind 0.0.0.0:8080
+
+Workers use gevent, which patches sockets, sleeps, locks and threads before
+the app is imported. The page fetch, LLM and Calendar calls then yield
+instead of blocking, so one process holds hundreds of requests in flight
+while the routes and their JSON contracts stay exactly as they are.
+
+SQLite is the exception: its calls don't yield, so a query on the caches,
+calendar copy, job queue or watches holds up the whole worker until it
+returns (see local_db.py). Those queries are quick, but a write waiting on
+another process's lock waits out the busy timeout, so it is cut to a second
+here. Run more workers rather than more connections per worker if that shows
+up in request latency.
+"""
+import os
+
+worker_class = 'gevent'
+workers = int(os.getenv('WEB_WORKERS', 1))
+# Requests in flight per worker
+worker_connections = int(os.getenv('WEB_WORKER_CONNECTIONS', 1000))
+# A parse can wait on a slow page and two model tiers
+timeout = int(os.getenv('WEB_TIMEOUT', 180))
+# The app must be imported after gevent has patched the worker
+preload_app = False
+
+# One process now runs many parses at once, so allow more concurrent LLM calls
+os.environ.setdefault('LLM_CONCURRENCY', '64')
+os.environ.setdefault('FETCH_POOL_SIZE', '50')
+# A SQLite write waiting on a lock blocks every request on the worker, so give up sooner
+os.environ.setdefault('SQLITE_BUSY_TIMEOUT', '1')
@@ -0,0 +1,381 @@
+"""Import events from iCalendar (ICS) feeds without the AI.
+
+A feed is read as a stream of chunks and unfolded into content lines, and
+each VEVENT becomes a dict in the `/create-event` shape as soon as its END
+line is read, so a multi-megabyte feed is never held in memory. Recurring
+events (RRULE and RDATE, less EXDATE) are expanded lazily with dateutil
+within a date window. They and their RECURRENCE-ID overrides are kept until
+the feed ends, so an override replaces the occurrence it moves wherever it
+appears in the feed; that is one entry per series, not per occurrence.
+
+    python ics_import.py feed.ics
+    python ics_import.py https://example.org/events.ics --days 90 --dry-run
+    python ics_import.py feed.ics --parse-only
+"""
+import argparse
+import codecs
+import json
+import logging
+import os
+import re
+import sys
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+try:
+    from dateutil.rrule import rruleset, rrulestr
+except ImportError:
+    rruleset = rrulestr = None
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+MAX_LINE_LENGTH = 1024 * 1024
+
+TEXT_ESCAPE = re.compile(r'\\([\\;,nN])')
+DURATION = re.compile(
+    r'^([-+])?P(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$'
+)
+UNTIL_DATE = re.compile(r'(UNTIL=\d{8})(?=;|$)')
+UNTIL_LOCAL = re.compile(r'(UNTIL=\d{8}T\d{6})(?=;|$)')
+
+# Event properties the import reads; others (attendees, alarms, attachments) are dropped as they stream by
+PROPERTIES = {
+    'UID', 'SUMMARY', 'DESCRIPTION', 'LOCATION', 'URL', 'STATUS', 'DTSTART', 'DTEND', 'DURATION',
+    'RRULE', 'RDATE', 'EXDATE', 'RECURRENCE-ID',
+}
+
+
+class ICSError(ValueError):
+    """The feed is not valid iCalendar."""
+
+
+def iter_lines(chunks, max_line_length=MAX_LINE_LENGTH):
+    """Yield unfolded content lines from an iterable of bytes or str chunks."""
+    decoder = codecs.getincrementaldecoder('utf-8-sig')(errors='replace')
+    buffer = ''
+    line = None
+    for chunk in chunks:
+        buffer += decoder.decode(chunk) if isinstance(chunk, bytes) else chunk
+        *complete, buffer = buffer.split('\n')
+        for raw in complete:
+            raw = raw.rstrip('\r')
+            if raw[:1] in (' ', '\t') and line is not None:
+                # A folded line continues the previous one
+                line += raw[1:]
+                if len(line) > max_line_length:
+                    raise ICSError(f'Content line longer than {max_line_length} characters')
+                continue
+            if line:
+                yield line
+            line = raw
+        if len(buffer) > max_line_length:
+            raise ICSError(f'Content line longer than {max_line_length} characters')
+    buffer += decoder.decode(b'', final=True)
+    buffer = buffer.rstrip('\r')
+    if buffer[:1] in (' ', '\t') and line is not None:
+        line += buffer[1:]
+    else:
+        if line:
+            yield line
+        line = buffer
+    if line:
+        yield line
+
+
+def parse_line(line):
+    """Split a content line into (NAME, {PARAM: value}, value)."""
+    colon = line.find(':')
+    if colon < 0:
+        raise ICSError(f'Content line without a value: {line[:80]!r}')
+    head = line[:colon]
+    if '"' in head:
+        # A quoted parameter value may itself contain ':' or ';'
+        return _parse_quoted_line(line)
+    name, *params = head.split(';')
+    return name.upper(), _params(params), line[colon + 1:]
+
+
+def _parse_quoted_line(line):
+    quoted = False
+    parts = []
+    start = 0
+    for index, char in enumerate(line):
+        if char == '"':
+            quoted = not quoted
+        elif not quoted and char in ';:':
+            parts.append(line[start:index])
+            start = index + 1
+            if char == ':':
+                break
+    else:
+        raise ICSError(f'Content line without a value: {line[:80]!r}')
+    return parts[0].upper(), _params(parts[1:]), line[start:]
+
+
+def _params(params):
+    parsed = {}
+    for param in params:
+        key, _, value = param.partition('=')
+        parsed[key.upper()] = value.strip('"')
+    return parsed
+
+
+def unescape(value):
+    return TEXT_ESCAPE.sub(lambda match: '\n' if match.group(1) in 'nN' else match.group(1), value)
+
+
+@lru_cache(maxsize=256)
+def get_timezone(name):
+    """ZoneInfo for an IANA name, or None for names like 'Eastern Standard Time'."""
+    try:
+        return ZoneInfo(name.strip().lstrip('/'))
+    except (ZoneInfoNotFoundError, ValueError):
+        return None
+
+
+def parse_time(value, params, default_tz):
+    """Parse a DATE or DATE-TIME value into (aware datetime, all_day)."""
+    value = value.strip()
+    tz = get_timezone(params['TZID']) if 'TZID' in params else None
+    try:
+        # Sliced rather than strptime'd: this runs for every event time in a feed
+        date = int(value[:4]), int(value[4:6]), int(value[6:8])
+        if params.get('VALUE') == 'DATE' or len(value) == 8:
+            return datetime(*date, tzinfo=tz or default_tz), True
+        if len(value) not in (15, 16) or value[8] != 'T':
+            raise ValueError(value)
+        time_of_day = int(value[9:11]), int(value[11:13]), int(value[13:15])
+        if value.endswith('Z'):
+            return datetime(*date, *time_of_day, tzinfo=timezone.utc), False
+        # Floating times, and zones we can't resolve, are read in the calendar's zone
+        return datetime(*date, *time_of_day, tzinfo=tz or default_tz), False
+    except ValueError:
+        raise ICSError(f'Invalid date or time: {value!r}')
+
+
+def parse_duration(value):
+    match = DURATION.match(value.strip())
+    if not match:
+        raise ICSError(f'Invalid duration: {value!r}')
+    sign, weeks, days, hours, minutes, seconds = match.groups()
+    duration = timedelta(
+        weeks=int(weeks or 0), days=int(days or 0), hours=int(hours or 0),
+        minutes=int(minutes or 0), seconds=int(seconds or 0)
+    )
+    return -duration if sign == '-' else duration
+
+
+def _rrule(value, start):
+    """Parse an RRULE for an aware DTSTART; dateutil wants UNTIL in UTC then."""
+    value = UNTIL_DATE.sub(r'\1T235959Z', value)
+    until = UNTIL_LOCAL.search(value)
+    if until:
+        local = datetime.strptime(until.group(1)[6:], '%Y%m%dT%H%M%S').replace(tzinfo=start.tzinfo)
+        value = value.replace(until.group(1), f"UNTIL={local.astimezone(timezone.utc).strftime('%Y%m%dT%H%M%SZ')}")
+    return rrulestr(value, dtstart=start)
+
+
+class ICSImporter:
+    """Turn an ICS feed into event details for events overlapping [after, before).
+
+    Yields dicts with 'uid', 'title', 'description', 'start_time', 'end_time',
+    'location' and 'all_day'. At most `max_occurrences` occurrences of any one
+    recurring event are yielded.
+    """
+
+    def __init__(self, after, before, default_timezone='UTC', max_occurrences=500):
+        if rruleset is None:
+            raise RuntimeError('ICS import needs the python-dateutil package')
+        self.after = after
+        self.before = before
+        self.default_tz = get_timezone(default_timezone)
+        self.max_occurrences = max_occurrences
+        self.skipped = 0
+
+    def events(self, chunks):
+        """Yield event details from an iterable of bytes or str chunks."""
+        series = []
+        overrides = {}  # uid -> {original start: props}
+        default_tz = self.default_tz
+        stack = []
+        props = None
+        for line in iter_lines(chunks):
+            name, params, value = parse_line(line)
+            if name == 'BEGIN':
+                stack.append(value.upper())
+                if stack == ['VCALENDAR', 'VEVENT']:
+                    props = {}
+            elif name == 'END':
+                if not stack or stack[-1] != value.upper():
+                    raise ICSError(f'Unexpected END:{value}')
+                stack.pop()
+                if props is not None and len(stack) == 1:
+                    event, props = props, None
+                    if event.get('STATUS', ({}, ''))[1].upper() == 'CANCELLED' and 'RECURRENCE-ID' not in event:
+                        self.skipped += 1
+                    elif 'RECURRENCE-ID' in event:
+                        original, _ = parse_time(*event['RECURRENCE-ID'][::-1], default_tz)
+                        overrides.setdefault(self._uid(event), {})[original] = event
+                    elif 'RRULE' in event or 'RDATE' in event:
+                        series.append(event)
+                    else:
+                        yield from self._single(event, default_tz)
+            elif stack == ['VCALENDAR'] and name == 'X-WR-TIMEZONE':
+                default_tz = get_timezone(value) or default_tz
+            elif props is not None and len(stack) == 2 and name in PROPERTIES:
+                if name in ('RDATE', 'EXDATE'):
+                    props.setdefault(name, []).append((params, value))
+                else:
+                    props[name] = (params, value)
+        if stack:
+            raise ICSError(f'Feed ended inside {stack[-1]}')
+
+        for event in series:
+            yield from self._expand(event, overrides.pop(self._uid(event), {}), default_tz)
+        # Moved occurrences of series we never saw are events of their own
+        for moved in overrides.values():
+            for event in moved.values():
+                if event.get('STATUS', ({}, ''))[1].upper() != 'CANCELLED':
+                    yield from self._single(event, default_tz)
+
+    def _uid(self, event):
+        return event.get('UID', ({}, ''))[1]
+
+    def _times(self, event, default_tz):
+        if 'DTSTART' not in event:
+            raise ICSError(f'Event {self._uid(event)!r} has no DTSTART')
+        start, all_day = parse_time(*event['DTSTART'][::-1], default_tz)
+        if 'DTEND' in event:
+            end, _ = parse_time(*event['DTEND'][::-1], default_tz)
+        elif 'DURATION' in event:
+            end = start + parse_duration(event['DURATION'][1])
+        else:
+            end = start + timedelta(days=1) if all_day else start
+        return start, end, all_day
+
+    def _details(self, event, start, end, all_day):
+        description = unescape(event.get('DESCRIPTION', ({}, ''))[1]).strip()
+        url = event.get('URL', ({}, ''))[1].strip()
+        if url and url not in description:
+            description = f"{description}\n\n{url}".strip()
+        return {
+            'uid': self._uid(event),
+            'title': unescape(event.get('SUMMARY', ({}, ''))[1]).strip(),
+            'description': description,
+            'start_time': start.isoformat(),
+            'end_time': end.isoformat(),
+            'location': unescape(event.get('LOCATION', ({}, ''))[1]).strip(),
+            'all_day': all_day,
+        }
+
+    def _in_window(self, start, end):
+        return end > self.after and start < self.before
+
+    def _single(self, event, default_tz):
+        start, end, all_day = self._times(event, default_tz)
+        if self._in_window(start, end):
+            yield self._details(event, start, end, all_day)
+        else:
+            self.skipped += 1
+
+    def _expand(self, event, moved, default_tz):
+        start, end, all_day = self._times(event, default_tz)
+        duration = end - start
+        rules = rruleset()
+        if 'RRULE' in event:
+            rules.rrule(_rrule(event['RRULE'][1], start))
+        for name, add in (('RDATE', rules.rdate), ('EXDATE', rules.exdate)):
+            for params, value in event.get(name, []):
+                for item in value.split(','):
+                    # PERIOD values give a start and an end; only the start is used
+                    add(parse_time(item.split('/')[0], params, start.tzinfo)[0])
+        if 'RRULE' not in event:
+            rules.rdate(start)
+
+        count = 0
+        for occurrence in rules.xafter(self.after - duration, inc=True):
+            if occurrence >= self.before:
+                break
+            if occurrence in moved:
+                continue
+            if not self._in_window(occurrence, occurrence + duration):
+                continue
+            if count >= self.max_occurrences:
+                logger.warning(f"Stopped expanding {self._uid(event)!r} after {count} occurrences")
+                break
+            count += 1
+            yield self._details(event, occurrence, occurrence + duration, all_day)
+        for moved_event in moved.values():
+            if moved_event.get('STATUS', ({}, ''))[1].upper() != 'CANCELLED':
+                yield from self._single(moved_event, default_tz)
+
+
+def read_chunks(f, chunk_size=CHUNK_SIZE):
+    return iter(lambda: f.read(chunk_size), b'')
+
+
+def parse_day(value):
+    """Parse an ISO date or datetime; naive values are taken as UTC."""
+    parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def main():
+    import requests
+
+    parser = argparse.ArgumentParser(description='Import the events of an iCalendar feed into the calendar')
+    parser.add_argument('source', help='ICS file, or http(s) URL of a feed')
+    parser.add_argument('--after', help='import events ending after this ISO date (default now)')
+    parser.add_argument('--before', help='import events starting before this ISO date (default --days from --after)')
+    parser.add_argument('--days', type=int, default=365, help='length of the import window')
+    parser.add_argument('--dry-run', action='store_true', help='validate and check for duplicates, create nothing')
+    parser.add_argument('--parse-only', action='store_true', help='print the parsed events as JSON lines, no API needed')
+    parser.add_argument('--timezone', default=os.getenv('ICS_DEFAULT_TIMEZONE', 'America/Chicago'),
+                        help='zone for floating times when the feed names none')
+    parser.add_argument('--api-url', default=os.getenv('API_URL', 'http://localhost:5000'))
+    args = parser.parse_args()
+
+    after = parse_day(args.after) if args.after else datetime.now(timezone.utc)
+    before = parse_day(args.before) if args.before else after + timedelta(days=args.days)
+    is_url = args.source.startswith(('http://', 'https://'))
+
+    if args.parse_only:
+        importer = ICSImporter(after, before, args.timezone)
+        if is_url:
+            with requests.get(args.source, stream=True, timeout=(5, 60)) as response:
+                response.raise_for_status()
+                events = importer.events(response.iter_content(CHUNK_SIZE))
+                for details in events:
+                    print(json.dumps(details))
+        else:
+            with open(args.source, 'rb') as f:
+                for details in importer.events(read_chunks(f)):
+                    print(json.dumps(details))
+        print(f"{importer.skipped} events outside the window skipped", file=sys.stderr)
+        return
+
+    window = {'after': after.isoformat(), 'before': before.isoformat(), 'dry_run': args.dry_run}
+    endpoint = f"{args.api_url}/import-ics"
+    if is_url:
+        response = requests.post(endpoint, json={'url': args.source, **window}, timeout=600)
+    else:
+        # The file is streamed to the API, not read into memory
+        with open(args.source, 'rb') as f:
+            response = requests.post(
+                endpoint, data=f, params=window, headers={'Content-Type': 'text/calendar'}, timeout=600
+            )
+    body = response.json()
+    if response.status_code != 200:
+        sys.exit(f"Import failed ({response.status_code}): {body.get('error')} {body.get('details', '')}")
+    for result in body['results']:
+        detail = result.get('eventId') or '; '.join(result.get('issues', [])) or result.get('error', '')
+        print(f"{result['status']:<10} {result['start_time'][:16]}  {result['title'][:50]:<50} {detail}")
+    counts = ', '.join(f"{body[status]} {status}" for status in ('created', 'valid', 'duplicate', 'invalid', 'failed')
+                       if body.get(status))
+    print(f"{len(body['results'])} events: {counts or 'nothing to import'} ({body['skipped']} outside the window)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,300 @@
+"""Background parse jobs backed by a local SQLite queue.
+
+Submitting a job stores it in SQLite and returns immediately. A pool of worker
+threads claims queued jobs, runs the fetch/parse/validate pipeline and writes
+the result back, so a slow LLM call never holds a web worker. Because the
+queue lives in a file, every gunicorn worker process can serve status requests
+for any job, and jobs left running by a crashed process are picked up again.
+
+The serving process starts the workers when it starts (see wsgi.py), so jobs
+queued before a restart, and jobs whose lease expired, run without waiting
+for a new submission. Each claim takes a new lease; a worker whose job was
+reclaimed meanwhile finds its lease gone and drops its result instead of
+overwriting the one from the run that replaced it.
+"""
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+
+from local_db import busy_timeout, thread_local
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_STATUSES = ('queued', 'running')
+
+
+class QueueFull(Exception):
+    """Raised when a job is submitted while the queue is at capacity."""
+
+
+class JobCancelled(Exception):
+    """Raised inside a running job once cancellation has been requested."""
+
+
+class _LeaseLost(Exception):
+    """Raised inside a running job once another worker has reclaimed it."""
+
+
+class ParseJobQueue:
+    """SQLite-backed job queue with a worker pool, started with `start()`.
+
+    `run_job(url, description_style, progress)` does the work and returns a
+    (body, status, path) tuple. It should call `progress(stage)` between stages;
+    that records the stage and raises JobCancelled if the job was cancelled.
+    """
+
+    def __init__(self, path, run_job, workers=2, max_depth=100, lease_seconds=300,
+                 retention_seconds=86400, poll_interval=1.0):
+        self.path = path
+        self.run_job = run_job
+        self.workers = workers
+        self.max_depth = max_depth
+        self.lease_seconds = lease_seconds
+        self.retention_seconds = retention_seconds
+        self.poll_interval = poll_interval
+        self._local = thread_local()
+        self._wakeup = threading.Condition()
+        self._start_lock = threading.Lock()
+        self._threads = []
+        self._stopping = False
+        self._init_db()
+
+    def _connect(self):
+        db = getattr(self._local, 'db', None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=busy_timeout(10), isolation_level=None)
+            db.row_factory = sqlite3.Row
+            self._local.db = db
+        return db
+
+    def _init_db(self):
+        db = self._connect()
+        db.execute('PRAGMA journal_mode=WAL')
+        db.execute(
+            'CREATE TABLE IF NOT EXISTS parse_jobs ('
+            ' id TEXT PRIMARY KEY,'
+            ' url TEXT NOT NULL,'
+            ' description_style TEXT NOT NULL,'
+            ' status TEXT NOT NULL,'
+            ' stage TEXT NOT NULL,'
+            ' cancel_requested INTEGER NOT NULL DEFAULT 0,'
+            ' lease TEXT,'
+            ' result TEXT,'
+            ' status_code INTEGER,'
+            ' path TEXT,'
+            ' created_at REAL NOT NULL,'
+            ' updated_at REAL NOT NULL)'
+        )
+        db.execute('CREATE INDEX IF NOT EXISTS parse_jobs_status ON parse_jobs (status, created_at)')
+
+    def start(self):
+        """Start the worker threads, once."""
+        with self._start_lock:
+            if self._threads:
+                return
+            for index in range(self.workers):
+                thread = threading.Thread(
+                    target=self._work, name=f'parse-job-{index}', daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def depth(self):
+        """Number of jobs queued or running."""
+        row = self._connect().execute(
+            'SELECT COUNT(*) FROM parse_jobs WHERE status IN (?, ?)', ACTIVE_STATUSES
+        ).fetchone()
+        return row[0]
+
+    def submit(self, url, description_style='default'):
+        """Queue a parse job and return its initial state. Raises QueueFull."""
+        now = time.time()
+        job_id = uuid.uuid4().hex
+        db = self._connect()
+        db.execute('BEGIN IMMEDIATE')
+        try:
+            depth = db.execute(
+                'SELECT COUNT(*) FROM parse_jobs WHERE status IN (?, ?)', ACTIVE_STATUSES
+            ).fetchone()[0]
+            if depth >= self.max_depth:
+                raise QueueFull(f'{depth} jobs already queued')
+            db.execute(
+                'INSERT INTO parse_jobs (id, url, description_style, status, stage, created_at, updated_at)'
+                ' VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (job_id, url, description_style, 'queued', 'queued', now, now)
+            )
+            db.execute('COMMIT')
+        except Exception:
+            db.execute('ROLLBACK')
+            raise
+
+        self.start()
+        with self._wakeup:
+            self._wakeup.notify()
+        return self.get(job_id)
+
+    def get(self, job_id):
+        """Return the job as a dict, or None if it doesn't exist."""
+        row = self._connect().execute('SELECT * FROM parse_jobs WHERE id = ?', (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = {
+            'job_id': row['id'],
+            'url': row['url'],
+            'description_style': row['description_style'],
+            'status': row['status'],
+            'stage': row['stage'],
+            'created_at': row['created_at'],
+            'updated_at': row['updated_at'],
+        }
+        if row['status'] == 'queued':
+            job['position'] = self._connect().execute(
+                'SELECT COUNT(*) FROM parse_jobs WHERE status = ? AND created_at <= ?',
+                ('queued', row['created_at'])
+            ).fetchone()[0]
+        if row['result'] is not None:
+            job['result'] = json.loads(row['result'])
+            job['status_code'] = row['status_code']
+            job['path'] = row['path']
+        return job
+
+    def cancel(self, job_id):
+        """Cancel a job. Returns the updated job, or None if it doesn't exist.
+
+        Queued jobs are cancelled at once; running jobs stop at their next stage.
+        """
+        now = time.time()
+        db = self._connect()
+        db.execute(
+            "UPDATE parse_jobs SET status = 'cancelled', stage = 'cancelled', updated_at = ?"
+            " WHERE id = ? AND status = 'queued'",
+            (now, job_id)
+        )
+        db.execute(
+            "UPDATE parse_jobs SET cancel_requested = 1, updated_at = ?"
+            " WHERE id = ? AND status = 'running'",
+            (now, job_id)
+        )
+        return self.get(job_id)
+
+    def _claim(self):
+        """Atomically move the oldest queued job to running under a new lease and return it."""
+        now = time.time()
+        db = self._connect()
+        db.execute('BEGIN IMMEDIATE')
+        try:
+            # Jobs whose worker died mid-run (or stalled past its lease) are returned to the queue
+            db.execute(
+                "UPDATE parse_jobs SET status = 'queued', stage = 'queued', lease = NULL"
+                " WHERE status = 'running' AND updated_at < ?",
+                (now - self.lease_seconds,)
+            )
+            row = db.execute(
+                "SELECT id, url, description_style FROM parse_jobs"
+                " WHERE status = 'queued' ORDER BY created_at LIMIT 1"
+            ).fetchone()
+            job = None
+            if row is not None:
+                job = dict(row, lease=uuid.uuid4().hex)
+                db.execute(
+                    "UPDATE parse_jobs SET status = 'running', stage = 'starting', lease = ?, updated_at = ?"
+                    " WHERE id = ?",
+                    (job['lease'], now, row['id'])
+                )
+            db.execute('COMMIT')
+        except Exception:
+            db.execute('ROLLBACK')
+            raise
+        return job
+
+    def _progress(self, job, stage):
+        db = self._connect()
+        updated = db.execute(
+            'UPDATE parse_jobs SET stage = ?, updated_at = ? WHERE id = ? AND lease = ?',
+            (stage, time.time(), job['id'], job['lease'])
+        ).rowcount
+        if not updated:
+            raise _LeaseLost()
+        row = db.execute('SELECT cancel_requested FROM parse_jobs WHERE id = ?', (job['id'],)).fetchone()
+        if row is not None and row['cancel_requested']:
+            raise JobCancelled()
+
+    def _finish(self, job, status, body=None, status_code=None, path=None):
+        """Record the outcome, unless the job was reclaimed meanwhile."""
+        updated = self._connect().execute(
+            'UPDATE parse_jobs SET status = ?, stage = ?, result = ?, status_code = ?, path = ?, lease = NULL,'
+            ' updated_at = ? WHERE id = ? AND lease = ?',
+            (status, status, json.dumps(body) if body is not None else None,
+             status_code, path, time.time(), job['id'], job['lease'])
+        ).rowcount
+        if not updated:
+            logger.warning(f"Parse job {job['id']} was reclaimed by another worker, dropping this result")
+
+    def _prune(self):
+        self._connect().execute(
+            'DELETE FROM parse_jobs WHERE status NOT IN (?, ?) AND updated_at < ?',
+            (*ACTIVE_STATUSES, time.time() - self.retention_seconds)
+        )
+
+    def _run(self, job):
+        job_id = job['id']
+        try:
+            body, status_code, path = self.run_job(
+                job['url'], job['description_style'],
+                lambda stage: self._progress(job, stage)
+            )
+            self._progress(job, 'saving')
+        except _LeaseLost:
+            logger.warning(f"Parse job {job_id} was reclaimed by another worker, stopping")
+            return
+        except JobCancelled:
+            logger.info(f"Parse job {job_id} cancelled")
+            self._finish(job, 'cancelled')
+            return
+        except Exception as e:
+            logger.error(f"Parse job {job_id} failed: {str(e)}")
+            self._finish(job, 'failed', {'error': 'Failed to parse event details', 'details': str(e)}, 500)
+            return
+        status = 'succeeded' if status_code == 200 else 'failed'
+        self._finish(job, status, body, status_code, path)
+
+    def _work(self):
+        last_prune = 0.0
+        while not self._stopping:
+            try:
+                job = self._claim()
+                if job is None:
+                    if time.time() - last_prune > 3600:
+                        self._prune()
+                        last_prune = time.time()
+                    with self._wakeup:
+                        self._wakeup.wait(self.poll_interval)
+                    continue
+                self._run(job)
+            except sqlite3.Error as e:
+                logger.error(f"Parse job queue error: {e}")
+                time.sleep(self.poll_interval)
+
+    def stop(self):
+        """Stop the worker threads after their current job."""
+        self._stopping = True
+        with self._wakeup:
+            self._wakeup.notify_all()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        self._stopping = False
+
+
+def queue_from_env(run_job):
+    """Build the parse job queue from PARSE_JOB_* environment variables."""
+    return ParseJobQueue(
+        path=os.getenv('PARSE_JOB_DB_PATH', 'parse_jobs.sqlite3'),
+        run_job=run_job,
+        workers=int(os.getenv('PARSE_JOB_WORKERS', 2)),
+        max_depth=int(os.getenv('PARSE_JOB_MAX_DEPTH', 100)),
+    )
@@ -0,0 +1,361 @@
+"""Long-lived LLM client that returns event fields as structured data.
+
+One client (and its HTTP connection pool) is reused for every parse. Anthropic
+models are called directly with a forced tool whose input schema is the event
+fields, so the fields come back as a parsed object instead of text that has to
+be cleaned up. The tool and system prompt are marked for prompt caching when
+together they reach the model's minimum cacheable length; below it the API
+wouldn't cache them anyway, and marking them would only risk the cache write
+premium.
+Other aisuite providers ("openai:...", etc.) are asked for JSON and their reply
+is cleaned and decoded.
+
+If the output is unusable (no JSON, missing fields, or rejected by the
+caller's validator) one repair call is made. It sends only the previous output
+and the problems found, not the page again.
+
+ModelCascade tries a list of (model, max_tokens) tiers in order, moving to
+the next tier only when a cheaper one fails, its output still fails validation
+after the repair call, or the caller's low_confidence check flags it, and
+keeps latency, escalation and token counts for each tier. An empty field is
+not in itself a reason to escalate: pages often don't state an end time or
+location, and a larger model can't find what isn't there.
+
+Given a resilience.Upstreams registry, every model call goes through the
+'llm:<provider:model>' upstream, which rate limits it, retries overloads and
+rate limits, and fails fast while the model is down. The Anthropic SDK's own
+retries are turned off then so failures aren't retried twice.
+"""
+import json
+import logging
+import threading
+import time
+from collections import defaultdict, namedtuple
+
+logger = logging.getLogger(__name__)
+
+PROMPT_CACHING_BETA = 'prompt-caching-2024-07-31'
+TOOL_NAME = 'record_event'
+
+# Shortest prefix, in tokens, the API caches for a model family
+MIN_CACHEABLE_TOKENS = {'haiku': 2048}
+DEFAULT_MIN_CACHEABLE_TOKENS = 1024
+# Rough characters per token, for estimating a prefix's length
+CHARS_PER_TOKEN = 4
+
+LLMResult = namedtuple('LLMResult', ['details', 'raw', 'usage', 'repaired'])
+
+
+class LLMOutputError(Exception):
+    """Raised when the model's output is still unusable after the repair call."""
+
+    def __init__(self, message, raw):
+        super().__init__(message)
+        self.raw = raw
+
+
+def clean_json_response(content):
+    """Clean up AI response to extract just the JSON object"""
+    content = content.strip()
+
+    # Remove common LLM prefixes
+    prefixes_to_remove = [
+        "Here is the JSON object with the extracted event details:",
+        "Here's the JSON object:",
+        "Here is a JSON object with the extracted event details:",
+        "Here is the event information in JSON format:",
+        "The extracted event details in JSON format:"
+    ]
+
+    for prefix in prefixes_to_remove:
+        if content.lower().startswith(prefix.lower()):
+            content = content[len(prefix):].strip()
+
+    # Remove any markdown code block formatting
+    if content.startswith("```json"):
+        content = content[7:]
+    if content.startswith("```"):
+        content = content[3:]
+    if content.endswith("```"):
+        content = content[:-3]
+
+    return content.strip()
+
+
+def fields_schema(field_descriptions, required=None):
+    """JSON schema for an object with the given {field: description} string fields.
+
+    Every field is required unless `required` names the ones that are.
+    """
+    return {
+        'type': 'object',
+        'properties': {
+            field: {'type': 'string', 'description': description}
+            for field, description in field_descriptions.items()
+        },
+        'required': list(field_descriptions if required is None else required),
+    }
+
+
+def min_cacheable_tokens(model):
+    return next(
+        (minimum for family, minimum in MIN_CACHEABLE_TOKENS.items() if family in model),
+        DEFAULT_MIN_CACHEABLE_TOKENS
+    )
+
+
+def _usage(input_tokens=0, output_tokens=0, cache_read_tokens=0, cache_write_tokens=0):
+    return {
+        'input_tokens': input_tokens or 0,
+        'output_tokens': output_tokens or 0,
+        'cache_read_tokens': cache_read_tokens or 0,
+        'cache_write_tokens': cache_write_tokens or 0,
+    }
+
+
+class AnthropicProvider:
+    """Anthropic Messages API with a forced tool call for structured output."""
+
+    def __init__(self, api_key=None, prompt_caching=True, max_retries=2, client=None):
+        if client is None:
+            import anthropic
+            client = anthropic.Anthropic(api_key=api_key, max_retries=max_retries)
+        self._client = client
+        self.prompt_caching = prompt_caching
+
+    def complete(self, model, system, messages, schema, max_tokens, temperature):
+        """Return (details dict or None, raw text, usage).
+
+        The tool and system prompt form the cached prefix, so both must be the
+        same on every call for the cache to hit; the breakpoint is on the
+        system block, after the tool, and only set when the prefix is long
+        enough to be cached.
+        """
+        tool = {
+            'name': TOOL_NAME,
+            'description': 'Record the event details extracted from the page.',
+            'input_schema': schema,
+        }
+        system_block = {'type': 'text', 'text': system}
+        extra_headers = None
+        prefix_tokens = (len(json.dumps(tool)) + len(system)) // CHARS_PER_TOKEN
+        if self.prompt_caching and prefix_tokens >= min_cacheable_tokens(model):
+            system_block['cache_control'] = {'type': 'ephemeral'}
+            extra_headers = {'anthropic-beta': PROMPT_CACHING_BETA}
+        response = self._client.messages.create(
+            model=model,
+            system=[system_block],
+            messages=messages,
+            tools=[tool],
+            tool_choice={'type': 'tool', 'name': TOOL_NAME},
+            max_tokens=max_tokens,
+            temperature=temperature,
+            extra_headers=extra_headers,
+        )
+        usage = _usage(
+            response.usage.input_tokens,
+            response.usage.output_tokens,
+            getattr(response.usage, 'cache_read_input_tokens', 0),
+            getattr(response.usage, 'cache_creation_input_tokens', 0),
+        )
+        for block in response.content:
+            if block.type == 'tool_use':
+                return block.input, json.dumps(block.input), usage
+        text = ''.join(block.text for block in response.content if block.type == 'text')
+        return None, text, usage
+
+
+class AISuiteProvider:
+    """Any aisuite provider, asked to answer with a JSON object."""
+
+    def __init__(self):
+        import aisuite as ai
+        self._client = ai.Client()
+
+    def complete(self, model, system, messages, schema, max_tokens, temperature):
+        """Return (details dict or None, raw text, usage)."""
+        response = self._client.chat.completions.create(
+            messages=[{'role': 'system', 'content': system}] + messages,
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature
+        )
+        raw = response.choices[0].message.content.strip()
+        usage = getattr(response, 'usage', None)
+        usage = _usage(
+            getattr(usage, 'prompt_tokens', 0), getattr(usage, 'completion_tokens', 0)
+        )
+        try:
+            details = json.loads(clean_json_response(raw))
+        except json.JSONDecodeError:
+            details = None
+        return details, raw, usage
+
+
+class LLMClient:
+    """Creates one provider per provider name and reuses it across threads.
+
+    `model` strings use aisuite's "provider:model" form. Calls go through
+    `upstreams` (a resilience.Upstreams) when one is given.
+    """
+
+    def __init__(self, providers=None, upstreams=None):
+        self._providers = dict(providers or {})
+        self.upstreams = upstreams
+        self._lock = threading.Lock()
+
+    def provider(self, name):
+        with self._lock:
+            if name not in self._providers:
+                if name == 'anthropic':
+                    self._providers[name] = AnthropicProvider(max_retries=0 if self.upstreams else 2)
+                else:
+                    self._providers[name] = AISuiteProvider()
+            return self._providers[name]
+
+    def _call(self, model, system, messages, schema, max_tokens, temperature):
+        provider_name, _, model_name = model.partition(':')
+        provider = self.provider(provider_name)
+        if not isinstance(provider, AnthropicProvider):
+            # Other providers get the full provider:model string, as aisuite expects
+            model_name = model
+        if self.upstreams is None:
+            return provider.complete(model_name, system, messages, schema, max_tokens, temperature)
+        return self.upstreams.call(
+            f'llm:{model}', lambda: provider.complete(model_name, system, messages, schema, max_tokens, temperature)
+        )
+
+    @staticmethod
+    def _problems(details, fields, validate):
+        if not isinstance(details, dict):
+            return ['The output was not a JSON object.']
+        problems = [f"Missing field: {field}" for field in fields if field not in details]
+        if not problems and validate is not None:
+            problems = validate(details)
+        return problems
+
+    def extract(self, model, system, prompt, schema, max_tokens=4096, temperature=0.5, validate=None,
+                fields=None):
+        """Ask `model` for an object matching `schema` and return an LLMResult.
+
+        `fields` are the ones the output must have (by default the schema's
+        required ones). Missing fields, problems returned by
+        `validate(details)` and undecodable output trigger one repair call.
+        Raises LLMOutputError if the output still can't be decoded after that.
+        """
+        fields = schema.get('required', []) if fields is None else fields
+        messages = [{'role': 'user', 'content': prompt}]
+        details, raw, usage = self._call(model, system, messages, schema, max_tokens, temperature)
+        problems = self._problems(details, fields, validate)
+        if not problems:
+            return LLMResult(details, raw, usage, False)
+
+        logger.info(f"Repairing LLM output: {problems}")
+        repair_prompt = (
+            "Your previous output was:\n"
+            f"{raw}\n\n"
+            "It has these problems:\n"
+            + "\n".join(f"- {problem}" for problem in problems)
+            + f"\n\nReturn the corrected object with the fields {', '.join(fields)}. Change only what is needed to "
+            "fix the problems."
+        )
+        repaired, repaired_raw, repair_usage = self._call(
+            model, system, [{'role': 'user', 'content': repair_prompt}], schema, max_tokens, temperature
+        )
+        usage = {key: usage[key] + repair_usage[key] for key in usage}
+        if isinstance(repaired, dict):
+            return LLMResult(repaired, repaired_raw, usage, True)
+        if isinstance(details, dict):
+            # The repair made things worse; let the caller's validation report the original problems
+            return LLMResult(details, raw, usage, False)
+        raise LLMOutputError('Invalid JSON response from AI', repaired_raw)
+
+
+class ModelCascade:
+    """Try cheaper models first and escalate only when their output isn't good enough.
+
+    `tiers` maps a description style to a list of (model, max_tokens) pairs,
+    cheapest first; styles without an entry use the 'default' list. Raises
+    ValueError if there is no 'default' list or any list is empty.
+    `on_call(style, model, seconds, outcome, usage)` is called after every
+    model call, e.g. to feed metrics.
+    """
+
+    def __init__(self, client, tiers, on_call=None):
+        if 'default' not in tiers:
+            raise ValueError("Model tiers need a 'default' list")
+        empty = sorted(style for style, style_tiers in tiers.items() if not style_tiers)
+        if empty:
+            raise ValueError(f"No models configured for description style(s): {', '.join(empty)}")
+        self.client = client
+        self.tiers = tiers
+        self.on_call = on_call
+        self._stats = defaultdict(lambda: defaultdict(float))
+        self._lock = threading.Lock()
+
+    def tiers_for(self, style):
+        return self.tiers.get(style, self.tiers['default'])
+
+    def _record(self, style, model, elapsed, outcome, usage=None):
+        with self._lock:
+            stats = self._stats[(style, model)]
+            stats['calls'] += 1
+            stats[outcome] += 1
+            stats['seconds'] += elapsed
+            for key, value in (usage or {}).items():
+                stats[key] += value
+        if self.on_call is not None:
+            self.on_call(style, model, elapsed, outcome, usage or {})
+
+    def extract(self, style, system, prompt, schema, temperature=0.5, validate=None, low_confidence=None,
+                fields=None):
+        """Run the cascade for `style` and return (LLMResult, model).
+
+        `validate(details)` returns a list of errors; errors left after the
+        repair call, or `low_confidence(details)` being true, send the request
+        to the next tier. The last tier's result is returned as-is.
+        """
+        tiers = self.tiers_for(style)
+        for index, (model, max_tokens) in enumerate(tiers):
+            last = index == len(tiers) - 1
+            started = time.monotonic()
+            try:
+                result = self.client.extract(
+                    model, system, prompt, schema, max_tokens=max_tokens,
+                    temperature=temperature, validate=validate, fields=fields
+                )
+            except Exception:
+                self._record(style, model, time.monotonic() - started, 'failed')
+                if last:
+                    raise
+                logger.info(f"{model} failed, escalating")
+                continue
+            elapsed = time.monotonic() - started
+            unreliable = (validate is not None and validate(result.details)) or (
+                low_confidence is not None and low_confidence(result.details)
+            )
+            if last or not unreliable:
+                self._record(style, model, elapsed, 'accepted', result.usage)
+                return result, model
+            self._record(style, model, elapsed, 'escalated', result.usage)
+            logger.info(f"Escalating {style} parse from {model}")
+
+    def stats(self):
+        """Per style and model: calls, escalation rate, mean latency and tokens."""
+        with self._lock:
+            snapshot = {key: dict(stats) for key, stats in self._stats.items()}
+        report = {}
+        for (style, model), stats in snapshot.items():
+            calls = stats['calls']
+            report.setdefault(style, {})[model] = {
+                'calls': int(calls),
+                'accepted': int(stats.get('accepted', 0)),
+                'escalated': int(stats.get('escalated', 0)),
+                'failed': int(stats.get('failed', 0)),
+                'escalation_rate': round((stats.get('escalated', 0) + stats.get('failed', 0)) / calls, 4),
+                'mean_latency_ms': round(stats['seconds'] / calls * 1000, 1),
+                'input_tokens': int(stats.get('input_tokens', 0)),
+                'output_tokens': int(stats.get('output_tokens', 0)),
+                'cache_read_tokens': int(stats.get('cache_read_tokens', 0)),
+            }
+        return report
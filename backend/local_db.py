@@ -0,0 +1,37 @@
+"""Connection settings shared by the API's SQLite files.
+
+The parse cache, HTTP cache, calendar copy, parse job queue and event watches
+each keep a local SQLite file in WAL mode. Reads never wait on writers, and a
+write waits up to the busy timeout for another process's write to finish.
+
+SQLite calls don't yield to gevent: in async mode (gunicorn_async.conf.py) a
+query holds up every request on its worker until it returns. Queries on these
+files take well under a millisecond, so the cost that matters is a write
+waiting out the busy timeout. SQLITE_BUSY_TIMEOUT bounds that wait, and the
+async config lowers it. A write contended for longer then fails instead: the
+caches skip it, a calendar sync is retried on the next request, and a job
+submission answers 500.
+"""
+import os
+import threading
+
+try:
+    from gevent.monkey import get_original
+except ImportError:  # gevent is only needed for the async mode
+    get_original = None
+
+
+def busy_timeout(default):
+    """Seconds a write waits on another connection's lock: SQLITE_BUSY_TIMEOUT, else `default`."""
+    return float(os.getenv('SQLITE_BUSY_TIMEOUT', default))
+
+
+def thread_local():
+    """A threading.local that stays per OS thread when gevent patches it per greenlet.
+
+    Greenlets on one thread then share a connection rather than opening one
+    each. They can't interleave on it, since SQLite calls never yield.
+    """
+    if get_original is None:
+        return threading.local()
+    return get_original('threading', 'local')()
@@ -0,0 +1,267 @@
+"""Content-addressed cache for parsed event results.
+
+Results are keyed by a hash of the normalized URL, the text extracted from the
+page and the description style, so a page whose content changes gets a fresh
+parse while repeated links are answered without another LLM round trip.
+
+Two tiers are used: an in-process LRU in front of a SQLite file that survives
+restarts and is shared between gunicorn workers. Both tiers honour the same TTL.
+Concurrent requests for the same key wait on a single in-flight computation.
+"""
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from local_db import busy_timeout
+
+logger = logging.getLogger(__name__)
+
+# Query parameters that only identify where a link was shared from
+TRACKING_PARAMS = {'fbclid', 'gclid', 'mc_cid', 'mc_eid', 'ref', 'ref_src'}
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+def normalize_url(url):
+    """Normalize a URL so trivially different links map to the same key."""
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    path = parts.path or '/'
+    if len(path) > 1:
+        path = path.rstrip('/')
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.startswith('utm_') and k not in TRACKING_PARAMS
+    )
+    return urlunsplit((scheme, host, path, urlencode(query), ''))
+
+
+def make_cache_key(url, text_content, description_style, *extra):
+    """Build the cache key for a parse of `text_content` fetched from `url`.
+
+    Any `extra` strings that also shape the result are hashed into the key.
+    """
+    digest = hashlib.sha256()
+    for part in (normalize_url(url), description_style or 'default', text_content, *extra):
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+class _Flight:
+    """A computation in progress that other callers can wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class ParseCache:
+    """Two-tier (memory + SQLite) TTL cache with single-flight computation."""
+
+    def __init__(self, path=None, ttl=86400, max_entries=512, max_disk_entries=10000):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self._memory = OrderedDict()
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        self._db = None
+        self._writes = 0
+        self._stats = {
+            'memory_hits': 0,
+            'disk_hits': 0,
+            'misses': 0,
+            'coalesced': 0,
+            'stores': 0,
+            'errors': 0,
+            'seconds_saved': 0.0,
+        }
+        if path:
+            self._open_db()
+
+    def _open_db(self):
+        try:
+            self._db = sqlite3.connect(self.path, timeout=busy_timeout(5), check_same_thread=False)
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS parse_cache ('
+                ' key TEXT PRIMARY KEY,'
+                ' value TEXT NOT NULL,'
+                ' expires_at REAL NOT NULL)'
+            )
+            self._db.execute(
+                'CREATE INDEX IF NOT EXISTS parse_cache_expires ON parse_cache (expires_at)'
+            )
+            self._db.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Parse cache disk tier disabled: {e}")
+            self._db = None
+
+    def _disk_get(self, key, now):
+        if self._db is None:
+            return None
+        try:
+            with self._db_lock:
+                row = self._db.execute(
+                    'SELECT value, expires_at FROM parse_cache WHERE key = ?', (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Parse cache read failed: {e}")
+            return None
+        if row is None or row[1] <= now:
+            return None
+        return json.loads(row[0]), row[1]
+
+    def _disk_set(self, key, entry, expires_at):
+        if self._db is None:
+            return
+        try:
+            with self._db_lock:
+                self._db.execute(
+                    'INSERT OR REPLACE INTO parse_cache (key, value, expires_at) VALUES (?, ?, ?)',
+                    (key, json.dumps(entry), expires_at)
+                )
+                self._writes += 1
+                if self._writes % 100 == 0:
+                    self._prune_disk(time.time())
+                self._db.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Parse cache write failed: {e}")
+
+    def _prune_disk(self, now):
+        self._db.execute('DELETE FROM parse_cache WHERE expires_at <= ?', (now,))
+        self._db.execute(
+            'DELETE FROM parse_cache WHERE key IN ('
+            ' SELECT key FROM parse_cache ORDER BY expires_at DESC LIMIT -1 OFFSET ?)',
+            (self.max_disk_entries,)
+        )
+
+    def _memory_set(self, key, entry, expires_at):
+        # Caller holds self._lock
+        self._memory[key] = (expires_at, entry)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _lookup(self, key):
+        """Return the cached entry for `key` and count the hit, or None."""
+        now = time.time()
+        with self._lock:
+            cached = self._memory.get(key)
+            if cached is not None:
+                if cached[0] > now:
+                    self._memory.move_to_end(key)
+                    self._stats['memory_hits'] += 1
+                    self._stats['seconds_saved'] += cached[1]['seconds']
+                    return cached[1]
+                del self._memory[key]
+
+        found = self._disk_get(key, now)
+        if found is None:
+            return None
+        entry, expires_at = found
+        with self._lock:
+            self._memory_set(key, entry, expires_at)
+            self._stats['disk_hits'] += 1
+            self._stats['seconds_saved'] += entry['seconds']
+        return entry
+
+    def get(self, key):
+        """Return the cached value for `key`, or None if absent or expired."""
+        entry = self._lookup(key)
+        return entry['value'] if entry is not None else None
+
+    def set(self, key, value, seconds=0.0):
+        """Store `value` under `key`. `seconds` is the cost of computing it."""
+        entry = {'value': value, 'seconds': seconds}
+        expires_at = time.time() + self.ttl
+        with self._lock:
+            self._memory_set(key, entry, expires_at)
+            self._stats['stores'] += 1
+        self._disk_set(key, entry, expires_at)
+
+    def get_or_compute(self, key, compute, cacheable=None):
+        """Return the cached value for `key`, computing it at most once.
+
+        If another thread is already computing `key`, wait for its result instead
+        of starting a second computation. Results for which `cacheable(value)` is
+        false are handed to waiting callers but not stored.
+        """
+        entry = self._lookup(key)
+        if entry is not None:
+            return entry['value']
+
+        with self._lock:
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight()
+                self._stats['misses'] += 1
+            else:
+                self._stats['coalesced'] += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        started = time.monotonic()
+        try:
+            flight.value = compute()
+            # Stored before the flight ends, so a caller arriving in between
+            # finds the value instead of computing it again
+            if cacheable is None or cacheable(flight.value):
+                self.set(key, flight.value, time.monotonic() - started)
+        except Exception as e:
+            flight.error = e
+            with self._lock:
+                self._stats['errors'] += 1
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.done.set()
+        return flight.value
+
+    def stats(self):
+        """Return hit/miss counters and the compute time served from cache."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['memory_entries'] = len(self._memory)
+            stats['in_flight'] = len(self._inflight)
+        lookups = stats['memory_hits'] + stats['disk_hits'] + stats['misses'] + stats['coalesced']
+        hits = lookups - stats['misses']
+        stats['hit_rate'] = round(hits / lookups, 4) if lookups else 0.0
+        stats['seconds_saved'] = round(stats['seconds_saved'], 3)
+        return stats
+
+    def clear(self):
+        """Drop every entry from both tiers."""
+        with self._lock:
+            self._memory.clear()
+        if self._db is not None:
+            with self._db_lock:
+                self._db.execute('DELETE FROM parse_cache')
+                self._db.commit()
+
+
+def cache_from_env():
+    """Build the parse cache from PARSE_CACHE_* environment variables."""
+    return ParseCache(
+        path=os.getenv('PARSE_CACHE_PATH', 'parse_cache.sqlite3') or None,
+        ttl=int(os.getenv('PARSE_CACHE_TTL', 86400)),
+        max_entries=int(os.getenv('PARSE_CACHE_MAX_ENTRIES', 512)),
+    )
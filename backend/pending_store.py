@@ -0,0 +1,276 @@
+"""Storage for parsed events waiting for an admin's approval.
+
+Entries are keyed by the (chat_id, message_id) of the bot message that shows
+the event, expire after a TTL, and are capped in number. Approving an event
+first claims it atomically, so two admins reacting at the same moment can't
+add it to the calendar twice.
+
+The SQLite store is the default: it survives restarts and can be shared by
+several bot processes on the same host. The claim is only atomic between
+processes locking the same local file; SQLite's locks don't hold across
+machines or on network filesystems. Replicas on separate hosts share a Redis
+store instead, where each change runs as one server-side script.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+try:
+    import redis
+except ImportError:  # only needed for PENDING_STORE=redis
+    redis = None
+
+
+class PendingEventStore:
+    """Interface for pending event stores."""
+
+    def put(self, chat_id, message_id, event_details):
+        """Store an event awaiting approval."""
+        raise NotImplementedError
+
+    def get(self, chat_id, message_id):
+        """Return the pending event details, or None."""
+        raise NotImplementedError
+
+    def claim(self, chat_id, message_id):
+        """Atomically take an unclaimed event for approval.
+
+        Returns its details, or None if it's missing, expired or already claimed.
+        """
+        raise NotImplementedError
+
+    def release(self, chat_id, message_id):
+        """Return a claimed event to pending, e.g. after a failed approval."""
+        raise NotImplementedError
+
+    def delete(self, chat_id, message_id):
+        """Remove an event, typically once it has been added to the calendar."""
+        raise NotImplementedError
+
+
+class MemoryPendingStore(PendingEventStore):
+    """In-process store, for a single bot process that can lose state on restart."""
+
+    def __init__(self, ttl=7 * 86400, max_entries=1000, claim_timeout=300):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.claim_timeout = claim_timeout
+        self._entries = OrderedDict()  # (chat_id, message_id) -> [details, expires_at, claimed_at]
+        self._lock = threading.Lock()
+
+    def _live(self, key, now):
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] <= now:
+            del self._entries[key]
+            return None
+        return entry
+
+    def put(self, chat_id, message_id, event_details):
+        now = time.time()
+        with self._lock:
+            self._entries[(chat_id, message_id)] = [event_details, now + self.ttl, None]
+            self._entries.move_to_end((chat_id, message_id))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, chat_id, message_id):
+        with self._lock:
+            entry = self._live((chat_id, message_id), time.time())
+            return entry[0] if entry else None
+
+    def claim(self, chat_id, message_id):
+        now = time.time()
+        with self._lock:
+            entry = self._live((chat_id, message_id), now)
+            if entry is None or (entry[2] is not None and entry[2] > now - self.claim_timeout):
+                return None
+            entry[2] = now
+            return entry[0]
+
+    def release(self, chat_id, message_id):
+        with self._lock:
+            entry = self._entries.get((chat_id, message_id))
+            if entry is not None:
+                entry[2] = None
+
+    def delete(self, chat_id, message_id):
+        with self._lock:
+            self._entries.pop((chat_id, message_id), None)
+
+
+class SQLitePendingStore(PendingEventStore):
+    """SQLite-backed store shared by every bot process using the same file."""
+
+    def __init__(self, path, ttl=7 * 86400, max_entries=1000, claim_timeout=300):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.claim_timeout = claim_timeout
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, timeout=5, isolation_level=None, check_same_thread=False)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS pending_events ('
+            ' chat_id INTEGER NOT NULL,'
+            ' message_id INTEGER NOT NULL,'
+            ' details TEXT NOT NULL,'
+            ' created_at REAL NOT NULL,'
+            ' expires_at REAL NOT NULL,'
+            ' claimed_at REAL,'
+            ' PRIMARY KEY (chat_id, message_id))'
+        )
+        self._db.execute('CREATE INDEX IF NOT EXISTS pending_events_created ON pending_events (created_at)')
+
+    def put(self, chat_id, message_id, event_details):
+        now = time.time()
+        with self._lock:
+            self._db.execute('BEGIN IMMEDIATE')
+            try:
+                self._db.execute(
+                    'INSERT OR REPLACE INTO pending_events (chat_id, message_id, details, created_at, expires_at)'
+                    ' VALUES (?, ?, ?, ?, ?)',
+                    (chat_id, message_id, json.dumps(event_details), now, now + self.ttl)
+                )
+                self._db.execute('DELETE FROM pending_events WHERE expires_at <= ?', (now,))
+                self._db.execute(
+                    'DELETE FROM pending_events WHERE rowid IN ('
+                    ' SELECT rowid FROM pending_events ORDER BY created_at DESC LIMIT -1 OFFSET ?)',
+                    (self.max_entries,)
+                )
+                self._db.execute('COMMIT')
+            except Exception:
+                self._db.execute('ROLLBACK')
+                raise
+
+    def get(self, chat_id, message_id):
+        with self._lock:
+            row = self._db.execute(
+                'SELECT details FROM pending_events WHERE chat_id = ? AND message_id = ? AND expires_at > ?',
+                (chat_id, message_id, time.time())
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def claim(self, chat_id, message_id):
+        now = time.time()
+        with self._lock:
+            # A single UPDATE is atomic across processes; only one claimant changes the row
+            claimed = self._db.execute(
+                'UPDATE pending_events SET claimed_at = ?'
+                ' WHERE chat_id = ? AND message_id = ? AND expires_at > ?'
+                ' AND (claimed_at IS NULL OR claimed_at <= ?)',
+                (now, chat_id, message_id, now, now - self.claim_timeout)
+            ).rowcount
+            if not claimed:
+                return None
+            row = self._db.execute(
+                'SELECT details FROM pending_events WHERE chat_id = ? AND message_id = ?',
+                (chat_id, message_id)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def release(self, chat_id, message_id):
+        with self._lock:
+            self._db.execute(
+                'UPDATE pending_events SET claimed_at = NULL WHERE chat_id = ? AND message_id = ?',
+                (chat_id, message_id)
+            )
+
+    def delete(self, chat_id, message_id):
+        with self._lock:
+            self._db.execute(
+                'DELETE FROM pending_events WHERE chat_id = ? AND message_id = ?',
+                (chat_id, message_id)
+            )
+
+
+# KEYS: entry, index; ARGV: details, ttl, now, max_entries
+_PUT_SCRIPT = """
+redis.call('DEL', KEYS[1])
+redis.call('HSET', KEYS[1], 'details', ARGV[1])
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+local now = tonumber(ARGV[3])
+redis.call('ZADD', KEYS[2], now, KEYS[1])
+redis.call('ZREMRANGEBYSCORE', KEYS[2], '-inf', now - tonumber(ARGV[2]))
+local overflow = redis.call('ZRANGE', KEYS[2], 0, -tonumber(ARGV[4]) - 1)
+for _, key in ipairs(overflow) do
+    redis.call('DEL', key)
+    redis.call('ZREM', KEYS[2], key)
+end
+"""
+
+# KEYS: entry; ARGV: now, claim_timeout
+_CLAIM_SCRIPT = """
+local details = redis.call('HGET', KEYS[1], 'details')
+if not details then
+    return false
+end
+local claimed_at = tonumber(redis.call('HGET', KEYS[1], 'claimed_at') or '0')
+if claimed_at > tonumber(ARGV[1]) - tonumber(ARGV[2]) then
+    return false
+end
+redis.call('HSET', KEYS[1], 'claimed_at', ARGV[1])
+return details
+"""
+
+
+class RedisPendingStore(PendingEventStore):
+    """Redis-backed store shared by bot replicas on any host.
+
+    Each entry is a hash that Redis expires after the TTL, and a sorted set of
+    entries by creation time caps their number. Puts and claims run as Lua
+    scripts, so they're atomic however many replicas use the server.
+    """
+
+    def __init__(self, url, ttl=7 * 86400, max_entries=1000, claim_timeout=300, prefix='pending_events'):
+        if redis is None:
+            raise RuntimeError('PENDING_STORE=redis needs the redis package (pip install redis)')
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.claim_timeout = claim_timeout
+        self.prefix = prefix
+        self._redis = redis.Redis.from_url(url)
+        self._put = self._redis.register_script(_PUT_SCRIPT)
+        self._claim = self._redis.register_script(_CLAIM_SCRIPT)
+
+    def _key(self, chat_id, message_id):
+        return f'{self.prefix}:{chat_id}:{message_id}'
+
+    def put(self, chat_id, message_id, event_details):
+        self._put(
+            keys=[self._key(chat_id, message_id), f'{self.prefix}:index'],
+            args=[json.dumps(event_details), self.ttl, time.time(), self.max_entries],
+        )
+
+    def get(self, chat_id, message_id):
+        details = self._redis.hget(self._key(chat_id, message_id), 'details')
+        return json.loads(details) if details else None
+
+    def claim(self, chat_id, message_id):
+        details = self._claim(keys=[self._key(chat_id, message_id)], args=[time.time(), self.claim_timeout])
+        return json.loads(details) if details else None
+
+    def release(self, chat_id, message_id):
+        self._redis.hdel(self._key(chat_id, message_id), 'claimed_at')
+
+    def delete(self, chat_id, message_id):
+        key = self._key(chat_id, message_id)
+        pipeline = self._redis.pipeline()
+        pipeline.delete(key)
+        pipeline.zrem(f'{self.prefix}:index', key)
+        pipeline.execute()
+
+
+def store_from_env():
+    """Build the pending event store from PENDING_* environment variables."""
+    ttl = int(os.getenv('PENDING_EVENT_TTL', 7 * 86400))
+    max_entries = int(os.getenv('PENDING_EVENT_MAX_ENTRIES', 1000))
+    store = os.getenv('PENDING_STORE', 'sqlite')
+    if store == 'memory':
+        return MemoryPendingStore(ttl=ttl, max_entries=max_entries)
+    if store == 'redis':
+        return RedisPendingStore(os.getenv('REDIS_URL', 'redis://localhost:6379/0'), ttl=ttl, max_entries=max_entries)
+    return SQLitePendingStore(
+        os.getenv('PENDING_DB_PATH', 'pending_events.sqlite3'), ttl=ttl, max_entries=max_entries
+    )
@@ -0,0 +1,372 @@
+"""Rate limits, retries and circuit breakers for calls to upstream services.
+
+Every upstream (each LLM model, each host pages are fetched from, Google
+Calendar) gets an `Upstream` that wraps its calls with:
+
+- a token bucket, so this process sends at most `rate` calls a second with
+  bursts of up to `burst`. A call that can't get a token within `max_wait`
+  is rejected instead of queueing behind the limit;
+- retries of transient failures (connection errors, timeouts, 429, 5xx and
+  Google's rate-limit 403s) with full-jitter exponential backoff. A
+  Retry-After sent by the upstream is waited out, or, if it's longer than
+  `max_delay`, the breaker is held open for that long and the call gives up;
+- a circuit breaker that opens after `failure_threshold` transient failures
+  in a row, rejects calls for `reset_timeout` seconds, then lets one trial
+  call through and closes again if it succeeds. Rate-limit answers don't
+  count towards it; the upstream is up, just busy, and says how long to wait.
+
+Rejected calls and calls that run out of retries raise UpstreamUnavailable,
+which the API answers with a 503 and a Retry-After header. Errors that aren't
+transient (a 404 page, a bad request) are raised unchanged and count as the
+upstream being up.
+"""
+import logging
+import os
+import random
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from email.utils import parsedate_to_datetime
+
+import requests
+
+try:
+    import anthropic
+except ImportError:  # only needed to recognise its connection errors
+    anthropic = None
+
+logger = logging.getLogger(__name__)
+
+CLOSED, OPEN, HALF_OPEN = 'closed', 'open', 'half_open'
+
+# 529 is Anthropic's "overloaded"
+RETRYABLE_STATUSES = {408, 429, 500, 502, 503, 504, 529}
+RATE_LIMIT_REASONS = ('rateLimitExceeded', 'userRateLimitExceeded', 'quotaExceeded')
+TRANSIENT_ERRORS = (ConnectionError, TimeoutError, requests.ConnectionError, requests.Timeout) + (
+    (anthropic.APIConnectionError,) if anthropic else ()
+)
+
+
+class UpstreamUnavailable(Exception):
+    """Raised when an upstream is rejecting calls or kept failing them."""
+
+    def __init__(self, upstream, reason, retry_after):
+        super().__init__(f"{upstream}: {reason}")
+        self.upstream = upstream
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+def status_code(exception):
+    """HTTP status carried by an anthropic, requests or googleapiclient error, or None."""
+    status = getattr(exception, 'status_code', None)
+    if status is None:
+        status = getattr(getattr(exception, 'response', None), 'status_code', None)
+    if status is None:
+        status = getattr(getattr(exception, 'resp', None), 'status', None)
+    return int(status) if status is not None else None
+
+
+def parse_retry_after(value):
+    """Seconds to wait from a Retry-After header value (seconds or HTTP date), or None."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def retry_after(exception):
+    """Seconds the upstream asked us to wait before retrying, or None."""
+    headers = getattr(getattr(exception, 'response', None), 'headers', None)
+    if headers is None:
+        # googleapiclient keeps the httplib2 response, a dict of lowercased headers
+        headers = getattr(exception, 'resp', None)
+    if not hasattr(headers, 'get'):
+        return None
+    return parse_retry_after(headers.get('retry-after'))
+
+
+def is_rate_limited(exception):
+    """Whether the upstream refused a call because of a rate limit or quota."""
+    status = status_code(exception)
+    if status == 429:
+        return True
+    content = getattr(exception, 'content', b'')
+    if isinstance(content, bytes):
+        content = content.decode('utf-8', 'replace')
+    # Google answers some rate limits with a 403 and says so in the body
+    return status == 403 and any(reason in str(content) for reason in RATE_LIMIT_REASONS)
+
+
+def is_transient(exception):
+    """Whether a failed call is worth retrying."""
+    status = status_code(exception)
+    if status is not None:
+        return status in RETRYABLE_STATUSES or is_rate_limited(exception)
+    if isinstance(exception, requests.exceptions.SSLError):
+        # A certificate that fails verification will fail again
+        return False
+    return isinstance(exception, TRANSIENT_ERRORS)
+
+
+def backoff_delay(attempt, base_delay, max_delay, retry_after=None):
+    """Full-jitter exponential backoff for retry number `attempt` (from 1).
+
+    A Retry-After from the upstream is a floor; the jitter on top keeps
+    clients told the same time from all coming back at once.
+    """
+    delay = random.uniform(0, min(max_delay, base_delay * 2 ** (attempt - 1)))
+    if retry_after is not None:
+        delay = max(delay, retry_after + random.uniform(0, base_delay))
+    return delay
+
+
+class TokenBucket:
+    """Allows `rate` acquisitions a second on average, `burst` at once."""
+
+    def __init__(self, rate, burst=None):
+        self.rate = rate
+        self.capacity = burst or max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _take(self):
+        """Take a token and return 0, or return the seconds until one is available."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self, timeout=None):
+        """Wait for a token; return False if none comes within `timeout` seconds."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            wait = self._take()
+            if not wait:
+                return True
+            if deadline is not None and time.monotonic() + wait > deadline:
+                return False
+            time.sleep(wait)
+
+    def available(self):
+        with self._lock:
+            elapsed = time.monotonic() - self._updated
+            return min(self.capacity, self._tokens + elapsed * self.rate)
+
+
+class CircuitBreaker:
+    """Closed, open or half open, from consecutive transient failures."""
+
+    def __init__(self, name, failure_threshold=5, reset_timeout=30):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened = 0
+        self._open_until = 0.0
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        """Return 0 if a call may go ahead, else the seconds until one will be let through."""
+        with self._lock:
+            if self.state == OPEN:
+                remaining = self._open_until - time.monotonic()
+                if remaining > 0:
+                    return remaining
+                self.state = HALF_OPEN
+            if self.state == HALF_OPEN:
+                # Only one trial call at a time; the rest keep failing fast until it's done
+                if self._trial_running:
+                    return 1.0
+                self._trial_running = True
+            return 0
+
+    def abandon(self):
+        """A call let through never reached the upstream."""
+        with self._lock:
+            self._trial_running = False
+
+    def record_success(self):
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+            self._trial_running = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                self._open(self.reset_timeout)
+
+    def hold_open(self, seconds):
+        """Open for `seconds`, e.g. when the upstream sent a long Retry-After."""
+        with self._lock:
+            self._open(max(seconds, self._open_until - time.monotonic()))
+
+    def _open(self, seconds):
+        if self.state != OPEN:
+            self.opened += 1
+            logger.warning(f"Circuit for {self.name} opened for {seconds:.0f}s after {self.failures} failures")
+        self.state = OPEN
+        self._open_until = time.monotonic() + seconds
+        self._trial_running = False
+
+    def open_for(self):
+        with self._lock:
+            return max(0.0, self._open_until - time.monotonic()) if self.state == OPEN else 0.0
+
+
+class Upstream:
+    """Rate limit, retry and circuit breaker for calls to one upstream service."""
+
+    def __init__(self, name, rate=None, burst=None, max_wait=10, max_attempts=3, base_delay=0.5,
+                 max_delay=10, failure_threshold=5, reset_timeout=30):
+        self.name = name
+        self.limiter = TokenBucket(rate, burst) if rate else None
+        self.max_wait = max_wait
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.breaker = CircuitBreaker(name, failure_threshold, reset_timeout)
+        self.counts = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def _count(self, outcome):
+        with self._lock:
+            self.counts[outcome] += 1
+
+    def _admit(self):
+        wait = self.breaker.before_call()
+        if wait:
+            self._count('rejected')
+            raise UpstreamUnavailable(self.name, 'circuit open', wait)
+        if self.limiter is not None and not self.limiter.acquire(self.max_wait):
+            self.breaker.abandon()
+            self._count('throttled')
+            raise UpstreamUnavailable(self.name, 'rate limit reached', 1 / self.limiter.rate)
+
+    def call(self, fn, retry=True):
+        """Return `fn()`, retrying transient failures unless `retry` is false.
+
+        Only pass `retry=True` for calls that are safe to repeat.
+        """
+        attempts = self.max_attempts if retry else 1
+        for attempt in range(1, attempts + 1):
+            self._admit()
+            try:
+                result = fn()
+            except Exception as e:
+                if not is_transient(e):
+                    # The upstream answered; the request itself was at fault
+                    self.breaker.record_success()
+                    raise
+                if is_rate_limited(e):
+                    self.breaker.abandon()
+                else:
+                    self.breaker.record_failure()
+                self._count('failed')
+                wait = retry_after(e)
+                if wait is not None and wait > self.max_delay:
+                    self.breaker.hold_open(wait)
+                    raise UpstreamUnavailable(self.name, f"asked to retry after {wait:.0f}s", wait) from e
+                if attempt == attempts:
+                    raise UpstreamUnavailable(
+                        self.name, f"failed {attempts} times: {e}", wait or self.breaker.open_for() or self.max_delay
+                    ) from e
+                delay = backoff_delay(attempt, self.base_delay, self.max_delay, wait)
+                self._count('retried')
+                logger.warning(f"{self.name} call failed ({e}), retry {attempt} in {delay:.2f}s")
+                time.sleep(delay)
+            else:
+                self.breaker.record_success()
+                self._count('succeeded')
+                return result
+
+    def stats(self):
+        with self._lock:
+            counts = dict(self.counts)
+        open_for = self.breaker.open_for()
+        state = self.breaker.state
+        if state == OPEN and not open_for:
+            # The next call will be the trial
+            state = HALF_OPEN
+        stats = {
+            'state': state,
+            'consecutive_failures': self.breaker.failures,
+            'times_opened': self.breaker.opened,
+            'open_for_seconds': round(open_for, 1),
+            **{outcome: counts.get(outcome, 0) for outcome in ('succeeded', 'failed', 'retried', 'rejected', 'throttled')},
+        }
+        if self.limiter is not None:
+            stats['tokens_available'] = round(self.limiter.available(), 2)
+        return stats
+
+
+class Upstreams:
+    """Upstreams by name, created on first use.
+
+    A name's prefix before the first ':' picks its settings from `settings`,
+    e.g. 'fetch:example.com' uses settings['fetch']. Only the
+    `max_entries` most recently used upstreams are kept.
+    """
+
+    def __init__(self, settings=None, max_entries=1024):
+        self.settings = settings or {}
+        self.max_entries = max_entries
+        self._upstreams = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, name):
+        with self._lock:
+            upstream = self._upstreams.get(name)
+            if upstream is None:
+                upstream = self._upstreams[name] = Upstream(name, **self.settings.get(name.partition(':')[0], {}))
+                if len(self._upstreams) > self.max_entries:
+                    self._upstreams.popitem(last=False)
+            else:
+                self._upstreams.move_to_end(name)
+            return upstream
+
+    def call(self, name, fn, retry=True):
+        return self.get(name).call(fn, retry)
+
+    def stats(self):
+        with self._lock:
+            upstreams = list(self._upstreams.values())
+        return {upstream.name: upstream.stats() for upstream in sorted(upstreams, key=lambda u: u.name)}
+
+
+def _settings_from_env(prefix, rate, burst):
+    return {
+        'rate': float(os.getenv(f'{prefix}_RATE_LIMIT', rate)),
+        'burst': float(os.getenv(f'{prefix}_RATE_BURST', burst)),
+        'max_attempts': int(os.getenv('RETRY_MAX_ATTEMPTS', 3)),
+        'max_delay': float(os.getenv('RETRY_MAX_DELAY', 10)),
+        'failure_threshold': int(os.getenv('BREAKER_FAILURE_THRESHOLD', 5)),
+        'reset_timeout': float(os.getenv('BREAKER_RESET_TIMEOUT', 30)),
+    }
+
+
+def upstreams_from_env():
+    """Build the upstream registry from *_RATE_LIMIT, RETRY_* and BREAKER_* environment variables.
+
+    Rates are calls per second per process; 0 disables the limit.
+    """
+    return Upstreams({
+        'llm': _settings_from_env('LLM', 4, 8),
+        'fetch': _settings_from_env('FETCH', 10, 20),
+        'calendar': _settings_from_env('CALENDAR', 5, 10),
+    })
@@ -1,173 +0,0 @@
-var wS=Object.defineProperty;var SS=(e,t,r)=>t in e?wS(e,t,{enumerable:!0,configurable:!0,writable:!0,value:r}):e[t]=r;var As=(e,t,r)=>SS(e,typeof t!="symbol"?t+"":t,r);function CS(e,t){for(var r=0;r<t.length;r++){const o=t[r];if(typeof o!="string"&&!Array.isArray(o)){for(const s in o)if(s!=="default"&&!(s in e)){const a=Object.getOwnPropertyDescriptor(o,s);a&&Object.defineProperty(e,s,a.get?a:{enumerable:!0,get:()=>o[s]})}}}return Object.freeze(Object.defineProperty(e,Symbol.toStringTag,{value:"Module"}))}(function(){const t=document.createElement("link").relList;if(t&&t.supports&&t.supports("modulepreload"))return;for(const s of document.querySelectorAll('link[rel="modulepreload"]'))o(s);new MutationObserver(s=>{for(const a of s)if(a.type==="childList")for(const c of a.addedNodes)c.tagName==="LINK"&&c.rel==="modulepreload"&&o(c)}).observe(document,{childList:!0,subtree:!0});function r(s){const a={};return s.integrity&&(a.integrity=s.integrity),s.referrerPolicy&&(a.referrerPolicy=s.referrerPolicy),s.crossOrigin==="use-credentials"?a.credentials="include":s.crossOrigin==="anonymous"?a.credentials="omit":a.credentials="same-origin",a}function o(s){if(s.ep)return;s.ep=!0;const a=r(s);fetch(s.href,a)}})();function dr(e){return e&&e.__esModule&&Object.prototype.hasOwnProperty.call(e,"default")?e.default:e}var Zd={exports:{}},Ns={},Jd={exports:{}},Qe={};/**
- * @license React
- * react.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Mg;function kS(){if(Mg)return Qe;Mg=1;var e=Symbol.for("react.element"),t=Symbol.for("react.portal"),r=Symbol.for("react.fragment"),o=Symbol.for("react.strict_mode"),s=Symbol.for("react.profiler"),a=Symbol.for("react.provider"),c=Symbol.for("react.context"),u=Symbol.for("react.forward_ref"),f=Symbol.for("react.suspense"),p=Symbol.for("react.memo"),h=Symbol.for("react.lazy"),g=Symbol.iterator;function b(L){return L===null||typeof L!="object"?null:(L=g&&L[g]||L["@@iterator"],typeof L=="function"?L:null)}var S={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},v=Object.assign,x={};function w(L,Q,te){this.props=L,this.context=Q,this.refs=x,this.updater=te||S}w.prototype.isReactComponent={},w.prototype.setState=function(L,Q){if(typeof L!="object"&&typeof L!="function"&&L!=null)throw Error("setState(...): takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,L,Q,"setState")},w.prototype.forceUpdate=function(L){this.updater.enqueueForceUpdate(this,L,"forceUpdate")};function T(){}T.prototype=w.prototype;function R(L,Q,te){this.props=L,this.context=Q,this.refs=x,this.updater=te||S}var P=R.prototype=new T;P.constructor=R,v(P,w.prototype),P.isPureReactComponent=!0;var M=Array.isArray,D=Object.prototype.hasOwnProperty,$={current:null},O={key:!0,ref:!0,__self:!0,__source:!0};function N(L,Q,te){var ae,Z={},le=null,ue=null;if(Q!=null)for(ae in Q.ref!==void 0&&(ue=Q.ref),Q.key!==void 0&&(le=""+Q.key),Q)D.call(Q,ae)&&!O.hasOwnProperty(ae)&&(Z[ae]=Q[ae]);var J=arguments.length-2;if(J===1)Z.children=te;else if(1<J){for(var ne=Array(J),fe=0;fe<J;fe++)ne[fe]=arguments[fe+2];Z.children=ne}if(L&&L.defaultProps)for(ae in J=L.defaultProps,J)Z[ae]===void 0&&(Z[ae]=J[ae]);return{$$typeof:e,type:L,key:le,ref:ue,props:Z,_owner:$.current}}function U(L,Q){return{$$typeof:e,type:L.type,key:Q,ref:L.ref,props:L.props,_owner:L._owner}}function C(L){return typeof L=="object"&&L!==null&&L.$$typeof===e}function A(L){var Q={"=":"=0",":":"=2"};return"$"+L.replace(/[=:]/g,function(te){return Q[te]})}var H=/\/+/g;function W(L,Q){return typeof L=="object"&&L!==null&&L.key!=null?A(""+L.key):Q.toString(36)}function V(L,Q,te,ae,Z){var le=typeof L;(le==="undefined"||le==="boolean")&&(L=null);var ue=!1;if(L===null)ue=!0;else switch(le){case"string":case"number":ue=!0;break;case"object":switch(L.$$typeof){case e:case t:ue=!0}}if(ue)return ue=L,Z=Z(ue),L=ae===""?"."+W(ue,0):ae,M(Z)?(te="",L!=null&&(te=L.replace(H,"$&/")+"/"),V(Z,Q,te,"",function(fe){return fe})):Z!=null&&(C(Z)&&(Z=U(Z,te+(!Z.key||ue&&ue.key===Z.key?"":(""+Z.key).replace(H,"$&/")+"/")+L)),Q.push(Z)),1;if(ue=0,ae=ae===""?".":ae+":",M(L))for(var J=0;J<L.length;J++){le=L[J];var ne=ae+W(le,J);ue+=V(le,Q,te,ne,Z)}else if(ne=b(L),typeof ne=="function")for(L=ne.call(L),J=0;!(le=L.next()).done;)le=le.value,ne=ae+W(le,J++),ue+=V(le,Q,te,ne,Z);else if(le==="object")throw Q=String(L),Error("Objects are not valid as a React child (found: "+(Q==="[object Object]"?"object with keys {"+Object.keys(L).join(", ")+"}":Q)+"). If you meant to render a collection of children, use an array instead.");return ue}function F(L,Q,te){if(L==null)return L;var ae=[],Z=0;return V(L,ae,"","",function(le){return Q.call(te,le,Z++)}),ae}function B(L){if(L._status===-1){var Q=L._result;Q=Q(),Q.then(function(te){(L._status===0||L._status===-1)&&(L._status=1,L._result=te)},function(te){(L._status===0||L._status===-1)&&(L._status=2,L._result=te)}),L._status===-1&&(L._status=0,L._result=Q)}if(L._status===1)return L._result.default;throw L._result}var Y={current:null},j={transition:null},_={ReactCurrentDispatcher:Y,ReactCurrentBatchConfig:j,ReactCurrentOwner:$};function q(){throw Error("act(...) is not supported in production builds of React.")}return Qe.Children={map:F,forEach:function(L,Q,te){F(L,function(){Q.apply(this,arguments)},te)},count:function(L){var Q=0;return F(L,function(){Q++}),Q},toArray:function(L){return F(L,function(Q){return Q})||[]},only:function(L){if(!C(L))throw Error("React.Children.only expected to receive a single React element child.");return L}},Qe.Component=w,Qe.Fragment=r,Qe.Profiler=s,Qe.PureComponent=R,Qe.StrictMode=o,Qe.Suspense=f,Qe.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=_,Qe.act=q,Qe.cloneElement=function(L,Q,te){if(L==null)throw Error("React.cloneElement(...): The argument must be a React element, but you passed "+L+".");var ae=v({},L.props),Z=L.key,le=L.ref,ue=L._owner;if(Q!=null){if(Q.ref!==void 0&&(le=Q.ref,ue=$.current),Q.key!==void 0&&(Z=""+Q.key),L.type&&L.type.defaultProps)var J=L.type.defaultProps;for(ne in Q)D.call(Q,ne)&&!O.hasOwnProperty(ne)&&(ae[ne]=Q[ne]===void 0&&J!==void 0?J[ne]:Q[ne])}var ne=arguments.length-2;if(ne===1)ae.children=te;else if(1<ne){J=Array(ne);for(var fe=0;fe<ne;fe++)J[fe]=arguments[fe+2];ae.children=J}return{$$typeof:e,type:L.type,key:Z,ref:le,props:ae,_owner:ue}},Qe.createContext=function(L){return L={$$typeof:c,_currentValue:L,_currentValue2:L,_threadCount:0,Provider:null,Consumer:null,_defaultValue:null,_globalName:null},L.Provider={$$typeof:a,_context:L},L.Consumer=L},Qe.createElement=N,Qe.createFactory=function(L){var Q=N.bind(null,L);return Q.type=L,Q},Qe.createRef=function(){return{current:null}},Qe.forwardRef=function(L){return{$$typeof:u,render:L}},Qe.isValidElement=C,Qe.lazy=function(L){return{$$typeof:h,_payload:{_status:-1,_result:L},_init:B}},Qe.memo=function(L,Q){return{$$typeof:p,type:L,compare:Q===void 0?null:Q}},Qe.startTransition=function(L){var Q=j.transition;j.transition={};try{L()}finally{j.transition=Q}},Qe.unstable_act=q,Qe.useCallback=function(L,Q){return Y.current.useCallback(L,Q)},Qe.useContext=function(L){return Y.current.useContext(L)},Qe.useDebugValue=function(){},Qe.useDeferredValue=function(L){return Y.current.useDeferredValue(L)},Qe.useEffect=function(L,Q){return Y.current.useEffect(L,Q)},Qe.useId=function(){return Y.current.useId()},Qe.useImperativeHandle=function(L,Q,te){return Y.current.useImperativeHandle(L,Q,te)},Qe.useInsertionEffect=function(L,Q){return Y.current.useInsertionEffect(L,Q)},Qe.useLayoutEffect=function(L,Q){return Y.current.useLayoutEffect(L,Q)},Qe.useMemo=function(L,Q){return Y.current.useMemo(L,Q)},Qe.useReducer=function(L,Q,te){return Y.current.useReducer(L,Q,te)},Qe.useRef=function(L){return Y.current.useRef(L)},Qe.useState=function(L){return Y.current.useState(L)},Qe.useSyncExternalStore=function(L,Q,te){return Y.current.useSyncExternalStore(L,Q,te)},Qe.useTransition=function(){return Y.current.useTransition()},Qe.version="18.3.1",Qe}var Rg;function Xf(){return Rg||(Rg=1,Jd.exports=kS()),Jd.exports}/**
- * @license React
- * react-jsx-runtime.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Dg;function TS(){if(Dg)return Ns;Dg=1;var e=Xf(),t=Symbol.for("react.element"),r=Symbol.for("react.fragment"),o=Object.prototype.hasOwnProperty,s=e.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED.ReactCurrentOwner,a={key:!0,ref:!0,__self:!0,__source:!0};function c(u,f,p){var h,g={},b=null,S=null;p!==void 0&&(b=""+p),f.key!==void 0&&(b=""+f.key),f.ref!==void 0&&(S=f.ref);for(h in f)o.call(f,h)&&!a.hasOwnProperty(h)&&(g[h]=f[h]);if(u&&u.defaultProps)for(h in f=u.defaultProps,f)g[h]===void 0&&(g[h]=f[h]);return{$$typeof:t,type:u,key:b,ref:S,props:g,_owner:s.current}}return Ns.Fragment=r,Ns.jsx=c,Ns.jsxs=c,Ns}var Eg;function PS(){return Eg||(Eg=1,Zd.exports=TS()),Zd.exports}var I=PS(),k=Xf();const Un=dr(k),xc=CS({__proto__:null,default:Un},[k]);var _l={},ef={exports:{}},gn={},tf={exports:{}},nf={};/**
- * @license React
- * scheduler.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Ig;function MS(){return Ig||(Ig=1,function(e){function t(j,_){var q=j.length;j.push(_);e:for(;0<q;){var L=q-1>>>1,Q=j[L];if(0<s(Q,_))j[L]=_,j[q]=Q,q=L;else break e}}function r(j){return j.length===0?null:j[0]}function o(j){if(j.length===0)return null;var _=j[0],q=j.pop();if(q!==_){j[0]=q;e:for(var L=0,Q=j.length,te=Q>>>1;L<te;){var ae=2*(L+1)-1,Z=j[ae],le=ae+1,ue=j[le];if(0>s(Z,q))le<Q&&0>s(ue,Z)?(j[L]=ue,j[le]=q,L=le):(j[L]=Z,j[ae]=q,L=ae);else if(le<Q&&0>s(ue,q))j[L]=ue,j[le]=q,L=le;else break e}}return _}function s(j,_){var q=j.sortIndex-_.sortIndex;return q!==0?q:j.id-_.id}if(typeof performance=="object"&&typeof performance.now=="function"){var a=performance;e.unstable_now=function(){return a.now()}}else{var c=Date,u=c.now();e.unstable_now=function(){return c.now()-u}}var f=[],p=[],h=1,g=null,b=3,S=!1,v=!1,x=!1,w=typeof setTimeout=="function"?setTimeout:null,T=typeof clearTimeout=="function"?clearTimeout:null,R=typeof setImmediate<"u"?setImmediate:null;typeof navigator<"u"&&navigator.scheduling!==void 0&&navigator.scheduling.isInputPending!==void 0&&navigator.scheduling.isInputPending.bind(navigator.scheduling);function P(j){for(var _=r(p);_!==null;){if(_.callback===null)o(p);else if(_.startTime<=j)o(p),_.sortIndex=_.expirationTime,t(f,_);else break;_=r(p)}}function M(j){if(x=!1,P(j),!v)if(r(f)!==null)v=!0,B(D);else{var _=r(p);_!==null&&Y(M,_.startTime-j)}}function D(j,_){v=!1,x&&(x=!1,T(N),N=-1),S=!0;var q=b;try{for(P(_),g=r(f);g!==null&&(!(g.expirationTime>_)||j&&!A());){var L=g.callback;if(typeof L=="function"){g.callback=null,b=g.priorityLevel;var Q=L(g.expirationTime<=_);_=e.unstable_now(),typeof Q=="function"?g.callback=Q:g===r(f)&&o(f),P(_)}else o(f);g=r(f)}if(g!==null)var te=!0;else{var ae=r(p);ae!==null&&Y(M,ae.startTime-_),te=!1}return te}finally{g=null,b=q,S=!1}}var $=!1,O=null,N=-1,U=5,C=-1;function A(){return!(e.unstable_now()-C<U)}function H(){if(O!==null){var j=e.unstable_now();C=j;var _=!0;try{_=O(!0,j)}finally{_?W():($=!1,O=null)}}else $=!1}var W;if(typeof R=="function")W=function(){R(H)};else if(typeof MessageChannel<"u"){var V=new MessageChannel,F=V.port2;V.port1.onmessage=H,W=function(){F.postMessage(null)}}else W=function(){w(H,0)};function B(j){O=j,$||($=!0,W())}function Y(j,_){N=w(function(){j(e.unstable_now())},_)}e.unstable_IdlePriority=5,e.unstable_ImmediatePriority=1,e.unstable_LowPriority=4,e.unstable_NormalPriority=3,e.unstable_Profiling=null,e.unstable_UserBlockingPriority=2,e.unstable_cancelCallback=function(j){j.callback=null},e.unstable_continueExecution=function(){v||S||(v=!0,B(D))},e.unstable_forceFrameRate=function(j){0>j||125<j?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):U=0<j?Math.floor(1e3/j):5},e.unstable_getCurrentPriorityLevel=function(){return b},e.unstable_getFirstCallbackNode=function(){return r(f)},e.unstable_next=function(j){switch(b){case 1:case 2:case 3:var _=3;break;default:_=b}var q=b;b=_;try{return j()}finally{b=q}},e.unstable_pauseExecution=function(){},e.unstable_requestPaint=function(){},e.unstable_runWithPriority=function(j,_){switch(j){case 1:case 2:case 3:case 4:case 5:break;default:j=3}var q=b;b=j;try{return _()}finally{b=q}},e.unstable_scheduleCallback=function(j,_,q){var L=e.unstable_now();switch(typeof q=="object"&&q!==null?(q=q.delay,q=typeof q=="number"&&0<q?L+q:L):q=L,j){case 1:var Q=-1;break;case 2:Q=250;break;case 5:Q=1073741823;break;case 4:Q=1e4;break;default:Q=5e3}return Q=q+Q,j={id:h++,callback:_,priorityLevel:j,startTime:q,expirationTime:Q,sortIndex:-1},q>L?(j.sortIndex=q,t(p,j),r(f)===null&&j===r(p)&&(x?(T(N),N=-1):x=!0,Y(M,q-L))):(j.sortIndex=Q,t(f,j),v||S||(v=!0,B(D))),j},e.unstable_shouldYield=A,e.unstable_wrapCallback=function(j){var _=b;return function(){var q=b;b=_;try{return j.apply(this,arguments)}finally{b=q}}}}(nf)),nf}var Og;function RS(){return Og||(Og=1,tf.exports=MS()),tf.exports}/**
- * @license React
- * react-dom.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var $g;function DS(){if($g)return gn;$g=1;var e=Xf(),t=RS();function r(n){for(var i="https://reactjs.org/docs/error-decoder.html?invariant="+n,l=1;l<arguments.length;l++)i+="&args[]="+encodeURIComponent(arguments[l]);return"Minified React error #"+n+"; visit "+i+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var o=new Set,s={};function a(n,i){c(n,i),c(n+"Capture",i)}function c(n,i){for(s[n]=i,n=0;n<i.length;n++)o.add(i[n])}var u=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),f=Object.prototype.hasOwnProperty,p=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,h={},g={};function b(n){return f.call(g,n)?!0:f.call(h,n)?!1:p.test(n)?g[n]=!0:(h[n]=!0,!1)}function S(n,i,l,d){if(l!==null&&l.type===0)return!1;switch(typeof i){case"function":case"symbol":return!0;case"boolean":return d?!1:l!==null?!l.acceptsBooleans:(n=n.toLowerCase().slice(0,5),n!=="data-"&&n!=="aria-");default:return!1}}function v(n,i,l,d){if(i===null||typeof i>"u"||S(n,i,l,d))return!0;if(d)return!1;if(l!==null)switch(l.type){case 3:return!i;case 4:return i===!1;case 5:return isNaN(i);case 6:return isNaN(i)||1>i}return!1}function x(n,i,l,d,m,y,E){this.acceptsBooleans=i===2||i===3||i===4,this.attributeName=d,this.attributeNamespace=m,this.mustUseProperty=l,this.propertyName=n,this.type=i,this.sanitizeURL=y,this.removeEmptyString=E}var w={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach(function(n){w[n]=new x(n,0,!1,n,null,!1,!1)}),[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach(function(n){var i=n[0];w[i]=new x(i,1,!1,n[1],null,!1,!1)}),["contentEditable","draggable","spellCheck","value"].forEach(function(n){w[n]=new x(n,2,!1,n.toLowerCase(),null,!1,!1)}),["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach(function(n){w[n]=new x(n,2,!1,n,null,!1,!1)}),"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach(function(n){w[n]=new x(n,3,!1,n.toLowerCase(),null,!1,!1)}),["checked","multiple","muted","selected"].forEach(function(n){w[n]=new x(n,3,!0,n,null,!1,!1)}),["capture","download"].forEach(function(n){w[n]=new x(n,4,!1,n,null,!1,!1)}),["cols","rows","size","span"].forEach(function(n){w[n]=new x(n,6,!1,n,null,!1,!1)}),["rowSpan","start"].forEach(function(n){w[n]=new x(n,5,!1,n.toLowerCase(),null,!1,!1)});var T=/[\-:]([a-z])/g;function R(n){return n[1].toUpperCase()}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach(function(n){var i=n.replace(T,R);w[i]=new x(i,1,!1,n,null,!1,!1)}),"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach(function(n){var i=n.replace(T,R);w[i]=new x(i,1,!1,n,"http://www.w3.org/1999/xlink",!1,!1)}),["xml:base","xml:lang","xml:space"].forEach(function(n){var i=n.replace(T,R);w[i]=new x(i,1,!1,n,"http://www.w3.org/XML/1998/namespace",!1,!1)}),["tabIndex","crossOrigin"].forEach(function(n){w[n]=new x(n,1,!1,n.toLowerCase(),null,!1,!1)}),w.xlinkHref=new x("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1),["src","href","action","formAction"].forEach(function(n){w[n]=new x(n,1,!1,n.toLowerCase(),null,!0,!0)});function P(n,i,l,d){var m=w.hasOwnProperty(i)?w[i]:null;(m!==null?m.type!==0:d||!(2<i.length)||i[0]!=="o"&&i[0]!=="O"||i[1]!=="n"&&i[1]!=="N")&&(v(i,l,m,d)&&(l=null),d||m===null?b(i)&&(l===null?n.removeAttribute(i):n.setAttribute(i,""+l)):m.mustUseProperty?n[m.propertyName]=l===null?m.type===3?!1:"":l:(i=m.attributeName,d=m.attributeNamespace,l===null?n.removeAttribute(i):(m=m.type,l=m===3||m===4&&l===!0?"":""+l,d?n.setAttributeNS(d,i,l):n.setAttribute(i,l))))}var M=e.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,D=Symbol.for("react.element"),$=Symbol.for("react.portal"),O=Symbol.for("react.fragment"),N=Symbol.for("react.strict_mode"),U=Symbol.for("react.profiler"),C=Symbol.for("react.provider"),A=Symbol.for("react.context"),H=Symbol.for("react.forward_ref"),W=Symbol.for("react.suspense"),V=Symbol.for("react.suspense_list"),F=Symbol.for("react.memo"),B=Symbol.for("react.lazy"),Y=Symbol.for("react.offscreen"),j=Symbol.iterator;function _(n){return n===null||typeof n!="object"?null:(n=j&&n[j]||n["@@iterator"],typeof n=="function"?n:null)}var q=Object.assign,L;function Q(n){if(L===void 0)try{throw Error()}catch(l){var i=l.stack.trim().match(/\n( *(at )?)/);L=i&&i[1]||""}return`
-`+L+n}var te=!1;function ae(n,i){if(!n||te)return"";te=!0;var l=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(i)if(i=function(){throw Error()},Object.defineProperty(i.prototype,"props",{set:function(){throw Error()}}),typeof Reflect=="object"&&Reflect.construct){try{Reflect.construct(i,[])}catch(ce){var d=ce}Reflect.construct(n,[],i)}else{try{i.call()}catch(ce){d=ce}n.call(i.prototype)}else{try{throw Error()}catch(ce){d=ce}n()}}catch(ce){if(ce&&d&&typeof ce.stack=="string"){for(var m=ce.stack.split(`
-`),y=d.stack.split(`
-`),E=m.length-1,z=y.length-1;1<=E&&0<=z&&m[E]!==y[z];)z--;for(;1<=E&&0<=z;E--,z--)if(m[E]!==y[z]){if(E!==1||z!==1)do if(E--,z--,0>z||m[E]!==y[z]){var G=`
-`+m[E].replace(" at new "," at ");return n.displayName&&G.includes("<anonymous>")&&(G=G.replace("<anonymous>",n.displayName)),G}while(1<=E&&0<=z);break}}}finally{te=!1,Error.prepareStackTrace=l}return(n=n?n.displayName||n.name:"")?Q(n):""}function Z(n){switch(n.tag){case 5:return Q(n.type);case 16:return Q("Lazy");case 13:return Q("Suspense");case 19:return Q("SuspenseList");case 0:case 2:case 15:return n=ae(n.type,!1),n;case 11:return n=ae(n.type.render,!1),n;case 1:return n=ae(n.type,!0),n;default:return""}}function le(n){if(n==null)return null;if(typeof n=="function")return n.displayName||n.name||null;if(typeof n=="string")return n;switch(n){case O:return"Fragment";case $:return"Portal";case U:return"Profiler";case N:return"StrictMode";case W:return"Suspense";case V:return"SuspenseList"}if(typeof n=="object")switch(n.$$typeof){case A:return(n.displayName||"Context")+".Consumer";case C:return(n._context.displayName||"Context")+".Provider";case H:var i=n.render;return n=n.displayName,n||(n=i.displayName||i.name||"",n=n!==""?"ForwardRef("+n+")":"ForwardRef"),n;case F:return i=n.displayName||null,i!==null?i:le(n.type)||"Memo";case B:i=n._payload,n=n._init;try{return le(n(i))}catch{}}return null}function ue(n){var i=n.type;switch(n.tag){case 24:return"Cache";case 9:return(i.displayName||"Context")+".Consumer";case 10:return(i._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return n=i.render,n=n.displayName||n.name||"",i.displayName||(n!==""?"ForwardRef("+n+")":"ForwardRef");case 7:return"Fragment";case 5:return i;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return le(i);case 8:return i===N?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if(typeof i=="function")return i.displayName||i.name||null;if(typeof i=="string")return i}return null}function J(n){switch(typeof n){case"boolean":case"number":case"string":case"undefined":return n;case"object":return n;default:return""}}function ne(n){var i=n.type;return(n=n.nodeName)&&n.toLowerCase()==="input"&&(i==="checkbox"||i==="radio")}function fe(n){var i=ne(n)?"checked":"value",l=Object.getOwnPropertyDescriptor(n.constructor.prototype,i),d=""+n[i];if(!n.hasOwnProperty(i)&&typeof l<"u"&&typeof l.get=="function"&&typeof l.set=="function"){var m=l.get,y=l.set;return Object.defineProperty(n,i,{configurable:!0,get:function(){return m.call(this)},set:function(E){d=""+E,y.call(this,E)}}),Object.defineProperty(n,i,{enumerable:l.enumerable}),{getValue:function(){return d},setValue:function(E){d=""+E},stopTracking:function(){n._valueTracker=null,delete n[i]}}}}function be(n){n._valueTracker||(n._valueTracker=fe(n))}function ve(n){if(!n)return!1;var i=n._valueTracker;if(!i)return!0;var l=i.getValue(),d="";return n&&(d=ne(n)?n.checked?"true":"false":n.value),n=d,n!==l?(i.setValue(n),!0):!1}function ee(n){if(n=n||(typeof document<"u"?document:void 0),typeof n>"u")return null;try{return n.activeElement||n.body}catch{return n.body}}function me(n,i){var l=i.checked;return q({},i,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:l??n._wrapperState.initialChecked})}function xe(n,i){var l=i.defaultValue==null?"":i.defaultValue,d=i.checked!=null?i.checked:i.defaultChecked;l=J(i.value!=null?i.value:l),n._wrapperState={initialChecked:d,initialValue:l,controlled:i.type==="checkbox"||i.type==="radio"?i.checked!=null:i.value!=null}}function he(n,i){i=i.checked,i!=null&&P(n,"checked",i,!1)}function de(n,i){he(n,i);var l=J(i.value),d=i.type;if(l!=null)d==="number"?(l===0&&n.value===""||n.value!=l)&&(n.value=""+l):n.value!==""+l&&(n.value=""+l);else if(d==="submit"||d==="reset"){n.removeAttribute("value");return}i.hasOwnProperty("value")?we(n,i.type,l):i.hasOwnProperty("defaultValue")&&we(n,i.type,J(i.defaultValue)),i.checked==null&&i.defaultChecked!=null&&(n.defaultChecked=!!i.defaultChecked)}function ge(n,i,l){if(i.hasOwnProperty("value")||i.hasOwnProperty("defaultValue")){var d=i.type;if(!(d!=="submit"&&d!=="reset"||i.value!==void 0&&i.value!==null))return;i=""+n._wrapperState.initialValue,l||i===n.value||(n.value=i),n.defaultValue=i}l=n.name,l!==""&&(n.name=""),n.defaultChecked=!!n._wrapperState.initialChecked,l!==""&&(n.name=l)}function we(n,i,l){(i!=="number"||ee(n.ownerDocument)!==n)&&(l==null?n.defaultValue=""+n._wrapperState.initialValue:n.defaultValue!==""+l&&(n.defaultValue=""+l))}var Ce=Array.isArray;function Ie(n,i,l,d){if(n=n.options,i){i={};for(var m=0;m<l.length;m++)i["$"+l[m]]=!0;for(l=0;l<n.length;l++)m=i.hasOwnProperty("$"+n[l].value),n[l].selected!==m&&(n[l].selected=m),m&&d&&(n[l].defaultSelected=!0)}else{for(l=""+J(l),i=null,m=0;m<n.length;m++){if(n[m].value===l){n[m].selected=!0,d&&(n[m].defaultSelected=!0);return}i!==null||n[m].disabled||(i=n[m])}i!==null&&(i.selected=!0)}}function Oe(n,i){if(i.dangerouslySetInnerHTML!=null)throw Error(r(91));return q({},i,{value:void 0,defaultValue:void 0,children:""+n._wrapperState.initialValue})}function mt(n,i){var l=i.value;if(l==null){if(l=i.children,i=i.defaultValue,l!=null){if(i!=null)throw Error(r(92));if(Ce(l)){if(1<l.length)throw Error(r(93));l=l[0]}i=l}i==null&&(i=""),l=i}n._wrapperState={initialValue:J(l)}}function lt(n,i){var l=J(i.value),d=J(i.defaultValue);l!=null&&(l=""+l,l!==n.value&&(n.value=l),i.defaultValue==null&&n.defaultValue!==l&&(n.defaultValue=l)),d!=null&&(n.defaultValue=""+d)}function tt(n){var i=n.textContent;i===n._wrapperState.initialValue&&i!==""&&i!==null&&(n.value=i)}function ht(n){switch(n){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function Tt(n,i){return n==null||n==="http://www.w3.org/1999/xhtml"?ht(i):n==="http://www.w3.org/2000/svg"&&i==="foreignObject"?"http://www.w3.org/1999/xhtml":n}var Rt,Xt=function(n){return typeof MSApp<"u"&&MSApp.execUnsafeLocalFunction?function(i,l,d,m){MSApp.execUnsafeLocalFunction(function(){return n(i,l,d,m)})}:n}(function(n,i){if(n.namespaceURI!=="http://www.w3.org/2000/svg"||"innerHTML"in n)n.innerHTML=i;else{for(Rt=Rt||document.createElement("div"),Rt.innerHTML="<svg>"+i.valueOf().toString()+"</svg>",i=Rt.firstChild;n.firstChild;)n.removeChild(n.firstChild);for(;i.firstChild;)n.appendChild(i.firstChild)}});function Wt(n,i){if(i){var l=n.firstChild;if(l&&l===n.lastChild&&l.nodeType===3){l.nodeValue=i;return}}n.textContent=i}var Xe={animationIterationCount:!0,aspectRatio:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},On=["Webkit","ms","Moz","O"];Object.keys(Xe).forEach(function(n){On.forEach(function(i){i=i+n.charAt(0).toUpperCase()+n.substring(1),Xe[i]=Xe[n]})});function un(n,i,l){return i==null||typeof i=="boolean"||i===""?"":l||typeof i!="number"||i===0||Xe.hasOwnProperty(n)&&Xe[n]?(""+i).trim():i+"px"}function $n(n,i){n=n.style;for(var l in i)if(i.hasOwnProperty(l)){var d=l.indexOf("--")===0,m=un(l,i[l],d);l==="float"&&(l="cssFloat"),d?n.setProperty(l,m):n[l]=m}}var Se=q({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function De(n,i){if(i){if(Se[n]&&(i.children!=null||i.dangerouslySetInnerHTML!=null))throw Error(r(137,n));if(i.dangerouslySetInnerHTML!=null){if(i.children!=null)throw Error(r(60));if(typeof i.dangerouslySetInnerHTML!="object"||!("__html"in i.dangerouslySetInnerHTML))throw Error(r(61))}if(i.style!=null&&typeof i.style!="object")throw Error(r(62))}}function _e(n,i){if(n.indexOf("-")===-1)return typeof i.is=="string";switch(n){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var qe=null;function Ue(n){return n=n.target||n.srcElement||window,n.correspondingUseElement&&(n=n.correspondingUseElement),n.nodeType===3?n.parentNode:n}var bt=null,Bt=null,Ot=null;function Xi(n){if(n=bs(n)){if(typeof bt!="function")throw Error(r(280));var i=n.stateNode;i&&(i=rl(i),bt(n.stateNode,n.type,i))}}function Qo(n){Bt?Ot?Ot.push(n):Ot=[n]:Bt=n}function Yp(){if(Bt){var n=Bt,i=Ot;if(Ot=Bt=null,Xi(n),i)for(n=0;n<i.length;n++)Xi(i[n])}}function Kp(n,i){return n(i)}function qp(){}var hu=!1;function Gp(n,i,l){if(hu)return n(i,l);hu=!0;try{return Kp(n,i,l)}finally{hu=!1,(Bt!==null||Ot!==null)&&(qp(),Yp())}}function Zi(n,i){var l=n.stateNode;if(l===null)return null;var d=rl(l);if(d===null)return null;l=d[i];e:switch(i){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(d=!d.disabled)||(n=n.type,d=!(n==="button"||n==="input"||n==="select"||n==="textarea")),n=!d;break e;default:n=!1}if(n)return null;if(l&&typeof l!="function")throw Error(r(231,i,typeof l));return l}var gu=!1;if(u)try{var Ji={};Object.defineProperty(Ji,"passive",{get:function(){gu=!0}}),window.addEventListener("test",Ji,Ji),window.removeEventListener("test",Ji,Ji)}catch{gu=!1}function Rx(n,i,l,d,m,y,E,z,G){var ce=Array.prototype.slice.call(arguments,3);try{i.apply(l,ce)}catch(Te){this.onError(Te)}}var es=!1,Na=null,La=!1,yu=null,Dx={onError:function(n){es=!0,Na=n}};function Ex(n,i,l,d,m,y,E,z,G){es=!1,Na=null,Rx.apply(Dx,arguments)}function Ix(n,i,l,d,m,y,E,z,G){if(Ex.apply(this,arguments),es){if(es){var ce=Na;es=!1,Na=null}else throw Error(r(198));La||(La=!0,yu=ce)}}function vo(n){var i=n,l=n;if(n.alternate)for(;i.return;)i=i.return;else{n=i;do i=n,i.flags&4098&&(l=i.return),n=i.return;while(n)}return i.tag===3?l:null}function Qp(n){if(n.tag===13){var i=n.memoizedState;if(i===null&&(n=n.alternate,n!==null&&(i=n.memoizedState)),i!==null)return i.dehydrated}return null}function Xp(n){if(vo(n)!==n)throw Error(r(188))}function Ox(n){var i=n.alternate;if(!i){if(i=vo(n),i===null)throw Error(r(188));return i!==n?null:n}for(var l=n,d=i;;){var m=l.return;if(m===null)break;var y=m.alternate;if(y===null){if(d=m.return,d!==null){l=d;continue}break}if(m.child===y.child){for(y=m.child;y;){if(y===l)return Xp(m),n;if(y===d)return Xp(m),i;y=y.sibling}throw Error(r(188))}if(l.return!==d.return)l=m,d=y;else{for(var E=!1,z=m.child;z;){if(z===l){E=!0,l=m,d=y;break}if(z===d){E=!0,d=m,l=y;break}z=z.sibling}if(!E){for(z=y.child;z;){if(z===l){E=!0,l=y,d=m;break}if(z===d){E=!0,d=y,l=m;break}z=z.sibling}if(!E)throw Error(r(189))}}if(l.alternate!==d)throw Error(r(190))}if(l.tag!==3)throw Error(r(188));return l.stateNode.current===l?n:i}function Zp(n){return n=Ox(n),n!==null?Jp(n):null}function Jp(n){if(n.tag===5||n.tag===6)return n;for(n=n.child;n!==null;){var i=Jp(n);if(i!==null)return i;n=n.sibling}return null}var em=t.unstable_scheduleCallback,tm=t.unstable_cancelCallback,$x=t.unstable_shouldYield,Ax=t.unstable_requestPaint,$t=t.unstable_now,Nx=t.unstable_getCurrentPriorityLevel,vu=t.unstable_ImmediatePriority,nm=t.unstable_UserBlockingPriority,Fa=t.unstable_NormalPriority,Lx=t.unstable_LowPriority,rm=t.unstable_IdlePriority,Ba=null,hr=null;function Fx(n){if(hr&&typeof hr.onCommitFiberRoot=="function")try{hr.onCommitFiberRoot(Ba,n,void 0,(n.current.flags&128)===128)}catch{}}var Jn=Math.clz32?Math.clz32:jx,Bx=Math.log,Vx=Math.LN2;function jx(n){return n>>>=0,n===0?32:31-(Bx(n)/Vx|0)|0}var Va=64,ja=4194304;function ts(n){switch(n&-n){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return n&4194240;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return n&130023424;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return n}}function za(n,i){var l=n.pendingLanes;if(l===0)return 0;var d=0,m=n.suspendedLanes,y=n.pingedLanes,E=l&268435455;if(E!==0){var z=E&~m;z!==0?d=ts(z):(y&=E,y!==0&&(d=ts(y)))}else E=l&~m,E!==0?d=ts(E):y!==0&&(d=ts(y));if(d===0)return 0;if(i!==0&&i!==d&&!(i&m)&&(m=d&-d,y=i&-i,m>=y||m===16&&(y&4194240)!==0))return i;if(d&4&&(d|=l&16),i=n.entangledLanes,i!==0)for(n=n.entanglements,i&=d;0<i;)l=31-Jn(i),m=1<<l,d|=n[l],i&=~m;return d}function zx(n,i){switch(n){case 1:case 2:case 4:return i+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return i+5e3;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return-1;case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function _x(n,i){for(var l=n.suspendedLanes,d=n.pingedLanes,m=n.expirationTimes,y=n.pendingLanes;0<y;){var E=31-Jn(y),z=1<<E,G=m[E];G===-1?(!(z&l)||z&d)&&(m[E]=zx(z,i)):G<=i&&(n.expiredLanes|=z),y&=~z}}function bu(n){return n=n.pendingLanes&-1073741825,n!==0?n:n&1073741824?1073741824:0}function om(){var n=Va;return Va<<=1,!(Va&4194240)&&(Va=64),n}function xu(n){for(var i=[],l=0;31>l;l++)i.push(n);return i}function ns(n,i,l){n.pendingLanes|=i,i!==536870912&&(n.suspendedLanes=0,n.pingedLanes=0),n=n.eventTimes,i=31-Jn(i),n[i]=l}function Wx(n,i){var l=n.pendingLanes&~i;n.pendingLanes=i,n.suspendedLanes=0,n.pingedLanes=0,n.expiredLanes&=i,n.mutableReadLanes&=i,n.entangledLanes&=i,i=n.entanglements;var d=n.eventTimes;for(n=n.expirationTimes;0<l;){var m=31-Jn(l),y=1<<m;i[m]=0,d[m]=-1,n[m]=-1,l&=~y}}function wu(n,i){var l=n.entangledLanes|=i;for(n=n.entanglements;l;){var d=31-Jn(l),m=1<<d;m&i|n[d]&i&&(n[d]|=i),l&=~m}}var pt=0;function im(n){return n&=-n,1<n?4<n?n&268435455?16:536870912:4:1}var sm,Su,am,lm,cm,Cu=!1,_a=[],Kr=null,qr=null,Gr=null,rs=new Map,os=new Map,Qr=[],Ux="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function um(n,i){switch(n){case"focusin":case"focusout":Kr=null;break;case"dragenter":case"dragleave":qr=null;break;case"mouseover":case"mouseout":Gr=null;break;case"pointerover":case"pointerout":rs.delete(i.pointerId);break;case"gotpointercapture":case"lostpointercapture":os.delete(i.pointerId)}}function is(n,i,l,d,m,y){return n===null||n.nativeEvent!==y?(n={blockedOn:i,domEventName:l,eventSystemFlags:d,nativeEvent:y,targetContainers:[m]},i!==null&&(i=bs(i),i!==null&&Su(i)),n):(n.eventSystemFlags|=d,i=n.targetContainers,m!==null&&i.indexOf(m)===-1&&i.push(m),n)}function Hx(n,i,l,d,m){switch(i){case"focusin":return Kr=is(Kr,n,i,l,d,m),!0;case"dragenter":return qr=is(qr,n,i,l,d,m),!0;case"mouseover":return Gr=is(Gr,n,i,l,d,m),!0;case"pointerover":var y=m.pointerId;return rs.set(y,is(rs.get(y)||null,n,i,l,d,m)),!0;case"gotpointercapture":return y=m.pointerId,os.set(y,is(os.get(y)||null,n,i,l,d,m)),!0}return!1}function dm(n){var i=bo(n.target);if(i!==null){var l=vo(i);if(l!==null){if(i=l.tag,i===13){if(i=Qp(l),i!==null){n.blockedOn=i,cm(n.priority,function(){am(l)});return}}else if(i===3&&l.stateNode.current.memoizedState.isDehydrated){n.blockedOn=l.tag===3?l.stateNode.containerInfo:null;return}}}n.blockedOn=null}function Wa(n){if(n.blockedOn!==null)return!1;for(var i=n.targetContainers;0<i.length;){var l=Tu(n.domEventName,n.eventSystemFlags,i[0],n.nativeEvent);if(l===null){l=n.nativeEvent;var d=new l.constructor(l.type,l);qe=d,l.target.dispatchEvent(d),qe=null}else return i=bs(l),i!==null&&Su(i),n.blockedOn=l,!1;i.shift()}return!0}function fm(n,i,l){Wa(n)&&l.delete(i)}function Yx(){Cu=!1,Kr!==null&&Wa(Kr)&&(Kr=null),qr!==null&&Wa(qr)&&(qr=null),Gr!==null&&Wa(Gr)&&(Gr=null),rs.forEach(fm),os.forEach(fm)}function ss(n,i){n.blockedOn===i&&(n.blockedOn=null,Cu||(Cu=!0,t.unstable_scheduleCallback(t.unstable_NormalPriority,Yx)))}function as(n){function i(m){return ss(m,n)}if(0<_a.length){ss(_a[0],n);for(var l=1;l<_a.length;l++){var d=_a[l];d.blockedOn===n&&(d.blockedOn=null)}}for(Kr!==null&&ss(Kr,n),qr!==null&&ss(qr,n),Gr!==null&&ss(Gr,n),rs.forEach(i),os.forEach(i),l=0;l<Qr.length;l++)d=Qr[l],d.blockedOn===n&&(d.blockedOn=null);for(;0<Qr.length&&(l=Qr[0],l.blockedOn===null);)dm(l),l.blockedOn===null&&Qr.shift()}var Xo=M.ReactCurrentBatchConfig,Ua=!0;function Kx(n,i,l,d){var m=pt,y=Xo.transition;Xo.transition=null;try{pt=1,ku(n,i,l,d)}finally{pt=m,Xo.transition=y}}function qx(n,i,l,d){var m=pt,y=Xo.transition;Xo.transition=null;try{pt=4,ku(n,i,l,d)}finally{pt=m,Xo.transition=y}}function ku(n,i,l,d){if(Ua){var m=Tu(n,i,l,d);if(m===null)_u(n,i,d,Ha,l),um(n,d);else if(Hx(m,n,i,l,d))d.stopPropagation();else if(um(n,d),i&4&&-1<Ux.indexOf(n)){for(;m!==null;){var y=bs(m);if(y!==null&&sm(y),y=Tu(n,i,l,d),y===null&&_u(n,i,d,Ha,l),y===m)break;m=y}m!==null&&d.stopPropagation()}else _u(n,i,d,null,l)}}var Ha=null;function Tu(n,i,l,d){if(Ha=null,n=Ue(d),n=bo(n),n!==null)if(i=vo(n),i===null)n=null;else if(l=i.tag,l===13){if(n=Qp(i),n!==null)return n;n=null}else if(l===3){if(i.stateNode.current.memoizedState.isDehydrated)return i.tag===3?i.stateNode.containerInfo:null;n=null}else i!==n&&(n=null);return Ha=n,null}function pm(n){switch(n){case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 1;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"toggle":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 4;case"message":switch(Nx()){case vu:return 1;case nm:return 4;case Fa:case Lx:return 16;case rm:return 536870912;default:return 16}default:return 16}}var Xr=null,Pu=null,Ya=null;function mm(){if(Ya)return Ya;var n,i=Pu,l=i.length,d,m="value"in Xr?Xr.value:Xr.textContent,y=m.length;for(n=0;n<l&&i[n]===m[n];n++);var E=l-n;for(d=1;d<=E&&i[l-d]===m[y-d];d++);return Ya=m.slice(n,1<d?1-d:void 0)}function Ka(n){var i=n.keyCode;return"charCode"in n?(n=n.charCode,n===0&&i===13&&(n=13)):n=i,n===10&&(n=13),32<=n||n===13?n:0}function qa(){return!0}function hm(){return!1}function Cn(n){function i(l,d,m,y,E){this._reactName=l,this._targetInst=m,this.type=d,this.nativeEvent=y,this.target=E,this.currentTarget=null;for(var z in n)n.hasOwnProperty(z)&&(l=n[z],this[z]=l?l(y):y[z]);return this.isDefaultPrevented=(y.defaultPrevented!=null?y.defaultPrevented:y.returnValue===!1)?qa:hm,this.isPropagationStopped=hm,this}return q(i.prototype,{preventDefault:function(){this.defaultPrevented=!0;var l=this.nativeEvent;l&&(l.preventDefault?l.preventDefault():typeof l.returnValue!="unknown"&&(l.returnValue=!1),this.isDefaultPrevented=qa)},stopPropagation:function(){var l=this.nativeEvent;l&&(l.stopPropagation?l.stopPropagation():typeof l.cancelBubble!="unknown"&&(l.cancelBubble=!0),this.isPropagationStopped=qa)},persist:function(){},isPersistent:qa}),i}var Zo={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(n){return n.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},Mu=Cn(Zo),ls=q({},Zo,{view:0,detail:0}),Gx=Cn(ls),Ru,Du,cs,Ga=q({},ls,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:Iu,button:0,buttons:0,relatedTarget:function(n){return n.relatedTarget===void 0?n.fromElement===n.srcElement?n.toElement:n.fromElement:n.relatedTarget},movementX:function(n){return"movementX"in n?n.movementX:(n!==cs&&(cs&&n.type==="mousemove"?(Ru=n.screenX-cs.screenX,Du=n.screenY-cs.screenY):Du=Ru=0,cs=n),Ru)},movementY:function(n){return"movementY"in n?n.movementY:Du}}),gm=Cn(Ga),Qx=q({},Ga,{dataTransfer:0}),Xx=Cn(Qx),Zx=q({},ls,{relatedTarget:0}),Eu=Cn(Zx),Jx=q({},Zo,{animationName:0,elapsedTime:0,pseudoElement:0}),ew=Cn(Jx),tw=q({},Zo,{clipboardData:function(n){return"clipboardData"in n?n.clipboardData:window.clipboardData}}),nw=Cn(tw),rw=q({},Zo,{data:0}),ym=Cn(rw),ow={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},iw={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},sw={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function aw(n){var i=this.nativeEvent;return i.getModifierState?i.getModifierState(n):(n=sw[n])?!!i[n]:!1}function Iu(){return aw}var lw=q({},ls,{key:function(n){if(n.key){var i=ow[n.key]||n.key;if(i!=="Unidentified")return i}return n.type==="keypress"?(n=Ka(n),n===13?"Enter":String.fromCharCode(n)):n.type==="keydown"||n.type==="keyup"?iw[n.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:Iu,charCode:function(n){return n.type==="keypress"?Ka(n):0},keyCode:function(n){return n.type==="keydown"||n.type==="keyup"?n.keyCode:0},which:function(n){return n.type==="keypress"?Ka(n):n.type==="keydown"||n.type==="keyup"?n.keyCode:0}}),cw=Cn(lw),uw=q({},Ga,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),vm=Cn(uw),dw=q({},ls,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:Iu}),fw=Cn(dw),pw=q({},Zo,{propertyName:0,elapsedTime:0,pseudoElement:0}),mw=Cn(pw),hw=q({},Ga,{deltaX:function(n){return"deltaX"in n?n.deltaX:"wheelDeltaX"in n?-n.wheelDeltaX:0},deltaY:function(n){return"deltaY"in n?n.deltaY:"wheelDeltaY"in n?-n.wheelDeltaY:"wheelDelta"in n?-n.wheelDelta:0},deltaZ:0,deltaMode:0}),gw=Cn(hw),yw=[9,13,27,32],Ou=u&&"CompositionEvent"in window,us=null;u&&"documentMode"in document&&(us=document.documentMode);var vw=u&&"TextEvent"in window&&!us,bm=u&&(!Ou||us&&8<us&&11>=us),xm=" ",wm=!1;function Sm(n,i){switch(n){case"keyup":return yw.indexOf(i.keyCode)!==-1;case"keydown":return i.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Cm(n){return n=n.detail,typeof n=="object"&&"data"in n?n.data:null}var Jo=!1;function bw(n,i){switch(n){case"compositionend":return Cm(i);case"keypress":return i.which!==32?null:(wm=!0,xm);case"textInput":return n=i.data,n===xm&&wm?null:n;default:return null}}function xw(n,i){if(Jo)return n==="compositionend"||!Ou&&Sm(n,i)?(n=mm(),Ya=Pu=Xr=null,Jo=!1,n):null;switch(n){case"paste":return null;case"keypress":if(!(i.ctrlKey||i.altKey||i.metaKey)||i.ctrlKey&&i.altKey){if(i.char&&1<i.char.length)return i.char;if(i.which)return String.fromCharCode(i.which)}return null;case"compositionend":return bm&&i.locale!=="ko"?null:i.data;default:return null}}var ww={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function km(n){var i=n&&n.nodeName&&n.nodeName.toLowerCase();return i==="input"?!!ww[n.type]:i==="textarea"}function Tm(n,i,l,d){Qo(d),i=el(i,"onChange"),0<i.length&&(l=new Mu("onChange","change",null,l,d),n.push({event:l,listeners:i}))}var ds=null,fs=null;function Sw(n){Wm(n,0)}function Qa(n){var i=oi(n);if(ve(i))return n}function Cw(n,i){if(n==="change")return i}var Pm=!1;if(u){var $u;if(u){var Au="oninput"in document;if(!Au){var Mm=document.createElement("div");Mm.setAttribute("oninput","return;"),Au=typeof Mm.oninput=="function"}$u=Au}else $u=!1;Pm=$u&&(!document.documentMode||9<document.documentMode)}function Rm(){ds&&(ds.detachEvent("onpropertychange",Dm),fs=ds=null)}function Dm(n){if(n.propertyName==="value"&&Qa(fs)){var i=[];Tm(i,fs,n,Ue(n)),Gp(Sw,i)}}function kw(n,i,l){n==="focusin"?(Rm(),ds=i,fs=l,ds.attachEvent("onpropertychange",Dm)):n==="focusout"&&Rm()}function Tw(n){if(n==="selectionchange"||n==="keyup"||n==="keydown")return Qa(fs)}function Pw(n,i){if(n==="click")return Qa(i)}function Mw(n,i){if(n==="input"||n==="change")return Qa(i)}function Rw(n,i){return n===i&&(n!==0||1/n===1/i)||n!==n&&i!==i}var er=typeof Object.is=="function"?Object.is:Rw;function ps(n,i){if(er(n,i))return!0;if(typeof n!="object"||n===null||typeof i!="object"||i===null)return!1;var l=Object.keys(n),d=Object.keys(i);if(l.length!==d.length)return!1;for(d=0;d<l.length;d++){var m=l[d];if(!f.call(i,m)||!er(n[m],i[m]))return!1}return!0}function Em(n){for(;n&&n.firstChild;)n=n.firstChild;return n}function Im(n,i){var l=Em(n);n=0;for(var d;l;){if(l.nodeType===3){if(d=n+l.textContent.length,n<=i&&d>=i)return{node:l,offset:i-n};n=d}e:{for(;l;){if(l.nextSibling){l=l.nextSibling;break e}l=l.parentNode}l=void 0}l=Em(l)}}function Om(n,i){return n&&i?n===i?!0:n&&n.nodeType===3?!1:i&&i.nodeType===3?Om(n,i.parentNode):"contains"in n?n.contains(i):n.compareDocumentPosition?!!(n.compareDocumentPosition(i)&16):!1:!1}function $m(){for(var n=window,i=ee();i instanceof n.HTMLIFrameElement;){try{var l=typeof i.contentWindow.location.href=="string"}catch{l=!1}if(l)n=i.contentWindow;else break;i=ee(n.document)}return i}function Nu(n){var i=n&&n.nodeName&&n.nodeName.toLowerCase();return i&&(i==="input"&&(n.type==="text"||n.type==="search"||n.type==="tel"||n.type==="url"||n.type==="password")||i==="textarea"||n.contentEditable==="true")}function Dw(n){var i=$m(),l=n.focusedElem,d=n.selectionRange;if(i!==l&&l&&l.ownerDocument&&Om(l.ownerDocument.documentElement,l)){if(d!==null&&Nu(l)){if(i=d.start,n=d.end,n===void 0&&(n=i),"selectionStart"in l)l.selectionStart=i,l.selectionEnd=Math.min(n,l.value.length);else if(n=(i=l.ownerDocument||document)&&i.defaultView||window,n.getSelection){n=n.getSelection();var m=l.textContent.length,y=Math.min(d.start,m);d=d.end===void 0?y:Math.min(d.end,m),!n.extend&&y>d&&(m=d,d=y,y=m),m=Im(l,y);var E=Im(l,d);m&&E&&(n.rangeCount!==1||n.anchorNode!==m.node||n.anchorOffset!==m.offset||n.focusNode!==E.node||n.focusOffset!==E.offset)&&(i=i.createRange(),i.setStart(m.node,m.offset),n.removeAllRanges(),y>d?(n.addRange(i),n.extend(E.node,E.offset)):(i.setEnd(E.node,E.offset),n.addRange(i)))}}for(i=[],n=l;n=n.parentNode;)n.nodeType===1&&i.push({element:n,left:n.scrollLeft,top:n.scrollTop});for(typeof l.focus=="function"&&l.focus(),l=0;l<i.length;l++)n=i[l],n.element.scrollLeft=n.left,n.element.scrollTop=n.top}}var Ew=u&&"documentMode"in document&&11>=document.documentMode,ei=null,Lu=null,ms=null,Fu=!1;function Am(n,i,l){var d=l.window===l?l.document:l.nodeType===9?l:l.ownerDocument;Fu||ei==null||ei!==ee(d)||(d=ei,"selectionStart"in d&&Nu(d)?d={start:d.selectionStart,end:d.selectionEnd}:(d=(d.ownerDocument&&d.ownerDocument.defaultView||window).getSelection(),d={anchorNode:d.anchorNode,anchorOffset:d.anchorOffset,focusNode:d.focusNode,focusOffset:d.focusOffset}),ms&&ps(ms,d)||(ms=d,d=el(Lu,"onSelect"),0<d.length&&(i=new Mu("onSelect","select",null,i,l),n.push({event:i,listeners:d}),i.target=ei)))}function Xa(n,i){var l={};return l[n.toLowerCase()]=i.toLowerCase(),l["Webkit"+n]="webkit"+i,l["Moz"+n]="moz"+i,l}var ti={animationend:Xa("Animation","AnimationEnd"),animationiteration:Xa("Animation","AnimationIteration"),animationstart:Xa("Animation","AnimationStart"),transitionend:Xa("Transition","TransitionEnd")},Bu={},Nm={};u&&(Nm=document.createElement("div").style,"AnimationEvent"in window||(delete ti.animationend.animation,delete ti.animationiteration.animation,delete ti.animationstart.animation),"TransitionEvent"in window||delete ti.transitionend.transition);function Za(n){if(Bu[n])return Bu[n];if(!ti[n])return n;var i=ti[n],l;for(l in i)if(i.hasOwnProperty(l)&&l in Nm)return Bu[n]=i[l];return n}var Lm=Za("animationend"),Fm=Za("animationiteration"),Bm=Za("animationstart"),Vm=Za("transitionend"),jm=new Map,zm="abort auxClick cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function Zr(n,i){jm.set(n,i),a(i,[n])}for(var Vu=0;Vu<zm.length;Vu++){var ju=zm[Vu],Iw=ju.toLowerCase(),Ow=ju[0].toUpperCase()+ju.slice(1);Zr(Iw,"on"+Ow)}Zr(Lm,"onAnimationEnd"),Zr(Fm,"onAnimationIteration"),Zr(Bm,"onAnimationStart"),Zr("dblclick","onDoubleClick"),Zr("focusin","onFocus"),Zr("focusout","onBlur"),Zr(Vm,"onTransitionEnd"),c("onMouseEnter",["mouseout","mouseover"]),c("onMouseLeave",["mouseout","mouseover"]),c("onPointerEnter",["pointerout","pointerover"]),c("onPointerLeave",["pointerout","pointerover"]),a("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),a("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),a("onBeforeInput",["compositionend","keypress","textInput","paste"]),a("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),a("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),a("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var hs="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),$w=new Set("cancel close invalid load scroll toggle".split(" ").concat(hs));function _m(n,i,l){var d=n.type||"unknown-event";n.currentTarget=l,Ix(d,i,void 0,n),n.currentTarget=null}function Wm(n,i){i=(i&4)!==0;for(var l=0;l<n.length;l++){var d=n[l],m=d.event;d=d.listeners;e:{var y=void 0;if(i)for(var E=d.length-1;0<=E;E--){var z=d[E],G=z.instance,ce=z.currentTarget;if(z=z.listener,G!==y&&m.isPropagationStopped())break e;_m(m,z,ce),y=G}else for(E=0;E<d.length;E++){if(z=d[E],G=z.instance,ce=z.currentTarget,z=z.listener,G!==y&&m.isPropagationStopped())break e;_m(m,z,ce),y=G}}}if(La)throw n=yu,La=!1,yu=null,n}function xt(n,i){var l=i[qu];l===void 0&&(l=i[qu]=new Set);var d=n+"__bubble";l.has(d)||(Um(i,n,2,!1),l.add(d))}function zu(n,i,l){var d=0;i&&(d|=4),Um(l,n,d,i)}var Ja="_reactListening"+Math.random().toString(36).slice(2);function gs(n){if(!n[Ja]){n[Ja]=!0,o.forEach(function(l){l!=="selectionchange"&&($w.has(l)||zu(l,!1,n),zu(l,!0,n))});var i=n.nodeType===9?n:n.ownerDocument;i===null||i[Ja]||(i[Ja]=!0,zu("selectionchange",!1,i))}}function Um(n,i,l,d){switch(pm(i)){case 1:var m=Kx;break;case 4:m=qx;break;default:m=ku}l=m.bind(null,i,l,n),m=void 0,!gu||i!=="touchstart"&&i!=="touchmove"&&i!=="wheel"||(m=!0),d?m!==void 0?n.addEventListener(i,l,{capture:!0,passive:m}):n.addEventListener(i,l,!0):m!==void 0?n.addEventListener(i,l,{passive:m}):n.addEventListener(i,l,!1)}function _u(n,i,l,d,m){var y=d;if(!(i&1)&&!(i&2)&&d!==null)e:for(;;){if(d===null)return;var E=d.tag;if(E===3||E===4){var z=d.stateNode.containerInfo;if(z===m||z.nodeType===8&&z.parentNode===m)break;if(E===4)for(E=d.return;E!==null;){var G=E.tag;if((G===3||G===4)&&(G=E.stateNode.containerInfo,G===m||G.nodeType===8&&G.parentNode===m))return;E=E.return}for(;z!==null;){if(E=bo(z),E===null)return;if(G=E.tag,G===5||G===6){d=y=E;continue e}z=z.parentNode}}d=d.return}Gp(function(){var ce=y,Te=Ue(l),Pe=[];e:{var ke=jm.get(n);if(ke!==void 0){var Ne=Mu,Ve=n;switch(n){case"keypress":if(Ka(l)===0)break e;case"keydown":case"keyup":Ne=cw;break;case"focusin":Ve="focus",Ne=Eu;break;case"focusout":Ve="blur",Ne=Eu;break;case"beforeblur":case"afterblur":Ne=Eu;break;case"click":if(l.button===2)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":Ne=gm;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":Ne=Xx;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":Ne=fw;break;case Lm:case Fm:case Bm:Ne=ew;break;case Vm:Ne=mw;break;case"scroll":Ne=Gx;break;case"wheel":Ne=gw;break;case"copy":case"cut":case"paste":Ne=nw;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":Ne=vm}var je=(i&4)!==0,At=!je&&n==="scroll",oe=je?ke!==null?ke+"Capture":null:ke;je=[];for(var X=ce,se;X!==null;){se=X;var Re=se.stateNode;if(se.tag===5&&Re!==null&&(se=Re,oe!==null&&(Re=Zi(X,oe),Re!=null&&je.push(ys(X,Re,se)))),At)break;X=X.return}0<je.length&&(ke=new Ne(ke,Ve,null,l,Te),Pe.push({event:ke,listeners:je}))}}if(!(i&7)){e:{if(ke=n==="mouseover"||n==="pointerover",Ne=n==="mouseout"||n==="pointerout",ke&&l!==qe&&(Ve=l.relatedTarget||l.fromElement)&&(bo(Ve)||Ve[Er]))break e;if((Ne||ke)&&(ke=Te.window===Te?Te:(ke=Te.ownerDocument)?ke.defaultView||ke.parentWindow:window,Ne?(Ve=l.relatedTarget||l.toElement,Ne=ce,Ve=Ve?bo(Ve):null,Ve!==null&&(At=vo(Ve),Ve!==At||Ve.tag!==5&&Ve.tag!==6)&&(Ve=null)):(Ne=null,Ve=ce),Ne!==Ve)){if(je=gm,Re="onMouseLeave",oe="onMouseEnter",X="mouse",(n==="pointerout"||n==="pointerover")&&(je=vm,Re="onPointerLeave",oe="onPointerEnter",X="pointer"),At=Ne==null?ke:oi(Ne),se=Ve==null?ke:oi(Ve),ke=new je(Re,X+"leave",Ne,l,Te),ke.target=At,ke.relatedTarget=se,Re=null,bo(Te)===ce&&(je=new je(oe,X+"enter",Ve,l,Te),je.target=se,je.relatedTarget=At,Re=je),At=Re,Ne&&Ve)t:{for(je=Ne,oe=Ve,X=0,se=je;se;se=ni(se))X++;for(se=0,Re=oe;Re;Re=ni(Re))se++;for(;0<X-se;)je=ni(je),X--;for(;0<se-X;)oe=ni(oe),se--;for(;X--;){if(je===oe||oe!==null&&je===oe.alternate)break t;je=ni(je),oe=ni(oe)}je=null}else je=null;Ne!==null&&Hm(Pe,ke,Ne,je,!1),Ve!==null&&At!==null&&Hm(Pe,At,Ve,je,!0)}}e:{if(ke=ce?oi(ce):window,Ne=ke.nodeName&&ke.nodeName.toLowerCase(),Ne==="select"||Ne==="input"&&ke.type==="file")var ze=Cw;else if(km(ke))if(Pm)ze=Mw;else{ze=Tw;var He=kw}else(Ne=ke.nodeName)&&Ne.toLowerCase()==="input"&&(ke.type==="checkbox"||ke.type==="radio")&&(ze=Pw);if(ze&&(ze=ze(n,ce))){Tm(Pe,ze,l,Te);break e}He&&He(n,ke,ce),n==="focusout"&&(He=ke._wrapperState)&&He.controlled&&ke.type==="number"&&we(ke,"number",ke.value)}switch(He=ce?oi(ce):window,n){case"focusin":(km(He)||He.contentEditable==="true")&&(ei=He,Lu=ce,ms=null);break;case"focusout":ms=Lu=ei=null;break;case"mousedown":Fu=!0;break;case"contextmenu":case"mouseup":case"dragend":Fu=!1,Am(Pe,l,Te);break;case"selectionchange":if(Ew)break;case"keydown":case"keyup":Am(Pe,l,Te)}var Ye;if(Ou)e:{switch(n){case"compositionstart":var Ke="onCompositionStart";break e;case"compositionend":Ke="onCompositionEnd";break e;case"compositionupdate":Ke="onCompositionUpdate";break e}Ke=void 0}else Jo?Sm(n,l)&&(Ke="onCompositionEnd"):n==="keydown"&&l.keyCode===229&&(Ke="onCompositionStart");Ke&&(bm&&l.locale!=="ko"&&(Jo||Ke!=="onCompositionStart"?Ke==="onCompositionEnd"&&Jo&&(Ye=mm()):(Xr=Te,Pu="value"in Xr?Xr.value:Xr.textContent,Jo=!0)),He=el(ce,Ke),0<He.length&&(Ke=new ym(Ke,n,null,l,Te),Pe.push({event:Ke,listeners:He}),Ye?Ke.data=Ye:(Ye=Cm(l),Ye!==null&&(Ke.data=Ye)))),(Ye=vw?bw(n,l):xw(n,l))&&(ce=el(ce,"onBeforeInput"),0<ce.length&&(Te=new ym("onBeforeInput","beforeinput",null,l,Te),Pe.push({event:Te,listeners:ce}),Te.data=Ye))}Wm(Pe,i)})}function ys(n,i,l){return{instance:n,listener:i,currentTarget:l}}function el(n,i){for(var l=i+"Capture",d=[];n!==null;){var m=n,y=m.stateNode;m.tag===5&&y!==null&&(m=y,y=Zi(n,l),y!=null&&d.unshift(ys(n,y,m)),y=Zi(n,i),y!=null&&d.push(ys(n,y,m))),n=n.return}return d}function ni(n){if(n===null)return null;do n=n.return;while(n&&n.tag!==5);return n||null}function Hm(n,i,l,d,m){for(var y=i._reactName,E=[];l!==null&&l!==d;){var z=l,G=z.alternate,ce=z.stateNode;if(G!==null&&G===d)break;z.tag===5&&ce!==null&&(z=ce,m?(G=Zi(l,y),G!=null&&E.unshift(ys(l,G,z))):m||(G=Zi(l,y),G!=null&&E.push(ys(l,G,z)))),l=l.return}E.length!==0&&n.push({event:i,listeners:E})}var Aw=/\r\n?/g,Nw=/\u0000|\uFFFD/g;function Ym(n){return(typeof n=="string"?n:""+n).replace(Aw,`
-`).replace(Nw,"")}function tl(n,i,l){if(i=Ym(i),Ym(n)!==i&&l)throw Error(r(425))}function nl(){}var Wu=null,Uu=null;function Hu(n,i){return n==="textarea"||n==="noscript"||typeof i.children=="string"||typeof i.children=="number"||typeof i.dangerouslySetInnerHTML=="object"&&i.dangerouslySetInnerHTML!==null&&i.dangerouslySetInnerHTML.__html!=null}var Yu=typeof setTimeout=="function"?setTimeout:void 0,Lw=typeof clearTimeout=="function"?clearTimeout:void 0,Km=typeof Promise=="function"?Promise:void 0,Fw=typeof queueMicrotask=="function"?queueMicrotask:typeof Km<"u"?function(n){return Km.resolve(null).then(n).catch(Bw)}:Yu;function Bw(n){setTimeout(function(){throw n})}function Ku(n,i){var l=i,d=0;do{var m=l.nextSibling;if(n.removeChild(l),m&&m.nodeType===8)if(l=m.data,l==="/$"){if(d===0){n.removeChild(m),as(i);return}d--}else l!=="$"&&l!=="$?"&&l!=="$!"||d++;l=m}while(l);as(i)}function Jr(n){for(;n!=null;n=n.nextSibling){var i=n.nodeType;if(i===1||i===3)break;if(i===8){if(i=n.data,i==="$"||i==="$!"||i==="$?")break;if(i==="/$")return null}}return n}function qm(n){n=n.previousSibling;for(var i=0;n;){if(n.nodeType===8){var l=n.data;if(l==="$"||l==="$!"||l==="$?"){if(i===0)return n;i--}else l==="/$"&&i++}n=n.previousSibling}return null}var ri=Math.random().toString(36).slice(2),gr="__reactFiber$"+ri,vs="__reactProps$"+ri,Er="__reactContainer$"+ri,qu="__reactEvents$"+ri,Vw="__reactListeners$"+ri,jw="__reactHandles$"+ri;function bo(n){var i=n[gr];if(i)return i;for(var l=n.parentNode;l;){if(i=l[Er]||l[gr]){if(l=i.alternate,i.child!==null||l!==null&&l.child!==null)for(n=qm(n);n!==null;){if(l=n[gr])return l;n=qm(n)}return i}n=l,l=n.parentNode}return null}function bs(n){return n=n[gr]||n[Er],!n||n.tag!==5&&n.tag!==6&&n.tag!==13&&n.tag!==3?null:n}function oi(n){if(n.tag===5||n.tag===6)return n.stateNode;throw Error(r(33))}function rl(n){return n[vs]||null}var Gu=[],ii=-1;function eo(n){return{current:n}}function wt(n){0>ii||(n.current=Gu[ii],Gu[ii]=null,ii--)}function vt(n,i){ii++,Gu[ii]=n.current,n.current=i}var to={},Zt=eo(to),dn=eo(!1),xo=to;function si(n,i){var l=n.type.contextTypes;if(!l)return to;var d=n.stateNode;if(d&&d.__reactInternalMemoizedUnmaskedChildContext===i)return d.__reactInternalMemoizedMaskedChildContext;var m={},y;for(y in l)m[y]=i[y];return d&&(n=n.stateNode,n.__reactInternalMemoizedUnmaskedChildContext=i,n.__reactInternalMemoizedMaskedChildContext=m),m}function fn(n){return n=n.childContextTypes,n!=null}function ol(){wt(dn),wt(Zt)}function Gm(n,i,l){if(Zt.current!==to)throw Error(r(168));vt(Zt,i),vt(dn,l)}function Qm(n,i,l){var d=n.stateNode;if(i=i.childContextTypes,typeof d.getChildContext!="function")return l;d=d.getChildContext();for(var m in d)if(!(m in i))throw Error(r(108,ue(n)||"Unknown",m));return q({},l,d)}function il(n){return n=(n=n.stateNode)&&n.__reactInternalMemoizedMergedChildContext||to,xo=Zt.current,vt(Zt,n),vt(dn,dn.current),!0}function Xm(n,i,l){var d=n.stateNode;if(!d)throw Error(r(169));l?(n=Qm(n,i,xo),d.__reactInternalMemoizedMergedChildContext=n,wt(dn),wt(Zt),vt(Zt,n)):wt(dn),vt(dn,l)}var Ir=null,sl=!1,Qu=!1;function Zm(n){Ir===null?Ir=[n]:Ir.push(n)}function zw(n){sl=!0,Zm(n)}function no(){if(!Qu&&Ir!==null){Qu=!0;var n=0,i=pt;try{var l=Ir;for(pt=1;n<l.length;n++){var d=l[n];do d=d(!0);while(d!==null)}Ir=null,sl=!1}catch(m){throw Ir!==null&&(Ir=Ir.slice(n+1)),em(vu,no),m}finally{pt=i,Qu=!1}}return null}var ai=[],li=0,al=null,ll=0,An=[],Nn=0,wo=null,Or=1,$r="";function So(n,i){ai[li++]=ll,ai[li++]=al,al=n,ll=i}function Jm(n,i,l){An[Nn++]=Or,An[Nn++]=$r,An[Nn++]=wo,wo=n;var d=Or;n=$r;var m=32-Jn(d)-1;d&=~(1<<m),l+=1;var y=32-Jn(i)+m;if(30<y){var E=m-m%5;y=(d&(1<<E)-1).toString(32),d>>=E,m-=E,Or=1<<32-Jn(i)+m|l<<m|d,$r=y+n}else Or=1<<y|l<<m|d,$r=n}function Xu(n){n.return!==null&&(So(n,1),Jm(n,1,0))}function Zu(n){for(;n===al;)al=ai[--li],ai[li]=null,ll=ai[--li],ai[li]=null;for(;n===wo;)wo=An[--Nn],An[Nn]=null,$r=An[--Nn],An[Nn]=null,Or=An[--Nn],An[Nn]=null}var kn=null,Tn=null,St=!1,tr=null;function eh(n,i){var l=Vn(5,null,null,0);l.elementType="DELETED",l.stateNode=i,l.return=n,i=n.deletions,i===null?(n.deletions=[l],n.flags|=16):i.push(l)}function th(n,i){switch(n.tag){case 5:var l=n.type;return i=i.nodeType!==1||l.toLowerCase()!==i.nodeName.toLowerCase()?null:i,i!==null?(n.stateNode=i,kn=n,Tn=Jr(i.firstChild),!0):!1;case 6:return i=n.pendingProps===""||i.nodeType!==3?null:i,i!==null?(n.stateNode=i,kn=n,Tn=null,!0):!1;case 13:return i=i.nodeType!==8?null:i,i!==null?(l=wo!==null?{id:Or,overflow:$r}:null,n.memoizedState={dehydrated:i,treeContext:l,retryLane:1073741824},l=Vn(18,null,null,0),l.stateNode=i,l.return=n,n.child=l,kn=n,Tn=null,!0):!1;default:return!1}}function Ju(n){return(n.mode&1)!==0&&(n.flags&128)===0}function ed(n){if(St){var i=Tn;if(i){var l=i;if(!th(n,i)){if(Ju(n))throw Error(r(418));i=Jr(l.nextSibling);var d=kn;i&&th(n,i)?eh(d,l):(n.flags=n.flags&-4097|2,St=!1,kn=n)}}else{if(Ju(n))throw Error(r(418));n.flags=n.flags&-4097|2,St=!1,kn=n}}}function nh(n){for(n=n.return;n!==null&&n.tag!==5&&n.tag!==3&&n.tag!==13;)n=n.return;kn=n}function cl(n){if(n!==kn)return!1;if(!St)return nh(n),St=!0,!1;var i;if((i=n.tag!==3)&&!(i=n.tag!==5)&&(i=n.type,i=i!=="head"&&i!=="body"&&!Hu(n.type,n.memoizedProps)),i&&(i=Tn)){if(Ju(n))throw rh(),Error(r(418));for(;i;)eh(n,i),i=Jr(i.nextSibling)}if(nh(n),n.tag===13){if(n=n.memoizedState,n=n!==null?n.dehydrated:null,!n)throw Error(r(317));e:{for(n=n.nextSibling,i=0;n;){if(n.nodeType===8){var l=n.data;if(l==="/$"){if(i===0){Tn=Jr(n.nextSibling);break e}i--}else l!=="$"&&l!=="$!"&&l!=="$?"||i++}n=n.nextSibling}Tn=null}}else Tn=kn?Jr(n.stateNode.nextSibling):null;return!0}function rh(){for(var n=Tn;n;)n=Jr(n.nextSibling)}function ci(){Tn=kn=null,St=!1}function td(n){tr===null?tr=[n]:tr.push(n)}var _w=M.ReactCurrentBatchConfig;function xs(n,i,l){if(n=l.ref,n!==null&&typeof n!="function"&&typeof n!="object"){if(l._owner){if(l=l._owner,l){if(l.tag!==1)throw Error(r(309));var d=l.stateNode}if(!d)throw Error(r(147,n));var m=d,y=""+n;return i!==null&&i.ref!==null&&typeof i.ref=="function"&&i.ref._stringRef===y?i.ref:(i=function(E){var z=m.refs;E===null?delete z[y]:z[y]=E},i._stringRef=y,i)}if(typeof n!="string")throw Error(r(284));if(!l._owner)throw Error(r(290,n))}return n}function ul(n,i){throw n=Object.prototype.toString.call(i),Error(r(31,n==="[object Object]"?"object with keys {"+Object.keys(i).join(", ")+"}":n))}function oh(n){var i=n._init;return i(n._payload)}function ih(n){function i(oe,X){if(n){var se=oe.deletions;se===null?(oe.deletions=[X],oe.flags|=16):se.push(X)}}function l(oe,X){if(!n)return null;for(;X!==null;)i(oe,X),X=X.sibling;return null}function d(oe,X){for(oe=new Map;X!==null;)X.key!==null?oe.set(X.key,X):oe.set(X.index,X),X=X.sibling;return oe}function m(oe,X){return oe=uo(oe,X),oe.index=0,oe.sibling=null,oe}function y(oe,X,se){return oe.index=se,n?(se=oe.alternate,se!==null?(se=se.index,se<X?(oe.flags|=2,X):se):(oe.flags|=2,X)):(oe.flags|=1048576,X)}function E(oe){return n&&oe.alternate===null&&(oe.flags|=2),oe}function z(oe,X,se,Re){return X===null||X.tag!==6?(X=Yd(se,oe.mode,Re),X.return=oe,X):(X=m(X,se),X.return=oe,X)}function G(oe,X,se,Re){var ze=se.type;return ze===O?Te(oe,X,se.props.children,Re,se.key):X!==null&&(X.elementType===ze||typeof ze=="object"&&ze!==null&&ze.$$typeof===B&&oh(ze)===X.type)?(Re=m(X,se.props),Re.ref=xs(oe,X,se),Re.return=oe,Re):(Re=Al(se.type,se.key,se.props,null,oe.mode,Re),Re.ref=xs(oe,X,se),Re.return=oe,Re)}function ce(oe,X,se,Re){return X===null||X.tag!==4||X.stateNode.containerInfo!==se.containerInfo||X.stateNode.implementation!==se.implementation?(X=Kd(se,oe.mode,Re),X.return=oe,X):(X=m(X,se.children||[]),X.return=oe,X)}function Te(oe,X,se,Re,ze){return X===null||X.tag!==7?(X=Eo(se,oe.mode,Re,ze),X.return=oe,X):(X=m(X,se),X.return=oe,X)}function Pe(oe,X,se){if(typeof X=="string"&&X!==""||typeof X=="number")return X=Yd(""+X,oe.mode,se),X.return=oe,X;if(typeof X=="object"&&X!==null){switch(X.$$typeof){case D:return se=Al(X.type,X.key,X.props,null,oe.mode,se),se.ref=xs(oe,null,X),se.return=oe,se;case $:return X=Kd(X,oe.mode,se),X.return=oe,X;case B:var Re=X._init;return Pe(oe,Re(X._payload),se)}if(Ce(X)||_(X))return X=Eo(X,oe.mode,se,null),X.return=oe,X;ul(oe,X)}return null}function ke(oe,X,se,Re){var ze=X!==null?X.key:null;if(typeof se=="string"&&se!==""||typeof se=="number")return ze!==null?null:z(oe,X,""+se,Re);if(typeof se=="object"&&se!==null){switch(se.$$typeof){case D:return se.key===ze?G(oe,X,se,Re):null;case $:return se.key===ze?ce(oe,X,se,Re):null;case B:return ze=se._init,ke(oe,X,ze(se._payload),Re)}if(Ce(se)||_(se))return ze!==null?null:Te(oe,X,se,Re,null);ul(oe,se)}return null}function Ne(oe,X,se,Re,ze){if(typeof Re=="string"&&Re!==""||typeof Re=="number")return oe=oe.get(se)||null,z(X,oe,""+Re,ze);if(typeof Re=="object"&&Re!==null){switch(Re.$$typeof){case D:return oe=oe.get(Re.key===null?se:Re.key)||null,G(X,oe,Re,ze);case $:return oe=oe.get(Re.key===null?se:Re.key)||null,ce(X,oe,Re,ze);case B:var He=Re._init;return Ne(oe,X,se,He(Re._payload),ze)}if(Ce(Re)||_(Re))return oe=oe.get(se)||null,Te(X,oe,Re,ze,null);ul(X,Re)}return null}function Ve(oe,X,se,Re){for(var ze=null,He=null,Ye=X,Ke=X=0,Yt=null;Ye!==null&&Ke<se.length;Ke++){Ye.index>Ke?(Yt=Ye,Ye=null):Yt=Ye.sibling;var at=ke(oe,Ye,se[Ke],Re);if(at===null){Ye===null&&(Ye=Yt);break}n&&Ye&&at.alternate===null&&i(oe,Ye),X=y(at,X,Ke),He===null?ze=at:He.sibling=at,He=at,Ye=Yt}if(Ke===se.length)return l(oe,Ye),St&&So(oe,Ke),ze;if(Ye===null){for(;Ke<se.length;Ke++)Ye=Pe(oe,se[Ke],Re),Ye!==null&&(X=y(Ye,X,Ke),He===null?ze=Ye:He.sibling=Ye,He=Ye);return St&&So(oe,Ke),ze}for(Ye=d(oe,Ye);Ke<se.length;Ke++)Yt=Ne(Ye,oe,Ke,se[Ke],Re),Yt!==null&&(n&&Yt.alternate!==null&&Ye.delete(Yt.key===null?Ke:Yt.key),X=y(Yt,X,Ke),He===null?ze=Yt:He.sibling=Yt,He=Yt);return n&&Ye.forEach(function(fo){return i(oe,fo)}),St&&So(oe,Ke),ze}function je(oe,X,se,Re){var ze=_(se);if(typeof ze!="function")throw Error(r(150));if(se=ze.call(se),se==null)throw Error(r(151));for(var He=ze=null,Ye=X,Ke=X=0,Yt=null,at=se.next();Ye!==null&&!at.done;Ke++,at=se.next()){Ye.index>Ke?(Yt=Ye,Ye=null):Yt=Ye.sibling;var fo=ke(oe,Ye,at.value,Re);if(fo===null){Ye===null&&(Ye=Yt);break}n&&Ye&&fo.alternate===null&&i(oe,Ye),X=y(fo,X,Ke),He===null?ze=fo:He.sibling=fo,He=fo,Ye=Yt}if(at.done)return l(oe,Ye),St&&So(oe,Ke),ze;if(Ye===null){for(;!at.done;Ke++,at=se.next())at=Pe(oe,at.value,Re),at!==null&&(X=y(at,X,Ke),He===null?ze=at:He.sibling=at,He=at);return St&&So(oe,Ke),ze}for(Ye=d(oe,Ye);!at.done;Ke++,at=se.next())at=Ne(Ye,oe,Ke,at.value,Re),at!==null&&(n&&at.alternate!==null&&Ye.delete(at.key===null?Ke:at.key),X=y(at,X,Ke),He===null?ze=at:He.sibling=at,He=at);return n&&Ye.forEach(function(xS){return i(oe,xS)}),St&&So(oe,Ke),ze}function At(oe,X,se,Re){if(typeof se=="object"&&se!==null&&se.type===O&&se.key===null&&(se=se.props.children),typeof se=="object"&&se!==null){switch(se.$$typeof){case D:e:{for(var ze=se.key,He=X;He!==null;){if(He.key===ze){if(ze=se.type,ze===O){if(He.tag===7){l(oe,He.sibling),X=m(He,se.props.children),X.return=oe,oe=X;break e}}else if(He.elementType===ze||typeof ze=="object"&&ze!==null&&ze.$$typeof===B&&oh(ze)===He.type){l(oe,He.sibling),X=m(He,se.props),X.ref=xs(oe,He,se),X.return=oe,oe=X;break e}l(oe,He);break}else i(oe,He);He=He.sibling}se.type===O?(X=Eo(se.props.children,oe.mode,Re,se.key),X.return=oe,oe=X):(Re=Al(se.type,se.key,se.props,null,oe.mode,Re),Re.ref=xs(oe,X,se),Re.return=oe,oe=Re)}return E(oe);case $:e:{for(He=se.key;X!==null;){if(X.key===He)if(X.tag===4&&X.stateNode.containerInfo===se.containerInfo&&X.stateNode.implementation===se.implementation){l(oe,X.sibling),X=m(X,se.children||[]),X.return=oe,oe=X;break e}else{l(oe,X);break}else i(oe,X);X=X.sibling}X=Kd(se,oe.mode,Re),X.return=oe,oe=X}return E(oe);case B:return He=se._init,At(oe,X,He(se._payload),Re)}if(Ce(se))return Ve(oe,X,se,Re);if(_(se))return je(oe,X,se,Re);ul(oe,se)}return typeof se=="string"&&se!==""||typeof se=="number"?(se=""+se,X!==null&&X.tag===6?(l(oe,X.sibling),X=m(X,se),X.return=oe,oe=X):(l(oe,X),X=Yd(se,oe.mode,Re),X.return=oe,oe=X),E(oe)):l(oe,X)}return At}var ui=ih(!0),sh=ih(!1),dl=eo(null),fl=null,di=null,nd=null;function rd(){nd=di=fl=null}function od(n){var i=dl.current;wt(dl),n._currentValue=i}function id(n,i,l){for(;n!==null;){var d=n.alternate;if((n.childLanes&i)!==i?(n.childLanes|=i,d!==null&&(d.childLanes|=i)):d!==null&&(d.childLanes&i)!==i&&(d.childLanes|=i),n===l)break;n=n.return}}function fi(n,i){fl=n,nd=di=null,n=n.dependencies,n!==null&&n.firstContext!==null&&(n.lanes&i&&(pn=!0),n.firstContext=null)}function Ln(n){var i=n._currentValue;if(nd!==n)if(n={context:n,memoizedValue:i,next:null},di===null){if(fl===null)throw Error(r(308));di=n,fl.dependencies={lanes:0,firstContext:n}}else di=di.next=n;return i}var Co=null;function sd(n){Co===null?Co=[n]:Co.push(n)}function ah(n,i,l,d){var m=i.interleaved;return m===null?(l.next=l,sd(i)):(l.next=m.next,m.next=l),i.interleaved=l,Ar(n,d)}function Ar(n,i){n.lanes|=i;var l=n.alternate;for(l!==null&&(l.lanes|=i),l=n,n=n.return;n!==null;)n.childLanes|=i,l=n.alternate,l!==null&&(l.childLanes|=i),l=n,n=n.return;return l.tag===3?l.stateNode:null}var ro=!1;function ad(n){n.updateQueue={baseState:n.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function lh(n,i){n=n.updateQueue,i.updateQueue===n&&(i.updateQueue={baseState:n.baseState,firstBaseUpdate:n.firstBaseUpdate,lastBaseUpdate:n.lastBaseUpdate,shared:n.shared,effects:n.effects})}function Nr(n,i){return{eventTime:n,lane:i,tag:0,payload:null,callback:null,next:null}}function oo(n,i,l){var d=n.updateQueue;if(d===null)return null;if(d=d.shared,it&2){var m=d.pending;return m===null?i.next=i:(i.next=m.next,m.next=i),d.pending=i,Ar(n,l)}return m=d.interleaved,m===null?(i.next=i,sd(d)):(i.next=m.next,m.next=i),d.interleaved=i,Ar(n,l)}function pl(n,i,l){if(i=i.updateQueue,i!==null&&(i=i.shared,(l&4194240)!==0)){var d=i.lanes;d&=n.pendingLanes,l|=d,i.lanes=l,wu(n,l)}}function ch(n,i){var l=n.updateQueue,d=n.alternate;if(d!==null&&(d=d.updateQueue,l===d)){var m=null,y=null;if(l=l.firstBaseUpdate,l!==null){do{var E={eventTime:l.eventTime,lane:l.lane,tag:l.tag,payload:l.payload,callback:l.callback,next:null};y===null?m=y=E:y=y.next=E,l=l.next}while(l!==null);y===null?m=y=i:y=y.next=i}else m=y=i;l={baseState:d.baseState,firstBaseUpdate:m,lastBaseUpdate:y,shared:d.shared,effects:d.effects},n.updateQueue=l;return}n=l.lastBaseUpdate,n===null?l.firstBaseUpdate=i:n.next=i,l.lastBaseUpdate=i}function ml(n,i,l,d){var m=n.updateQueue;ro=!1;var y=m.firstBaseUpdate,E=m.lastBaseUpdate,z=m.shared.pending;if(z!==null){m.shared.pending=null;var G=z,ce=G.next;G.next=null,E===null?y=ce:E.next=ce,E=G;var Te=n.alternate;Te!==null&&(Te=Te.updateQueue,z=Te.lastBaseUpdate,z!==E&&(z===null?Te.firstBaseUpdate=ce:z.next=ce,Te.lastBaseUpdate=G))}if(y!==null){var Pe=m.baseState;E=0,Te=ce=G=null,z=y;do{var ke=z.lane,Ne=z.eventTime;if((d&ke)===ke){Te!==null&&(Te=Te.next={eventTime:Ne,lane:0,tag:z.tag,payload:z.payload,callback:z.callback,next:null});e:{var Ve=n,je=z;switch(ke=i,Ne=l,je.tag){case 1:if(Ve=je.payload,typeof Ve=="function"){Pe=Ve.call(Ne,Pe,ke);break e}Pe=Ve;break e;case 3:Ve.flags=Ve.flags&-65537|128;case 0:if(Ve=je.payload,ke=typeof Ve=="function"?Ve.call(Ne,Pe,ke):Ve,ke==null)break e;Pe=q({},Pe,ke);break e;case 2:ro=!0}}z.callback!==null&&z.lane!==0&&(n.flags|=64,ke=m.effects,ke===null?m.effects=[z]:ke.push(z))}else Ne={eventTime:Ne,lane:ke,tag:z.tag,payload:z.payload,callback:z.callback,next:null},Te===null?(ce=Te=Ne,G=Pe):Te=Te.next=Ne,E|=ke;if(z=z.next,z===null){if(z=m.shared.pending,z===null)break;ke=z,z=ke.next,ke.next=null,m.lastBaseUpdate=ke,m.shared.pending=null}}while(!0);if(Te===null&&(G=Pe),m.baseState=G,m.firstBaseUpdate=ce,m.lastBaseUpdate=Te,i=m.shared.interleaved,i!==null){m=i;do E|=m.lane,m=m.next;while(m!==i)}else y===null&&(m.shared.lanes=0);Po|=E,n.lanes=E,n.memoizedState=Pe}}function uh(n,i,l){if(n=i.effects,i.effects=null,n!==null)for(i=0;i<n.length;i++){var d=n[i],m=d.callback;if(m!==null){if(d.callback=null,d=l,typeof m!="function")throw Error(r(191,m));m.call(d)}}}var ws={},yr=eo(ws),Ss=eo(ws),Cs=eo(ws);function ko(n){if(n===ws)throw Error(r(174));return n}function ld(n,i){switch(vt(Cs,i),vt(Ss,n),vt(yr,ws),n=i.nodeType,n){case 9:case 11:i=(i=i.documentElement)?i.namespaceURI:Tt(null,"");break;default:n=n===8?i.parentNode:i,i=n.namespaceURI||null,n=n.tagName,i=Tt(i,n)}wt(yr),vt(yr,i)}function pi(){wt(yr),wt(Ss),wt(Cs)}function dh(n){ko(Cs.current);var i=ko(yr.current),l=Tt(i,n.type);i!==l&&(vt(Ss,n),vt(yr,l))}function cd(n){Ss.current===n&&(wt(yr),wt(Ss))}var Pt=eo(0);function hl(n){for(var i=n;i!==null;){if(i.tag===13){var l=i.memoizedState;if(l!==null&&(l=l.dehydrated,l===null||l.data==="$?"||l.data==="$!"))return i}else if(i.tag===19&&i.memoizedProps.revealOrder!==void 0){if(i.flags&128)return i}else if(i.child!==null){i.child.return=i,i=i.child;continue}if(i===n)break;for(;i.sibling===null;){if(i.return===null||i.return===n)return null;i=i.return}i.sibling.return=i.return,i=i.sibling}return null}var ud=[];function dd(){for(var n=0;n<ud.length;n++)ud[n]._workInProgressVersionPrimary=null;ud.length=0}var gl=M.ReactCurrentDispatcher,fd=M.ReactCurrentBatchConfig,To=0,Mt=null,zt=null,Ut=null,yl=!1,ks=!1,Ts=0,Ww=0;function Jt(){throw Error(r(321))}function pd(n,i){if(i===null)return!1;for(var l=0;l<i.length&&l<n.length;l++)if(!er(n[l],i[l]))return!1;return!0}function md(n,i,l,d,m,y){if(To=y,Mt=i,i.memoizedState=null,i.updateQueue=null,i.lanes=0,gl.current=n===null||n.memoizedState===null?Kw:qw,n=l(d,m),ks){y=0;do{if(ks=!1,Ts=0,25<=y)throw Error(r(301));y+=1,Ut=zt=null,i.updateQueue=null,gl.current=Gw,n=l(d,m)}while(ks)}if(gl.current=xl,i=zt!==null&&zt.next!==null,To=0,Ut=zt=Mt=null,yl=!1,i)throw Error(r(300));return n}function hd(){var n=Ts!==0;return Ts=0,n}function vr(){var n={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return Ut===null?Mt.memoizedState=Ut=n:Ut=Ut.next=n,Ut}function Fn(){if(zt===null){var n=Mt.alternate;n=n!==null?n.memoizedState:null}else n=zt.next;var i=Ut===null?Mt.memoizedState:Ut.next;if(i!==null)Ut=i,zt=n;else{if(n===null)throw Error(r(310));zt=n,n={memoizedState:zt.memoizedState,baseState:zt.baseState,baseQueue:zt.baseQueue,queue:zt.queue,next:null},Ut===null?Mt.memoizedState=Ut=n:Ut=Ut.next=n}return Ut}function Ps(n,i){return typeof i=="function"?i(n):i}function gd(n){var i=Fn(),l=i.queue;if(l===null)throw Error(r(311));l.lastRenderedReducer=n;var d=zt,m=d.baseQueue,y=l.pending;if(y!==null){if(m!==null){var E=m.next;m.next=y.next,y.next=E}d.baseQueue=m=y,l.pending=null}if(m!==null){y=m.next,d=d.baseState;var z=E=null,G=null,ce=y;do{var Te=ce.lane;if((To&Te)===Te)G!==null&&(G=G.next={lane:0,action:ce.action,hasEagerState:ce.hasEagerState,eagerState:ce.eagerState,next:null}),d=ce.hasEagerState?ce.eagerState:n(d,ce.action);else{var Pe={lane:Te,action:ce.action,hasEagerState:ce.hasEagerState,eagerState:ce.eagerState,next:null};G===null?(z=G=Pe,E=d):G=G.next=Pe,Mt.lanes|=Te,Po|=Te}ce=ce.next}while(ce!==null&&ce!==y);G===null?E=d:G.next=z,er(d,i.memoizedState)||(pn=!0),i.memoizedState=d,i.baseState=E,i.baseQueue=G,l.lastRenderedState=d}if(n=l.interleaved,n!==null){m=n;do y=m.lane,Mt.lanes|=y,Po|=y,m=m.next;while(m!==n)}else m===null&&(l.lanes=0);return[i.memoizedState,l.dispatch]}function yd(n){var i=Fn(),l=i.queue;if(l===null)throw Error(r(311));l.lastRenderedReducer=n;var d=l.dispatch,m=l.pending,y=i.memoizedState;if(m!==null){l.pending=null;var E=m=m.next;do y=n(y,E.action),E=E.next;while(E!==m);er(y,i.memoizedState)||(pn=!0),i.memoizedState=y,i.baseQueue===null&&(i.baseState=y),l.lastRenderedState=y}return[y,d]}function fh(){}function ph(n,i){var l=Mt,d=Fn(),m=i(),y=!er(d.memoizedState,m);if(y&&(d.memoizedState=m,pn=!0),d=d.queue,vd(gh.bind(null,l,d,n),[n]),d.getSnapshot!==i||y||Ut!==null&&Ut.memoizedState.tag&1){if(l.flags|=2048,Ms(9,hh.bind(null,l,d,m,i),void 0,null),Ht===null)throw Error(r(349));To&30||mh(l,i,m)}return m}function mh(n,i,l){n.flags|=16384,n={getSnapshot:i,value:l},i=Mt.updateQueue,i===null?(i={lastEffect:null,stores:null},Mt.updateQueue=i,i.stores=[n]):(l=i.stores,l===null?i.stores=[n]:l.push(n))}function hh(n,i,l,d){i.value=l,i.getSnapshot=d,yh(i)&&vh(n)}function gh(n,i,l){return l(function(){yh(i)&&vh(n)})}function yh(n){var i=n.getSnapshot;n=n.value;try{var l=i();return!er(n,l)}catch{return!0}}function vh(n){var i=Ar(n,1);i!==null&&ir(i,n,1,-1)}function bh(n){var i=vr();return typeof n=="function"&&(n=n()),i.memoizedState=i.baseState=n,n={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:Ps,lastRenderedState:n},i.queue=n,n=n.dispatch=Yw.bind(null,Mt,n),[i.memoizedState,n]}function Ms(n,i,l,d){return n={tag:n,create:i,destroy:l,deps:d,next:null},i=Mt.updateQueue,i===null?(i={lastEffect:null,stores:null},Mt.updateQueue=i,i.lastEffect=n.next=n):(l=i.lastEffect,l===null?i.lastEffect=n.next=n:(d=l.next,l.next=n,n.next=d,i.lastEffect=n)),n}function xh(){return Fn().memoizedState}function vl(n,i,l,d){var m=vr();Mt.flags|=n,m.memoizedState=Ms(1|i,l,void 0,d===void 0?null:d)}function bl(n,i,l,d){var m=Fn();d=d===void 0?null:d;var y=void 0;if(zt!==null){var E=zt.memoizedState;if(y=E.destroy,d!==null&&pd(d,E.deps)){m.memoizedState=Ms(i,l,y,d);return}}Mt.flags|=n,m.memoizedState=Ms(1|i,l,y,d)}function wh(n,i){return vl(8390656,8,n,i)}function vd(n,i){return bl(2048,8,n,i)}function Sh(n,i){return bl(4,2,n,i)}function Ch(n,i){return bl(4,4,n,i)}function kh(n,i){if(typeof i=="function")return n=n(),i(n),function(){i(null)};if(i!=null)return n=n(),i.current=n,function(){i.current=null}}function Th(n,i,l){return l=l!=null?l.concat([n]):null,bl(4,4,kh.bind(null,i,n),l)}function bd(){}function Ph(n,i){var l=Fn();i=i===void 0?null:i;var d=l.memoizedState;return d!==null&&i!==null&&pd(i,d[1])?d[0]:(l.memoizedState=[n,i],n)}function Mh(n,i){var l=Fn();i=i===void 0?null:i;var d=l.memoizedState;return d!==null&&i!==null&&pd(i,d[1])?d[0]:(n=n(),l.memoizedState=[n,i],n)}function Rh(n,i,l){return To&21?(er(l,i)||(l=om(),Mt.lanes|=l,Po|=l,n.baseState=!0),i):(n.baseState&&(n.baseState=!1,pn=!0),n.memoizedState=l)}function Uw(n,i){var l=pt;pt=l!==0&&4>l?l:4,n(!0);var d=fd.transition;fd.transition={};try{n(!1),i()}finally{pt=l,fd.transition=d}}function Dh(){return Fn().memoizedState}function Hw(n,i,l){var d=lo(n);if(l={lane:d,action:l,hasEagerState:!1,eagerState:null,next:null},Eh(n))Ih(i,l);else if(l=ah(n,i,l,d),l!==null){var m=cn();ir(l,n,d,m),Oh(l,i,d)}}function Yw(n,i,l){var d=lo(n),m={lane:d,action:l,hasEagerState:!1,eagerState:null,next:null};if(Eh(n))Ih(i,m);else{var y=n.alternate;if(n.lanes===0&&(y===null||y.lanes===0)&&(y=i.lastRenderedReducer,y!==null))try{var E=i.lastRenderedState,z=y(E,l);if(m.hasEagerState=!0,m.eagerState=z,er(z,E)){var G=i.interleaved;G===null?(m.next=m,sd(i)):(m.next=G.next,G.next=m),i.interleaved=m;return}}catch{}finally{}l=ah(n,i,m,d),l!==null&&(m=cn(),ir(l,n,d,m),Oh(l,i,d))}}function Eh(n){var i=n.alternate;return n===Mt||i!==null&&i===Mt}function Ih(n,i){ks=yl=!0;var l=n.pending;l===null?i.next=i:(i.next=l.next,l.next=i),n.pending=i}function Oh(n,i,l){if(l&4194240){var d=i.lanes;d&=n.pendingLanes,l|=d,i.lanes=l,wu(n,l)}}var xl={readContext:Ln,useCallback:Jt,useContext:Jt,useEffect:Jt,useImperativeHandle:Jt,useInsertionEffect:Jt,useLayoutEffect:Jt,useMemo:Jt,useReducer:Jt,useRef:Jt,useState:Jt,useDebugValue:Jt,useDeferredValue:Jt,useTransition:Jt,useMutableSource:Jt,useSyncExternalStore:Jt,useId:Jt,unstable_isNewReconciler:!1},Kw={readContext:Ln,useCallback:function(n,i){return vr().memoizedState=[n,i===void 0?null:i],n},useContext:Ln,useEffect:wh,useImperativeHandle:function(n,i,l){return l=l!=null?l.concat([n]):null,vl(4194308,4,kh.bind(null,i,n),l)},useLayoutEffect:function(n,i){return vl(4194308,4,n,i)},useInsertionEffect:function(n,i){return vl(4,2,n,i)},useMemo:function(n,i){var l=vr();return i=i===void 0?null:i,n=n(),l.memoizedState=[n,i],n},useReducer:function(n,i,l){var d=vr();return i=l!==void 0?l(i):i,d.memoizedState=d.baseState=i,n={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:n,lastRenderedState:i},d.queue=n,n=n.dispatch=Hw.bind(null,Mt,n),[d.memoizedState,n]},useRef:function(n){var i=vr();return n={current:n},i.memoizedState=n},useState:bh,useDebugValue:bd,useDeferredValue:function(n){return vr().memoizedState=n},useTransition:function(){var n=bh(!1),i=n[0];return n=Uw.bind(null,n[1]),vr().memoizedState=n,[i,n]},useMutableSource:function(){},useSyncExternalStore:function(n,i,l){var d=Mt,m=vr();if(St){if(l===void 0)throw Error(r(407));l=l()}else{if(l=i(),Ht===null)throw Error(r(349));To&30||mh(d,i,l)}m.memoizedState=l;var y={value:l,getSnapshot:i};return m.queue=y,wh(gh.bind(null,d,y,n),[n]),d.flags|=2048,Ms(9,hh.bind(null,d,y,l,i),void 0,null),l},useId:function(){var n=vr(),i=Ht.identifierPrefix;if(St){var l=$r,d=Or;l=(d&~(1<<32-Jn(d)-1)).toString(32)+l,i=":"+i+"R"+l,l=Ts++,0<l&&(i+="H"+l.toString(32)),i+=":"}else l=Ww++,i=":"+i+"r"+l.toString(32)+":";return n.memoizedState=i},unstable_isNewReconciler:!1},qw={readContext:Ln,useCallback:Ph,useContext:Ln,useEffect:vd,useImperativeHandle:Th,useInsertionEffect:Sh,useLayoutEffect:Ch,useMemo:Mh,useReducer:gd,useRef:xh,useState:function(){return gd(Ps)},useDebugValue:bd,useDeferredValue:function(n){var i=Fn();return Rh(i,zt.memoizedState,n)},useTransition:function(){var n=gd(Ps)[0],i=Fn().memoizedState;return[n,i]},useMutableSource:fh,useSyncExternalStore:ph,useId:Dh,unstable_isNewReconciler:!1},Gw={readContext:Ln,useCallback:Ph,useContext:Ln,useEffect:vd,useImperativeHandle:Th,useInsertionEffect:Sh,useLayoutEffect:Ch,useMemo:Mh,useReducer:yd,useRef:xh,useState:function(){return yd(Ps)},useDebugValue:bd,useDeferredValue:function(n){var i=Fn();return zt===null?i.memoizedState=n:Rh(i,zt.memoizedState,n)},useTransition:function(){var n=yd(Ps)[0],i=Fn().memoizedState;return[n,i]},useMutableSource:fh,useSyncExternalStore:ph,useId:Dh,unstable_isNewReconciler:!1};function nr(n,i){if(n&&n.defaultProps){i=q({},i),n=n.defaultProps;for(var l in n)i[l]===void 0&&(i[l]=n[l]);return i}return i}function xd(n,i,l,d){i=n.memoizedState,l=l(d,i),l=l==null?i:q({},i,l),n.memoizedState=l,n.lanes===0&&(n.updateQueue.baseState=l)}var wl={isMounted:function(n){return(n=n._reactInternals)?vo(n)===n:!1},enqueueSetState:function(n,i,l){n=n._reactInternals;var d=cn(),m=lo(n),y=Nr(d,m);y.payload=i,l!=null&&(y.callback=l),i=oo(n,y,m),i!==null&&(ir(i,n,m,d),pl(i,n,m))},enqueueReplaceState:function(n,i,l){n=n._reactInternals;var d=cn(),m=lo(n),y=Nr(d,m);y.tag=1,y.payload=i,l!=null&&(y.callback=l),i=oo(n,y,m),i!==null&&(ir(i,n,m,d),pl(i,n,m))},enqueueForceUpdate:function(n,i){n=n._reactInternals;var l=cn(),d=lo(n),m=Nr(l,d);m.tag=2,i!=null&&(m.callback=i),i=oo(n,m,d),i!==null&&(ir(i,n,d,l),pl(i,n,d))}};function $h(n,i,l,d,m,y,E){return n=n.stateNode,typeof n.shouldComponentUpdate=="function"?n.shouldComponentUpdate(d,y,E):i.prototype&&i.prototype.isPureReactComponent?!ps(l,d)||!ps(m,y):!0}function Ah(n,i,l){var d=!1,m=to,y=i.contextType;return typeof y=="object"&&y!==null?y=Ln(y):(m=fn(i)?xo:Zt.current,d=i.contextTypes,y=(d=d!=null)?si(n,m):to),i=new i(l,y),n.memoizedState=i.state!==null&&i.state!==void 0?i.state:null,i.updater=wl,n.stateNode=i,i._reactInternals=n,d&&(n=n.stateNode,n.__reactInternalMemoizedUnmaskedChildContext=m,n.__reactInternalMemoizedMaskedChildContext=y),i}function Nh(n,i,l,d){n=i.state,typeof i.componentWillReceiveProps=="function"&&i.componentWillReceiveProps(l,d),typeof i.UNSAFE_componentWillReceiveProps=="function"&&i.UNSAFE_componentWillReceiveProps(l,d),i.state!==n&&wl.enqueueReplaceState(i,i.state,null)}function wd(n,i,l,d){var m=n.stateNode;m.props=l,m.state=n.memoizedState,m.refs={},ad(n);var y=i.contextType;typeof y=="object"&&y!==null?m.context=Ln(y):(y=fn(i)?xo:Zt.current,m.context=si(n,y)),m.state=n.memoizedState,y=i.getDerivedStateFromProps,typeof y=="function"&&(xd(n,i,y,l),m.state=n.memoizedState),typeof i.getDerivedStateFromProps=="function"||typeof m.getSnapshotBeforeUpdate=="function"||typeof m.UNSAFE_componentWillMount!="function"&&typeof m.componentWillMount!="function"||(i=m.state,typeof m.componentWillMount=="function"&&m.componentWillMount(),typeof m.UNSAFE_componentWillMount=="function"&&m.UNSAFE_componentWillMount(),i!==m.state&&wl.enqueueReplaceState(m,m.state,null),ml(n,l,m,d),m.state=n.memoizedState),typeof m.componentDidMount=="function"&&(n.flags|=4194308)}function mi(n,i){try{var l="",d=i;do l+=Z(d),d=d.return;while(d);var m=l}catch(y){m=`
-Error generating stack: `+y.message+`
-`+y.stack}return{value:n,source:i,stack:m,digest:null}}function Sd(n,i,l){return{value:n,source:null,stack:l??null,digest:i??null}}function Cd(n,i){try{console.error(i.value)}catch(l){setTimeout(function(){throw l})}}var Qw=typeof WeakMap=="function"?WeakMap:Map;function Lh(n,i,l){l=Nr(-1,l),l.tag=3,l.payload={element:null};var d=i.value;return l.callback=function(){Rl||(Rl=!0,Bd=d),Cd(n,i)},l}function Fh(n,i,l){l=Nr(-1,l),l.tag=3;var d=n.type.getDerivedStateFromError;if(typeof d=="function"){var m=i.value;l.payload=function(){return d(m)},l.callback=function(){Cd(n,i)}}var y=n.stateNode;return y!==null&&typeof y.componentDidCatch=="function"&&(l.callback=function(){Cd(n,i),typeof d!="function"&&(so===null?so=new Set([this]):so.add(this));var E=i.stack;this.componentDidCatch(i.value,{componentStack:E!==null?E:""})}),l}function Bh(n,i,l){var d=n.pingCache;if(d===null){d=n.pingCache=new Qw;var m=new Set;d.set(i,m)}else m=d.get(i),m===void 0&&(m=new Set,d.set(i,m));m.has(l)||(m.add(l),n=uS.bind(null,n,i,l),i.then(n,n))}function Vh(n){do{var i;if((i=n.tag===13)&&(i=n.memoizedState,i=i!==null?i.dehydrated!==null:!0),i)return n;n=n.return}while(n!==null);return null}function jh(n,i,l,d,m){return n.mode&1?(n.flags|=65536,n.lanes=m,n):(n===i?n.flags|=65536:(n.flags|=128,l.flags|=131072,l.flags&=-52805,l.tag===1&&(l.alternate===null?l.tag=17:(i=Nr(-1,1),i.tag=2,oo(l,i,1))),l.lanes|=1),n)}var Xw=M.ReactCurrentOwner,pn=!1;function ln(n,i,l,d){i.child=n===null?sh(i,null,l,d):ui(i,n.child,l,d)}function zh(n,i,l,d,m){l=l.render;var y=i.ref;return fi(i,m),d=md(n,i,l,d,y,m),l=hd(),n!==null&&!pn?(i.updateQueue=n.updateQueue,i.flags&=-2053,n.lanes&=~m,Lr(n,i,m)):(St&&l&&Xu(i),i.flags|=1,ln(n,i,d,m),i.child)}function _h(n,i,l,d,m){if(n===null){var y=l.type;return typeof y=="function"&&!Hd(y)&&y.defaultProps===void 0&&l.compare===null&&l.defaultProps===void 0?(i.tag=15,i.type=y,Wh(n,i,y,d,m)):(n=Al(l.type,null,d,i,i.mode,m),n.ref=i.ref,n.return=i,i.child=n)}if(y=n.child,!(n.lanes&m)){var E=y.memoizedProps;if(l=l.compare,l=l!==null?l:ps,l(E,d)&&n.ref===i.ref)return Lr(n,i,m)}return i.flags|=1,n=uo(y,d),n.ref=i.ref,n.return=i,i.child=n}function Wh(n,i,l,d,m){if(n!==null){var y=n.memoizedProps;if(ps(y,d)&&n.ref===i.ref)if(pn=!1,i.pendingProps=d=y,(n.lanes&m)!==0)n.flags&131072&&(pn=!0);else return i.lanes=n.lanes,Lr(n,i,m)}return kd(n,i,l,d,m)}function Uh(n,i,l){var d=i.pendingProps,m=d.children,y=n!==null?n.memoizedState:null;if(d.mode==="hidden")if(!(i.mode&1))i.memoizedState={baseLanes:0,cachePool:null,transitions:null},vt(gi,Pn),Pn|=l;else{if(!(l&1073741824))return n=y!==null?y.baseLanes|l:l,i.lanes=i.childLanes=1073741824,i.memoizedState={baseLanes:n,cachePool:null,transitions:null},i.updateQueue=null,vt(gi,Pn),Pn|=n,null;i.memoizedState={baseLanes:0,cachePool:null,transitions:null},d=y!==null?y.baseLanes:l,vt(gi,Pn),Pn|=d}else y!==null?(d=y.baseLanes|l,i.memoizedState=null):d=l,vt(gi,Pn),Pn|=d;return ln(n,i,m,l),i.child}function Hh(n,i){var l=i.ref;(n===null&&l!==null||n!==null&&n.ref!==l)&&(i.flags|=512,i.flags|=2097152)}function kd(n,i,l,d,m){var y=fn(l)?xo:Zt.current;return y=si(i,y),fi(i,m),l=md(n,i,l,d,y,m),d=hd(),n!==null&&!pn?(i.updateQueue=n.updateQueue,i.flags&=-2053,n.lanes&=~m,Lr(n,i,m)):(St&&d&&Xu(i),i.flags|=1,ln(n,i,l,m),i.child)}function Yh(n,i,l,d,m){if(fn(l)){var y=!0;il(i)}else y=!1;if(fi(i,m),i.stateNode===null)Cl(n,i),Ah(i,l,d),wd(i,l,d,m),d=!0;else if(n===null){var E=i.stateNode,z=i.memoizedProps;E.props=z;var G=E.context,ce=l.contextType;typeof ce=="object"&&ce!==null?ce=Ln(ce):(ce=fn(l)?xo:Zt.current,ce=si(i,ce));var Te=l.getDerivedStateFromProps,Pe=typeof Te=="function"||typeof E.getSnapshotBeforeUpdate=="function";Pe||typeof E.UNSAFE_componentWillReceiveProps!="function"&&typeof E.componentWillReceiveProps!="function"||(z!==d||G!==ce)&&Nh(i,E,d,ce),ro=!1;var ke=i.memoizedState;E.state=ke,ml(i,d,E,m),G=i.memoizedState,z!==d||ke!==G||dn.current||ro?(typeof Te=="function"&&(xd(i,l,Te,d),G=i.memoizedState),(z=ro||$h(i,l,z,d,ke,G,ce))?(Pe||typeof E.UNSAFE_componentWillMount!="function"&&typeof E.componentWillMount!="function"||(typeof E.componentWillMount=="function"&&E.componentWillMount(),typeof E.UNSAFE_componentWillMount=="function"&&E.UNSAFE_componentWillMount()),typeof E.componentDidMount=="function"&&(i.flags|=4194308)):(typeof E.componentDidMount=="function"&&(i.flags|=4194308),i.memoizedProps=d,i.memoizedState=G),E.props=d,E.state=G,E.context=ce,d=z):(typeof E.componentDidMount=="function"&&(i.flags|=4194308),d=!1)}else{E=i.stateNode,lh(n,i),z=i.memoizedProps,ce=i.type===i.elementType?z:nr(i.type,z),E.props=ce,Pe=i.pendingProps,ke=E.context,G=l.contextType,typeof G=="object"&&G!==null?G=Ln(G):(G=fn(l)?xo:Zt.current,G=si(i,G));var Ne=l.getDerivedStateFromProps;(Te=typeof Ne=="function"||typeof E.getSnapshotBeforeUpdate=="function")||typeof E.UNSAFE_componentWillReceiveProps!="function"&&typeof E.componentWillReceiveProps!="function"||(z!==Pe||ke!==G)&&Nh(i,E,d,G),ro=!1,ke=i.memoizedState,E.state=ke,ml(i,d,E,m);var Ve=i.memoizedState;z!==Pe||ke!==Ve||dn.current||ro?(typeof Ne=="function"&&(xd(i,l,Ne,d),Ve=i.memoizedState),(ce=ro||$h(i,l,ce,d,ke,Ve,G)||!1)?(Te||typeof E.UNSAFE_componentWillUpdate!="function"&&typeof E.componentWillUpdate!="function"||(typeof E.componentWillUpdate=="function"&&E.componentWillUpdate(d,Ve,G),typeof E.UNSAFE_componentWillUpdate=="function"&&E.UNSAFE_componentWillUpdate(d,Ve,G)),typeof E.componentDidUpdate=="function"&&(i.flags|=4),typeof E.getSnapshotBeforeUpdate=="function"&&(i.flags|=1024)):(typeof E.componentDidUpdate!="function"||z===n.memoizedProps&&ke===n.memoizedState||(i.flags|=4),typeof E.getSnapshotBeforeUpdate!="function"||z===n.memoizedProps&&ke===n.memoizedState||(i.flags|=1024),i.memoizedProps=d,i.memoizedState=Ve),E.props=d,E.state=Ve,E.context=G,d=ce):(typeof E.componentDidUpdate!="function"||z===n.memoizedProps&&ke===n.memoizedState||(i.flags|=4),typeof E.getSnapshotBeforeUpdate!="function"||z===n.memoizedProps&&ke===n.memoizedState||(i.flags|=1024),d=!1)}return Td(n,i,l,d,y,m)}function Td(n,i,l,d,m,y){Hh(n,i);var E=(i.flags&128)!==0;if(!d&&!E)return m&&Xm(i,l,!1),Lr(n,i,y);d=i.stateNode,Xw.current=i;var z=E&&typeof l.getDerivedStateFromError!="function"?null:d.render();return i.flags|=1,n!==null&&E?(i.child=ui(i,n.child,null,y),i.child=ui(i,null,z,y)):ln(n,i,z,y),i.memoizedState=d.state,m&&Xm(i,l,!0),i.child}function Kh(n){var i=n.stateNode;i.pendingContext?Gm(n,i.pendingContext,i.pendingContext!==i.context):i.context&&Gm(n,i.context,!1),ld(n,i.containerInfo)}function qh(n,i,l,d,m){return ci(),td(m),i.flags|=256,ln(n,i,l,d),i.child}var Pd={dehydrated:null,treeContext:null,retryLane:0};function Md(n){return{baseLanes:n,cachePool:null,transitions:null}}function Gh(n,i,l){var d=i.pendingProps,m=Pt.current,y=!1,E=(i.flags&128)!==0,z;if((z=E)||(z=n!==null&&n.memoizedState===null?!1:(m&2)!==0),z?(y=!0,i.flags&=-129):(n===null||n.memoizedState!==null)&&(m|=1),vt(Pt,m&1),n===null)return ed(i),n=i.memoizedState,n!==null&&(n=n.dehydrated,n!==null)?(i.mode&1?n.data==="$!"?i.lanes=8:i.lanes=1073741824:i.lanes=1,null):(E=d.children,n=d.fallback,y?(d=i.mode,y=i.child,E={mode:"hidden",children:E},!(d&1)&&y!==null?(y.childLanes=0,y.pendingProps=E):y=Nl(E,d,0,null),n=Eo(n,d,l,null),y.return=i,n.return=i,y.sibling=n,i.child=y,i.child.memoizedState=Md(l),i.memoizedState=Pd,n):Rd(i,E));if(m=n.memoizedState,m!==null&&(z=m.dehydrated,z!==null))return Zw(n,i,E,d,z,m,l);if(y){y=d.fallback,E=i.mode,m=n.child,z=m.sibling;var G={mode:"hidden",children:d.children};return!(E&1)&&i.child!==m?(d=i.child,d.childLanes=0,d.pendingProps=G,i.deletions=null):(d=uo(m,G),d.subtreeFlags=m.subtreeFlags&14680064),z!==null?y=uo(z,y):(y=Eo(y,E,l,null),y.flags|=2),y.return=i,d.return=i,d.sibling=y,i.child=d,d=y,y=i.child,E=n.child.memoizedState,E=E===null?Md(l):{baseLanes:E.baseLanes|l,cachePool:null,transitions:E.transitions},y.memoizedState=E,y.childLanes=n.childLanes&~l,i.memoizedState=Pd,d}return y=n.child,n=y.sibling,d=uo(y,{mode:"visible",children:d.children}),!(i.mode&1)&&(d.lanes=l),d.return=i,d.sibling=null,n!==null&&(l=i.deletions,l===null?(i.deletions=[n],i.flags|=16):l.push(n)),i.child=d,i.memoizedState=null,d}function Rd(n,i){return i=Nl({mode:"visible",children:i},n.mode,0,null),i.return=n,n.child=i}function Sl(n,i,l,d){return d!==null&&td(d),ui(i,n.child,null,l),n=Rd(i,i.pendingProps.children),n.flags|=2,i.memoizedState=null,n}function Zw(n,i,l,d,m,y,E){if(l)return i.flags&256?(i.flags&=-257,d=Sd(Error(r(422))),Sl(n,i,E,d)):i.memoizedState!==null?(i.child=n.child,i.flags|=128,null):(y=d.fallback,m=i.mode,d=Nl({mode:"visible",children:d.children},m,0,null),y=Eo(y,m,E,null),y.flags|=2,d.return=i,y.return=i,d.sibling=y,i.child=d,i.mode&1&&ui(i,n.child,null,E),i.child.memoizedState=Md(E),i.memoizedState=Pd,y);if(!(i.mode&1))return Sl(n,i,E,null);if(m.data==="$!"){if(d=m.nextSibling&&m.nextSibling.dataset,d)var z=d.dgst;return d=z,y=Error(r(419)),d=Sd(y,d,void 0),Sl(n,i,E,d)}if(z=(E&n.childLanes)!==0,pn||z){if(d=Ht,d!==null){switch(E&-E){case 4:m=2;break;case 16:m=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:m=32;break;case 536870912:m=268435456;break;default:m=0}m=m&(d.suspendedLanes|E)?0:m,m!==0&&m!==y.retryLane&&(y.retryLane=m,Ar(n,m),ir(d,n,m,-1))}return Ud(),d=Sd(Error(r(421))),Sl(n,i,E,d)}return m.data==="$?"?(i.flags|=128,i.child=n.child,i=dS.bind(null,n),m._reactRetry=i,null):(n=y.treeContext,Tn=Jr(m.nextSibling),kn=i,St=!0,tr=null,n!==null&&(An[Nn++]=Or,An[Nn++]=$r,An[Nn++]=wo,Or=n.id,$r=n.overflow,wo=i),i=Rd(i,d.children),i.flags|=4096,i)}function Qh(n,i,l){n.lanes|=i;var d=n.alternate;d!==null&&(d.lanes|=i),id(n.return,i,l)}function Dd(n,i,l,d,m){var y=n.memoizedState;y===null?n.memoizedState={isBackwards:i,rendering:null,renderingStartTime:0,last:d,tail:l,tailMode:m}:(y.isBackwards=i,y.rendering=null,y.renderingStartTime=0,y.last=d,y.tail=l,y.tailMode=m)}function Xh(n,i,l){var d=i.pendingProps,m=d.revealOrder,y=d.tail;if(ln(n,i,d.children,l),d=Pt.current,d&2)d=d&1|2,i.flags|=128;else{if(n!==null&&n.flags&128)e:for(n=i.child;n!==null;){if(n.tag===13)n.memoizedState!==null&&Qh(n,l,i);else if(n.tag===19)Qh(n,l,i);else if(n.child!==null){n.child.return=n,n=n.child;continue}if(n===i)break e;for(;n.sibling===null;){if(n.return===null||n.return===i)break e;n=n.return}n.sibling.return=n.return,n=n.sibling}d&=1}if(vt(Pt,d),!(i.mode&1))i.memoizedState=null;else switch(m){case"forwards":for(l=i.child,m=null;l!==null;)n=l.alternate,n!==null&&hl(n)===null&&(m=l),l=l.sibling;l=m,l===null?(m=i.child,i.child=null):(m=l.sibling,l.sibling=null),Dd(i,!1,m,l,y);break;case"backwards":for(l=null,m=i.child,i.child=null;m!==null;){if(n=m.alternate,n!==null&&hl(n)===null){i.child=m;break}n=m.sibling,m.sibling=l,l=m,m=n}Dd(i,!0,l,null,y);break;case"together":Dd(i,!1,null,null,void 0);break;default:i.memoizedState=null}return i.child}function Cl(n,i){!(i.mode&1)&&n!==null&&(n.alternate=null,i.alternate=null,i.flags|=2)}function Lr(n,i,l){if(n!==null&&(i.dependencies=n.dependencies),Po|=i.lanes,!(l&i.childLanes))return null;if(n!==null&&i.child!==n.child)throw Error(r(153));if(i.child!==null){for(n=i.child,l=uo(n,n.pendingProps),i.child=l,l.return=i;n.sibling!==null;)n=n.sibling,l=l.sibling=uo(n,n.pendingProps),l.return=i;l.sibling=null}return i.child}function Jw(n,i,l){switch(i.tag){case 3:Kh(i),ci();break;case 5:dh(i);break;case 1:fn(i.type)&&il(i);break;case 4:ld(i,i.stateNode.containerInfo);break;case 10:var d=i.type._context,m=i.memoizedProps.value;vt(dl,d._currentValue),d._currentValue=m;break;case 13:if(d=i.memoizedState,d!==null)return d.dehydrated!==null?(vt(Pt,Pt.current&1),i.flags|=128,null):l&i.child.childLanes?Gh(n,i,l):(vt(Pt,Pt.current&1),n=Lr(n,i,l),n!==null?n.sibling:null);vt(Pt,Pt.current&1);break;case 19:if(d=(l&i.childLanes)!==0,n.flags&128){if(d)return Xh(n,i,l);i.flags|=128}if(m=i.memoizedState,m!==null&&(m.rendering=null,m.tail=null,m.lastEffect=null),vt(Pt,Pt.current),d)break;return null;case 22:case 23:return i.lanes=0,Uh(n,i,l)}return Lr(n,i,l)}var Zh,Ed,Jh,eg;Zh=function(n,i){for(var l=i.child;l!==null;){if(l.tag===5||l.tag===6)n.appendChild(l.stateNode);else if(l.tag!==4&&l.child!==null){l.child.return=l,l=l.child;continue}if(l===i)break;for(;l.sibling===null;){if(l.return===null||l.return===i)return;l=l.return}l.sibling.return=l.return,l=l.sibling}},Ed=function(){},Jh=function(n,i,l,d){var m=n.memoizedProps;if(m!==d){n=i.stateNode,ko(yr.current);var y=null;switch(l){case"input":m=me(n,m),d=me(n,d),y=[];break;case"select":m=q({},m,{value:void 0}),d=q({},d,{value:void 0}),y=[];break;case"textarea":m=Oe(n,m),d=Oe(n,d),y=[];break;default:typeof m.onClick!="function"&&typeof d.onClick=="function"&&(n.onclick=nl)}De(l,d);var E;l=null;for(ce in m)if(!d.hasOwnProperty(ce)&&m.hasOwnProperty(ce)&&m[ce]!=null)if(ce==="style"){var z=m[ce];for(E in z)z.hasOwnProperty(E)&&(l||(l={}),l[E]="")}else ce!=="dangerouslySetInnerHTML"&&ce!=="children"&&ce!=="suppressContentEditableWarning"&&ce!=="suppressHydrationWarning"&&ce!=="autoFocus"&&(s.hasOwnProperty(ce)?y||(y=[]):(y=y||[]).push(ce,null));for(ce in d){var G=d[ce];if(z=m!=null?m[ce]:void 0,d.hasOwnProperty(ce)&&G!==z&&(G!=null||z!=null))if(ce==="style")if(z){for(E in z)!z.hasOwnProperty(E)||G&&G.hasOwnProperty(E)||(l||(l={}),l[E]="");for(E in G)G.hasOwnProperty(E)&&z[E]!==G[E]&&(l||(l={}),l[E]=G[E])}else l||(y||(y=[]),y.push(ce,l)),l=G;else ce==="dangerouslySetInnerHTML"?(G=G?G.__html:void 0,z=z?z.__html:void 0,G!=null&&z!==G&&(y=y||[]).push(ce,G)):ce==="children"?typeof G!="string"&&typeof G!="number"||(y=y||[]).push(ce,""+G):ce!=="suppressContentEditableWarning"&&ce!=="suppressHydrationWarning"&&(s.hasOwnProperty(ce)?(G!=null&&ce==="onScroll"&&xt("scroll",n),y||z===G||(y=[])):(y=y||[]).push(ce,G))}l&&(y=y||[]).push("style",l);var ce=y;(i.updateQueue=ce)&&(i.flags|=4)}},eg=function(n,i,l,d){l!==d&&(i.flags|=4)};function Rs(n,i){if(!St)switch(n.tailMode){case"hidden":i=n.tail;for(var l=null;i!==null;)i.alternate!==null&&(l=i),i=i.sibling;l===null?n.tail=null:l.sibling=null;break;case"collapsed":l=n.tail;for(var d=null;l!==null;)l.alternate!==null&&(d=l),l=l.sibling;d===null?i||n.tail===null?n.tail=null:n.tail.sibling=null:d.sibling=null}}function en(n){var i=n.alternate!==null&&n.alternate.child===n.child,l=0,d=0;if(i)for(var m=n.child;m!==null;)l|=m.lanes|m.childLanes,d|=m.subtreeFlags&14680064,d|=m.flags&14680064,m.return=n,m=m.sibling;else for(m=n.child;m!==null;)l|=m.lanes|m.childLanes,d|=m.subtreeFlags,d|=m.flags,m.return=n,m=m.sibling;return n.subtreeFlags|=d,n.childLanes=l,i}function eS(n,i,l){var d=i.pendingProps;switch(Zu(i),i.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return en(i),null;case 1:return fn(i.type)&&ol(),en(i),null;case 3:return d=i.stateNode,pi(),wt(dn),wt(Zt),dd(),d.pendingContext&&(d.context=d.pendingContext,d.pendingContext=null),(n===null||n.child===null)&&(cl(i)?i.flags|=4:n===null||n.memoizedState.isDehydrated&&!(i.flags&256)||(i.flags|=1024,tr!==null&&(zd(tr),tr=null))),Ed(n,i),en(i),null;case 5:cd(i);var m=ko(Cs.current);if(l=i.type,n!==null&&i.stateNode!=null)Jh(n,i,l,d,m),n.ref!==i.ref&&(i.flags|=512,i.flags|=2097152);else{if(!d){if(i.stateNode===null)throw Error(r(166));return en(i),null}if(n=ko(yr.current),cl(i)){d=i.stateNode,l=i.type;var y=i.memoizedProps;switch(d[gr]=i,d[vs]=y,n=(i.mode&1)!==0,l){case"dialog":xt("cancel",d),xt("close",d);break;case"iframe":case"object":case"embed":xt("load",d);break;case"video":case"audio":for(m=0;m<hs.length;m++)xt(hs[m],d);break;case"source":xt("error",d);break;case"img":case"image":case"link":xt("error",d),xt("load",d);break;case"details":xt("toggle",d);break;case"input":xe(d,y),xt("invalid",d);break;case"select":d._wrapperState={wasMultiple:!!y.multiple},xt("invalid",d);break;case"textarea":mt(d,y),xt("invalid",d)}De(l,y),m=null;for(var E in y)if(y.hasOwnProperty(E)){var z=y[E];E==="children"?typeof z=="string"?d.textContent!==z&&(y.suppressHydrationWarning!==!0&&tl(d.textContent,z,n),m=["children",z]):typeof z=="number"&&d.textContent!==""+z&&(y.suppressHydrationWarning!==!0&&tl(d.textContent,z,n),m=["children",""+z]):s.hasOwnProperty(E)&&z!=null&&E==="onScroll"&&xt("scroll",d)}switch(l){case"input":be(d),ge(d,y,!0);break;case"textarea":be(d),tt(d);break;case"select":case"option":break;default:typeof y.onClick=="function"&&(d.onclick=nl)}d=m,i.updateQueue=d,d!==null&&(i.flags|=4)}else{E=m.nodeType===9?m:m.ownerDocument,n==="http://www.w3.org/1999/xhtml"&&(n=ht(l)),n==="http://www.w3.org/1999/xhtml"?l==="script"?(n=E.createElement("div"),n.innerHTML="<script><\/script>",n=n.removeChild(n.firstChild)):typeof d.is=="string"?n=E.createElement(l,{is:d.is}):(n=E.createElement(l),l==="select"&&(E=n,d.multiple?E.multiple=!0:d.size&&(E.size=d.size))):n=E.createElementNS(n,l),n[gr]=i,n[vs]=d,Zh(n,i,!1,!1),i.stateNode=n;e:{switch(E=_e(l,d),l){case"dialog":xt("cancel",n),xt("close",n),m=d;break;case"iframe":case"object":case"embed":xt("load",n),m=d;break;case"video":case"audio":for(m=0;m<hs.length;m++)xt(hs[m],n);m=d;break;case"source":xt("error",n),m=d;break;case"img":case"image":case"link":xt("error",n),xt("load",n),m=d;break;case"details":xt("toggle",n),m=d;break;case"input":xe(n,d),m=me(n,d),xt("invalid",n);break;case"option":m=d;break;case"select":n._wrapperState={wasMultiple:!!d.multiple},m=q({},d,{value:void 0}),xt("invalid",n);break;case"textarea":mt(n,d),m=Oe(n,d),xt("invalid",n);break;default:m=d}De(l,m),z=m;for(y in z)if(z.hasOwnProperty(y)){var G=z[y];y==="style"?$n(n,G):y==="dangerouslySetInnerHTML"?(G=G?G.__html:void 0,G!=null&&Xt(n,G)):y==="children"?typeof G=="string"?(l!=="textarea"||G!=="")&&Wt(n,G):typeof G=="number"&&Wt(n,""+G):y!=="suppressContentEditableWarning"&&y!=="suppressHydrationWarning"&&y!=="autoFocus"&&(s.hasOwnProperty(y)?G!=null&&y==="onScroll"&&xt("scroll",n):G!=null&&P(n,y,G,E))}switch(l){case"input":be(n),ge(n,d,!1);break;case"textarea":be(n),tt(n);break;case"option":d.value!=null&&n.setAttribute("value",""+J(d.value));break;case"select":n.multiple=!!d.multiple,y=d.value,y!=null?Ie(n,!!d.multiple,y,!1):d.defaultValue!=null&&Ie(n,!!d.multiple,d.defaultValue,!0);break;default:typeof m.onClick=="function"&&(n.onclick=nl)}switch(l){case"button":case"input":case"select":case"textarea":d=!!d.autoFocus;break e;case"img":d=!0;break e;default:d=!1}}d&&(i.flags|=4)}i.ref!==null&&(i.flags|=512,i.flags|=2097152)}return en(i),null;case 6:if(n&&i.stateNode!=null)eg(n,i,n.memoizedProps,d);else{if(typeof d!="string"&&i.stateNode===null)throw Error(r(166));if(l=ko(Cs.current),ko(yr.current),cl(i)){if(d=i.stateNode,l=i.memoizedProps,d[gr]=i,(y=d.nodeValue!==l)&&(n=kn,n!==null))switch(n.tag){case 3:tl(d.nodeValue,l,(n.mode&1)!==0);break;case 5:n.memoizedProps.suppressHydrationWarning!==!0&&tl(d.nodeValue,l,(n.mode&1)!==0)}y&&(i.flags|=4)}else d=(l.nodeType===9?l:l.ownerDocument).createTextNode(d),d[gr]=i,i.stateNode=d}return en(i),null;case 13:if(wt(Pt),d=i.memoizedState,n===null||n.memoizedState!==null&&n.memoizedState.dehydrated!==null){if(St&&Tn!==null&&i.mode&1&&!(i.flags&128))rh(),ci(),i.flags|=98560,y=!1;else if(y=cl(i),d!==null&&d.dehydrated!==null){if(n===null){if(!y)throw Error(r(318));if(y=i.memoizedState,y=y!==null?y.dehydrated:null,!y)throw Error(r(317));y[gr]=i}else ci(),!(i.flags&128)&&(i.memoizedState=null),i.flags|=4;en(i),y=!1}else tr!==null&&(zd(tr),tr=null),y=!0;if(!y)return i.flags&65536?i:null}return i.flags&128?(i.lanes=l,i):(d=d!==null,d!==(n!==null&&n.memoizedState!==null)&&d&&(i.child.flags|=8192,i.mode&1&&(n===null||Pt.current&1?_t===0&&(_t=3):Ud())),i.updateQueue!==null&&(i.flags|=4),en(i),null);case 4:return pi(),Ed(n,i),n===null&&gs(i.stateNode.containerInfo),en(i),null;case 10:return od(i.type._context),en(i),null;case 17:return fn(i.type)&&ol(),en(i),null;case 19:if(wt(Pt),y=i.memoizedState,y===null)return en(i),null;if(d=(i.flags&128)!==0,E=y.rendering,E===null)if(d)Rs(y,!1);else{if(_t!==0||n!==null&&n.flags&128)for(n=i.child;n!==null;){if(E=hl(n),E!==null){for(i.flags|=128,Rs(y,!1),d=E.updateQueue,d!==null&&(i.updateQueue=d,i.flags|=4),i.subtreeFlags=0,d=l,l=i.child;l!==null;)y=l,n=d,y.flags&=14680066,E=y.alternate,E===null?(y.childLanes=0,y.lanes=n,y.child=null,y.subtreeFlags=0,y.memoizedProps=null,y.memoizedState=null,y.updateQueue=null,y.dependencies=null,y.stateNode=null):(y.childLanes=E.childLanes,y.lanes=E.lanes,y.child=E.child,y.subtreeFlags=0,y.deletions=null,y.memoizedProps=E.memoizedProps,y.memoizedState=E.memoizedState,y.updateQueue=E.updateQueue,y.type=E.type,n=E.dependencies,y.dependencies=n===null?null:{lanes:n.lanes,firstContext:n.firstContext}),l=l.sibling;return vt(Pt,Pt.current&1|2),i.child}n=n.sibling}y.tail!==null&&$t()>yi&&(i.flags|=128,d=!0,Rs(y,!1),i.lanes=4194304)}else{if(!d)if(n=hl(E),n!==null){if(i.flags|=128,d=!0,l=n.updateQueue,l!==null&&(i.updateQueue=l,i.flags|=4),Rs(y,!0),y.tail===null&&y.tailMode==="hidden"&&!E.alternate&&!St)return en(i),null}else 2*$t()-y.renderingStartTime>yi&&l!==1073741824&&(i.flags|=128,d=!0,Rs(y,!1),i.lanes=4194304);y.isBackwards?(E.sibling=i.child,i.child=E):(l=y.last,l!==null?l.sibling=E:i.child=E,y.last=E)}return y.tail!==null?(i=y.tail,y.rendering=i,y.tail=i.sibling,y.renderingStartTime=$t(),i.sibling=null,l=Pt.current,vt(Pt,d?l&1|2:l&1),i):(en(i),null);case 22:case 23:return Wd(),d=i.memoizedState!==null,n!==null&&n.memoizedState!==null!==d&&(i.flags|=8192),d&&i.mode&1?Pn&1073741824&&(en(i),i.subtreeFlags&6&&(i.flags|=8192)):en(i),null;case 24:return null;case 25:return null}throw Error(r(156,i.tag))}function tS(n,i){switch(Zu(i),i.tag){case 1:return fn(i.type)&&ol(),n=i.flags,n&65536?(i.flags=n&-65537|128,i):null;case 3:return pi(),wt(dn),wt(Zt),dd(),n=i.flags,n&65536&&!(n&128)?(i.flags=n&-65537|128,i):null;case 5:return cd(i),null;case 13:if(wt(Pt),n=i.memoizedState,n!==null&&n.dehydrated!==null){if(i.alternate===null)throw Error(r(340));ci()}return n=i.flags,n&65536?(i.flags=n&-65537|128,i):null;case 19:return wt(Pt),null;case 4:return pi(),null;case 10:return od(i.type._context),null;case 22:case 23:return Wd(),null;case 24:return null;default:return null}}var kl=!1,tn=!1,nS=typeof WeakSet=="function"?WeakSet:Set,Be=null;function hi(n,i){var l=n.ref;if(l!==null)if(typeof l=="function")try{l(null)}catch(d){Dt(n,i,d)}else l.current=null}function Id(n,i,l){try{l()}catch(d){Dt(n,i,d)}}var tg=!1;function rS(n,i){if(Wu=Ua,n=$m(),Nu(n)){if("selectionStart"in n)var l={start:n.selectionStart,end:n.selectionEnd};else e:{l=(l=n.ownerDocument)&&l.defaultView||window;var d=l.getSelection&&l.getSelection();if(d&&d.rangeCount!==0){l=d.anchorNode;var m=d.anchorOffset,y=d.focusNode;d=d.focusOffset;try{l.nodeType,y.nodeType}catch{l=null;break e}var E=0,z=-1,G=-1,ce=0,Te=0,Pe=n,ke=null;t:for(;;){for(var Ne;Pe!==l||m!==0&&Pe.nodeType!==3||(z=E+m),Pe!==y||d!==0&&Pe.nodeType!==3||(G=E+d),Pe.nodeType===3&&(E+=Pe.nodeValue.length),(Ne=Pe.firstChild)!==null;)ke=Pe,Pe=Ne;for(;;){if(Pe===n)break t;if(ke===l&&++ce===m&&(z=E),ke===y&&++Te===d&&(G=E),(Ne=Pe.nextSibling)!==null)break;Pe=ke,ke=Pe.parentNode}Pe=Ne}l=z===-1||G===-1?null:{start:z,end:G}}else l=null}l=l||{start:0,end:0}}else l=null;for(Uu={focusedElem:n,selectionRange:l},Ua=!1,Be=i;Be!==null;)if(i=Be,n=i.child,(i.subtreeFlags&1028)!==0&&n!==null)n.return=i,Be=n;else for(;Be!==null;){i=Be;try{var Ve=i.alternate;if(i.flags&1024)switch(i.tag){case 0:case 11:case 15:break;case 1:if(Ve!==null){var je=Ve.memoizedProps,At=Ve.memoizedState,oe=i.stateNode,X=oe.getSnapshotBeforeUpdate(i.elementType===i.type?je:nr(i.type,je),At);oe.__reactInternalSnapshotBeforeUpdate=X}break;case 3:var se=i.stateNode.containerInfo;se.nodeType===1?se.textContent="":se.nodeType===9&&se.documentElement&&se.removeChild(se.documentElement);break;case 5:case 6:case 4:case 17:break;default:throw Error(r(163))}}catch(Re){Dt(i,i.return,Re)}if(n=i.sibling,n!==null){n.return=i.return,Be=n;break}Be=i.return}return Ve=tg,tg=!1,Ve}function Ds(n,i,l){var d=i.updateQueue;if(d=d!==null?d.lastEffect:null,d!==null){var m=d=d.next;do{if((m.tag&n)===n){var y=m.destroy;m.destroy=void 0,y!==void 0&&Id(i,l,y)}m=m.next}while(m!==d)}}function Tl(n,i){if(i=i.updateQueue,i=i!==null?i.lastEffect:null,i!==null){var l=i=i.next;do{if((l.tag&n)===n){var d=l.create;l.destroy=d()}l=l.next}while(l!==i)}}function Od(n){var i=n.ref;if(i!==null){var l=n.stateNode;switch(n.tag){case 5:n=l;break;default:n=l}typeof i=="function"?i(n):i.current=n}}function ng(n){var i=n.alternate;i!==null&&(n.alternate=null,ng(i)),n.child=null,n.deletions=null,n.sibling=null,n.tag===5&&(i=n.stateNode,i!==null&&(delete i[gr],delete i[vs],delete i[qu],delete i[Vw],delete i[jw])),n.stateNode=null,n.return=null,n.dependencies=null,n.memoizedProps=null,n.memoizedState=null,n.pendingProps=null,n.stateNode=null,n.updateQueue=null}function rg(n){return n.tag===5||n.tag===3||n.tag===4}function og(n){e:for(;;){for(;n.sibling===null;){if(n.return===null||rg(n.return))return null;n=n.return}for(n.sibling.return=n.return,n=n.sibling;n.tag!==5&&n.tag!==6&&n.tag!==18;){if(n.flags&2||n.child===null||n.tag===4)continue e;n.child.return=n,n=n.child}if(!(n.flags&2))return n.stateNode}}function $d(n,i,l){var d=n.tag;if(d===5||d===6)n=n.stateNode,i?l.nodeType===8?l.parentNode.insertBefore(n,i):l.insertBefore(n,i):(l.nodeType===8?(i=l.parentNode,i.insertBefore(n,l)):(i=l,i.appendChild(n)),l=l._reactRootContainer,l!=null||i.onclick!==null||(i.onclick=nl));else if(d!==4&&(n=n.child,n!==null))for($d(n,i,l),n=n.sibling;n!==null;)$d(n,i,l),n=n.sibling}function Ad(n,i,l){var d=n.tag;if(d===5||d===6)n=n.stateNode,i?l.insertBefore(n,i):l.appendChild(n);else if(d!==4&&(n=n.child,n!==null))for(Ad(n,i,l),n=n.sibling;n!==null;)Ad(n,i,l),n=n.sibling}var Kt=null,rr=!1;function io(n,i,l){for(l=l.child;l!==null;)ig(n,i,l),l=l.sibling}function ig(n,i,l){if(hr&&typeof hr.onCommitFiberUnmount=="function")try{hr.onCommitFiberUnmount(Ba,l)}catch{}switch(l.tag){case 5:tn||hi(l,i);case 6:var d=Kt,m=rr;Kt=null,io(n,i,l),Kt=d,rr=m,Kt!==null&&(rr?(n=Kt,l=l.stateNode,n.nodeType===8?n.parentNode.removeChild(l):n.removeChild(l)):Kt.removeChild(l.stateNode));break;case 18:Kt!==null&&(rr?(n=Kt,l=l.stateNode,n.nodeType===8?Ku(n.parentNode,l):n.nodeType===1&&Ku(n,l),as(n)):Ku(Kt,l.stateNode));break;case 4:d=Kt,m=rr,Kt=l.stateNode.containerInfo,rr=!0,io(n,i,l),Kt=d,rr=m;break;case 0:case 11:case 14:case 15:if(!tn&&(d=l.updateQueue,d!==null&&(d=d.lastEffect,d!==null))){m=d=d.next;do{var y=m,E=y.destroy;y=y.tag,E!==void 0&&(y&2||y&4)&&Id(l,i,E),m=m.next}while(m!==d)}io(n,i,l);break;case 1:if(!tn&&(hi(l,i),d=l.stateNode,typeof d.componentWillUnmount=="function"))try{d.props=l.memoizedProps,d.state=l.memoizedState,d.componentWillUnmount()}catch(z){Dt(l,i,z)}io(n,i,l);break;case 21:io(n,i,l);break;case 22:l.mode&1?(tn=(d=tn)||l.memoizedState!==null,io(n,i,l),tn=d):io(n,i,l);break;default:io(n,i,l)}}function sg(n){var i=n.updateQueue;if(i!==null){n.updateQueue=null;var l=n.stateNode;l===null&&(l=n.stateNode=new nS),i.forEach(function(d){var m=fS.bind(null,n,d);l.has(d)||(l.add(d),d.then(m,m))})}}function or(n,i){var l=i.deletions;if(l!==null)for(var d=0;d<l.length;d++){var m=l[d];try{var y=n,E=i,z=E;e:for(;z!==null;){switch(z.tag){case 5:Kt=z.stateNode,rr=!1;break e;case 3:Kt=z.stateNode.containerInfo,rr=!0;break e;case 4:Kt=z.stateNode.containerInfo,rr=!0;break e}z=z.return}if(Kt===null)throw Error(r(160));ig(y,E,m),Kt=null,rr=!1;var G=m.alternate;G!==null&&(G.return=null),m.return=null}catch(ce){Dt(m,i,ce)}}if(i.subtreeFlags&12854)for(i=i.child;i!==null;)ag(i,n),i=i.sibling}function ag(n,i){var l=n.alternate,d=n.flags;switch(n.tag){case 0:case 11:case 14:case 15:if(or(i,n),br(n),d&4){try{Ds(3,n,n.return),Tl(3,n)}catch(je){Dt(n,n.return,je)}try{Ds(5,n,n.return)}catch(je){Dt(n,n.return,je)}}break;case 1:or(i,n),br(n),d&512&&l!==null&&hi(l,l.return);break;case 5:if(or(i,n),br(n),d&512&&l!==null&&hi(l,l.return),n.flags&32){var m=n.stateNode;try{Wt(m,"")}catch(je){Dt(n,n.return,je)}}if(d&4&&(m=n.stateNode,m!=null)){var y=n.memoizedProps,E=l!==null?l.memoizedProps:y,z=n.type,G=n.updateQueue;if(n.updateQueue=null,G!==null)try{z==="input"&&y.type==="radio"&&y.name!=null&&he(m,y),_e(z,E);var ce=_e(z,y);for(E=0;E<G.length;E+=2){var Te=G[E],Pe=G[E+1];Te==="style"?$n(m,Pe):Te==="dangerouslySetInnerHTML"?Xt(m,Pe):Te==="children"?Wt(m,Pe):P(m,Te,Pe,ce)}switch(z){case"input":de(m,y);break;case"textarea":lt(m,y);break;case"select":var ke=m._wrapperState.wasMultiple;m._wrapperState.wasMultiple=!!y.multiple;var Ne=y.value;Ne!=null?Ie(m,!!y.multiple,Ne,!1):ke!==!!y.multiple&&(y.defaultValue!=null?Ie(m,!!y.multiple,y.defaultValue,!0):Ie(m,!!y.multiple,y.multiple?[]:"",!1))}m[vs]=y}catch(je){Dt(n,n.return,je)}}break;case 6:if(or(i,n),br(n),d&4){if(n.stateNode===null)throw Error(r(162));m=n.stateNode,y=n.memoizedProps;try{m.nodeValue=y}catch(je){Dt(n,n.return,je)}}break;case 3:if(or(i,n),br(n),d&4&&l!==null&&l.memoizedState.isDehydrated)try{as(i.containerInfo)}catch(je){Dt(n,n.return,je)}break;case 4:or(i,n),br(n);break;case 13:or(i,n),br(n),m=n.child,m.flags&8192&&(y=m.memoizedState!==null,m.stateNode.isHidden=y,!y||m.alternate!==null&&m.alternate.memoizedState!==null||(Fd=$t())),d&4&&sg(n);break;case 22:if(Te=l!==null&&l.memoizedState!==null,n.mode&1?(tn=(ce=tn)||Te,or(i,n),tn=ce):or(i,n),br(n),d&8192){if(ce=n.memoizedState!==null,(n.stateNode.isHidden=ce)&&!Te&&n.mode&1)for(Be=n,Te=n.child;Te!==null;){for(Pe=Be=Te;Be!==null;){switch(ke=Be,Ne=ke.child,ke.tag){case 0:case 11:case 14:case 15:Ds(4,ke,ke.return);break;case 1:hi(ke,ke.return);var Ve=ke.stateNode;if(typeof Ve.componentWillUnmount=="function"){d=ke,l=ke.return;try{i=d,Ve.props=i.memoizedProps,Ve.state=i.memoizedState,Ve.componentWillUnmount()}catch(je){Dt(d,l,je)}}break;case 5:hi(ke,ke.return);break;case 22:if(ke.memoizedState!==null){ug(Pe);continue}}Ne!==null?(Ne.return=ke,Be=Ne):ug(Pe)}Te=Te.sibling}e:for(Te=null,Pe=n;;){if(Pe.tag===5){if(Te===null){Te=Pe;try{m=Pe.stateNode,ce?(y=m.style,typeof y.setProperty=="function"?y.setProperty("display","none","important"):y.display="none"):(z=Pe.stateNode,G=Pe.memoizedProps.style,E=G!=null&&G.hasOwnProperty("display")?G.display:null,z.style.display=un("display",E))}catch(je){Dt(n,n.return,je)}}}else if(Pe.tag===6){if(Te===null)try{Pe.stateNode.nodeValue=ce?"":Pe.memoizedProps}catch(je){Dt(n,n.return,je)}}else if((Pe.tag!==22&&Pe.tag!==23||Pe.memoizedState===null||Pe===n)&&Pe.child!==null){Pe.child.return=Pe,Pe=Pe.child;continue}if(Pe===n)break e;for(;Pe.sibling===null;){if(Pe.return===null||Pe.return===n)break e;Te===Pe&&(Te=null),Pe=Pe.return}Te===Pe&&(Te=null),Pe.sibling.return=Pe.return,Pe=Pe.sibling}}break;case 19:or(i,n),br(n),d&4&&sg(n);break;case 21:break;default:or(i,n),br(n)}}function br(n){var i=n.flags;if(i&2){try{e:{for(var l=n.return;l!==null;){if(rg(l)){var d=l;break e}l=l.return}throw Error(r(160))}switch(d.tag){case 5:var m=d.stateNode;d.flags&32&&(Wt(m,""),d.flags&=-33);var y=og(n);Ad(n,y,m);break;case 3:case 4:var E=d.stateNode.containerInfo,z=og(n);$d(n,z,E);break;default:throw Error(r(161))}}catch(G){Dt(n,n.return,G)}n.flags&=-3}i&4096&&(n.flags&=-4097)}function oS(n,i,l){Be=n,lg(n)}function lg(n,i,l){for(var d=(n.mode&1)!==0;Be!==null;){var m=Be,y=m.child;if(m.tag===22&&d){var E=m.memoizedState!==null||kl;if(!E){var z=m.alternate,G=z!==null&&z.memoizedState!==null||tn;z=kl;var ce=tn;if(kl=E,(tn=G)&&!ce)for(Be=m;Be!==null;)E=Be,G=E.child,E.tag===22&&E.memoizedState!==null?dg(m):G!==null?(G.return=E,Be=G):dg(m);for(;y!==null;)Be=y,lg(y),y=y.sibling;Be=m,kl=z,tn=ce}cg(n)}else m.subtreeFlags&8772&&y!==null?(y.return=m,Be=y):cg(n)}}function cg(n){for(;Be!==null;){var i=Be;if(i.flags&8772){var l=i.alternate;try{if(i.flags&8772)switch(i.tag){case 0:case 11:case 15:tn||Tl(5,i);break;case 1:var d=i.stateNode;if(i.flags&4&&!tn)if(l===null)d.componentDidMount();else{var m=i.elementType===i.type?l.memoizedProps:nr(i.type,l.memoizedProps);d.componentDidUpdate(m,l.memoizedState,d.__reactInternalSnapshotBeforeUpdate)}var y=i.updateQueue;y!==null&&uh(i,y,d);break;case 3:var E=i.updateQueue;if(E!==null){if(l=null,i.child!==null)switch(i.child.tag){case 5:l=i.child.stateNode;break;case 1:l=i.child.stateNode}uh(i,E,l)}break;case 5:var z=i.stateNode;if(l===null&&i.flags&4){l=z;var G=i.memoizedProps;switch(i.type){case"button":case"input":case"select":case"textarea":G.autoFocus&&l.focus();break;case"img":G.src&&(l.src=G.src)}}break;case 6:break;case 4:break;case 12:break;case 13:if(i.memoizedState===null){var ce=i.alternate;if(ce!==null){var Te=ce.memoizedState;if(Te!==null){var Pe=Te.dehydrated;Pe!==null&&as(Pe)}}}break;case 19:case 17:case 21:case 22:case 23:case 25:break;default:throw Error(r(163))}tn||i.flags&512&&Od(i)}catch(ke){Dt(i,i.return,ke)}}if(i===n){Be=null;break}if(l=i.sibling,l!==null){l.return=i.return,Be=l;break}Be=i.return}}function ug(n){for(;Be!==null;){var i=Be;if(i===n){Be=null;break}var l=i.sibling;if(l!==null){l.return=i.return,Be=l;break}Be=i.return}}function dg(n){for(;Be!==null;){var i=Be;try{switch(i.tag){case 0:case 11:case 15:var l=i.return;try{Tl(4,i)}catch(G){Dt(i,l,G)}break;case 1:var d=i.stateNode;if(typeof d.componentDidMount=="function"){var m=i.return;try{d.componentDidMount()}catch(G){Dt(i,m,G)}}var y=i.return;try{Od(i)}catch(G){Dt(i,y,G)}break;case 5:var E=i.return;try{Od(i)}catch(G){Dt(i,E,G)}}}catch(G){Dt(i,i.return,G)}if(i===n){Be=null;break}var z=i.sibling;if(z!==null){z.return=i.return,Be=z;break}Be=i.return}}var iS=Math.ceil,Pl=M.ReactCurrentDispatcher,Nd=M.ReactCurrentOwner,Bn=M.ReactCurrentBatchConfig,it=0,Ht=null,Vt=null,qt=0,Pn=0,gi=eo(0),_t=0,Es=null,Po=0,Ml=0,Ld=0,Is=null,mn=null,Fd=0,yi=1/0,Fr=null,Rl=!1,Bd=null,so=null,Dl=!1,ao=null,El=0,Os=0,Vd=null,Il=-1,Ol=0;function cn(){return it&6?$t():Il!==-1?Il:Il=$t()}function lo(n){return n.mode&1?it&2&&qt!==0?qt&-qt:_w.transition!==null?(Ol===0&&(Ol=om()),Ol):(n=pt,n!==0||(n=window.event,n=n===void 0?16:pm(n.type)),n):1}function ir(n,i,l,d){if(50<Os)throw Os=0,Vd=null,Error(r(185));ns(n,l,d),(!(it&2)||n!==Ht)&&(n===Ht&&(!(it&2)&&(Ml|=l),_t===4&&co(n,qt)),hn(n,d),l===1&&it===0&&!(i.mode&1)&&(yi=$t()+500,sl&&no()))}function hn(n,i){var l=n.callbackNode;_x(n,i);var d=za(n,n===Ht?qt:0);if(d===0)l!==null&&tm(l),n.callbackNode=null,n.callbackPriority=0;else if(i=d&-d,n.callbackPriority!==i){if(l!=null&&tm(l),i===1)n.tag===0?zw(pg.bind(null,n)):Zm(pg.bind(null,n)),Fw(function(){!(it&6)&&no()}),l=null;else{switch(im(d)){case 1:l=vu;break;case 4:l=nm;break;case 16:l=Fa;break;case 536870912:l=rm;break;default:l=Fa}l=wg(l,fg.bind(null,n))}n.callbackPriority=i,n.callbackNode=l}}function fg(n,i){if(Il=-1,Ol=0,it&6)throw Error(r(327));var l=n.callbackNode;if(vi()&&n.callbackNode!==l)return null;var d=za(n,n===Ht?qt:0);if(d===0)return null;if(d&30||d&n.expiredLanes||i)i=$l(n,d);else{i=d;var m=it;it|=2;var y=hg();(Ht!==n||qt!==i)&&(Fr=null,yi=$t()+500,Ro(n,i));do try{lS();break}catch(z){mg(n,z)}while(!0);rd(),Pl.current=y,it=m,Vt!==null?i=0:(Ht=null,qt=0,i=_t)}if(i!==0){if(i===2&&(m=bu(n),m!==0&&(d=m,i=jd(n,m))),i===1)throw l=Es,Ro(n,0),co(n,d),hn(n,$t()),l;if(i===6)co(n,d);else{if(m=n.current.alternate,!(d&30)&&!sS(m)&&(i=$l(n,d),i===2&&(y=bu(n),y!==0&&(d=y,i=jd(n,y))),i===1))throw l=Es,Ro(n,0),co(n,d),hn(n,$t()),l;switch(n.finishedWork=m,n.finishedLanes=d,i){case 0:case 1:throw Error(r(345));case 2:Do(n,mn,Fr);break;case 3:if(co(n,d),(d&130023424)===d&&(i=Fd+500-$t(),10<i)){if(za(n,0)!==0)break;if(m=n.suspendedLanes,(m&d)!==d){cn(),n.pingedLanes|=n.suspendedLanes&m;break}n.timeoutHandle=Yu(Do.bind(null,n,mn,Fr),i);break}Do(n,mn,Fr);break;case 4:if(co(n,d),(d&4194240)===d)break;for(i=n.eventTimes,m=-1;0<d;){var E=31-Jn(d);y=1<<E,E=i[E],E>m&&(m=E),d&=~y}if(d=m,d=$t()-d,d=(120>d?120:480>d?480:1080>d?1080:1920>d?1920:3e3>d?3e3:4320>d?4320:1960*iS(d/1960))-d,10<d){n.timeoutHandle=Yu(Do.bind(null,n,mn,Fr),d);break}Do(n,mn,Fr);break;case 5:Do(n,mn,Fr);break;default:throw Error(r(329))}}}return hn(n,$t()),n.callbackNode===l?fg.bind(null,n):null}function jd(n,i){var l=Is;return n.current.memoizedState.isDehydrated&&(Ro(n,i).flags|=256),n=$l(n,i),n!==2&&(i=mn,mn=l,i!==null&&zd(i)),n}function zd(n){mn===null?mn=n:mn.push.apply(mn,n)}function sS(n){for(var i=n;;){if(i.flags&16384){var l=i.updateQueue;if(l!==null&&(l=l.stores,l!==null))for(var d=0;d<l.length;d++){var m=l[d],y=m.getSnapshot;m=m.value;try{if(!er(y(),m))return!1}catch{return!1}}}if(l=i.child,i.subtreeFlags&16384&&l!==null)l.return=i,i=l;else{if(i===n)break;for(;i.sibling===null;){if(i.return===null||i.return===n)return!0;i=i.return}i.sibling.return=i.return,i=i.sibling}}return!0}function co(n,i){for(i&=~Ld,i&=~Ml,n.suspendedLanes|=i,n.pingedLanes&=~i,n=n.expirationTimes;0<i;){var l=31-Jn(i),d=1<<l;n[l]=-1,i&=~d}}function pg(n){if(it&6)throw Error(r(327));vi();var i=za(n,0);if(!(i&1))return hn(n,$t()),null;var l=$l(n,i);if(n.tag!==0&&l===2){var d=bu(n);d!==0&&(i=d,l=jd(n,d))}if(l===1)throw l=Es,Ro(n,0),co(n,i),hn(n,$t()),l;if(l===6)throw Error(r(345));return n.finishedWork=n.current.alternate,n.finishedLanes=i,Do(n,mn,Fr),hn(n,$t()),null}function _d(n,i){var l=it;it|=1;try{return n(i)}finally{it=l,it===0&&(yi=$t()+500,sl&&no())}}function Mo(n){ao!==null&&ao.tag===0&&!(it&6)&&vi();var i=it;it|=1;var l=Bn.transition,d=pt;try{if(Bn.transition=null,pt=1,n)return n()}finally{pt=d,Bn.transition=l,it=i,!(it&6)&&no()}}function Wd(){Pn=gi.current,wt(gi)}function Ro(n,i){n.finishedWork=null,n.finishedLanes=0;var l=n.timeoutHandle;if(l!==-1&&(n.timeoutHandle=-1,Lw(l)),Vt!==null)for(l=Vt.return;l!==null;){var d=l;switch(Zu(d),d.tag){case 1:d=d.type.childContextTypes,d!=null&&ol();break;case 3:pi(),wt(dn),wt(Zt),dd();break;case 5:cd(d);break;case 4:pi();break;case 13:wt(Pt);break;case 19:wt(Pt);break;case 10:od(d.type._context);break;case 22:case 23:Wd()}l=l.return}if(Ht=n,Vt=n=uo(n.current,null),qt=Pn=i,_t=0,Es=null,Ld=Ml=Po=0,mn=Is=null,Co!==null){for(i=0;i<Co.length;i++)if(l=Co[i],d=l.interleaved,d!==null){l.interleaved=null;var m=d.next,y=l.pending;if(y!==null){var E=y.next;y.next=m,d.next=E}l.pending=d}Co=null}return n}function mg(n,i){do{var l=Vt;try{if(rd(),gl.current=xl,yl){for(var d=Mt.memoizedState;d!==null;){var m=d.queue;m!==null&&(m.pending=null),d=d.next}yl=!1}if(To=0,Ut=zt=Mt=null,ks=!1,Ts=0,Nd.current=null,l===null||l.return===null){_t=1,Es=i,Vt=null;break}e:{var y=n,E=l.return,z=l,G=i;if(i=qt,z.flags|=32768,G!==null&&typeof G=="object"&&typeof G.then=="function"){var ce=G,Te=z,Pe=Te.tag;if(!(Te.mode&1)&&(Pe===0||Pe===11||Pe===15)){var ke=Te.alternate;ke?(Te.updateQueue=ke.updateQueue,Te.memoizedState=ke.memoizedState,Te.lanes=ke.lanes):(Te.updateQueue=null,Te.memoizedState=null)}var Ne=Vh(E);if(Ne!==null){Ne.flags&=-257,jh(Ne,E,z,y,i),Ne.mode&1&&Bh(y,ce,i),i=Ne,G=ce;var Ve=i.updateQueue;if(Ve===null){var je=new Set;je.add(G),i.updateQueue=je}else Ve.add(G);break e}else{if(!(i&1)){Bh(y,ce,i),Ud();break e}G=Error(r(426))}}else if(St&&z.mode&1){var At=Vh(E);if(At!==null){!(At.flags&65536)&&(At.flags|=256),jh(At,E,z,y,i),td(mi(G,z));break e}}y=G=mi(G,z),_t!==4&&(_t=2),Is===null?Is=[y]:Is.push(y),y=E;do{switch(y.tag){case 3:y.flags|=65536,i&=-i,y.lanes|=i;var oe=Lh(y,G,i);ch(y,oe);break e;case 1:z=G;var X=y.type,se=y.stateNode;if(!(y.flags&128)&&(typeof X.getDerivedStateFromError=="function"||se!==null&&typeof se.componentDidCatch=="function"&&(so===null||!so.has(se)))){y.flags|=65536,i&=-i,y.lanes|=i;var Re=Fh(y,z,i);ch(y,Re);break e}}y=y.return}while(y!==null)}yg(l)}catch(ze){i=ze,Vt===l&&l!==null&&(Vt=l=l.return);continue}break}while(!0)}function hg(){var n=Pl.current;return Pl.current=xl,n===null?xl:n}function Ud(){(_t===0||_t===3||_t===2)&&(_t=4),Ht===null||!(Po&268435455)&&!(Ml&268435455)||co(Ht,qt)}function $l(n,i){var l=it;it|=2;var d=hg();(Ht!==n||qt!==i)&&(Fr=null,Ro(n,i));do try{aS();break}catch(m){mg(n,m)}while(!0);if(rd(),it=l,Pl.current=d,Vt!==null)throw Error(r(261));return Ht=null,qt=0,_t}function aS(){for(;Vt!==null;)gg(Vt)}function lS(){for(;Vt!==null&&!$x();)gg(Vt)}function gg(n){var i=xg(n.alternate,n,Pn);n.memoizedProps=n.pendingProps,i===null?yg(n):Vt=i,Nd.current=null}function yg(n){var i=n;do{var l=i.alternate;if(n=i.return,i.flags&32768){if(l=tS(l,i),l!==null){l.flags&=32767,Vt=l;return}if(n!==null)n.flags|=32768,n.subtreeFlags=0,n.deletions=null;else{_t=6,Vt=null;return}}else if(l=eS(l,i,Pn),l!==null){Vt=l;return}if(i=i.sibling,i!==null){Vt=i;return}Vt=i=n}while(i!==null);_t===0&&(_t=5)}function Do(n,i,l){var d=pt,m=Bn.transition;try{Bn.transition=null,pt=1,cS(n,i,l,d)}finally{Bn.transition=m,pt=d}return null}function cS(n,i,l,d){do vi();while(ao!==null);if(it&6)throw Error(r(327));l=n.finishedWork;var m=n.finishedLanes;if(l===null)return null;if(n.finishedWork=null,n.finishedLanes=0,l===n.current)throw Error(r(177));n.callbackNode=null,n.callbackPriority=0;var y=l.lanes|l.childLanes;if(Wx(n,y),n===Ht&&(Vt=Ht=null,qt=0),!(l.subtreeFlags&2064)&&!(l.flags&2064)||Dl||(Dl=!0,wg(Fa,function(){return vi(),null})),y=(l.flags&15990)!==0,l.subtreeFlags&15990||y){y=Bn.transition,Bn.transition=null;var E=pt;pt=1;var z=it;it|=4,Nd.current=null,rS(n,l),ag(l,n),Dw(Uu),Ua=!!Wu,Uu=Wu=null,n.current=l,oS(l),Ax(),it=z,pt=E,Bn.transition=y}else n.current=l;if(Dl&&(Dl=!1,ao=n,El=m),y=n.pendingLanes,y===0&&(so=null),Fx(l.stateNode),hn(n,$t()),i!==null)for(d=n.onRecoverableError,l=0;l<i.length;l++)m=i[l],d(m.value,{componentStack:m.stack,digest:m.digest});if(Rl)throw Rl=!1,n=Bd,Bd=null,n;return El&1&&n.tag!==0&&vi(),y=n.pendingLanes,y&1?n===Vd?Os++:(Os=0,Vd=n):Os=0,no(),null}function vi(){if(ao!==null){var n=im(El),i=Bn.transition,l=pt;try{if(Bn.transition=null,pt=16>n?16:n,ao===null)var d=!1;else{if(n=ao,ao=null,El=0,it&6)throw Error(r(331));var m=it;for(it|=4,Be=n.current;Be!==null;){var y=Be,E=y.child;if(Be.flags&16){var z=y.deletions;if(z!==null){for(var G=0;G<z.length;G++){var ce=z[G];for(Be=ce;Be!==null;){var Te=Be;switch(Te.tag){case 0:case 11:case 15:Ds(8,Te,y)}var Pe=Te.child;if(Pe!==null)Pe.return=Te,Be=Pe;else for(;Be!==null;){Te=Be;var ke=Te.sibling,Ne=Te.return;if(ng(Te),Te===ce){Be=null;break}if(ke!==null){ke.return=Ne,Be=ke;break}Be=Ne}}}var Ve=y.alternate;if(Ve!==null){var je=Ve.child;if(je!==null){Ve.child=null;do{var At=je.sibling;je.sibling=null,je=At}while(je!==null)}}Be=y}}if(y.subtreeFlags&2064&&E!==null)E.return=y,Be=E;else e:for(;Be!==null;){if(y=Be,y.flags&2048)switch(y.tag){case 0:case 11:case 15:Ds(9,y,y.return)}var oe=y.sibling;if(oe!==null){oe.return=y.return,Be=oe;break e}Be=y.return}}var X=n.current;for(Be=X;Be!==null;){E=Be;var se=E.child;if(E.subtreeFlags&2064&&se!==null)se.return=E,Be=se;else e:for(E=X;Be!==null;){if(z=Be,z.flags&2048)try{switch(z.tag){case 0:case 11:case 15:Tl(9,z)}}catch(ze){Dt(z,z.return,ze)}if(z===E){Be=null;break e}var Re=z.sibling;if(Re!==null){Re.return=z.return,Be=Re;break e}Be=z.return}}if(it=m,no(),hr&&typeof hr.onPostCommitFiberRoot=="function")try{hr.onPostCommitFiberRoot(Ba,n)}catch{}d=!0}return d}finally{pt=l,Bn.transition=i}}return!1}function vg(n,i,l){i=mi(l,i),i=Lh(n,i,1),n=oo(n,i,1),i=cn(),n!==null&&(ns(n,1,i),hn(n,i))}function Dt(n,i,l){if(n.tag===3)vg(n,n,l);else for(;i!==null;){if(i.tag===3){vg(i,n,l);break}else if(i.tag===1){var d=i.stateNode;if(typeof i.type.getDerivedStateFromError=="function"||typeof d.componentDidCatch=="function"&&(so===null||!so.has(d))){n=mi(l,n),n=Fh(i,n,1),i=oo(i,n,1),n=cn(),i!==null&&(ns(i,1,n),hn(i,n));break}}i=i.return}}function uS(n,i,l){var d=n.pingCache;d!==null&&d.delete(i),i=cn(),n.pingedLanes|=n.suspendedLanes&l,Ht===n&&(qt&l)===l&&(_t===4||_t===3&&(qt&130023424)===qt&&500>$t()-Fd?Ro(n,0):Ld|=l),hn(n,i)}function bg(n,i){i===0&&(n.mode&1?(i=ja,ja<<=1,!(ja&130023424)&&(ja=4194304)):i=1);var l=cn();n=Ar(n,i),n!==null&&(ns(n,i,l),hn(n,l))}function dS(n){var i=n.memoizedState,l=0;i!==null&&(l=i.retryLane),bg(n,l)}function fS(n,i){var l=0;switch(n.tag){case 13:var d=n.stateNode,m=n.memoizedState;m!==null&&(l=m.retryLane);break;case 19:d=n.stateNode;break;default:throw Error(r(314))}d!==null&&d.delete(i),bg(n,l)}var xg;xg=function(n,i,l){if(n!==null)if(n.memoizedProps!==i.pendingProps||dn.current)pn=!0;else{if(!(n.lanes&l)&&!(i.flags&128))return pn=!1,Jw(n,i,l);pn=!!(n.flags&131072)}else pn=!1,St&&i.flags&1048576&&Jm(i,ll,i.index);switch(i.lanes=0,i.tag){case 2:var d=i.type;Cl(n,i),n=i.pendingProps;var m=si(i,Zt.current);fi(i,l),m=md(null,i,d,n,m,l);var y=hd();return i.flags|=1,typeof m=="object"&&m!==null&&typeof m.render=="function"&&m.$$typeof===void 0?(i.tag=1,i.memoizedState=null,i.updateQueue=null,fn(d)?(y=!0,il(i)):y=!1,i.memoizedState=m.state!==null&&m.state!==void 0?m.state:null,ad(i),m.updater=wl,i.stateNode=m,m._reactInternals=i,wd(i,d,n,l),i=Td(null,i,d,!0,y,l)):(i.tag=0,St&&y&&Xu(i),ln(null,i,m,l),i=i.child),i;case 16:d=i.elementType;e:{switch(Cl(n,i),n=i.pendingProps,m=d._init,d=m(d._payload),i.type=d,m=i.tag=mS(d),n=nr(d,n),m){case 0:i=kd(null,i,d,n,l);break e;case 1:i=Yh(null,i,d,n,l);break e;case 11:i=zh(null,i,d,n,l);break e;case 14:i=_h(null,i,d,nr(d.type,n),l);break e}throw Error(r(306,d,""))}return i;case 0:return d=i.type,m=i.pendingProps,m=i.elementType===d?m:nr(d,m),kd(n,i,d,m,l);case 1:return d=i.type,m=i.pendingProps,m=i.elementType===d?m:nr(d,m),Yh(n,i,d,m,l);case 3:e:{if(Kh(i),n===null)throw Error(r(387));d=i.pendingProps,y=i.memoizedState,m=y.element,lh(n,i),ml(i,d,null,l);var E=i.memoizedState;if(d=E.element,y.isDehydrated)if(y={element:d,isDehydrated:!1,cache:E.cache,pendingSuspenseBoundaries:E.pendingSuspenseBoundaries,transitions:E.transitions},i.updateQueue.baseState=y,i.memoizedState=y,i.flags&256){m=mi(Error(r(423)),i),i=qh(n,i,d,l,m);break e}else if(d!==m){m=mi(Error(r(424)),i),i=qh(n,i,d,l,m);break e}else for(Tn=Jr(i.stateNode.containerInfo.firstChild),kn=i,St=!0,tr=null,l=sh(i,null,d,l),i.child=l;l;)l.flags=l.flags&-3|4096,l=l.sibling;else{if(ci(),d===m){i=Lr(n,i,l);break e}ln(n,i,d,l)}i=i.child}return i;case 5:return dh(i),n===null&&ed(i),d=i.type,m=i.pendingProps,y=n!==null?n.memoizedProps:null,E=m.children,Hu(d,m)?E=null:y!==null&&Hu(d,y)&&(i.flags|=32),Hh(n,i),ln(n,i,E,l),i.child;case 6:return n===null&&ed(i),null;case 13:return Gh(n,i,l);case 4:return ld(i,i.stateNode.containerInfo),d=i.pendingProps,n===null?i.child=ui(i,null,d,l):ln(n,i,d,l),i.child;case 11:return d=i.type,m=i.pendingProps,m=i.elementType===d?m:nr(d,m),zh(n,i,d,m,l);case 7:return ln(n,i,i.pendingProps,l),i.child;case 8:return ln(n,i,i.pendingProps.children,l),i.child;case 12:return ln(n,i,i.pendingProps.children,l),i.child;case 10:e:{if(d=i.type._context,m=i.pendingProps,y=i.memoizedProps,E=m.value,vt(dl,d._currentValue),d._currentValue=E,y!==null)if(er(y.value,E)){if(y.children===m.children&&!dn.current){i=Lr(n,i,l);break e}}else for(y=i.child,y!==null&&(y.return=i);y!==null;){var z=y.dependencies;if(z!==null){E=y.child;for(var G=z.firstContext;G!==null;){if(G.context===d){if(y.tag===1){G=Nr(-1,l&-l),G.tag=2;var ce=y.updateQueue;if(ce!==null){ce=ce.shared;var Te=ce.pending;Te===null?G.next=G:(G.next=Te.next,Te.next=G),ce.pending=G}}y.lanes|=l,G=y.alternate,G!==null&&(G.lanes|=l),id(y.return,l,i),z.lanes|=l;break}G=G.next}}else if(y.tag===10)E=y.type===i.type?null:y.child;else if(y.tag===18){if(E=y.return,E===null)throw Error(r(341));E.lanes|=l,z=E.alternate,z!==null&&(z.lanes|=l),id(E,l,i),E=y.sibling}else E=y.child;if(E!==null)E.return=y;else for(E=y;E!==null;){if(E===i){E=null;break}if(y=E.sibling,y!==null){y.return=E.return,E=y;break}E=E.return}y=E}ln(n,i,m.children,l),i=i.child}return i;case 9:return m=i.type,d=i.pendingProps.children,fi(i,l),m=Ln(m),d=d(m),i.flags|=1,ln(n,i,d,l),i.child;case 14:return d=i.type,m=nr(d,i.pendingProps),m=nr(d.type,m),_h(n,i,d,m,l);case 15:return Wh(n,i,i.type,i.pendingProps,l);case 17:return d=i.type,m=i.pendingProps,m=i.elementType===d?m:nr(d,m),Cl(n,i),i.tag=1,fn(d)?(n=!0,il(i)):n=!1,fi(i,l),Ah(i,d,m),wd(i,d,m,l),Td(null,i,d,!0,n,l);case 19:return Xh(n,i,l);case 22:return Uh(n,i,l)}throw Error(r(156,i.tag))};function wg(n,i){return em(n,i)}function pS(n,i,l,d){this.tag=n,this.key=l,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=i,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=d,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function Vn(n,i,l,d){return new pS(n,i,l,d)}function Hd(n){return n=n.prototype,!(!n||!n.isReactComponent)}function mS(n){if(typeof n=="function")return Hd(n)?1:0;if(n!=null){if(n=n.$$typeof,n===H)return 11;if(n===F)return 14}return 2}function uo(n,i){var l=n.alternate;return l===null?(l=Vn(n.tag,i,n.key,n.mode),l.elementType=n.elementType,l.type=n.type,l.stateNode=n.stateNode,l.alternate=n,n.alternate=l):(l.pendingProps=i,l.type=n.type,l.flags=0,l.subtreeFlags=0,l.deletions=null),l.flags=n.flags&14680064,l.childLanes=n.childLanes,l.lanes=n.lanes,l.child=n.child,l.memoizedProps=n.memoizedProps,l.memoizedState=n.memoizedState,l.updateQueue=n.updateQueue,i=n.dependencies,l.dependencies=i===null?null:{lanes:i.lanes,firstContext:i.firstContext},l.sibling=n.sibling,l.index=n.index,l.ref=n.ref,l}function Al(n,i,l,d,m,y){var E=2;if(d=n,typeof n=="function")Hd(n)&&(E=1);else if(typeof n=="string")E=5;else e:switch(n){case O:return Eo(l.children,m,y,i);case N:E=8,m|=8;break;case U:return n=Vn(12,l,i,m|2),n.elementType=U,n.lanes=y,n;case W:return n=Vn(13,l,i,m),n.elementType=W,n.lanes=y,n;case V:return n=Vn(19,l,i,m),n.elementType=V,n.lanes=y,n;case Y:return Nl(l,m,y,i);default:if(typeof n=="object"&&n!==null)switch(n.$$typeof){case C:E=10;break e;case A:E=9;break e;case H:E=11;break e;case F:E=14;break e;case B:E=16,d=null;break e}throw Error(r(130,n==null?n:typeof n,""))}return i=Vn(E,l,i,m),i.elementType=n,i.type=d,i.lanes=y,i}function Eo(n,i,l,d){return n=Vn(7,n,d,i),n.lanes=l,n}function Nl(n,i,l,d){return n=Vn(22,n,d,i),n.elementType=Y,n.lanes=l,n.stateNode={isHidden:!1},n}function Yd(n,i,l){return n=Vn(6,n,null,i),n.lanes=l,n}function Kd(n,i,l){return i=Vn(4,n.children!==null?n.children:[],n.key,i),i.lanes=l,i.stateNode={containerInfo:n.containerInfo,pendingChildren:null,implementation:n.implementation},i}function hS(n,i,l,d,m){this.tag=i,this.containerInfo=n,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=xu(0),this.expirationTimes=xu(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=xu(0),this.identifierPrefix=d,this.onRecoverableError=m,this.mutableSourceEagerHydrationData=null}function qd(n,i,l,d,m,y,E,z,G){return n=new hS(n,i,l,z,G),i===1?(i=1,y===!0&&(i|=8)):i=0,y=Vn(3,null,null,i),n.current=y,y.stateNode=n,y.memoizedState={element:d,isDehydrated:l,cache:null,transitions:null,pendingSuspenseBoundaries:null},ad(y),n}function gS(n,i,l){var d=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:$,key:d==null?null:""+d,children:n,containerInfo:i,implementation:l}}function Sg(n){if(!n)return to;n=n._reactInternals;e:{if(vo(n)!==n||n.tag!==1)throw Error(r(170));var i=n;do{switch(i.tag){case 3:i=i.stateNode.context;break e;case 1:if(fn(i.type)){i=i.stateNode.__reactInternalMemoizedMergedChildContext;break e}}i=i.return}while(i!==null);throw Error(r(171))}if(n.tag===1){var l=n.type;if(fn(l))return Qm(n,l,i)}return i}function Cg(n,i,l,d,m,y,E,z,G){return n=qd(l,d,!0,n,m,y,E,z,G),n.context=Sg(null),l=n.current,d=cn(),m=lo(l),y=Nr(d,m),y.callback=i??null,oo(l,y,m),n.current.lanes=m,ns(n,m,d),hn(n,d),n}function Ll(n,i,l,d){var m=i.current,y=cn(),E=lo(m);return l=Sg(l),i.context===null?i.context=l:i.pendingContext=l,i=Nr(y,E),i.payload={element:n},d=d===void 0?null:d,d!==null&&(i.callback=d),n=oo(m,i,E),n!==null&&(ir(n,m,E,y),pl(n,m,E)),E}function Fl(n){if(n=n.current,!n.child)return null;switch(n.child.tag){case 5:return n.child.stateNode;default:return n.child.stateNode}}function kg(n,i){if(n=n.memoizedState,n!==null&&n.dehydrated!==null){var l=n.retryLane;n.retryLane=l!==0&&l<i?l:i}}function Gd(n,i){kg(n,i),(n=n.alternate)&&kg(n,i)}var Tg=typeof reportError=="function"?reportError:function(n){console.error(n)};function Qd(n){this._internalRoot=n}Bl.prototype.render=Qd.prototype.render=function(n){var i=this._internalRoot;if(i===null)throw Error(r(409));Ll(n,i,null,null)},Bl.prototype.unmount=Qd.prototype.unmount=function(){var n=this._internalRoot;if(n!==null){this._internalRoot=null;var i=n.containerInfo;Mo(function(){Ll(null,n,null,null)}),i[Er]=null}};function Bl(n){this._internalRoot=n}Bl.prototype.unstable_scheduleHydration=function(n){if(n){var i=lm();n={blockedOn:null,target:n,priority:i};for(var l=0;l<Qr.length&&i!==0&&i<Qr[l].priority;l++);Qr.splice(l,0,n),l===0&&dm(n)}};function Xd(n){return!(!n||n.nodeType!==1&&n.nodeType!==9&&n.nodeType!==11)}function Vl(n){return!(!n||n.nodeType!==1&&n.nodeType!==9&&n.nodeType!==11&&(n.nodeType!==8||n.nodeValue!==" react-mount-point-unstable "))}function Pg(){}function yS(n,i,l,d,m){if(m){if(typeof d=="function"){var y=d;d=function(){var ce=Fl(E);y.call(ce)}}var E=Cg(i,d,n,0,null,!1,!1,"",Pg);return n._reactRootContainer=E,n[Er]=E.current,gs(n.nodeType===8?n.parentNode:n),Mo(),E}for(;m=n.lastChild;)n.removeChild(m);if(typeof d=="function"){var z=d;d=function(){var ce=Fl(G);z.call(ce)}}var G=qd(n,0,!1,null,null,!1,!1,"",Pg);return n._reactRootContainer=G,n[Er]=G.current,gs(n.nodeType===8?n.parentNode:n),Mo(function(){Ll(i,G,l,d)}),G}function jl(n,i,l,d,m){var y=l._reactRootContainer;if(y){var E=y;if(typeof m=="function"){var z=m;m=function(){var G=Fl(E);z.call(G)}}Ll(i,E,n,m)}else E=yS(l,i,n,m,d);return Fl(E)}sm=function(n){switch(n.tag){case 3:var i=n.stateNode;if(i.current.memoizedState.isDehydrated){var l=ts(i.pendingLanes);l!==0&&(wu(i,l|1),hn(i,$t()),!(it&6)&&(yi=$t()+500,no()))}break;case 13:Mo(function(){var d=Ar(n,1);if(d!==null){var m=cn();ir(d,n,1,m)}}),Gd(n,1)}},Su=function(n){if(n.tag===13){var i=Ar(n,134217728);if(i!==null){var l=cn();ir(i,n,134217728,l)}Gd(n,134217728)}},am=function(n){if(n.tag===13){var i=lo(n),l=Ar(n,i);if(l!==null){var d=cn();ir(l,n,i,d)}Gd(n,i)}},lm=function(){return pt},cm=function(n,i){var l=pt;try{return pt=n,i()}finally{pt=l}},bt=function(n,i,l){switch(i){case"input":if(de(n,l),i=l.name,l.type==="radio"&&i!=null){for(l=n;l.parentNode;)l=l.parentNode;for(l=l.querySelectorAll("input[name="+JSON.stringify(""+i)+'][type="radio"]'),i=0;i<l.length;i++){var d=l[i];if(d!==n&&d.form===n.form){var m=rl(d);if(!m)throw Error(r(90));ve(d),de(d,m)}}}break;case"textarea":lt(n,l);break;case"select":i=l.value,i!=null&&Ie(n,!!l.multiple,i,!1)}},Kp=_d,qp=Mo;var vS={usingClientEntryPoint:!1,Events:[bs,oi,rl,Qo,Yp,_d]},$s={findFiberByHostInstance:bo,bundleType:0,version:"18.3.1",rendererPackageName:"react-dom"},bS={bundleType:$s.bundleType,version:$s.version,rendererPackageName:$s.rendererPackageName,rendererConfig:$s.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:M.ReactCurrentDispatcher,findHostInstanceByFiber:function(n){return n=Zp(n),n===null?null:n.stateNode},findFiberByHostInstance:$s.findFiberByHostInstance,findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1-next-f1338f8080-20240426"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var zl=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!zl.isDisabled&&zl.supportsFiber)try{Ba=zl.inject(bS),hr=zl}catch{}}return gn.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=vS,gn.createPortal=function(n,i){var l=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!Xd(i))throw Error(r(200));return gS(n,i,null,l)},gn.createRoot=function(n,i){if(!Xd(n))throw Error(r(299));var l=!1,d="",m=Tg;return i!=null&&(i.unstable_strictMode===!0&&(l=!0),i.identifierPrefix!==void 0&&(d=i.identifierPrefix),i.onRecoverableError!==void 0&&(m=i.onRecoverableError)),i=qd(n,1,!1,null,null,l,!1,d,m),n[Er]=i.current,gs(n.nodeType===8?n.parentNode:n),new Qd(i)},gn.findDOMNode=function(n){if(n==null)return null;if(n.nodeType===1)return n;var i=n._reactInternals;if(i===void 0)throw typeof n.render=="function"?Error(r(188)):(n=Object.keys(n).join(","),Error(r(268,n)));return n=Zp(i),n=n===null?null:n.stateNode,n},gn.flushSync=function(n){return Mo(n)},gn.hydrate=function(n,i,l){if(!Vl(i))throw Error(r(200));return jl(null,n,i,!0,l)},gn.hydrateRoot=function(n,i,l){if(!Xd(n))throw Error(r(405));var d=l!=null&&l.hydratedSources||null,m=!1,y="",E=Tg;if(l!=null&&(l.unstable_strictMode===!0&&(m=!0),l.identifierPrefix!==void 0&&(y=l.identifierPrefix),l.onRecoverableError!==void 0&&(E=l.onRecoverableError)),i=Cg(i,null,n,1,l??null,m,!1,y,E),n[Er]=i.current,gs(n),d)for(n=0;n<d.length;n++)l=d[n],m=l._getVersion,m=m(l._source),i.mutableSourceEagerHydrationData==null?i.mutableSourceEagerHydrationData=[l,m]:i.mutableSourceEagerHydrationData.push(l,m);return new Bl(i)},gn.render=function(n,i,l){if(!Vl(i))throw Error(r(200));return jl(null,n,i,!1,l)},gn.unmountComponentAtNode=function(n){if(!Vl(n))throw Error(r(40));return n._reactRootContainer?(Mo(function(){jl(null,null,n,!1,function(){n._reactRootContainer=null,n[Er]=null})}),!0):!1},gn.unstable_batchedUpdates=_d,gn.unstable_renderSubtreeIntoContainer=function(n,i,l,d){if(!Vl(l))throw Error(r(200));if(n==null||n._reactInternals===void 0)throw Error(r(38));return jl(n,i,l,!1,d)},gn.version="18.3.1-next-f1338f8080-20240426",gn}var Ag;function Uv(){if(Ag)return ef.exports;Ag=1;function e(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(e)}catch(t){console.error(t)}}return e(),ef.exports=DS(),ef.exports}var Ng;function ES(){if(Ng)return _l;Ng=1;var e=Uv();return _l.createRoot=e.createRoot,_l.hydrateRoot=e.hydrateRoot,_l}var IS=ES();const aa={black:"#000",white:"#fff"},bi={50:"#ffebee",100:"#ffcdd2",200:"#ef9a9a",300:"#e57373",400:"#ef5350",500:"#f44336",600:"#e53935",700:"#d32f2f",800:"#c62828",900:"#b71c1c",A100:"#ff8a80",A200:"#ff5252",A400:"#ff1744",A700:"#d50000"},xi={50:"#f3e5f5",100:"#e1bee7",200:"#ce93d8",300:"#ba68c8",400:"#ab47bc",500:"#9c27b0",600:"#8e24aa",700:"#7b1fa2",800:"#6a1b9a",900:"#4a148c",A100:"#ea80fc",A200:"#e040fb",A400:"#d500f9",A700:"#aa00ff"},wi={50:"#e3f2fd",100:"#bbdefb",200:"#90caf9",300:"#64b5f6",400:"#42a5f5",500:"#2196f3",600:"#1e88e5",700:"#1976d2",800:"#1565c0",900:"#0d47a1",A100:"#82b1ff",A200:"#448aff",A400:"#2979ff",A700:"#2962ff"},Si={50:"#e1f5fe",100:"#b3e5fc",200:"#81d4fa",300:"#4fc3f7",400:"#29b6f6",500:"#03a9f4",600:"#039be5",700:"#0288d1",800:"#0277bd",900:"#01579b",A100:"#80d8ff",A200:"#40c4ff",A400:"#00b0ff",A700:"#0091ea"},Ci={50:"#e8f5e9",100:"#c8e6c9",200:"#a5d6a7",300:"#81c784",400:"#66bb6a",500:"#4caf50",600:"#43a047",700:"#388e3c",800:"#2e7d32",900:"#1b5e20",A100:"#b9f6ca",A200:"#69f0ae",A400:"#00e676",A700:"#00c853"},Ls={50:"#fff3e0",100:"#ffe0b2",200:"#ffcc80",300:"#ffb74d",400:"#ffa726",500:"#ff9800",600:"#fb8c00",700:"#f57c00",800:"#ef6c00",900:"#e65100",A100:"#ffd180",A200:"#ffab40",A400:"#ff9100",A700:"#ff6d00"},OS={50:"#fafafa",100:"#f5f5f5",200:"#eeeeee",300:"#e0e0e0",400:"#bdbdbd",500:"#9e9e9e",600:"#757575",700:"#616161",800:"#424242",900:"#212121",A100:"#f5f5f5",A200:"#eeeeee",A400:"#bdbdbd",A700:"#616161"};function _r(e,...t){const r=new URL(`https://mui.com/production-error/?code=${e}`);return t.forEach(o=>r.searchParams.append("args[]",o)),`Minified MUI error #${e}; visit ${r} for the full message.`}const Wi="$$material";function K(){return K=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var r=arguments[t];for(var o in r)({}).hasOwnProperty.call(r,o)&&(e[o]=r[o])}return e},K.apply(null,arguments)}var $S=!1;function AS(e){if(e.sheet)return e.sheet;for(var t=0;t<document.styleSheets.length;t++)if(document.styleSheets[t].ownerNode===e)return document.styleSheets[t]}function NS(e){var t=document.createElement("style");return t.setAttribute("data-emotion",e.key),e.nonce!==void 0&&t.setAttribute("nonce",e.nonce),t.appendChild(document.createTextNode("")),t.setAttribute("data-s",""),t}var LS=function(){function e(r){var o=this;this._insertTag=function(s){var a;o.tags.length===0?o.insertionPoint?a=o.insertionPoint.nextSibling:o.prepend?a=o.container.firstChild:a=o.before:a=o.tags[o.tags.length-1].nextSibling,o.container.insertBefore(s,a),o.tags.push(s)},this.isSpeedy=r.speedy===void 0?!$S:r.speedy,this.tags=[],this.ctr=0,this.nonce=r.nonce,this.key=r.key,this.container=r.container,this.prepend=r.prepend,this.insertionPoint=r.insertionPoint,this.before=null}var t=e.prototype;return t.hydrate=function(o){o.forEach(this._insertTag)},t.insert=function(o){this.ctr%(this.isSpeedy?65e3:1)===0&&this._insertTag(NS(this));var s=this.tags[this.tags.length-1];if(this.isSpeedy){var a=AS(s);try{a.insertRule(o,a.cssRules.length)}catch{}}else s.appendChild(document.createTextNode(o));this.ctr++},t.flush=function(){this.tags.forEach(function(o){var s;return(s=o.parentNode)==null?void 0:s.removeChild(o)}),this.tags=[],this.ctr=0},e}(),nn="-ms-",wc="-moz-",ct="-webkit-",Hv="comm",Zf="rule",Jf="decl",FS="@import",Yv="@keyframes",BS="@layer",VS=Math.abs,Ac=String.fromCharCode,jS=Object.assign;function zS(e,t){return Gt(e,0)^45?(((t<<2^Gt(e,0))<<2^Gt(e,1))<<2^Gt(e,2))<<2^Gt(e,3):0}function Kv(e){return e.trim()}function _S(e,t){return(e=t.exec(e))?e[0]:e}function ut(e,t,r){return e.replace(t,r)}function kf(e,t){return e.indexOf(t)}function Gt(e,t){return e.charCodeAt(t)|0}function la(e,t,r){return e.slice(t,r)}function Cr(e){return e.length}function ep(e){return e.length}function Wl(e,t){return t.push(e),e}function WS(e,t){return e.map(t).join("")}var Nc=1,Ai=1,qv=0,wn=0,jt=0,Ui="";function Lc(e,t,r,o,s,a,c){return{value:e,root:t,parent:r,type:o,props:s,children:a,line:Nc,column:Ai,length:c,return:""}}function Fs(e,t){return jS(Lc("",null,null,"",null,null,0),e,{length:-e.length},t)}function US(){return jt}function HS(){return jt=wn>0?Gt(Ui,--wn):0,Ai--,jt===10&&(Ai=1,Nc--),jt}function Dn(){return jt=wn<qv?Gt(Ui,wn++):0,Ai++,jt===10&&(Ai=1,Nc++),jt}function Mr(){return Gt(Ui,wn)}function tc(){return wn}function xa(e,t){return la(Ui,e,t)}function ca(e){switch(e){case 0:case 9:case 10:case 13:case 32:return 5;case 33:case 43:case 44:case 47:case 62:case 64:case 126:case 59:case 123:case 125:return 4;case 58:return 3;case 34:case 39:case 40:case 91:return 2;case 41:case 93:return 1}return 0}function Gv(e){return Nc=Ai=1,qv=Cr(Ui=e),wn=0,[]}function Qv(e){return Ui="",e}function nc(e){return Kv(xa(wn-1,Tf(e===91?e+2:e===40?e+1:e)))}function YS(e){for(;(jt=Mr())&&jt<33;)Dn();return ca(e)>2||ca(jt)>3?"":" "}function KS(e,t){for(;--t&&Dn()&&!(jt<48||jt>102||jt>57&&jt<65||jt>70&&jt<97););return xa(e,tc()+(t<6&&Mr()==32&&Dn()==32))}function Tf(e){for(;Dn();)switch(jt){case e:return wn;case 34:case 39:e!==34&&e!==39&&Tf(jt);break;case 40:e===41&&Tf(e);break;case 92:Dn();break}return wn}function qS(e,t){for(;Dn()&&e+jt!==57;)if(e+jt===84&&Mr()===47)break;return"/*"+xa(t,wn-1)+"*"+Ac(e===47?e:Dn())}function GS(e){for(;!ca(Mr());)Dn();return xa(e,wn)}function QS(e){return Qv(rc("",null,null,null,[""],e=Gv(e),0,[0],e))}function rc(e,t,r,o,s,a,c,u,f){for(var p=0,h=0,g=c,b=0,S=0,v=0,x=1,w=1,T=1,R=0,P="",M=s,D=a,$=o,O=P;w;)switch(v=R,R=Dn()){case 40:if(v!=108&&Gt(O,g-1)==58){kf(O+=ut(nc(R),"&","&\f"),"&\f")!=-1&&(T=-1);break}case 34:case 39:case 91:O+=nc(R);break;case 9:case 10:case 13:case 32:O+=YS(v);break;case 92:O+=KS(tc()-1,7);continue;case 47:switch(Mr()){case 42:case 47:Wl(XS(qS(Dn(),tc()),t,r),f);break;default:O+="/"}break;case 123*x:u[p++]=Cr(O)*T;case 125*x:case 59:case 0:switch(R){case 0:case 125:w=0;case 59+h:T==-1&&(O=ut(O,/\f/g,"")),S>0&&Cr(O)-g&&Wl(S>32?Fg(O+";",o,r,g-1):Fg(ut(O," ","")+";",o,r,g-2),f);break;case 59:O+=";";default:if(Wl($=Lg(O,t,r,p,h,s,u,P,M=[],D=[],g),a),R===123)if(h===0)rc(O,t,$,$,M,a,g,u,D);else switch(b===99&&Gt(O,3)===110?100:b){case 100:case 108:case 109:case 115:rc(e,$,$,o&&Wl(Lg(e,$,$,0,0,s,u,P,s,M=[],g),D),s,D,g,u,o?M:D);break;default:rc(O,$,$,$,[""],D,0,u,D)}}p=h=S=0,x=T=1,P=O="",g=c;break;case 58:g=1+Cr(O),S=v;default:if(x<1){if(R==123)--x;else if(R==125&&x++==0&&HS()==125)continue}switch(O+=Ac(R),R*x){case 38:T=h>0?1:(O+="\f",-1);break;case 44:u[p++]=(Cr(O)-1)*T,T=1;break;case 64:Mr()===45&&(O+=nc(Dn())),b=Mr(),h=g=Cr(P=O+=GS(tc())),R++;break;case 45:v===45&&Cr(O)==2&&(x=0)}}return a}function Lg(e,t,r,o,s,a,c,u,f,p,h){for(var g=s-1,b=s===0?a:[""],S=ep(b),v=0,x=0,w=0;v<o;++v)for(var T=0,R=la(e,g+1,g=VS(x=c[v])),P=e;T<S;++T)(P=Kv(x>0?b[T]+" "+R:ut(R,/&\f/g,b[T])))&&(f[w++]=P);return Lc(e,t,r,s===0?Zf:u,f,p,h)}function XS(e,t,r){return Lc(e,t,r,Hv,Ac(US()),la(e,2,-2),0)}function Fg(e,t,r,o){return Lc(e,t,r,Jf,la(e,0,o),la(e,o+1,-1),o)}function Di(e,t){for(var r="",o=ep(e),s=0;s<o;s++)r+=t(e[s],s,e,t)||"";return r}function ZS(e,t,r,o){switch(e.type){case BS:if(e.children.length)break;case FS:case Jf:return e.return=e.return||e.value;case Hv:return"";case Yv:return e.return=e.value+"{"+Di(e.children,o)+"}";case Zf:e.value=e.props.join(",")}return Cr(r=Di(e.children,o))?e.return=e.value+"{"+r+"}":""}function JS(e){var t=ep(e);return function(r,o,s,a){for(var c="",u=0;u<t;u++)c+=e[u](r,o,s,a)||"";return c}}function e1(e){return function(t){t.root||(t=t.return)&&e(t)}}function Xv(e){var t=Object.create(null);return function(r){return t[r]===void 0&&(t[r]=e(r)),t[r]}}var t1=function(t,r,o){for(var s=0,a=0;s=a,a=Mr(),s===38&&a===12&&(r[o]=1),!ca(a);)Dn();return xa(t,wn)},n1=function(t,r){var o=-1,s=44;do switch(ca(s)){case 0:s===38&&Mr()===12&&(r[o]=1),t[o]+=t1(wn-1,r,o);break;case 2:t[o]+=nc(s);break;case 4:if(s===44){t[++o]=Mr()===58?"&\f":"",r[o]=t[o].length;break}default:t[o]+=Ac(s)}while(s=Dn());return t},r1=function(t,r){return Qv(n1(Gv(t),r))},Bg=new WeakMap,o1=function(t){if(!(t.type!=="rule"||!t.parent||t.length<1)){for(var r=t.value,o=t.parent,s=t.column===o.column&&t.line===o.line;o.type!=="rule";)if(o=o.parent,!o)return;if(!(t.props.length===1&&r.charCodeAt(0)!==58&&!Bg.get(o))&&!s){Bg.set(t,!0);for(var a=[],c=r1(r,a),u=o.props,f=0,p=0;f<c.length;f++)for(var h=0;h<u.length;h++,p++)t.props[p]=a[f]?c[f].replace(/&\f/g,u[h]):u[h]+" "+c[f]}}},i1=function(t){if(t.type==="decl"){var r=t.value;r.charCodeAt(0)===108&&r.charCodeAt(2)===98&&(t.return="",t.value="")}};function Zv(e,t){switch(zS(e,t)){case 5103:return ct+"print-"+e+e;case 5737:case 4201:case 3177:case 3433:case 1641:case 4457:case 2921:case 5572:case 6356:case 5844:case 3191:case 6645:case 3005:case 6391:case 5879:case 5623:case 6135:case 4599:case 4855:case 4215:case 6389:case 5109:case 5365:case 5621:case 3829:return ct+e+e;case 5349:case 4246:case 4810:case 6968:case 2756:return ct+e+wc+e+nn+e+e;case 6828:case 4268:return ct+e+nn+e+e;case 6165:return ct+e+nn+"flex-"+e+e;case 5187:return ct+e+ut(e,/(\w+).+(:[^]+)/,ct+"box-$1$2"+nn+"flex-$1$2")+e;case 5443:return ct+e+nn+"flex-item-"+ut(e,/flex-|-self/,"")+e;case 4675:return ct+e+nn+"flex-line-pack"+ut(e,/align-content|flex-|-self/,"")+e;case 5548:return ct+e+nn+ut(e,"shrink","negative")+e;case 5292:return ct+e+nn+ut(e,"basis","preferred-size")+e;case 6060:return ct+"box-"+ut(e,"-grow","")+ct+e+nn+ut(e,"grow","positive")+e;case 4554:return ct+ut(e,/([^-])(transform)/g,"$1"+ct+"$2")+e;case 6187:return ut(ut(ut(e,/(zoom-|grab)/,ct+"$1"),/(image-set)/,ct+"$1"),e,"")+e;case 5495:case 3959:return ut(e,/(image-set\([^]*)/,ct+"$1$`$1");case 4968:return ut(ut(e,/(.+:)(flex-)?(.*)/,ct+"box-pack:$3"+nn+"flex-pack:$3"),/s.+-b[^;]+/,"justify")+ct+e+e;case 4095:case 3583:case 4068:case 2532:return ut(e,/(.+)-inline(.+)/,ct+"$1$2")+e;case 8116:case 7059:case 5753:case 5535:case 5445:case 5701:case 4933:case 4677:case 5533:case 5789:case 5021:case 4765:if(Cr(e)-1-t>6)switch(Gt(e,t+1)){case 109:if(Gt(e,t+4)!==45)break;case 102:return ut(e,/(.+:)(.+)-([^]+)/,"$1"+ct+"$2-$3$1"+wc+(Gt(e,t+3)==108?"$3":"$2-$3"))+e;case 115:return~kf(e,"stretch")?Zv(ut(e,"stretch","fill-available"),t)+e:e}break;case 4949:if(Gt(e,t+1)!==115)break;case 6444:switch(Gt(e,Cr(e)-3-(~kf(e,"!important")&&10))){case 107:return ut(e,":",":"+ct)+e;case 101:return ut(e,/(.+:)([^;!]+)(;|!.+)?/,"$1"+ct+(Gt(e,14)===45?"inline-":"")+"box$3$1"+ct+"$2$3$1"+nn+"$2box$3")+e}break;case 5936:switch(Gt(e,t+11)){case 114:return ct+e+nn+ut(e,/[svh]\w+-[tblr]{2}/,"tb")+e;case 108:return ct+e+nn+ut(e,/[svh]\w+-[tblr]{2}/,"tb-rl")+e;case 45:return ct+e+nn+ut(e,/[svh]\w+-[tblr]{2}/,"lr")+e}return ct+e+nn+e+e}return e}var s1=function(t,r,o,s){if(t.length>-1&&!t.return)switch(t.type){case Jf:t.return=Zv(t.value,t.length);break;case Yv:return Di([Fs(t,{value:ut(t.value,"@","@"+ct)})],s);case Zf:if(t.length)return WS(t.props,function(a){switch(_S(a,/(::plac\w+|:read-\w+)/)){case":read-only":case":read-write":return Di([Fs(t,{props:[ut(a,/:(read-\w+)/,":"+wc+"$1")]})],s);case"::placeholder":return Di([Fs(t,{props:[ut(a,/:(plac\w+)/,":"+ct+"input-$1")]}),Fs(t,{props:[ut(a,/:(plac\w+)/,":"+wc+"$1")]}),Fs(t,{props:[ut(a,/:(plac\w+)/,nn+"input-$1")]})],s)}return""})}},a1=[s1],l1=function(t){var r=t.key;if(r==="css"){var o=document.querySelectorAll("style[data-emotion]:not([data-s])");Array.prototype.forEach.call(o,function(x){var w=x.getAttribute("data-emotion");w.indexOf(" ")!==-1&&(document.head.appendChild(x),x.setAttribute("data-s",""))})}var s=t.stylisPlugins||a1,a={},c,u=[];c=t.container||document.head,Array.prototype.forEach.call(document.querySelectorAll('style[data-emotion^="'+r+' "]'),function(x){for(var w=x.getAttribute("data-emotion").split(" "),T=1;T<w.length;T++)a[w[T]]=!0;u.push(x)});var f,p=[o1,i1];{var h,g=[ZS,e1(function(x){h.insert(x)})],b=JS(p.concat(s,g)),S=function(w){return Di(QS(w),b)};f=function(w,T,R,P){h=R,S(w?w+"{"+T.styles+"}":T.styles),P&&(v.inserted[T.name]=!0)}}var v={key:r,sheet:new LS({key:r,container:c,nonce:t.nonce,speedy:t.speedy,prepend:t.prepend,insertionPoint:t.insertionPoint}),nonce:t.nonce,inserted:a,registered:{},insert:f};return v.sheet.hydrate(u),v},rf={exports:{}},dt={};/** @license React v16.13.1
- * react-is.production.min.js
- *
- * Copyright (c) Facebook, Inc. and its affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Vg;function c1(){if(Vg)return dt;Vg=1;var e=typeof Symbol=="function"&&Symbol.for,t=e?Symbol.for("react.element"):60103,r=e?Symbol.for("react.portal"):60106,o=e?Symbol.for("react.fragment"):60107,s=e?Symbol.for("react.strict_mode"):60108,a=e?Symbol.for("react.profiler"):60114,c=e?Symbol.for("react.provider"):60109,u=e?Symbol.for("react.context"):60110,f=e?Symbol.for("react.async_mode"):60111,p=e?Symbol.for("react.concurrent_mode"):60111,h=e?Symbol.for("react.forward_ref"):60112,g=e?Symbol.for("react.suspense"):60113,b=e?Symbol.for("react.suspense_list"):60120,S=e?Symbol.for("react.memo"):60115,v=e?Symbol.for("react.lazy"):60116,x=e?Symbol.for("react.block"):60121,w=e?Symbol.for("react.fundamental"):60117,T=e?Symbol.for("react.responder"):60118,R=e?Symbol.for("react.scope"):60119;function P(D){if(typeof D=="object"&&D!==null){var $=D.$$typeof;switch($){case t:switch(D=D.type,D){case f:case p:case o:case a:case s:case g:return D;default:switch(D=D&&D.$$typeof,D){case u:case h:case v:case S:case c:return D;default:return $}}case r:return $}}}function M(D){return P(D)===p}return dt.AsyncMode=f,dt.ConcurrentMode=p,dt.ContextConsumer=u,dt.ContextProvider=c,dt.Element=t,dt.ForwardRef=h,dt.Fragment=o,dt.Lazy=v,dt.Memo=S,dt.Portal=r,dt.Profiler=a,dt.StrictMode=s,dt.Suspense=g,dt.isAsyncMode=function(D){return M(D)||P(D)===f},dt.isConcurrentMode=M,dt.isContextConsumer=function(D){return P(D)===u},dt.isContextProvider=function(D){return P(D)===c},dt.isElement=function(D){return typeof D=="object"&&D!==null&&D.$$typeof===t},dt.isForwardRef=function(D){return P(D)===h},dt.isFragment=function(D){return P(D)===o},dt.isLazy=function(D){return P(D)===v},dt.isMemo=function(D){return P(D)===S},dt.isPortal=function(D){return P(D)===r},dt.isProfiler=function(D){return P(D)===a},dt.isStrictMode=function(D){return P(D)===s},dt.isSuspense=function(D){return P(D)===g},dt.isValidElementType=function(D){return typeof D=="string"||typeof D=="function"||D===o||D===p||D===a||D===s||D===g||D===b||typeof D=="object"&&D!==null&&(D.$$typeof===v||D.$$typeof===S||D.$$typeof===c||D.$$typeof===u||D.$$typeof===h||D.$$typeof===w||D.$$typeof===T||D.$$typeof===R||D.$$typeof===x)},dt.typeOf=P,dt}var jg;function u1(){return jg||(jg=1,rf.exports=c1()),rf.exports}var of,zg;function d1(){if(zg)return of;zg=1;var e=u1(),t={childContextTypes:!0,contextType:!0,contextTypes:!0,defaultProps:!0,displayName:!0,getDefaultProps:!0,getDerivedStateFromError:!0,getDerivedStateFromProps:!0,mixins:!0,propTypes:!0,type:!0},r={name:!0,length:!0,prototype:!0,caller:!0,callee:!0,arguments:!0,arity:!0},o={$$typeof:!0,render:!0,defaultProps:!0,displayName:!0,propTypes:!0},s={$$typeof:!0,compare:!0,defaultProps:!0,displayName:!0,propTypes:!0,type:!0},a={};a[e.ForwardRef]=o,a[e.Memo]=s;function c(v){return e.isMemo(v)?s:a[v.$$typeof]||t}var u=Object.defineProperty,f=Object.getOwnPropertyNames,p=Object.getOwnPropertySymbols,h=Object.getOwnPropertyDescriptor,g=Object.getPrototypeOf,b=Object.prototype;function S(v,x,w){if(typeof x!="string"){if(b){var T=g(x);T&&T!==b&&S(v,T,w)}var R=f(x);p&&(R=R.concat(p(x)));for(var P=c(v),M=c(x),D=0;D<R.length;++D){var $=R[D];if(!r[$]&&!(w&&w[$])&&!(M&&M[$])&&!(P&&P[$])){var O=h(x,$);try{u(v,$,O)}catch{}}}}return v}return of=S,of}d1();var f1=!0;function Jv(e,t,r){var o="";return r.split(" ").forEach(function(s){e[s]!==void 0?t.push(e[s]+";"):s&&(o+=s+" ")}),o}var tp=function(t,r,o){var s=t.key+"-"+r.name;(o===!1||f1===!1)&&t.registered[s]===void 0&&(t.registered[s]=r.styles)},np=function(t,r,o){tp(t,r,o);var s=t.key+"-"+r.name;if(t.inserted[r.name]===void 0){var a=r;do t.insert(r===a?"."+s:"",a,t.sheet,!0),a=a.next;while(a!==void 0)}};function p1(e){for(var t=0,r,o=0,s=e.length;s>=4;++o,s-=4)r=e.charCodeAt(o)&255|(e.charCodeAt(++o)&255)<<8|(e.charCodeAt(++o)&255)<<16|(e.charCodeAt(++o)&255)<<24,r=(r&65535)*1540483477+((r>>>16)*59797<<16),r^=r>>>24,t=(r&65535)*1540483477+((r>>>16)*59797<<16)^(t&65535)*1540483477+((t>>>16)*59797<<16);switch(s){case 3:t^=(e.charCodeAt(o+2)&255)<<16;case 2:t^=(e.charCodeAt(o+1)&255)<<8;case 1:t^=e.charCodeAt(o)&255,t=(t&65535)*1540483477+((t>>>16)*59797<<16)}return t^=t>>>13,t=(t&65535)*1540483477+((t>>>16)*59797<<16),((t^t>>>15)>>>0).toString(36)}var m1={animationIterationCount:1,aspectRatio:1,borderImageOutset:1,borderImageSlice:1,borderImageWidth:1,boxFlex:1,boxFlexGroup:1,boxOrdinalGroup:1,columnCount:1,columns:1,flex:1,flexGrow:1,flexPositive:1,flexShrink:1,flexNegative:1,flexOrder:1,gridRow:1,gridRowEnd:1,gridRowSpan:1,gridRowStart:1,gridColumn:1,gridColumnEnd:1,gridColumnSpan:1,gridColumnStart:1,msGridRow:1,msGridRowSpan:1,msGridColumn:1,msGridColumnSpan:1,fontWeight:1,lineHeight:1,opacity:1,order:1,orphans:1,scale:1,tabSize:1,widows:1,zIndex:1,zoom:1,WebkitLineClamp:1,fillOpacity:1,floodOpacity:1,stopOpacity:1,strokeDasharray:1,strokeDashoffset:1,strokeMiterlimit:1,strokeOpacity:1,strokeWidth:1},h1=/[A-Z]|^ms/g,g1=/_EMO_([^_]+?)_([^]*?)_EMO_/g,e0=function(t){return t.charCodeAt(1)===45},_g=function(t){return t!=null&&typeof t!="boolean"},sf=Xv(function(e){return e0(e)?e:e.replace(h1,"-$&").toLowerCase()}),Wg=function(t,r){switch(t){case"animation":case"animationName":if(typeof r=="string")return r.replace(g1,function(o,s,a){return kr={name:s,styles:a,next:kr},s})}return m1[t]!==1&&!e0(t)&&typeof r=="number"&&r!==0?r+"px":r};function ua(e,t,r){if(r==null)return"";var o=r;if(o.__emotion_styles!==void 0)return o;switch(typeof r){case"boolean":return"";case"object":{var s=r;if(s.anim===1)return kr={name:s.name,styles:s.styles,next:kr},s.name;var a=r;if(a.styles!==void 0){var c=a.next;if(c!==void 0)for(;c!==void 0;)kr={name:c.name,styles:c.styles,next:kr},c=c.next;var u=a.styles+";";return u}return y1(e,t,r)}case"function":{if(e!==void 0){var f=kr,p=r(e);return kr=f,ua(e,t,p)}break}}var h=r;if(t==null)return h;var g=t[h];return g!==void 0?g:h}function y1(e,t,r){var o="";if(Array.isArray(r))for(var s=0;s<r.length;s++)o+=ua(e,t,r[s])+";";else for(var a in r){var c=r[a];if(typeof c!="object"){var u=c;t!=null&&t[u]!==void 0?o+=a+"{"+t[u]+"}":_g(u)&&(o+=sf(a)+":"+Wg(a,u)+";")}else if(Array.isArray(c)&&typeof c[0]=="string"&&(t==null||t[c[0]]===void 0))for(var f=0;f<c.length;f++)_g(c[f])&&(o+=sf(a)+":"+Wg(a,c[f])+";");else{var p=ua(e,t,c);switch(a){case"animation":case"animationName":{o+=sf(a)+":"+p+";";break}default:o+=a+"{"+p+"}"}}}return o}var Ug=/label:\s*([^\s;{]+)\s*(;|$)/g,kr;function wa(e,t,r){if(e.length===1&&typeof e[0]=="object"&&e[0]!==null&&e[0].styles!==void 0)return e[0];var o=!0,s="";kr=void 0;var a=e[0];if(a==null||a.raw===void 0)o=!1,s+=ua(r,t,a);else{var c=a;s+=c[0]}for(var u=1;u<e.length;u++)if(s+=ua(r,t,e[u]),o){var f=a;s+=f[u]}Ug.lastIndex=0;for(var p="",h;(h=Ug.exec(s))!==null;)p+="-"+h[1];var g=p1(s)+p;return{name:g,styles:s,next:kr}}var v1=function(t){return t()},t0=xc.useInsertionEffect?xc.useInsertionEffect:!1,n0=t0||v1,Hg=t0||k.useLayoutEffect,b1=!1,r0=k.createContext(typeof HTMLElement<"u"?l1({key:"css"}):null);r0.Provider;var rp=function(t){return k.forwardRef(function(r,o){var s=k.useContext(r0);return t(r,s,o)})},Fc=k.createContext({}),op={}.hasOwnProperty,Pf="__EMOTION_TYPE_PLEASE_DO_NOT_USE__",x1=function(t,r){var o={};for(var s in r)op.call(r,s)&&(o[s]=r[s]);return o[Pf]=t,o},w1=function(t){var r=t.cache,o=t.serialized,s=t.isStringTag;return tp(r,o,s),n0(function(){return np(r,o,s)}),null},S1=rp(function(e,t,r){var o=e.css;typeof o=="string"&&t.registered[o]!==void 0&&(o=t.registered[o]);var s=e[Pf],a=[o],c="";typeof e.className=="string"?c=Jv(t.registered,a,e.className):e.className!=null&&(c=e.className+" ");var u=wa(a,void 0,k.useContext(Fc));c+=t.key+"-"+u.name;var f={};for(var p in e)op.call(e,p)&&p!=="css"&&p!==Pf&&!b1&&(f[p]=e[p]);return f.className=c,r&&(f.ref=r),k.createElement(k.Fragment,null,k.createElement(w1,{cache:t,serialized:u,isStringTag:typeof s=="string"}),k.createElement(s,f))}),C1=S1,k1=function(t,r){var o=arguments;if(r==null||!op.call(r,"css"))return k.createElement.apply(void 0,o);var s=o.length,a=new Array(s);a[0]=C1,a[1]=x1(t,r);for(var c=2;c<s;c++)a[c]=o[c];return k.createElement.apply(null,a)};(function(e){var t;t||(t=e.JSX||(e.JSX={}))})(k1);var T1=rp(function(e,t){var r=e.styles,o=wa([r],void 0,k.useContext(Fc)),s=k.useRef();return Hg(function(){var a=t.key+"-global",c=new t.sheet.constructor({key:a,nonce:t.sheet.nonce,container:t.sheet.container,speedy:t.sheet.isSpeedy}),u=!1,f=document.querySelector('style[data-emotion="'+a+" "+o.name+'"]');return t.sheet.tags.length&&(c.before=t.sheet.tags[0]),f!==null&&(u=!0,f.setAttribute("data-emotion",a),c.hydrate([f])),s.current=[c,u],function(){c.flush()}},[t]),Hg(function(){var a=s.current,c=a[0],u=a[1];if(u){a[1]=!1;return}if(o.next!==void 0&&np(t,o.next,!0),c.tags.length){var f=c.tags[c.tags.length-1].nextElementSibling;c.before=f,c.flush()}t.insert("",o,c,!1)},[t,o.name]),null});function ip(){for(var e=arguments.length,t=new Array(e),r=0;r<e;r++)t[r]=arguments[r];return wa(t)}function Sa(){var e=ip.apply(void 0,arguments),t="animation-"+e.name;return{name:t,styles:"@keyframes "+t+"{"+e.styles+"}",anim:1,toString:function(){return"_EMO_"+this.name+"_"+this.styles+"_EMO_"}}}var P1=/^((children|dangerouslySetInnerHTML|key|ref|autoFocus|defaultValue|defaultChecked|innerHTML|suppressContentEditableWarning|suppressHydrationWarning|valueLink|abbr|accept|acceptCharset|accessKey|action|allow|allowUserMedia|allowPaymentRequest|allowFullScreen|allowTransparency|alt|async|autoComplete|autoPlay|capture|cellPadding|cellSpacing|challenge|charSet|checked|cite|classID|className|cols|colSpan|content|contentEditable|contextMenu|controls|controlsList|coords|crossOrigin|data|dateTime|decoding|default|defer|dir|disabled|disablePictureInPicture|disableRemotePlayback|download|draggable|encType|enterKeyHint|fetchpriority|fetchPriority|form|formAction|formEncType|formMethod|formNoValidate|formTarget|frameBorder|headers|height|hidden|high|href|hrefLang|htmlFor|httpEquiv|id|inputMode|integrity|is|keyParams|keyType|kind|label|lang|list|loading|loop|low|marginHeight|marginWidth|max|maxLength|media|mediaGroup|method|min|minLength|multiple|muted|name|nonce|noValidate|open|optimum|pattern|placeholder|playsInline|poster|preload|profile|radioGroup|readOnly|referrerPolicy|rel|required|reversed|role|rows|rowSpan|sandbox|scope|scoped|scrolling|seamless|selected|shape|size|sizes|slot|span|spellCheck|src|srcDoc|srcLang|srcSet|start|step|style|summary|tabIndex|target|title|translate|type|useMap|value|width|wmode|wrap|about|datatype|inlist|prefix|property|resource|typeof|vocab|autoCapitalize|autoCorrect|autoSave|color|incremental|fallback|inert|itemProp|itemScope|itemType|itemID|itemRef|on|option|results|security|unselectable|accentHeight|accumulate|additive|alignmentBaseline|allowReorder|alphabetic|amplitude|arabicForm|ascent|attributeName|attributeType|autoReverse|azimuth|baseFrequency|baselineShift|baseProfile|bbox|begin|bias|by|calcMode|capHeight|clip|clipPathUnits|clipPath|clipRule|colorInterpolation|colorInterpolationFilters|colorProfile|colorRendering|contentScriptType|contentStyleType|cursor|cx|cy|d|decelerate|descent|diffuseConstant|direction|display|divisor|dominantBaseline|dur|dx|dy|edgeMode|elevation|enableBackground|end|exponent|externalResourcesRequired|fill|fillOpacity|fillRule|filter|filterRes|filterUnits|floodColor|floodOpacity|focusable|fontFamily|fontSize|fontSizeAdjust|fontStretch|fontStyle|fontVariant|fontWeight|format|from|fr|fx|fy|g1|g2|glyphName|glyphOrientationHorizontal|glyphOrientationVertical|glyphRef|gradientTransform|gradientUnits|hanging|horizAdvX|horizOriginX|ideographic|imageRendering|in|in2|intercept|k|k1|k2|k3|k4|kernelMatrix|kernelUnitLength|kerning|keyPoints|keySplines|keyTimes|lengthAdjust|letterSpacing|lightingColor|limitingConeAngle|local|markerEnd|markerMid|markerStart|markerHeight|markerUnits|markerWidth|mask|maskContentUnits|maskUnits|mathematical|mode|numOctaves|offset|opacity|operator|order|orient|orientation|origin|overflow|overlinePosition|overlineThickness|panose1|paintOrder|pathLength|patternContentUnits|patternTransform|patternUnits|pointerEvents|points|pointsAtX|pointsAtY|pointsAtZ|preserveAlpha|preserveAspectRatio|primitiveUnits|r|radius|refX|refY|renderingIntent|repeatCount|repeatDur|requiredExtensions|requiredFeatures|restart|result|rotate|rx|ry|scale|seed|shapeRendering|slope|spacing|specularConstant|specularExponent|speed|spreadMethod|startOffset|stdDeviation|stemh|stemv|stitchTiles|stopColor|stopOpacity|strikethroughPosition|strikethroughThickness|string|stroke|strokeDasharray|strokeDashoffset|strokeLinecap|strokeLinejoin|strokeMiterlimit|strokeOpacity|strokeWidth|surfaceScale|systemLanguage|tableValues|targetX|targetY|textAnchor|textDecoration|textRendering|textLength|to|transform|u1|u2|underlinePosition|underlineThickness|unicode|unicodeBidi|unicodeRange|unitsPerEm|vAlphabetic|vHanging|vIdeographic|vMathematical|values|vectorEffect|version|vertAdvY|vertOriginX|vertOriginY|viewBox|viewTarget|visibility|widths|wordSpacing|writingMode|x|xHeight|x1|x2|xChannelSelector|xlinkActuate|xlinkArcrole|xlinkHref|xlinkRole|xlinkShow|xlinkTitle|xlinkType|xmlBase|xmlns|xmlnsXlink|xmlLang|xmlSpace|y|y1|y2|yChannelSelector|z|zoomAndPan|for|class|autofocus)|(([Dd][Aa][Tt][Aa]|[Aa][Rr][Ii][Aa]|x)-.*))$/,M1=Xv(function(e){return P1.test(e)||e.charCodeAt(0)===111&&e.charCodeAt(1)===110&&e.charCodeAt(2)<91}),R1=M1,D1=function(t){return t!=="theme"},Yg=function(t){return typeof t=="string"&&t.charCodeAt(0)>96?R1:D1},Kg=function(t,r,o){var s;if(r){var a=r.shouldForwardProp;s=t.__emotion_forwardProp&&a?function(c){return t.__emotion_forwardProp(c)&&a(c)}:a}return typeof s!="function"&&o&&(s=t.__emotion_forwardProp),s},E1=function(t){var r=t.cache,o=t.serialized,s=t.isStringTag;return tp(r,o,s),n0(function(){return np(r,o,s)}),null},I1=function e(t,r){var o=t.__emotion_real===t,s=o&&t.__emotion_base||t,a,c;r!==void 0&&(a=r.label,c=r.target);var u=Kg(t,r,o),f=u||Yg(s),p=!f("as");return function(){var h=arguments,g=o&&t.__emotion_styles!==void 0?t.__emotion_styles.slice(0):[];if(a!==void 0&&g.push("label:"+a+";"),h[0]==null||h[0].raw===void 0)g.push.apply(g,h);else{var b=h[0];g.push(b[0]);for(var S=h.length,v=1;v<S;v++)g.push(h[v],b[v])}var x=rp(function(w,T,R){var P=p&&w.as||s,M="",D=[],$=w;if(w.theme==null){$={};for(var O in w)$[O]=w[O];$.theme=k.useContext(Fc)}typeof w.className=="string"?M=Jv(T.registered,D,w.className):w.className!=null&&(M=w.className+" ");var N=wa(g.concat(D),T.registered,$);M+=T.key+"-"+N.name,c!==void 0&&(M+=" "+c);var U=p&&u===void 0?Yg(P):f,C={};for(var A in w)p&&A==="as"||U(A)&&(C[A]=w[A]);return C.className=M,R&&(C.ref=R),k.createElement(k.Fragment,null,k.createElement(E1,{cache:T,serialized:N,isStringTag:typeof P=="string"}),k.createElement(P,C))});return x.displayName=a!==void 0?a:"Styled("+(typeof s=="string"?s:s.displayName||s.name||"Component")+")",x.defaultProps=t.defaultProps,x.__emotion_real=x,x.__emotion_base=s,x.__emotion_styles=g,x.__emotion_forwardProp=u,Object.defineProperty(x,"toString",{value:function(){return"."+c}}),x.withComponent=function(w,T){var R=e(w,K({},r,T,{shouldForwardProp:Kg(x,T,!0)}));return R.apply(void 0,g)},x}},O1=["a","abbr","address","area","article","aside","audio","b","base","bdi","bdo","big","blockquote","body","br","button","canvas","caption","cite","code","col","colgroup","data","datalist","dd","del","details","dfn","dialog","div","dl","dt","em","embed","fieldset","figcaption","figure","footer","form","h1","h2","h3","h4","h5","h6","head","header","hgroup","hr","html","i","iframe","img","input","ins","kbd","keygen","label","legend","li","link","main","map","mark","marquee","menu","menuitem","meta","meter","nav","noscript","object","ol","optgroup","option","output","p","param","picture","pre","progress","q","rp","rt","ruby","s","samp","script","section","select","small","source","span","strong","style","sub","summary","sup","table","tbody","td","textarea","tfoot","th","thead","time","title","tr","track","u","ul","var","video","wbr","circle","clipPath","defs","ellipse","foreignObject","g","image","line","linearGradient","mask","path","pattern","polygon","polyline","radialGradient","rect","stop","svg","text","tspan"],Mf=I1.bind(null);O1.forEach(function(e){Mf[e]=Mf(e)});var af={exports:{}},lf,qg;function $1(){if(qg)return lf;qg=1;var e="SECRET_DO_NOT_PASS_THIS_OR_YOU_WILL_BE_FIRED";return lf=e,lf}var cf,Gg;function A1(){if(Gg)return cf;Gg=1;var e=$1();function t(){}function r(){}return r.resetWarningCache=t,cf=function(){function o(c,u,f,p,h,g){if(g!==e){var b=new Error("Calling PropTypes validators directly is not supported by the `prop-types` package. Use PropTypes.checkPropTypes() to call them. Read more at http://fb.me/use-check-prop-types");throw b.name="Invariant Violation",b}}o.isRequired=o;function s(){return o}var a={array:o,bigint:o,bool:o,func:o,number:o,object:o,string:o,symbol:o,any:o,arrayOf:s,element:o,elementType:o,instanceOf:s,node:o,objectOf:s,oneOf:s,oneOfType:s,shape:s,exact:s,checkPropTypes:r,resetWarningCache:t};return a.PropTypes=a,a},cf}var Qg;function N1(){return Qg||(Qg=1,af.exports=A1()()),af.exports}var L1=N1();const re=dr(L1);function F1(e){return e==null||Object.keys(e).length===0}function B1(e){const{styles:t,defaultTheme:r={}}=e,o=typeof t=="function"?s=>t(F1(s)?r:s):t;return I.jsx(T1,{styles:o})}/**
- * @mui/styled-engine v6.3.0
- *
- * @license MIT
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */function o0(e,t){return Mf(e,t)}function V1(e,t){Array.isArray(e.__emotion_styles)&&(e.__emotion_styles=t(e.__emotion_styles))}const Xg=[];function Zg(e){return Xg[0]=e,wa(Xg)}function Tr(e){if(typeof e!="object"||e===null)return!1;const t=Object.getPrototypeOf(e);return(t===null||t===Object.prototype||Object.getPrototypeOf(t)===null)&&!(Symbol.toStringTag in e)&&!(Symbol.iterator in e)}function i0(e){if(k.isValidElement(e)||!Tr(e))return e;const t={};return Object.keys(e).forEach(r=>{t[r]=i0(e[r])}),t}function on(e,t,r={clone:!0}){const o=r.clone?{...e}:e;return Tr(e)&&Tr(t)&&Object.keys(t).forEach(s=>{k.isValidElement(t[s])?o[s]=t[s]:Tr(t[s])&&Object.prototype.hasOwnProperty.call(e,s)&&Tr(e[s])?o[s]=on(e[s],t[s],r):r.clone?o[s]=Tr(t[s])?i0(t[s]):t[s]:o[s]=t[s]}),o}const j1=e=>{const t=Object.keys(e).map(r=>({key:r,val:e[r]}))||[];return t.sort((r,o)=>r.val-o.val),t.reduce((r,o)=>({...r,[o.key]:o.val}),{})};function z1(e){const{values:t={xs:0,sm:600,md:900,lg:1200,xl:1536},unit:r="px",step:o=5,...s}=e,a=j1(t),c=Object.keys(a);function u(b){return`@media (min-width:${typeof t[b]=="number"?t[b]:b}${r})`}function f(b){return`@media (max-width:${(typeof t[b]=="number"?t[b]:b)-o/100}${r})`}function p(b,S){const v=c.indexOf(S);return`@media (min-width:${typeof t[b]=="number"?t[b]:b}${r}) and (max-width:${(v!==-1&&typeof t[c[v]]=="number"?t[c[v]]:S)-o/100}${r})`}function h(b){return c.indexOf(b)+1<c.length?p(b,c[c.indexOf(b)+1]):u(b)}function g(b){const S=c.indexOf(b);return S===0?u(c[1]):S===c.length-1?f(c[S]):p(b,c[c.indexOf(b)+1]).replace("@media","@media not all and")}return{keys:c,values:a,up:u,down:f,between:p,only:h,not:g,unit:r,...s}}function _1(e,t){if(!e.containerQueries)return t;const r=Object.keys(t).filter(o=>o.startsWith("@container")).sort((o,s)=>{var c,u;const a=/min-width:\s*([0-9.]+)/;return+(((c=o.match(a))==null?void 0:c[1])||0)-+(((u=s.match(a))==null?void 0:u[1])||0)});return r.length?r.reduce((o,s)=>{const a=t[s];return delete o[s],o[s]=a,o},{...t}):t}function W1(e,t){return t==="@"||t.startsWith("@")&&(e.some(r=>t.startsWith(`@${r}`))||!!t.match(/^@\d/))}function U1(e,t){const r=t.match(/^@([^/]+)?\/?(.+)?$/);if(!r)return null;const[,o,s]=r,a=Number.isNaN(+o)?o||0:+o;return e.containerQueries(s).up(a)}function H1(e){const t=(a,c)=>a.replace("@media",c?`@container ${c}`:"@container");function r(a,c){a.up=(...u)=>t(e.breakpoints.up(...u),c),a.down=(...u)=>t(e.breakpoints.down(...u),c),a.between=(...u)=>t(e.breakpoints.between(...u),c),a.only=(...u)=>t(e.breakpoints.only(...u),c),a.not=(...u)=>{const f=t(e.breakpoints.not(...u),c);return f.includes("not all and")?f.replace("not all and ","").replace("min-width:","width<").replace("max-width:","width>").replace("and","or"):f}}const o={},s=a=>(r(o,a),o);return r(s),{...e,containerQueries:s}}const Y1={borderRadius:4};function ea(e,t){return t?on(e,t,{clone:!1}):e}const Bc={xs:0,sm:600,md:900,lg:1200,xl:1536},Jg={keys:["xs","sm","md","lg","xl"],up:e=>`@media (min-width:${Bc[e]}px)`},K1={containerQueries:e=>({up:t=>{let r=typeof t=="number"?t:Bc[t]||t;return typeof r=="number"&&(r=`${r}px`),e?`@container ${e} (min-width:${r})`:`@container (min-width:${r})`}})};function Wr(e,t,r){const o=e.theme||{};if(Array.isArray(t)){const a=o.breakpoints||Jg;return t.reduce((c,u,f)=>(c[a.up(a.keys[f])]=r(t[f]),c),{})}if(typeof t=="object"){const a=o.breakpoints||Jg;return Object.keys(t).reduce((c,u)=>{if(W1(a.keys,u)){const f=U1(o.containerQueries?o:K1,u);f&&(c[f]=r(t[u],u))}else if(Object.keys(a.values||Bc).includes(u)){const f=a.up(u);c[f]=r(t[u],u)}else{const f=u;c[f]=t[f]}return c},{})}return r(t)}function q1(e={}){var r;return((r=e.keys)==null?void 0:r.reduce((o,s)=>{const a=e.up(s);return o[a]={},o},{}))||{}}function G1(e,t){return e.reduce((r,o)=>{const s=r[o];return(!s||Object.keys(s).length===0)&&delete r[o],r},t)}function Ee(e){if(typeof e!="string")throw new Error(_r(7));return e.charAt(0).toUpperCase()+e.slice(1)}function Vc(e,t,r=!0){if(!t||typeof t!="string")return null;if(e&&e.vars&&r){const o=`vars.${t}`.split(".").reduce((s,a)=>s&&s[a]?s[a]:null,e);if(o!=null)return o}return t.split(".").reduce((o,s)=>o&&o[s]!=null?o[s]:null,e)}function Sc(e,t,r,o=r){let s;return typeof e=="function"?s=e(r):Array.isArray(e)?s=e[r]||o:s=Vc(e,r)||o,t&&(s=t(s,o,e)),s}function Ft(e){const{prop:t,cssProperty:r=e.prop,themeKey:o,transform:s}=e,a=c=>{if(c[t]==null)return null;const u=c[t],f=c.theme,p=Vc(f,o)||{};return Wr(c,u,g=>{let b=Sc(p,s,g);return g===b&&typeof g=="string"&&(b=Sc(p,s,`${t}${g==="default"?"":Ee(g)}`,g)),r===!1?b:{[r]:b}})};return a.propTypes={},a.filterProps=[t],a}function Q1(e){const t={};return r=>(t[r]===void 0&&(t[r]=e(r)),t[r])}const X1={m:"margin",p:"padding"},Z1={t:"Top",r:"Right",b:"Bottom",l:"Left",x:["Left","Right"],y:["Top","Bottom"]},ey={marginX:"mx",marginY:"my",paddingX:"px",paddingY:"py"},J1=Q1(e=>{if(e.length>2)if(ey[e])e=ey[e];else return[e];const[t,r]=e.split(""),o=X1[t],s=Z1[r]||"";return Array.isArray(s)?s.map(a=>o+a):[o+s]}),sp=["m","mt","mr","mb","ml","mx","my","margin","marginTop","marginRight","marginBottom","marginLeft","marginX","marginY","marginInline","marginInlineStart","marginInlineEnd","marginBlock","marginBlockStart","marginBlockEnd"],ap=["p","pt","pr","pb","pl","px","py","padding","paddingTop","paddingRight","paddingBottom","paddingLeft","paddingX","paddingY","paddingInline","paddingInlineStart","paddingInlineEnd","paddingBlock","paddingBlockStart","paddingBlockEnd"];[...sp,...ap];function Ca(e,t,r,o){const s=Vc(e,t,!0)??r;return typeof s=="number"||typeof s=="string"?a=>typeof a=="string"?a:typeof s=="string"?`calc(${a} * ${s})`:s*a:Array.isArray(s)?a=>{if(typeof a=="string")return a;const c=Math.abs(a),u=s[c];return a>=0?u:typeof u=="number"?-u:`-${u}`}:typeof s=="function"?s:()=>{}}function lp(e){return Ca(e,"spacing",8)}function ka(e,t){return typeof t=="string"||t==null?t:e(t)}function eC(e,t){return r=>e.reduce((o,s)=>(o[s]=ka(t,r),o),{})}function tC(e,t,r,o){if(!t.includes(r))return null;const s=J1(r),a=eC(s,o),c=e[r];return Wr(e,c,a)}function s0(e,t){const r=lp(e.theme);return Object.keys(e).map(o=>tC(e,t,o,r)).reduce(ea,{})}function Et(e){return s0(e,sp)}Et.propTypes={};Et.filterProps=sp;function It(e){return s0(e,ap)}It.propTypes={};It.filterProps=ap;function a0(e=8,t=lp({spacing:e})){if(e.mui)return e;const r=(...o)=>(o.length===0?[1]:o).map(a=>{const c=t(a);return typeof c=="number"?`${c}px`:c}).join(" ");return r.mui=!0,r}function jc(...e){const t=e.reduce((o,s)=>(s.filterProps.forEach(a=>{o[a]=s}),o),{}),r=o=>Object.keys(o).reduce((s,a)=>t[a]?ea(s,t[a](o)):s,{});return r.propTypes={},r.filterProps=e.reduce((o,s)=>o.concat(s.filterProps),[]),r}function Wn(e){return typeof e!="number"?e:`${e}px solid`}function Qn(e,t){return Ft({prop:e,themeKey:"borders",transform:t})}const nC=Qn("border",Wn),rC=Qn("borderTop",Wn),oC=Qn("borderRight",Wn),iC=Qn("borderBottom",Wn),sC=Qn("borderLeft",Wn),aC=Qn("borderColor"),lC=Qn("borderTopColor"),cC=Qn("borderRightColor"),uC=Qn("borderBottomColor"),dC=Qn("borderLeftColor"),fC=Qn("outline",Wn),pC=Qn("outlineColor"),zc=e=>{if(e.borderRadius!==void 0&&e.borderRadius!==null){const t=Ca(e.theme,"shape.borderRadius",4),r=o=>({borderRadius:ka(t,o)});return Wr(e,e.borderRadius,r)}return null};zc.propTypes={};zc.filterProps=["borderRadius"];jc(nC,rC,oC,iC,sC,aC,lC,cC,uC,dC,zc,fC,pC);const _c=e=>{if(e.gap!==void 0&&e.gap!==null){const t=Ca(e.theme,"spacing",8),r=o=>({gap:ka(t,o)});return Wr(e,e.gap,r)}return null};_c.propTypes={};_c.filterProps=["gap"];const Wc=e=>{if(e.columnGap!==void 0&&e.columnGap!==null){const t=Ca(e.theme,"spacing",8),r=o=>({columnGap:ka(t,o)});return Wr(e,e.columnGap,r)}return null};Wc.propTypes={};Wc.filterProps=["columnGap"];const Uc=e=>{if(e.rowGap!==void 0&&e.rowGap!==null){const t=Ca(e.theme,"spacing",8),r=o=>({rowGap:ka(t,o)});return Wr(e,e.rowGap,r)}return null};Uc.propTypes={};Uc.filterProps=["rowGap"];const mC=Ft({prop:"gridColumn"}),hC=Ft({prop:"gridRow"}),gC=Ft({prop:"gridAutoFlow"}),yC=Ft({prop:"gridAutoColumns"}),vC=Ft({prop:"gridAutoRows"}),bC=Ft({prop:"gridTemplateColumns"}),xC=Ft({prop:"gridTemplateRows"}),wC=Ft({prop:"gridTemplateAreas"}),SC=Ft({prop:"gridArea"});jc(_c,Wc,Uc,mC,hC,gC,yC,vC,bC,xC,wC,SC);function Ei(e,t){return t==="grey"?t:e}const CC=Ft({prop:"color",themeKey:"palette",transform:Ei}),kC=Ft({prop:"bgcolor",cssProperty:"backgroundColor",themeKey:"palette",transform:Ei}),TC=Ft({prop:"backgroundColor",themeKey:"palette",transform:Ei});jc(CC,kC,TC);function Mn(e){return e<=1&&e!==0?`${e*100}%`:e}const PC=Ft({prop:"width",transform:Mn}),cp=e=>{if(e.maxWidth!==void 0&&e.maxWidth!==null){const t=r=>{var s,a,c,u,f;const o=((c=(a=(s=e.theme)==null?void 0:s.breakpoints)==null?void 0:a.values)==null?void 0:c[r])||Bc[r];return o?((f=(u=e.theme)==null?void 0:u.breakpoints)==null?void 0:f.unit)!=="px"?{maxWidth:`${o}${e.theme.breakpoints.unit}`}:{maxWidth:o}:{maxWidth:Mn(r)}};return Wr(e,e.maxWidth,t)}return null};cp.filterProps=["maxWidth"];const MC=Ft({prop:"minWidth",transform:Mn}),RC=Ft({prop:"height",transform:Mn}),DC=Ft({prop:"maxHeight",transform:Mn}),EC=Ft({prop:"minHeight",transform:Mn});Ft({prop:"size",cssProperty:"width",transform:Mn});Ft({prop:"size",cssProperty:"height",transform:Mn});const IC=Ft({prop:"boxSizing"});jc(PC,cp,MC,RC,DC,EC,IC);const Ta={border:{themeKey:"borders",transform:Wn},borderTop:{themeKey:"borders",transform:Wn},borderRight:{themeKey:"borders",transform:Wn},borderBottom:{themeKey:"borders",transform:Wn},borderLeft:{themeKey:"borders",transform:Wn},borderColor:{themeKey:"palette"},borderTopColor:{themeKey:"palette"},borderRightColor:{themeKey:"palette"},borderBottomColor:{themeKey:"palette"},borderLeftColor:{themeKey:"palette"},outline:{themeKey:"borders",transform:Wn},outlineColor:{themeKey:"palette"},borderRadius:{themeKey:"shape.borderRadius",style:zc},color:{themeKey:"palette",transform:Ei},bgcolor:{themeKey:"palette",cssProperty:"backgroundColor",transform:Ei},backgroundColor:{themeKey:"palette",transform:Ei},p:{style:It},pt:{style:It},pr:{style:It},pb:{style:It},pl:{style:It},px:{style:It},py:{style:It},padding:{style:It},paddingTop:{style:It},paddingRight:{style:It},paddingBottom:{style:It},paddingLeft:{style:It},paddingX:{style:It},paddingY:{style:It},paddingInline:{style:It},paddingInlineStart:{style:It},paddingInlineEnd:{style:It},paddingBlock:{style:It},paddingBlockStart:{style:It},paddingBlockEnd:{style:It},m:{style:Et},mt:{style:Et},mr:{style:Et},mb:{style:Et},ml:{style:Et},mx:{style:Et},my:{style:Et},margin:{style:Et},marginTop:{style:Et},marginRight:{style:Et},marginBottom:{style:Et},marginLeft:{style:Et},marginX:{style:Et},marginY:{style:Et},marginInline:{style:Et},marginInlineStart:{style:Et},marginInlineEnd:{style:Et},marginBlock:{style:Et},marginBlockStart:{style:Et},marginBlockEnd:{style:Et},displayPrint:{cssProperty:!1,transform:e=>({"@media print":{display:e}})},display:{},overflow:{},textOverflow:{},visibility:{},whiteSpace:{},flexBasis:{},flexDirection:{},flexWrap:{},justifyContent:{},alignItems:{},alignContent:{},order:{},flex:{},flexGrow:{},flexShrink:{},alignSelf:{},justifyItems:{},justifySelf:{},gap:{style:_c},rowGap:{style:Uc},columnGap:{style:Wc},gridColumn:{},gridRow:{},gridAutoFlow:{},gridAutoColumns:{},gridAutoRows:{},gridTemplateColumns:{},gridTemplateRows:{},gridTemplateAreas:{},gridArea:{},position:{},zIndex:{themeKey:"zIndex"},top:{},right:{},bottom:{},left:{},boxShadow:{themeKey:"shadows"},width:{transform:Mn},maxWidth:{style:cp},minWidth:{transform:Mn},height:{transform:Mn},maxHeight:{transform:Mn},minHeight:{transform:Mn},boxSizing:{},font:{themeKey:"font"},fontFamily:{themeKey:"typography"},fontSize:{themeKey:"typography"},fontStyle:{themeKey:"typography"},fontWeight:{themeKey:"typography"},letterSpacing:{},textTransform:{},lineHeight:{},textAlign:{},typography:{cssProperty:!1,themeKey:"typography"}};function OC(...e){const t=e.reduce((o,s)=>o.concat(Object.keys(s)),[]),r=new Set(t);return e.every(o=>r.size===Object.keys(o).length)}function $C(e,t){return typeof e=="function"?e(t):e}function AC(){function e(r,o,s,a){const c={[r]:o,theme:s},u=a[r];if(!u)return{[r]:o};const{cssProperty:f=r,themeKey:p,transform:h,style:g}=u;if(o==null)return null;if(p==="typography"&&o==="inherit")return{[r]:o};const b=Vc(s,p)||{};return g?g(c):Wr(c,o,v=>{let x=Sc(b,h,v);return v===x&&typeof v=="string"&&(x=Sc(b,h,`${r}${v==="default"?"":Ee(v)}`,v)),f===!1?x:{[f]:x}})}function t(r){const{sx:o,theme:s={}}=r||{};if(!o)return null;const a=s.unstable_sxConfig??Ta;function c(u){let f=u;if(typeof u=="function")f=u(s);else if(typeof u!="object")return u;if(!f)return null;const p=q1(s.breakpoints),h=Object.keys(p);let g=p;return Object.keys(f).forEach(b=>{const S=$C(f[b],s);if(S!=null)if(typeof S=="object")if(a[b])g=ea(g,e(b,S,s,a));else{const v=Wr({theme:s},S,x=>({[b]:x}));OC(v,S)?g[b]=t({sx:S,theme:s}):g=ea(g,v)}else g=ea(g,e(b,S,s,a))}),_1(s,G1(h,g))}return Array.isArray(o)?o.map(c):c(o)}return t}const Wo=AC();Wo.filterProps=["sx"];function NC(e,t){var o;const r=this;if(r.vars){if(!((o=r.colorSchemes)!=null&&o[e])||typeof r.getColorSchemeSelector!="function")return{};let s=r.getColorSchemeSelector(e);return s==="&"?t:((s.includes("data-")||s.includes("."))&&(s=`*:where(${s.replace(/\s*&$/,"")}) &`),{[s]:t})}return r.palette.mode===e?t:{}}function Hc(e={},...t){const{breakpoints:r={},palette:o={},spacing:s,shape:a={},...c}=e,u=z1(r),f=a0(s);let p=on({breakpoints:u,direction:"ltr",components:{},palette:{mode:"light",...o},spacing:f,shape:{...Y1,...a}},c);return p=H1(p),p.applyStyles=NC,p=t.reduce((h,g)=>on(h,g),p),p.unstable_sxConfig={...Ta,...c==null?void 0:c.unstable_sxConfig},p.unstable_sx=function(g){return Wo({sx:g,theme:this})},p}function LC(e){return Object.keys(e).length===0}function l0(e=null){const t=k.useContext(Fc);return!t||LC(t)?e:t}const FC=Hc();function Yc(e=FC){return l0(e)}function BC({styles:e,themeId:t,defaultTheme:r={}}){const o=Yc(r),s=typeof e=="function"?e(t&&o[t]||o):e;return I.jsx(B1,{styles:s})}const VC=e=>{var o;const t={systemProps:{},otherProps:{}},r=((o=e==null?void 0:e.theme)==null?void 0:o.unstable_sxConfig)??Ta;return Object.keys(e).forEach(s=>{r[s]?t.systemProps[s]=e[s]:t.otherProps[s]=e[s]}),t};function c0(e){const{sx:t,...r}=e,{systemProps:o,otherProps:s}=VC(r);let a;return Array.isArray(t)?a=[o,...t]:typeof t=="function"?a=(...c)=>{const u=t(...c);return Tr(u)?{...o,...u}:o}:a={...o,...t},{...s,sx:a}}const ty=e=>e,jC=()=>{let e=ty;return{configure(t){e=t},generate(t){return e(t)},reset(){e=ty}}},u0=jC();function d0(e){var t,r,o="";if(typeof e=="string"||typeof e=="number")o+=e;else if(typeof e=="object")if(Array.isArray(e)){var s=e.length;for(t=0;t<s;t++)e[t]&&(r=d0(e[t]))&&(o&&(o+=" "),o+=r)}else for(r in e)e[r]&&(o&&(o+=" "),o+=r);return o}function Me(){for(var e,t,r=0,o="",s=arguments.length;r<s;r++)(e=arguments[r])&&(t=d0(e))&&(o&&(o+=" "),o+=t);return o}function zC(e={}){const{themeId:t,defaultTheme:r,defaultClassName:o="MuiBox-root",generateClassName:s}=e,a=o0("div",{shouldForwardProp:u=>u!=="theme"&&u!=="sx"&&u!=="as"})(Wo);return k.forwardRef(function(f,p){const h=Yc(r),{className:g,component:b="div",...S}=c0(f);return I.jsx(a,{as:b,ref:p,className:Me(g,s?s(o):o),theme:t&&h[t]||h,...S})})}const _C={active:"active",checked:"checked",completed:"completed",disabled:"disabled",error:"error",expanded:"expanded",focused:"focused",focusVisible:"focusVisible",open:"open",readOnly:"readOnly",required:"required",selected:"selected"};function Fe(e,t,r="Mui"){const o=_C[t];return o?`${r}-${o}`:`${u0.generate(e)}-${t}`}function Ae(e,t,r="Mui"){const o={};return t.forEach(s=>{o[s]=Fe(e,s,r)}),o}function f0(e){const{variants:t,...r}=e,o={variants:t,style:Zg(r),isProcessed:!0};return o.style===r||t&&t.forEach(s=>{typeof s.style!="function"&&(s.style=Zg(s.style))}),o}const WC=Hc();function oc(e){return e!=="ownerState"&&e!=="theme"&&e!=="sx"&&e!=="as"}function UC(e){return e?(t,r)=>r[e]:null}function HC(e,t,r){e.theme=KC(e.theme)?r:e.theme[t]||e.theme}function ic(e,t){const r=typeof t=="function"?t(e):t;if(Array.isArray(r))return r.flatMap(o=>ic(e,o));if(Array.isArray(r==null?void 0:r.variants)){let o;if(r.isProcessed)o=r.style;else{const{variants:s,...a}=r;o=a}return p0(e,r.variants,[o])}return r!=null&&r.isProcessed?r.style:r}function p0(e,t,r=[]){var s;let o;e:for(let a=0;a<t.length;a+=1){const c=t[a];if(typeof c.props=="function"){if(o??(o={...e,...e.ownerState,ownerState:e.ownerState}),!c.props(o))continue}else for(const u in c.props)if(e[u]!==c.props[u]&&((s=e.ownerState)==null?void 0:s[u])!==c.props[u])continue e;typeof c.style=="function"?(o??(o={...e,...e.ownerState,ownerState:e.ownerState}),r.push(c.style(o))):r.push(c.style)}return r}function m0(e={}){const{themeId:t,defaultTheme:r=WC,rootShouldForwardProp:o=oc,slotShouldForwardProp:s=oc}=e;function a(u){HC(u,t,r)}return(u,f={})=>{V1(u,D=>D.filter($=>$!==Wo));const{name:p,slot:h,skipVariantsResolver:g,skipSx:b,overridesResolver:S=UC(GC(h)),...v}=f,x=g!==void 0?g:h&&h!=="Root"&&h!=="root"||!1,w=b||!1;let T=oc;h==="Root"||h==="root"?T=o:h?T=s:qC(u)&&(T=void 0);const R=o0(u,{shouldForwardProp:T,label:YC(),...v}),P=D=>{if(typeof D=="function"&&D.__emotion_real!==D)return function(O){return ic(O,D)};if(Tr(D)){const $=f0(D);return $.variants?function(N){return ic(N,$)}:$.style}return D},M=(...D)=>{const $=[],O=D.map(P),N=[];if($.push(a),p&&S&&N.push(function(H){var B,Y;const V=(Y=(B=H.theme.components)==null?void 0:B[p])==null?void 0:Y.styleOverrides;if(!V)return null;const F={};for(const j in V)F[j]=ic(H,V[j]);return S(H,F)}),p&&!x&&N.push(function(H){var F,B;const W=H.theme,V=(B=(F=W==null?void 0:W.components)==null?void 0:F[p])==null?void 0:B.variants;return V?p0(H,V):null}),w||N.push(Wo),Array.isArray(O[0])){const A=O.shift(),H=new Array($.length).fill(""),W=new Array(N.length).fill("");let V;V=[...H,...A,...W],V.raw=[...H,...A.raw,...W],$.unshift(V)}const U=[...$,...O,...N],C=R(...U);return u.muiName&&(C.muiName=u.muiName),C};return R.withConfig&&(M.withConfig=R.withConfig),M}}function YC(e,t){return void 0}function KC(e){for(const t in e)return!1;return!0}function qC(e){return typeof e=="string"&&e.charCodeAt(0)>96}function GC(e){return e&&e.charAt(0).toLowerCase()+e.slice(1)}const QC=m0();function da(e,t){const r={...t};for(const o in e)if(Object.prototype.hasOwnProperty.call(e,o)){const s=o;if(s==="components"||s==="slots")r[s]={...e[s],...r[s]};else if(s==="componentsProps"||s==="slotProps"){const a=e[s],c=t[s];if(!c)r[s]=a||{};else if(!a)r[s]=c;else{r[s]={...c};for(const u in a)if(Object.prototype.hasOwnProperty.call(a,u)){const f=u;r[s][f]=da(a[f],c[f])}}}else r[s]===void 0&&(r[s]=e[s])}return r}function h0(e){const{theme:t,name:r,props:o}=e;return!t||!t.components||!t.components[r]||!t.components[r].defaultProps?o:da(t.components[r].defaultProps,o)}function g0({props:e,name:t,defaultTheme:r,themeId:o}){let s=Yc(r);return o&&(s=s[o]||s),h0({theme:s,name:t,props:e})}const Nt=typeof window<"u"?k.useLayoutEffect:k.useEffect;function XC(e,t,r,o,s){const[a,c]=k.useState(()=>s&&r?r(e).matches:o?o(e).matches:t);return Nt(()=>{if(!r)return;const u=r(e),f=()=>{c(u.matches)};return f(),u.addEventListener("change",f),()=>{u.removeEventListener("change",f)}},[e,r]),a}const ZC={...xc},y0=ZC.useSyncExternalStore;function JC(e,t,r,o,s){const a=k.useCallback(()=>t,[t]),c=k.useMemo(()=>{if(s&&r)return()=>r(e).matches;if(o!==null){const{matches:h}=o(e);return()=>h}return a},[a,e,o,s,r]),[u,f]=k.useMemo(()=>{if(r===null)return[a,()=>()=>{}];const h=r(e);return[()=>h.matches,g=>(h.addEventListener("change",g),()=>{h.removeEventListener("change",g)})]},[a,r,e]);return y0(f,u,c)}function ek(e={}){const{themeId:t}=e;return function(o,s={}){let a=l0();a&&t&&(a=a[t]||a);const c=typeof window<"u"&&typeof window.matchMedia<"u",{defaultMatches:u=!1,matchMedia:f=c?window.matchMedia:null,ssrMatchMedia:p=null,noSsr:h=!1}=h0({name:"MuiUseMediaQuery",props:s,theme:a});let g=typeof o=="function"?o(a):o;return g=g.replace(/^@media( ?)/m,""),(y0!==void 0?JC:XC)(g,u,f,p,h)}}function tk(e,t=Number.MIN_SAFE_INTEGER,r=Number.MAX_SAFE_INTEGER){return Math.max(t,Math.min(e,r))}function up(e,t=0,r=1){return tk(e,t,r)}function nk(e){e=e.slice(1);const t=new RegExp(`.{1,${e.length>=6?2:1}}`,"g");let r=e.match(t);return r&&r[0].length===1&&(r=r.map(o=>o+o)),r?`rgb${r.length===4?"a":""}(${r.map((o,s)=>s<3?parseInt(o,16):Math.round(parseInt(o,16)/255*1e3)/1e3).join(", ")})`:""}function ho(e){if(e.type)return e;if(e.charAt(0)==="#")return ho(nk(e));const t=e.indexOf("("),r=e.substring(0,t);if(!["rgb","rgba","hsl","hsla","color"].includes(r))throw new Error(_r(9,e));let o=e.substring(t+1,e.length-1),s;if(r==="color"){if(o=o.split(" "),s=o.shift(),o.length===4&&o[3].charAt(0)==="/"&&(o[3]=o[3].slice(1)),!["srgb","display-p3","a98-rgb","prophoto-rgb","rec-2020"].includes(s))throw new Error(_r(10,s))}else o=o.split(",");return o=o.map(a=>parseFloat(a)),{type:r,values:o,colorSpace:s}}const rk=e=>{const t=ho(e);return t.values.slice(0,3).map((r,o)=>t.type.includes("hsl")&&o!==0?`${r}%`:r).join(" ")},qs=(e,t)=>{try{return rk(e)}catch{return e}};function Kc(e){const{type:t,colorSpace:r}=e;let{values:o}=e;return t.includes("rgb")?o=o.map((s,a)=>a<3?parseInt(s,10):s):t.includes("hsl")&&(o[1]=`${o[1]}%`,o[2]=`${o[2]}%`),t.includes("color")?o=`${r} ${o.join(" ")}`:o=`${o.join(", ")}`,`${t}(${o})`}function v0(e){e=ho(e);const{values:t}=e,r=t[0],o=t[1]/100,s=t[2]/100,a=o*Math.min(s,1-s),c=(p,h=(p+r/30)%12)=>s-a*Math.max(Math.min(h-3,9-h,1),-1);let u="rgb";const f=[Math.round(c(0)*255),Math.round(c(8)*255),Math.round(c(4)*255)];return e.type==="hsla"&&(u+="a",f.push(t[3])),Kc({type:u,values:f})}function Rf(e){e=ho(e);let t=e.type==="hsl"||e.type==="hsla"?ho(v0(e)).values:e.values;return t=t.map(r=>(e.type!=="color"&&(r/=255),r<=.03928?r/12.92:((r+.055)/1.055)**2.4)),Number((.2126*t[0]+.7152*t[1]+.0722*t[2]).toFixed(3))}function ok(e,t){const r=Rf(e),o=Rf(t);return(Math.max(r,o)+.05)/(Math.min(r,o)+.05)}function nt(e,t){return e=ho(e),t=up(t),(e.type==="rgb"||e.type==="hsl")&&(e.type+="a"),e.type==="color"?e.values[3]=`/${t}`:e.values[3]=t,Kc(e)}function Ul(e,t,r){try{return nt(e,t)}catch{return e}}function dp(e,t){if(e=ho(e),t=up(t),e.type.includes("hsl"))e.values[2]*=1-t;else if(e.type.includes("rgb")||e.type.includes("color"))for(let r=0;r<3;r+=1)e.values[r]*=1-t;return Kc(e)}function gt(e,t,r){try{return dp(e,t)}catch{return e}}function fp(e,t){if(e=ho(e),t=up(t),e.type.includes("hsl"))e.values[2]+=(100-e.values[2])*t;else if(e.type.includes("rgb"))for(let r=0;r<3;r+=1)e.values[r]+=(255-e.values[r])*t;else if(e.type.includes("color"))for(let r=0;r<3;r+=1)e.values[r]+=(1-e.values[r])*t;return Kc(e)}function yt(e,t,r){try{return fp(e,t)}catch{return e}}function ik(e,t=.15){return Rf(e)>.5?dp(e,t):fp(e,t)}function Hl(e,t,r){try{return ik(e,t)}catch{return e}}const b0=re.oneOfType([re.func,re.object]);function ny(...e){return e.reduce((t,r)=>r==null?t:function(...s){t.apply(this,s),r.apply(this,s)},()=>{})}function qc(e,t=166){let r;function o(...s){const a=()=>{e.apply(this,s)};clearTimeout(r),r=setTimeout(a,t)}return o.clear=()=>{clearTimeout(r)},o}function sc(e,t){var r,o,s;return k.isValidElement(e)&&t.indexOf(e.type.muiName??((s=(o=(r=e.type)==null?void 0:r._payload)==null?void 0:o.value)==null?void 0:s.muiName))!==-1}function Qt(e){return e&&e.ownerDocument||document}function ur(e){return Qt(e).defaultView||window}function Df(e,t){typeof e=="function"?e(t):e&&(e.current=t)}let ry=0;function sk(e){const[t,r]=k.useState(e),o=e||t;return k.useEffect(()=>{t==null&&(ry+=1,r(`mui-${ry}`))},[t]),o}const ak={...xc},oy=ak.useId;function Yr(e){if(oy!==void 0){const t=oy();return e??t}return sk(e)}function Ur({controlled:e,default:t,name:r,state:o="value"}){const{current:s}=k.useRef(e!==void 0),[a,c]=k.useState(t),u=s?e:a,f=k.useCallback(p=>{s||c(p)},[]);return[u,f]}function $e(e){const t=k.useRef(e);return Nt(()=>{t.current=e}),k.useRef((...r)=>(0,t.current)(...r)).current}function rt(...e){return k.useMemo(()=>e.every(t=>t==null)?null:t=>{e.forEach(r=>{Df(r,t)})},e)}const iy={};function x0(e,t){const r=k.useRef(iy);return r.current===iy&&(r.current=e(t)),r}const lk=[];function ck(e){k.useEffect(e,lk)}class pp{constructor(){As(this,"currentId",null);As(this,"clear",()=>{this.currentId!==null&&(clearTimeout(this.currentId),this.currentId=null)});As(this,"disposeEffect",()=>this.clear)}static create(){return new pp}start(t,r){this.clear(),this.currentId=setTimeout(()=>{this.currentId=null,r()},t)}}function w0(){const e=x0(pp.create).current;return ck(e.disposeEffect),e}function sy(e){try{return e.matches(":focus-visible")}catch{}return!1}function S0(e=window){const t=e.document.documentElement.clientWidth;return e.innerWidth-t}const uk={border:0,clip:"rect(0 0 0 0)",height:"1px",margin:"-1px",overflow:"hidden",padding:0,position:"absolute",whiteSpace:"nowrap",width:"1px"};function Le(e,t,r=void 0){const o={};for(const s in e){const a=e[s];let c="",u=!0;for(let f=0;f<a.length;f+=1){const p=a[f];p&&(c+=(u===!0?"":" ")+t(p),u=!1,r&&r[p]&&(c+=" "+r[p]))}o[s]=c}return o}function dk(e){return typeof e=="string"}function C0(e,t,r){return e===void 0||dk(e)?t:{...t,ownerState:{...t.ownerState,...r}}}function k0(e,t=[]){if(e===void 0)return{};const r={};return Object.keys(e).filter(o=>o.match(/^on[A-Z]/)&&typeof e[o]=="function"&&!t.includes(o)).forEach(o=>{r[o]=e[o]}),r}function ay(e){if(e===void 0)return{};const t={};return Object.keys(e).filter(r=>!(r.match(/^on[A-Z]/)&&typeof e[r]=="function")).forEach(r=>{t[r]=e[r]}),t}function T0(e){const{getSlotProps:t,additionalProps:r,externalSlotProps:o,externalForwardedProps:s,className:a}=e;if(!t){const S=Me(r==null?void 0:r.className,a,s==null?void 0:s.className,o==null?void 0:o.className),v={...r==null?void 0:r.style,...s==null?void 0:s.style,...o==null?void 0:o.style},x={...r,...s,...o};return S.length>0&&(x.className=S),Object.keys(v).length>0&&(x.style=v),{props:x,internalRef:void 0}}const c=k0({...s,...o}),u=ay(o),f=ay(s),p=t(c),h=Me(p==null?void 0:p.className,r==null?void 0:r.className,a,s==null?void 0:s.className,o==null?void 0:o.className),g={...p==null?void 0:p.style,...r==null?void 0:r.style,...s==null?void 0:s.style,...o==null?void 0:o.style},b={...p,...r,...f,...u};return h.length>0&&(b.className=h),Object.keys(g).length>0&&(b.style=g),{props:b,internalRef:p.ref}}function fa(e,t,r){return typeof e=="function"?e(t,r):e}function Je(e){var g;const{elementType:t,externalSlotProps:r,ownerState:o,skipResolvingSlotProps:s=!1,...a}=e,c=s?{}:fa(r,o),{props:u,internalRef:f}=T0({...a,externalSlotProps:c}),p=rt(f,c==null?void 0:c.ref,(g=e.additionalProps)==null?void 0:g.ref);return C0(t,{...u,ref:p},o)}function Pa(e){var t;return parseInt(k.version,10)>=19?((t=e==null?void 0:e.props)==null?void 0:t.ref)||null:(e==null?void 0:e.ref)||null}const fk=k.createContext(),an=()=>k.useContext(fk)??!1,pk=k.createContext(void 0);function mk(e){const{theme:t,name:r,props:o}=e;if(!t||!t.components||!t.components[r])return o;const s=t.components[r];return s.defaultProps?da(s.defaultProps,o):!s.styleOverrides&&!s.variants?da(s,o):o}function hk({props:e,name:t}){const r=k.useContext(pk);return mk({props:e,name:t,theme:{components:r}})}const ly={theme:void 0};function gk(e){let t,r;return function(s){let a=t;return(a===void 0||s.theme!==r)&&(ly.theme=s.theme,a=f0(e(ly)),t=a,r=s.theme),a}}function yk(e=""){function t(...o){if(!o.length)return"";const s=o[0];return typeof s=="string"&&!s.match(/(#|\(|\)|(-?(\d*\.)?\d+)(px|em|%|ex|ch|rem|vw|vh|vmin|vmax|cm|mm|in|pt|pc))|^(-?(\d*\.)?\d+)$|(\d+ \d+ \d+)/)?`, var(--${e?`${e}-`:""}${s}${t(...o.slice(1))})`:`, ${s}`}return(o,...s)=>`var(--${e?`${e}-`:""}${o}${t(...s)})`}const cy=(e,t,r,o=[])=>{let s=e;t.forEach((a,c)=>{c===t.length-1?Array.isArray(s)?s[Number(a)]=r:s&&typeof s=="object"&&(s[a]=r):s&&typeof s=="object"&&(s[a]||(s[a]=o.includes(a)?[]:{}),s=s[a])})},vk=(e,t,r)=>{function o(s,a=[],c=[]){Object.entries(s).forEach(([u,f])=>{(!r||!r([...a,u]))&&f!=null&&(typeof f=="object"&&Object.keys(f).length>0?o(f,[...a,u],Array.isArray(f)?[...c,u]:c):t([...a,u],f,c))})}o(e)},bk=(e,t)=>typeof t=="number"?["lineHeight","fontWeight","opacity","zIndex"].some(o=>e.includes(o))||e[e.length-1].toLowerCase().includes("opacity")?t:`${t}px`:t;function uf(e,t){const{prefix:r,shouldSkipGeneratingVar:o}=t||{},s={},a={},c={};return vk(e,(u,f,p)=>{if((typeof f=="string"||typeof f=="number")&&(!o||!o(u,f))){const h=`--${r?`${r}-`:""}${u.join("-")}`,g=bk(u,f);Object.assign(s,{[h]:g}),cy(a,u,`var(${h})`,p),cy(c,u,`var(${h}, ${g})`,p)}},u=>u[0]==="vars"),{css:s,vars:a,varsWithDefaults:c}}function xk(e,t={}){const{getSelector:r=w,disableCssColorScheme:o,colorSchemeSelector:s}=t,{colorSchemes:a={},components:c,defaultColorScheme:u="light",...f}=e,{vars:p,css:h,varsWithDefaults:g}=uf(f,t);let b=g;const S={},{[u]:v,...x}=a;if(Object.entries(x||{}).forEach(([P,M])=>{const{vars:D,css:$,varsWithDefaults:O}=uf(M,t);b=on(b,O),S[P]={css:$,vars:D}}),v){const{css:P,vars:M,varsWithDefaults:D}=uf(v,t);b=on(b,D),S[u]={css:P,vars:M}}function w(P,M){var $,O;let D=s;if(s==="class"&&(D=".%s"),s==="data"&&(D="[data-%s]"),s!=null&&s.startsWith("data-")&&!s.includes("%s")&&(D=`[${s}="%s"]`),P){if(D==="media")return e.defaultColorScheme===P?":root":{[`@media (prefers-color-scheme: ${((O=($=a[P])==null?void 0:$.palette)==null?void 0:O.mode)||P})`]:{":root":M}};if(D)return e.defaultColorScheme===P?`:root, ${D.replace("%s",String(P))}`:D.replace("%s",String(P))}return":root"}return{vars:b,generateThemeVars:()=>{let P={...p};return Object.entries(S).forEach(([,{vars:M}])=>{P=on(P,M)}),P},generateStyleSheets:()=>{var N,U;const P=[],M=e.defaultColorScheme||"light";function D(C,A){Object.keys(A).length&&P.push(typeof C=="string"?{[C]:{...A}}:C)}D(r(void 0,{...h}),h);const{[M]:$,...O}=S;if($){const{css:C}=$,A=(U=(N=a[M])==null?void 0:N.palette)==null?void 0:U.mode,H=!o&&A?{colorScheme:A,...C}:{...C};D(r(M,{...H}),H)}return Object.entries(O).forEach(([C,{css:A}])=>{var V,F;const H=(F=(V=a[C])==null?void 0:V.palette)==null?void 0:F.mode,W=!o&&H?{colorScheme:H,...A}:{...A};D(r(C,{...W}),W)}),P}}}function wk(e){return function(r){return e==="media"?`@media (prefers-color-scheme: ${r})`:e?e.startsWith("data-")&&!e.includes("%s")?`[${e}="${r}"] &`:e==="class"?`.${r} &`:e==="data"?`[data-${r}] &`:`${e.replace("%s",r)} &`:"&"}}const Sk=Hc(),Ck=QC("div",{name:"MuiContainer",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:r}=e;return[t.root,t[`maxWidth${Ee(String(r.maxWidth))}`],r.fixed&&t.fixed,r.disableGutters&&t.disableGutters]}}),kk=e=>g0({props:e,name:"MuiContainer",defaultTheme:Sk}),Tk=(e,t)=>{const r=f=>Fe(t,f),{classes:o,fixed:s,disableGutters:a,maxWidth:c}=e,u={root:["root",c&&`maxWidth${Ee(String(c))}`,s&&"fixed",a&&"disableGutters"]};return Le(u,r,o)};function Pk(e={}){const{createStyledComponent:t=Ck,useThemeProps:r=kk,componentName:o="MuiContainer"}=e,s=t(({theme:c,ownerState:u})=>({width:"100%",marginLeft:"auto",boxSizing:"border-box",marginRight:"auto",...!u.disableGutters&&{paddingLeft:c.spacing(2),paddingRight:c.spacing(2),[c.breakpoints.up("sm")]:{paddingLeft:c.spacing(3),paddingRight:c.spacing(3)}}}),({theme:c,ownerState:u})=>u.fixed&&Object.keys(c.breakpoints.values).reduce((f,p)=>{const h=p,g=c.breakpoints.values[h];return g!==0&&(f[c.breakpoints.up(h)]={maxWidth:`${g}${c.breakpoints.unit}`}),f},{}),({theme:c,ownerState:u})=>({...u.maxWidth==="xs"&&{[c.breakpoints.up("xs")]:{maxWidth:Math.max(c.breakpoints.values.xs,444)}},...u.maxWidth&&u.maxWidth!=="xs"&&{[c.breakpoints.up(u.maxWidth)]:{maxWidth:`${c.breakpoints.values[u.maxWidth]}${c.breakpoints.unit}`}}}));return k.forwardRef(function(u,f){const p=r(u),{className:h,component:g="div",disableGutters:b=!1,fixed:S=!1,maxWidth:v="lg",classes:x,...w}=p,T={...p,component:g,disableGutters:b,fixed:S,maxWidth:v},R=Tk(T,o);return I.jsx(s,{as:g,ownerState:T,className:Me(R.root,h),ref:f,...w})})}function P0(){return{text:{primary:"rgba(0, 0, 0, 0.87)",secondary:"rgba(0, 0, 0, 0.6)",disabled:"rgba(0, 0, 0, 0.38)"},divider:"rgba(0, 0, 0, 0.12)",background:{paper:aa.white,default:aa.white},action:{active:"rgba(0, 0, 0, 0.54)",hover:"rgba(0, 0, 0, 0.04)",hoverOpacity:.04,selected:"rgba(0, 0, 0, 0.08)",selectedOpacity:.08,disabled:"rgba(0, 0, 0, 0.26)",disabledBackground:"rgba(0, 0, 0, 0.12)",disabledOpacity:.38,focus:"rgba(0, 0, 0, 0.12)",focusOpacity:.12,activatedOpacity:.12}}}const Mk=P0();function M0(){return{text:{primary:aa.white,secondary:"rgba(255, 255, 255, 0.7)",disabled:"rgba(255, 255, 255, 0.5)",icon:"rgba(255, 255, 255, 0.5)"},divider:"rgba(255, 255, 255, 0.12)",background:{paper:"#121212",default:"#121212"},action:{active:aa.white,hover:"rgba(255, 255, 255, 0.08)",hoverOpacity:.08,selected:"rgba(255, 255, 255, 0.16)",selectedOpacity:.16,disabled:"rgba(255, 255, 255, 0.3)",disabledBackground:"rgba(255, 255, 255, 0.12)",disabledOpacity:.38,focus:"rgba(255, 255, 255, 0.12)",focusOpacity:.12,activatedOpacity:.24}}}const uy=M0();function dy(e,t,r,o){const s=o.light||o,a=o.dark||o*1.5;e[t]||(e.hasOwnProperty(r)?e[t]=e[r]:t==="light"?e.light=fp(e.main,s):t==="dark"&&(e.dark=dp(e.main,a)))}function Rk(e="light"){return e==="dark"?{main:wi[200],light:wi[50],dark:wi[400]}:{main:wi[700],light:wi[400],dark:wi[800]}}function Dk(e="light"){return e==="dark"?{main:xi[200],light:xi[50],dark:xi[400]}:{main:xi[500],light:xi[300],dark:xi[700]}}function Ek(e="light"){return e==="dark"?{main:bi[500],light:bi[300],dark:bi[700]}:{main:bi[700],light:bi[400],dark:bi[800]}}function Ik(e="light"){return e==="dark"?{main:Si[400],light:Si[300],dark:Si[700]}:{main:Si[700],light:Si[500],dark:Si[900]}}function Ok(e="light"){return e==="dark"?{main:Ci[400],light:Ci[300],dark:Ci[700]}:{main:Ci[800],light:Ci[500],dark:Ci[900]}}function $k(e="light"){return e==="dark"?{main:Ls[400],light:Ls[300],dark:Ls[700]}:{main:"#ed6c02",light:Ls[500],dark:Ls[900]}}function mp(e){const{mode:t="light",contrastThreshold:r=3,tonalOffset:o=.2,...s}=e,a=e.primary||Rk(t),c=e.secondary||Dk(t),u=e.error||Ek(t),f=e.info||Ik(t),p=e.success||Ok(t),h=e.warning||$k(t);function g(x){return ok(x,uy.text.primary)>=r?uy.text.primary:Mk.text.primary}const b=({color:x,name:w,mainShade:T=500,lightShade:R=300,darkShade:P=700})=>{if(x={...x},!x.main&&x[T]&&(x.main=x[T]),!x.hasOwnProperty("main"))throw new Error(_r(11,w?` (${w})`:"",T));if(typeof x.main!="string")throw new Error(_r(12,w?` (${w})`:"",JSON.stringify(x.main)));return dy(x,"light",R,o),dy(x,"dark",P,o),x.contrastText||(x.contrastText=g(x.main)),x};let S;return t==="light"?S=P0():t==="dark"&&(S=M0()),on({common:{...aa},mode:t,primary:b({color:a,name:"primary"}),secondary:b({color:c,name:"secondary",mainShade:"A400",lightShade:"A200",darkShade:"A700"}),error:b({color:u,name:"error"}),warning:b({color:h,name:"warning"}),info:b({color:f,name:"info"}),success:b({color:p,name:"success"}),grey:OS,contrastThreshold:r,getContrastText:g,augmentColor:b,tonalOffset:o,...S},s)}function Ak(e){const t={};return Object.entries(e).forEach(o=>{const[s,a]=o;typeof a=="object"&&(t[s]=`${a.fontStyle?`${a.fontStyle} `:""}${a.fontVariant?`${a.fontVariant} `:""}${a.fontWeight?`${a.fontWeight} `:""}${a.fontStretch?`${a.fontStretch} `:""}${a.fontSize||""}${a.lineHeight?`/${a.lineHeight} `:""}${a.fontFamily||""}`)}),t}function Nk(e,t){return{toolbar:{minHeight:56,[e.up("xs")]:{"@media (orientation: landscape)":{minHeight:48}},[e.up("sm")]:{minHeight:64}},...t}}function Lk(e){return Math.round(e*1e5)/1e5}const fy={textTransform:"uppercase"},py='"Roboto", "Helvetica", "Arial", sans-serif';function Fk(e,t){const{fontFamily:r=py,fontSize:o=14,fontWeightLight:s=300,fontWeightRegular:a=400,fontWeightMedium:c=500,fontWeightBold:u=700,htmlFontSize:f=16,allVariants:p,pxToRem:h,...g}=typeof t=="function"?t(e):t,b=o/14,S=h||(w=>`${w/f*b}rem`),v=(w,T,R,P,M)=>({fontFamily:r,fontWeight:w,fontSize:S(T),lineHeight:R,...r===py?{letterSpacing:`${Lk(P/T)}em`}:{},...M,...p}),x={h1:v(s,96,1.167,-1.5),h2:v(s,60,1.2,-.5),h3:v(a,48,1.167,0),h4:v(a,34,1.235,.25),h5:v(a,24,1.334,0),h6:v(c,20,1.6,.15),subtitle1:v(a,16,1.75,.15),subtitle2:v(c,14,1.57,.1),body1:v(a,16,1.5,.15),body2:v(a,14,1.43,.15),button:v(c,14,1.75,.4,fy),caption:v(a,12,1.66,.4),overline:v(a,12,2.66,1,fy),inherit:{fontFamily:"inherit",fontWeight:"inherit",fontSize:"inherit",lineHeight:"inherit",letterSpacing:"inherit"}};return on({htmlFontSize:f,pxToRem:S,fontFamily:r,fontSize:o,fontWeightLight:s,fontWeightRegular:a,fontWeightMedium:c,fontWeightBold:u,...x},g,{clone:!1})}const Bk=.2,Vk=.14,jk=.12;function Ct(...e){return[`${e[0]}px ${e[1]}px ${e[2]}px ${e[3]}px rgba(0,0,0,${Bk})`,`${e[4]}px ${e[5]}px ${e[6]}px ${e[7]}px rgba(0,0,0,${Vk})`,`${e[8]}px ${e[9]}px ${e[10]}px ${e[11]}px rgba(0,0,0,${jk})`].join(",")}const zk=["none",Ct(0,2,1,-1,0,1,1,0,0,1,3,0),Ct(0,3,1,-2,0,2,2,0,0,1,5,0),Ct(0,3,3,-2,0,3,4,0,0,1,8,0),Ct(0,2,4,-1,0,4,5,0,0,1,10,0),Ct(0,3,5,-1,0,5,8,0,0,1,14,0),Ct(0,3,5,-1,0,6,10,0,0,1,18,0),Ct(0,4,5,-2,0,7,10,1,0,2,16,1),Ct(0,5,5,-3,0,8,10,1,0,3,14,2),Ct(0,5,6,-3,0,9,12,1,0,3,16,2),Ct(0,6,6,-3,0,10,14,1,0,4,18,3),Ct(0,6,7,-4,0,11,15,1,0,4,20,3),Ct(0,7,8,-4,0,12,17,2,0,5,22,4),Ct(0,7,8,-4,0,13,19,2,0,5,24,4),Ct(0,7,9,-4,0,14,21,2,0,5,26,4),Ct(0,8,9,-5,0,15,22,2,0,6,28,5),Ct(0,8,10,-5,0,16,24,2,0,6,30,5),Ct(0,8,11,-5,0,17,26,2,0,6,32,5),Ct(0,9,11,-5,0,18,28,2,0,7,34,6),Ct(0,9,12,-6,0,19,29,2,0,7,36,6),Ct(0,10,13,-6,0,20,31,3,0,8,38,7),Ct(0,10,13,-6,0,21,33,3,0,8,40,7),Ct(0,10,14,-6,0,22,35,3,0,8,42,7),Ct(0,11,14,-7,0,23,36,3,0,9,44,8),Ct(0,11,15,-7,0,24,38,3,0,9,46,8)],_k={easeInOut:"cubic-bezier(0.4, 0, 0.2, 1)",easeOut:"cubic-bezier(0.0, 0, 0.2, 1)",easeIn:"cubic-bezier(0.4, 0, 1, 1)",sharp:"cubic-bezier(0.4, 0, 0.6, 1)"},Wk={shortest:150,shorter:200,short:250,standard:300,complex:375,enteringScreen:225,leavingScreen:195};function my(e){return`${Math.round(e)}ms`}function Uk(e){if(!e)return 0;const t=e/36;return Math.min(Math.round((4+15*t**.25+t/5)*10),3e3)}function Hk(e){const t={..._k,...e.easing},r={...Wk,...e.duration};return{getAutoHeightDuration:Uk,create:(s=["all"],a={})=>{const{duration:c=r.standard,easing:u=t.easeInOut,delay:f=0,...p}=a;return(Array.isArray(s)?s:[s]).map(h=>`${h} ${typeof c=="string"?c:my(c)} ${u} ${typeof f=="string"?f:my(f)}`).join(",")},...e,easing:t,duration:r}}const Yk={mobileStepper:1e3,fab:1050,speedDial:1050,appBar:1100,drawer:1200,modal:1300,snackbar:1400,tooltip:1500};function Kk(e){return Tr(e)||typeof e>"u"||typeof e=="string"||typeof e=="boolean"||typeof e=="number"||Array.isArray(e)}function R0(e={}){const t={...e};function r(o){const s=Object.entries(o);for(let a=0;a<s.length;a++){const[c,u]=s[a];!Kk(u)||c.startsWith("unstable_")?delete o[c]:Tr(u)&&(o[c]={...u},r(o[c]))}}return r(t),`import { unstable_createBreakpoints as createBreakpoints, createTransitions } from '@mui/material/styles';
-
-const theme = ${JSON.stringify(t,null,2)};
-
-theme.breakpoints = createBreakpoints(theme.breakpoints || {});
-theme.transitions = createTransitions(theme.transitions || {});
-
-export default theme;`}function Ef(e={},...t){const{breakpoints:r,mixins:o={},spacing:s,palette:a={},transitions:c={},typography:u={},shape:f,...p}=e;if(e.vars)throw new Error(_r(20));const h=mp(a),g=Hc(e);let b=on(g,{mixins:Nk(g.breakpoints,o),palette:h,shadows:zk.slice(),typography:Fk(h,u),transitions:Hk(c),zIndex:{...Yk}});return b=on(b,p),b=t.reduce((S,v)=>on(S,v),b),b.unstable_sxConfig={...Ta,...p==null?void 0:p.unstable_sxConfig},b.unstable_sx=function(v){return Wo({sx:v,theme:this})},b.toRuntimeSource=R0,b}function If(e){let t;return e<1?t=5.11916*e**2:t=4.5*Math.log(e+1)+2,Math.round(t*10)/1e3}const qk=[...Array(25)].map((e,t)=>{if(t===0)return"none";const r=If(t);return`linear-gradient(rgba(255 255 255 / ${r}), rgba(255 255 255 / ${r}))`});function D0(e){return{inputPlaceholder:e==="dark"?.5:.42,inputUnderline:e==="dark"?.7:.42,switchTrackDisabled:e==="dark"?.2:.12,switchTrack:e==="dark"?.3:.38}}function E0(e){return e==="dark"?qk:[]}function Gk(e){const{palette:t={mode:"light"},opacity:r,overlays:o,...s}=e,a=mp(t);return{palette:a,opacity:{...D0(a.mode),...r},overlays:o||E0(a.mode),...s}}function Qk(e){var t;return!!e[0].match(/(cssVarPrefix|colorSchemeSelector|rootSelector|typography|mixins|breakpoints|direction|transitions)/)||!!e[0].match(/sxConfig$/)||e[0]==="palette"&&!!((t=e[1])!=null&&t.match(/(mode|contrastThreshold|tonalOffset)/))}const Xk=e=>[...[...Array(25)].map((t,r)=>`--${e?`${e}-`:""}overlays-${r}`),`--${e?`${e}-`:""}palette-AppBar-darkBg`,`--${e?`${e}-`:""}palette-AppBar-darkColor`],Zk=e=>(t,r)=>{const o=e.rootSelector||":root",s=e.colorSchemeSelector;let a=s;if(s==="class"&&(a=".%s"),s==="data"&&(a="[data-%s]"),s!=null&&s.startsWith("data-")&&!s.includes("%s")&&(a=`[${s}="%s"]`),e.defaultColorScheme===t){if(t==="dark"){const c={};return Xk(e.cssVarPrefix).forEach(u=>{c[u]=r[u],delete r[u]}),a==="media"?{[o]:r,"@media (prefers-color-scheme: dark)":{[o]:c}}:a?{[a.replace("%s",t)]:c,[`${o}, ${a.replace("%s",t)}`]:r}:{[o]:{...r,...c}}}if(a&&a!=="media")return`${o}, ${a.replace("%s",String(t))}`}else if(t){if(a==="media")return{[`@media (prefers-color-scheme: ${String(t)})`]:{[o]:r}};if(a)return a.replace("%s",String(t))}return o};function Jk(e,t){t.forEach(r=>{e[r]||(e[r]={})})}function ye(e,t,r){!e[t]&&r&&(e[t]=r)}function Gs(e){return typeof e!="string"||!e.startsWith("hsl")?e:v0(e)}function Br(e,t){`${t}Channel`in e||(e[`${t}Channel`]=qs(Gs(e[t])))}function eT(e){return typeof e=="number"?`${e}px`:typeof e=="string"||typeof e=="function"||Array.isArray(e)?e:"8px"}const xr=e=>{try{return e()}catch{}},tT=(e="mui")=>yk(e);function df(e,t,r,o){if(!t)return;t=t===!0?{}:t;const s=o==="dark"?"dark":"light";if(!r){e[o]=Gk({...t,palette:{mode:s,...t==null?void 0:t.palette}});return}const{palette:a,...c}=Ef({...r,palette:{mode:s,...t==null?void 0:t.palette}});return e[o]={...t,palette:a,opacity:{...D0(s),...t==null?void 0:t.opacity},overlays:(t==null?void 0:t.overlays)||E0(s)},c}function nT(e={},...t){const{colorSchemes:r={light:!0},defaultColorScheme:o,disableCssColorScheme:s=!1,cssVarPrefix:a="mui",shouldSkipGeneratingVar:c=Qk,colorSchemeSelector:u=r.light&&r.dark?"media":void 0,rootSelector:f=":root",...p}=e,h=Object.keys(r)[0],g=o||(r.light&&h!=="light"?"light":h),b=tT(a),{[g]:S,light:v,dark:x,...w}=r,T={...w};let R=S;if((g==="dark"&&!("dark"in r)||g==="light"&&!("light"in r))&&(R=!0),!R)throw new Error(_r(21,g));const P=df(T,R,p,g);v&&!T.light&&df(T,v,void 0,"light"),x&&!T.dark&&df(T,x,void 0,"dark");let M={defaultColorScheme:g,...P,cssVarPrefix:a,colorSchemeSelector:u,rootSelector:f,getCssVar:b,colorSchemes:T,font:{...Ak(P.typography),...P.font},spacing:eT(p.spacing)};Object.keys(M.colorSchemes).forEach(U=>{const C=M.colorSchemes[U].palette,A=H=>{const W=H.split("-"),V=W[1],F=W[2];return b(H,C[V][F])};if(C.mode==="light"&&(ye(C.common,"background","#fff"),ye(C.common,"onBackground","#000")),C.mode==="dark"&&(ye(C.common,"background","#000"),ye(C.common,"onBackground","#fff")),Jk(C,["Alert","AppBar","Avatar","Button","Chip","FilledInput","LinearProgress","Skeleton","Slider","SnackbarContent","SpeedDialAction","StepConnector","StepContent","Switch","TableCell","Tooltip"]),C.mode==="light"){ye(C.Alert,"errorColor",gt(C.error.light,.6)),ye(C.Alert,"infoColor",gt(C.info.light,.6)),ye(C.Alert,"successColor",gt(C.success.light,.6)),ye(C.Alert,"warningColor",gt(C.warning.light,.6)),ye(C.Alert,"errorFilledBg",A("palette-error-main")),ye(C.Alert,"infoFilledBg",A("palette-info-main")),ye(C.Alert,"successFilledBg",A("palette-success-main")),ye(C.Alert,"warningFilledBg",A("palette-warning-main")),ye(C.Alert,"errorFilledColor",xr(()=>C.getContrastText(C.error.main))),ye(C.Alert,"infoFilledColor",xr(()=>C.getContrastText(C.info.main))),ye(C.Alert,"successFilledColor",xr(()=>C.getContrastText(C.success.main))),ye(C.Alert,"warningFilledColor",xr(()=>C.getContrastText(C.warning.main))),ye(C.Alert,"errorStandardBg",yt(C.error.light,.9)),ye(C.Alert,"infoStandardBg",yt(C.info.light,.9)),ye(C.Alert,"successStandardBg",yt(C.success.light,.9)),ye(C.Alert,"warningStandardBg",yt(C.warning.light,.9)),ye(C.Alert,"errorIconColor",A("palette-error-main")),ye(C.Alert,"infoIconColor",A("palette-info-main")),ye(C.Alert,"successIconColor",A("palette-success-main")),ye(C.Alert,"warningIconColor",A("palette-warning-main")),ye(C.AppBar,"defaultBg",A("palette-grey-100")),ye(C.Avatar,"defaultBg",A("palette-grey-400")),ye(C.Button,"inheritContainedBg",A("palette-grey-300")),ye(C.Button,"inheritContainedHoverBg",A("palette-grey-A100")),ye(C.Chip,"defaultBorder",A("palette-grey-400")),ye(C.Chip,"defaultAvatarColor",A("palette-grey-700")),ye(C.Chip,"defaultIconColor",A("palette-grey-700")),ye(C.FilledInput,"bg","rgba(0, 0, 0, 0.06)"),ye(C.FilledInput,"hoverBg","rgba(0, 0, 0, 0.09)"),ye(C.FilledInput,"disabledBg","rgba(0, 0, 0, 0.12)"),ye(C.LinearProgress,"primaryBg",yt(C.primary.main,.62)),ye(C.LinearProgress,"secondaryBg",yt(C.secondary.main,.62)),ye(C.LinearProgress,"errorBg",yt(C.error.main,.62)),ye(C.LinearProgress,"infoBg",yt(C.info.main,.62)),ye(C.LinearProgress,"successBg",yt(C.success.main,.62)),ye(C.LinearProgress,"warningBg",yt(C.warning.main,.62)),ye(C.Skeleton,"bg",`rgba(${A("palette-text-primaryChannel")} / 0.11)`),ye(C.Slider,"primaryTrack",yt(C.primary.main,.62)),ye(C.Slider,"secondaryTrack",yt(C.secondary.main,.62)),ye(C.Slider,"errorTrack",yt(C.error.main,.62)),ye(C.Slider,"infoTrack",yt(C.info.main,.62)),ye(C.Slider,"successTrack",yt(C.success.main,.62)),ye(C.Slider,"warningTrack",yt(C.warning.main,.62));const H=Hl(C.background.default,.8);ye(C.SnackbarContent,"bg",H),ye(C.SnackbarContent,"color",xr(()=>C.getContrastText(H))),ye(C.SpeedDialAction,"fabHoverBg",Hl(C.background.paper,.15)),ye(C.StepConnector,"border",A("palette-grey-400")),ye(C.StepContent,"border",A("palette-grey-400")),ye(C.Switch,"defaultColor",A("palette-common-white")),ye(C.Switch,"defaultDisabledColor",A("palette-grey-100")),ye(C.Switch,"primaryDisabledColor",yt(C.primary.main,.62)),ye(C.Switch,"secondaryDisabledColor",yt(C.secondary.main,.62)),ye(C.Switch,"errorDisabledColor",yt(C.error.main,.62)),ye(C.Switch,"infoDisabledColor",yt(C.info.main,.62)),ye(C.Switch,"successDisabledColor",yt(C.success.main,.62)),ye(C.Switch,"warningDisabledColor",yt(C.warning.main,.62)),ye(C.TableCell,"border",yt(Ul(C.divider,1),.88)),ye(C.Tooltip,"bg",Ul(C.grey[700],.92))}if(C.mode==="dark"){ye(C.Alert,"errorColor",yt(C.error.light,.6)),ye(C.Alert,"infoColor",yt(C.info.light,.6)),ye(C.Alert,"successColor",yt(C.success.light,.6)),ye(C.Alert,"warningColor",yt(C.warning.light,.6)),ye(C.Alert,"errorFilledBg",A("palette-error-dark")),ye(C.Alert,"infoFilledBg",A("palette-info-dark")),ye(C.Alert,"successFilledBg",A("palette-success-dark")),ye(C.Alert,"warningFilledBg",A("palette-warning-dark")),ye(C.Alert,"errorFilledColor",xr(()=>C.getContrastText(C.error.dark))),ye(C.Alert,"infoFilledColor",xr(()=>C.getContrastText(C.info.dark))),ye(C.Alert,"successFilledColor",xr(()=>C.getContrastText(C.success.dark))),ye(C.Alert,"warningFilledColor",xr(()=>C.getContrastText(C.warning.dark))),ye(C.Alert,"errorStandardBg",gt(C.error.light,.9)),ye(C.Alert,"infoStandardBg",gt(C.info.light,.9)),ye(C.Alert,"successStandardBg",gt(C.success.light,.9)),ye(C.Alert,"warningStandardBg",gt(C.warning.light,.9)),ye(C.Alert,"errorIconColor",A("palette-error-main")),ye(C.Alert,"infoIconColor",A("palette-info-main")),ye(C.Alert,"successIconColor",A("palette-success-main")),ye(C.Alert,"warningIconColor",A("palette-warning-main")),ye(C.AppBar,"defaultBg",A("palette-grey-900")),ye(C.AppBar,"darkBg",A("palette-background-paper")),ye(C.AppBar,"darkColor",A("palette-text-primary")),ye(C.Avatar,"defaultBg",A("palette-grey-600")),ye(C.Button,"inheritContainedBg",A("palette-grey-800")),ye(C.Button,"inheritContainedHoverBg",A("palette-grey-700")),ye(C.Chip,"defaultBorder",A("palette-grey-700")),ye(C.Chip,"defaultAvatarColor",A("palette-grey-300")),ye(C.Chip,"defaultIconColor",A("palette-grey-300")),ye(C.FilledInput,"bg","rgba(255, 255, 255, 0.09)"),ye(C.FilledInput,"hoverBg","rgba(255, 255, 255, 0.13)"),ye(C.FilledInput,"disabledBg","rgba(255, 255, 255, 0.12)"),ye(C.LinearProgress,"primaryBg",gt(C.primary.main,.5)),ye(C.LinearProgress,"secondaryBg",gt(C.secondary.main,.5)),ye(C.LinearProgress,"errorBg",gt(C.error.main,.5)),ye(C.LinearProgress,"infoBg",gt(C.info.main,.5)),ye(C.LinearProgress,"successBg",gt(C.success.main,.5)),ye(C.LinearProgress,"warningBg",gt(C.warning.main,.5)),ye(C.Skeleton,"bg",`rgba(${A("palette-text-primaryChannel")} / 0.13)`),ye(C.Slider,"primaryTrack",gt(C.primary.main,.5)),ye(C.Slider,"secondaryTrack",gt(C.secondary.main,.5)),ye(C.Slider,"errorTrack",gt(C.error.main,.5)),ye(C.Slider,"infoTrack",gt(C.info.main,.5)),ye(C.Slider,"successTrack",gt(C.success.main,.5)),ye(C.Slider,"warningTrack",gt(C.warning.main,.5));const H=Hl(C.background.default,.98);ye(C.SnackbarContent,"bg",H),ye(C.SnackbarContent,"color",xr(()=>C.getContrastText(H))),ye(C.SpeedDialAction,"fabHoverBg",Hl(C.background.paper,.15)),ye(C.StepConnector,"border",A("palette-grey-600")),ye(C.StepContent,"border",A("palette-grey-600")),ye(C.Switch,"defaultColor",A("palette-grey-300")),ye(C.Switch,"defaultDisabledColor",A("palette-grey-600")),ye(C.Switch,"primaryDisabledColor",gt(C.primary.main,.55)),ye(C.Switch,"secondaryDisabledColor",gt(C.secondary.main,.55)),ye(C.Switch,"errorDisabledColor",gt(C.error.main,.55)),ye(C.Switch,"infoDisabledColor",gt(C.info.main,.55)),ye(C.Switch,"successDisabledColor",gt(C.success.main,.55)),ye(C.Switch,"warningDisabledColor",gt(C.warning.main,.55)),ye(C.TableCell,"border",gt(Ul(C.divider,1),.68)),ye(C.Tooltip,"bg",Ul(C.grey[700],.92))}Br(C.background,"default"),Br(C.background,"paper"),Br(C.common,"background"),Br(C.common,"onBackground"),Br(C,"divider"),Object.keys(C).forEach(H=>{const W=C[H];H!=="tonalOffset"&&W&&typeof W=="object"&&(W.main&&ye(C[H],"mainChannel",qs(Gs(W.main))),W.light&&ye(C[H],"lightChannel",qs(Gs(W.light))),W.dark&&ye(C[H],"darkChannel",qs(Gs(W.dark))),W.contrastText&&ye(C[H],"contrastTextChannel",qs(Gs(W.contrastText))),H==="text"&&(Br(C[H],"primary"),Br(C[H],"secondary")),H==="action"&&(W.active&&Br(C[H],"active"),W.selected&&Br(C[H],"selected")))})}),M=t.reduce((U,C)=>on(U,C),M);const D={prefix:a,disableCssColorScheme:s,shouldSkipGeneratingVar:c,getSelector:Zk(M)},{vars:$,generateThemeVars:O,generateStyleSheets:N}=xk(M,D);return M.vars=$,Object.entries(M.colorSchemes[M.defaultColorScheme]).forEach(([U,C])=>{M[U]=C}),M.generateThemeVars=O,M.generateStyleSheets=N,M.generateSpacing=function(){return a0(p.spacing,lp(this))},M.getColorSchemeSelector=wk(u),M.spacing=M.generateSpacing(),M.shouldSkipGeneratingVar=c,M.unstable_sxConfig={...Ta,...p==null?void 0:p.unstable_sxConfig},M.unstable_sx=function(C){return Wo({sx:C,theme:this})},M.toRuntimeSource=R0,M}function hy(e,t,r){e.colorSchemes&&r&&(e.colorSchemes[t]={...r!==!0&&r,palette:mp({...r===!0?{}:r.palette,mode:t})})}function I0(e={},...t){const{palette:r,cssVariables:o=!1,colorSchemes:s=r?void 0:{light:!0},defaultColorScheme:a=r==null?void 0:r.mode,...c}=e,u=a||"light",f=s==null?void 0:s[u],p={...s,...r?{[u]:{...typeof f!="boolean"&&f,palette:r}}:void 0};if(o===!1){if(!("colorSchemes"in e))return Ef(e,...t);let h=r;"palette"in e||p[u]&&(p[u]!==!0?h=p[u].palette:u==="dark"&&(h={mode:"dark"}));const g=Ef({...e,palette:h},...t);return g.defaultColorScheme=u,g.colorSchemes=p,g.palette.mode==="light"&&(g.colorSchemes.light={...p.light!==!0&&p.light,palette:g.palette},hy(g,"dark",p.dark)),g.palette.mode==="dark"&&(g.colorSchemes.dark={...p.dark!==!0&&p.dark,palette:g.palette},hy(g,"light",p.light)),g}return!r&&!("light"in p)&&u==="light"&&(p.light=!0),nT({...c,colorSchemes:p,defaultColorScheme:u,...typeof o!="boolean"&&o},...t)}const Gc=I0();function Ko(){const e=Yc(Gc);return e[Wi]||e}function ot({props:e,name:t}){return g0({props:e,name:t,defaultTheme:Gc,themeId:Wi})}function O0(e){return e!=="ownerState"&&e!=="theme"&&e!=="sx"&&e!=="as"}const Xn=e=>O0(e)&&e!=="classes",ie=m0({themeId:Wi,defaultTheme:Gc,rootShouldForwardProp:Xn});function rT(e){return I.jsx(BC,{...e,defaultTheme:Gc,themeId:Wi})}function oT(e){return function(r){return I.jsx(rT,{styles:typeof e=="function"?o=>e({theme:o,...r}):e})}}function iT(){return c0}const st=gk;function et(e){return hk(e)}function sT(e){return Fe("MuiSvgIcon",e)}Ae("MuiSvgIcon",["root","colorPrimary","colorSecondary","colorAction","colorError","colorDisabled","fontSizeInherit","fontSizeSmall","fontSizeMedium","fontSizeLarge"]);const aT=e=>{const{color:t,fontSize:r,classes:o}=e,s={root:["root",t!=="inherit"&&`color${Ee(t)}`,`fontSize${Ee(r)}`]};return Le(s,sT,o)},lT=ie("svg",{name:"MuiSvgIcon",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:r}=e;return[t.root,r.color!=="inherit"&&t[`color${Ee(r.color)}`],t[`fontSize${Ee(r.fontSize)}`]]}})(st(({theme:e})=>{var t,r,o,s,a,c,u,f,p,h,g,b,S,v;return{userSelect:"none",width:"1em",height:"1em",display:"inline-block",flexShrink:0,transition:(s=(t=e.transitions)==null?void 0:t.create)==null?void 0:s.call(t,"fill",{duration:(o=(r=(e.vars??e).transitions)==null?void 0:r.duration)==null?void 0:o.shorter}),variants:[{props:x=>!x.hasSvgAsChild,style:{fill:"currentColor"}},{props:{fontSize:"inherit"},style:{fontSize:"inherit"}},{props:{fontSize:"small"},style:{fontSize:((c=(a=e.typography)==null?void 0:a.pxToRem)==null?void 0:c.call(a,20))||"1.25rem"}},{props:{fontSize:"medium"},style:{fontSize:((f=(u=e.typography)==null?void 0:u.pxToRem)==null?void 0:f.call(u,24))||"1.5rem"}},{props:{fontSize:"large"},style:{fontSize:((h=(p=e.typography)==null?void 0:p.pxToRem)==null?void 0:h.call(p,35))||"2.1875rem"}},...Object.entries((e.vars??e).palette).filter(([,x])=>x&&x.main).map(([x])=>{var w,T;return{props:{color:x},style:{color:(T=(w=(e.vars??e).palette)==null?void 0:w[x])==null?void 0:T.main}}}),{props:{color:"action"},style:{color:(b=(g=(e.vars??e).palette)==null?void 0:g.action)==null?void 0:b.active}},{props:{color:"disabled"},style:{color:(v=(S=(e.vars??e).palette)==null?void 0:S.action)==null?void 0:v.disabled}},{props:{color:"inherit"},style:{color:void 0}}]}})),Of=k.forwardRef(function(t,r){const o=et({props:t,name:"MuiSvgIcon"}),{children:s,className:a,color:c="inherit",component:u="svg",fontSize:f="medium",htmlColor:p,inheritViewBox:h=!1,titleAccess:g,viewBox:b="0 0 24 24",...S}=o,v=k.isValidElement(s)&&s.type==="svg",x={...o,color:c,component:u,fontSize:f,instanceFontSize:t.fontSize,inheritViewBox:h,viewBox:b,hasSvgAsChild:v},w={};h||(w.viewBox=b);const T=aT(x);return I.jsxs(lT,{as:u,className:Me(T.root,a),focusable:"false",color:p,"aria-hidden":g?void 0:!0,role:g?"img":void 0,ref:r,...w,...S,...v&&s.props,ownerState:x,children:[v?s.props.children:s,g?I.jsx("title",{children:g}):null]})});Of.muiName="SvgIcon";function Zn(e,t){function r(o,s){return I.jsx(Of,{"data-testid":`${t}Icon`,ref:s,...o,children:e})}return r.muiName=Of.muiName,k.memo(k.forwardRef(r))}function We(e,t){if(e==null)return{};var r={};for(var o in e)if({}.hasOwnProperty.call(e,o)){if(t.includes(o))continue;r[o]=e[o]}return r}function $f(e,t){return $f=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(r,o){return r.__proto__=o,r},$f(e,t)}function hp(e,t){e.prototype=Object.create(t.prototype),e.prototype.constructor=e,$f(e,t)}function cT(e,t){return e.classList?!!t&&e.classList.contains(t):(" "+(e.className.baseVal||e.className)+" ").indexOf(" "+t+" ")!==-1}function uT(e,t){e.classList?e.classList.add(t):cT(e,t)||(typeof e.className=="string"?e.className=e.className+" "+t:e.setAttribute("class",(e.className&&e.className.baseVal||"")+" "+t))}function gy(e,t){return e.replace(new RegExp("(^|\\s)"+t+"(?:\\s|$)","g"),"$1").replace(/\s+/g," ").replace(/^\s*|\s*$/g,"")}function dT(e,t){e.classList?e.classList.remove(t):typeof e.className=="string"?e.className=gy(e.className,t):e.setAttribute("class",gy(e.className&&e.className.baseVal||"",t))}var $0=Uv();const Yl=dr($0),yy={disabled:!1},Cc=Un.createContext(null);var A0=function(t){return t.scrollTop},Qs="unmounted",Ao="exited",No="entering",Mi="entered",Af="exiting",fr=function(e){hp(t,e);function t(o,s){var a;a=e.call(this,o,s)||this;var c=s,u=c&&!c.isMounting?o.enter:o.appear,f;return a.appearStatus=null,o.in?u?(f=Ao,a.appearStatus=No):f=Mi:o.unmountOnExit||o.mountOnEnter?f=Qs:f=Ao,a.state={status:f},a.nextCallback=null,a}t.getDerivedStateFromProps=function(s,a){var c=s.in;return c&&a.status===Qs?{status:Ao}:null};var r=t.prototype;return r.componentDidMount=function(){this.updateStatus(!0,this.appearStatus)},r.componentDidUpdate=function(s){var a=null;if(s!==this.props){var c=this.state.status;this.props.in?c!==No&&c!==Mi&&(a=No):(c===No||c===Mi)&&(a=Af)}this.updateStatus(!1,a)},r.componentWillUnmount=function(){this.cancelNextCallback()},r.getTimeouts=function(){var s=this.props.timeout,a,c,u;return a=c=u=s,s!=null&&typeof s!="number"&&(a=s.exit,c=s.enter,u=s.appear!==void 0?s.appear:c),{exit:a,enter:c,appear:u}},r.updateStatus=function(s,a){if(s===void 0&&(s=!1),a!==null)if(this.cancelNextCallback(),a===No){if(this.props.unmountOnExit||this.props.mountOnEnter){var c=this.props.nodeRef?this.props.nodeRef.current:Yl.findDOMNode(this);c&&A0(c)}this.performEnter(s)}else this.performExit();else this.props.unmountOnExit&&this.state.status===Ao&&this.setState({status:Qs})},r.performEnter=function(s){var a=this,c=this.props.enter,u=this.context?this.context.isMounting:s,f=this.props.nodeRef?[u]:[Yl.findDOMNode(this),u],p=f[0],h=f[1],g=this.getTimeouts(),b=u?g.appear:g.enter;if(!s&&!c||yy.disabled){this.safeSetState({status:Mi},function(){a.props.onEntered(p)});return}this.props.onEnter(p,h),this.safeSetState({status:No},function(){a.props.onEntering(p,h),a.onTransitionEnd(b,function(){a.safeSetState({status:Mi},function(){a.props.onEntered(p,h)})})})},r.performExit=function(){var s=this,a=this.props.exit,c=this.getTimeouts(),u=this.props.nodeRef?void 0:Yl.findDOMNode(this);if(!a||yy.disabled){this.safeSetState({status:Ao},function(){s.props.onExited(u)});return}this.props.onExit(u),this.safeSetState({status:Af},function(){s.props.onExiting(u),s.onTransitionEnd(c.exit,function(){s.safeSetState({status:Ao},function(){s.props.onExited(u)})})})},r.cancelNextCallback=function(){this.nextCallback!==null&&(this.nextCallback.cancel(),this.nextCallback=null)},r.safeSetState=function(s,a){a=this.setNextCallback(a),this.setState(s,a)},r.setNextCallback=function(s){var a=this,c=!0;return this.nextCallback=function(u){c&&(c=!1,a.nextCallback=null,s(u))},this.nextCallback.cancel=function(){c=!1},this.nextCallback},r.onTransitionEnd=function(s,a){this.setNextCallback(a);var c=this.props.nodeRef?this.props.nodeRef.current:Yl.findDOMNode(this),u=s==null&&!this.props.addEndListener;if(!c||u){setTimeout(this.nextCallback,0);return}if(this.props.addEndListener){var f=this.props.nodeRef?[this.nextCallback]:[c,this.nextCallback],p=f[0],h=f[1];this.props.addEndListener(p,h)}s!=null&&setTimeout(this.nextCallback,s)},r.render=function(){var s=this.state.status;if(s===Qs)return null;var a=this.props,c=a.children;a.in,a.mountOnEnter,a.unmountOnExit,a.appear,a.enter,a.exit,a.timeout,a.addEndListener,a.onEnter,a.onEntering,a.onEntered,a.onExit,a.onExiting,a.onExited,a.nodeRef;var u=We(a,["children","in","mountOnEnter","unmountOnExit","appear","enter","exit","timeout","addEndListener","onEnter","onEntering","onEntered","onExit","onExiting","onExited","nodeRef"]);return Un.createElement(Cc.Provider,{value:null},typeof c=="function"?c(s,u):Un.cloneElement(Un.Children.only(c),u))},t}(Un.Component);fr.contextType=Cc;fr.propTypes={};function ki(){}fr.defaultProps={in:!1,mountOnEnter:!1,unmountOnExit:!1,appear:!1,enter:!0,exit:!0,onEnter:ki,onEntering:ki,onEntered:ki,onExit:ki,onExiting:ki,onExited:ki};fr.UNMOUNTED=Qs;fr.EXITED=Ao;fr.ENTERING=No;fr.ENTERED=Mi;fr.EXITING=Af;var fT=function(t,r){return t&&r&&r.split(" ").forEach(function(o){return uT(t,o)})},ff=function(t,r){return t&&r&&r.split(" ").forEach(function(o){return dT(t,o)})},gp=function(e){hp(t,e);function t(){for(var o,s=arguments.length,a=new Array(s),c=0;c<s;c++)a[c]=arguments[c];return o=e.call.apply(e,[this].concat(a))||this,o.appliedClasses={appear:{},enter:{},exit:{}},o.onEnter=function(u,f){var p=o.resolveArguments(u,f),h=p[0],g=p[1];o.removeClasses(h,"exit"),o.addClass(h,g?"appear":"enter","base"),o.props.onEnter&&o.props.onEnter(u,f)},o.onEntering=function(u,f){var p=o.resolveArguments(u,f),h=p[0],g=p[1],b=g?"appear":"enter";o.addClass(h,b,"active"),o.props.onEntering&&o.props.onEntering(u,f)},o.onEntered=function(u,f){var p=o.resolveArguments(u,f),h=p[0],g=p[1],b=g?"appear":"enter";o.removeClasses(h,b),o.addClass(h,b,"done"),o.props.onEntered&&o.props.onEntered(u,f)},o.onExit=function(u){var f=o.resolveArguments(u),p=f[0];o.removeClasses(p,"appear"),o.removeClasses(p,"enter"),o.addClass(p,"exit","base"),o.props.onExit&&o.props.onExit(u)},o.onExiting=function(u){var f=o.resolveArguments(u),p=f[0];o.addClass(p,"exit","active"),o.props.onExiting&&o.props.onExiting(u)},o.onExited=function(u){var f=o.resolveArguments(u),p=f[0];o.removeClasses(p,"exit"),o.addClass(p,"exit","done"),o.props.onExited&&o.props.onExited(u)},o.resolveArguments=function(u,f){return o.props.nodeRef?[o.props.nodeRef.current,u]:[u,f]},o.getClassNames=function(u){var f=o.props.classNames,p=typeof f=="string",h=p&&f?f+"-":"",g=p?""+h+u:f[u],b=p?g+"-active":f[u+"Active"],S=p?g+"-done":f[u+"Done"];return{baseClassName:g,activeClassName:b,doneClassName:S}},o}var r=t.prototype;return r.addClass=function(s,a,c){var u=this.getClassNames(a)[c+"ClassName"],f=this.getClassNames("enter"),p=f.doneClassName;a==="appear"&&c==="done"&&p&&(u+=" "+p),c==="active"&&s&&A0(s),u&&(this.appliedClasses[a][c]=u,fT(s,u))},r.removeClasses=function(s,a){var c=this.appliedClasses[a],u=c.base,f=c.active,p=c.done;this.appliedClasses[a]={},u&&ff(s,u),f&&ff(s,f),p&&ff(s,p)},r.render=function(){var s=this.props;s.classNames;var a=We(s,["classNames"]);return Un.createElement(fr,K({},a,{onEnter:this.onEnter,onEntered:this.onEntered,onEntering:this.onEntering,onExit:this.onExit,onExiting:this.onExiting,onExited:this.onExited}))},t}(Un.Component);gp.defaultProps={classNames:""};gp.propTypes={};function pT(e){if(e===void 0)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}function yp(e,t){var r=function(a){return t&&k.isValidElement(a)?t(a):a},o=Object.create(null);return e&&k.Children.map(e,function(s){return s}).forEach(function(s){o[s.key]=r(s)}),o}function mT(e,t){e=e||{},t=t||{};function r(h){return h in t?t[h]:e[h]}var o=Object.create(null),s=[];for(var a in e)a in t?s.length&&(o[a]=s,s=[]):s.push(a);var c,u={};for(var f in t){if(o[f])for(c=0;c<o[f].length;c++){var p=o[f][c];u[o[f][c]]=r(p)}u[f]=r(f)}for(c=0;c<s.length;c++)u[s[c]]=r(s[c]);return u}function Lo(e,t,r){return r[t]!=null?r[t]:e.props[t]}function hT(e,t){return yp(e.children,function(r){return k.cloneElement(r,{onExited:t.bind(null,r),in:!0,appear:Lo(r,"appear",e),enter:Lo(r,"enter",e),exit:Lo(r,"exit",e)})})}function gT(e,t,r){var o=yp(e.children),s=mT(t,o);return Object.keys(s).forEach(function(a){var c=s[a];if(k.isValidElement(c)){var u=a in t,f=a in o,p=t[a],h=k.isValidElement(p)&&!p.props.in;f&&(!u||h)?s[a]=k.cloneElement(c,{onExited:r.bind(null,c),in:!0,exit:Lo(c,"exit",e),enter:Lo(c,"enter",e)}):!f&&u&&!h?s[a]=k.cloneElement(c,{in:!1}):f&&u&&k.isValidElement(p)&&(s[a]=k.cloneElement(c,{onExited:r.bind(null,c),in:p.props.in,exit:Lo(c,"exit",e),enter:Lo(c,"enter",e)}))}}),s}var yT=Object.values||function(e){return Object.keys(e).map(function(t){return e[t]})},vT={component:"div",childFactory:function(t){return t}},Ma=function(e){hp(t,e);function t(o,s){var a;a=e.call(this,o,s)||this;var c=a.handleExited.bind(pT(a));return a.state={contextValue:{isMounting:!0},handleExited:c,firstRender:!0},a}var r=t.prototype;return r.componentDidMount=function(){this.mounted=!0,this.setState({contextValue:{isMounting:!1}})},r.componentWillUnmount=function(){this.mounted=!1},t.getDerivedStateFromProps=function(s,a){var c=a.children,u=a.handleExited,f=a.firstRender;return{children:f?hT(s,u):gT(s,c,u),firstRender:!1}},r.handleExited=function(s,a){var c=yp(this.props.children);s.key in c||(s.props.onExited&&s.props.onExited(a),this.mounted&&this.setState(function(u){var f=K({},u.children);return delete f[s.key],{children:f}}))},r.render=function(){var s=this.props,a=s.component,c=s.childFactory,u=We(s,["component","childFactory"]),f=this.state.contextValue,p=yT(this.state.children).map(c);return delete u.appear,delete u.enter,delete u.exit,a===null?Un.createElement(Cc.Provider,{value:f},p):Un.createElement(Cc.Provider,{value:f},Un.createElement(a,u,p))},t}(Un.Component);Ma.propTypes={};Ma.defaultProps=vT;const N0=e=>e.scrollTop;function kc(e,t){const{timeout:r,easing:o,style:s={}}=e;return{duration:s.transitionDuration??(typeof r=="number"?r:r[t.mode]||0),easing:s.transitionTimingFunction??(typeof o=="object"?o[t.mode]:o),delay:s.transitionDelay}}function bT(e){return Fe("MuiPaper",e)}Ae("MuiPaper",["root","rounded","outlined","elevation","elevation0","elevation1","elevation2","elevation3","elevation4","elevation5","elevation6","elevation7","elevation8","elevation9","elevation10","elevation11","elevation12","elevation13","elevation14","elevation15","elevation16","elevation17","elevation18","elevation19","elevation20","elevation21","elevation22","elevation23","elevation24"]);const xT=e=>{const{square:t,elevation:r,variant:o,classes:s}=e,a={root:["root",o,!t&&"rounded",o==="elevation"&&`elevation${r}`]};return Le(a,bT,s)},wT=ie("div",{name:"MuiPaper",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:r}=e;return[t.root,t[r.variant],!r.square&&t.rounded,r.variant==="elevation"&&t[`elevation${r.elevation}`]]}})(st(({theme:e})=>({backgroundColor:(e.vars||e).palette.background.paper,color:(e.vars||e).palette.text.primary,transition:e.transitions.create("box-shadow"),variants:[{props:({ownerState:t})=>!t.square,style:{borderRadius:e.shape.borderRadius}},{props:{variant:"outlined"},style:{border:`1px solid ${(e.vars||e).palette.divider}`}},{props:{variant:"elevation"},style:{boxShadow:"var(--Paper-shadow)",backgroundImage:"var(--Paper-overlay)"}}]}))),Vo=k.forwardRef(function(t,r){var S;const o=et({props:t,name:"MuiPaper"}),s=Ko(),{className:a,component:c="div",elevation:u=1,square:f=!1,variant:p="elevation",...h}=o,g={...o,component:c,elevation:u,square:f,variant:p},b=xT(g);return I.jsx(wT,{as:c,ownerState:g,className:Me(b.root,a),ref:r,...h,style:{...p==="elevation"&&{"--Paper-shadow":(s.vars||s).shadows[u],...s.vars&&{"--Paper-overlay":(S=s.vars.overlays)==null?void 0:S[u]},...!s.vars&&s.palette.mode==="dark"&&{"--Paper-overlay":`linear-gradient(${nt("#fff",If(u))}, ${nt("#fff",If(u))})`}},...h.style}})});function cr(e,t){const{className:r,elementType:o,ownerState:s,externalForwardedProps:a,internalForwardedProps:c,...u}=t,{component:f,slots:p={[e]:void 0},slotProps:h={[e]:void 0},...g}=a,b=p[e]||o,S=fa(h[e],s),{props:{component:v,...x},internalRef:w}=T0({className:r,...u,externalForwardedProps:e==="root"?g:void 0,externalSlotProps:S}),T=rt(w,S==null?void 0:S.ref,t.ref),R=e==="root"?v||f:v,P=C0(b,{...e==="root"&&!f&&!p[e]&&c,...e!=="root"&&!p[e]&&c,...x,...R&&{as:R},ref:T},s);return[b,P]}class Tc{constructor(){As(this,"mountEffect",()=>{this.shouldMount&&!this.didMount&&this.ref.current!==null&&(this.didMount=!0,this.mounted.resolve())});this.ref={current:null},this.mounted=null,this.didMount=!1,this.shouldMount=!1,this.setShouldMount=null}static create(){return new Tc}static use(){const t=x0(Tc.create).current,[r,o]=k.useState(!1);return t.shouldMount=r,t.setShouldMount=o,k.useEffect(t.mountEffect,[r]),t}mount(){return this.mounted||(this.mounted=CT(),this.shouldMount=!0,this.setShouldMount(this.shouldMount)),this.mounted}start(...t){this.mount().then(()=>{var r;return(r=this.ref.current)==null?void 0:r.start(...t)})}stop(...t){this.mount().then(()=>{var r;return(r=this.ref.current)==null?void 0:r.stop(...t)})}pulsate(...t){this.mount().then(()=>{var r;return(r=this.ref.current)==null?void 0:r.pulsate(...t)})}}function ST(){return Tc.use()}function CT(){let e,t;const r=new Promise((o,s)=>{e=o,t=s});return r.resolve=e,r.reject=t,r}function kT(e){const{className:t,classes:r,pulsate:o=!1,rippleX:s,rippleY:a,rippleSize:c,in:u,onExited:f,timeout:p}=e,[h,g]=k.useState(!1),b=Me(t,r.ripple,r.rippleVisible,o&&r.ripplePulsate),S={width:c,height:c,top:-(c/2)+a,left:-(c/2)+s},v=Me(r.child,h&&r.childLeaving,o&&r.childPulsate);return!u&&!h&&g(!0),k.useEffect(()=>{if(!u&&f!=null){const x=setTimeout(f,p);return()=>{clearTimeout(x)}}},[f,u,p]),I.jsx("span",{className:b,style:S,children:I.jsx("span",{className:v})})}const _n=Ae("MuiTouchRipple",["root","ripple","rippleVisible","ripplePulsate","child","childLeaving","childPulsate"]),Nf=550,TT=80,PT=Sa`
-  0% {
-    transform: scale(0);
-    opacity: 0.1;
-  }
-
-  100% {
-    transform: scale(1);
-    opacity: 0.3;
-  }
-`,MT=Sa`
-  0% {
-    opacity: 1;
-  }
-
-  100% {
-    opacity: 0;
-  }
-`,RT=Sa`
-  0% {
-    transform: scale(1);
-  }
-
-  50% {
-    transform: scale(0.92);
-  }
-
-  100% {
-    transform: scale(1);
-  }
-`,DT=ie("span",{name:"MuiTouchRipple",slot:"Root"})({overflow:"hidden",pointerEvents:"none",position:"absolute",zIndex:0,top:0,right:0,bottom:0,left:0,borderRadius:"inherit"}),ET=ie(kT,{name:"MuiTouchRipple",slot:"Ripple"})`
-  opacity: 0;
-  position: absolute;
-
-  &.${_n.rippleVisible} {
-    opacity: 0.3;
-    transform: scale(1);
-    animation-name: ${PT};
-    animation-duration: ${Nf}ms;
-    animation-timing-function: ${({theme:e})=>e.transitions.easing.easeInOut};
-  }
-
-  &.${_n.ripplePulsate} {
-    animation-duration: ${({theme:e})=>e.transitions.duration.shorter}ms;
-  }
-
-  & .${_n.child} {
-    opacity: 1;
-    display: block;
-    width: 100%;
-    height: 100%;
-    border-radius: 50%;
-    background-color: currentColor;
-  }
-
-  & .${_n.childLeaving} {
-    opacity: 0;
-    animation-name: ${MT};
-    animation-duration: ${Nf}ms;
-    animation-timing-function: ${({theme:e})=>e.transitions.easing.easeInOut};
-  }
-
-  & .${_n.childPulsate} {
-    position: absolute;
-    /* @noflip */
-    left: 0px;
-    top: 0;
-    animation-name: ${RT};
-    animation-duration: 2500ms;
-    animation-timing-function: ${({theme:e})=>e.transitions.easing.easeInOut};
-    animation-iteration-count: infinite;
-    animation-delay: 200ms;
-  }
-`,IT=k.forwardRef(function(t,r){const o=et({props:t,name:"MuiTouchRipple"}),{center:s=!1,classes:a={},className:c,...u}=o,[f,p]=k.useState([]),h=k.useRef(0),g=k.useRef(null);k.useEffect(()=>{g.current&&(g.current(),g.current=null)},[f]);const b=k.useRef(!1),S=w0(),v=k.useRef(null),x=k.useRef(null),w=k.useCallback(M=>{const{pulsate:D,rippleX:$,rippleY:O,rippleSize:N,cb:U}=M;p(C=>[...C,I.jsx(ET,{classes:{ripple:Me(a.ripple,_n.ripple),rippleVisible:Me(a.rippleVisible,_n.rippleVisible),ripplePulsate:Me(a.ripplePulsate,_n.ripplePulsate),child:Me(a.child,_n.child),childLeaving:Me(a.childLeaving,_n.childLeaving),childPulsate:Me(a.childPulsate,_n.childPulsate)},timeout:Nf,pulsate:D,rippleX:$,rippleY:O,rippleSize:N},h.current)]),h.current+=1,g.current=U},[a]),T=k.useCallback((M={},D={},$=()=>{})=>{const{pulsate:O=!1,center:N=s||D.pulsate,fakeElement:U=!1}=D;if((M==null?void 0:M.type)==="mousedown"&&b.current){b.current=!1;return}(M==null?void 0:M.type)==="touchstart"&&(b.current=!0);const C=U?null:x.current,A=C?C.getBoundingClientRect():{width:0,height:0,left:0,top:0};let H,W,V;if(N||M===void 0||M.clientX===0&&M.clientY===0||!M.clientX&&!M.touches)H=Math.round(A.width/2),W=Math.round(A.height/2);else{const{clientX:F,clientY:B}=M.touches&&M.touches.length>0?M.touches[0]:M;H=Math.round(F-A.left),W=Math.round(B-A.top)}if(N)V=Math.sqrt((2*A.width**2+A.height**2)/3),V%2===0&&(V+=1);else{const F=Math.max(Math.abs((C?C.clientWidth:0)-H),H)*2+2,B=Math.max(Math.abs((C?C.clientHeight:0)-W),W)*2+2;V=Math.sqrt(F**2+B**2)}M!=null&&M.touches?v.current===null&&(v.current=()=>{w({pulsate:O,rippleX:H,rippleY:W,rippleSize:V,cb:$})},S.start(TT,()=>{v.current&&(v.current(),v.current=null)})):w({pulsate:O,rippleX:H,rippleY:W,rippleSize:V,cb:$})},[s,w,S]),R=k.useCallback(()=>{T({},{pulsate:!0})},[T]),P=k.useCallback((M,D)=>{if(S.clear(),(M==null?void 0:M.type)==="touchend"&&v.current){v.current(),v.current=null,S.start(0,()=>{P(M,D)});return}v.current=null,p($=>$.length>0?$.slice(1):$),g.current=D},[S]);return k.useImperativeHandle(r,()=>({pulsate:R,start:T,stop:P}),[R,T,P]),I.jsx(DT,{className:Me(_n.root,a.root,c),ref:x,...u,children:I.jsx(Ma,{component:null,exit:!0,children:f})})});function OT(e){return Fe("MuiButtonBase",e)}const $T=Ae("MuiButtonBase",["root","disabled","focusVisible"]),AT=e=>{const{disabled:t,focusVisible:r,focusVisibleClassName:o,classes:s}=e,c=Le({root:["root",t&&"disabled",r&&"focusVisible"]},OT,s);return r&&o&&(c.root+=` ${o}`),c},NT=ie("button",{name:"MuiButtonBase",slot:"Root",overridesResolver:(e,t)=>t.root})({display:"inline-flex",alignItems:"center",justifyContent:"center",position:"relative",boxSizing:"border-box",WebkitTapHighlightColor:"transparent",backgroundColor:"transparent",outline:0,border:0,margin:0,borderRadius:0,padding:0,cursor:"pointer",userSelect:"none",verticalAlign:"middle",MozAppearance:"none",WebkitAppearance:"none",textDecoration:"none",color:"inherit","&::-moz-focus-inner":{borderStyle:"none"},[`&.${$T.disabled}`]:{pointerEvents:"none",cursor:"default"},"@media print":{colorAdjust:"exact"}}),go=k.forwardRef(function(t,r){const o=et({props:t,name:"MuiButtonBase"}),{action:s,centerRipple:a=!1,children:c,className:u,component:f="button",disabled:p=!1,disableRipple:h=!1,disableTouchRipple:g=!1,focusRipple:b=!1,focusVisibleClassName:S,LinkComponent:v="a",onBlur:x,onClick:w,onContextMenu:T,onDragLeave:R,onFocus:P,onFocusVisible:M,onKeyDown:D,onKeyUp:$,onMouseDown:O,onMouseLeave:N,onMouseUp:U,onTouchEnd:C,onTouchMove:A,onTouchStart:H,tabIndex:W=0,TouchRippleProps:V,touchRippleRef:F,type:B,...Y}=o,j=k.useRef(null),_=ST(),q=rt(_.ref,F),[L,Q]=k.useState(!1);p&&L&&Q(!1),k.useImperativeHandle(s,()=>({focusVisible:()=>{Q(!0),j.current.focus()}}),[]);const te=_.shouldMount&&!h&&!p;k.useEffect(()=>{L&&b&&!h&&_.pulsate()},[h,b,L,_]);const ae=Vr(_,"start",O,g),Z=Vr(_,"stop",T,g),le=Vr(_,"stop",R,g),ue=Vr(_,"stop",U,g),J=Vr(_,"stop",Oe=>{L&&Oe.preventDefault(),N&&N(Oe)},g),ne=Vr(_,"start",H,g),fe=Vr(_,"stop",C,g),be=Vr(_,"stop",A,g),ve=Vr(_,"stop",Oe=>{sy(Oe.target)||Q(!1),x&&x(Oe)},!1),ee=$e(Oe=>{j.current||(j.current=Oe.currentTarget),sy(Oe.target)&&(Q(!0),M&&M(Oe)),P&&P(Oe)}),me=()=>{const Oe=j.current;return f&&f!=="button"&&!(Oe.tagName==="A"&&Oe.href)},xe=$e(Oe=>{b&&!Oe.repeat&&L&&Oe.key===" "&&_.stop(Oe,()=>{_.start(Oe)}),Oe.target===Oe.currentTarget&&me()&&Oe.key===" "&&Oe.preventDefault(),D&&D(Oe),Oe.target===Oe.currentTarget&&me()&&Oe.key==="Enter"&&!p&&(Oe.preventDefault(),w&&w(Oe))}),he=$e(Oe=>{b&&Oe.key===" "&&L&&!Oe.defaultPrevented&&_.stop(Oe,()=>{_.pulsate(Oe)}),$&&$(Oe),w&&Oe.target===Oe.currentTarget&&me()&&Oe.key===" "&&!Oe.defaultPrevented&&w(Oe)});let de=f;de==="button"&&(Y.href||Y.to)&&(de=v);const ge={};de==="button"?(ge.type=B===void 0?"button":B,ge.disabled=p):(!Y.href&&!Y.to&&(ge.role="button"),p&&(ge["aria-disabled"]=p));const we=rt(r,j),Ce={...o,centerRipple:a,component:f,disabled:p,disableRipple:h,disableTouchRipple:g,focusRipple:b,tabIndex:W,focusVisible:L},Ie=AT(Ce);return I.jsxs(NT,{as:de,className:Me(Ie.root,u),ownerState:Ce,onBlur:ve,onClick:w,onContextMenu:Z,onFocus:ee,onKeyDown:xe,onKeyUp:he,onMouseDown:ae,onMouseLeave:J,onMouseUp:ue,onDragLeave:le,onTouchEnd:fe,onTouchMove:be,onTouchStart:ne,ref:we,tabIndex:p?-1:W,type:B,...ge,...Y,children:[c,te?I.jsx(IT,{ref:q,center:a,...V}):null]})});function Vr(e,t,r,o=!1){return $e(s=>(r&&r(s),o||e[t](s),!0))}function LT(e){return typeof e.main=="string"}function FT(e,t=[]){if(!LT(e))return!1;for(const r of t)if(!e.hasOwnProperty(r)||typeof e[r]!="string")return!1;return!0}function Rn(e=[]){return([,t])=>t&&FT(t,e)}function BT(e){return Fe("MuiIconButton",e)}const VT=Ae("MuiIconButton",["root","disabled","colorInherit","colorPrimary","colorSecondary","colorError","colorInfo","colorSuccess","colorWarning","edgeStart","edgeEnd","sizeSmall","sizeMedium","sizeLarge"]),jT=e=>{const{classes:t,disabled:r,color:o,edge:s,size:a}=e,c={root:["root",r&&"disabled",o!=="default"&&`color${Ee(o)}`,s&&`edge${Ee(s)}`,`size${Ee(a)}`]};return Le(c,BT,t)},zT=ie(go,{name:"MuiIconButton",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:r}=e;return[t.root,r.color!=="default"&&t[`color${Ee(r.color)}`],r.edge&&t[`edge${Ee(r.edge)}`],t[`size${Ee(r.size)}`]]}})(st(({theme:e})=>({textAlign:"center",flex:"0 0 auto",fontSize:e.typography.pxToRem(24),padding:8,borderRadius:"50%",color:(e.vars||e).palette.action.active,transition:e.transitions.create("background-color",{duration:e.transitions.duration.shortest}),variants:[{props:t=>!t.disableRipple,style:{"--IconButton-hoverBg":e.vars?`rgba(${e.vars.palette.action.activeChannel} / ${e.vars.palette.action.hoverOpacity})`:nt(e.palette.action.active,e.palette.action.hoverOpacity),"&:hover":{backgroundColor:"var(--IconButton-hoverBg)","@media (hover: none)":{backgroundColor:"transparent"}}}},{props:{edge:"start"},style:{marginLeft:-12}},{props:{edge:"start",size:"small"},style:{marginLeft:-3}},{props:{edge:"end"},style:{marginRight:-12}},{props:{edge:"end",size:"small"},style:{marginRight:-3}}]})),st(({theme:e})=>({variants:[{props:{color:"inherit"},style:{color:"inherit"}},...Object.entries(e.palette).filter(Rn()).map(([t])=>({props:{color:t},style:{color:(e.vars||e).palette[t].main}})),...Object.entries(e.palette).filter(Rn()).map(([t])=>({props:{color:t},style:{"--IconButton-hoverBg":e.vars?`rgba(${(e.vars||e).palette[t].mainChannel} / ${e.vars.palette.action.hoverOpacity})`:nt((e.vars||e).palette[t].main,e.palette.action.hoverOpacity)}})),{props:{size:"small"},style:{padding:5,fontSize:e.typography.pxToRem(18)}},{props:{size:"large"},style:{padding:12,fontSize:e.typography.pxToRem(28)}}],[`&.${VT.disabled}`]:{backgroundColor:"transparent",color:(e.vars||e).palette.action.disabled}}))),Hi=k.forwardRef(function(t,r){const o=et({props:t,name:"MuiIconButton"}),{edge:s=!1,children:a,className:c,color:u="default",disabled:f=!1,disableFocusRipple:p=!1,size:h="medium",...g}=o,b={...o,edge:s,color:u,disabled:f,disableFocusRipple:p,size:h},S=jT(b);return I.jsx(zT,{className:Me(S.root,c),centerRipple:!0,focusRipple:!p,disabled:f,ref:r,...g,ownerState:b,children:a})});function _T(e){return Fe("MuiTypography",e)}Ae("MuiTypography",["root","h1","h2","h3","h4","h5","h6","subtitle1","subtitle2","body1","body2","inherit","button","caption","overline","alignLeft","alignRight","alignCenter","alignJustify","noWrap","gutterBottom","paragraph"]);const WT={primary:!0,secondary:!0,error:!0,info:!0,success:!0,warning:!0,textPrimary:!0,textSecondary:!0,textDisabled:!0},UT=iT(),HT=e=>{const{align:t,gutterBottom:r,noWrap:o,paragraph:s,variant:a,classes:c}=e,u={root:["root",a,e.align!=="inherit"&&`align${Ee(t)}`,r&&"gutterBottom",o&&"noWrap",s&&"paragraph"]};return Le(u,_T,c)},YT=ie("span",{name:"MuiTypography",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:r}=e;return[t.root,r.variant&&t[r.variant],r.align!=="inherit"&&t[`align${Ee(r.align)}`],r.noWrap&&t.noWrap,r.gutterBottom&&t.gutterBottom,r.paragraph&&t.paragraph]}})(st(({theme:e})=>{var t;return{margin:0,variants:[{props:{variant:"inherit"},style:{font:"inherit",lineHeight:"inherit",letterSpacing:"inherit"}},...Object.entries(e.typography).filter(([r,o])=>r!=="inherit"&&o&&typeof o=="object").map(([r,o])=>({props:{variant:r},style:o})),...Object.entries(e.palette).filter(Rn()).map(([r])=>({props:{color:r},style:{color:(e.vars||e).palette[r].main}})),...Object.entries(((t=e.palette)==null?void 0:t.text)||{}).filter(([,r])=>typeof r=="string").map(([r])=>({props:{color:`text${Ee(r)}`},style:{color:(e.vars||e).palette.text[r]}})),{props:({ownerState:r})=>r.align!=="inherit",style:{textAlign:"var(--Typography-textAlign)"}},{props:({ownerState:r})=>r.noWrap,style:{overflow:"hidden",textOverflow:"ellipsis",whiteSpace:"nowrap"}},{props:({ownerState:r})=>r.gutterBottom,style:{marginBottom:"0.35em"}},{props:({ownerState:r})=>r.paragraph,style:{marginBottom:16}}]}})),vy={h1:"h1",h2:"h2",h3:"h3",h4:"h4",h5:"h5",h6:"h6",subtitle1:"h6",subtitle2:"h6",body1:"p",body2:"p",inherit:"p"},Hn=k.forwardRef(function(t,r){const{color:o,...s}=et({props:t,name:"MuiTypography"}),a=!WT[o],c=UT({...s,...a&&{color:o}}),{align:u="inherit",className:f,component:p,gutterBottom:h=!1,noWrap:g=!1,paragraph:b=!1,variant:S="body1",variantMapping:v=vy,...x}=c,w={...c,align:u,color:o,className:f,component:p,gutterBottom:h,noWrap:g,paragraph:b,variant:S,variantMapping:v},T=p||(b?"p":v[S]||vy[S])||"span",R=HT(w);return I.jsx(YT,{as:T,ref:r,className:Me(R.root,f),...x,ownerState:w,style:{...u!=="inherit"&&{"--Typography-textAlign":u},...x.style}})});var vn="top",Kn="bottom",qn="right",bn="left",vp="auto",Ra=[vn,Kn,qn,bn],Ni="start",pa="end",KT="clippingParents",L0="viewport",Bs="popper",qT="reference",by=Ra.reduce(function(e,t){return e.concat([t+"-"+Ni,t+"-"+pa])},[]),F0=[].concat(Ra,[vp]).reduce(function(e,t){return e.concat([t,t+"-"+Ni,t+"-"+pa])},[]),GT="beforeRead",QT="read",XT="afterRead",ZT="beforeMain",JT="main",eP="afterMain",tP="beforeWrite",nP="write",rP="afterWrite",oP=[GT,QT,XT,ZT,JT,eP,tP,nP,rP];function Dr(e){return e?(e.nodeName||"").toLowerCase():null}function In(e){if(e==null)return window;if(e.toString()!=="[object Window]"){var t=e.ownerDocument;return t&&t.defaultView||window}return e}function Uo(e){var t=In(e).Element;return e instanceof t||e instanceof Element}function Yn(e){var t=In(e).HTMLElement;return e instanceof t||e instanceof HTMLElement}function bp(e){if(typeof ShadowRoot>"u")return!1;var t=In(e).ShadowRoot;return e instanceof t||e instanceof ShadowRoot}function iP(e){var t=e.state;Object.keys(t.elements).forEach(function(r){var o=t.styles[r]||{},s=t.attributes[r]||{},a=t.elements[r];!Yn(a)||!Dr(a)||(Object.assign(a.style,o),Object.keys(s).forEach(function(c){var u=s[c];u===!1?a.removeAttribute(c):a.setAttribute(c,u===!0?"":u)}))})}function sP(e){var t=e.state,r={popper:{position:t.options.strategy,left:"0",top:"0",margin:"0"},arrow:{position:"absolute"},reference:{}};return Object.assign(t.elements.popper.style,r.popper),t.styles=r,t.elements.arrow&&Object.assign(t.elements.arrow.style,r.arrow),function(){Object.keys(t.elements).forEach(function(o){var s=t.elements[o],a=t.attributes[o]||{},c=Object.keys(t.styles.hasOwnProperty(o)?t.styles[o]:r[o]),u=c.reduce(function(f,p){return f[p]="",f},{});!Yn(s)||!Dr(s)||(Object.assign(s.style,u),Object.keys(a).forEach(function(f){s.removeAttribute(f)}))})}}const aP={name:"applyStyles",enabled:!0,phase:"write",fn:iP,effect:sP,requires:["computeStyles"]};function Rr(e){return e.split("-")[0]}var jo=Math.max,Pc=Math.min,Li=Math.round;function Lf(){var e=navigator.userAgentData;return e!=null&&e.brands&&Array.isArray(e.brands)?e.brands.map(function(t){return t.brand+"/"+t.version}).join(" "):navigator.userAgent}function B0(){return!/^((?!chrome|android).)*safari/i.test(Lf())}function Fi(e,t,r){t===void 0&&(t=!1),r===void 0&&(r=!1);var o=e.getBoundingClientRect(),s=1,a=1;t&&Yn(e)&&(s=e.offsetWidth>0&&Li(o.width)/e.offsetWidth||1,a=e.offsetHeight>0&&Li(o.height)/e.offsetHeight||1);var c=Uo(e)?In(e):window,u=c.visualViewport,f=!B0()&&r,p=(o.left+(f&&u?u.offsetLeft:0))/s,h=(o.top+(f&&u?u.offsetTop:0))/a,g=o.width/s,b=o.height/a;return{width:g,height:b,top:h,right:p+g,bottom:h+b,left:p,x:p,y:h}}function xp(e){var t=Fi(e),r=e.offsetWidth,o=e.offsetHeight;return Math.abs(t.width-r)<=1&&(r=t.width),Math.abs(t.height-o)<=1&&(o=t.height),{x:e.offsetLeft,y:e.offsetTop,width:r,height:o}}function V0(e,t){var r=t.getRootNode&&t.getRootNode();if(e.contains(t))return!0;if(r&&bp(r)){var o=t;do{if(o&&e.isSameNode(o))return!0;o=o.parentNode||o.host}while(o)}return!1}function Hr(e){return In(e).getComputedStyle(e)}function lP(e){return["table","td","th"].indexOf(Dr(e))>=0}function yo(e){return((Uo(e)?e.ownerDocument:e.document)||window.document).documentElement}function Qc(e){return Dr(e)==="html"?e:e.assignedSlot||e.parentNode||(bp(e)?e.host:null)||yo(e)}function xy(e){return!Yn(e)||Hr(e).position==="fixed"?null:e.offsetParent}function cP(e){var t=/firefox/i.test(Lf()),r=/Trident/i.test(Lf());if(r&&Yn(e)){var o=Hr(e);if(o.position==="fixed")return null}var s=Qc(e);for(bp(s)&&(s=s.host);Yn(s)&&["html","body"].indexOf(Dr(s))<0;){var a=Hr(s);if(a.transform!=="none"||a.perspective!=="none"||a.contain==="paint"||["transform","perspective"].indexOf(a.willChange)!==-1||t&&a.willChange==="filter"||t&&a.filter&&a.filter!=="none")return s;s=s.parentNode}return null}function Da(e){for(var t=In(e),r=xy(e);r&&lP(r)&&Hr(r).position==="static";)r=xy(r);return r&&(Dr(r)==="html"||Dr(r)==="body"&&Hr(r).position==="static")?t:r||cP(e)||t}function wp(e){return["top","bottom"].indexOf(e)>=0?"x":"y"}function ta(e,t,r){return jo(e,Pc(t,r))}function uP(e,t,r){var o=ta(e,t,r);return o>r?r:o}function j0(){return{top:0,right:0,bottom:0,left:0}}function z0(e){return Object.assign({},j0(),e)}function _0(e,t){return t.reduce(function(r,o){return r[o]=e,r},{})}var dP=function(t,r){return t=typeof t=="function"?t(Object.assign({},r.rects,{placement:r.placement})):t,z0(typeof t!="number"?t:_0(t,Ra))};function fP(e){var t,r=e.state,o=e.name,s=e.options,a=r.elements.arrow,c=r.modifiersData.popperOffsets,u=Rr(r.placement),f=wp(u),p=[bn,qn].indexOf(u)>=0,h=p?"height":"width";if(!(!a||!c)){var g=dP(s.padding,r),b=xp(a),S=f==="y"?vn:bn,v=f==="y"?Kn:qn,x=r.rects.reference[h]+r.rects.reference[f]-c[f]-r.rects.popper[h],w=c[f]-r.rects.reference[f],T=Da(a),R=T?f==="y"?T.clientHeight||0:T.clientWidth||0:0,P=x/2-w/2,M=g[S],D=R-b[h]-g[v],$=R/2-b[h]/2+P,O=ta(M,$,D),N=f;r.modifiersData[o]=(t={},t[N]=O,t.centerOffset=O-$,t)}}function pP(e){var t=e.state,r=e.options,o=r.element,s=o===void 0?"[data-popper-arrow]":o;s!=null&&(typeof s=="string"&&(s=t.elements.popper.querySelector(s),!s)||V0(t.elements.popper,s)&&(t.elements.arrow=s))}const mP={name:"arrow",enabled:!0,phase:"main",fn:fP,effect:pP,requires:["popperOffsets"],requiresIfExists:["preventOverflow"]};function Bi(e){return e.split("-")[1]}var hP={top:"auto",right:"auto",bottom:"auto",left:"auto"};function gP(e,t){var r=e.x,o=e.y,s=t.devicePixelRatio||1;return{x:Li(r*s)/s||0,y:Li(o*s)/s||0}}function wy(e){var t,r=e.popper,o=e.popperRect,s=e.placement,a=e.variation,c=e.offsets,u=e.position,f=e.gpuAcceleration,p=e.adaptive,h=e.roundOffsets,g=e.isFixed,b=c.x,S=b===void 0?0:b,v=c.y,x=v===void 0?0:v,w=typeof h=="function"?h({x:S,y:x}):{x:S,y:x};S=w.x,x=w.y;var T=c.hasOwnProperty("x"),R=c.hasOwnProperty("y"),P=bn,M=vn,D=window;if(p){var $=Da(r),O="clientHeight",N="clientWidth";if($===In(r)&&($=yo(r),Hr($).position!=="static"&&u==="absolute"&&(O="scrollHeight",N="scrollWidth")),$=$,s===vn||(s===bn||s===qn)&&a===pa){M=Kn;var U=g&&$===D&&D.visualViewport?D.visualViewport.height:$[O];x-=U-o.height,x*=f?1:-1}if(s===bn||(s===vn||s===Kn)&&a===pa){P=qn;var C=g&&$===D&&D.visualViewport?D.visualViewport.width:$[N];S-=C-o.width,S*=f?1:-1}}var A=Object.assign({position:u},p&&hP),H=h===!0?gP({x:S,y:x},In(r)):{x:S,y:x};if(S=H.x,x=H.y,f){var W;return Object.assign({},A,(W={},W[M]=R?"0":"",W[P]=T?"0":"",W.transform=(D.devicePixelRatio||1)<=1?"translate("+S+"px, "+x+"px)":"translate3d("+S+"px, "+x+"px, 0)",W))}return Object.assign({},A,(t={},t[M]=R?x+"px":"",t[P]=T?S+"px":"",t.transform="",t))}function yP(e){var t=e.state,r=e.options,o=r.gpuAcceleration,s=o===void 0?!0:o,a=r.adaptive,c=a===void 0?!0:a,u=r.roundOffsets,f=u===void 0?!0:u,p={placement:Rr(t.placement),variation:Bi(t.placement),popper:t.elements.popper,popperRect:t.rects.popper,gpuAcceleration:s,isFixed:t.options.strategy==="fixed"};t.modifiersData.popperOffsets!=null&&(t.styles.popper=Object.assign({},t.styles.popper,wy(Object.assign({},p,{offsets:t.modifiersData.popperOffsets,position:t.options.strategy,adaptive:c,roundOffsets:f})))),t.modifiersData.arrow!=null&&(t.styles.arrow=Object.assign({},t.styles.arrow,wy(Object.assign({},p,{offsets:t.modifiersData.arrow,position:"absolute",adaptive:!1,roundOffsets:f})))),t.attributes.popper=Object.assign({},t.attributes.popper,{"data-popper-placement":t.placement})}const vP={name:"computeStyles",enabled:!0,phase:"beforeWrite",fn:yP,data:{}};var Kl={passive:!0};function bP(e){var t=e.state,r=e.instance,o=e.options,s=o.scroll,a=s===void 0?!0:s,c=o.resize,u=c===void 0?!0:c,f=In(t.elements.popper),p=[].concat(t.scrollParents.reference,t.scrollParents.popper);return a&&p.forEach(function(h){h.addEventListener("scroll",r.update,Kl)}),u&&f.addEventListener("resize",r.update,Kl),function(){a&&p.forEach(function(h){h.removeEventListener("scroll",r.update,Kl)}),u&&f.removeEventListener("resize",r.update,Kl)}}const xP={name:"eventListeners",enabled:!0,phase:"write",fn:function(){},effect:bP,data:{}};var wP={left:"right",right:"left",bottom:"top",top:"bottom"};function ac(e){return e.replace(/left|right|bottom|top/g,function(t){return wP[t]})}var SP={start:"end",end:"start"};function Sy(e){return e.replace(/start|end/g,function(t){return SP[t]})}function Sp(e){var t=In(e),r=t.pageXOffset,o=t.pageYOffset;return{scrollLeft:r,scrollTop:o}}function Cp(e){return Fi(yo(e)).left+Sp(e).scrollLeft}function CP(e,t){var r=In(e),o=yo(e),s=r.visualViewport,a=o.clientWidth,c=o.clientHeight,u=0,f=0;if(s){a=s.width,c=s.height;var p=B0();(p||!p&&t==="fixed")&&(u=s.offsetLeft,f=s.offsetTop)}return{width:a,height:c,x:u+Cp(e),y:f}}function kP(e){var t,r=yo(e),o=Sp(e),s=(t=e.ownerDocument)==null?void 0:t.body,a=jo(r.scrollWidth,r.clientWidth,s?s.scrollWidth:0,s?s.clientWidth:0),c=jo(r.scrollHeight,r.clientHeight,s?s.scrollHeight:0,s?s.clientHeight:0),u=-o.scrollLeft+Cp(e),f=-o.scrollTop;return Hr(s||r).direction==="rtl"&&(u+=jo(r.clientWidth,s?s.clientWidth:0)-a),{width:a,height:c,x:u,y:f}}function kp(e){var t=Hr(e),r=t.overflow,o=t.overflowX,s=t.overflowY;return/auto|scroll|overlay|hidden/.test(r+s+o)}function W0(e){return["html","body","#document"].indexOf(Dr(e))>=0?e.ownerDocument.body:Yn(e)&&kp(e)?e:W0(Qc(e))}function na(e,t){var r;t===void 0&&(t=[]);var o=W0(e),s=o===((r=e.ownerDocument)==null?void 0:r.body),a=In(o),c=s?[a].concat(a.visualViewport||[],kp(o)?o:[]):o,u=t.concat(c);return s?u:u.concat(na(Qc(c)))}function Ff(e){return Object.assign({},e,{left:e.x,top:e.y,right:e.x+e.width,bottom:e.y+e.height})}function TP(e,t){var r=Fi(e,!1,t==="fixed");return r.top=r.top+e.clientTop,r.left=r.left+e.clientLeft,r.bottom=r.top+e.clientHeight,r.right=r.left+e.clientWidth,r.width=e.clientWidth,r.height=e.clientHeight,r.x=r.left,r.y=r.top,r}function Cy(e,t,r){return t===L0?Ff(CP(e,r)):Uo(t)?TP(t,r):Ff(kP(yo(e)))}function PP(e){var t=na(Qc(e)),r=["absolute","fixed"].indexOf(Hr(e).position)>=0,o=r&&Yn(e)?Da(e):e;return Uo(o)?t.filter(function(s){return Uo(s)&&V0(s,o)&&Dr(s)!=="body"}):[]}function MP(e,t,r,o){var s=t==="clippingParents"?PP(e):[].concat(t),a=[].concat(s,[r]),c=a[0],u=a.reduce(function(f,p){var h=Cy(e,p,o);return f.top=jo(h.top,f.top),f.right=Pc(h.right,f.right),f.bottom=Pc(h.bottom,f.bottom),f.left=jo(h.left,f.left),f},Cy(e,c,o));return u.width=u.right-u.left,u.height=u.bottom-u.top,u.x=u.left,u.y=u.top,u}function U0(e){var t=e.reference,r=e.element,o=e.placement,s=o?Rr(o):null,a=o?Bi(o):null,c=t.x+t.width/2-r.width/2,u=t.y+t.height/2-r.height/2,f;switch(s){case vn:f={x:c,y:t.y-r.height};break;case Kn:f={x:c,y:t.y+t.height};break;case qn:f={x:t.x+t.width,y:u};break;case bn:f={x:t.x-r.width,y:u};break;default:f={x:t.x,y:t.y}}var p=s?wp(s):null;if(p!=null){var h=p==="y"?"height":"width";switch(a){case Ni:f[p]=f[p]-(t[h]/2-r[h]/2);break;case pa:f[p]=f[p]+(t[h]/2-r[h]/2);break}}return f}function ma(e,t){t===void 0&&(t={});var r=t,o=r.placement,s=o===void 0?e.placement:o,a=r.strategy,c=a===void 0?e.strategy:a,u=r.boundary,f=u===void 0?KT:u,p=r.rootBoundary,h=p===void 0?L0:p,g=r.elementContext,b=g===void 0?Bs:g,S=r.altBoundary,v=S===void 0?!1:S,x=r.padding,w=x===void 0?0:x,T=z0(typeof w!="number"?w:_0(w,Ra)),R=b===Bs?qT:Bs,P=e.rects.popper,M=e.elements[v?R:b],D=MP(Uo(M)?M:M.contextElement||yo(e.elements.popper),f,h,c),$=Fi(e.elements.reference),O=U0({reference:$,element:P,strategy:"absolute",placement:s}),N=Ff(Object.assign({},P,O)),U=b===Bs?N:$,C={top:D.top-U.top+T.top,bottom:U.bottom-D.bottom+T.bottom,left:D.left-U.left+T.left,right:U.right-D.right+T.right},A=e.modifiersData.offset;if(b===Bs&&A){var H=A[s];Object.keys(C).forEach(function(W){var V=[qn,Kn].indexOf(W)>=0?1:-1,F=[vn,Kn].indexOf(W)>=0?"y":"x";C[W]+=H[F]*V})}return C}function RP(e,t){t===void 0&&(t={});var r=t,o=r.placement,s=r.boundary,a=r.rootBoundary,c=r.padding,u=r.flipVariations,f=r.allowedAutoPlacements,p=f===void 0?F0:f,h=Bi(o),g=h?u?by:by.filter(function(v){return Bi(v)===h}):Ra,b=g.filter(function(v){return p.indexOf(v)>=0});b.length===0&&(b=g);var S=b.reduce(function(v,x){return v[x]=ma(e,{placement:x,boundary:s,rootBoundary:a,padding:c})[Rr(x)],v},{});return Object.keys(S).sort(function(v,x){return S[v]-S[x]})}function DP(e){if(Rr(e)===vp)return[];var t=ac(e);return[Sy(e),t,Sy(t)]}function EP(e){var t=e.state,r=e.options,o=e.name;if(!t.modifiersData[o]._skip){for(var s=r.mainAxis,a=s===void 0?!0:s,c=r.altAxis,u=c===void 0?!0:c,f=r.fallbackPlacements,p=r.padding,h=r.boundary,g=r.rootBoundary,b=r.altBoundary,S=r.flipVariations,v=S===void 0?!0:S,x=r.allowedAutoPlacements,w=t.options.placement,T=Rr(w),R=T===w,P=f||(R||!v?[ac(w)]:DP(w)),M=[w].concat(P).reduce(function(ae,Z){return ae.concat(Rr(Z)===vp?RP(t,{placement:Z,boundary:h,rootBoundary:g,padding:p,flipVariations:v,allowedAutoPlacements:x}):Z)},[]),D=t.rects.reference,$=t.rects.popper,O=new Map,N=!0,U=M[0],C=0;C<M.length;C++){var A=M[C],H=Rr(A),W=Bi(A)===Ni,V=[vn,Kn].indexOf(H)>=0,F=V?"width":"height",B=ma(t,{placement:A,boundary:h,rootBoundary:g,altBoundary:b,padding:p}),Y=V?W?qn:bn:W?Kn:vn;D[F]>$[F]&&(Y=ac(Y));var j=ac(Y),_=[];if(a&&_.push(B[H]<=0),u&&_.push(B[Y]<=0,B[j]<=0),_.every(function(ae){return ae})){U=A,N=!1;break}O.set(A,_)}if(N)for(var q=v?3:1,L=function(Z){var le=M.find(function(ue){var J=O.get(ue);if(J)return J.slice(0,Z).every(function(ne){return ne})});if(le)return U=le,"break"},Q=q;Q>0;Q--){var te=L(Q);if(te==="break")break}t.placement!==U&&(t.modifiersData[o]._skip=!0,t.placement=U,t.reset=!0)}}const IP={name:"flip",enabled:!0,phase:"main",fn:EP,requiresIfExists:["offset"],data:{_skip:!1}};function ky(e,t,r){return r===void 0&&(r={x:0,y:0}),{top:e.top-t.height-r.y,right:e.right-t.width+r.x,bottom:e.bottom-t.height+r.y,left:e.left-t.width-r.x}}function Ty(e){return[vn,qn,Kn,bn].some(function(t){return e[t]>=0})}function OP(e){var t=e.state,r=e.name,o=t.rects.reference,s=t.rects.popper,a=t.modifiersData.preventOverflow,c=ma(t,{elementContext:"reference"}),u=ma(t,{altBoundary:!0}),f=ky(c,o),p=ky(u,s,a),h=Ty(f),g=Ty(p);t.modifiersData[r]={referenceClippingOffsets:f,popperEscapeOffsets:p,isReferenceHidden:h,hasPopperEscaped:g},t.attributes.popper=Object.assign({},t.attributes.popper,{"data-popper-reference-hidden":h,"data-popper-escaped":g})}const $P={name:"hide",enabled:!0,phase:"main",requiresIfExists:["preventOverflow"],fn:OP};function AP(e,t,r){var o=Rr(e),s=[bn,vn].indexOf(o)>=0?-1:1,a=typeof r=="function"?r(Object.assign({},t,{placement:e})):r,c=a[0],u=a[1];return c=c||0,u=(u||0)*s,[bn,qn].indexOf(o)>=0?{x:u,y:c}:{x:c,y:u}}function NP(e){var t=e.state,r=e.options,o=e.name,s=r.offset,a=s===void 0?[0,0]:s,c=F0.reduce(function(h,g){return h[g]=AP(g,t.rects,a),h},{}),u=c[t.placement],f=u.x,p=u.y;t.modifiersData.popperOffsets!=null&&(t.modifiersData.popperOffsets.x+=f,t.modifiersData.popperOffsets.y+=p),t.modifiersData[o]=c}const LP={name:"offset",enabled:!0,phase:"main",requires:["popperOffsets"],fn:NP};function FP(e){var t=e.state,r=e.name;t.modifiersData[r]=U0({reference:t.rects.reference,element:t.rects.popper,strategy:"absolute",placement:t.placement})}const BP={name:"popperOffsets",enabled:!0,phase:"read",fn:FP,data:{}};function VP(e){return e==="x"?"y":"x"}function jP(e){var t=e.state,r=e.options,o=e.name,s=r.mainAxis,a=s===void 0?!0:s,c=r.altAxis,u=c===void 0?!1:c,f=r.boundary,p=r.rootBoundary,h=r.altBoundary,g=r.padding,b=r.tether,S=b===void 0?!0:b,v=r.tetherOffset,x=v===void 0?0:v,w=ma(t,{boundary:f,rootBoundary:p,padding:g,altBoundary:h}),T=Rr(t.placement),R=Bi(t.placement),P=!R,M=wp(T),D=VP(M),$=t.modifiersData.popperOffsets,O=t.rects.reference,N=t.rects.popper,U=typeof x=="function"?x(Object.assign({},t.rects,{placement:t.placement})):x,C=typeof U=="number"?{mainAxis:U,altAxis:U}:Object.assign({mainAxis:0,altAxis:0},U),A=t.modifiersData.offset?t.modifiersData.offset[t.placement]:null,H={x:0,y:0};if($){if(a){var W,V=M==="y"?vn:bn,F=M==="y"?Kn:qn,B=M==="y"?"height":"width",Y=$[M],j=Y+w[V],_=Y-w[F],q=S?-N[B]/2:0,L=R===Ni?O[B]:N[B],Q=R===Ni?-N[B]:-O[B],te=t.elements.arrow,ae=S&&te?xp(te):{width:0,height:0},Z=t.modifiersData["arrow#persistent"]?t.modifiersData["arrow#persistent"].padding:j0(),le=Z[V],ue=Z[F],J=ta(0,O[B],ae[B]),ne=P?O[B]/2-q-J-le-C.mainAxis:L-J-le-C.mainAxis,fe=P?-O[B]/2+q+J+ue+C.mainAxis:Q+J+ue+C.mainAxis,be=t.elements.arrow&&Da(t.elements.arrow),ve=be?M==="y"?be.clientTop||0:be.clientLeft||0:0,ee=(W=A==null?void 0:A[M])!=null?W:0,me=Y+ne-ee-ve,xe=Y+fe-ee,he=ta(S?Pc(j,me):j,Y,S?jo(_,xe):_);$[M]=he,H[M]=he-Y}if(u){var de,ge=M==="x"?vn:bn,we=M==="x"?Kn:qn,Ce=$[D],Ie=D==="y"?"height":"width",Oe=Ce+w[ge],mt=Ce-w[we],lt=[vn,bn].indexOf(T)!==-1,tt=(de=A==null?void 0:A[D])!=null?de:0,ht=lt?Oe:Ce-O[Ie]-N[Ie]-tt+C.altAxis,Tt=lt?Ce+O[Ie]+N[Ie]-tt-C.altAxis:mt,Rt=S&&lt?uP(ht,Ce,Tt):ta(S?ht:Oe,Ce,S?Tt:mt);$[D]=Rt,H[D]=Rt-Ce}t.modifiersData[o]=H}}const zP={name:"preventOverflow",enabled:!0,phase:"main",fn:jP,requiresIfExists:["offset"]};function _P(e){return{scrollLeft:e.scrollLeft,scrollTop:e.scrollTop}}function WP(e){return e===In(e)||!Yn(e)?Sp(e):_P(e)}function UP(e){var t=e.getBoundingClientRect(),r=Li(t.width)/e.offsetWidth||1,o=Li(t.height)/e.offsetHeight||1;return r!==1||o!==1}function HP(e,t,r){r===void 0&&(r=!1);var o=Yn(t),s=Yn(t)&&UP(t),a=yo(t),c=Fi(e,s,r),u={scrollLeft:0,scrollTop:0},f={x:0,y:0};return(o||!o&&!r)&&((Dr(t)!=="body"||kp(a))&&(u=WP(t)),Yn(t)?(f=Fi(t,!0),f.x+=t.clientLeft,f.y+=t.clientTop):a&&(f.x=Cp(a))),{x:c.left+u.scrollLeft-f.x,y:c.top+u.scrollTop-f.y,width:c.width,height:c.height}}function YP(e){var t=new Map,r=new Set,o=[];e.forEach(function(a){t.set(a.name,a)});function s(a){r.add(a.name);var c=[].concat(a.requires||[],a.requiresIfExists||[]);c.forEach(function(u){if(!r.has(u)){var f=t.get(u);f&&s(f)}}),o.push(a)}return e.forEach(function(a){r.has(a.name)||s(a)}),o}function KP(e){var t=YP(e);return oP.reduce(function(r,o){return r.concat(t.filter(function(s){return s.phase===o}))},[])}function qP(e){var t;return function(){return t||(t=new Promise(function(r){Promise.resolve().then(function(){t=void 0,r(e())})})),t}}function GP(e){var t=e.reduce(function(r,o){var s=r[o.name];return r[o.name]=s?Object.assign({},s,o,{options:Object.assign({},s.options,o.options),data:Object.assign({},s.data,o.data)}):o,r},{});return Object.keys(t).map(function(r){return t[r]})}var Py={placement:"bottom",modifiers:[],strategy:"absolute"};function My(){for(var e=arguments.length,t=new Array(e),r=0;r<e;r++)t[r]=arguments[r];return!t.some(function(o){return!(o&&typeof o.getBoundingClientRect=="function")})}function QP(e){e===void 0&&(e={});var t=e,r=t.defaultModifiers,o=r===void 0?[]:r,s=t.defaultOptions,a=s===void 0?Py:s;return function(u,f,p){p===void 0&&(p=a);var h={placement:"bottom",orderedModifiers:[],options:Object.assign({},Py,a),modifiersData:{},elements:{reference:u,popper:f},attributes:{},styles:{}},g=[],b=!1,S={state:h,setOptions:function(T){var R=typeof T=="function"?T(h.options):T;x(),h.options=Object.assign({},a,h.options,R),h.scrollParents={reference:Uo(u)?na(u):u.contextElement?na(u.contextElement):[],popper:na(f)};var P=KP(GP([].concat(o,h.options.modifiers)));return h.orderedModifiers=P.filter(function(M){return M.enabled}),v(),S.update()},forceUpdate:function(){if(!b){var T=h.elements,R=T.reference,P=T.popper;if(My(R,P)){h.rects={reference:HP(R,Da(P),h.options.strategy==="fixed"),popper:xp(P)},h.reset=!1,h.placement=h.options.placement,h.orderedModifiers.forEach(function(C){return h.modifiersData[C.name]=Object.assign({},C.data)});for(var M=0;M<h.orderedModifiers.length;M++){if(h.reset===!0){h.reset=!1,M=-1;continue}var D=h.orderedModifiers[M],$=D.fn,O=D.options,N=O===void 0?{}:O,U=D.name;typeof $=="function"&&(h=$({state:h,options:N,name:U,instance:S})||h)}}}},update:qP(function(){return new Promise(function(w){S.forceUpdate(),w(h)})}),destroy:function(){x(),b=!0}};if(!My(u,f))return S;S.setOptions(p).then(function(w){!b&&p.onFirstUpdate&&p.onFirstUpdate(w)});function v(){h.orderedModifiers.forEach(function(w){var T=w.name,R=w.options,P=R===void 0?{}:R,M=w.effect;if(typeof M=="function"){var D=M({state:h,name:T,instance:S,options:P}),$=function(){};g.push(D||$)}})}function x(){g.forEach(function(w){return w()}),g=[]}return S}}var XP=[xP,BP,vP,aP,LP,IP,zP,mP,$P],ZP=QP({defaultModifiers:XP});function JP(e){return typeof e=="function"?e():e}const H0=k.forwardRef(function(t,r){const{children:o,container:s,disablePortal:a=!1}=t,[c,u]=k.useState(null),f=rt(k.isValidElement(o)?Pa(o):null,r);if(Nt(()=>{a||u(JP(s)||document.body)},[s,a]),Nt(()=>{if(c&&!a)return Df(r,c),()=>{Df(r,null)}},[r,c,a]),a){if(k.isValidElement(o)){const p={ref:f};return k.cloneElement(o,p)}return o}return c&&$0.createPortal(o,c)});function eM(e){return Fe("MuiPopper",e)}Ae("MuiPopper",["root"]);function tM(e,t){if(t==="ltr")return e;switch(e){case"bottom-end":return"bottom-start";case"bottom-start":return"bottom-end";case"top-end":return"top-start";case"top-start":return"top-end";default:return e}}function Bf(e){return typeof e=="function"?e():e}function nM(e){return e.nodeType!==void 0}const rM=e=>{const{classes:t}=e;return Le({root:["root"]},eM,t)},oM={},iM=k.forwardRef(function(t,r){const{anchorEl:o,children:s,direction:a,disablePortal:c,modifiers:u,open:f,placement:p,popperOptions:h,popperRef:g,slotProps:b={},slots:S={},TransitionProps:v,ownerState:x,...w}=t,T=k.useRef(null),R=rt(T,r),P=k.useRef(null),M=rt(P,g),D=k.useRef(M);Nt(()=>{D.current=M},[M]),k.useImperativeHandle(g,()=>P.current,[]);const $=tM(p,a),[O,N]=k.useState($),[U,C]=k.useState(Bf(o));k.useEffect(()=>{P.current&&P.current.forceUpdate()}),k.useEffect(()=>{o&&C(Bf(o))},[o]),Nt(()=>{if(!U||!f)return;const F=j=>{N(j.placement)};let B=[{name:"preventOverflow",options:{altBoundary:c}},{name:"flip",options:{altBoundary:c}},{name:"onUpdate",enabled:!0,phase:"afterWrite",fn:({state:j})=>{F(j)}}];u!=null&&(B=B.concat(u)),h&&h.modifiers!=null&&(B=B.concat(h.modifiers));const Y=ZP(U,T.current,{placement:$,...h,modifiers:B});return D.current(Y),()=>{Y.destroy(),D.current(null)}},[U,c,u,f,h,$]);const A={placement:O};v!==null&&(A.TransitionProps=v);const H=rM(t),W=S.root??"div",V=Je({elementType:W,externalSlotProps:b.root,externalForwardedProps:w,additionalProps:{role:"tooltip",ref:R},ownerState:t,className:H.root});return I.jsx(W,{...V,children:typeof s=="function"?s(A):s})}),sM=k.forwardRef(function(t,r){const{anchorEl:o,children:s,container:a,direction:c="ltr",disablePortal:u=!1,keepMounted:f=!1,modifiers:p,open:h,placement:g="bottom",popperOptions:b=oM,popperRef:S,style:v,transition:x=!1,slotProps:w={},slots:T={},...R}=t,[P,M]=k.useState(!0),D=()=>{M(!1)},$=()=>{M(!0)};if(!f&&!h&&(!x||P))return null;let O;if(a)O=a;else if(o){const C=Bf(o);O=C&&nM(C)?Qt(C).body:Qt(null).body}const N=!h&&f&&(!x||P)?"none":void 0,U=x?{in:h,onEnter:D,onExited:$}:void 0;return I.jsx(H0,{disablePortal:u,container:O,children:I.jsx(iM,{anchorEl:o,direction:c,disablePortal:u,modifiers:p,ref:r,open:x?!P:h,placement:g,popperOptions:b,popperRef:S,slotProps:w,slots:T,...R,style:{position:"fixed",top:0,left:0,display:N,...v},TransitionProps:U,children:s})})}),aM=ie(sM,{name:"MuiPopper",slot:"Root",overridesResolver:(e,t)=>t.root})({}),lM=k.forwardRef(function(t,r){const o=an(),s=et({props:t,name:"MuiPopper"}),{anchorEl:a,component:c,components:u,componentsProps:f,container:p,disablePortal:h,keepMounted:g,modifiers:b,open:S,placement:v,popperOptions:x,popperRef:w,transition:T,slots:R,slotProps:P,...M}=s,D=(R==null?void 0:R.root)??(u==null?void 0:u.Root),$={anchorEl:a,container:p,disablePortal:h,keepMounted:g,modifiers:b,open:S,placement:v,popperOptions:x,popperRef:w,transition:T,...M};return I.jsx(aM,{as:c,direction:o?"rtl":"ltr",slots:{root:D},slotProps:P??f,...$,ref:r})}),cM=Zn(I.jsx("path",{d:"M12 2C6.47 2 2 6.47 2 12s4.47 10 10 10 10-4.47 10-10S17.53 2 12 2zm5 13.59L15.59 17 12 13.41 8.41 17 7 15.59 10.59 12 7 8.41 8.41 7 12 10.59 15.59 7 17 8.41 13.41 12 17 15.59z"}),"Cancel");function uM(e){return Fe("MuiChip",e)}const Ze=Ae("MuiChip",["root","sizeSmall","sizeMedium","colorDefault","colorError","colorInfo","colorPrimary","colorSecondary","colorSuccess","colorWarning","disabled","clickable","clickableColorPrimary","clickableColorSecondary","deletable","deletableColorPrimary","deletableColorSecondary","outlined","filled","outlinedPrimary","outlinedSecondary","filledPrimary","filledSecondary","avatar","avatarSmall","avatarMedium","avatarColorPrimary","avatarColorSecondary","icon","iconSmall","iconMedium","iconColorPrimary","iconColorSecondary","label","labelSmall","labelMedium","deleteIcon","deleteIconSmall","deleteIconMedium","deleteIconColorPrimary","deleteIconColorSecondary","deleteIconOutlinedColorPrimary","deleteIconOutlinedColorSecondary","deleteIconFilledColorPrimary","deleteIconFilledColorSecondary","focusVisible"]),dM=e=>{const{classes:t,disabled:r,size:o,color:s,iconColor:a,onDelete:c,clickable:u,variant:f}=e,p={root:["root",f,r&&"disabled",`size${Ee(o)}`,`color${Ee(s)}`,u&&"clickable",u&&`clickableColor${Ee(s)}`,c&&"deletable",c&&`deletableColor${Ee(s)}`,`${f}${Ee(s)}`],label:["label",`label${Ee(o)}`],avatar:["avatar",`avatar${Ee(o)}`,`avatarColor${Ee(s)}`],icon:["icon",`icon${Ee(o)}`,`iconColor${Ee(a)}`],deleteIcon:["deleteIcon",`deleteIcon${Ee(o)}`,`deleteIconColor${Ee(s)}`,`deleteIcon${Ee(f)}Color${Ee(s)}`]};return Le(p,uM,t)},fM=ie("div",{name:"MuiChip",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:r}=e,{color:o,iconColor:s,clickable:a,onDelete:c,size:u,variant:f}=r;return[{[`& .${Ze.avatar}`]:t.avatar},{[`& .${Ze.avatar}`]:t[`avatar${Ee(u)}`]},{[`& .${Ze.avatar}`]:t[`avatarColor${Ee(o)}`]},{[`& .${Ze.icon}`]:t.icon},{[`& .${Ze.icon}`]:t[`icon${Ee(u)}`]},{[`& .${Ze.icon}`]:t[`iconColor${Ee(s)}`]},{[`& .${Ze.deleteIcon}`]:t.deleteIcon},{[`& .${Ze.deleteIcon}`]:t[`deleteIcon${Ee(u)}`]},{[`& .${Ze.deleteIcon}`]:t[`deleteIconColor${Ee(o)}`]},{[`& .${Ze.deleteIcon}`]:t[`deleteIcon${Ee(f)}Color${Ee(o)}`]},t.root,t[`size${Ee(u)}`],t[`color${Ee(o)}`],a&&t.clickable,a&&o!=="default"&&t[`clickableColor${Ee(o)})`],c&&t.deletable,c&&o!=="default"&&t[`deletableColor${Ee(o)}`],t[f],t[`${f}${Ee(o)}`]]}})(st(({theme:e})=>{const t=e.palette.mode==="light"?e.palette.grey[700]:e.palette.grey[300];return{maxWidth:"100%",fontFamily:e.typography.fontFamily,fontSize:e.typography.pxToRem(13),display:"inline-flex",alignItems:"center",justifyContent:"center",height:32,color:(e.vars||e).palette.text.primary,backgroundColor:(e.vars||e).palette.action.selected,borderRadius:32/2,whiteSpace:"nowrap",transition:e.transitions.create(["background-color","box-shadow"]),cursor:"unset",outline:0,textDecoration:"none",border:0,padding:0,verticalAlign:"middle",boxSizing:"border-box",[`&.${Ze.disabled}`]:{opacity:(e.vars||e).palette.action.disabledOpacity,pointerEvents:"none"},[`& .${Ze.avatar}`]:{marginLeft:5,marginRight:-6,width:24,height:24,color:e.vars?e.vars.palette.Chip.defaultAvatarColor:t,fontSize:e.typography.pxToRem(12)},[`& .${Ze.avatarColorPrimary}`]:{color:(e.vars||e).palette.primary.contrastText,backgroundColor:(e.vars||e).palette.primary.dark},[`& .${Ze.avatarColorSecondary}`]:{color:(e.vars||e).palette.secondary.contrastText,backgroundColor:(e.vars||e).palette.secondary.dark},[`& .${Ze.avatarSmall}`]:{marginLeft:4,marginRight:-4,width:18,height:18,fontSize:e.typography.pxToRem(10)},[`& .${Ze.icon}`]:{marginLeft:5,marginRight:-6},[`& .${Ze.deleteIcon}`]:{WebkitTapHighlightColor:"transparent",color:e.vars?`rgba(${e.vars.palette.text.primaryChannel} / 0.26)`:nt(e.palette.text.primary,.26),fontSize:22,cursor:"pointer",margin:"0 5px 0 -6px","&:hover":{color:e.vars?`rgba(${e.vars.palette.text.primaryChannel} / 0.4)`:nt(e.palette.text.primary,.4)}},variants:[{props:{size:"small"},style:{height:24,[`& .${Ze.icon}`]:{fontSize:18,marginLeft:4,marginRight:-4},[`& .${Ze.deleteIcon}`]:{fontSize:16,marginRight:4,marginLeft:-4}}},...Object.entries(e.palette).filter(Rn(["contrastText"])).map(([r])=>({props:{color:r},style:{backgroundColor:(e.vars||e).palette[r].main,color:(e.vars||e).palette[r].contrastText,[`& .${Ze.deleteIcon}`]:{color:e.vars?`rgba(${e.vars.palette[r].contrastTextChannel} / 0.7)`:nt(e.palette[r].contrastText,.7),"&:hover, &:active":{color:(e.vars||e).palette[r].contrastText}}}})),{props:r=>r.iconColor===r.color,style:{[`& .${Ze.icon}`]:{color:e.vars?e.vars.palette.Chip.defaultIconColor:t}}},{props:r=>r.iconColor===r.color&&r.color!=="default",style:{[`& .${Ze.icon}`]:{color:"inherit"}}},{props:{onDelete:!0},style:{[`&.${Ze.focusVisible}`]:{backgroundColor:e.vars?`rgba(${e.vars.palette.action.selectedChannel} / calc(${e.vars.palette.action.selectedOpacity} + ${e.vars.palette.action.focusOpacity}))`:nt(e.palette.action.selected,e.palette.action.selectedOpacity+e.palette.action.focusOpacity)}}},...Object.entries(e.palette).filter(Rn(["dark"])).map(([r])=>({props:{color:r,onDelete:!0},style:{[`&.${Ze.focusVisible}`]:{background:(e.vars||e).palette[r].dark}}})),{props:{clickable:!0},style:{userSelect:"none",WebkitTapHighlightColor:"transparent",cursor:"pointer","&:hover":{backgroundColor:e.vars?`rgba(${e.vars.palette.action.selectedChannel} / calc(${e.vars.palette.action.selectedOpacity} + ${e.vars.palette.action.hoverOpacity}))`:nt(e.palette.action.selected,e.palette.action.selectedOpacity+e.palette.action.hoverOpacity)},[`&.${Ze.focusVisible}`]:{backgroundColor:e.vars?`rgba(${e.vars.palette.action.selectedChannel} / calc(${e.vars.palette.action.selectedOpacity} + ${e.vars.palette.action.focusOpacity}))`:nt(e.palette.action.selected,e.palette.action.selectedOpacity+e.palette.action.focusOpacity)},"&:active":{boxShadow:(e.vars||e).shadows[1]}}},...Object.entries(e.palette).filter(Rn(["dark"])).map(([r])=>({props:{color:r,clickable:!0},style:{[`&:hover, &.${Ze.focusVisible}`]:{backgroundColor:(e.vars||e).palette[r].dark}}})),{props:{variant:"outlined"},style:{backgroundColor:"transparent",border:e.vars?`1px solid ${e.vars.palette.Chip.defaultBorder}`:`1px solid ${e.palette.mode==="light"?e.palette.grey[400]:e.palette.grey[700]}`,[`&.${Ze.clickable}:hover`]:{backgroundColor:(e.vars||e).palette.action.hover},[`&.${Ze.focusVisible}`]:{backgroundColor:(e.vars||e).palette.action.focus},[`& .${Ze.avatar}`]:{marginLeft:4},[`& .${Ze.avatarSmall}`]:{marginLeft:2},[`& .${Ze.icon}`]:{marginLeft:4},[`& .${Ze.iconSmall}`]:{marginLeft:2},[`& .${Ze.deleteIcon}`]:{marginRight:5},[`& .${Ze.deleteIconSmall}`]:{marginRight:3}}},...Object.entries(e.palette).filter(Rn()).map(([r])=>({props:{variant:"outlined",color:r},style:{color:(e.vars||e).palette[r].main,border:`1px solid ${e.vars?`rgba(${e.vars.palette[r].mainChannel} / 0.7)`:nt(e.palette[r].main,.7)}`,[`&.${Ze.clickable}:hover`]:{backgroundColor:e.vars?`rgba(${e.vars.palette[r].mainChannel} / ${e.vars.palette.action.hoverOpacity})`:nt(e.palette[r].main,e.palette.action.hoverOpacity)},[`&.${Ze.focusVisible}`]:{backgroundColor:e.vars?`rgba(${e.vars.palette[r].mainChannel} / ${e.vars.palette.action.focusOpacity})`:nt(e.palette[r].main,e.palette.action.focusOpacity)},[`& .${Ze.deleteIcon}`]:{color:e.vars?`rgba(${e.vars.palette[r].mainChannel} / 0.7)`:nt(e.palette[r].main,.7),"&:hover, &:active":{color:(e.vars||e).palette[r].main}}}}))]}})),pM=ie("span",{name:"MuiChip",slot:"Label",overridesResolver:(e,t)=>{const{ownerState:r}=e,{size:o}=r;return[t.label,t[`label${Ee(o)}`]]}})({overflow:"hidden",textOverflow:"ellipsis",paddingLeft:12,paddingRight:12,whiteSpace:"nowrap",variants:[{props:{variant:"outlined"},style:{paddingLeft:11,paddingRight:11}},{props:{size:"small"},style:{paddingLeft:8,paddingRight:8}},{props:{size:"small",variant:"outlined"},style:{paddingLeft:7,paddingRight:7}}]});function Ry(e){return e.key==="Backspace"||e.key==="Delete"}const mM=k.forwardRef(function(t,r){const o=et({props:t,name:"MuiChip"}),{avatar:s,className:a,clickable:c,color:u="default",component:f,deleteIcon:p,disabled:h=!1,icon:g,label:b,onClick:S,onDelete:v,onKeyDown:x,onKeyUp:w,size:T="medium",variant:R="filled",tabIndex:P,skipFocusWhenDisabled:M=!1,...D}=o,$=k.useRef(null),O=rt($,r),N=_=>{_.stopPropagation(),v&&v(_)},U=_=>{_.currentTarget===_.target&&Ry(_)&&_.preventDefault(),x&&x(_)},C=_=>{_.currentTarget===_.target&&v&&Ry(_)&&v(_),w&&w(_)},A=c!==!1&&S?!0:c,H=A||v?go:f||"div",W={...o,component:H,disabled:h,size:T,color:u,iconColor:k.isValidElement(g)&&g.props.color||u,onDelete:!!v,clickable:A,variant:R},V=dM(W),F=H===go?{component:f||"div",focusVisibleClassName:V.focusVisible,...v&&{disableRipple:!0}}:{};let B=null;v&&(B=p&&k.isValidElement(p)?k.cloneElement(p,{className:Me(p.props.className,V.deleteIcon),onClick:N}):I.jsx(cM,{className:Me(V.deleteIcon),onClick:N}));let Y=null;s&&k.isValidElement(s)&&(Y=k.cloneElement(s,{className:Me(V.avatar,s.props.className)}));let j=null;return g&&k.isValidElement(g)&&(j=k.cloneElement(g,{className:Me(V.icon,g.props.className)})),I.jsxs(fM,{as:H,className:Me(V.root,a),disabled:A&&h?!0:void 0,onClick:S,onKeyDown:U,onKeyUp:C,ref:O,tabIndex:M&&h?-1:P,ownerState:W,...F,...D,children:[Y||j,I.jsx(pM,{className:Me(V.label),ownerState:W,children:b}),B]})});function ql(e){return parseInt(e,10)||0}const hM={shadow:{visibility:"hidden",position:"absolute",overflow:"hidden",height:0,top:0,left:0,transform:"translateZ(0)"}};function gM(e){return e==null||Object.keys(e).length===0||e.outerHeightStyle===0&&!e.overflowing}const yM=k.forwardRef(function(t,r){const{onChange:o,maxRows:s,minRows:a=1,style:c,value:u,...f}=t,{current:p}=k.useRef(u!=null),h=k.useRef(null),g=rt(r,h),b=k.useRef(null),S=k.useRef(null),v=k.useCallback(()=>{const T=h.current,P=ur(T).getComputedStyle(T);if(P.width==="0px")return{outerHeightStyle:0,overflowing:!1};const M=S.current;M.style.width=P.width,M.value=T.value||t.placeholder||"x",M.value.slice(-1)===`
-`&&(M.value+=" ");const D=P.boxSizing,$=ql(P.paddingBottom)+ql(P.paddingTop),O=ql(P.borderBottomWidth)+ql(P.borderTopWidth),N=M.scrollHeight;M.value="x";const U=M.scrollHeight;let C=N;a&&(C=Math.max(Number(a)*U,C)),s&&(C=Math.min(Number(s)*U,C)),C=Math.max(C,U);const A=C+(D==="border-box"?$+O:0),H=Math.abs(C-N)<=1;return{outerHeightStyle:A,overflowing:H}},[s,a,t.placeholder]),x=k.useCallback(()=>{const T=v();if(gM(T))return;const R=T.outerHeightStyle,P=h.current;b.current!==R&&(b.current=R,P.style.height=`${R}px`),P.style.overflow=T.overflowing?"hidden":""},[v]);Nt(()=>{const T=()=>{x()};let R;const P=qc(T),M=h.current,D=ur(M);D.addEventListener("resize",P);let $;return typeof ResizeObserver<"u"&&($=new ResizeObserver(T),$.observe(M)),()=>{P.clear(),cancelAnimationFrame(R),D.removeEventListener("resize",P),$&&$.disconnect()}},[v,x]),Nt(()=>{x()});const w=T=>{p||x(),o&&o(T)};return I.jsxs(k.Fragment,{children:[I.jsx("textarea",{value:u,onChange:w,ref:g,rows:a,style:c,...f}),I.jsx("textarea",{"aria-hidden":!0,className:t.className,readOnly:!0,ref:S,tabIndex:-1,style:{...hM.shadow,...c,paddingTop:0,paddingBottom:0}})]})});function ha(e){return typeof e=="string"}function Yi({props:e,states:t,muiFormControl:r}){return t.reduce((o,s)=>(o[s]=e[s],r&&typeof e[s]>"u"&&(o[s]=r[s]),o),{})}const Xc=k.createContext(void 0);function pr(){return k.useContext(Xc)}function Dy(e){return e!=null&&!(Array.isArray(e)&&e.length===0)}function Mc(e,t=!1){return e&&(Dy(e.value)&&e.value!==""||t&&Dy(e.defaultValue)&&e.defaultValue!=="")}function vM(e){return e.startAdornment}function bM(e){return Fe("MuiInputBase",e)}const Vi=Ae("MuiInputBase",["root","formControl","focused","disabled","adornedStart","adornedEnd","error","sizeSmall","multiline","colorSecondary","fullWidth","hiddenLabel","readOnly","input","inputSizeSmall","inputMultiline","inputTypeSearch","inputAdornedStart","inputAdornedEnd","inputHiddenLabel"]);var Ey;const Zc=(e,t)=>{const{ownerState:r}=e;return[t.root,r.formControl&&t.formControl,r.startAdornment&&t.adornedStart,r.endAdornment&&t.adornedEnd,r.error&&t.error,r.size==="small"&&t.sizeSmall,r.multiline&&t.multiline,r.color&&t[`color${Ee(r.color)}`],r.fullWidth&&t.fullWidth,r.hiddenLabel&&t.hiddenLabel]},Jc=(e,t)=>{const{ownerState:r}=e;return[t.input,r.size==="small"&&t.inputSizeSmall,r.multiline&&t.inputMultiline,r.type==="search"&&t.inputTypeSearch,r.startAdornment&&t.inputAdornedStart,r.endAdornment&&t.inputAdornedEnd,r.hiddenLabel&&t.inputHiddenLabel]},xM=e=>{const{classes:t,color:r,disabled:o,error:s,endAdornment:a,focused:c,formControl:u,fullWidth:f,hiddenLabel:p,multiline:h,readOnly:g,size:b,startAdornment:S,type:v}=e,x={root:["root",`color${Ee(r)}`,o&&"disabled",s&&"error",f&&"fullWidth",c&&"focused",u&&"formControl",b&&b!=="medium"&&`size${Ee(b)}`,h&&"multiline",S&&"adornedStart",a&&"adornedEnd",p&&"hiddenLabel",g&&"readOnly"],input:["input",o&&"disabled",v==="search"&&"inputTypeSearch",h&&"inputMultiline",b==="small"&&"inputSizeSmall",p&&"inputHiddenLabel",S&&"inputAdornedStart",a&&"inputAdornedEnd",g&&"readOnly"]};return Le(x,bM,t)},eu=ie("div",{name:"MuiInputBase",slot:"Root",overridesResolver:Zc})(st(({theme:e})=>({...e.typography.body1,color:(e.vars||e).palette.text.primary,lineHeight:"1.4375em",boxSizing:"border-box",position:"relative",cursor:"text",display:"inline-flex",alignItems:"center",[`&.${Vi.disabled}`]:{color:(e.vars||e).palette.text.disabled,cursor:"default"},variants:[{props:({ownerState:t})=>t.multiline,style:{padding:"4px 0 5px"}},{props:({ownerState:t,size:r})=>t.multiline&&r==="small",style:{paddingTop:1}},{props:({ownerState:t})=>t.fullWidth,style:{width:"100%"}}]}))),tu=ie("input",{name:"MuiInputBase",slot:"Input",overridesResolver:Jc})(st(({theme:e})=>{const t=e.palette.mode==="light",r={color:"currentColor",...e.vars?{opacity:e.vars.opacity.inputPlaceholder}:{opacity:t?.42:.5},transition:e.transitions.create("opacity",{duration:e.transitions.duration.shorter})},o={opacity:"0 !important"},s=e.vars?{opacity:e.vars.opacity.inputPlaceholder}:{opacity:t?.42:.5};return{font:"inherit",letterSpacing:"inherit",color:"currentColor",padding:"4px 0 5px",border:0,boxSizing:"content-box",background:"none",height:"1.4375em",margin:0,WebkitTapHighlightColor:"transparent",display:"block",minWidth:0,width:"100%","&::-webkit-input-placeholder":r,"&::-moz-placeholder":r,"&::-ms-input-placeholder":r,"&:focus":{outline:0},"&:invalid":{boxShadow:"none"},"&::-webkit-search-decoration":{WebkitAppearance:"none"},[`label[data-shrink=false] + .${Vi.formControl} &`]:{"&::-webkit-input-placeholder":o,"&::-moz-placeholder":o,"&::-ms-input-placeholder":o,"&:focus::-webkit-input-placeholder":s,"&:focus::-moz-placeholder":s,"&:focus::-ms-input-placeholder":s},[`&.${Vi.disabled}`]:{opacity:1,WebkitTextFillColor:(e.vars||e).palette.text.disabled},variants:[{props:({ownerState:a})=>!a.disableInjectingGlobalStyles,style:{animationName:"mui-auto-fill-cancel",animationDuration:"10ms","&:-webkit-autofill":{animationDuration:"5000s",animationName:"mui-auto-fill"}}},{props:{size:"small"},style:{paddingTop:1}},{props:({ownerState:a})=>a.multiline,style:{height:"auto",resize:"none",padding:0,paddingTop:0}},{props:{type:"search"},style:{MozAppearance:"textfield"}}]}})),Iy=oT({"@keyframes mui-auto-fill":{from:{display:"block"}},"@keyframes mui-auto-fill-cancel":{from:{display:"block"}}}),Tp=k.forwardRef(function(t,r){const o=et({props:t,name:"MuiInputBase"}),{"aria-describedby":s,autoComplete:a,autoFocus:c,className:u,color:f,components:p={},componentsProps:h={},defaultValue:g,disabled:b,disableInjectingGlobalStyles:S,endAdornment:v,error:x,fullWidth:w=!1,id:T,inputComponent:R="input",inputProps:P={},inputRef:M,margin:D,maxRows:$,minRows:O,multiline:N=!1,name:U,onBlur:C,onChange:A,onClick:H,onFocus:W,onKeyDown:V,onKeyUp:F,placeholder:B,readOnly:Y,renderSuffix:j,rows:_,size:q,slotProps:L={},slots:Q={},startAdornment:te,type:ae="text",value:Z,...le}=o,ue=P.value!=null?P.value:Z,{current:J}=k.useRef(ue!=null),ne=k.useRef(),fe=k.useCallback(Xe=>{},[]),be=rt(ne,M,P.ref,fe),[ve,ee]=k.useState(!1),me=pr(),xe=Yi({props:o,muiFormControl:me,states:["color","disabled","error","hiddenLabel","size","required","filled"]});xe.focused=me?me.focused:ve,k.useEffect(()=>{!me&&b&&ve&&(ee(!1),C&&C())},[me,b,ve,C]);const he=me&&me.onFilled,de=me&&me.onEmpty,ge=k.useCallback(Xe=>{Mc(Xe)?he&&he():de&&de()},[he,de]);Nt(()=>{J&&ge({value:ue})},[ue,ge,J]);const we=Xe=>{W&&W(Xe),P.onFocus&&P.onFocus(Xe),me&&me.onFocus?me.onFocus(Xe):ee(!0)},Ce=Xe=>{C&&C(Xe),P.onBlur&&P.onBlur(Xe),me&&me.onBlur?me.onBlur(Xe):ee(!1)},Ie=(Xe,...On)=>{if(!J){const un=Xe.target||ne.current;if(un==null)throw new Error(_r(1));ge({value:un.value})}P.onChange&&P.onChange(Xe,...On),A&&A(Xe,...On)};k.useEffect(()=>{ge(ne.current)},[]);const Oe=Xe=>{ne.current&&Xe.currentTarget===Xe.target&&ne.current.focus(),H&&H(Xe)};let mt=R,lt=P;N&&mt==="input"&&(_?lt={type:void 0,minRows:_,maxRows:_,...lt}:lt={type:void 0,maxRows:$,minRows:O,...lt},mt=yM);const tt=Xe=>{ge(Xe.animationName==="mui-auto-fill-cancel"?ne.current:{value:"x"})};k.useEffect(()=>{me&&me.setAdornedStart(!!te)},[me,te]);const ht={...o,color:xe.color||"primary",disabled:xe.disabled,endAdornment:v,error:xe.error,focused:xe.focused,formControl:me,fullWidth:w,hiddenLabel:xe.hiddenLabel,multiline:N,size:xe.size,startAdornment:te,type:ae},Tt=xM(ht),Rt=Q.root||p.Root||eu,Xt=L.root||h.root||{},Wt=Q.input||p.Input||tu;return lt={...lt,...L.input??h.input},I.jsxs(k.Fragment,{children:[!S&&typeof Iy=="function"&&(Ey||(Ey=I.jsx(Iy,{}))),I.jsxs(Rt,{...Xt,ref:r,onClick:Oe,...le,...!ha(Rt)&&{ownerState:{...ht,...Xt.ownerState}},className:Me(Tt.root,Xt.className,u,Y&&"MuiInputBase-readOnly"),children:[te,I.jsx(Xc.Provider,{value:null,children:I.jsx(Wt,{"aria-invalid":xe.error,"aria-describedby":s,autoComplete:a,autoFocus:c,defaultValue:g,disabled:xe.disabled,id:T,onAnimationStart:tt,name:U,placeholder:B,readOnly:Y,required:xe.required,rows:_,value:ue,onKeyDown:V,onKeyUp:F,type:ae,...lt,...!ha(Wt)&&{as:mt,ownerState:{...ht,...lt.ownerState}},ref:be,className:Me(Tt.input,lt.className,Y&&"MuiInputBase-readOnly"),onBlur:Ce,onChange:Ie,onFocus:we})}),v,j?j({...xe,startAdornment:te}):null]})]})});function wM(e){return Fe("MuiInput",e)}const Vs={...Vi,...Ae("MuiInput",["root","underline","input"])};function SM(e){return Fe("MuiOutlinedInput",e)}const wr={...Vi,...Ae("MuiOutlinedInput",["root","notchedOutline","input"])};function CM(e){return Fe("MuiFilledInput",e)}const Io={...Vi,...Ae("MuiFilledInput",["root","underline","input","adornedStart","adornedEnd","sizeSmall","multiline","hiddenLabel"])},kM=Zn(I.jsx("path",{d:"M7 10l5 5 5-5z"}),"ArrowDropDown"),TM={entering:{opacity:1},entered:{opacity:1}},Ki=k.forwardRef(function(t,r){const o=Ko(),s={enter:o.transitions.duration.enteringScreen,exit:o.transitions.duration.leavingScreen},{addEndListener:a,appear:c=!0,children:u,easing:f,in:p,onEnter:h,onEntered:g,onEntering:b,onExit:S,onExited:v,onExiting:x,style:w,timeout:T=s,TransitionComponent:R=fr,...P}=t,M=k.useRef(null),D=rt(M,Pa(u),r),$=V=>F=>{if(V){const B=M.current;F===void 0?V(B):V(B,F)}},O=$(b),N=$((V,F)=>{N0(V);const B=kc({style:w,timeout:T,easing:f},{mode:"enter"});V.style.webkitTransition=o.transitions.create("opacity",B),V.style.transition=o.transitions.create("opacity",B),h&&h(V,F)}),U=$(g),C=$(x),A=$(V=>{const F=kc({style:w,timeout:T,easing:f},{mode:"exit"});V.style.webkitTransition=o.transitions.create("opacity",F),V.style.transition=o.transitions.create("opacity",F),S&&S(V)}),H=$(v),W=V=>{a&&a(M.current,V)};return I.jsx(R,{appear:c,in:p,nodeRef:M,onEnter:N,onEntered:U,onEntering:O,onExit:A,onExited:H,onExiting:C,addEndListener:W,timeout:T,...P,children:(V,{ownerState:F,...B})=>k.cloneElement(u,{style:{opacity:0,visibility:V==="exited"&&!p?"hidden":void 0,...TM[V],...w,...u.props.style},ref:D,...B})})});function PM(e){return Fe("MuiBackdrop",e)}Ae("MuiBackdrop",["root","invisible"]);const MM=e=>{const{classes:t,invisible:r}=e;return Le({root:["root",r&&"invisible"]},PM,t)},RM=ie("div",{name:"MuiBackdrop",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:r}=e;return[t.root,r.invisible&&t.invisible]}})({position:"fixed",display:"flex",alignItems:"center",justifyContent:"center",right:0,bottom:0,top:0,left:0,backgroundColor:"rgba(0, 0, 0, 0.5)",WebkitTapHighlightColor:"transparent",variants:[{props:{invisible:!0},style:{backgroundColor:"transparent"}}]}),Y0=k.forwardRef(function(t,r){const o=et({props:t,name:"MuiBackdrop"}),{children:s,className:a,component:c="div",invisible:u=!1,open:f,components:p={},componentsProps:h={},slotProps:g={},slots:b={},TransitionComponent:S,transitionDuration:v,...x}=o,w={...o,component:c,invisible:u},T=MM(w),R={transition:S,root:p.Root,...b},P={...h,...g},M={slots:R,slotProps:P},[D,$]=cr("root",{elementType:RM,externalForwardedProps:M,className:Me(T.root,a),ownerState:w}),[O,N]=cr("transition",{elementType:Ki,externalForwardedProps:M,ownerState:w});return I.jsx(O,{in:f,timeout:v,...x,...N,children:I.jsx(D,{"aria-hidden":!0,...$,classes:T,ref:r,children:s})})}),DM=Ae("MuiBox",["root"]),EM=I0(),Gl=zC({themeId:Wi,defaultTheme:EM,defaultClassName:DM.root,generateClassName:u0.generate});function IM(e){return Fe("MuiButton",e)}const Ti=Ae("MuiButton",["root","text","textInherit","textPrimary","textSecondary","textSuccess","textError","textInfo","textWarning","outlined","outlinedInherit","outlinedPrimary","outlinedSecondary","outlinedSuccess","outlinedError","outlinedInfo","outlinedWarning","contained","containedInherit","containedPrimary","containedSecondary","containedSuccess","containedError","containedInfo","containedWarning","disableElevation","focusVisible","disabled","colorInherit","colorPrimary","colorSecondary","colorSuccess","colorError","colorInfo","colorWarning","textSizeSmall","textSizeMedium","textSizeLarge","outlinedSizeSmall","outlinedSizeMedium","outlinedSizeLarge","containedSizeSmall","containedSizeMedium","containedSizeLarge","sizeMedium","sizeSmall","sizeLarge","fullWidth","startIcon","endIcon","icon","iconSizeSmall","iconSizeMedium","iconSizeLarge"]),OM=k.createContext({}),$M=k.createContext(void 0),AM=e=>{const{color:t,disableElevation:r,fullWidth:o,size:s,variant:a,classes:c}=e,u={root:["root",a,`${a}${Ee(t)}`,`size${Ee(s)}`,`${a}Size${Ee(s)}`,`color${Ee(t)}`,r&&"disableElevation",o&&"fullWidth"],label:["label"],startIcon:["icon","startIcon",`iconSize${Ee(s)}`],endIcon:["icon","endIcon",`iconSize${Ee(s)}`]},f=Le(u,IM,c);return{...c,...f}},K0=[{props:{size:"small"},style:{"& > *:nth-of-type(1)":{fontSize:18}}},{props:{size:"medium"},style:{"& > *:nth-of-type(1)":{fontSize:20}}},{props:{size:"large"},style:{"& > *:nth-of-type(1)":{fontSize:22}}}],NM=ie(go,{shouldForwardProp:e=>Xn(e)||e==="classes",name:"MuiButton",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:r}=e;return[t.root,t[r.variant],t[`${r.variant}${Ee(r.color)}`],t[`size${Ee(r.size)}`],t[`${r.variant}Size${Ee(r.size)}`],r.color==="inherit"&&t.colorInherit,r.disableElevation&&t.disableElevation,r.fullWidth&&t.fullWidth]}})(st(({theme:e})=>{const t=e.palette.mode==="light"?e.palette.grey[300]:e.palette.grey[800],r=e.palette.mode==="light"?e.palette.grey.A100:e.palette.grey[700];return{...e.typography.button,minWidth:64,padding:"6px 16px",border:0,borderRadius:(e.vars||e).shape.borderRadius,transition:e.transitions.create(["background-color","box-shadow","border-color","color"],{duration:e.transitions.duration.short}),"&:hover":{textDecoration:"none"},[`&.${Ti.disabled}`]:{color:(e.vars||e).palette.action.disabled},variants:[{props:{variant:"contained"},style:{color:"var(--variant-containedColor)",backgroundColor:"var(--variant-containedBg)",boxShadow:(e.vars||e).shadows[2],"&:hover":{boxShadow:(e.vars||e).shadows[4],"@media (hover: none)":{boxShadow:(e.vars||e).shadows[2]}},"&:active":{boxShadow:(e.vars||e).shadows[8]},[`&.${Ti.focusVisible}`]:{boxShadow:(e.vars||e).shadows[6]},[`&.${Ti.disabled}`]:{color:(e.vars||e).palette.action.disabled,boxShadow:(e.vars||e).shadows[0],backgroundColor:(e.vars||e).palette.action.disabledBackground}}},{props:{variant:"outlined"},style:{padding:"5px 15px",border:"1px solid currentColor",borderColor:"var(--variant-outlinedBorder, currentColor)",backgroundColor:"var(--variant-outlinedBg)",color:"var(--variant-outlinedColor)",[`&.${Ti.disabled}`]:{border:`1px solid ${(e.vars||e).palette.action.disabledBackground}`}}},{props:{variant:"text"},style:{padding:"6px 8px",color:"var(--variant-textColor)",backgroundColor:"var(--variant-textBg)"}},...Object.entries(e.palette).filter(Rn()).map(([o])=>({props:{color:o},style:{"--variant-textColor":(e.vars||e).palette[o].main,"--variant-outlinedColor":(e.vars||e).palette[o].main,"--variant-outlinedBorder":e.vars?`rgba(${e.vars.palette[o].mainChannel} / 0.5)`:nt(e.palette[o].main,.5),"--variant-containedColor":(e.vars||e).palette[o].contrastText,"--variant-containedBg":(e.vars||e).palette[o].main,"@media (hover: hover)":{"&:hover":{"--variant-containedBg":(e.vars||e).palette[o].dark,"--variant-textBg":e.vars?`rgba(${e.vars.palette[o].mainChannel} / ${e.vars.palette.action.hoverOpacity})`:nt(e.palette[o].main,e.palette.action.hoverOpacity),"--variant-outlinedBorder":(e.vars||e).palette[o].main,"--variant-outlinedBg":e.vars?`rgba(${e.vars.palette[o].mainChannel} / ${e.vars.palette.action.hoverOpacity})`:nt(e.palette[o].main,e.palette.action.hoverOpacity)}}}})),{props:{color:"inherit"},style:{color:"inherit",borderColor:"currentColor","--variant-containedBg":e.vars?e.vars.palette.Button.inheritContainedBg:t,"@media (hover: hover)":{"&:hover":{"--variant-containedBg":e.vars?e.vars.palette.Button.inheritContainedHoverBg:r,"--variant-textBg":e.vars?`rgba(${e.vars.palette.text.primaryChannel} / ${e.vars.palette.action.hoverOpacity})`:nt(e.palette.text.primary,e.palette.action.hoverOpacity),"--variant-outlinedBg":e.vars?`rgba(${e.vars.palette.text.primaryChannel} / ${e.vars.palette.action.hoverOpacity})`:nt(e.palette.text.primary,e.palette.action.hoverOpacity)}}}},{props:{size:"small",variant:"text"},style:{padding:"4px 5px",fontSize:e.typography.pxToRem(13)}},{props:{size:"large",variant:"text"},style:{padding:"8px 11px",fontSize:e.typography.pxToRem(15)}},{props:{size:"small",variant:"outlined"},style:{padding:"3px 9px",fontSize:e.typography.pxToRem(13)}},{props:{size:"large",variant:"outlined"},style:{padding:"7px 21px",fontSize:e.typography.pxToRem(15)}},{props:{size:"small",variant:"contained"},style:{padding:"4px 10px",fontSize:e.typography.pxToRem(13)}},{props:{size:"large",variant:"contained"},style:{padding:"8px 22px",fontSize:e.typography.pxToRem(15)}},{props:{disableElevation:!0},style:{boxShadow:"none","&:hover":{boxShadow:"none"},[`&.${Ti.focusVisible}`]:{boxShadow:"none"},"&:active":{boxShadow:"none"},[`&.${Ti.disabled}`]:{boxShadow:"none"}}},{props:{fullWidth:!0},style:{width:"100%"}}]}})),LM=ie("span",{name:"MuiButton",slot:"StartIcon",overridesResolver:(e,t)=>{const{ownerState:r}=e;return[t.startIcon,t[`iconSize${Ee(r.size)}`]]}})({display:"inherit",marginRight:8,marginLeft:-4,variants:[{props:{size:"small"},style:{marginLeft:-2}},...K0]}),FM=ie("span",{name:"MuiButton",slot:"EndIcon",overridesResolver:(e,t)=>{const{ownerState:r}=e;return[t.endIcon,t[`iconSize${Ee(r.size)}`]]}})({display:"inherit",marginRight:-4,marginLeft:8,variants:[{props:{size:"small"},style:{marginRight:-2}},...K0]}),Fo=k.forwardRef(function(t,r){const o=k.useContext(OM),s=k.useContext($M),a=da(o,t),c=et({props:a,name:"MuiButton"}),{children:u,color:f="primary",component:p="button",className:h,disabled:g=!1,disableElevation:b=!1,disableFocusRipple:S=!1,endIcon:v,focusVisibleClassName:x,fullWidth:w=!1,size:T="medium",startIcon:R,type:P,variant:M="text",...D}=c,$={...c,color:f,component:p,disabled:g,disableElevation:b,disableFocusRipple:S,fullWidth:w,size:T,type:P,variant:M},O=AM($),N=R&&I.jsx(LM,{className:O.startIcon,ownerState:$,children:R}),U=v&&I.jsx(FM,{className:O.endIcon,ownerState:$,children:v}),C=s||"";return I.jsxs(NM,{ownerState:$,className:Me(o.className,O.root,h,C),component:p,disabled:g,focusRipple:!S,focusVisibleClassName:Me(O.focusVisible,x),ref:r,type:P,...D,classes:O,children:[N,u,U]})});function BM(e){return Fe("MuiCircularProgress",e)}Ae("MuiCircularProgress",["root","determinate","indeterminate","colorPrimary","colorSecondary","svg","circle","circleDeterminate","circleIndeterminate","circleDisableShrink"]);const po=44,Vf=Sa`
-  0% {
-    transform: rotate(0deg);
-  }
-
-  100% {
-    transform: rotate(360deg);
-  }
-`,jf=Sa`
-  0% {
-    stroke-dasharray: 1px, 200px;
-    stroke-dashoffset: 0;
-  }
-
-  50% {
-    stroke-dasharray: 100px, 200px;
-    stroke-dashoffset: -15px;
-  }
-
-  100% {
-    stroke-dasharray: 100px, 200px;
-    stroke-dashoffset: -125px;
-  }
-`,VM=typeof Vf!="string"?ip`
-        animation: ${Vf} 1.4s linear infinite;
-      `:null,jM=typeof jf!="string"?ip`
-        animation: ${jf} 1.4s ease-in-out infinite;
-      `:null,zM=e=>{const{classes:t,variant:r,color:o,disableShrink:s}=e,a={root:["root",r,`color${Ee(o)}`],svg:["svg"],circle:["circle",`circle${Ee(r)}`,s&&"circleDisableShrink"]};return Le(a,BM,t)},_M=ie("span",{name:"MuiCircularProgress",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:r}=e;return[t.root,t[r.variant],t[`color${Ee(r.color)}`]]}})(st(({theme:e})=>({display:"inline-block",variants:[{props:{variant:"determinate"},style:{transition:e.transitions.create("transform")}},{props:{variant:"indeterminate"},style:VM||{animation:`${Vf} 1.4s linear infinite`}},...Object.entries(e.palette).filter(Rn()).map(([t])=>({props:{color:t},style:{color:(e.vars||e).palette[t].main}}))]}))),WM=ie("svg",{name:"MuiCircularProgress",slot:"Svg",overridesResolver:(e,t)=>t.svg})({display:"block"}),UM=ie("circle",{name:"MuiCircularProgress",slot:"Circle",overridesResolver:(e,t)=>{const{ownerState:r}=e;return[t.circle,t[`circle${Ee(r.variant)}`],r.disableShrink&&t.circleDisableShrink]}})(st(({theme:e})=>({stroke:"currentColor",variants:[{props:{variant:"determinate"},style:{transition:e.transitions.create("stroke-dashoffset")}},{props:{variant:"indeterminate"},style:{strokeDasharray:"80px, 200px",strokeDashoffset:0}},{props:({ownerState:t})=>t.variant==="indeterminate"&&!t.disableShrink,style:jM||{animation:`${jf} 1.4s ease-in-out infinite`}}]}))),Oy=k.forwardRef(function(t,r){const o=et({props:t,name:"MuiCircularProgress"}),{className:s,color:a="primary",disableShrink:c=!1,size:u=40,style:f,thickness:p=3.6,value:h=0,variant:g="indeterminate",...b}=o,S={...o,color:a,disableShrink:c,size:u,thickness:p,value:h,variant:g},v=zM(S),x={},w={},T={};if(g==="determinate"){const R=2*Math.PI*((po-p)/2);x.strokeDasharray=R.toFixed(3),T["aria-valuenow"]=Math.round(h),x.strokeDashoffset=`${((100-h)/100*R).toFixed(3)}px`,w.transform="rotate(-90deg)"}return I.jsx(_M,{className:Me(v.root,s),style:{width:u,height:u,...w,...f},ownerState:S,ref:r,role:"progressbar",...T,...b,children:I.jsx(WM,{className:v.svg,ownerState:S,viewBox:`${po/2} ${po/2} ${po} ${po}`,children:I.jsx(UM,{className:v.circle,style:x,ownerState:S,cx:po,cy:po,r:(po-p)/2,fill:"none",strokeWidth:p})})})}),HM=Pk({createStyledComponent:ie("div",{name:"MuiContainer",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:r}=e;return[t.root,t[`maxWidth${Ee(String(r.maxWidth))}`],r.fixed&&t.fixed,r.disableGutters&&t.disableGutters]}}),useThemeProps:e=>et({props:e,name:"MuiContainer"})});function YM(e){const t=Qt(e);return t.body===e?ur(e).innerWidth>t.documentElement.clientWidth:e.scrollHeight>e.clientHeight}function ra(e,t){t?e.setAttribute("aria-hidden","true"):e.removeAttribute("aria-hidden")}function $y(e){return parseInt(ur(e).getComputedStyle(e).paddingRight,10)||0}function KM(e){const r=["TEMPLATE","SCRIPT","STYLE","LINK","MAP","META","NOSCRIPT","PICTURE","COL","COLGROUP","PARAM","SLOT","SOURCE","TRACK"].includes(e.tagName),o=e.tagName==="INPUT"&&e.getAttribute("type")==="hidden";return r||o}function Ay(e,t,r,o,s){const a=[t,r,...o];[].forEach.call(e.children,c=>{const u=!a.includes(c),f=!KM(c);u&&f&&ra(c,s)})}function pf(e,t){let r=-1;return e.some((o,s)=>t(o)?(r=s,!0):!1),r}function qM(e,t){const r=[],o=e.container;if(!t.disableScrollLock){if(YM(o)){const c=S0(ur(o));r.push({value:o.style.paddingRight,property:"padding-right",el:o}),o.style.paddingRight=`${$y(o)+c}px`;const u=Qt(o).querySelectorAll(".mui-fixed");[].forEach.call(u,f=>{r.push({value:f.style.paddingRight,property:"padding-right",el:f}),f.style.paddingRight=`${$y(f)+c}px`})}let a;if(o.parentNode instanceof DocumentFragment)a=Qt(o).body;else{const c=o.parentElement,u=ur(o);a=(c==null?void 0:c.nodeName)==="HTML"&&u.getComputedStyle(c).overflowY==="scroll"?c:o}r.push({value:a.style.overflow,property:"overflow",el:a},{value:a.style.overflowX,property:"overflow-x",el:a},{value:a.style.overflowY,property:"overflow-y",el:a}),a.style.overflow="hidden"}return()=>{r.forEach(({value:a,el:c,property:u})=>{a?c.style.setProperty(u,a):c.style.removeProperty(u)})}}function GM(e){const t=[];return[].forEach.call(e.children,r=>{r.getAttribute("aria-hidden")==="true"&&t.push(r)}),t}class QM{constructor(){this.modals=[],this.containers=[]}add(t,r){let o=this.modals.indexOf(t);if(o!==-1)return o;o=this.modals.length,this.modals.push(t),t.modalRef&&ra(t.modalRef,!1);const s=GM(r);Ay(r,t.mount,t.modalRef,s,!0);const a=pf(this.containers,c=>c.container===r);return a!==-1?(this.containers[a].modals.push(t),o):(this.containers.push({modals:[t],container:r,restore:null,hiddenSiblings:s}),o)}mount(t,r){const o=pf(this.containers,a=>a.modals.includes(t)),s=this.containers[o];s.restore||(s.restore=qM(s,r))}remove(t,r=!0){const o=this.modals.indexOf(t);if(o===-1)return o;const s=pf(this.containers,c=>c.modals.includes(t)),a=this.containers[s];if(a.modals.splice(a.modals.indexOf(t),1),this.modals.splice(o,1),a.modals.length===0)a.restore&&a.restore(),t.modalRef&&ra(t.modalRef,r),Ay(a.container,t.mount,t.modalRef,a.hiddenSiblings,!1),this.containers.splice(s,1);else{const c=a.modals[a.modals.length-1];c.modalRef&&ra(c.modalRef,!1)}return o}isTopModal(t){return this.modals.length>0&&this.modals[this.modals.length-1]===t}}const XM=["input","select","textarea","a[href]","button","[tabindex]","audio[controls]","video[controls]",'[contenteditable]:not([contenteditable="false"])'].join(",");function ZM(e){const t=parseInt(e.getAttribute("tabindex")||"",10);return Number.isNaN(t)?e.contentEditable==="true"||(e.nodeName==="AUDIO"||e.nodeName==="VIDEO"||e.nodeName==="DETAILS")&&e.getAttribute("tabindex")===null?0:e.tabIndex:t}function JM(e){if(e.tagName!=="INPUT"||e.type!=="radio"||!e.name)return!1;const t=o=>e.ownerDocument.querySelector(`input[type="radio"]${o}`);let r=t(`[name="${e.name}"]:checked`);return r||(r=t(`[name="${e.name}"]`)),r!==e}function eR(e){return!(e.disabled||e.tagName==="INPUT"&&e.type==="hidden"||JM(e))}function tR(e){const t=[],r=[];return Array.from(e.querySelectorAll(XM)).forEach((o,s)=>{const a=ZM(o);a===-1||!eR(o)||(a===0?t.push(o):r.push({documentOrder:s,tabIndex:a,node:o}))}),r.sort((o,s)=>o.tabIndex===s.tabIndex?o.documentOrder-s.documentOrder:o.tabIndex-s.tabIndex).map(o=>o.node).concat(t)}function nR(){return!0}function q0(e){const{children:t,disableAutoFocus:r=!1,disableEnforceFocus:o=!1,disableRestoreFocus:s=!1,getTabbable:a=tR,isEnabled:c=nR,open:u}=e,f=k.useRef(!1),p=k.useRef(null),h=k.useRef(null),g=k.useRef(null),b=k.useRef(null),S=k.useRef(!1),v=k.useRef(null),x=rt(Pa(t),v),w=k.useRef(null);k.useEffect(()=>{!u||!v.current||(S.current=!r)},[r,u]),k.useEffect(()=>{if(!u||!v.current)return;const P=Qt(v.current);return v.current.contains(P.activeElement)||(v.current.hasAttribute("tabIndex")||v.current.setAttribute("tabIndex","-1"),S.current&&v.current.focus()),()=>{s||(g.current&&g.current.focus&&(f.current=!0,g.current.focus()),g.current=null)}},[u]),k.useEffect(()=>{if(!u||!v.current)return;const P=Qt(v.current),M=O=>{w.current=O,!(o||!c()||O.key!=="Tab")&&P.activeElement===v.current&&O.shiftKey&&(f.current=!0,h.current&&h.current.focus())},D=()=>{var U,C;const O=v.current;if(O===null)return;if(!P.hasFocus()||!c()||f.current){f.current=!1;return}if(O.contains(P.activeElement)||o&&P.activeElement!==p.current&&P.activeElement!==h.current)return;if(P.activeElement!==b.current)b.current=null;else if(b.current!==null)return;if(!S.current)return;let N=[];if((P.activeElement===p.current||P.activeElement===h.current)&&(N=a(v.current)),N.length>0){const A=!!((U=w.current)!=null&&U.shiftKey&&((C=w.current)==null?void 0:C.key)==="Tab"),H=N[0],W=N[N.length-1];typeof H!="string"&&typeof W!="string"&&(A?W.focus():H.focus())}else O.focus()};P.addEventListener("focusin",D),P.addEventListener("keydown",M,!0);const $=setInterval(()=>{P.activeElement&&P.activeElement.tagName==="BODY"&&D()},50);return()=>{clearInterval($),P.removeEventListener("focusin",D),P.removeEventListener("keydown",M,!0)}},[r,o,s,c,u,a]);const T=P=>{g.current===null&&(g.current=P.relatedTarget),S.current=!0,b.current=P.target;const M=t.props.onFocus;M&&M(P)},R=P=>{g.current===null&&(g.current=P.relatedTarget),S.current=!0};return I.jsxs(k.Fragment,{children:[I.jsx("div",{tabIndex:u?0:-1,onFocus:R,ref:p,"data-testid":"sentinelStart"}),k.cloneElement(t,{ref:x,onFocus:T}),I.jsx("div",{tabIndex:u?0:-1,onFocus:R,ref:h,"data-testid":"sentinelEnd"})]})}function rR(e){return typeof e=="function"?e():e}function oR(e){return e?e.props.hasOwnProperty("in"):!1}const Ny=()=>{},Ql=new QM;function iR(e){const{container:t,disableEscapeKeyDown:r=!1,disableScrollLock:o=!1,closeAfterTransition:s=!1,onTransitionEnter:a,onTransitionExited:c,children:u,onClose:f,open:p,rootRef:h}=e,g=k.useRef({}),b=k.useRef(null),S=k.useRef(null),v=rt(S,h),[x,w]=k.useState(!p),T=oR(u);let R=!0;(e["aria-hidden"]==="false"||e["aria-hidden"]===!1)&&(R=!1);const P=()=>Qt(b.current),M=()=>(g.current.modalRef=S.current,g.current.mount=b.current,g.current),D=()=>{Ql.mount(M(),{disableScrollLock:o}),S.current&&(S.current.scrollTop=0)},$=$e(()=>{const F=rR(t)||P().body;Ql.add(M(),F),S.current&&D()}),O=()=>Ql.isTopModal(M()),N=$e(F=>{b.current=F,F&&(p&&O()?D():S.current&&ra(S.current,R))}),U=k.useCallback(()=>{Ql.remove(M(),R)},[R]);k.useEffect(()=>()=>{U()},[U]),k.useEffect(()=>{p?$():(!T||!s)&&U()},[p,U,T,s,$]);const C=F=>B=>{var Y;(Y=F.onKeyDown)==null||Y.call(F,B),!(B.key!=="Escape"||B.which===229||!O())&&(r||(B.stopPropagation(),f&&f(B,"escapeKeyDown")))},A=F=>B=>{var Y;(Y=F.onClick)==null||Y.call(F,B),B.target===B.currentTarget&&f&&f(B,"backdropClick")};return{getRootProps:(F={})=>{const B=k0(e);delete B.onTransitionEnter,delete B.onTransitionExited;const Y={...B,...F};return{role:"presentation",...Y,onKeyDown:C(Y),ref:v}},getBackdropProps:(F={})=>{const B=F;return{"aria-hidden":!0,...B,onClick:A(B),open:p}},getTransitionProps:()=>{const F=()=>{w(!1),a&&a()},B=()=>{w(!0),c&&c(),s&&U()};return{onEnter:ny(F,(u==null?void 0:u.props.onEnter)??Ny),onExited:ny(B,(u==null?void 0:u.props.onExited)??Ny)}},rootRef:v,portalRef:N,isTopModal:O,exited:x,hasTransition:T}}function sR(e){return Fe("MuiModal",e)}Ae("MuiModal",["root","hidden","backdrop"]);const aR=e=>{const{open:t,exited:r,classes:o}=e;return Le({root:["root",!t&&r&&"hidden"],backdrop:["backdrop"]},sR,o)},lR=ie("div",{name:"MuiModal",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:r}=e;return[t.root,!r.open&&r.exited&&t.hidden]}})(st(({theme:e})=>({position:"fixed",zIndex:(e.vars||e).zIndex.modal,right:0,bottom:0,top:0,left:0,variants:[{props:({ownerState:t})=>!t.open&&t.exited,style:{visibility:"hidden"}}]}))),cR=ie(Y0,{name:"MuiModal",slot:"Backdrop",overridesResolver:(e,t)=>t.backdrop})({zIndex:-1}),G0=k.forwardRef(function(t,r){const o=et({name:"MuiModal",props:t}),{BackdropComponent:s=cR,BackdropProps:a,classes:c,className:u,closeAfterTransition:f=!1,children:p,container:h,component:g,components:b={},componentsProps:S={},disableAutoFocus:v=!1,disableEnforceFocus:x=!1,disableEscapeKeyDown:w=!1,disablePortal:T=!1,disableRestoreFocus:R=!1,disableScrollLock:P=!1,hideBackdrop:M=!1,keepMounted:D=!1,onBackdropClick:$,onClose:O,onTransitionEnter:N,onTransitionExited:U,open:C,slotProps:A={},slots:H={},theme:W,...V}=o,F={...o,closeAfterTransition:f,disableAutoFocus:v,disableEnforceFocus:x,disableEscapeKeyDown:w,disablePortal:T,disableRestoreFocus:R,disableScrollLock:P,hideBackdrop:M,keepMounted:D},{getRootProps:B,getBackdropProps:Y,getTransitionProps:j,portalRef:_,isTopModal:q,exited:L,hasTransition:Q}=iR({...F,rootRef:r}),te={...F,exited:L},ae=aR(te),Z={};if(p.props.tabIndex===void 0&&(Z.tabIndex="-1"),Q){const{onEnter:ve,onExited:ee}=j();Z.onEnter=ve,Z.onExited=ee}const le={...V,slots:{root:b.Root,backdrop:b.Backdrop,...H},slotProps:{...S,...A}},[ue,J]=cr("root",{elementType:lR,externalForwardedProps:le,getSlotProps:B,additionalProps:{ref:r,as:g},ownerState:te,className:Me(u,ae==null?void 0:ae.root,!te.open&&te.exited&&(ae==null?void 0:ae.hidden))}),[ne,fe]=cr("backdrop",{elementType:s,externalForwardedProps:le,additionalProps:a,getSlotProps:ve=>Y({...ve,onClick:ee=>{$&&$(ee),ve!=null&&ve.onClick&&ve.onClick(ee)}}),className:Me(a==null?void 0:a.className,ae==null?void 0:ae.backdrop),ownerState:te}),be=rt(a==null?void 0:a.ref,fe.ref);return!D&&!C&&(!Q||L)?null:I.jsx(H0,{ref:_,container:h,disablePortal:T,children:I.jsxs(ue,{...J,children:[!M&&s?I.jsx(ne,{...fe,ref:be}):null,I.jsx(q0,{disableEnforceFocus:x,disableAutoFocus:v,disableRestoreFocus:R,isEnabled:q,open:C,children:k.cloneElement(p,Z)})]})})});function uR(e){return Fe("MuiDialog",e)}const oa=Ae("MuiDialog",["root","scrollPaper","scrollBody","container","paper","paperScrollPaper","paperScrollBody","paperWidthFalse","paperWidthXs","paperWidthSm","paperWidthMd","paperWidthLg","paperWidthXl","paperFullWidth","paperFullScreen"]),dR=k.createContext({}),fR=ie(Y0,{name:"MuiDialog",slot:"Backdrop",overrides:(e,t)=>t.backdrop})({zIndex:-1}),pR=e=>{const{classes:t,scroll:r,maxWidth:o,fullWidth:s,fullScreen:a}=e,c={root:["root"],container:["container",`scroll${Ee(r)}`],paper:["paper",`paperScroll${Ee(r)}`,`paperWidth${Ee(String(o))}`,s&&"paperFullWidth",a&&"paperFullScreen"]};return Le(c,uR,t)},mR=ie(G0,{name:"MuiDialog",slot:"Root",overridesResolver:(e,t)=>t.root})({"@media print":{position:"absolute !important"}}),hR=ie("div",{name:"MuiDialog",slot:"Container",overridesResolver:(e,t)=>{const{ownerState:r}=e;return[t.container,t[`scroll${Ee(r.scroll)}`]]}})({height:"100%","@media print":{height:"auto"},outline:0,variants:[{props:{scroll:"paper"},style:{display:"flex",justifyContent:"center",alignItems:"center"}},{props:{scroll:"body"},style:{overflowY:"auto",overflowX:"hidden",textAlign:"center","&::after":{content:'""',display:"inline-block",verticalAlign:"middle",height:"100%",width:"0"}}}]}),gR=ie(Vo,{name:"MuiDialog",slot:"Paper",overridesResolver:(e,t)=>{const{ownerState:r}=e;return[t.paper,t[`scrollPaper${Ee(r.scroll)}`],t[`paperWidth${Ee(String(r.maxWidth))}`],r.fullWidth&&t.paperFullWidth,r.fullScreen&&t.paperFullScreen]}})(st(({theme:e})=>({margin:32,position:"relative",overflowY:"auto","@media print":{overflowY:"visible",boxShadow:"none"},variants:[{props:{scroll:"paper"},style:{display:"flex",flexDirection:"column",maxHeight:"calc(100% - 64px)"}},{props:{scroll:"body"},style:{display:"inline-block",verticalAlign:"middle",textAlign:"initial"}},{props:({ownerState:t})=>!t.maxWidth,style:{maxWidth:"calc(100% - 64px)"}},{props:{maxWidth:"xs"},style:{maxWidth:e.breakpoints.unit==="px"?Math.max(e.breakpoints.values.xs,444):`max(${e.breakpoints.values.xs}${e.breakpoints.unit}, 444px)`,[`&.${oa.paperScrollBody}`]:{[e.breakpoints.down(Math.max(e.breakpoints.values.xs,444)+32*2)]:{maxWidth:"calc(100% - 64px)"}}}},...Object.keys(e.breakpoints.values).filter(t=>t!=="xs").map(t=>({props:{maxWidth:t},style:{maxWidth:`${e.breakpoints.values[t]}${e.breakpoints.unit}`,[`&.${oa.paperScrollBody}`]:{[e.breakpoints.down(e.breakpoints.values[t]+32*2)]:{maxWidth:"calc(100% - 64px)"}}}})),{props:({ownerState:t})=>t.fullWidth,style:{width:"calc(100% - 64px)"}},{props:({ownerState:t})=>t.fullScreen,style:{margin:0,width:"100%",maxWidth:"100%",height:"100%",maxHeight:"none",borderRadius:0,[`&.${oa.paperScrollBody}`]:{margin:0,maxWidth:"100%"}}}]}))),yR=k.forwardRef(function(t,r){const o=et({props:t,name:"MuiDialog"}),s=Ko(),a={enter:s.transitions.duration.enteringScreen,exit:s.transitions.duration.leavingScreen},{"aria-describedby":c,"aria-labelledby":u,"aria-modal":f=!0,BackdropComponent:p,BackdropProps:h,children:g,className:b,disableEscapeKeyDown:S=!1,fullScreen:v=!1,fullWidth:x=!1,maxWidth:w="sm",onBackdropClick:T,onClick:R,onClose:P,open:M,PaperComponent:D=Vo,PaperProps:$={},scroll:O="paper",TransitionComponent:N=Ki,transitionDuration:U=a,TransitionProps:C,...A}=o,H={...o,disableEscapeKeyDown:S,fullScreen:v,fullWidth:x,maxWidth:w,scroll:O},W=pR(H),V=k.useRef(),F=_=>{V.current=_.target===_.currentTarget},B=_=>{R&&R(_),V.current&&(V.current=null,T&&T(_),P&&P(_,"backdropClick"))},Y=Yr(u),j=k.useMemo(()=>({titleId:Y}),[Y]);return I.jsx(mR,{className:Me(W.root,b),closeAfterTransition:!0,components:{Backdrop:fR},componentsProps:{backdrop:{transitionDuration:U,as:p,...h}},disableEscapeKeyDown:S,onClose:P,open:M,ref:r,onClick:B,ownerState:H,...A,children:I.jsx(N,{appear:!0,in:M,timeout:U,role:"presentation",...C,children:I.jsx(hR,{className:Me(W.container),onMouseDown:F,ownerState:H,children:I.jsx(gR,{as:D,elevation:24,role:"dialog","aria-describedby":c,"aria-labelledby":Y,"aria-modal":f,...$,className:Me(W.paper,$.className),ownerState:H,children:I.jsx(dR.Provider,{value:j,children:g})})})})})});function vR(e){return Fe("MuiDialogActions",e)}Ae("MuiDialogActions",["root","spacing"]);const bR=e=>{const{classes:t,disableSpacing:r}=e;return Le({root:["root",!r&&"spacing"]},vR,t)},xR=ie("div",{name:"MuiDialogActions",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:r}=e;return[t.root,!r.disableSpacing&&t.spacing]}})({display:"flex",alignItems:"center",padding:8,justifyContent:"flex-end",flex:"0 0 auto",variants:[{props:({ownerState:e})=>!e.disableSpacing,style:{"& > :not(style) ~ :not(style)":{marginLeft:8}}}]}),wR=k.forwardRef(function(t,r){const o=et({props:t,name:"MuiDialogActions"}),{className:s,disableSpacing:a=!1,...c}=o,u={...o,disableSpacing:a},f=bR(u);return I.jsx(xR,{className:Me(f.root,s),ownerState:u,ref:r,...c})});function SR(e){return Fe("MuiDialogContent",e)}Ae("MuiDialogContent",["root","dividers"]);const CR=Ae("MuiDialogTitle",["root"]),kR=e=>{const{classes:t,dividers:r}=e;return Le({root:["root",r&&"dividers"]},SR,t)},TR=ie("div",{name:"MuiDialogContent",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:r}=e;return[t.root,r.dividers&&t.dividers]}})(st(({theme:e})=>({flex:"1 1 auto",WebkitOverflowScrolling:"touch",overflowY:"auto",padding:"20px 24px",variants:[{props:({ownerState:t})=>t.dividers,style:{padding:"16px 24px",borderTop:`1px solid ${(e.vars||e).palette.divider}`,borderBottom:`1px solid ${(e.vars||e).palette.divider}`}},{props:({ownerState:t})=>!t.dividers,style:{[`.${CR.root} + &`]:{paddingTop:0}}}]}))),PR=k.forwardRef(function(t,r){const o=et({props:t,name:"MuiDialogContent"}),{className:s,dividers:a=!1,...c}=o,u={...o,dividers:a},f=kR(u);return I.jsx(TR,{className:Me(f.root,s),ownerState:u,ref:r,...c})});function MR(e){return Fe("MuiDivider",e)}const Ly=Ae("MuiDivider",["root","absolute","fullWidth","inset","middle","flexItem","light","vertical","withChildren","withChildrenVertical","textAlignRight","textAlignLeft","wrapper","wrapperVertical"]),RR=e=>{const{absolute:t,children:r,classes:o,flexItem:s,light:a,orientation:c,textAlign:u,variant:f}=e;return Le({root:["root",t&&"absolute",f,a&&"light",c==="vertical"&&"vertical",s&&"flexItem",r&&"withChildren",r&&c==="vertical"&&"withChildrenVertical",u==="right"&&c!=="vertical"&&"textAlignRight",u==="left"&&c!=="vertical"&&"textAlignLeft"],wrapper:["wrapper",c==="vertical"&&"wrapperVertical"]},MR,o)},DR=ie("div",{name:"MuiDivider",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:r}=e;return[t.root,r.absolute&&t.absolute,t[r.variant],r.light&&t.light,r.orientation==="vertical"&&t.vertical,r.flexItem&&t.flexItem,r.children&&t.withChildren,r.children&&r.orientation==="vertical"&&t.withChildrenVertical,r.textAlign==="right"&&r.orientation!=="vertical"&&t.textAlignRight,r.textAlign==="left"&&r.orientation!=="vertical"&&t.textAlignLeft]}})(st(({theme:e})=>({margin:0,flexShrink:0,borderWidth:0,borderStyle:"solid",borderColor:(e.vars||e).palette.divider,borderBottomWidth:"thin",variants:[{props:{absolute:!0},style:{position:"absolute",bottom:0,left:0,width:"100%"}},{props:{light:!0},style:{borderColor:e.vars?`rgba(${e.vars.palette.dividerChannel} / 0.08)`:nt(e.palette.divider,.08)}},{props:{variant:"inset"},style:{marginLeft:72}},{props:{variant:"middle",orientation:"horizontal"},style:{marginLeft:e.spacing(2),marginRight:e.spacing(2)}},{props:{variant:"middle",orientation:"vertical"},style:{marginTop:e.spacing(1),marginBottom:e.spacing(1)}},{props:{orientation:"vertical"},style:{height:"100%",borderBottomWidth:0,borderRightWidth:"thin"}},{props:{flexItem:!0},style:{alignSelf:"stretch",height:"auto"}},{props:({ownerState:t})=>!!t.children,style:{display:"flex",textAlign:"center",border:0,borderTopStyle:"solid",borderLeftStyle:"solid","&::before, &::after":{content:'""',alignSelf:"center"}}},{props:({ownerState:t})=>t.children&&t.orientation!=="vertical",style:{"&::before, &::after":{width:"100%",borderTop:`thin solid ${(e.vars||e).palette.divider}`,borderTopStyle:"inherit"}}},{props:({ownerState:t})=>t.orientation==="vertical"&&t.children,style:{flexDirection:"column","&::before, &::after":{height:"100%",borderLeft:`thin solid ${(e.vars||e).palette.divider}`,borderLeftStyle:"inherit"}}},{props:({ownerState:t})=>t.textAlign==="right"&&t.orientation!=="vertical",style:{"&::before":{width:"90%"},"&::after":{width:"10%"}}},{props:({ownerState:t})=>t.textAlign==="left"&&t.orientation!=="vertical",style:{"&::before":{width:"10%"},"&::after":{width:"90%"}}}]}))),ER=ie("span",{name:"MuiDivider",slot:"Wrapper",overridesResolver:(e,t)=>{const{ownerState:r}=e;return[t.wrapper,r.orientation==="vertical"&&t.wrapperVertical]}})(st(({theme:e})=>({display:"inline-block",paddingLeft:`calc(${e.spacing(1)} * 1.2)`,paddingRight:`calc(${e.spacing(1)} * 1.2)`,whiteSpace:"nowrap",variants:[{props:{orientation:"vertical"},style:{paddingTop:`calc(${e.spacing(1)} * 1.2)`,paddingBottom:`calc(${e.spacing(1)} * 1.2)`}}]}))),Rc=k.forwardRef(function(t,r){const o=et({props:t,name:"MuiDivider"}),{absolute:s=!1,children:a,className:c,orientation:u="horizontal",component:f=a||u==="vertical"?"div":"hr",flexItem:p=!1,light:h=!1,role:g=f!=="hr"?"separator":void 0,textAlign:b="center",variant:S="fullWidth",...v}=o,x={...o,absolute:s,component:f,flexItem:p,light:h,orientation:u,role:g,textAlign:b,variant:S},w=RR(x);return I.jsx(DR,{as:f,className:Me(w.root,c),role:g,ref:r,ownerState:x,"aria-orientation":g==="separator"&&(f!=="hr"||u==="vertical")?u:void 0,...v,children:a?I.jsx(ER,{className:w.wrapper,ownerState:x,children:a}):null})});Rc&&(Rc.muiSkipListHighlight=!0);const IR=e=>{const{classes:t,disableUnderline:r,startAdornment:o,endAdornment:s,size:a,hiddenLabel:c,multiline:u}=e,f={root:["root",!r&&"underline",o&&"adornedStart",s&&"adornedEnd",a==="small"&&`size${Ee(a)}`,c&&"hiddenLabel",u&&"multiline"],input:["input"]},p=Le(f,CM,t);return{...t,...p}},OR=ie(eu,{shouldForwardProp:e=>Xn(e)||e==="classes",name:"MuiFilledInput",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:r}=e;return[...Zc(e,t),!r.disableUnderline&&t.underline]}})(st(({theme:e})=>{const t=e.palette.mode==="light",r=t?"rgba(0, 0, 0, 0.42)":"rgba(255, 255, 255, 0.7)",o=t?"rgba(0, 0, 0, 0.06)":"rgba(255, 255, 255, 0.09)",s=t?"rgba(0, 0, 0, 0.09)":"rgba(255, 255, 255, 0.13)",a=t?"rgba(0, 0, 0, 0.12)":"rgba(255, 255, 255, 0.12)";return{position:"relative",backgroundColor:e.vars?e.vars.palette.FilledInput.bg:o,borderTopLeftRadius:(e.vars||e).shape.borderRadius,borderTopRightRadius:(e.vars||e).shape.borderRadius,transition:e.transitions.create("background-color",{duration:e.transitions.duration.shorter,easing:e.transitions.easing.easeOut}),"&:hover":{backgroundColor:e.vars?e.vars.palette.FilledInput.hoverBg:s,"@media (hover: none)":{backgroundColor:e.vars?e.vars.palette.FilledInput.bg:o}},[`&.${Io.focused}`]:{backgroundColor:e.vars?e.vars.palette.FilledInput.bg:o},[`&.${Io.disabled}`]:{backgroundColor:e.vars?e.vars.palette.FilledInput.disabledBg:a},variants:[{props:({ownerState:c})=>!c.disableUnderline,style:{"&::after":{left:0,bottom:0,content:'""',position:"absolute",right:0,transform:"scaleX(0)",transition:e.transitions.create("transform",{duration:e.transitions.duration.shorter,easing:e.transitions.easing.easeOut}),pointerEvents:"none"},[`&.${Io.focused}:after`]:{transform:"scaleX(1) translateX(0)"},[`&.${Io.error}`]:{"&::before, &::after":{borderBottomColor:(e.vars||e).palette.error.main}},"&::before":{borderBottom:`1px solid ${e.vars?`rgba(${e.vars.palette.common.onBackgroundChannel} / ${e.vars.opacity.inputUnderline})`:r}`,left:0,bottom:0,content:'"\\00a0"',position:"absolute",right:0,transition:e.transitions.create("border-bottom-color",{duration:e.transitions.duration.shorter}),pointerEvents:"none"},[`&:hover:not(.${Io.disabled}, .${Io.error}):before`]:{borderBottom:`1px solid ${(e.vars||e).palette.text.primary}`},[`&.${Io.disabled}:before`]:{borderBottomStyle:"dotted"}}},...Object.entries(e.palette).filter(Rn()).map(([c])=>{var u;return{props:{disableUnderline:!1,color:c},style:{"&::after":{borderBottom:`2px solid ${(u=(e.vars||e).palette[c])==null?void 0:u.main}`}}}}),{props:({ownerState:c})=>c.startAdornment,style:{paddingLeft:12}},{props:({ownerState:c})=>c.endAdornment,style:{paddingRight:12}},{props:({ownerState:c})=>c.multiline,style:{padding:"25px 12px 8px"}},{props:({ownerState:c,size:u})=>c.multiline&&u==="small",style:{paddingTop:21,paddingBottom:4}},{props:({ownerState:c})=>c.multiline&&c.hiddenLabel,style:{paddingTop:16,paddingBottom:17}},{props:({ownerState:c})=>c.multiline&&c.hiddenLabel&&c.size==="small",style:{paddingTop:8,paddingBottom:9}}]}})),$R=ie(tu,{name:"MuiFilledInput",slot:"Input",overridesResolver:Jc})(st(({theme:e})=>({paddingTop:25,paddingRight:12,paddingBottom:8,paddingLeft:12,...!e.vars&&{"&:-webkit-autofill":{WebkitBoxShadow:e.palette.mode==="light"?null:"0 0 0 100px #266798 inset",WebkitTextFillColor:e.palette.mode==="light"?null:"#fff",caretColor:e.palette.mode==="light"?null:"#fff",borderTopLeftRadius:"inherit",borderTopRightRadius:"inherit"}},...e.vars&&{"&:-webkit-autofill":{borderTopLeftRadius:"inherit",borderTopRightRadius:"inherit"},[e.getColorSchemeSelector("dark")]:{"&:-webkit-autofill":{WebkitBoxShadow:"0 0 0 100px #266798 inset",WebkitTextFillColor:"#fff",caretColor:"#fff"}}},variants:[{props:{size:"small"},style:{paddingTop:21,paddingBottom:4}},{props:({ownerState:t})=>t.hiddenLabel,style:{paddingTop:16,paddingBottom:17}},{props:({ownerState:t})=>t.startAdornment,style:{paddingLeft:0}},{props:({ownerState:t})=>t.endAdornment,style:{paddingRight:0}},{props:({ownerState:t})=>t.hiddenLabel&&t.size==="small",style:{paddingTop:8,paddingBottom:9}},{props:({ownerState:t})=>t.multiline,style:{paddingTop:0,paddingBottom:0,paddingLeft:0,paddingRight:0}}]}))),Pp=k.forwardRef(function(t,r){const o=et({props:t,name:"MuiFilledInput"}),{disableUnderline:s=!1,components:a={},componentsProps:c,fullWidth:u=!1,hiddenLabel:f,inputComponent:p="input",multiline:h=!1,slotProps:g,slots:b={},type:S="text",...v}=o,x={...o,disableUnderline:s,fullWidth:u,inputComponent:p,multiline:h,type:S},w=IR(o),T={root:{ownerState:x},input:{ownerState:x}},R=g??c?on(T,g??c):T,P=b.root??a.Root??OR,M=b.input??a.Input??$R;return I.jsx(Tp,{slots:{root:P,input:M},slotProps:R,fullWidth:u,inputComponent:p,multiline:h,ref:r,type:S,...v,classes:w})});Pp.muiName="Input";function AR(e){return Fe("MuiFormControl",e)}Ae("MuiFormControl",["root","marginNone","marginNormal","marginDense","fullWidth","disabled"]);const NR=e=>{const{classes:t,margin:r,fullWidth:o}=e,s={root:["root",r!=="none"&&`margin${Ee(r)}`,o&&"fullWidth"]};return Le(s,AR,t)},LR=ie("div",{name:"MuiFormControl",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:r}=e;return[t.root,t[`margin${Ee(r.margin)}`],r.fullWidth&&t.fullWidth]}})({display:"inline-flex",flexDirection:"column",position:"relative",minWidth:0,padding:0,margin:0,border:0,verticalAlign:"top",variants:[{props:{margin:"normal"},style:{marginTop:16,marginBottom:8}},{props:{margin:"dense"},style:{marginTop:8,marginBottom:4}},{props:{fullWidth:!0},style:{width:"100%"}}]}),Q0=k.forwardRef(function(t,r){const o=et({props:t,name:"MuiFormControl"}),{children:s,className:a,color:c="primary",component:u="div",disabled:f=!1,error:p=!1,focused:h,fullWidth:g=!1,hiddenLabel:b=!1,margin:S="none",required:v=!1,size:x="medium",variant:w="outlined",...T}=o,R={...o,color:c,component:u,disabled:f,error:p,fullWidth:g,hiddenLabel:b,margin:S,required:v,size:x,variant:w},P=NR(R),[M,D]=k.useState(()=>{let W=!1;return s&&k.Children.forEach(s,V=>{if(!sc(V,["Input","Select"]))return;const F=sc(V,["Select"])?V.props.input:V;F&&vM(F.props)&&(W=!0)}),W}),[$,O]=k.useState(()=>{let W=!1;return s&&k.Children.forEach(s,V=>{sc(V,["Input","Select"])&&(Mc(V.props,!0)||Mc(V.props.inputProps,!0))&&(W=!0)}),W}),[N,U]=k.useState(!1);f&&N&&U(!1);const C=h!==void 0&&!f?h:N;let A;k.useRef(!1);const H=k.useMemo(()=>({adornedStart:M,setAdornedStart:D,color:c,disabled:f,error:p,filled:$,focused:C,fullWidth:g,hiddenLabel:b,size:x,onBlur:()=>{U(!1)},onEmpty:()=>{O(!1)},onFilled:()=>{O(!0)},onFocus:()=>{U(!0)},registerEffect:A,required:v,variant:w}),[M,c,f,p,$,C,g,b,A,v,x,w]);return I.jsx(Xc.Provider,{value:H,children:I.jsx(LR,{as:u,ownerState:R,className:Me(P.root,a),ref:r,...T,children:s})})});function FR(e){return Fe("MuiFormHelperText",e)}const Fy=Ae("MuiFormHelperText",["root","error","disabled","sizeSmall","sizeMedium","contained","focused","filled","required"]);var By;const BR=e=>{const{classes:t,contained:r,size:o,disabled:s,error:a,filled:c,focused:u,required:f}=e,p={root:["root",s&&"disabled",a&&"error",o&&`size${Ee(o)}`,r&&"contained",u&&"focused",c&&"filled",f&&"required"]};return Le(p,FR,t)},VR=ie("p",{name:"MuiFormHelperText",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:r}=e;return[t.root,r.size&&t[`size${Ee(r.size)}`],r.contained&&t.contained,r.filled&&t.filled]}})(st(({theme:e})=>({color:(e.vars||e).palette.text.secondary,...e.typography.caption,textAlign:"left",marginTop:3,marginRight:0,marginBottom:0,marginLeft:0,[`&.${Fy.disabled}`]:{color:(e.vars||e).palette.text.disabled},[`&.${Fy.error}`]:{color:(e.vars||e).palette.error.main},variants:[{props:{size:"small"},style:{marginTop:4}},{props:({ownerState:t})=>t.contained,style:{marginLeft:14,marginRight:14}}]}))),X0=k.forwardRef(function(t,r){const o=et({props:t,name:"MuiFormHelperText"}),{children:s,className:a,component:c="p",disabled:u,error:f,filled:p,focused:h,margin:g,required:b,variant:S,...v}=o,x=pr(),w=Yi({props:o,muiFormControl:x,states:["variant","size","disabled","error","filled","focused","required"]}),T={...o,component:c,contained:w.variant==="filled"||w.variant==="outlined",variant:w.variant,size:w.size,disabled:w.disabled,error:w.error,filled:w.filled,focused:w.focused,required:w.required};delete T.ownerState;const R=BR(T);return I.jsx(VR,{as:c,className:Me(R.root,a),ref:r,...v,ownerState:T,children:s===" "?By||(By=I.jsx("span",{className:"notranslate","aria-hidden":!0,children:"​"})):s})});function jR(e){return Fe("MuiFormLabel",e)}const ia=Ae("MuiFormLabel",["root","colorSecondary","focused","disabled","error","filled","required","asterisk"]),zR=e=>{const{classes:t,color:r,focused:o,disabled:s,error:a,filled:c,required:u}=e,f={root:["root",`color${Ee(r)}`,s&&"disabled",a&&"error",c&&"filled",o&&"focused",u&&"required"],asterisk:["asterisk",a&&"error"]};return Le(f,jR,t)},_R=ie("label",{name:"MuiFormLabel",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:r}=e;return[t.root,r.color==="secondary"&&t.colorSecondary,r.filled&&t.filled]}})(st(({theme:e})=>({color:(e.vars||e).palette.text.secondary,...e.typography.body1,lineHeight:"1.4375em",padding:0,position:"relative",variants:[...Object.entries(e.palette).filter(Rn()).map(([t])=>({props:{color:t},style:{[`&.${ia.focused}`]:{color:(e.vars||e).palette[t].main}}})),{props:{},style:{[`&.${ia.disabled}`]:{color:(e.vars||e).palette.text.disabled},[`&.${ia.error}`]:{color:(e.vars||e).palette.error.main}}}]}))),WR=ie("span",{name:"MuiFormLabel",slot:"Asterisk",overridesResolver:(e,t)=>t.asterisk})(st(({theme:e})=>({[`&.${ia.error}`]:{color:(e.vars||e).palette.error.main}}))),UR=k.forwardRef(function(t,r){const o=et({props:t,name:"MuiFormLabel"}),{children:s,className:a,color:c,component:u="label",disabled:f,error:p,filled:h,focused:g,required:b,...S}=o,v=pr(),x=Yi({props:o,muiFormControl:v,states:["color","required","focused","disabled","error","filled"]}),w={...o,color:x.color||"primary",component:u,disabled:x.disabled,error:x.error,filled:x.filled,focused:x.focused,required:x.required},T=zR(w);return I.jsxs(_R,{as:u,ownerState:w,className:Me(T.root,a),ref:r,...S,children:[s,x.required&&I.jsxs(WR,{ownerState:w,"aria-hidden":!0,className:T.asterisk,children:[" ","*"]})]})});function zf(e){return`scale(${e}, ${e**2})`}const HR={entering:{opacity:1,transform:zf(1)},entered:{opacity:1,transform:"none"}},mf=typeof navigator<"u"&&/^((?!chrome|android).)*(safari|mobile)/i.test(navigator.userAgent)&&/(os |version\/)15(.|_)4/i.test(navigator.userAgent),Dc=k.forwardRef(function(t,r){const{addEndListener:o,appear:s=!0,children:a,easing:c,in:u,onEnter:f,onEntered:p,onEntering:h,onExit:g,onExited:b,onExiting:S,style:v,timeout:x="auto",TransitionComponent:w=fr,...T}=t,R=w0(),P=k.useRef(),M=Ko(),D=k.useRef(null),$=rt(D,Pa(a),r),O=F=>B=>{if(F){const Y=D.current;B===void 0?F(Y):F(Y,B)}},N=O(h),U=O((F,B)=>{N0(F);const{duration:Y,delay:j,easing:_}=kc({style:v,timeout:x,easing:c},{mode:"enter"});let q;x==="auto"?(q=M.transitions.getAutoHeightDuration(F.clientHeight),P.current=q):q=Y,F.style.transition=[M.transitions.create("opacity",{duration:q,delay:j}),M.transitions.create("transform",{duration:mf?q:q*.666,delay:j,easing:_})].join(","),f&&f(F,B)}),C=O(p),A=O(S),H=O(F=>{const{duration:B,delay:Y,easing:j}=kc({style:v,timeout:x,easing:c},{mode:"exit"});let _;x==="auto"?(_=M.transitions.getAutoHeightDuration(F.clientHeight),P.current=_):_=B,F.style.transition=[M.transitions.create("opacity",{duration:_,delay:Y}),M.transitions.create("transform",{duration:mf?_:_*.666,delay:mf?Y:Y||_*.333,easing:j})].join(","),F.style.opacity=0,F.style.transform=zf(.75),g&&g(F)}),W=O(b),V=F=>{x==="auto"&&R.start(P.current||0,F),o&&o(D.current,F)};return I.jsx(w,{appear:s,in:u,nodeRef:D,onEnter:U,onEntered:C,onEntering:N,onExit:H,onExited:W,onExiting:A,addEndListener:V,timeout:x==="auto"?null:x,...T,children:(F,{ownerState:B,...Y})=>k.cloneElement(a,{style:{opacity:0,transform:zf(.75),visibility:F==="exited"&&!u?"hidden":void 0,...HR[F],...v,...a.props.style},ref:$,...Y})})});Dc&&(Dc.muiSupportAuto=!0);const Z0=ek({themeId:Wi}),YR=e=>{const{classes:t,disableUnderline:r}=e,s=Le({root:["root",!r&&"underline"],input:["input"]},wM,t);return{...t,...s}},KR=ie(eu,{shouldForwardProp:e=>Xn(e)||e==="classes",name:"MuiInput",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:r}=e;return[...Zc(e,t),!r.disableUnderline&&t.underline]}})(st(({theme:e})=>{let r=e.palette.mode==="light"?"rgba(0, 0, 0, 0.42)":"rgba(255, 255, 255, 0.7)";return e.vars&&(r=`rgba(${e.vars.palette.common.onBackgroundChannel} / ${e.vars.opacity.inputUnderline})`),{position:"relative",variants:[{props:({ownerState:o})=>o.formControl,style:{"label + &":{marginTop:16}}},{props:({ownerState:o})=>!o.disableUnderline,style:{"&::after":{left:0,bottom:0,content:'""',position:"absolute",right:0,transform:"scaleX(0)",transition:e.transitions.create("transform",{duration:e.transitions.duration.shorter,easing:e.transitions.easing.easeOut}),pointerEvents:"none"},[`&.${Vs.focused}:after`]:{transform:"scaleX(1) translateX(0)"},[`&.${Vs.error}`]:{"&::before, &::after":{borderBottomColor:(e.vars||e).palette.error.main}},"&::before":{borderBottom:`1px solid ${r}`,left:0,bottom:0,content:'"\\00a0"',position:"absolute",right:0,transition:e.transitions.create("border-bottom-color",{duration:e.transitions.duration.shorter}),pointerEvents:"none"},[`&:hover:not(.${Vs.disabled}, .${Vs.error}):before`]:{borderBottom:`2px solid ${(e.vars||e).palette.text.primary}`,"@media (hover: none)":{borderBottom:`1px solid ${r}`}},[`&.${Vs.disabled}:before`]:{borderBottomStyle:"dotted"}}},...Object.entries(e.palette).filter(Rn()).map(([o])=>({props:{color:o,disableUnderline:!1},style:{"&::after":{borderBottom:`2px solid ${(e.vars||e).palette[o].main}`}}}))]}})),qR=ie(tu,{name:"MuiInput",slot:"Input",overridesResolver:Jc})({}),Mp=k.forwardRef(function(t,r){const o=et({props:t,name:"MuiInput"}),{disableUnderline:s=!1,components:a={},componentsProps:c,fullWidth:u=!1,inputComponent:f="input",multiline:p=!1,slotProps:h,slots:g={},type:b="text",...S}=o,v=YR(o),w={root:{ownerState:{disableUnderline:s}}},T=h??c?on(h??c,w):w,R=g.root??a.Root??KR,P=g.input??a.Input??qR;return I.jsx(Tp,{slots:{root:R,input:P},slotProps:T,fullWidth:u,inputComponent:f,multiline:p,ref:r,type:b,...S,classes:v})});Mp.muiName="Input";function GR(e){return Fe("MuiInputAdornment",e)}const Vy=Ae("MuiInputAdornment",["root","filled","standard","outlined","positionStart","positionEnd","disablePointerEvents","hiddenLabel","sizeSmall"]);var jy;const QR=(e,t)=>{const{ownerState:r}=e;return[t.root,t[`position${Ee(r.position)}`],r.disablePointerEvents===!0&&t.disablePointerEvents,t[r.variant]]},XR=e=>{const{classes:t,disablePointerEvents:r,hiddenLabel:o,position:s,size:a,variant:c}=e,u={root:["root",r&&"disablePointerEvents",s&&`position${Ee(s)}`,c,o&&"hiddenLabel",a&&`size${Ee(a)}`]};return Le(u,GR,t)},ZR=ie("div",{name:"MuiInputAdornment",slot:"Root",overridesResolver:QR})(st(({theme:e})=>({display:"flex",maxHeight:"2em",alignItems:"center",whiteSpace:"nowrap",color:(e.vars||e).palette.action.active,variants:[{props:{variant:"filled"},style:{[`&.${Vy.positionStart}&:not(.${Vy.hiddenLabel})`]:{marginTop:16}}},{props:{position:"start"},style:{marginRight:8}},{props:{position:"end"},style:{marginLeft:8}},{props:{disablePointerEvents:!0},style:{pointerEvents:"none"}}]}))),J0=k.forwardRef(function(t,r){const o=et({props:t,name:"MuiInputAdornment"}),{children:s,className:a,component:c="div",disablePointerEvents:u=!1,disableTypography:f=!1,position:p,variant:h,...g}=o,b=pr()||{};let S=h;h&&b.variant,S||(S=b.variant);const v={...o,hiddenLabel:b.hiddenLabel,size:b.size,disablePointerEvents:u,position:p,variant:S},x=XR(v);return I.jsx(Xc.Provider,{value:null,children:I.jsx(ZR,{as:c,ownerState:v,className:Me(x.root,a),ref:r,...g,children:typeof s=="string"&&!f?I.jsx(Hn,{color:"textSecondary",children:s}):I.jsxs(k.Fragment,{children:[p==="start"?jy||(jy=I.jsx("span",{className:"notranslate","aria-hidden":!0,children:"​"})):null,s]})})})});function JR(e){return Fe("MuiInputLabel",e)}Ae("MuiInputLabel",["root","focused","disabled","error","required","asterisk","formControl","sizeSmall","shrink","animated","standard","filled","outlined"]);const eD=e=>{const{classes:t,formControl:r,size:o,shrink:s,disableAnimation:a,variant:c,required:u}=e,f={root:["root",r&&"formControl",!a&&"animated",s&&"shrink",o&&o!=="normal"&&`size${Ee(o)}`,c],asterisk:[u&&"asterisk"]},p=Le(f,JR,t);return{...t,...p}},tD=ie(UR,{shouldForwardProp:e=>Xn(e)||e==="classes",name:"MuiInputLabel",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:r}=e;return[{[`& .${ia.asterisk}`]:t.asterisk},t.root,r.formControl&&t.formControl,r.size==="small"&&t.sizeSmall,r.shrink&&t.shrink,!r.disableAnimation&&t.animated,r.focused&&t.focused,t[r.variant]]}})(st(({theme:e})=>({display:"block",transformOrigin:"top left",whiteSpace:"nowrap",overflow:"hidden",textOverflow:"ellipsis",maxWidth:"100%",variants:[{props:({ownerState:t})=>t.formControl,style:{position:"absolute",left:0,top:0,transform:"translate(0, 20px) scale(1)"}},{props:{size:"small"},style:{transform:"translate(0, 17px) scale(1)"}},{props:({ownerState:t})=>t.shrink,style:{transform:"translate(0, -1.5px) scale(0.75)",transformOrigin:"top left",maxWidth:"133%"}},{props:({ownerState:t})=>!t.disableAnimation,style:{transition:e.transitions.create(["color","transform","max-width"],{duration:e.transitions.duration.shorter,easing:e.transitions.easing.easeOut})}},{props:{variant:"filled"},style:{zIndex:1,pointerEvents:"none",transform:"translate(12px, 16px) scale(1)",maxWidth:"calc(100% - 24px)"}},{props:{variant:"filled",size:"small"},style:{transform:"translate(12px, 13px) scale(1)"}},{props:({variant:t,ownerState:r})=>t==="filled"&&r.shrink,style:{userSelect:"none",pointerEvents:"auto",transform:"translate(12px, 7px) scale(0.75)",maxWidth:"calc(133% - 24px)"}},{props:({variant:t,ownerState:r,size:o})=>t==="filled"&&r.shrink&&o==="small",style:{transform:"translate(12px, 4px) scale(0.75)"}},{props:{variant:"outlined"},style:{zIndex:1,pointerEvents:"none",transform:"translate(14px, 16px) scale(1)",maxWidth:"calc(100% - 24px)"}},{props:{variant:"outlined",size:"small"},style:{transform:"translate(14px, 9px) scale(1)"}},{props:({variant:t,ownerState:r})=>t==="outlined"&&r.shrink,style:{userSelect:"none",pointerEvents:"auto",maxWidth:"calc(133% - 32px)",transform:"translate(14px, -9px) scale(0.75)"}}]}))),eb=k.forwardRef(function(t,r){const o=et({name:"MuiInputLabel",props:t}),{disableAnimation:s=!1,margin:a,shrink:c,variant:u,className:f,...p}=o,h=pr();let g=c;typeof g>"u"&&h&&(g=h.filled||h.focused||h.adornedStart);const b=Yi({props:o,muiFormControl:h,states:["size","variant","required","focused"]}),S={...o,disableAnimation:s,formControl:h,shrink:g,size:b.size,variant:b.variant,required:b.required,focused:b.focused},v=eD(S);return I.jsx(tD,{"data-shrink":g,ref:r,className:Me(v.root,f),...p,ownerState:S,classes:v})}),zo=k.createContext({});function nD(e){return Fe("MuiList",e)}Ae("MuiList",["root","padding","dense","subheader"]);const rD=e=>{const{classes:t,disablePadding:r,dense:o,subheader:s}=e;return Le({root:["root",!r&&"padding",o&&"dense",s&&"subheader"]},nD,t)},oD=ie("ul",{name:"MuiList",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:r}=e;return[t.root,!r.disablePadding&&t.padding,r.dense&&t.dense,r.subheader&&t.subheader]}})({listStyle:"none",margin:0,padding:0,position:"relative",variants:[{props:({ownerState:e})=>!e.disablePadding,style:{paddingTop:8,paddingBottom:8}},{props:({ownerState:e})=>e.subheader,style:{paddingTop:0}}]}),tb=k.forwardRef(function(t,r){const o=et({props:t,name:"MuiList"}),{children:s,className:a,component:c="ul",dense:u=!1,disablePadding:f=!1,subheader:p,...h}=o,g=k.useMemo(()=>({dense:u}),[u]),b={...o,component:c,dense:u,disablePadding:f},S=rD(b);return I.jsx(zo.Provider,{value:g,children:I.jsxs(oD,{as:c,className:Me(S.root,a),ref:r,ownerState:b,...h,children:[p,s]})})});function iD(e){return Fe("MuiListItem",e)}Ae("MuiListItem",["root","container","dense","alignItemsFlexStart","divider","gutters","padding","secondaryAction"]);const sD=Ae("MuiListItemButton",["root","focusVisible","dense","alignItemsFlexStart","disabled","divider","gutters","selected"]);function aD(e){return Fe("MuiListItemSecondaryAction",e)}Ae("MuiListItemSecondaryAction",["root","disableGutters"]);const lD=e=>{const{disableGutters:t,classes:r}=e;return Le({root:["root",t&&"disableGutters"]},aD,r)},cD=ie("div",{name:"MuiListItemSecondaryAction",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:r}=e;return[t.root,r.disableGutters&&t.disableGutters]}})({position:"absolute",right:16,top:"50%",transform:"translateY(-50%)",variants:[{props:({ownerState:e})=>e.disableGutters,style:{right:0}}]}),nb=k.forwardRef(function(t,r){const o=et({props:t,name:"MuiListItemSecondaryAction"}),{className:s,...a}=o,c=k.useContext(zo),u={...o,disableGutters:c.disableGutters},f=lD(u);return I.jsx(cD,{className:Me(f.root,s),ownerState:u,ref:r,...a})});nb.muiName="ListItemSecondaryAction";const uD=(e,t)=>{const{ownerState:r}=e;return[t.root,r.dense&&t.dense,r.alignItems==="flex-start"&&t.alignItemsFlexStart,r.divider&&t.divider,!r.disableGutters&&t.gutters,!r.disablePadding&&t.padding,r.hasSecondaryAction&&t.secondaryAction]},dD=e=>{const{alignItems:t,classes:r,dense:o,disableGutters:s,disablePadding:a,divider:c,hasSecondaryAction:u}=e;return Le({root:["root",o&&"dense",!s&&"gutters",!a&&"padding",c&&"divider",t==="flex-start"&&"alignItemsFlexStart",u&&"secondaryAction"],container:["container"]},iD,r)},fD=ie("div",{name:"MuiListItem",slot:"Root",overridesResolver:uD})(st(({theme:e})=>({display:"flex",justifyContent:"flex-start",alignItems:"center",position:"relative",textDecoration:"none",width:"100%",boxSizing:"border-box",textAlign:"left",variants:[{props:({ownerState:t})=>!t.disablePadding,style:{paddingTop:8,paddingBottom:8}},{props:({ownerState:t})=>!t.disablePadding&&t.dense,style:{paddingTop:4,paddingBottom:4}},{props:({ownerState:t})=>!t.disablePadding&&!t.disableGutters,style:{paddingLeft:16,paddingRight:16}},{props:({ownerState:t})=>!t.disablePadding&&!!t.secondaryAction,style:{paddingRight:48}},{props:({ownerState:t})=>!!t.secondaryAction,style:{[`& > .${sD.root}`]:{paddingRight:48}}},{props:{alignItems:"flex-start"},style:{alignItems:"flex-start"}},{props:({ownerState:t})=>t.divider,style:{borderBottom:`1px solid ${(e.vars||e).palette.divider}`,backgroundClip:"padding-box"}},{props:({ownerState:t})=>t.button,style:{transition:e.transitions.create("background-color",{duration:e.transitions.duration.shortest}),"&:hover":{textDecoration:"none",backgroundColor:(e.vars||e).palette.action.hover,"@media (hover: none)":{backgroundColor:"transparent"}}}},{props:({ownerState:t})=>t.hasSecondaryAction,style:{paddingRight:48}}]}))),pD=ie("li",{name:"MuiListItem",slot:"Container",overridesResolver:(e,t)=>t.container})({position:"relative"}),mD=k.forwardRef(function(t,r){const o=et({props:t,name:"MuiListItem"}),{alignItems:s="center",children:a,className:c,component:u,components:f={},componentsProps:p={},ContainerComponent:h="li",ContainerProps:{className:g,...b}={},dense:S=!1,disableGutters:v=!1,disablePadding:x=!1,divider:w=!1,secondaryAction:T,slotProps:R={},slots:P={},...M}=o,D=k.useContext(zo),$=k.useMemo(()=>({dense:S||D.dense||!1,alignItems:s,disableGutters:v}),[s,D.dense,S,v]),O=k.useRef(null),N=k.Children.toArray(a),U=N.length&&sc(N[N.length-1],["ListItemSecondaryAction"]),C={...o,alignItems:s,dense:$.dense,disableGutters:v,disablePadding:x,divider:w,hasSecondaryAction:U},A=dD(C),H=rt(O,r),W=P.root||f.Root||fD,V=R.root||p.root||{},F={className:Me(A.root,V.className,c),...M};let B=u||"li";return U?(B=!F.component&&!u?"div":B,h==="li"&&(B==="li"?B="div":F.component==="li"&&(F.component="div")),I.jsx(zo.Provider,{value:$,children:I.jsxs(pD,{as:h,className:Me(A.container,g),ref:H,ownerState:C,...b,children:[I.jsx(W,{...V,...!ha(W)&&{as:B,ownerState:{...C,...V.ownerState}},...F,children:N}),N.pop()]})})):I.jsx(zo.Provider,{value:$,children:I.jsxs(W,{...V,as:B,ref:H,...!ha(W)&&{ownerState:{...C,...V.ownerState}},...F,children:[N,T&&I.jsx(nb,{children:T})]})})}),zy=Ae("MuiListItemIcon",["root","alignItemsFlexStart"]),_y=Ae("MuiListItemText",["root","multiline","dense","inset","primary","secondary"]);function hf(e,t,r){return e===t?e.firstChild:t&&t.nextElementSibling?t.nextElementSibling:r?null:e.firstChild}function Wy(e,t,r){return e===t?r?e.firstChild:e.lastChild:t&&t.previousElementSibling?t.previousElementSibling:r?null:e.lastChild}function rb(e,t){if(t===void 0)return!0;let r=e.innerText;return r===void 0&&(r=e.textContent),r=r.trim().toLowerCase(),r.length===0?!1:t.repeating?r[0]===t.keys[0]:r.startsWith(t.keys.join(""))}function js(e,t,r,o,s,a){let c=!1,u=s(e,t,t?r:!1);for(;u;){if(u===e.firstChild){if(c)return!1;c=!0}const f=o?!1:u.disabled||u.getAttribute("aria-disabled")==="true";if(!u.hasAttribute("tabindex")||!rb(u,a)||f)u=s(e,u,r);else return u.focus(),!0}return!1}const Rp=k.forwardRef(function(t,r){const{actions:o,autoFocus:s=!1,autoFocusItem:a=!1,children:c,className:u,disabledItemsFocusable:f=!1,disableListWrap:p=!1,onKeyDown:h,variant:g="selectedMenu",...b}=t,S=k.useRef(null),v=k.useRef({keys:[],repeating:!0,previousKeyMatched:!0,lastTime:null});Nt(()=>{s&&S.current.focus()},[s]),k.useImperativeHandle(o,()=>({adjustStyleForScrollbar:(P,{direction:M})=>{const D=!S.current.style.width;if(P.clientHeight<S.current.clientHeight&&D){const $=`${S0(ur(P))}px`;S.current.style[M==="rtl"?"paddingLeft":"paddingRight"]=$,S.current.style.width=`calc(100% + ${$})`}return S.current}}),[]);const x=P=>{const M=S.current,D=P.key;if(P.ctrlKey||P.metaKey||P.altKey){h&&h(P);return}const O=Qt(M).activeElement;if(D==="ArrowDown")P.preventDefault(),js(M,O,p,f,hf);else if(D==="ArrowUp")P.preventDefault(),js(M,O,p,f,Wy);else if(D==="Home")P.preventDefault(),js(M,null,p,f,hf);else if(D==="End")P.preventDefault(),js(M,null,p,f,Wy);else if(D.length===1){const N=v.current,U=D.toLowerCase(),C=performance.now();N.keys.length>0&&(C-N.lastTime>500?(N.keys=[],N.repeating=!0,N.previousKeyMatched=!0):N.repeating&&U!==N.keys[0]&&(N.repeating=!1)),N.lastTime=C,N.keys.push(U);const A=O&&!N.repeating&&rb(O,N);N.previousKeyMatched&&(A||js(M,O,!1,f,hf,N))?P.preventDefault():N.previousKeyMatched=!1}h&&h(P)},w=rt(S,r);let T=-1;k.Children.forEach(c,(P,M)=>{if(!k.isValidElement(P)){T===M&&(T+=1,T>=c.length&&(T=-1));return}P.props.disabled||(g==="selectedMenu"&&P.props.selected||T===-1)&&(T=M),T===M&&(P.props.disabled||P.props.muiSkipListHighlight||P.type.muiSkipListHighlight)&&(T+=1,T>=c.length&&(T=-1))});const R=k.Children.map(c,(P,M)=>{if(M===T){const D={};return a&&(D.autoFocus=!0),P.props.tabIndex===void 0&&g==="selectedMenu"&&(D.tabIndex=0),k.cloneElement(P,D)}return P});return I.jsx(tb,{role:"menu",ref:w,className:u,onKeyDown:x,tabIndex:s?0:-1,...b,children:R})});function hD(e){return Fe("MuiPopover",e)}Ae("MuiPopover",["root","paper"]);function Uy(e,t){let r=0;return typeof t=="number"?r=t:t==="center"?r=e.height/2:t==="bottom"&&(r=e.height),r}function Hy(e,t){let r=0;return typeof t=="number"?r=t:t==="center"?r=e.width/2:t==="right"&&(r=e.width),r}function Yy(e){return[e.horizontal,e.vertical].map(t=>typeof t=="number"?`${t}px`:t).join(" ")}function gf(e){return typeof e=="function"?e():e}const gD=e=>{const{classes:t}=e;return Le({root:["root"],paper:["paper"]},hD,t)},yD=ie(G0,{name:"MuiPopover",slot:"Root",overridesResolver:(e,t)=>t.root})({}),ob=ie(Vo,{name:"MuiPopover",slot:"Paper",overridesResolver:(e,t)=>t.paper})({position:"absolute",overflowY:"auto",overflowX:"hidden",minWidth:16,minHeight:16,maxWidth:"calc(100% - 32px)",maxHeight:"calc(100% - 32px)",outline:0}),vD=k.forwardRef(function(t,r){const o=et({props:t,name:"MuiPopover"}),{action:s,anchorEl:a,anchorOrigin:c={vertical:"top",horizontal:"left"},anchorPosition:u,anchorReference:f="anchorEl",children:p,className:h,container:g,elevation:b=8,marginThreshold:S=16,open:v,PaperProps:x={},slots:w={},slotProps:T={},transformOrigin:R={vertical:"top",horizontal:"left"},TransitionComponent:P=Dc,transitionDuration:M="auto",TransitionProps:{onEntering:D,...$}={},disableScrollLock:O=!1,...N}=o,U=(T==null?void 0:T.paper)??x,C=k.useRef(),A={...o,anchorOrigin:c,anchorReference:f,elevation:b,marginThreshold:S,externalPaperSlotProps:U,transformOrigin:R,TransitionComponent:P,transitionDuration:M,TransitionProps:$},H=gD(A),W=k.useCallback(()=>{if(f==="anchorPosition")return u;const fe=gf(a),ve=(fe&&fe.nodeType===1?fe:Qt(C.current).body).getBoundingClientRect();return{top:ve.top+Uy(ve,c.vertical),left:ve.left+Hy(ve,c.horizontal)}},[a,c.horizontal,c.vertical,u,f]),V=k.useCallback(fe=>({vertical:Uy(fe,R.vertical),horizontal:Hy(fe,R.horizontal)}),[R.horizontal,R.vertical]),F=k.useCallback(fe=>{const be={width:fe.offsetWidth,height:fe.offsetHeight},ve=V(be);if(f==="none")return{top:null,left:null,transformOrigin:Yy(ve)};const ee=W();let me=ee.top-ve.vertical,xe=ee.left-ve.horizontal;const he=me+be.height,de=xe+be.width,ge=ur(gf(a)),we=ge.innerHeight-S,Ce=ge.innerWidth-S;if(S!==null&&me<S){const Ie=me-S;me-=Ie,ve.vertical+=Ie}else if(S!==null&&he>we){const Ie=he-we;me-=Ie,ve.vertical+=Ie}if(S!==null&&xe<S){const Ie=xe-S;xe-=Ie,ve.horizontal+=Ie}else if(de>Ce){const Ie=de-Ce;xe-=Ie,ve.horizontal+=Ie}return{top:`${Math.round(me)}px`,left:`${Math.round(xe)}px`,transformOrigin:Yy(ve)}},[a,f,W,V,S]),[B,Y]=k.useState(v),j=k.useCallback(()=>{const fe=C.current;if(!fe)return;const be=F(fe);be.top!==null&&fe.style.setProperty("top",be.top),be.left!==null&&(fe.style.left=be.left),fe.style.transformOrigin=be.transformOrigin,Y(!0)},[F]);k.useEffect(()=>(O&&window.addEventListener("scroll",j),()=>window.removeEventListener("scroll",j)),[a,O,j]);const _=(fe,be)=>{D&&D(fe,be),j()},q=()=>{Y(!1)};k.useEffect(()=>{v&&j()}),k.useImperativeHandle(s,()=>v?{updatePosition:()=>{j()}}:null,[v,j]),k.useEffect(()=>{if(!v)return;const fe=qc(()=>{j()}),be=ur(a);return be.addEventListener("resize",fe),()=>{fe.clear(),be.removeEventListener("resize",fe)}},[a,v,j]);let L=M;M==="auto"&&!P.muiSupportAuto&&(L=void 0);const Q=g||(a?Qt(gf(a)).body:void 0),te={slots:w,slotProps:{...T,paper:U}},[ae,Z]=cr("paper",{elementType:ob,externalForwardedProps:te,additionalProps:{elevation:b,className:Me(H.paper,U==null?void 0:U.className),style:B?U.style:{...U.style,opacity:0}},ownerState:A}),[le,{slotProps:ue,...J}]=cr("root",{elementType:yD,externalForwardedProps:te,additionalProps:{slotProps:{backdrop:{invisible:!0}},container:Q,open:v},ownerState:A,className:Me(H.root,h)}),ne=rt(C,Z.ref);return I.jsx(le,{...J,...!ha(le)&&{slotProps:ue,disableScrollLock:O},...N,ref:r,children:I.jsx(P,{appear:!0,in:v,onEntering:_,onExited:q,timeout:L,...$,children:I.jsx(ae,{...Z,ref:ne,children:p})})})});function bD(e){return Fe("MuiMenu",e)}Ae("MuiMenu",["root","paper","list"]);const xD={vertical:"top",horizontal:"right"},wD={vertical:"top",horizontal:"left"},SD=e=>{const{classes:t}=e;return Le({root:["root"],paper:["paper"],list:["list"]},bD,t)},CD=ie(vD,{shouldForwardProp:e=>Xn(e)||e==="classes",name:"MuiMenu",slot:"Root",overridesResolver:(e,t)=>t.root})({}),kD=ie(ob,{name:"MuiMenu",slot:"Paper",overridesResolver:(e,t)=>t.paper})({maxHeight:"calc(100% - 96px)",WebkitOverflowScrolling:"touch"}),TD=ie(Rp,{name:"MuiMenu",slot:"List",overridesResolver:(e,t)=>t.list})({outline:0}),PD=k.forwardRef(function(t,r){const o=et({props:t,name:"MuiMenu"}),{autoFocus:s=!0,children:a,className:c,disableAutoFocusItem:u=!1,MenuListProps:f={},onClose:p,open:h,PaperProps:g={},PopoverClasses:b,transitionDuration:S="auto",TransitionProps:{onEntering:v,...x}={},variant:w="selectedMenu",slots:T={},slotProps:R={},...P}=o,M=an(),D={...o,autoFocus:s,disableAutoFocusItem:u,MenuListProps:f,onEntering:v,PaperProps:g,transitionDuration:S,TransitionProps:x,variant:w},$=SD(D),O=s&&!u&&h,N=k.useRef(null),U=(B,Y)=>{N.current&&N.current.adjustStyleForScrollbar(B,{direction:M?"rtl":"ltr"}),v&&v(B,Y)},C=B=>{B.key==="Tab"&&(B.preventDefault(),p&&p(B,"tabKeyDown"))};let A=-1;k.Children.map(a,(B,Y)=>{k.isValidElement(B)&&(B.props.disabled||(w==="selectedMenu"&&B.props.selected||A===-1)&&(A=Y))});const H=T.paper??kD,W=R.paper??g,V=Je({elementType:T.root,externalSlotProps:R.root,ownerState:D,className:[$.root,c]}),F=Je({elementType:H,externalSlotProps:W,ownerState:D,className:$.paper});return I.jsx(CD,{onClose:p,anchorOrigin:{vertical:"bottom",horizontal:M?"right":"left"},transformOrigin:M?xD:wD,slots:{paper:H,root:T.root},slotProps:{root:V,paper:F},open:h,ref:r,transitionDuration:S,TransitionProps:{onEntering:U,...x},ownerState:D,...P,classes:b,children:I.jsx(TD,{onKeyDown:C,actions:N,autoFocus:s&&(A===-1||u),autoFocusItem:O,variant:w,...f,className:Me($.list,f.className),children:a})})});function MD(e){return Fe("MuiMenuItem",e)}const zs=Ae("MuiMenuItem",["root","focusVisible","dense","disabled","divider","gutters","selected"]),RD=(e,t)=>{const{ownerState:r}=e;return[t.root,r.dense&&t.dense,r.divider&&t.divider,!r.disableGutters&&t.gutters]},DD=e=>{const{disabled:t,dense:r,divider:o,disableGutters:s,selected:a,classes:c}=e,f=Le({root:["root",r&&"dense",t&&"disabled",!s&&"gutters",o&&"divider",a&&"selected"]},MD,c);return{...c,...f}},ED=ie(go,{shouldForwardProp:e=>Xn(e)||e==="classes",name:"MuiMenuItem",slot:"Root",overridesResolver:RD})(st(({theme:e})=>({...e.typography.body1,display:"flex",justifyContent:"flex-start",alignItems:"center",position:"relative",textDecoration:"none",minHeight:48,paddingTop:6,paddingBottom:6,boxSizing:"border-box",whiteSpace:"nowrap","&:hover":{textDecoration:"none",backgroundColor:(e.vars||e).palette.action.hover,"@media (hover: none)":{backgroundColor:"transparent"}},[`&.${zs.selected}`]:{backgroundColor:e.vars?`rgba(${e.vars.palette.primary.mainChannel} / ${e.vars.palette.action.selectedOpacity})`:nt(e.palette.primary.main,e.palette.action.selectedOpacity),[`&.${zs.focusVisible}`]:{backgroundColor:e.vars?`rgba(${e.vars.palette.primary.mainChannel} / calc(${e.vars.palette.action.selectedOpacity} + ${e.vars.palette.action.focusOpacity}))`:nt(e.palette.primary.main,e.palette.action.selectedOpacity+e.palette.action.focusOpacity)}},[`&.${zs.selected}:hover`]:{backgroundColor:e.vars?`rgba(${e.vars.palette.primary.mainChannel} / calc(${e.vars.palette.action.selectedOpacity} + ${e.vars.palette.action.hoverOpacity}))`:nt(e.palette.primary.main,e.palette.action.selectedOpacity+e.palette.action.hoverOpacity),"@media (hover: none)":{backgroundColor:e.vars?`rgba(${e.vars.palette.primary.mainChannel} / ${e.vars.palette.action.selectedOpacity})`:nt(e.palette.primary.main,e.palette.action.selectedOpacity)}},[`&.${zs.focusVisible}`]:{backgroundColor:(e.vars||e).palette.action.focus},[`&.${zs.disabled}`]:{opacity:(e.vars||e).palette.action.disabledOpacity},[`& + .${Ly.root}`]:{marginTop:e.spacing(1),marginBottom:e.spacing(1)},[`& + .${Ly.inset}`]:{marginLeft:52},[`& .${_y.root}`]:{marginTop:0,marginBottom:0},[`& .${_y.inset}`]:{paddingLeft:36},[`& .${zy.root}`]:{minWidth:36},variants:[{props:({ownerState:t})=>!t.disableGutters,style:{paddingLeft:16,paddingRight:16}},{props:({ownerState:t})=>t.divider,style:{borderBottom:`1px solid ${(e.vars||e).palette.divider}`,backgroundClip:"padding-box"}},{props:({ownerState:t})=>!t.dense,style:{[e.breakpoints.up("sm")]:{minHeight:"auto"}}},{props:({ownerState:t})=>t.dense,style:{minHeight:32,paddingTop:4,paddingBottom:4,...e.typography.body2,[`& .${zy.root} svg`]:{fontSize:"1.25rem"}}}]}))),ib=k.forwardRef(function(t,r){const o=et({props:t,name:"MuiMenuItem"}),{autoFocus:s=!1,component:a="li",dense:c=!1,divider:u=!1,disableGutters:f=!1,focusVisibleClassName:p,role:h="menuitem",tabIndex:g,className:b,...S}=o,v=k.useContext(zo),x=k.useMemo(()=>({dense:c||v.dense||!1,disableGutters:f}),[v.dense,c,f]),w=k.useRef(null);Nt(()=>{s&&w.current&&w.current.focus()},[s]);const T={...o,dense:x.dense,divider:u,disableGutters:f},R=DD(o),P=rt(w,r);let M;return o.disabled||(M=g!==void 0?g:-1),I.jsx(zo.Provider,{value:x,children:I.jsx(ED,{ref:P,role:h,tabIndex:M,component:a,focusVisibleClassName:Me(R.focusVisible,p),className:Me(R.root,b),...S,ownerState:T,classes:R})})});function ID(e){return Fe("MuiNativeSelect",e)}const Dp=Ae("MuiNativeSelect",["root","select","multiple","filled","outlined","standard","disabled","icon","iconOpen","iconFilled","iconOutlined","iconStandard","nativeInput","error"]),OD=e=>{const{classes:t,variant:r,disabled:o,multiple:s,open:a,error:c}=e,u={select:["select",r,o&&"disabled",s&&"multiple",c&&"error"],icon:["icon",`icon${Ee(r)}`,a&&"iconOpen",o&&"disabled"]};return Le(u,ID,t)},sb=ie("select")(({theme:e})=>({MozAppearance:"none",WebkitAppearance:"none",userSelect:"none",borderRadius:0,cursor:"pointer","&:focus":{borderRadius:0},[`&.${Dp.disabled}`]:{cursor:"default"},"&[multiple]":{height:"auto"},"&:not([multiple]) option, &:not([multiple]) optgroup":{backgroundColor:(e.vars||e).palette.background.paper},variants:[{props:({ownerState:t})=>t.variant!=="filled"&&t.variant!=="outlined",style:{"&&&":{paddingRight:24,minWidth:16}}},{props:{variant:"filled"},style:{"&&&":{paddingRight:32}}},{props:{variant:"outlined"},style:{borderRadius:(e.vars||e).shape.borderRadius,"&:focus":{borderRadius:(e.vars||e).shape.borderRadius},"&&&":{paddingRight:32}}}]})),$D=ie(sb,{name:"MuiNativeSelect",slot:"Select",shouldForwardProp:Xn,overridesResolver:(e,t)=>{const{ownerState:r}=e;return[t.select,t[r.variant],r.error&&t.error,{[`&.${Dp.multiple}`]:t.multiple}]}})({}),ab=ie("svg")(({theme:e})=>({position:"absolute",right:0,top:"calc(50% - .5em)",pointerEvents:"none",color:(e.vars||e).palette.action.active,[`&.${Dp.disabled}`]:{color:(e.vars||e).palette.action.disabled},variants:[{props:({ownerState:t})=>t.open,style:{transform:"rotate(180deg)"}},{props:{variant:"filled"},style:{right:7}},{props:{variant:"outlined"},style:{right:7}}]})),AD=ie(ab,{name:"MuiNativeSelect",slot:"Icon",overridesResolver:(e,t)=>{const{ownerState:r}=e;return[t.icon,r.variant&&t[`icon${Ee(r.variant)}`],r.open&&t.iconOpen]}})({}),ND=k.forwardRef(function(t,r){const{className:o,disabled:s,error:a,IconComponent:c,inputRef:u,variant:f="standard",...p}=t,h={...t,disabled:s,variant:f,error:a},g=OD(h);return I.jsxs(k.Fragment,{children:[I.jsx($D,{ownerState:h,className:Me(g.select,o),disabled:s,ref:u||r,...p}),t.multiple?null:I.jsx(AD,{as:c,ownerState:h,className:g.icon})]})});var Ky;const LD=ie("fieldset",{shouldForwardProp:Xn})({textAlign:"left",position:"absolute",bottom:0,right:0,top:-5,left:0,margin:0,padding:"0 8px",pointerEvents:"none",borderRadius:"inherit",borderStyle:"solid",borderWidth:1,overflow:"hidden",minWidth:"0%"}),FD=ie("legend",{shouldForwardProp:Xn})(st(({theme:e})=>({float:"unset",width:"auto",overflow:"hidden",variants:[{props:({ownerState:t})=>!t.withLabel,style:{padding:0,lineHeight:"11px",transition:e.transitions.create("width",{duration:150,easing:e.transitions.easing.easeOut})}},{props:({ownerState:t})=>t.withLabel,style:{display:"block",padding:0,height:11,fontSize:"0.75em",visibility:"hidden",maxWidth:.01,transition:e.transitions.create("max-width",{duration:50,easing:e.transitions.easing.easeOut}),whiteSpace:"nowrap","& > span":{paddingLeft:5,paddingRight:5,display:"inline-block",opacity:0,visibility:"visible"}}},{props:({ownerState:t})=>t.withLabel&&t.notched,style:{maxWidth:"100%",transition:e.transitions.create("max-width",{duration:100,easing:e.transitions.easing.easeOut,delay:50})}}]})));function BD(e){const{children:t,classes:r,className:o,label:s,notched:a,...c}=e,u=s!=null&&s!=="",f={...e,notched:a,withLabel:u};return I.jsx(LD,{"aria-hidden":!0,className:o,ownerState:f,...c,children:I.jsx(FD,{ownerState:f,children:u?I.jsx("span",{children:s}):Ky||(Ky=I.jsx("span",{className:"notranslate","aria-hidden":!0,children:"​"}))})})}const VD=e=>{const{classes:t}=e,o=Le({root:["root"],notchedOutline:["notchedOutline"],input:["input"]},SM,t);return{...t,...o}},jD=ie(eu,{shouldForwardProp:e=>Xn(e)||e==="classes",name:"MuiOutlinedInput",slot:"Root",overridesResolver:Zc})(st(({theme:e})=>{const t=e.palette.mode==="light"?"rgba(0, 0, 0, 0.23)":"rgba(255, 255, 255, 0.23)";return{position:"relative",borderRadius:(e.vars||e).shape.borderRadius,[`&:hover .${wr.notchedOutline}`]:{borderColor:(e.vars||e).palette.text.primary},"@media (hover: none)":{[`&:hover .${wr.notchedOutline}`]:{borderColor:e.vars?`rgba(${e.vars.palette.common.onBackgroundChannel} / 0.23)`:t}},[`&.${wr.focused} .${wr.notchedOutline}`]:{borderWidth:2},variants:[...Object.entries(e.palette).filter(Rn()).map(([r])=>({props:{color:r},style:{[`&.${wr.focused} .${wr.notchedOutline}`]:{borderColor:(e.vars||e).palette[r].main}}})),{props:{},style:{[`&.${wr.error} .${wr.notchedOutline}`]:{borderColor:(e.vars||e).palette.error.main},[`&.${wr.disabled} .${wr.notchedOutline}`]:{borderColor:(e.vars||e).palette.action.disabled}}},{props:({ownerState:r})=>r.startAdornment,style:{paddingLeft:14}},{props:({ownerState:r})=>r.endAdornment,style:{paddingRight:14}},{props:({ownerState:r})=>r.multiline,style:{padding:"16.5px 14px"}},{props:({ownerState:r,size:o})=>r.multiline&&o==="small",style:{padding:"8.5px 14px"}}]}})),zD=ie(BD,{name:"MuiOutlinedInput",slot:"NotchedOutline",overridesResolver:(e,t)=>t.notchedOutline})(st(({theme:e})=>{const t=e.palette.mode==="light"?"rgba(0, 0, 0, 0.23)":"rgba(255, 255, 255, 0.23)";return{borderColor:e.vars?`rgba(${e.vars.palette.common.onBackgroundChannel} / 0.23)`:t}})),_D=ie(tu,{name:"MuiOutlinedInput",slot:"Input",overridesResolver:Jc})(st(({theme:e})=>({padding:"16.5px 14px",...!e.vars&&{"&:-webkit-autofill":{WebkitBoxShadow:e.palette.mode==="light"?null:"0 0 0 100px #266798 inset",WebkitTextFillColor:e.palette.mode==="light"?null:"#fff",caretColor:e.palette.mode==="light"?null:"#fff",borderRadius:"inherit"}},...e.vars&&{"&:-webkit-autofill":{borderRadius:"inherit"},[e.getColorSchemeSelector("dark")]:{"&:-webkit-autofill":{WebkitBoxShadow:"0 0 0 100px #266798 inset",WebkitTextFillColor:"#fff",caretColor:"#fff"}}},variants:[{props:{size:"small"},style:{padding:"8.5px 14px"}},{props:({ownerState:t})=>t.multiline,style:{padding:0}},{props:({ownerState:t})=>t.startAdornment,style:{paddingLeft:0}},{props:({ownerState:t})=>t.endAdornment,style:{paddingRight:0}}]}))),Ep=k.forwardRef(function(t,r){var o;const s=et({props:t,name:"MuiOutlinedInput"}),{components:a={},fullWidth:c=!1,inputComponent:u="input",label:f,multiline:p=!1,notched:h,slots:g={},type:b="text",...S}=s,v=VD(s),x=pr(),w=Yi({props:s,muiFormControl:x,states:["color","disabled","error","focused","hiddenLabel","size","required"]}),T={...s,color:w.color||"primary",disabled:w.disabled,error:w.error,focused:w.focused,formControl:x,fullWidth:c,hiddenLabel:w.hiddenLabel,multiline:p,size:w.size,type:b},R=g.root??a.Root??jD,P=g.input??a.Input??_D;return I.jsx(Tp,{slots:{root:R,input:P},renderSuffix:M=>I.jsx(zD,{ownerState:T,className:v.notchedOutline,label:f!=null&&f!==""&&w.required?o||(o=I.jsxs(k.Fragment,{children:[f," ","*"]})):f,notched:typeof h<"u"?h:!!(M.startAdornment||M.filled||M.focused)}),fullWidth:c,inputComponent:u,multiline:p,ref:r,type:b,...S,classes:{...v,notchedOutline:null}})});Ep.muiName="Input";function WD(e){return Fe("MuiSelect",e)}const _s=Ae("MuiSelect",["root","select","multiple","filled","outlined","standard","disabled","focused","icon","iconOpen","iconFilled","iconOutlined","iconStandard","nativeInput","error"]);var qy;const UD=ie(sb,{name:"MuiSelect",slot:"Select",overridesResolver:(e,t)=>{const{ownerState:r}=e;return[{[`&.${_s.select}`]:t.select},{[`&.${_s.select}`]:t[r.variant]},{[`&.${_s.error}`]:t.error},{[`&.${_s.multiple}`]:t.multiple}]}})({[`&.${_s.select}`]:{height:"auto",minHeight:"1.4375em",textOverflow:"ellipsis",whiteSpace:"nowrap",overflow:"hidden"}}),HD=ie(ab,{name:"MuiSelect",slot:"Icon",overridesResolver:(e,t)=>{const{ownerState:r}=e;return[t.icon,r.variant&&t[`icon${Ee(r.variant)}`],r.open&&t.iconOpen]}})({}),YD=ie("input",{shouldForwardProp:e=>O0(e)&&e!=="classes",name:"MuiSelect",slot:"NativeInput",overridesResolver:(e,t)=>t.nativeInput})({bottom:0,left:0,position:"absolute",opacity:0,pointerEvents:"none",width:"100%",boxSizing:"border-box"});function Gy(e,t){return typeof t=="object"&&t!==null?e===t:String(e)===String(t)}function KD(e){return e==null||typeof e=="string"&&!e.trim()}const qD=e=>{const{classes:t,variant:r,disabled:o,multiple:s,open:a,error:c}=e,u={select:["select",r,o&&"disabled",s&&"multiple",c&&"error"],icon:["icon",`icon${Ee(r)}`,a&&"iconOpen",o&&"disabled"],nativeInput:["nativeInput"]};return Le(u,WD,t)},GD=k.forwardRef(function(t,r){var $n;const{"aria-describedby":o,"aria-label":s,autoFocus:a,autoWidth:c,children:u,className:f,defaultOpen:p,defaultValue:h,disabled:g,displayEmpty:b,error:S=!1,IconComponent:v,inputRef:x,labelId:w,MenuProps:T={},multiple:R,name:P,onBlur:M,onChange:D,onClose:$,onFocus:O,onOpen:N,open:U,readOnly:C,renderValue:A,required:H,SelectDisplayProps:W={},tabIndex:V,type:F,value:B,variant:Y="standard",...j}=t,[_,q]=Ur({controlled:B,default:h,name:"Select"}),[L,Q]=Ur({controlled:U,default:p,name:"Select"}),te=k.useRef(null),ae=k.useRef(null),[Z,le]=k.useState(null),{current:ue}=k.useRef(U!=null),[J,ne]=k.useState(),fe=rt(r,x),be=k.useCallback(Se=>{ae.current=Se,Se&&le(Se)},[]),ve=Z==null?void 0:Z.parentNode;k.useImperativeHandle(fe,()=>({focus:()=>{ae.current.focus()},node:te.current,value:_}),[_]),k.useEffect(()=>{p&&L&&Z&&!ue&&(ne(c?null:ve.clientWidth),ae.current.focus())},[Z,c]),k.useEffect(()=>{a&&ae.current.focus()},[a]),k.useEffect(()=>{if(!w)return;const Se=Qt(ae.current).getElementById(w);if(Se){const De=()=>{getSelection().isCollapsed&&ae.current.focus()};return Se.addEventListener("click",De),()=>{Se.removeEventListener("click",De)}}},[w]);const ee=(Se,De)=>{Se?N&&N(De):$&&$(De),ue||(ne(c?null:ve.clientWidth),Q(Se))},me=Se=>{Se.button===0&&(Se.preventDefault(),ae.current.focus(),ee(!0,Se))},xe=Se=>{ee(!1,Se)},he=k.Children.toArray(u),de=Se=>{const De=he.find(_e=>_e.props.value===Se.target.value);De!==void 0&&(q(De.props.value),D&&D(Se,De))},ge=Se=>De=>{let _e;if(De.currentTarget.hasAttribute("tabindex")){if(R){_e=Array.isArray(_)?_.slice():[];const qe=_.indexOf(Se.props.value);qe===-1?_e.push(Se.props.value):_e.splice(qe,1)}else _e=Se.props.value;if(Se.props.onClick&&Se.props.onClick(De),_!==_e&&(q(_e),D)){const qe=De.nativeEvent||De,Ue=new qe.constructor(qe.type,qe);Object.defineProperty(Ue,"target",{writable:!0,value:{value:_e,name:P}}),D(Ue,Se)}R||ee(!1,De)}},we=Se=>{C||[" ","ArrowUp","ArrowDown","Enter"].includes(Se.key)&&(Se.preventDefault(),ee(!0,Se))},Ce=Z!==null&&L,Ie=Se=>{!Ce&&M&&(Object.defineProperty(Se,"target",{writable:!0,value:{value:_,name:P}}),M(Se))};delete j["aria-invalid"];let Oe,mt;const lt=[];let tt=!1;(Mc({value:_})||b)&&(A?Oe=A(_):tt=!0);const ht=he.map(Se=>{if(!k.isValidElement(Se))return null;let De;if(R){if(!Array.isArray(_))throw new Error(_r(2));De=_.some(_e=>Gy(_e,Se.props.value)),De&&tt&&lt.push(Se.props.children)}else De=Gy(_,Se.props.value),De&&tt&&(mt=Se.props.children);return k.cloneElement(Se,{"aria-selected":De?"true":"false",onClick:ge(Se),onKeyUp:_e=>{_e.key===" "&&_e.preventDefault(),Se.props.onKeyUp&&Se.props.onKeyUp(_e)},role:"option",selected:De,value:void 0,"data-value":Se.props.value})});tt&&(R?lt.length===0?Oe=null:Oe=lt.reduce((Se,De,_e)=>(Se.push(De),_e<lt.length-1&&Se.push(", "),Se),[]):Oe=mt);let Tt=J;!c&&ue&&Z&&(Tt=ve.clientWidth);let Rt;typeof V<"u"?Rt=V:Rt=g?null:0;const Xt=W.id||(P?`mui-component-select-${P}`:void 0),Wt={...t,variant:Y,value:_,open:Ce,error:S},Xe=qD(Wt),On={...T.PaperProps,...($n=T.slotProps)==null?void 0:$n.paper},un=Yr();return I.jsxs(k.Fragment,{children:[I.jsx(UD,{as:"div",ref:be,tabIndex:Rt,role:"combobox","aria-controls":un,"aria-disabled":g?"true":void 0,"aria-expanded":Ce?"true":"false","aria-haspopup":"listbox","aria-label":s,"aria-labelledby":[w,Xt].filter(Boolean).join(" ")||void 0,"aria-describedby":o,"aria-required":H?"true":void 0,"aria-invalid":S?"true":void 0,onKeyDown:we,onMouseDown:g||C?null:me,onBlur:Ie,onFocus:O,...W,ownerState:Wt,className:Me(W.className,Xe.select,f),id:Xt,children:KD(Oe)?qy||(qy=I.jsx("span",{className:"notranslate","aria-hidden":!0,children:"​"})):Oe}),I.jsx(YD,{"aria-invalid":S,value:Array.isArray(_)?_.join(","):_,name:P,ref:te,"aria-hidden":!0,onChange:de,tabIndex:-1,disabled:g,className:Xe.nativeInput,autoFocus:a,required:H,...j,ownerState:Wt}),I.jsx(HD,{as:v,className:Xe.icon,ownerState:Wt}),I.jsx(PD,{id:`menu-${P||""}`,anchorEl:ve,open:Ce,onClose:xe,anchorOrigin:{vertical:"bottom",horizontal:"center"},transformOrigin:{vertical:"top",horizontal:"center"},...T,MenuListProps:{"aria-labelledby":w,role:"listbox","aria-multiselectable":R?"true":void 0,disableListWrap:!0,id:un,...T.MenuListProps},slotProps:{...T.slotProps,paper:{...On,style:{minWidth:Tt,...On!=null?On.style:null}}},children:ht})]})}),QD=e=>{const{classes:t}=e;return t},Ip={name:"MuiSelect",overridesResolver:(e,t)=>t.root,shouldForwardProp:e=>Xn(e)&&e!=="variant",slot:"Root"},XD=ie(Mp,Ip)(""),ZD=ie(Ep,Ip)(""),JD=ie(Pp,Ip)(""),lb=k.forwardRef(function(t,r){const o=et({name:"MuiSelect",props:t}),{autoWidth:s=!1,children:a,classes:c={},className:u,defaultOpen:f=!1,displayEmpty:p=!1,IconComponent:h=kM,id:g,input:b,inputProps:S,label:v,labelId:x,MenuProps:w,multiple:T=!1,native:R=!1,onClose:P,onOpen:M,open:D,renderValue:$,SelectDisplayProps:O,variant:N="outlined",...U}=o,C=R?ND:GD,A=pr(),H=Yi({props:o,muiFormControl:A,states:["variant","error"]}),W=H.variant||N,V={...o,variant:W,classes:c},F=QD(V),{root:B,...Y}=F,j=b||{standard:I.jsx(XD,{ownerState:V}),outlined:I.jsx(ZD,{label:v,ownerState:V}),filled:I.jsx(JD,{ownerState:V})}[W],_=rt(r,Pa(j));return I.jsx(k.Fragment,{children:k.cloneElement(j,{inputComponent:C,inputProps:{children:a,error:H.error,IconComponent:h,variant:W,type:void 0,multiple:T,...R?{id:g}:{autoWidth:s,defaultOpen:f,displayEmpty:p,labelId:x,MenuProps:w,onClose:P,onOpen:M,open:D,renderValue:$,SelectDisplayProps:{id:g,...O}},...S,classes:S?on(Y,S.classes):Y,...b?b.props.inputProps:{}},...(T&&R||p)&&W==="outlined"?{notched:!0}:{},ref:_,className:Me(j.props.className,u,F.root),...!b&&{variant:W},...U})})});lb.muiName="Select";function eE(e){return Fe("MuiTab",e)}const jn=Ae("MuiTab",["root","labelIcon","textColorInherit","textColorPrimary","textColorSecondary","selected","disabled","fullWidth","wrapped","iconWrapper","icon"]),tE=e=>{const{classes:t,textColor:r,fullWidth:o,wrapped:s,icon:a,label:c,selected:u,disabled:f}=e,p={root:["root",a&&c&&"labelIcon",`textColor${Ee(r)}`,o&&"fullWidth",s&&"wrapped",u&&"selected",f&&"disabled"],icon:["iconWrapper","icon"]};return Le(p,eE,t)},nE=ie(go,{name:"MuiTab",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:r}=e;return[t.root,r.label&&r.icon&&t.labelIcon,t[`textColor${Ee(r.textColor)}`],r.fullWidth&&t.fullWidth,r.wrapped&&t.wrapped,{[`& .${jn.iconWrapper}`]:t.iconWrapper},{[`& .${jn.icon}`]:t.icon}]}})(st(({theme:e})=>({...e.typography.button,maxWidth:360,minWidth:90,position:"relative",minHeight:48,flexShrink:0,padding:"12px 16px",overflow:"hidden",whiteSpace:"normal",textAlign:"center",lineHeight:1.25,variants:[{props:({ownerState:t})=>t.label&&(t.iconPosition==="top"||t.iconPosition==="bottom"),style:{flexDirection:"column"}},{props:({ownerState:t})=>t.label&&t.iconPosition!=="top"&&t.iconPosition!=="bottom",style:{flexDirection:"row"}},{props:({ownerState:t})=>t.icon&&t.label,style:{minHeight:72,paddingTop:9,paddingBottom:9}},{props:({ownerState:t,iconPosition:r})=>t.icon&&t.label&&r==="top",style:{[`& > .${jn.icon}`]:{marginBottom:6}}},{props:({ownerState:t,iconPosition:r})=>t.icon&&t.label&&r==="bottom",style:{[`& > .${jn.icon}`]:{marginTop:6}}},{props:({ownerState:t,iconPosition:r})=>t.icon&&t.label&&r==="start",style:{[`& > .${jn.icon}`]:{marginRight:e.spacing(1)}}},{props:({ownerState:t,iconPosition:r})=>t.icon&&t.label&&r==="end",style:{[`& > .${jn.icon}`]:{marginLeft:e.spacing(1)}}},{props:{textColor:"inherit"},style:{color:"inherit",opacity:.6,[`&.${jn.selected}`]:{opacity:1},[`&.${jn.disabled}`]:{opacity:(e.vars||e).palette.action.disabledOpacity}}},{props:{textColor:"primary"},style:{color:(e.vars||e).palette.text.secondary,[`&.${jn.selected}`]:{color:(e.vars||e).palette.primary.main},[`&.${jn.disabled}`]:{color:(e.vars||e).palette.text.disabled}}},{props:{textColor:"secondary"},style:{color:(e.vars||e).palette.text.secondary,[`&.${jn.selected}`]:{color:(e.vars||e).palette.secondary.main},[`&.${jn.disabled}`]:{color:(e.vars||e).palette.text.disabled}}},{props:({ownerState:t})=>t.fullWidth,style:{flexShrink:1,flexGrow:1,flexBasis:0,maxWidth:"none"}},{props:({ownerState:t})=>t.wrapped,style:{fontSize:e.typography.pxToRem(12)}}]}))),Qy=k.forwardRef(function(t,r){const o=et({props:t,name:"MuiTab"}),{className:s,disabled:a=!1,disableFocusRipple:c=!1,fullWidth:u,icon:f,iconPosition:p="top",indicator:h,label:g,onChange:b,onClick:S,onFocus:v,selected:x,selectionFollowsFocus:w,textColor:T="inherit",value:R,wrapped:P=!1,...M}=o,D={...o,disabled:a,disableFocusRipple:c,selected:x,icon:!!f,iconPosition:p,label:!!g,fullWidth:u,textColor:T,wrapped:P},$=tE(D),O=f&&g&&k.isValidElement(f)?k.cloneElement(f,{className:Me($.icon,f.props.className)}):f,N=C=>{!x&&b&&b(C,R),S&&S(C)},U=C=>{w&&!x&&b&&b(C,R),v&&v(C)};return I.jsxs(nE,{focusRipple:!c,className:Me($.root,s),ref:r,role:"tab","aria-selected":x,disabled:a,onClick:N,onFocus:U,ownerState:D,tabIndex:x?0:-1,...M,children:[p==="top"||p==="start"?I.jsxs(k.Fragment,{children:[O,g]}):I.jsxs(k.Fragment,{children:[g,O]}),h]})}),rE=Zn(I.jsx("path",{d:"M15.41 16.09l-4.58-4.59 4.58-4.59L14 5.5l-6 6 6 6z"}),"KeyboardArrowLeft"),oE=Zn(I.jsx("path",{d:"M8.59 16.34l4.58-4.59-4.58-4.59L10 5.75l6 6-6 6z"}),"KeyboardArrowRight");function iE(e){return(1+Math.sin(Math.PI*e-Math.PI/2))/2}function sE(e,t,r,o={},s=()=>{}){const{ease:a=iE,duration:c=300}=o;let u=null;const f=t[e];let p=!1;const h=()=>{p=!0},g=b=>{if(p){s(new Error("Animation cancelled"));return}u===null&&(u=b);const S=Math.min(1,(b-u)/c);if(t[e]=a(S)*(r-f)+f,S>=1){requestAnimationFrame(()=>{s(null)});return}requestAnimationFrame(g)};return f===r?(s(new Error("Element already at target position")),h):(requestAnimationFrame(g),h)}const aE={width:99,height:99,position:"absolute",top:-9999,overflow:"scroll"};function lE(e){const{onChange:t,...r}=e,o=k.useRef(),s=k.useRef(null),a=()=>{o.current=s.current.offsetHeight-s.current.clientHeight};return Nt(()=>{const c=qc(()=>{const f=o.current;a(),f!==o.current&&t(o.current)}),u=ur(s.current);return u.addEventListener("resize",c),()=>{c.clear(),u.removeEventListener("resize",c)}},[t]),k.useEffect(()=>{a(),t(o.current)},[t]),I.jsx("div",{style:aE,...r,ref:s})}function cE(e){return Fe("MuiTabScrollButton",e)}const uE=Ae("MuiTabScrollButton",["root","vertical","horizontal","disabled"]),dE=e=>{const{classes:t,orientation:r,disabled:o}=e;return Le({root:["root",r,o&&"disabled"]},cE,t)},fE=ie(go,{name:"MuiTabScrollButton",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:r}=e;return[t.root,r.orientation&&t[r.orientation]]}})({width:40,flexShrink:0,opacity:.8,[`&.${uE.disabled}`]:{opacity:0},variants:[{props:{orientation:"vertical"},style:{width:"100%",height:40,"& svg":{transform:"var(--TabScrollButton-svgRotate)"}}}]}),pE=k.forwardRef(function(t,r){const o=et({props:t,name:"MuiTabScrollButton"}),{className:s,slots:a={},slotProps:c={},direction:u,orientation:f,disabled:p,...h}=o,g=an(),b={isRtl:g,...o},S=dE(b),v=a.StartScrollButtonIcon??rE,x=a.EndScrollButtonIcon??oE,w=Je({elementType:v,externalSlotProps:c.startScrollButtonIcon,additionalProps:{fontSize:"small"},ownerState:b}),T=Je({elementType:x,externalSlotProps:c.endScrollButtonIcon,additionalProps:{fontSize:"small"},ownerState:b});return I.jsx(fE,{component:"div",className:Me(S.root,s),ref:r,role:null,ownerState:b,tabIndex:null,...h,style:{...h.style,...f==="vertical"&&{"--TabScrollButton-svgRotate":`rotate(${g?-90:90}deg)`}},children:u==="left"?I.jsx(v,{...w}):I.jsx(x,{...T})})});function mE(e){return Fe("MuiTabs",e)}const lc=Ae("MuiTabs",["root","vertical","flexContainer","flexContainerVertical","centered","scroller","fixed","scrollableX","scrollableY","hideScrollbar","scrollButtons","scrollButtonsHideMobile","indicator"]),Xy=(e,t)=>e===t?e.firstChild:t&&t.nextElementSibling?t.nextElementSibling:e.firstChild,Zy=(e,t)=>e===t?e.lastChild:t&&t.previousElementSibling?t.previousElementSibling:e.lastChild,Xl=(e,t,r)=>{let o=!1,s=r(e,t);for(;s;){if(s===e.firstChild){if(o)return;o=!0}const a=s.disabled||s.getAttribute("aria-disabled")==="true";if(!s.hasAttribute("tabindex")||a)s=r(e,s);else{s.focus();return}}},hE=e=>{const{vertical:t,fixed:r,hideScrollbar:o,scrollableX:s,scrollableY:a,centered:c,scrollButtonsHideMobile:u,classes:f}=e;return Le({root:["root",t&&"vertical"],scroller:["scroller",r&&"fixed",o&&"hideScrollbar",s&&"scrollableX",a&&"scrollableY"],flexContainer:["flexContainer",t&&"flexContainerVertical",c&&"centered"],indicator:["indicator"],scrollButtons:["scrollButtons",u&&"scrollButtonsHideMobile"],scrollableX:[s&&"scrollableX"],hideScrollbar:[o&&"hideScrollbar"]},mE,f)},gE=ie("div",{name:"MuiTabs",slot:"Root",overridesResolver:(e,t)=>{const{ownerState:r}=e;return[{[`& .${lc.scrollButtons}`]:t.scrollButtons},{[`& .${lc.scrollButtons}`]:r.scrollButtonsHideMobile&&t.scrollButtonsHideMobile},t.root,r.vertical&&t.vertical]}})(st(({theme:e})=>({overflow:"hidden",minHeight:48,WebkitOverflowScrolling:"touch",display:"flex",variants:[{props:({ownerState:t})=>t.vertical,style:{flexDirection:"column"}},{props:({ownerState:t})=>t.scrollButtonsHideMobile,style:{[`& .${lc.scrollButtons}`]:{[e.breakpoints.down("sm")]:{display:"none"}}}}]}))),yE=ie("div",{name:"MuiTabs",slot:"Scroller",overridesResolver:(e,t)=>{const{ownerState:r}=e;return[t.scroller,r.fixed&&t.fixed,r.hideScrollbar&&t.hideScrollbar,r.scrollableX&&t.scrollableX,r.scrollableY&&t.scrollableY]}})({position:"relative",display:"inline-block",flex:"1 1 auto",whiteSpace:"nowrap",variants:[{props:({ownerState:e})=>e.fixed,style:{overflowX:"hidden",width:"100%"}},{props:({ownerState:e})=>e.hideScrollbar,style:{scrollbarWidth:"none","&::-webkit-scrollbar":{display:"none"}}},{props:({ownerState:e})=>e.scrollableX,style:{overflowX:"auto",overflowY:"hidden"}},{props:({ownerState:e})=>e.scrollableY,style:{overflowY:"auto",overflowX:"hidden"}}]}),vE=ie("div",{name:"MuiTabs",slot:"FlexContainer",overridesResolver:(e,t)=>{const{ownerState:r}=e;return[t.flexContainer,r.vertical&&t.flexContainerVertical,r.centered&&t.centered]}})({display:"flex",variants:[{props:({ownerState:e})=>e.vertical,style:{flexDirection:"column"}},{props:({ownerState:e})=>e.centered,style:{justifyContent:"center"}}]}),bE=ie("span",{name:"MuiTabs",slot:"Indicator",overridesResolver:(e,t)=>t.indicator})(st(({theme:e})=>({position:"absolute",height:2,bottom:0,width:"100%",transition:e.transitions.create(),variants:[{props:{indicatorColor:"primary"},style:{backgroundColor:(e.vars||e).palette.primary.main}},{props:{indicatorColor:"secondary"},style:{backgroundColor:(e.vars||e).palette.secondary.main}},{props:({ownerState:t})=>t.vertical,style:{height:"100%",width:2,right:0}}]}))),xE=ie(lE)({overflowX:"auto",overflowY:"hidden",scrollbarWidth:"none","&::-webkit-scrollbar":{display:"none"}}),Jy={},wE=k.forwardRef(function(t,r){const o=et({props:t,name:"MuiTabs"}),s=Ko(),a=an(),{"aria-label":c,"aria-labelledby":u,action:f,centered:p=!1,children:h,className:g,component:b="div",allowScrollButtonsMobile:S=!1,indicatorColor:v="primary",onChange:x,orientation:w="horizontal",ScrollButtonComponent:T=pE,scrollButtons:R="auto",selectionFollowsFocus:P,slots:M={},slotProps:D={},TabIndicatorProps:$={},TabScrollButtonProps:O={},textColor:N="primary",value:U,variant:C="standard",visibleScrollbar:A=!1,...H}=o,W=C==="scrollable",V=w==="vertical",F=V?"scrollTop":"scrollLeft",B=V?"top":"left",Y=V?"bottom":"right",j=V?"clientHeight":"clientWidth",_=V?"height":"width",q={...o,component:b,allowScrollButtonsMobile:S,indicatorColor:v,orientation:w,vertical:V,scrollButtons:R,textColor:N,variant:C,visibleScrollbar:A,fixed:!W,hideScrollbar:W&&!A,scrollableX:W&&!V,scrollableY:W&&V,centered:p&&!W,scrollButtonsHideMobile:!S},L=hE(q),Q=Je({elementType:M.StartScrollButtonIcon,externalSlotProps:D.startScrollButtonIcon,ownerState:q}),te=Je({elementType:M.EndScrollButtonIcon,externalSlotProps:D.endScrollButtonIcon,ownerState:q}),[ae,Z]=k.useState(!1),[le,ue]=k.useState(Jy),[J,ne]=k.useState(!1),[fe,be]=k.useState(!1),[ve,ee]=k.useState(!1),[me,xe]=k.useState({overflow:"hidden",scrollbarWidth:0}),he=new Map,de=k.useRef(null),ge=k.useRef(null),we=()=>{const Se=de.current;let De;if(Se){const qe=Se.getBoundingClientRect();De={clientWidth:Se.clientWidth,scrollLeft:Se.scrollLeft,scrollTop:Se.scrollTop,scrollWidth:Se.scrollWidth,top:qe.top,bottom:qe.bottom,left:qe.left,right:qe.right}}let _e;if(Se&&U!==!1){const qe=ge.current.children;if(qe.length>0){const Ue=qe[he.get(U)];_e=Ue?Ue.getBoundingClientRect():null}}return{tabsMeta:De,tabMeta:_e}},Ce=$e(()=>{const{tabsMeta:Se,tabMeta:De}=we();let _e=0,qe;V?(qe="top",De&&Se&&(_e=De.top-Se.top+Se.scrollTop)):(qe=a?"right":"left",De&&Se&&(_e=(a?-1:1)*(De[qe]-Se[qe]+Se.scrollLeft)));const Ue={[qe]:_e,[_]:De?De[_]:0};if(typeof le[qe]!="number"||typeof le[_]!="number")ue(Ue);else{const bt=Math.abs(le[qe]-Ue[qe]),Bt=Math.abs(le[_]-Ue[_]);(bt>=1||Bt>=1)&&ue(Ue)}}),Ie=(Se,{animation:De=!0}={})=>{De?sE(F,de.current,Se,{duration:s.transitions.duration.standard}):de.current[F]=Se},Oe=Se=>{let De=de.current[F];V?De+=Se:De+=Se*(a?-1:1),Ie(De)},mt=()=>{const Se=de.current[j];let De=0;const _e=Array.from(ge.current.children);for(let qe=0;qe<_e.length;qe+=1){const Ue=_e[qe];if(De+Ue[j]>Se){qe===0&&(De=Se);break}De+=Ue[j]}return De},lt=()=>{Oe(-1*mt())},tt=()=>{Oe(mt())},ht=k.useCallback(Se=>{xe({overflow:null,scrollbarWidth:Se})},[]),Tt=()=>{const Se={};Se.scrollbarSizeListener=W?I.jsx(xE,{onChange:ht,className:Me(L.scrollableX,L.hideScrollbar)}):null;const _e=W&&(R==="auto"&&(J||fe)||R===!0);return Se.scrollButtonStart=_e?I.jsx(T,{slots:{StartScrollButtonIcon:M.StartScrollButtonIcon},slotProps:{startScrollButtonIcon:Q},orientation:w,direction:a?"right":"left",onClick:lt,disabled:!J,...O,className:Me(L.scrollButtons,O.className)}):null,Se.scrollButtonEnd=_e?I.jsx(T,{slots:{EndScrollButtonIcon:M.EndScrollButtonIcon},slotProps:{endScrollButtonIcon:te},orientation:w,direction:a?"left":"right",onClick:tt,disabled:!fe,...O,className:Me(L.scrollButtons,O.className)}):null,Se},Rt=$e(Se=>{const{tabsMeta:De,tabMeta:_e}=we();if(!(!_e||!De)){if(_e[B]<De[B]){const qe=De[F]+(_e[B]-De[B]);Ie(qe,{animation:Se})}else if(_e[Y]>De[Y]){const qe=De[F]+(_e[Y]-De[Y]);Ie(qe,{animation:Se})}}}),Xt=$e(()=>{W&&R!==!1&&ee(!ve)});k.useEffect(()=>{const Se=qc(()=>{de.current&&Ce()});let De;const _e=bt=>{bt.forEach(Bt=>{Bt.removedNodes.forEach(Ot=>{De==null||De.unobserve(Ot)}),Bt.addedNodes.forEach(Ot=>{De==null||De.observe(Ot)})}),Se(),Xt()},qe=ur(de.current);qe.addEventListener("resize",Se);let Ue;return typeof ResizeObserver<"u"&&(De=new ResizeObserver(Se),Array.from(ge.current.children).forEach(bt=>{De.observe(bt)})),typeof MutationObserver<"u"&&(Ue=new MutationObserver(_e),Ue.observe(ge.current,{childList:!0})),()=>{Se.clear(),qe.removeEventListener("resize",Se),Ue==null||Ue.disconnect(),De==null||De.disconnect()}},[Ce,Xt]),k.useEffect(()=>{const Se=Array.from(ge.current.children),De=Se.length;if(typeof IntersectionObserver<"u"&&De>0&&W&&R!==!1){const _e=Se[0],qe=Se[De-1],Ue={root:de.current,threshold:.99},bt=Qo=>{ne(!Qo[0].isIntersecting)},Bt=new IntersectionObserver(bt,Ue);Bt.observe(_e);const Ot=Qo=>{be(!Qo[0].isIntersecting)},Xi=new IntersectionObserver(Ot,Ue);return Xi.observe(qe),()=>{Bt.disconnect(),Xi.disconnect()}}},[W,R,ve,h==null?void 0:h.length]),k.useEffect(()=>{Z(!0)},[]),k.useEffect(()=>{Ce()}),k.useEffect(()=>{Rt(Jy!==le)},[Rt,le]),k.useImperativeHandle(f,()=>({updateIndicator:Ce,updateScrollButtons:Xt}),[Ce,Xt]);const Wt=I.jsx(bE,{...$,className:Me(L.indicator,$.className),ownerState:q,style:{...le,...$.style}});let Xe=0;const On=k.Children.map(h,Se=>{if(!k.isValidElement(Se))return null;const De=Se.props.value===void 0?Xe:Se.props.value;he.set(De,Xe);const _e=De===U;return Xe+=1,k.cloneElement(Se,{fullWidth:C==="fullWidth",indicator:_e&&!ae&&Wt,selected:_e,selectionFollowsFocus:P,onChange:x,textColor:N,value:De,...Xe===1&&U===!1&&!Se.props.tabIndex?{tabIndex:0}:{}})}),un=Se=>{const De=ge.current,_e=Qt(De).activeElement;if(_e.getAttribute("role")!=="tab")return;let Ue=w==="horizontal"?"ArrowLeft":"ArrowUp",bt=w==="horizontal"?"ArrowRight":"ArrowDown";switch(w==="horizontal"&&a&&(Ue="ArrowRight",bt="ArrowLeft"),Se.key){case Ue:Se.preventDefault(),Xl(De,_e,Zy);break;case bt:Se.preventDefault(),Xl(De,_e,Xy);break;case"Home":Se.preventDefault(),Xl(De,null,Xy);break;case"End":Se.preventDefault(),Xl(De,null,Zy);break}},$n=Tt();return I.jsxs(gE,{className:Me(L.root,g),ownerState:q,ref:r,as:b,...H,children:[$n.scrollButtonStart,$n.scrollbarSizeListener,I.jsxs(yE,{className:L.scroller,ownerState:q,style:{overflow:me.overflow,[V?`margin${a?"Left":"Right"}`:"marginBottom"]:A?void 0:-me.scrollbarWidth},ref:de,children:[I.jsx(vE,{"aria-label":c,"aria-labelledby":u,"aria-orientation":w==="vertical"?"vertical":null,className:L.flexContainer,ownerState:q,onKeyDown:un,ref:ge,role:"tablist",children:On}),ae&&Wt]}),$n.scrollButtonEnd]})});function SE(e){return Fe("MuiTextField",e)}Ae("MuiTextField",["root"]);const CE={standard:Mp,filled:Pp,outlined:Ep},kE=e=>{const{classes:t}=e;return Le({root:["root"]},SE,t)},TE=ie(Q0,{name:"MuiTextField",slot:"Root",overridesResolver:(e,t)=>t.root})({}),Xs=k.forwardRef(function(t,r){const o=et({props:t,name:"MuiTextField"}),{autoComplete:s,autoFocus:a=!1,children:c,className:u,color:f="primary",defaultValue:p,disabled:h=!1,error:g=!1,FormHelperTextProps:b,fullWidth:S=!1,helperText:v,id:x,InputLabelProps:w,inputProps:T,InputProps:R,inputRef:P,label:M,maxRows:D,minRows:$,multiline:O=!1,name:N,onBlur:U,onChange:C,onFocus:A,placeholder:H,required:W=!1,rows:V,select:F=!1,SelectProps:B,slots:Y={},slotProps:j={},type:_,value:q,variant:L="outlined",...Q}=o,te={...o,autoFocus:a,color:f,disabled:h,error:g,fullWidth:S,multiline:O,required:W,select:F,variant:L},ae=kE(te),Z=Yr(x),le=v&&Z?`${Z}-helper-text`:void 0,ue=M&&Z?`${Z}-label`:void 0,J=CE[L],ne={slots:Y,slotProps:{input:R,inputLabel:w,htmlInput:T,formHelperText:b,select:B,...j}},fe={},be=ne.slotProps.inputLabel;L==="outlined"&&(be&&typeof be.shrink<"u"&&(fe.notched=be.shrink),fe.label=M),F&&((!B||!B.native)&&(fe.id=void 0),fe["aria-describedby"]=void 0);const[ve,ee]=cr("input",{elementType:J,externalForwardedProps:ne,additionalProps:fe,ownerState:te}),[me,xe]=cr("inputLabel",{elementType:eb,externalForwardedProps:ne,ownerState:te}),[he,de]=cr("htmlInput",{elementType:"input",externalForwardedProps:ne,ownerState:te}),[ge,we]=cr("formHelperText",{elementType:X0,externalForwardedProps:ne,ownerState:te}),[Ce,Ie]=cr("select",{elementType:lb,externalForwardedProps:ne,ownerState:te}),Oe=I.jsx(ve,{"aria-describedby":le,autoComplete:s,autoFocus:a,defaultValue:p,fullWidth:S,multiline:O,name:N,rows:V,maxRows:D,minRows:$,type:_,value:q,id:Z,inputRef:P,onBlur:U,onChange:C,onFocus:A,placeholder:H,inputProps:de,slots:{input:Y.htmlInput?he:void 0},...ee});return I.jsxs(TE,{className:Me(ae.root,u),disabled:h,error:g,fullWidth:S,ref:r,required:W,color:f,variant:L,ownerState:te,...Q,children:[M!=null&&M!==""&&I.jsx(me,{htmlFor:Z,id:ue,...xe,children:M}),F?I.jsx(Ce,{"aria-describedby":le,id:Z,labelId:ue,value:q,input:Oe,...Ie,children:c}):Oe,v&&I.jsx(ge,{id:le,...we,children:v})]})}),PE=["localeText"],_f=k.createContext(null),cb=function(t){const{localeText:r}=t,o=We(t,PE),{utils:s,localeText:a}=k.useContext(_f)??{utils:void 0,localeText:void 0},c=ot({props:o,name:"MuiLocalizationProvider"}),{children:u,dateAdapter:f,dateFormats:p,dateLibInstance:h,adapterLocale:g,localeText:b}=c,S=k.useMemo(()=>K({},b,a,r),[b,a,r]),v=k.useMemo(()=>{if(!f)return s||null;const T=new f({locale:g,formats:p,instance:h});if(!T.isMUIAdapter)throw new Error(["MUI X: The date adapter should be imported from `@mui/x-date-pickers` or `@mui/x-date-pickers-pro`, not from `@date-io`","For example, `import { AdapterDayjs } from '@mui/x-date-pickers/AdapterDayjs'` instead of `import AdapterDayjs from '@date-io/dayjs'`","More information on the installation documentation: https://mui.com/x/react-date-pickers/getting-started/#installation"].join(`
-`));return T},[f,g,p,h,s]),x=k.useMemo(()=>v?{minDate:v.date("1900-01-01T00:00:00.000"),maxDate:v.date("2099-12-31T00:00:00.000")}:null,[v]),w=k.useMemo(()=>({utils:v,defaultDates:x,localeText:S}),[x,v,S]);return I.jsx(_f.Provider,{value:w,children:u})},Pr=(e,t)=>e.length!==t.length?!1:t.every(r=>e.includes(r)),ME=({openTo:e,defaultOpenTo:t,views:r,defaultViews:o})=>{const s=r??o;let a;if(e!=null)a=e;else if(s.includes(t))a=t;else if(s.length>0)a=s[0];else throw new Error("MUI X: The `views` prop must contain at least one view.");return{views:s,openTo:a}},Ec=(e,t,r)=>{let o=t;return o=e.setHours(o,e.getHours(r)),o=e.setMinutes(o,e.getMinutes(r)),o=e.setSeconds(o,e.getSeconds(r)),o=e.setMilliseconds(o,e.getMilliseconds(r)),o},sa=({date:e,disableFuture:t,disablePast:r,maxDate:o,minDate:s,isDateDisabled:a,utils:c,timezone:u})=>{const f=Ec(c,c.date(void 0,u),e);r&&c.isBefore(s,f)&&(s=f),t&&c.isAfter(o,f)&&(o=f);let p=e,h=e;for(c.isBefore(e,s)&&(p=s,h=null),c.isAfter(e,o)&&(h&&(h=o),p=null);p||h;){if(p&&c.isAfter(p,o)&&(p=null),h&&c.isBefore(h,s)&&(h=null),p){if(!a(p))return p;p=c.addDays(p,1)}if(h){if(!a(h))return h;h=c.addDays(h,-1)}}return null},RE=(e,t)=>t==null||!e.isValid(t)?null:t,Gn=(e,t,r)=>t==null||!e.isValid(t)?r:t,DE=(e,t,r)=>!e.isValid(t)&&t!=null&&!e.isValid(r)&&r!=null?!0:e.isEqual(t,r),Op=(e,t)=>{const o=[e.startOfYear(t)];for(;o.length<12;){const s=o[o.length-1];o.push(e.addMonths(s,1))}return o},$p=(e,t,r)=>r==="date"?e.startOfDay(e.date(void 0,t)):e.date(void 0,t),jr=(e,t)=>{const r=e.setHours(e.date(),t==="am"?2:14);return e.format(r,"meridiem")},EE=["year","month","day"],ji=e=>EE.includes(e),ev=(e,{format:t,views:r},o)=>{if(t!=null)return t;const s=e.formats;return Pr(r,["year"])?s.year:Pr(r,["month"])?s.month:Pr(r,["day"])?s.dayOfMonth:Pr(r,["month","year"])?`${s.month} ${s.year}`:Pr(r,["day","month"])?`${s.month} ${s.dayOfMonth}`:s.keyboardDate},IE=(e,t)=>{const r=e.startOfWeek(t);return[0,1,2,3,4,5,6].map(o=>e.addDays(r,o))},ub=["hours","minutes","seconds"],zi=e=>ub.includes(e),Zs=e=>ub.includes(e)||e==="meridiem",OE=(e,t)=>e?t.getHours(e)>=12?"pm":"am":null,ga=(e,t,r)=>r&&(e>=12?"pm":"am")!==t?t==="am"?e-12:e+12:e,$E=(e,t,r,o)=>{const s=ga(o.getHours(e),t,r);return o.setHours(e,s)},tv=(e,t)=>t.getHours(e)*3600+t.getMinutes(e)*60+t.getSeconds(e),Ea=(e,t)=>(r,o)=>e?t.isAfter(r,o):tv(r,t)>tv(o,t),nv=(e,{format:t,views:r,ampm:o})=>{if(t!=null)return t;const s=e.formats;return Pr(r,["hours"])?o?`${s.hours12h} ${s.meridiem}`:s.hours24h:Pr(r,["minutes"])?s.minutes:Pr(r,["seconds"])?s.seconds:Pr(r,["minutes","seconds"])?`${s.minutes}:${s.seconds}`:Pr(r,["hours","minutes","seconds"])?o?`${s.hours12h}:${s.minutes}:${s.seconds} ${s.meridiem}`:`${s.hours24h}:${s.minutes}:${s.seconds}`:o?`${s.hours12h}:${s.minutes} ${s.meridiem}`:`${s.hours24h}:${s.minutes}`},lr={year:1,month:2,day:3,hours:4,minutes:5,seconds:6,milliseconds:7},AE=e=>Math.max(...e.map(t=>lr[t.type]??1)),Ws=(e,t,r)=>{if(t===lr.year)return e.startOfYear(r);if(t===lr.month)return e.startOfMonth(r);if(t===lr.day)return e.startOfDay(r);let o=r;return t<lr.minutes&&(o=e.setMinutes(o,0)),t<lr.seconds&&(o=e.setSeconds(o,0)),t<lr.milliseconds&&(o=e.setMilliseconds(o,0)),o},NE=({props:e,utils:t,granularity:r,timezone:o,getTodayDate:s})=>{let a=s?s():Ws(t,r,$p(t,o));e.minDate!=null&&t.isAfterDay(e.minDate,a)&&(a=Ws(t,r,e.minDate)),e.maxDate!=null&&t.isBeforeDay(e.maxDate,a)&&(a=Ws(t,r,e.maxDate));const c=Ea(e.disableIgnoringDatePartForTimeValidation??!1,t);return e.minTime!=null&&c(e.minTime,a)&&(a=Ws(t,r,e.disableIgnoringDatePartForTimeValidation?e.minTime:Ec(t,a,e.minTime))),e.maxTime!=null&&c(a,e.maxTime)&&(a=Ws(t,r,e.disableIgnoringDatePartForTimeValidation?e.maxTime:Ec(t,a,e.maxTime))),a},db=(e,t)=>{const r=e.formatTokenMap[t];if(r==null)throw new Error([`MUI X: The token "${t}" is not supported by the Date and Time Pickers.`,"Please try using another token or open an issue on https://github.com/mui/mui-x/issues/new/choose if you think it should be supported."].join(`
-`));return typeof r=="string"?{type:r,contentType:r==="meridiem"?"letter":"digit",maxLength:void 0}:{type:r.sectionType,contentType:r.contentType,maxLength:r.maxLength}},LE=e=>{switch(e){case"ArrowUp":return 1;case"ArrowDown":return-1;case"PageUp":return 5;case"PageDown":return-5;default:return 0}},nu=(e,t)=>{const r=[],o=e.date(void 0,"default"),s=e.startOfWeek(o),a=e.endOfWeek(o);let c=s;for(;e.isBefore(c,a);)r.push(c),c=e.addDays(c,1);return r.map(u=>e.formatByString(u,t))},fb=(e,t,r,o)=>{switch(r){case"month":return Op(e,e.date(void 0,t)).map(s=>e.formatByString(s,o));case"weekDay":return nu(e,o);case"meridiem":{const s=e.date(void 0,t);return[e.startOfDay(s),e.endOfDay(s)].map(a=>e.formatByString(a,o))}default:return[]}},rv="s",FE=["0","1","2","3","4","5","6","7","8","9"],BE=e=>{const t=e.date(void 0);return e.formatByString(e.setSeconds(t,0),rv)==="0"?FE:Array.from({length:10}).map((o,s)=>e.formatByString(e.setSeconds(t,s),rv))},Ho=(e,t)=>{if(t[0]==="0")return e;const r=[];let o="";for(let s=0;s<e.length;s+=1){o+=e[s];const a=t.indexOf(o);a>-1&&(r.push(a.toString()),o="")}return r.join("")},Ap=(e,t)=>t[0]==="0"?e:e.split("").map(r=>t[Number(r)]).join(""),ov=(e,t)=>{const r=Ho(e,t);return r!==" "&&!Number.isNaN(Number(r))},pb=(e,t)=>{let r=e;for(r=Number(r).toString();r.length<t;)r=`0${r}`;return r},mb=(e,t,r,o,s)=>{if(s.type==="day"&&s.contentType==="digit-with-letter"){const c=e.setDate(r.longestMonth,t);return e.formatByString(c,s.format)}let a=t.toString();return s.hasLeadingZerosInInput&&(a=pb(a,s.maxLength)),Ap(a,o)},VE=(e,t,r,o,s,a,c,u)=>{const f=LE(o),p=o==="Home",h=o==="End",g=r.value===""||p||h,b=()=>{const v=s[r.type]({currentDate:c,format:r.format,contentType:r.contentType}),x=P=>mb(e,P,v,a,r),w=r.type==="minutes"&&(u!=null&&u.minutesStep)?u.minutesStep:1;let R=parseInt(Ho(r.value,a),10)+f*w;if(g){if(r.type==="year"&&!h&&!p)return e.formatByString(e.date(void 0,t),r.format);f>0||p?R=v.minimum:R=v.maximum}return R%w!==0&&((f<0||p)&&(R+=w-(w+R)%w),(f>0||h)&&(R-=R%w)),R>v.maximum?x(v.minimum+(R-v.maximum-1)%(v.maximum-v.minimum+1)):R<v.minimum?x(v.maximum-(v.minimum-R-1)%(v.maximum-v.minimum+1)):x(R)},S=()=>{const v=fb(e,t,r.type,r.format);if(v.length===0)return r.value;if(g)return f>0||p?v[0]:v[v.length-1];const T=((v.indexOf(r.value)+f)%v.length+v.length)%v.length;return v[T]};return r.contentType==="digit"||r.contentType==="digit-with-letter"?b():S()},Np=(e,t,r)=>{let o=e.value||e.placeholder;const s=t==="non-input"?e.hasLeadingZerosInFormat:e.hasLeadingZerosInInput;return t==="non-input"&&e.hasLeadingZerosInInput&&!e.hasLeadingZerosInFormat&&(o=Number(Ho(o,r)).toString()),["input-rtl","input-ltr"].includes(t)&&e.contentType==="digit"&&!s&&o.length===1&&(o=`${o}‎`),t==="input-rtl"&&(o=`⁨${o}⁩`),o},iv=(e,t,r,o)=>e.formatByString(e.parse(t,r),o),hb=(e,t)=>e.formatByString(e.date(void 0,"system"),t).length===4,gb=(e,t,r,o)=>{if(t!=="digit")return!1;const s=e.date(void 0,"default");switch(r){case"year":return hb(e,o)?e.formatByString(e.setYear(s,1),o)==="0001":e.formatByString(e.setYear(s,2001),o)==="01";case"month":return e.formatByString(e.startOfYear(s),o).length>1;case"day":return e.formatByString(e.startOfMonth(s),o).length>1;case"weekDay":return e.formatByString(e.startOfWeek(s),o).length>1;case"hours":return e.formatByString(e.setHours(s,1),o).length>1;case"minutes":return e.formatByString(e.setMinutes(s,1),o).length>1;case"seconds":return e.formatByString(e.setSeconds(s,1),o).length>1;default:throw new Error("Invalid section type")}},jE=(e,t,r)=>{const o=t.some(f=>f.type==="day"),s=[],a=[];for(let f=0;f<t.length;f+=1){const p=t[f];o&&p.type==="weekDay"||(s.push(p.format),a.push(Np(p,"non-input",r)))}const c=s.join(" "),u=a.join(" ");return e.parse(u,c)},zE=e=>e.map(t=>`${t.startSeparator}${t.value||t.placeholder}${t.endSeparator}`).join(""),_E=(e,t,r)=>{const s=e.map(a=>{const c=Np(a,r?"input-rtl":"input-ltr",t);return`${a.startSeparator}${c}${a.endSeparator}`}).join("");return r?`⁦${s}⁩`:s},WE=(e,t,r)=>{const o=e.date(void 0,r),s=e.endOfYear(o),a=e.endOfDay(o),{maxDaysInMonth:c,longestMonth:u}=Op(e,o).reduce((f,p)=>{const h=e.getDaysInMonth(p);return h>f.maxDaysInMonth?{maxDaysInMonth:h,longestMonth:p}:f},{maxDaysInMonth:0,longestMonth:null});return{year:({format:f})=>({minimum:0,maximum:hb(e,f)?9999:99}),month:()=>({minimum:1,maximum:e.getMonth(s)+1}),day:({currentDate:f})=>({minimum:1,maximum:f!=null&&e.isValid(f)?e.getDaysInMonth(f):c,longestMonth:u}),weekDay:({format:f,contentType:p})=>{if(p==="digit"){const h=nu(e,f).map(Number);return{minimum:Math.min(...h),maximum:Math.max(...h)}}return{minimum:1,maximum:7}},hours:({format:f})=>{const p=e.getHours(a);return Ho(e.formatByString(e.endOfDay(o),f),t)!==p.toString()?{minimum:1,maximum:Number(Ho(e.formatByString(e.startOfDay(o),f),t))}:{minimum:0,maximum:p}},minutes:()=>({minimum:0,maximum:e.getMinutes(a)}),seconds:()=>({minimum:0,maximum:e.getSeconds(a)}),meridiem:()=>({minimum:0,maximum:1}),empty:()=>({minimum:0,maximum:0})}},UE=(e,t,r,o)=>{switch(t.type){case"year":return e.setYear(o,e.getYear(r));case"month":return e.setMonth(o,e.getMonth(r));case"weekDay":{const s=nu(e,t.format),a=e.formatByString(r,t.format),c=s.indexOf(a),f=s.indexOf(t.value)-c;return e.addDays(r,f)}case"day":return e.setDate(o,e.getDate(r));case"meridiem":{const s=e.getHours(r)<12,a=e.getHours(o);return s&&a>=12?e.addHours(o,-12):!s&&a<12?e.addHours(o,12):o}case"hours":return e.setHours(o,e.getHours(r));case"minutes":return e.setMinutes(o,e.getMinutes(r));case"seconds":return e.setSeconds(o,e.getSeconds(r));default:return o}},sv={year:1,month:2,day:3,weekDay:4,hours:5,minutes:6,seconds:7,meridiem:8,empty:9},av=(e,t,r,o,s)=>[...r].sort((a,c)=>sv[a.type]-sv[c.type]).reduce((a,c)=>!s||c.modified?UE(e,c,t,a):a,o),HE=()=>navigator.userAgent.toLowerCase().includes("android"),YE=(e,t)=>{const r={};if(!t)return e.forEach((f,p)=>{const h=p===0?null:p-1,g=p===e.length-1?null:p+1;r[p]={leftIndex:h,rightIndex:g}}),{neighbors:r,startIndex:0,endIndex:e.length-1};const o={},s={};let a=0,c=0,u=e.length-1;for(;u>=0;){c=e.findIndex((f,p)=>{var h;return p>=a&&((h=f.endSeparator)==null?void 0:h.includes(" "))&&f.endSeparator!==" / "}),c===-1&&(c=e.length-1);for(let f=c;f>=a;f-=1)s[f]=u,o[u]=f,u-=1;a=c+1}return e.forEach((f,p)=>{const h=s[p],g=h===0?null:o[h-1],b=h===e.length-1?null:o[h+1];r[p]={leftIndex:g,rightIndex:b}}),{neighbors:r,startIndex:o[0],endIndex:o[e.length-1]}},Wf=(e,t)=>{if(e==null)return null;if(e==="all")return"all";if(typeof e=="string"){const r=t.findIndex(o=>o.type===e);return r===-1?null:r}return e},KE=(e,t)=>{if(e.value)switch(e.type){case"month":{if(e.contentType==="digit")return t.format(t.setMonth(t.date(),Number(e.value)-1),"month");const r=t.parse(e.value,e.format);return r?t.format(r,"month"):void 0}case"day":return e.contentType==="digit"?t.format(t.setDate(t.startOfYear(t.date()),Number(e.value)),"dayOfMonthFull"):e.value;case"weekDay":return;default:return}},qE=(e,t)=>{if(e.value)switch(e.type){case"weekDay":return e.contentType==="letter"?void 0:Number(e.value);case"meridiem":{const r=t.parse(`01:00 ${e.value}`,`${t.formats.hours12h}:${t.formats.minutes} ${e.format}`);return r?t.getHours(r)>=12?1:0:void 0}case"day":return e.contentType==="digit-with-letter"?parseInt(e.value,10):Number(e.value);case"month":{if(e.contentType==="digit")return Number(e.value);const r=t.parse(e.value,e.format);return r?t.getMonth(r)+1:void 0}default:return e.contentType!=="letter"?Number(e.value):void 0}},GE=["value","referenceDate"],sn={emptyValue:null,getTodayValue:$p,getInitialReferenceValue:e=>{let{value:t,referenceDate:r}=e,o=We(e,GE);return t!=null&&o.utils.isValid(t)?t:r??NE(o)},cleanValue:RE,areValuesEqual:DE,isSameError:(e,t)=>e===t,hasError:e=>e!=null,defaultErrorState:null,getTimezone:(e,t)=>t==null||!e.isValid(t)?null:e.getTimezone(t),setTimezone:(e,t,r)=>r==null?null:e.setTimezone(r,t)},QE={updateReferenceValue:(e,t,r)=>t==null||!e.isValid(t)?r:t,getSectionsFromValue:(e,t,r,o)=>!e.isValid(t)&&!!r?r:o(t),getV7HiddenInputValueFromSections:zE,getV6InputValueFromSections:_E,getActiveDateManager:(e,t)=>({date:t.value,referenceDate:t.referenceValue,getSections:r=>r,getNewValuesFromNewActiveDate:r=>({value:r,referenceValue:r==null||!e.isValid(r)?t.referenceValue:r})}),parseValueStr:(e,t,r)=>r(e.trim(),t)},Lp=({props:e,value:t,timezone:r,adapter:o})=>{if(t===null)return null;const{shouldDisableDate:s,shouldDisableMonth:a,shouldDisableYear:c,disablePast:u,disableFuture:f}=e,p=o.utils.date(void 0,r),h=Gn(o.utils,e.minDate,o.defaultDates.minDate),g=Gn(o.utils,e.maxDate,o.defaultDates.maxDate);switch(!0){case!o.utils.isValid(t):return"invalidDate";case!!(s&&s(t)):return"shouldDisableDate";case!!(a&&a(t)):return"shouldDisableMonth";case!!(c&&c(t)):return"shouldDisableYear";case!!(f&&o.utils.isAfterDay(t,p)):return"disableFuture";case!!(u&&o.utils.isBeforeDay(t,p)):return"disablePast";case!!(h&&o.utils.isBeforeDay(t,h)):return"minDate";case!!(g&&o.utils.isAfterDay(t,g)):return"maxDate";default:return null}};Lp.valueManager=sn;const yb=({adapter:e,value:t,timezone:r,props:o})=>{if(t===null)return null;const{minTime:s,maxTime:a,minutesStep:c,shouldDisableTime:u,disableIgnoringDatePartForTimeValidation:f=!1,disablePast:p,disableFuture:h}=o,g=e.utils.date(void 0,r),b=Ea(f,e.utils);switch(!0){case!e.utils.isValid(t):return"invalidDate";case!!(s&&b(s,t)):return"minTime";case!!(a&&b(t,a)):return"maxTime";case!!(h&&e.utils.isAfter(t,g)):return"disableFuture";case!!(p&&e.utils.isBefore(t,g)):return"disablePast";case!!(u&&u(t,"hours")):return"shouldDisableTime-hours";case!!(u&&u(t,"minutes")):return"shouldDisableTime-minutes";case!!(u&&u(t,"seconds")):return"shouldDisableTime-seconds";case!!(c&&e.utils.getMinutes(t)%c!==0):return"minutesStep";default:return null}};yb.valueManager=sn;const ru=({adapter:e,value:t,timezone:r,props:o})=>{const s=Lp({adapter:e,value:t,timezone:r,props:o});return s!==null?s:yb({adapter:e,value:t,timezone:r,props:o})};ru.valueManager=sn;const vb=["disablePast","disableFuture","minDate","maxDate","shouldDisableDate","shouldDisableMonth","shouldDisableYear"],bb=["disablePast","disableFuture","minTime","maxTime","shouldDisableTime","minutesStep","ampm","disableIgnoringDatePartForTimeValidation"],xb=["minDateTime","maxDateTime"],XE=[...vb,...bb,...xb],wb=e=>XE.reduce((t,r)=>(e.hasOwnProperty(r)&&(t[r]=e[r]),t),{}),ZE=e=>({components:{MuiLocalizationProvider:{defaultProps:{localeText:K({},e)}}}}),Sb=e=>{const{utils:t,formatKey:r,contextTranslation:o,propsTranslation:s}=e;return a=>{const c=a!==null&&t.isValid(a)?t.format(a,r):null;return(s??o)(a,t,c)}},Cb={previousMonth:"Previous month",nextMonth:"Next month",openPreviousView:"Open previous view",openNextView:"Open next view",calendarViewSwitchingButtonAriaLabel:e=>e==="year"?"year view is open, switch to calendar view":"calendar view is open, switch to year view",start:"Start",end:"End",startDate:"Start date",startTime:"Start time",endDate:"End date",endTime:"End time",cancelButtonLabel:"Cancel",clearButtonLabel:"Clear",okButtonLabel:"OK",todayButtonLabel:"Today",datePickerToolbarTitle:"Select date",dateTimePickerToolbarTitle:"Select date & time",timePickerToolbarTitle:"Select time",dateRangePickerToolbarTitle:"Select date range",clockLabelText:(e,t,r,o)=>`Select ${e}. ${!o&&(t===null||!r.isValid(t))?"No time selected":`Selected time is ${o??r.format(t,"fullTime")}`}`,hoursClockNumberText:e=>`${e} hours`,minutesClockNumberText:e=>`${e} minutes`,secondsClockNumberText:e=>`${e} seconds`,selectViewText:e=>`Select ${e}`,calendarWeekNumberHeaderLabel:"Week number",calendarWeekNumberHeaderText:"#",calendarWeekNumberAriaLabelText:e=>`Week ${e}`,calendarWeekNumberText:e=>`${e}`,openDatePickerDialogue:(e,t,r)=>r||e!==null&&t.isValid(e)?`Choose date, selected date is ${r??t.format(e,"fullDate")}`:"Choose date",openTimePickerDialogue:(e,t,r)=>r||e!==null&&t.isValid(e)?`Choose time, selected time is ${r??t.format(e,"fullTime")}`:"Choose time",fieldClearLabel:"Clear",timeTableLabel:"pick time",dateTableLabel:"pick date",fieldYearPlaceholder:e=>"Y".repeat(e.digitAmount),fieldMonthPlaceholder:e=>e.contentType==="letter"?"MMMM":"MM",fieldDayPlaceholder:()=>"DD",fieldWeekDayPlaceholder:e=>e.contentType==="letter"?"EEEE":"EE",fieldHoursPlaceholder:()=>"hh",fieldMinutesPlaceholder:()=>"mm",fieldSecondsPlaceholder:()=>"ss",fieldMeridiemPlaceholder:()=>"aa",year:"Year",month:"Month",day:"Day",weekDay:"Week day",hours:"Hours",minutes:"Minutes",seconds:"Seconds",meridiem:"Meridiem",empty:"Empty"},JE=Cb;ZE(Cb);const qo=()=>{const e=k.useContext(_f);if(e===null)throw new Error(["MUI X: Can not find the date and time pickers localization context.","It looks like you forgot to wrap your component in LocalizationProvider.","This can also happen if you are bundling multiple versions of the `@mui/x-date-pickers` package"].join(`
-`));if(e.utils===null)throw new Error(["MUI X: Can not find the date and time pickers adapter from its localization context.","It looks like you forgot to pass a `dateAdapter` to your LocalizationProvider."].join(`
-`));const t=k.useMemo(()=>K({},JE,e.localeText),[e.localeText]);return k.useMemo(()=>K({},e,{localeText:t}),[e,t])},ft=()=>qo().utils,Ia=()=>qo().defaultDates,Go=e=>{const t=ft(),r=k.useRef();return r.current===void 0&&(r.current=t.date(void 0,e)),r.current};function kb(e){const{props:t,validator:r,value:o,timezone:s,onError:a}=e,c=qo(),u=k.useRef(r.valueManager.defaultErrorState),f=r({adapter:c,value:o,timezone:s,props:t}),p=r.valueManager.hasError(f);k.useEffect(()=>{a&&!r.valueManager.isSameError(f,u.current)&&a(f,o),u.current=f},[r,a,f,o]);const h=$e(g=>r({adapter:c,value:g,timezone:s,props:t}));return{validationError:f,hasValidationError:p,getValidationErrorForNewValue:h}}const Sn=()=>qo().localeText,e2=({utils:e,format:t})=>{let r=10,o=t,s=e.expandFormat(t);for(;s!==o;)if(o=s,s=e.expandFormat(o),r-=1,r<0)throw new Error("MUI X: The format expansion seems to be in an infinite loop. Please open an issue with the format passed to the picker component.");return s},t2=({utils:e,expandedFormat:t})=>{const r=[],{start:o,end:s}=e.escapedCharacters,a=new RegExp(`(\\${o}[^\\${s}]*\\${s})+`,"g");let c=null;for(;c=a.exec(t);)r.push({start:c.index,end:a.lastIndex-1});return r},n2=(e,t,r,o)=>{switch(r.type){case"year":return t.fieldYearPlaceholder({digitAmount:e.formatByString(e.date(void 0,"default"),o).length,format:o});case"month":return t.fieldMonthPlaceholder({contentType:r.contentType,format:o});case"day":return t.fieldDayPlaceholder({format:o});case"weekDay":return t.fieldWeekDayPlaceholder({contentType:r.contentType,format:o});case"hours":return t.fieldHoursPlaceholder({format:o});case"minutes":return t.fieldMinutesPlaceholder({format:o});case"seconds":return t.fieldSecondsPlaceholder({format:o});case"meridiem":return t.fieldMeridiemPlaceholder({format:o});default:return o}},r2=({utils:e,date:t,shouldRespectLeadingZeros:r,localeText:o,localizedDigits:s,now:a,token:c,startSeparator:u})=>{if(c==="")throw new Error("MUI X: Should not call `commitToken` with an empty token");const f=db(e,c),p=gb(e,f.contentType,f.type,c),h=r?p:f.contentType==="digit",g=t!=null&&e.isValid(t);let b=g?e.formatByString(t,c):"",S=null;if(h)if(p)S=b===""?e.formatByString(a,c).length:b.length;else{if(f.maxLength==null)throw new Error(`MUI X: The token ${c} should have a 'maxDigitNumber' property on it's adapter`);S=f.maxLength,g&&(b=Ap(pb(Ho(b,s),S),s))}return K({},f,{format:c,maxLength:S,value:b,placeholder:n2(e,o,f,c),hasLeadingZerosInFormat:p,hasLeadingZerosInInput:h,startSeparator:u,endSeparator:"",modified:!1})},o2=e=>{var S;const{utils:t,expandedFormat:r,escapedParts:o}=e,s=t.date(void 0),a=[];let c="";const u=Object.keys(t.formatTokenMap).sort((v,x)=>x.length-v.length),f=/^([a-zA-Z]+)/,p=new RegExp(`^(${u.join("|")})*$`),h=new RegExp(`^(${u.join("|")})`),g=v=>o.find(x=>x.start<=v&&x.end>=v);let b=0;for(;b<r.length;){const v=g(b),x=v!=null,w=(S=f.exec(r.slice(b)))==null?void 0:S[1];if(!x&&w!=null&&p.test(w)){let T=w;for(;T.length>0;){const R=h.exec(T)[1];T=T.slice(R.length),a.push(r2(K({},e,{now:s,token:R,startSeparator:c}))),c=""}b+=w.length}else{const T=r[b];x&&(v==null?void 0:v.start)===b||(v==null?void 0:v.end)===b||(a.length===0?c+=T:a[a.length-1].endSeparator+=T),b+=1}}return a.length===0&&c.length>0&&a.push({type:"empty",contentType:"letter",maxLength:null,format:"",value:"",placeholder:"",hasLeadingZerosInFormat:!1,hasLeadingZerosInInput:!1,startSeparator:c,endSeparator:"",modified:!1}),a},i2=({isRtl:e,formatDensity:t,sections:r})=>r.map(o=>{const s=a=>{let c=a;return e&&c!==null&&c.includes(" ")&&(c=`⁩${c}⁦`),t==="spacious"&&["/",".","-"].includes(c)&&(c=` ${c} `),c};return o.startSeparator=s(o.startSeparator),o.endSeparator=s(o.endSeparator),o}),lv=e=>{let t=e2(e);e.isRtl&&e.enableAccessibleFieldDOMStructure&&(t=t.split(" ").reverse().join(" "));const r=t2(K({},e,{expandedFormat:t})),o=o2(K({},e,{expandedFormat:t,escapedParts:r}));return i2(K({},e,{sections:o}))},Fp=({timezone:e,value:t,defaultValue:r,referenceDate:o,onChange:s,valueManager:a})=>{const c=ft(),u=k.useRef(r),f=t??u.current??a.emptyValue,p=k.useMemo(()=>a.getTimezone(c,f),[c,a,f]),h=$e(v=>p==null?v:a.setTimezone(c,p,v));let g;e?g=e:p?g=p:o?g=c.getTimezone(o):g="default";const b=k.useMemo(()=>a.setTimezone(c,g,f),[a,c,g,f]),S=$e((v,...x)=>{const w=h(v);s==null||s(w,...x)});return{value:b,handleValueChange:S,timezone:g}},qi=({name:e,timezone:t,value:r,defaultValue:o,referenceDate:s,onChange:a,valueManager:c})=>{const[u,f]=Ur({name:e,state:"value",controlled:r,default:o??c.emptyValue}),p=$e((h,...g)=>{f(h),a==null||a(h,...g)});return Fp({timezone:t,value:u,defaultValue:void 0,referenceDate:s,onChange:p,valueManager:c})},s2=e=>{const t=ft(),r=Sn(),o=qo(),s=an(),{valueManager:a,fieldValueManager:c,valueType:u,validator:f,internalProps:p,internalProps:{value:h,defaultValue:g,referenceDate:b,onChange:S,format:v,formatDensity:x="dense",selectedSections:w,onSelectedSectionsChange:T,shouldRespectLeadingZeros:R=!1,timezone:P,enableAccessibleFieldDOMStructure:M=!1}}=e,{timezone:D,value:$,handleValueChange:O}=Fp({timezone:P,value:h,defaultValue:g,referenceDate:b,onChange:S,valueManager:a}),N=k.useMemo(()=>BE(t),[t]),U=k.useMemo(()=>WE(t,N,D),[t,N,D]),C=k.useCallback((Z,le=null)=>c.getSectionsFromValue(t,Z,le,ue=>lv({utils:t,localeText:r,localizedDigits:N,format:v,date:ue,formatDensity:x,shouldRespectLeadingZeros:R,enableAccessibleFieldDOMStructure:M,isRtl:s})),[c,v,r,N,s,R,t,x,M]),[A,H]=k.useState(()=>{const Z=C($),le={sections:Z,value:$,referenceValue:a.emptyValue,tempValueStrAndroid:null},ue=AE(Z),J=a.getInitialReferenceValue({referenceDate:b,value:$,utils:t,props:p,granularity:ue,timezone:D});return K({},le,{referenceValue:J})}),[W,V]=Ur({controlled:w,default:null,name:"useField",state:"selectedSections"}),F=Z=>{V(Z),T==null||T(Z)},B=k.useMemo(()=>Wf(W,A.sections),[W,A.sections]),Y=B==="all"?0:B,j=({value:Z,referenceValue:le,sections:ue})=>{if(H(ne=>K({},ne,{sections:ue,value:Z,referenceValue:le,tempValueStrAndroid:null})),a.areValuesEqual(t,A.value,Z))return;const J={validationError:f({adapter:o,value:Z,timezone:D,props:p})};O(Z,J)},_=(Z,le)=>{const ue=[...A.sections];return ue[Z]=K({},ue[Z],{value:le,modified:!0}),ue},q=()=>{j({value:a.emptyValue,referenceValue:A.referenceValue,sections:C(a.emptyValue)})},L=()=>{if(Y==null)return;const Z=A.sections[Y],le=c.getActiveDateManager(t,A,Z),J=le.getSections(A.sections).filter(ve=>ve.value!=="").length===(Z.value===""?0:1),ne=_(Y,""),fe=J?null:t.getInvalidDate(),be=le.getNewValuesFromNewActiveDate(fe);j(K({},be,{sections:ne}))},Q=Z=>{const le=(ne,fe)=>{const be=t.parse(ne,v);if(be==null||!t.isValid(be))return null;const ve=lv({utils:t,localeText:r,localizedDigits:N,format:v,date:be,formatDensity:x,shouldRespectLeadingZeros:R,enableAccessibleFieldDOMStructure:M,isRtl:s});return av(t,be,ve,fe,!1)},ue=c.parseValueStr(Z,A.referenceValue,le),J=c.updateReferenceValue(t,ue,A.referenceValue);j({value:ue,referenceValue:J,sections:C(ue,A.sections)})},te=({activeSection:Z,newSectionValue:le,shouldGoToNextSection:ue})=>{ue&&Y<A.sections.length-1&&F(Y+1);const J=c.getActiveDateManager(t,A,Z),ne=_(Y,le),fe=J.getSections(ne),be=jE(t,fe,N);let ve,ee;if(be!=null&&t.isValid(be)){const me=av(t,be,fe,J.referenceDate,!0);ve=J.getNewValuesFromNewActiveDate(me),ee=!0}else ve=J.getNewValuesFromNewActiveDate(be),ee=(be!=null&&!t.isValid(be))!=(J.date!=null&&!t.isValid(J.date));return ee?j(K({},ve,{sections:ne})):H(me=>K({},me,ve,{sections:ne,tempValueStrAndroid:null}))},ae=Z=>H(le=>K({},le,{tempValueStrAndroid:Z}));return k.useEffect(()=>{const Z=C(A.value);H(le=>K({},le,{sections:Z}))},[v,t.locale,s]),k.useEffect(()=>{let Z;a.areValuesEqual(t,A.value,$)?Z=a.getTimezone(t,A.value)!==a.getTimezone(t,$):Z=!0,Z&&H(le=>K({},le,{value:$,referenceValue:c.updateReferenceValue(t,$,le.referenceValue),sections:C($)}))},[$]),{state:A,activeSectionIndex:Y,parsedSelectedSections:B,setSelectedSections:F,clearValue:q,clearActiveSection:L,updateSectionValue:te,updateValueFromValueStr:Q,setTempAndroidValueStr:ae,getSectionsFromValue:C,sectionsValueBoundaries:U,localizedDigits:N,timezone:D}},a2=5e3,Pi=e=>e.saveQuery!=null,l2=({sections:e,updateSectionValue:t,sectionsValueBoundaries:r,localizedDigits:o,setTempAndroidValueStr:s,timezone:a})=>{const c=ft(),[u,f]=k.useState(null),p=$e(()=>f(null));k.useEffect(()=>{var v;u!=null&&((v=e[u.sectionIndex])==null?void 0:v.type)!==u.sectionType&&p()},[e,u,p]),k.useEffect(()=>{if(u!=null){const v=setTimeout(()=>p(),a2);return()=>{clearTimeout(v)}}return()=>{}},[u,p]);const h=({keyPressed:v,sectionIndex:x},w,T)=>{const R=v.toLowerCase(),P=e[x];if(u!=null&&(!T||T(u.value))&&u.sectionIndex===x){const D=`${u.value}${R}`,$=w(D,P);if(!Pi($))return f({sectionIndex:x,value:D,sectionType:P.type}),$}const M=w(R,P);return Pi(M)&&!M.saveQuery?(p(),null):(f({sectionIndex:x,value:R,sectionType:P.type}),Pi(M)?null:M)},g=v=>{const x=(R,P,M)=>{const D=P.filter($=>$.toLowerCase().startsWith(M));return D.length===0?{saveQuery:!1}:{sectionValue:D[0],shouldGoToNextSection:D.length===1}},w=(R,P,M,D)=>{const $=O=>fb(c,a,P.type,O);if(P.contentType==="letter")return x(P.format,$(P.format),R);if(M&&D!=null&&db(c,M).contentType==="letter"){const O=$(M),N=x(M,O,R);return Pi(N)?{saveQuery:!1}:K({},N,{sectionValue:D(N.sectionValue,O)})}return{saveQuery:!1}};return h(v,(R,P)=>{switch(P.type){case"month":{const M=D=>iv(c,D,c.formats.month,P.format);return w(R,P,c.formats.month,M)}case"weekDay":{const M=(D,$)=>$.indexOf(D).toString();return w(R,P,c.formats.weekday,M)}case"meridiem":return w(R,P);default:return{saveQuery:!1}}})},b=v=>{const x=(T,R)=>{const P=Ho(T,o),M=Number(P),D=r[R.type]({currentDate:null,format:R.format,contentType:R.contentType});if(M>D.maximum)return{saveQuery:!1};if(M<D.minimum)return{saveQuery:!0};const $=M*10>D.maximum||P.length===D.maximum.toString().length;return{sectionValue:mb(c,M,D,o,R),shouldGoToNextSection:$}};return h(v,(T,R)=>{if(R.contentType==="digit"||R.contentType==="digit-with-letter")return x(T,R);if(R.type==="month"){const P=gb(c,"digit","month","MM"),M=x(T,{type:R.type,format:"MM",hasLeadingZerosInFormat:P,hasLeadingZerosInInput:!0,contentType:"digit",maxLength:2});if(Pi(M))return M;const D=iv(c,M.sectionValue,"MM",R.format);return K({},M,{sectionValue:D})}if(R.type==="weekDay"){const P=x(T,R);if(Pi(P))return P;const M=nu(c,R.format)[Number(P.sectionValue)-1];return K({},P,{sectionValue:M})}return{saveQuery:!1}},T=>ov(T,o))};return{applyCharacterEditing:$e(v=>{const x=e[v.sectionIndex],T=ov(v.keyPressed,o)?b(K({},v,{keyPressed:Ap(v.keyPressed,o)})):g(v);if(T==null){s(null);return}t({activeSection:x,newSectionValue:T.sectionValue,shouldGoToNextSection:T.shouldGoToNextSection})}),resetCharacterQuery:p}};function c2(e,t){return Array.isArray(t)?t.every(r=>e.indexOf(r)!==-1):e.indexOf(t)!==-1}const u2=(e,t)=>r=>{(r.key==="Enter"||r.key===" ")&&(e(r),r.preventDefault(),r.stopPropagation())},yn=(e=document)=>{const t=e.activeElement;return t?t.shadowRoot?yn(t.shadowRoot):t:null},Ic=e=>Array.from(e.children).indexOf(yn(document)),d2="@media (pointer: fine)",f2=e=>{const{internalProps:{disabled:t,readOnly:r=!1},forwardedProps:{sectionListRef:o,onBlur:s,onClick:a,onFocus:c,onInput:u,onPaste:f,focused:p,autoFocus:h=!1},fieldValueManager:g,applyCharacterEditing:b,resetCharacterQuery:S,setSelectedSections:v,parsedSelectedSections:x,state:w,clearActiveSection:T,clearValue:R,updateSectionValue:P,updateValueFromValueStr:M,sectionOrder:D,areAllSectionsEmpty:$,sectionsValueBoundaries:O}=e,N=k.useRef(null),U=rt(o,N),C=Sn(),A=ft(),H=Yr(),[W,V]=k.useState(!1),F=k.useMemo(()=>({syncSelectionToDOM:()=>{if(!N.current)return;const ee=document.getSelection();if(!ee)return;if(x==null){ee.rangeCount>0&&N.current.getRoot().contains(ee.getRangeAt(0).startContainer)&&ee.removeAllRanges(),W&&N.current.getRoot().blur();return}if(!N.current.getRoot().contains(yn(document)))return;const me=new window.Range;let xe;x==="all"?xe=N.current.getRoot():w.sections[x].type==="empty"?xe=N.current.getSectionContainer(x):xe=N.current.getSectionContent(x),me.selectNodeContents(xe),xe.focus(),ee.removeAllRanges(),ee.addRange(me)},getActiveSectionIndexFromDOM:()=>{const ee=yn(document);return!ee||!N.current||!N.current.getRoot().contains(ee)?null:N.current.getSectionIndexFromDOMElement(ee)},focusField:(ee=0)=>{if(!N.current)return;const me=Wf(ee,w.sections);V(!0),N.current.getSectionContent(me).focus()},setSelectedSections:ee=>{if(!N.current)return;const me=Wf(ee,w.sections);V((me==="all"?0:me)!==null),v(ee)},isFieldFocused:()=>{const ee=yn(document);return!!N.current&&N.current.getRoot().contains(ee)}}),[x,v,w.sections,W]),B=$e(ee=>{if(!N.current)return;const me=w.sections[ee];N.current.getSectionContent(ee).innerHTML=me.value||me.placeholder,F.syncSelectionToDOM()}),Y=$e((ee,...me)=>{ee.isDefaultPrevented()||!N.current||(V(!0),a==null||a(ee,...me),x==="all"?setTimeout(()=>{const xe=document.getSelection().getRangeAt(0).startOffset;if(xe===0){v(D.startIndex);return}let he=0,de=0;for(;de<xe&&he<w.sections.length;){const ge=w.sections[he];he+=1,de+=`${ge.startSeparator}${ge.value||ge.placeholder}${ge.endSeparator}`.length}v(he-1)}):W?N.current.getRoot().contains(ee.target)||v(D.startIndex):(V(!0),v(D.startIndex)))}),j=$e(ee=>{if(u==null||u(ee),!N.current||x!=="all")return;const xe=ee.target.textContent??"";N.current.getRoot().innerHTML=w.sections.map(he=>`${he.startSeparator}${he.value||he.placeholder}${he.endSeparator}`).join(""),F.syncSelectionToDOM(),xe.length===0||xe.charCodeAt(0)===10?(S(),R(),v("all")):xe.length>1?M(xe):b({keyPressed:xe,sectionIndex:0})}),_=$e(ee=>{if(f==null||f(ee),r||x!=="all"){ee.preventDefault();return}const me=ee.clipboardData.getData("text");ee.preventDefault(),S(),M(me)}),q=$e((...ee)=>{if(c==null||c(...ee),W||!N.current)return;V(!0),N.current.getSectionIndexFromDOMElement(yn(document))!=null||v(D.startIndex)}),L=$e((...ee)=>{s==null||s(...ee),setTimeout(()=>{if(!N.current)return;const me=yn(document);!N.current.getRoot().contains(me)&&(V(!1),v(null))})}),Q=$e(ee=>me=>{me.isDefaultPrevented()||v(ee)}),te=$e(ee=>{ee.preventDefault()}),ae=$e(ee=>()=>{v(ee)}),Z=$e(ee=>{if(ee.preventDefault(),r||t||typeof x!="number")return;const me=w.sections[x],xe=ee.clipboardData.getData("text"),he=/^[a-zA-Z]+$/.test(xe),de=/^[0-9]+$/.test(xe),ge=/^(([a-zA-Z]+)|)([0-9]+)(([a-zA-Z]+)|)$/.test(xe);me.contentType==="letter"&&he||me.contentType==="digit"&&de||me.contentType==="digit-with-letter"&&ge?(S(),P({activeSection:me,newSectionValue:xe,shouldGoToNextSection:!0})):!he&&!de&&(S(),M(xe))}),le=$e(ee=>{ee.preventDefault(),ee.dataTransfer.dropEffect="none"}),ue=$e(ee=>{if(!N.current)return;const me=ee.target,xe=me.textContent??"",he=N.current.getSectionIndexFromDOMElement(me),de=w.sections[he];if(r||!N.current){B(he);return}if(xe.length===0){if(de.value===""){B(he);return}const ge=ee.nativeEvent.inputType;if(ge==="insertParagraph"||ge==="insertLineBreak"){B(he);return}S(),T();return}b({keyPressed:xe,sectionIndex:he}),B(he)});Nt(()=>{if(!(!W||!N.current)){if(x==="all")N.current.getRoot().focus();else if(typeof x=="number"){const ee=N.current.getSectionContent(x);ee&&ee.focus()}}},[x,W]);const J=k.useMemo(()=>w.sections.reduce((ee,me)=>(ee[me.type]=O[me.type]({currentDate:null,contentType:me.contentType,format:me.format}),ee),{}),[O,w.sections]),ne=x==="all",fe=k.useMemo(()=>w.sections.map((ee,me)=>{const xe=!ne&&!t&&!r;return{container:{"data-sectionindex":me,onClick:Q(me)},content:{tabIndex:ne||me>0?-1:0,contentEditable:!ne&&!t&&!r,role:"spinbutton",id:`${H}-${ee.type}`,"aria-labelledby":`${H}-${ee.type}`,"aria-readonly":r,"aria-valuenow":qE(ee,A),"aria-valuemin":J[ee.type].minimum,"aria-valuemax":J[ee.type].maximum,"aria-valuetext":ee.value?KE(ee,A):C.empty,"aria-label":C[ee.type],"aria-disabled":t,spellCheck:xe?!1:void 0,autoCapitalize:xe?"off":void 0,autoCorrect:xe?"off":void 0,[parseInt(k.version,10)>=17?"enterKeyHint":"enterkeyhint"]:xe?"next":void 0,children:ee.value||ee.placeholder,onInput:ue,onPaste:Z,onFocus:ae(me),onDragOver:le,onMouseUp:te,inputMode:ee.contentType==="letter"?"text":"numeric"},before:{children:ee.startSeparator},after:{children:ee.endSeparator}}}),[w.sections,ae,Z,le,ue,Q,te,t,r,ne,C,A,J,H]),be=$e(ee=>{M(ee.target.value)}),ve=k.useMemo(()=>$?"":g.getV7HiddenInputValueFromSections(w.sections),[$,w.sections,g]);return k.useEffect(()=>{if(N.current==null)throw new Error(["MUI X: The `sectionListRef` prop has not been initialized by `PickersSectionList`","You probably tried to pass a component to the `textField` slot that contains an `<input />` element instead of a `PickersSectionList`.","","If you want to keep using an `<input />` HTML element for the editing, please remove the `enableAccessibleFieldDOMStructure` prop from your picker or field component:","","<DatePicker slots={{ textField: MyCustomTextField }} />","","Learn more about the field accessible DOM structure on the MUI documentation: https://mui.com/x/react-date-pickers/fields/#fields-to-edit-a-single-element"].join(`
-`));h&&N.current&&N.current.getSectionContent(D.startIndex).focus()},[]),{interactions:F,returnedValue:{autoFocus:h,readOnly:r,focused:p??W,sectionListRef:U,onBlur:L,onClick:Y,onFocus:q,onInput:j,onPaste:_,enableAccessibleFieldDOMStructure:!0,elements:fe,tabIndex:x===0?-1:0,contentEditable:ne,value:ve,onChange:be,areAllSectionsEmpty:$}}},Ri=e=>e.replace(/[\u2066\u2067\u2068\u2069]/g,""),p2=(e,t,r)=>{let o=0,s=r?1:0;const a=[];for(let c=0;c<e.length;c+=1){const u=e[c],f=Np(u,r?"input-rtl":"input-ltr",t),p=`${u.startSeparator}${f}${u.endSeparator}`,h=Ri(p).length,g=p.length,b=Ri(f),S=s+(b===""?0:f.indexOf(b[0]))+u.startSeparator.length,v=S+b.length;a.push(K({},u,{start:o,end:o+h,startInInput:S,endInInput:v})),o+=h,s+=g}return a},m2=e=>{const t=an(),r=k.useRef(),o=k.useRef(),{forwardedProps:{onFocus:s,onClick:a,onPaste:c,onBlur:u,inputRef:f,placeholder:p},internalProps:{readOnly:h=!1,disabled:g=!1},parsedSelectedSections:b,activeSectionIndex:S,state:v,fieldValueManager:x,valueManager:w,applyCharacterEditing:T,resetCharacterQuery:R,updateSectionValue:P,updateValueFromValueStr:M,clearActiveSection:D,clearValue:$,setTempAndroidValueStr:O,setSelectedSections:N,getSectionsFromValue:U,areAllSectionsEmpty:C,localizedDigits:A}=e,H=k.useRef(null),W=rt(f,H),V=k.useMemo(()=>p2(v.sections,A,t),[v.sections,A,t]),F=k.useMemo(()=>({syncSelectionToDOM:()=>{if(!H.current)return;if(b==null){H.current.scrollLeft&&(H.current.scrollLeft=0);return}if(H.current!==yn(document))return;const ue=H.current.scrollTop;if(b==="all")H.current.select();else{const J=V[b],ne=J.type==="empty"?J.startInInput-J.startSeparator.length:J.startInInput,fe=J.type==="empty"?J.endInInput+J.endSeparator.length:J.endInInput;(ne!==H.current.selectionStart||fe!==H.current.selectionEnd)&&H.current===yn(document)&&H.current.setSelectionRange(ne,fe),clearTimeout(o.current),o.current=setTimeout(()=>{H.current&&H.current===yn(document)&&H.current.selectionStart===H.current.selectionEnd&&(H.current.selectionStart!==ne||H.current.selectionEnd!==fe)&&F.syncSelectionToDOM()})}H.current.scrollTop=ue},getActiveSectionIndexFromDOM:()=>{const ue=H.current.selectionStart??0,J=H.current.selectionEnd??0;if(ue===0&&J===0)return null;const ne=ue<=V[0].startInInput?1:V.findIndex(fe=>fe.startInInput-fe.startSeparator.length>ue);return ne===-1?V.length-1:ne-1},focusField:(ue=0)=>{var J;(J=H.current)==null||J.focus(),N(ue)},setSelectedSections:ue=>N(ue),isFieldFocused:()=>H.current===yn(document)}),[H,b,V,N]),B=()=>{const ue=H.current.selectionStart??0;let J;ue<=V[0].startInInput||ue>=V[V.length-1].endInInput?J=1:J=V.findIndex(fe=>fe.startInInput-fe.startSeparator.length>ue);const ne=J===-1?V.length-1:J-1;N(ne)},Y=$e((...ue)=>{s==null||s(...ue);const J=H.current;clearTimeout(r.current),r.current=setTimeout(()=>{!J||J!==H.current||S==null&&(J.value.length&&Number(J.selectionEnd)-Number(J.selectionStart)===J.value.length?N("all"):B())})}),j=$e((ue,...J)=>{ue.isDefaultPrevented()||(a==null||a(ue,...J),B())}),_=$e(ue=>{if(c==null||c(ue),ue.preventDefault(),h||g)return;const J=ue.clipboardData.getData("text");if(typeof b=="number"){const ne=v.sections[b],fe=/^[a-zA-Z]+$/.test(J),be=/^[0-9]+$/.test(J),ve=/^(([a-zA-Z]+)|)([0-9]+)(([a-zA-Z]+)|)$/.test(J);if(ne.contentType==="letter"&&fe||ne.contentType==="digit"&&be||ne.contentType==="digit-with-letter"&&ve){R(),P({activeSection:ne,newSectionValue:J,shouldGoToNextSection:!0});return}if(fe||be)return}R(),M(J)}),q=$e((...ue)=>{u==null||u(...ue),N(null)}),L=$e(ue=>{if(h)return;const J=ue.target.value;if(J===""){R(),$();return}const ne=ue.nativeEvent.data,fe=ne&&ne.length>1,be=fe?ne:J,ve=Ri(be);if(S==null||fe){M(fe?ne:ve);return}let ee;if(b==="all"&&ve.length===1)ee=ve;else{const me=Ri(x.getV6InputValueFromSections(V,A,t));let xe=-1,he=-1;for(let Ce=0;Ce<me.length;Ce+=1)xe===-1&&me[Ce]!==ve[Ce]&&(xe=Ce),he===-1&&me[me.length-Ce-1]!==ve[ve.length-Ce-1]&&(he=Ce);const de=V[S];if(xe<de.start||me.length-he-1>de.end)return;const we=ve.length-me.length+de.end-Ri(de.endSeparator||"").length;ee=ve.slice(de.start+Ri(de.startSeparator||"").length,we)}if(ee.length===0){HE()&&O(be),R(),D();return}T({keyPressed:ee,sectionIndex:S})}),Q=k.useMemo(()=>p!==void 0?p:x.getV6InputValueFromSections(U(w.emptyValue),A,t),[p,x,U,w.emptyValue,A,t]),te=k.useMemo(()=>v.tempValueStrAndroid??x.getV6InputValueFromSections(v.sections,A,t),[v.sections,x,v.tempValueStrAndroid,A,t]);k.useEffect(()=>(H.current&&H.current===yn(document)&&N("all"),()=>{clearTimeout(r.current),clearTimeout(o.current)}),[]);const ae=k.useMemo(()=>S==null||v.sections[S].contentType==="letter"?"text":"numeric",[S,v.sections]),le=!(H.current&&H.current===yn(document))&&C;return{interactions:F,returnedValue:{readOnly:h,onBlur:q,onClick:j,onFocus:Y,onPaste:_,inputRef:W,enableAccessibleFieldDOMStructure:!1,placeholder:Q,inputMode:ae,autoComplete:"off",value:le?"":te,onChange:L}}},h2=e=>{const t=ft(),{internalProps:r,internalProps:{unstableFieldRef:o,minutesStep:s,enableAccessibleFieldDOMStructure:a=!1,disabled:c=!1,readOnly:u=!1},forwardedProps:{onKeyDown:f,error:p,clearable:h,onClear:g},fieldValueManager:b,valueManager:S,validator:v}=e,x=an(),w=s2(e),{state:T,activeSectionIndex:R,parsedSelectedSections:P,setSelectedSections:M,clearValue:D,clearActiveSection:$,updateSectionValue:O,setTempAndroidValueStr:N,sectionsValueBoundaries:U,localizedDigits:C,timezone:A}=w,H=l2({sections:T.sections,updateSectionValue:O,sectionsValueBoundaries:U,localizedDigits:C,setTempAndroidValueStr:N,timezone:A}),{resetCharacterQuery:W}=H,V=S.areValuesEqual(t,T.value,S.emptyValue),F=a?f2:m2,B=k.useMemo(()=>YE(T.sections,x&&!a),[T.sections,x,a]),{returnedValue:Y,interactions:j}=F(K({},e,w,H,{areAllSectionsEmpty:V,sectionOrder:B})),_=$e(Z=>{if(f==null||f(Z),!c)switch(!0){case((Z.ctrlKey||Z.metaKey)&&String.fromCharCode(Z.keyCode)==="A"&&!Z.shiftKey&&!Z.altKey):{Z.preventDefault(),M("all");break}case Z.key==="ArrowRight":{if(Z.preventDefault(),P==null)M(B.startIndex);else if(P==="all")M(B.endIndex);else{const le=B.neighbors[P].rightIndex;le!==null&&M(le)}break}case Z.key==="ArrowLeft":{if(Z.preventDefault(),P==null)M(B.endIndex);else if(P==="all")M(B.startIndex);else{const le=B.neighbors[P].leftIndex;le!==null&&M(le)}break}case Z.key==="Delete":{if(Z.preventDefault(),u)break;P==null||P==="all"?D():$(),W();break}case["ArrowUp","ArrowDown","Home","End","PageUp","PageDown"].includes(Z.key):{if(Z.preventDefault(),u||R==null)break;const le=T.sections[R],ue=b.getActiveDateManager(t,T,le),J=VE(t,A,le,Z.key,U,C,ue.date,{minutesStep:s});O({activeSection:le,newSectionValue:J,shouldGoToNextSection:!1});break}}});Nt(()=>{j.syncSelectionToDOM()});const{hasValidationError:q}=kb({props:r,validator:v,timezone:A,value:T.value,onError:r.onError}),L=k.useMemo(()=>p!==void 0?p:q,[q,p]);k.useEffect(()=>{!L&&R==null&&W()},[T.referenceValue,R,L]),k.useEffect(()=>{T.tempValueStrAndroid!=null&&R!=null&&(W(),$())},[T.sections]),k.useImperativeHandle(o,()=>({getSections:()=>T.sections,getActiveSectionIndex:j.getActiveSectionIndexFromDOM,setSelectedSections:j.setSelectedSections,focusField:j.focusField,isFieldFocused:j.isFieldFocused}));const Q=$e((Z,...le)=>{Z.preventDefault(),g==null||g(Z,...le),D(),j.isFieldFocused()?M(B.startIndex):j.focusField(0)}),te={onKeyDown:_,onClear:Q,error:L,clearable:!!(h&&!V&&!u&&!c)},ae={disabled:c,readOnly:u};return K({},e.forwardedProps,te,ae,Y)},g2=Zn(I.jsx("path",{d:"M7 10l5 5 5-5z"}),"ArrowDropDown"),y2=Zn(I.jsx("path",{d:"M15.41 16.59L10.83 12l4.58-4.59L14 6l-6 6 6 6 1.41-1.41z"}),"ArrowLeft"),v2=Zn(I.jsx("path",{d:"M8.59 16.59L13.17 12 8.59 7.41 10 6l6 6-6 6-1.41-1.41z"}),"ArrowRight"),b2=Zn(I.jsx("path",{d:"M17 12h-5v5h5v-5zM16 1v2H8V1H6v2H5c-1.11 0-1.99.9-1.99 2L3 19c0 1.1.89 2 2 2h14c1.1 0 2-.9 2-2V5c0-1.1-.9-2-2-2h-1V1h-2zm3 18H5V8h14v11z"}),"Calendar");Zn(I.jsxs(k.Fragment,{children:[I.jsx("path",{d:"M11.99 2C6.47 2 2 6.48 2 12s4.47 10 9.99 10C17.52 22 22 17.52 22 12S17.52 2 11.99 2zM12 20c-4.42 0-8-3.58-8-8s3.58-8 8-8 8 3.58 8 8-3.58 8-8 8z"}),I.jsx("path",{d:"M12.5 7H11v6l5.25 3.15.75-1.23-4.5-2.67z"})]}),"Clock");const x2=Zn(I.jsx("path",{d:"M9 11H7v2h2v-2zm4 0h-2v2h2v-2zm4 0h-2v2h2v-2zm2-7h-1V2h-2v2H8V2H6v2H5c-1.11 0-1.99.9-1.99 2L3 20c0 1.1.89 2 2 2h14c1.1 0 2-.9 2-2V6c0-1.1-.9-2-2-2zm0 16H5V9h14v11z"}),"DateRange"),w2=Zn(I.jsxs(k.Fragment,{children:[I.jsx("path",{d:"M11.99 2C6.47 2 2 6.48 2 12s4.47 10 9.99 10C17.52 22 22 17.52 22 12S17.52 2 11.99 2zM12 20c-4.42 0-8-3.58-8-8s3.58-8 8-8 8 3.58 8 8-3.58 8-8 8z"}),I.jsx("path",{d:"M12.5 7H11v6l5.25 3.15.75-1.23-4.5-2.67z"})]}),"Time"),S2=Zn(I.jsx("path",{d:"M19 6.41 17.59 5 12 10.59 6.41 5 5 6.41 10.59 12 5 17.59 6.41 19 12 13.41 17.59 19 19 17.59 13.41 12z"}),"Clear"),C2=["clearable","onClear","InputProps","sx","slots","slotProps"],k2=["ownerState"],T2=e=>{const t=Sn(),{clearable:r,onClear:o,InputProps:s,sx:a,slots:c,slotProps:u}=e,f=We(e,C2),p=(c==null?void 0:c.clearButton)??Hi,h=Je({elementType:p,externalSlotProps:u==null?void 0:u.clearButton,ownerState:{},className:"clearButton",additionalProps:{title:t.fieldClearLabel}}),g=We(h,k2),b=(c==null?void 0:c.clearIcon)??S2,S=Je({elementType:b,externalSlotProps:u==null?void 0:u.clearIcon,ownerState:{}});return K({},f,{InputProps:K({},s,{endAdornment:I.jsxs(k.Fragment,{children:[r&&I.jsx(J0,{position:"end",sx:{marginRight:s!=null&&s.endAdornment?-1:-1.5},children:I.jsx(p,K({},g,{onClick:o,children:I.jsx(b,K({fontSize:"small"},S))}))}),s==null?void 0:s.endAdornment]})}),sx:[{"& .clearButton":{opacity:1},"@media (pointer: fine)":{"& .clearButton":{opacity:0},"&:hover, &:focus-within":{".clearButton":{opacity:1}}}},...Array.isArray(a)?a:[a]]})},P2=["value","defaultValue","referenceDate","format","formatDensity","onChange","timezone","onError","shouldRespectLeadingZeros","selectedSections","onSelectedSectionsChange","unstableFieldRef","enableAccessibleFieldDOMStructure","disabled","readOnly","dateSeparator"],M2=(e,t)=>k.useMemo(()=>{const r=K({},e),o={},s=a=>{r.hasOwnProperty(a)&&(o[a]=r[a],delete r[a])};return P2.forEach(s),vb.forEach(s),bb.forEach(s),xb.forEach(s),{forwardedProps:r,internalProps:o}},[e,t]),R2=k.createContext(null);function Tb(e){const{contextValue:t,localeText:r,children:o}=e;return I.jsx(R2.Provider,{value:t,children:I.jsx(cb,{localeText:r,children:o})})}const D2=e=>{const t=ft(),r=Ia(),s=e.ampm??t.is12HourCycleInCurrentLocale()?t.formats.keyboardDateTime12h:t.formats.keyboardDateTime24h;return K({},e,{disablePast:e.disablePast??!1,disableFuture:e.disableFuture??!1,format:e.format??s,disableIgnoringDatePartForTimeValidation:!!(e.minDateTime||e.maxDateTime),minDate:Gn(t,e.minDateTime??e.minDate,r.minDate),maxDate:Gn(t,e.maxDateTime??e.maxDate,r.maxDate),minTime:e.minDateTime??e.minTime,maxTime:e.maxDateTime??e.maxTime})},E2=e=>{const t=D2(e),{forwardedProps:r,internalProps:o}=M2(t,"date-time");return h2({forwardedProps:r,internalProps:o,valueManager:sn,fieldValueManager:QE,validator:ru,valueType:"date-time"})};function I2(e){return Fe("MuiPickersTextField",e)}Ae("MuiPickersTextField",["root","focused","disabled","error","required"]);function O2(e){return Fe("MuiPickersInputBase",e)}const Ii=Ae("MuiPickersInputBase",["root","focused","disabled","error","notchedOutline","sectionContent","sectionBefore","sectionAfter","adornedStart","adornedEnd","input"]);function $2(e){return Fe("MuiPickersSectionList",e)}const Us=Ae("MuiPickersSectionList",["root","section","sectionContent"]),A2=["slots","slotProps","elements","sectionListRef"],Pb=ie("div",{name:"MuiPickersSectionList",slot:"Root",overridesResolver:(e,t)=>t.root})({direction:"ltr /*! @noflip */",outline:"none"}),Mb=ie("span",{name:"MuiPickersSectionList",slot:"Section",overridesResolver:(e,t)=>t.section})({}),Rb=ie("span",{name:"MuiPickersSectionList",slot:"SectionSeparator",overridesResolver:(e,t)=>t.sectionSeparator})({whiteSpace:"pre"}),Db=ie("span",{name:"MuiPickersSectionList",slot:"SectionContent",overridesResolver:(e,t)=>t.sectionContent})({outline:"none"}),N2=e=>{const{classes:t}=e;return Le({root:["root"],section:["section"],sectionContent:["sectionContent"]},$2,t)};function L2(e){const{slots:t,slotProps:r,element:o,classes:s}=e,a=(t==null?void 0:t.section)??Mb,c=Je({elementType:a,externalSlotProps:r==null?void 0:r.section,externalForwardedProps:o.container,className:s.section,ownerState:{}}),u=(t==null?void 0:t.sectionContent)??Db,f=Je({elementType:u,externalSlotProps:r==null?void 0:r.sectionContent,externalForwardedProps:o.content,additionalProps:{suppressContentEditableWarning:!0},className:s.sectionContent,ownerState:{}}),p=(t==null?void 0:t.sectionSeparator)??Rb,h=Je({elementType:p,externalSlotProps:r==null?void 0:r.sectionSeparator,externalForwardedProps:o.before,ownerState:{position:"before"}}),g=Je({elementType:p,externalSlotProps:r==null?void 0:r.sectionSeparator,externalForwardedProps:o.after,ownerState:{position:"after"}});return I.jsxs(a,K({},c,{children:[I.jsx(p,K({},h)),I.jsx(u,K({},f)),I.jsx(p,K({},g))]}))}const F2=k.forwardRef(function(t,r){const o=ot({props:t,name:"MuiPickersSectionList"}),{slots:s,slotProps:a,elements:c,sectionListRef:u}=o,f=We(o,A2),p=N2(o),h=k.useRef(null),g=rt(r,h),b=x=>{if(!h.current)throw new Error(`MUI X: Cannot call sectionListRef.${x} before the mount of the component.`);return h.current};k.useImperativeHandle(u,()=>({getRoot(){return b("getRoot")},getSectionContainer(x){return b("getSectionContainer").querySelector(`.${Us.section}[data-sectionindex="${x}"]`)},getSectionContent(x){return b("getSectionContent").querySelector(`.${Us.section}[data-sectionindex="${x}"] .${Us.sectionContent}`)},getSectionIndexFromDOMElement(x){const w=b("getSectionIndexFromDOMElement");if(x==null||!w.contains(x))return null;let T=null;return x.classList.contains(Us.section)?T=x:x.classList.contains(Us.sectionContent)&&(T=x.parentElement),T==null?null:Number(T.dataset.sectionindex)}}));const S=(s==null?void 0:s.root)??Pb,v=Je({elementType:S,externalSlotProps:a==null?void 0:a.root,externalForwardedProps:f,additionalProps:{ref:g,suppressContentEditableWarning:!0},className:p.root,ownerState:{}});return I.jsx(S,K({},v,{children:v.contentEditable?c.map(({content:x,before:w,after:T})=>`${w.children}${x.children}${T.children}`).join(""):I.jsx(k.Fragment,{children:c.map((x,w)=>I.jsx(L2,{slots:s,slotProps:a,element:x,classes:p},w))})}))}),B2=["elements","areAllSectionsEmpty","defaultValue","label","value","onChange","id","autoFocus","endAdornment","startAdornment","renderSuffix","slots","slotProps","contentEditable","tabIndex","onInput","onPaste","onKeyDown","fullWidth","name","readOnly","inputProps","inputRef","sectionListRef"],V2=e=>Math.round(e*1e5)/1e5,ou=ie("div",{name:"MuiPickersInputBase",slot:"Root",overridesResolver:(e,t)=>t.root})(({theme:e})=>K({},e.typography.body1,{color:(e.vars||e).palette.text.primary,cursor:"text",padding:0,display:"flex",justifyContent:"flex-start",alignItems:"center",position:"relative",boxSizing:"border-box",letterSpacing:`${V2(.15/16)}em`,variants:[{props:{fullWidth:!0},style:{width:"100%"}}]})),Bp=ie(Pb,{name:"MuiPickersInputBase",slot:"SectionsContainer",overridesResolver:(e,t)=>t.sectionsContainer})(({theme:e})=>({padding:"4px 0 5px",fontFamily:e.typography.fontFamily,fontSize:"inherit",lineHeight:"1.4375em",flexGrow:1,outline:"none",display:"flex",flexWrap:"nowrap",overflow:"hidden",letterSpacing:"inherit",width:"182px",variants:[{props:{isRtl:!0},style:{textAlign:"right /*! @noflip */"}},{props:{size:"small"},style:{paddingTop:1}},{props:{adornedStart:!1,focused:!1,filled:!1},style:{color:"currentColor",opacity:0}},{props:({adornedStart:t,focused:r,filled:o,label:s})=>!t&&!r&&!o&&s==null,style:e.vars?{opacity:e.vars.opacity.inputPlaceholder}:{opacity:e.palette.mode==="light"?.42:.5}}]})),j2=ie(Mb,{name:"MuiPickersInputBase",slot:"Section",overridesResolver:(e,t)=>t.section})(({theme:e})=>({fontFamily:e.typography.fontFamily,fontSize:"inherit",letterSpacing:"inherit",lineHeight:"1.4375em",display:"flex"})),z2=ie(Db,{name:"MuiPickersInputBase",slot:"SectionContent",overridesResolver:(e,t)=>t.content})(({theme:e})=>({fontFamily:e.typography.fontFamily,lineHeight:"1.4375em",letterSpacing:"inherit",width:"fit-content",outline:"none"})),_2=ie(Rb,{name:"MuiPickersInputBase",slot:"Separator",overridesResolver:(e,t)=>t.separator})(()=>({whiteSpace:"pre",letterSpacing:"inherit"})),W2=ie("input",{name:"MuiPickersInputBase",slot:"Input",overridesResolver:(e,t)=>t.hiddenInput})(K({},uk)),U2=e=>{const{focused:t,disabled:r,error:o,classes:s,fullWidth:a,readOnly:c,color:u,size:f,endAdornment:p,startAdornment:h}=e,g={root:["root",t&&!r&&"focused",r&&"disabled",c&&"readOnly",o&&"error",a&&"fullWidth",`color${Ee(u)}`,f==="small"&&"inputSizeSmall",!!h&&"adornedStart",!!p&&"adornedEnd"],notchedOutline:["notchedOutline"],input:["input"],sectionsContainer:["sectionsContainer"],sectionContent:["sectionContent"],sectionBefore:["sectionBefore"],sectionAfter:["sectionAfter"]};return Le(g,O2,s)},Vp=k.forwardRef(function(t,r){const o=ot({props:t,name:"MuiPickersInputBase"}),{elements:s,areAllSectionsEmpty:a,value:c,onChange:u,id:f,endAdornment:p,startAdornment:h,renderSuffix:g,slots:b,slotProps:S,contentEditable:v,tabIndex:x,onInput:w,onPaste:T,onKeyDown:R,name:P,readOnly:M,inputProps:D,inputRef:$,sectionListRef:O}=o,N=We(o,B2),U=k.useRef(null),C=rt(r,U),A=rt(D==null?void 0:D.ref,$),H=an(),W=pr();if(!W)throw new Error("MUI X: PickersInputBase should always be used inside a PickersTextField component");const V=q=>{var L;if(W.disabled){q.stopPropagation();return}(L=W.onFocus)==null||L.call(W,q)};k.useEffect(()=>{W&&W.setAdornedStart(!!h)},[W,h]),k.useEffect(()=>{W&&(a?W.onEmpty():W.onFilled())},[W,a]);const F=K({},o,W,{isRtl:H}),B=U2(F),Y=(b==null?void 0:b.root)||ou,j=Je({elementType:Y,externalSlotProps:S==null?void 0:S.root,externalForwardedProps:N,additionalProps:{"aria-invalid":W.error,ref:C},className:B.root,ownerState:F}),_=(b==null?void 0:b.input)||Bp;return I.jsxs(Y,K({},j,{children:[h,I.jsx(F2,{sectionListRef:O,elements:s,contentEditable:v,tabIndex:x,className:B.sectionsContainer,onFocus:V,onBlur:W.onBlur,onInput:w,onPaste:T,onKeyDown:R,slots:{root:_,section:j2,sectionContent:z2,sectionSeparator:_2},slotProps:{root:{ownerState:F},sectionContent:{className:Ii.sectionContent},sectionSeparator:({position:q})=>({className:q==="before"?Ii.sectionBefore:Ii.sectionAfter})}}),p,g?g(K({},W)):null,I.jsx(W2,K({name:P,className:B.input,value:c,onChange:u,id:f,"aria-hidden":"true",tabIndex:-1,readOnly:M,required:W.required,disabled:W.disabled},D,{ref:A}))]}))});function H2(e){return Fe("MuiPickersOutlinedInput",e)}const sr=K({},Ii,Ae("MuiPickersOutlinedInput",["root","notchedOutline","input"])),Y2=["children","className","label","notched","shrink"],K2=ie("fieldset",{name:"MuiPickersOutlinedInput",slot:"NotchedOutline",overridesResolver:(e,t)=>t.notchedOutline})(({theme:e})=>{const t=e.palette.mode==="light"?"rgba(0, 0, 0, 0.23)":"rgba(255, 255, 255, 0.23)";return{textAlign:"left",position:"absolute",bottom:0,right:0,top:-5,left:0,margin:0,padding:"0 8px",pointerEvents:"none",borderRadius:"inherit",borderStyle:"solid",borderWidth:1,overflow:"hidden",minWidth:"0%",borderColor:e.vars?`rgba(${e.vars.palette.common.onBackgroundChannel} / 0.23)`:t}}),cv=ie("span")(({theme:e})=>({fontFamily:e.typography.fontFamily,fontSize:"inherit"})),q2=ie("legend")(({theme:e})=>({float:"unset",width:"auto",overflow:"hidden",variants:[{props:{withLabel:!1},style:{padding:0,lineHeight:"11px",transition:e.transitions.create("width",{duration:150,easing:e.transitions.easing.easeOut})}},{props:{withLabel:!0},style:{display:"block",padding:0,height:11,fontSize:"0.75em",visibility:"hidden",maxWidth:.01,transition:e.transitions.create("max-width",{duration:50,easing:e.transitions.easing.easeOut}),whiteSpace:"nowrap","& > span":{paddingLeft:5,paddingRight:5,display:"inline-block",opacity:0,visibility:"visible"}}},{props:{withLabel:!0,notched:!0},style:{maxWidth:"100%",transition:e.transitions.create("max-width",{duration:100,easing:e.transitions.easing.easeOut,delay:50})}}]}));function G2(e){const{className:t,label:r}=e,o=We(e,Y2),s=r!=null&&r!=="",a=K({},e,{withLabel:s});return I.jsx(K2,K({"aria-hidden":!0,className:t},o,{ownerState:a,children:I.jsx(q2,{ownerState:a,children:s?I.jsx(cv,{children:r}):I.jsx(cv,{className:"notranslate",children:"​"})})}))}const Q2=["label","autoFocus","ownerState","notched"],X2=ie(ou,{name:"MuiPickersOutlinedInput",slot:"Root",overridesResolver:(e,t)=>t.root})(({theme:e})=>{const t=e.palette.mode==="light"?"rgba(0, 0, 0, 0.23)":"rgba(255, 255, 255, 0.23)";return{padding:"0 14px",borderRadius:(e.vars||e).shape.borderRadius,[`&:hover .${sr.notchedOutline}`]:{borderColor:(e.vars||e).palette.text.primary},"@media (hover: none)":{[`&:hover .${sr.notchedOutline}`]:{borderColor:e.vars?`rgba(${e.vars.palette.common.onBackgroundChannel} / 0.23)`:t}},[`&.${sr.focused} .${sr.notchedOutline}`]:{borderStyle:"solid",borderWidth:2},[`&.${sr.disabled}`]:{[`& .${sr.notchedOutline}`]:{borderColor:(e.vars||e).palette.action.disabled},"*":{color:(e.vars||e).palette.action.disabled}},[`&.${sr.error} .${sr.notchedOutline}`]:{borderColor:(e.vars||e).palette.error.main},variants:Object.keys((e.vars??e).palette).filter(r=>{var o;return((o=(e.vars??e).palette[r])==null?void 0:o.main)??!1}).map(r=>({props:{color:r},style:{[`&.${sr.focused}:not(.${sr.error}) .${sr.notchedOutline}`]:{borderColor:(e.vars||e).palette[r].main}}}))}}),Z2=ie(Bp,{name:"MuiPickersOutlinedInput",slot:"SectionsContainer",overridesResolver:(e,t)=>t.sectionsContainer})({padding:"16.5px 0",variants:[{props:{size:"small"},style:{padding:"8.5px 0"}}]}),J2=e=>{const{classes:t}=e,o=Le({root:["root"],notchedOutline:["notchedOutline"],input:["input"]},H2,t);return K({},t,o)},Eb=k.forwardRef(function(t,r){const o=ot({props:t,name:"MuiPickersOutlinedInput"}),{label:s,ownerState:a,notched:c}=o,u=We(o,Q2),f=pr(),p=K({},o,a,f,{color:(f==null?void 0:f.color)||"primary"}),h=J2(p);return I.jsx(Vp,K({slots:{root:X2,input:Z2},renderSuffix:g=>I.jsx(G2,{shrink:!!(c||g.adornedStart||g.focused||g.filled),notched:!!(c||g.adornedStart||g.focused||g.filled),className:h.notchedOutline,label:s!=null&&s!==""&&(f!=null&&f.required)?I.jsxs(k.Fragment,{children:[s," ","*"]}):s,ownerState:p})},u,{label:s,classes:h,ref:r}))});Eb.muiName="Input";function eI(e){return Fe("MuiPickersFilledInput",e)}const Oo=K({},Ii,Ae("MuiPickersFilledInput",["root","underline","input"])),tI=["label","autoFocus","disableUnderline","ownerState"],nI=ie(ou,{name:"MuiPickersFilledInput",slot:"Root",overridesResolver:(e,t)=>t.root,shouldForwardProp:e=>oc(e)&&e!=="disableUnderline"})(({theme:e})=>{const t=e.palette.mode==="light",r=t?"rgba(0, 0, 0, 0.42)":"rgba(255, 255, 255, 0.7)",o=t?"rgba(0, 0, 0, 0.06)":"rgba(255, 255, 255, 0.09)",s=t?"rgba(0, 0, 0, 0.09)":"rgba(255, 255, 255, 0.13)",a=t?"rgba(0, 0, 0, 0.12)":"rgba(255, 255, 255, 0.12)";return{backgroundColor:e.vars?e.vars.palette.FilledInput.bg:o,borderTopLeftRadius:(e.vars||e).shape.borderRadius,borderTopRightRadius:(e.vars||e).shape.borderRadius,transition:e.transitions.create("background-color",{duration:e.transitions.duration.shorter,easing:e.transitions.easing.easeOut}),"&:hover":{backgroundColor:e.vars?e.vars.palette.FilledInput.hoverBg:s,"@media (hover: none)":{backgroundColor:e.vars?e.vars.palette.FilledInput.bg:o}},[`&.${Oo.focused}`]:{backgroundColor:e.vars?e.vars.palette.FilledInput.bg:o},[`&.${Oo.disabled}`]:{backgroundColor:e.vars?e.vars.palette.FilledInput.disabledBg:a},variants:[...Object.keys((e.vars??e).palette).filter(c=>(e.vars??e).palette[c].main).map(c=>{var u;return{props:{color:c,disableUnderline:!1},style:{"&::after":{borderBottom:`2px solid ${(u=(e.vars||e).palette[c])==null?void 0:u.main}`}}}}),{props:{disableUnderline:!1},style:{"&::after":{left:0,bottom:0,content:'""',position:"absolute",right:0,transform:"scaleX(0)",transition:e.transitions.create("transform",{duration:e.transitions.duration.shorter,easing:e.transitions.easing.easeOut}),pointerEvents:"none"},[`&.${Oo.focused}:after`]:{transform:"scaleX(1) translateX(0)"},[`&.${Oo.error}`]:{"&:before, &:after":{borderBottomColor:(e.vars||e).palette.error.main}},"&::before":{borderBottom:`1px solid ${e.vars?`rgba(${e.vars.palette.common.onBackgroundChannel} / ${e.vars.opacity.inputUnderline})`:r}`,left:0,bottom:0,content:'"\\00a0"',position:"absolute",right:0,transition:e.transitions.create("border-bottom-color",{duration:e.transitions.duration.shorter}),pointerEvents:"none"},[`&:hover:not(.${Oo.disabled}, .${Oo.error}):before`]:{borderBottom:`1px solid ${(e.vars||e).palette.text.primary}`},[`&.${Oo.disabled}:before`]:{borderBottomStyle:"dotted"}}},{props:({startAdornment:c})=>!!c,style:{paddingLeft:12}},{props:({endAdornment:c})=>!!c,style:{paddingRight:12}}]}}),rI=ie(Bp,{name:"MuiPickersFilledInput",slot:"sectionsContainer",overridesResolver:(e,t)=>t.sectionsContainer})({paddingTop:25,paddingRight:12,paddingBottom:8,paddingLeft:12,variants:[{props:{size:"small"},style:{paddingTop:21,paddingBottom:4}},{props:({startAdornment:e})=>!!e,style:{paddingLeft:0}},{props:({endAdornment:e})=>!!e,style:{paddingRight:0}},{props:{hiddenLabel:!0},style:{paddingTop:16,paddingBottom:17}},{props:{hiddenLabel:!0,size:"small"},style:{paddingTop:8,paddingBottom:9}}]}),oI=e=>{const{classes:t,disableUnderline:r}=e,s=Le({root:["root",!r&&"underline"],input:["input"]},eI,t);return K({},t,s)},Ib=k.forwardRef(function(t,r){const o=ot({props:t,name:"MuiPickersFilledInput"}),{label:s,disableUnderline:a=!1,ownerState:c}=o,u=We(o,tI),f=pr(),p=K({},o,c,f,{color:(f==null?void 0:f.color)||"primary"}),h=oI(p);return I.jsx(Vp,K({slots:{root:nI,input:rI},slotProps:{root:{disableUnderline:a}}},u,{label:s,classes:h,ref:r}))});Ib.muiName="Input";function iI(e){return Fe("MuiPickersFilledInput",e)}const Hs=K({},Ii,Ae("MuiPickersInput",["root","input"])),sI=["label","autoFocus","disableUnderline","ownerState"],aI=ie(ou,{name:"MuiPickersInput",slot:"Root",overridesResolver:(e,t)=>t.root})(({theme:e})=>{let r=e.palette.mode==="light"?"rgba(0, 0, 0, 0.42)":"rgba(255, 255, 255, 0.7)";return e.vars&&(r=`rgba(${e.vars.palette.common.onBackgroundChannel} / ${e.vars.opacity.inputUnderline})`),{"label + &":{marginTop:16},variants:[...Object.keys((e.vars??e).palette).filter(o=>(e.vars??e).palette[o].main).map(o=>({props:{color:o},style:{"&::after":{borderBottom:`2px solid ${(e.vars||e).palette[o].main}`}}})),{props:{disableUnderline:!1},style:{"&::after":{background:"red",left:0,bottom:0,content:'""',position:"absolute",right:0,transform:"scaleX(0)",transition:e.transitions.create("transform",{duration:e.transitions.duration.shorter,easing:e.transitions.easing.easeOut}),pointerEvents:"none"},[`&.${Hs.focused}:after`]:{transform:"scaleX(1) translateX(0)"},[`&.${Hs.error}`]:{"&:before, &:after":{borderBottomColor:(e.vars||e).palette.error.main}},"&::before":{borderBottom:`1px solid ${r}`,left:0,bottom:0,content:'"\\00a0"',position:"absolute",right:0,transition:e.transitions.create("border-bottom-color",{duration:e.transitions.duration.shorter}),pointerEvents:"none"},[`&:hover:not(.${Hs.disabled}, .${Hs.error}):before`]:{borderBottom:`2px solid ${(e.vars||e).palette.text.primary}`,"@media (hover: none)":{borderBottom:`1px solid ${r}`}},[`&.${Hs.disabled}:before`]:{borderBottomStyle:"dotted"}}}]}}),lI=e=>{const{classes:t,disableUnderline:r}=e,s=Le({root:["root",!r&&"underline"],input:["input"]},iI,t);return K({},t,s)},Ob=k.forwardRef(function(t,r){const o=ot({props:t,name:"MuiPickersInput"}),{label:s,disableUnderline:a=!1,ownerState:c}=o,u=We(o,sI),f=pr(),p=K({},o,c,f,{disableUnderline:a,color:(f==null?void 0:f.color)||"primary"}),h=lI(p);return I.jsx(Vp,K({slots:{root:aI}},u,{label:s,classes:h,ref:r}))});Ob.muiName="Input";const cI=["onFocus","onBlur","className","color","disabled","error","variant","required","InputProps","inputProps","inputRef","sectionListRef","elements","areAllSectionsEmpty","onClick","onKeyDown","onKeyUp","onPaste","onInput","endAdornment","startAdornment","tabIndex","contentEditable","focused","value","onChange","fullWidth","id","name","helperText","FormHelperTextProps","label","InputLabelProps"],uI={standard:Ob,filled:Ib,outlined:Eb},dI=ie(Q0,{name:"MuiPickersTextField",slot:"Root",overridesResolver:(e,t)=>t.root})({}),fI=e=>{const{focused:t,disabled:r,classes:o,required:s}=e;return Le({root:["root",t&&!r&&"focused",r&&"disabled",s&&"required"]},I2,o)},pI=k.forwardRef(function(t,r){const o=ot({props:t,name:"MuiPickersTextField"}),{onFocus:s,onBlur:a,className:c,color:u="primary",disabled:f=!1,error:p=!1,variant:h="outlined",required:g=!1,InputProps:b,inputProps:S,inputRef:v,sectionListRef:x,elements:w,areAllSectionsEmpty:T,onClick:R,onKeyDown:P,onKeyUp:M,onPaste:D,onInput:$,endAdornment:O,startAdornment:N,tabIndex:U,contentEditable:C,focused:A,value:H,onChange:W,fullWidth:V,id:F,name:B,helperText:Y,FormHelperTextProps:j,label:_,InputLabelProps:q}=o,L=We(o,cI),Q=k.useRef(null),te=rt(r,Q),ae=Yr(F),Z=Y&&ae?`${ae}-helper-text`:void 0,le=_&&ae?`${ae}-label`:void 0,ue=K({},o,{color:u,disabled:f,error:p,focused:A,required:g,variant:h}),J=fI(ue),ne=uI[h];return I.jsxs(dI,K({className:Me(J.root,c),ref:te,focused:A,onFocus:s,onBlur:a,disabled:f,variant:h,error:p,color:u,fullWidth:V,required:g,ownerState:ue},L,{children:[I.jsx(eb,K({htmlFor:ae,id:le},q,{children:_})),I.jsx(ne,K({elements:w,areAllSectionsEmpty:T,onClick:R,onKeyDown:P,onKeyUp:M,onInput:$,onPaste:D,endAdornment:O,startAdornment:N,tabIndex:U,contentEditable:C,value:H,onChange:W,id:ae,fullWidth:V,inputProps:S,inputRef:v,sectionListRef:x,label:_,name:B,role:"group","aria-labelledby":le},b)),Y&&I.jsx(X0,K({id:Z},j,{children:Y}))]}))}),mI=["enableAccessibleFieldDOMStructure"],hI=["InputProps","readOnly"],gI=["onPaste","onKeyDown","inputMode","readOnly","InputProps","inputProps","inputRef"],yI=e=>{let{enableAccessibleFieldDOMStructure:t}=e,r=We(e,mI);if(t){const{InputProps:g,readOnly:b}=r,S=We(r,hI);return K({},S,{InputProps:K({},g??{},{readOnly:b})})}const{onPaste:o,onKeyDown:s,inputMode:a,readOnly:c,InputProps:u,inputProps:f,inputRef:p}=r,h=We(r,gI);return K({},h,{InputProps:K({},u??{},{readOnly:c}),inputProps:K({},f??{},{inputMode:a,onPaste:o,onKeyDown:s,ref:p})})},vI=["slots","slotProps","InputProps","inputProps"],$b=k.forwardRef(function(t,r){const o=ot({props:t,name:"MuiDateTimeField"}),{slots:s,slotProps:a,InputProps:c,inputProps:u}=o,f=We(o,vI),p=o,h=(s==null?void 0:s.textField)??(t.enableAccessibleFieldDOMStructure?pI:Xs),g=Je({elementType:h,externalSlotProps:a==null?void 0:a.textField,externalForwardedProps:f,ownerState:p,additionalProps:{ref:r}});g.inputProps=K({},u,g.inputProps),g.InputProps=K({},c,g.InputProps);const b=E2(g),S=yI(b),v=T2(K({},S,{slots:s,slotProps:a}));return I.jsx(h,K({},v))});function bI(e){return Fe("MuiDateTimePickerTabs",e)}Ae("MuiDateTimePickerTabs",["root"]);const xI=e=>ji(e)?"date":"time",wI=e=>e==="date"?"day":"hours",SI=e=>{const{classes:t}=e;return Le({root:["root"]},bI,t)},CI=ie(wE,{name:"MuiDateTimePickerTabs",slot:"Root",overridesResolver:(e,t)=>t.root})(({theme:e})=>({boxShadow:`0 -1px 0 0 inset ${(e.vars||e).palette.divider}`,"&:last-child":{boxShadow:`0 1px 0 0 inset ${(e.vars||e).palette.divider}`,[`& .${lc.indicator}`]:{bottom:"auto",top:0}}})),kI=function(t){const r=ot({props:t,name:"MuiDateTimePickerTabs"}),{dateIcon:o=I.jsx(x2,{}),onViewChange:s,timeIcon:a=I.jsx(w2,{}),view:c,hidden:u=typeof window>"u"||window.innerHeight<667,className:f,sx:p}=r,h=Sn(),g=SI(r),b=(S,v)=>{s(wI(v))};return u?null:I.jsxs(CI,{ownerState:r,variant:"fullWidth",value:xI(c),onChange:b,className:Me(f,g.root),sx:p,children:[I.jsx(Qy,{value:"date","aria-label":h.dateTableLabel,icon:I.jsx(k.Fragment,{children:o})}),I.jsx(Qy,{value:"time","aria-label":h.timeTableLabel,icon:I.jsx(k.Fragment,{children:a})})]})};function TI(e){return Fe("MuiPickersToolbarText",e)}const Uf=Ae("MuiPickersToolbarText",["root","selected"]),PI=["className","selected","value"],MI=e=>{const{classes:t,selected:r}=e;return Le({root:["root",r&&"selected"]},TI,t)},RI=ie(Hn,{name:"MuiPickersToolbarText",slot:"Root",overridesResolver:(e,t)=>[t.root,{[`&.${Uf.selected}`]:t.selected}]})(({theme:e})=>({transition:e.transitions.create("color"),color:(e.vars||e).palette.text.secondary,[`&.${Uf.selected}`]:{color:(e.vars||e).palette.text.primary}})),Ab=k.forwardRef(function(t,r){const o=ot({props:t,name:"MuiPickersToolbarText"}),{className:s,value:a}=o,c=We(o,PI),u=MI(o);return I.jsx(RI,K({ref:r,className:Me(u.root,s),component:"span"},c,{children:a}))});function Nb(e){return Fe("MuiPickersToolbar",e)}const DI=Ae("MuiPickersToolbar",["root","content"]),EI=["children","className","toolbarTitle","hidden","titleId","isLandscape","classes","landscapeDirection"],II=e=>{const{classes:t}=e;return Le({root:["root"],content:["content"]},Nb,t)},OI=ie("div",{name:"MuiPickersToolbar",slot:"Root",overridesResolver:(e,t)=>t.root})(({theme:e})=>({display:"flex",flexDirection:"column",alignItems:"flex-start",justifyContent:"space-between",padding:e.spacing(2,3),variants:[{props:{isLandscape:!0},style:{height:"auto",maxWidth:160,padding:16,justifyContent:"flex-start",flexWrap:"wrap"}}]})),$I=ie("div",{name:"MuiPickersToolbar",slot:"Content",overridesResolver:(e,t)=>t.content})({display:"flex",flexWrap:"wrap",width:"100%",flex:1,justifyContent:"space-between",alignItems:"center",flexDirection:"row",variants:[{props:{isLandscape:!0},style:{justifyContent:"flex-start",alignItems:"flex-start",flexDirection:"column"}},{props:{isLandscape:!0,landscapeDirection:"row"},style:{flexDirection:"row"}}]}),AI=k.forwardRef(function(t,r){const o=ot({props:t,name:"MuiPickersToolbar"}),{children:s,className:a,toolbarTitle:c,hidden:u,titleId:f}=o,p=We(o,EI),h=o,g=II(h);return u?null:I.jsxs(OI,K({ref:r,className:Me(g.root,a),ownerState:h},p,{children:[I.jsx(Hn,{color:"text.secondary",variant:"overline",id:f,children:c}),I.jsx($I,{className:g.content,ownerState:h,children:s})]}))}),NI=["align","className","selected","typographyClassName","value","variant","width"],LI=e=>{const{classes:t}=e;return Le({root:["root"]},Nb,t)},FI=ie(Fo,{name:"MuiPickersToolbarButton",slot:"Root",overridesResolver:(e,t)=>t.root})({padding:0,minWidth:16,textTransform:"none"}),mo=k.forwardRef(function(t,r){const o=ot({props:t,name:"MuiPickersToolbarButton"}),{align:s,className:a,selected:c,typographyClassName:u,value:f,variant:p,width:h}=o,g=We(o,NI),b=LI(o);return I.jsx(FI,K({variant:"text",ref:r,className:Me(b.root,a)},h?{sx:{width:h}}:{},g,{children:I.jsx(Ab,{align:s,className:u,variant:p,value:f,selected:c})}))});function BI(e){return Fe("MuiDateTimePickerToolbar",e)}const yf=Ae("MuiDateTimePickerToolbar",["root","dateContainer","timeContainer","timeDigitsContainer","separator","timeLabelReverse","ampmSelection","ampmLandscape","ampmLabel"]);function VI(e,{disableFuture:t,maxDate:r,timezone:o}){const s=ft();return k.useMemo(()=>{const a=s.date(void 0,o),c=s.startOfMonth(t&&s.isBefore(a,r)?a:r);return!s.isAfter(c,e)},[t,r,e,s,o])}function jI(e,{disablePast:t,minDate:r,timezone:o}){const s=ft();return k.useMemo(()=>{const a=s.date(void 0,o),c=s.startOfMonth(t&&s.isAfter(a,r)?a:r);return!s.isBefore(c,e)},[t,r,e,s,o])}function jp(e,t,r,o){const s=ft(),a=OE(e,s),c=k.useCallback(u=>{const f=e==null?null:$E(e,u,!!t,s);r(f,o??"partial")},[t,e,r,o,s]);return{meridiemMode:a,handleMeridiemChange:c}}const ya=36,iu=2,su=320,zI=280,au=336,Lb=232,Js=48,_I=["ampm","ampmInClock","value","onChange","view","isLandscape","onViewChange","toolbarFormat","toolbarPlaceholder","views","disabled","readOnly","toolbarVariant","toolbarTitle","className"],WI=e=>{const{classes:t,isLandscape:r,isRtl:o}=e;return Le({root:["root"],dateContainer:["dateContainer"],timeContainer:["timeContainer",o&&"timeLabelReverse"],timeDigitsContainer:["timeDigitsContainer",o&&"timeLabelReverse"],separator:["separator"],ampmSelection:["ampmSelection",r&&"ampmLandscape"],ampmLabel:["ampmLabel"]},BI,t)},UI=ie(AI,{name:"MuiDateTimePickerToolbar",slot:"Root",overridesResolver:(e,t)=>t.root})(({theme:e})=>({paddingLeft:16,paddingRight:16,justifyContent:"space-around",position:"relative",variants:[{props:{toolbarVariant:"desktop"},style:{borderBottom:`1px solid ${(e.vars||e).palette.divider}`,[`& .${DI.content} .${Uf.selected}`]:{color:(e.vars||e).palette.primary.main,fontWeight:e.typography.fontWeightBold}}},{props:{toolbarVariant:"desktop",isLandscape:!0},style:{borderRight:`1px solid ${(e.vars||e).palette.divider}`}},{props:{toolbarVariant:"desktop",isLandscape:!1},style:{paddingLeft:24,paddingRight:0}}]})),HI=ie("div",{name:"MuiDateTimePickerToolbar",slot:"DateContainer",overridesResolver:(e,t)=>t.dateContainer})({display:"flex",flexDirection:"column",alignItems:"flex-start"}),YI=ie("div",{name:"MuiDateTimePickerToolbar",slot:"TimeContainer",overridesResolver:(e,t)=>t.timeContainer})({display:"flex",flexDirection:"row",variants:[{props:{isRtl:!0},style:{flexDirection:"row-reverse"}},{props:{toolbarVariant:"desktop",isLandscape:!1},style:{gap:9,marginRight:4,alignSelf:"flex-end"}},{props:({isLandscape:e,toolbarVariant:t})=>e&&t!=="desktop",style:{flexDirection:"column"}},{props:({isLandscape:e,toolbarVariant:t,isRtl:r})=>e&&t!=="desktop"&&r,style:{flexDirection:"column-reverse"}}]}),KI=ie("div",{name:"MuiDateTimePickerToolbar",slot:"TimeDigitsContainer",overridesResolver:(e,t)=>t.timeDigitsContainer})({display:"flex",variants:[{props:{isRtl:!0},style:{flexDirection:"row-reverse"}},{props:{toolbarVariant:"desktop"},style:{gap:1.5}}]}),uv=ie(Ab,{name:"MuiDateTimePickerToolbar",slot:"Separator",overridesResolver:(e,t)=>t.separator})({margin:"0 4px 0 2px",cursor:"default",variants:[{props:{toolbarVariant:"desktop"},style:{margin:0}}]}),qI=ie("div",{name:"MuiDateTimePickerToolbar",slot:"AmPmSelection",overridesResolver:(e,t)=>[{[`.${yf.ampmLabel}`]:t.ampmLabel},{[`&.${yf.ampmLandscape}`]:t.ampmLandscape},t.ampmSelection]})({display:"flex",flexDirection:"column",marginRight:"auto",marginLeft:12,[`& .${yf.ampmLabel}`]:{fontSize:17},variants:[{props:{isLandscape:!0},style:{margin:"4px 0 auto",flexDirection:"row",justifyContent:"space-around",width:"100%"}}]});function GI(e){const t=ot({props:e,name:"MuiDateTimePickerToolbar"}),{ampm:r,ampmInClock:o,value:s,onChange:a,view:c,isLandscape:u,onViewChange:f,toolbarFormat:p,toolbarPlaceholder:h="––",views:g,disabled:b,readOnly:S,toolbarVariant:v="mobile",toolbarTitle:x,className:w}=t,T=We(t,_I),R=an(),P=K({},t,{isRtl:R}),M=ft(),{meridiemMode:D,handleMeridiemChange:$}=jp(s,r,a),O=!!(r&&!o),N=v==="desktop",U=Sn(),C=WI(P),A=x??U.dateTimePickerToolbarTitle,H=V=>r?M.format(V,"hours12h"):M.format(V,"hours24h"),W=k.useMemo(()=>s?p?M.formatByString(s,p):M.format(s,"shortDate"):h,[s,p,h,M]);return I.jsxs(UI,K({isLandscape:u,className:Me(C.root,w),toolbarTitle:A},T,{ownerState:P,children:[I.jsxs(HI,{className:C.dateContainer,ownerState:P,children:[g.includes("year")&&I.jsx(mo,{tabIndex:-1,variant:"subtitle1",onClick:()=>f("year"),selected:c==="year",value:s?M.format(s,"year"):"–"}),g.includes("day")&&I.jsx(mo,{tabIndex:-1,variant:N?"h5":"h4",onClick:()=>f("day"),selected:c==="day",value:W})]}),I.jsxs(YI,{className:C.timeContainer,ownerState:P,children:[I.jsxs(KI,{className:C.timeDigitsContainer,ownerState:P,children:[g.includes("hours")&&I.jsxs(k.Fragment,{children:[I.jsx(mo,{variant:N?"h5":"h3",width:N&&!u?Js:void 0,onClick:()=>f("hours"),selected:c==="hours",value:s?H(s):"--"}),I.jsx(uv,{variant:N?"h5":"h3",value:":",className:C.separator,ownerState:P}),I.jsx(mo,{variant:N?"h5":"h3",width:N&&!u?Js:void 0,onClick:()=>f("minutes"),selected:c==="minutes"||!g.includes("minutes")&&c==="hours",value:s?M.format(s,"minutes"):"--",disabled:!g.includes("minutes")})]}),g.includes("seconds")&&I.jsxs(k.Fragment,{children:[I.jsx(uv,{variant:N?"h5":"h3",value:":",className:C.separator,ownerState:P}),I.jsx(mo,{variant:N?"h5":"h3",width:N&&!u?Js:void 0,onClick:()=>f("seconds"),selected:c==="seconds",value:s?M.format(s,"seconds"):"--"})]})]}),O&&!N&&I.jsxs(qI,{className:C.ampmSelection,ownerState:P,children:[I.jsx(mo,{variant:"subtitle2",selected:D==="am",typographyClassName:C.ampmLabel,value:jr(M,"am"),onClick:S?void 0:()=>$("am"),disabled:b}),I.jsx(mo,{variant:"subtitle2",selected:D==="pm",typographyClassName:C.ampmLabel,value:jr(M,"pm"),onClick:S?void 0:()=>$("pm"),disabled:b})]}),r&&N&&I.jsx(mo,{variant:"h5",onClick:()=>f("meridiem"),selected:c==="meridiem",value:s&&D?jr(M,D):"--",width:Js})]})]}))}function Fb(e,t){var u;const r=ft(),o=Ia(),s=ot({props:e,name:t}),a=s.ampm??r.is12HourCycleInCurrentLocale(),c=k.useMemo(()=>{var f;return((f=s.localeText)==null?void 0:f.toolbarTitle)==null?s.localeText:K({},s.localeText,{dateTimePickerToolbarTitle:s.localeText.toolbarTitle})},[s.localeText]);return K({},s,ME({views:s.views,openTo:s.openTo,defaultViews:["year","day","hours","minutes"],defaultOpenTo:"day"}),{ampm:a,localeText:c,orientation:s.orientation??"portrait",disableIgnoringDatePartForTimeValidation:s.disableIgnoringDatePartForTimeValidation??!!(s.minDateTime||s.maxDateTime||s.disablePast||s.disableFuture),disableFuture:s.disableFuture??!1,disablePast:s.disablePast??!1,minDate:Gn(r,s.minDateTime??s.minDate,o.minDate),maxDate:Gn(r,s.maxDateTime??s.maxDate,o.maxDate),minTime:s.minDateTime??s.minTime,maxTime:s.maxDateTime??s.maxTime,slots:K({toolbar:GI,tabs:kI},s.slots),slotProps:K({},s.slotProps,{toolbar:K({ampm:a},(u=s.slotProps)==null?void 0:u.toolbar)})})}const Bb=({shouldDisableDate:e,shouldDisableMonth:t,shouldDisableYear:r,minDate:o,maxDate:s,disableFuture:a,disablePast:c,timezone:u})=>{const f=qo();return k.useCallback(p=>Lp({adapter:f,value:p,timezone:u,props:{shouldDisableDate:e,shouldDisableMonth:t,shouldDisableYear:r,minDate:o,maxDate:s,disableFuture:a,disablePast:c}})!==null,[f,e,t,r,o,s,a,c,u])},QI=(e,t,r)=>(o,s)=>{switch(s.type){case"changeMonth":return K({},o,{slideDirection:s.direction,currentMonth:s.newMonth,isMonthSwitchingAnimating:!e});case"changeMonthTimezone":{const a=s.newTimezone;if(r.getTimezone(o.currentMonth)===a)return o;let c=r.setTimezone(o.currentMonth,a);return r.getMonth(c)!==r.getMonth(o.currentMonth)&&(c=r.setMonth(c,r.getMonth(o.currentMonth))),K({},o,{currentMonth:c})}case"finishMonthSwitchingAnimation":return K({},o,{isMonthSwitchingAnimating:!1});case"changeFocusedDay":{if(o.focusedDay!=null&&s.focusedDay!=null&&r.isSameDay(s.focusedDay,o.focusedDay))return o;const a=s.focusedDay!=null&&!t&&!r.isSameMonth(o.currentMonth,s.focusedDay);return K({},o,{focusedDay:s.focusedDay,isMonthSwitchingAnimating:a&&!e&&!s.withoutMonthSwitchingAnimation,currentMonth:a?r.startOfMonth(s.focusedDay):o.currentMonth,slideDirection:s.focusedDay!=null&&r.isAfterDay(s.focusedDay,o.currentMonth)?"left":"right"})}default:throw new Error("missing support")}},XI=e=>{const{value:t,referenceDate:r,disableFuture:o,disablePast:s,disableSwitchToMonthOnDayFocus:a=!1,maxDate:c,minDate:u,onMonthChange:f,reduceAnimations:p,shouldDisableDate:h,timezone:g}=e,b=ft(),S=k.useRef(QI(!!p,a,b)).current,v=k.useMemo(()=>sn.getInitialReferenceValue({value:t,utils:b,timezone:g,props:e,referenceDate:r,granularity:lr.day}),[r,g]),[x,w]=k.useReducer(S,{isMonthSwitchingAnimating:!1,focusedDay:v,currentMonth:b.startOfMonth(v),slideDirection:"left"});k.useEffect(()=>{w({type:"changeMonthTimezone",newTimezone:b.getTimezone(v)})},[v,b]);const T=k.useCallback($=>{w(K({type:"changeMonth"},$)),f&&f($.newMonth)},[f]),R=k.useCallback($=>{const O=$;b.isSameMonth(O,x.currentMonth)||T({newMonth:b.startOfMonth(O),direction:b.isAfterDay(O,x.currentMonth)?"left":"right"})},[x.currentMonth,T,b]),P=Bb({shouldDisableDate:h,minDate:u,maxDate:c,disableFuture:o,disablePast:s,timezone:g}),M=k.useCallback(()=>{w({type:"finishMonthSwitchingAnimation"})},[]),D=$e(($,O)=>{P($)||w({type:"changeFocusedDay",focusedDay:$,withoutMonthSwitchingAnimation:O})});return{referenceDate:v,calendarState:x,changeMonth:R,changeFocusedDay:D,isDateDisabled:P,onMonthSwitchingAnimationEnd:M,handleChangeMonth:T}},ZI=e=>Fe("MuiPickersFadeTransitionGroup",e);Ae("MuiPickersFadeTransitionGroup",["root"]);const JI=e=>{const{classes:t}=e;return Le({root:["root"]},ZI,t)},eO=ie(Ma,{name:"MuiPickersFadeTransitionGroup",slot:"Root",overridesResolver:(e,t)=>t.root})({display:"block",position:"relative"});function Vb(e){const t=ot({props:e,name:"MuiPickersFadeTransitionGroup"}),{children:r,className:o,reduceAnimations:s,transKey:a}=t,c=JI(t),u=Ko();return s?r:I.jsx(eO,{className:Me(c.root,o),children:I.jsx(Ki,{appear:!1,mountOnEnter:!0,unmountOnExit:!0,timeout:{appear:u.transitions.duration.enteringScreen,enter:u.transitions.duration.enteringScreen,exit:0},children:r},a)})}function tO(e){return Fe("MuiPickersDay",e)}const $o=Ae("MuiPickersDay",["root","dayWithMargin","dayOutsideMonth","hiddenDaySpacingFiller","today","selected","disabled"]),nO=["autoFocus","className","day","disabled","disableHighlightToday","disableMargin","hidden","isAnimating","onClick","onDaySelect","onFocus","onBlur","onKeyDown","onMouseDown","onMouseEnter","outsideCurrentMonth","selected","showDaysOutsideCurrentMonth","children","today","isFirstVisibleCell","isLastVisibleCell"],rO=e=>{const{selected:t,disableMargin:r,disableHighlightToday:o,today:s,disabled:a,outsideCurrentMonth:c,showDaysOutsideCurrentMonth:u,classes:f}=e,p=c&&!u;return Le({root:["root",t&&!p&&"selected",a&&"disabled",!r&&"dayWithMargin",!o&&s&&"today",c&&u&&"dayOutsideMonth",p&&"hiddenDaySpacingFiller"],hiddenDaySpacingFiller:["hiddenDaySpacingFiller"]},tO,f)},jb=({theme:e})=>K({},e.typography.caption,{width:ya,height:ya,borderRadius:"50%",padding:0,backgroundColor:"transparent",transition:e.transitions.create("background-color",{duration:e.transitions.duration.short}),color:(e.vars||e).palette.text.primary,"@media (pointer: fine)":{"&:hover":{backgroundColor:e.vars?`rgba(${e.vars.palette.primary.mainChannel} / ${e.vars.palette.action.hoverOpacity})`:nt(e.palette.primary.main,e.palette.action.hoverOpacity)}},"&:focus":{backgroundColor:e.vars?`rgba(${e.vars.palette.primary.mainChannel} / ${e.vars.palette.action.focusOpacity})`:nt(e.palette.primary.main,e.palette.action.focusOpacity),[`&.${$o.selected}`]:{willChange:"background-color",backgroundColor:(e.vars||e).palette.primary.dark}},[`&.${$o.selected}`]:{color:(e.vars||e).palette.primary.contrastText,backgroundColor:(e.vars||e).palette.primary.main,fontWeight:e.typography.fontWeightMedium,"&:hover":{willChange:"background-color",backgroundColor:(e.vars||e).palette.primary.dark}},[`&.${$o.disabled}:not(.${$o.selected})`]:{color:(e.vars||e).palette.text.disabled},[`&.${$o.disabled}&.${$o.selected}`]:{opacity:.6},variants:[{props:{disableMargin:!1},style:{margin:`0 ${iu}px`}},{props:{outsideCurrentMonth:!0,showDaysOutsideCurrentMonth:!0},style:{color:(e.vars||e).palette.text.secondary}},{props:{disableHighlightToday:!1,today:!0},style:{[`&:not(.${$o.selected})`]:{border:`1px solid ${(e.vars||e).palette.text.secondary}`}}}]}),zb=(e,t)=>{const{ownerState:r}=e;return[t.root,!r.disableMargin&&t.dayWithMargin,!r.disableHighlightToday&&r.today&&t.today,!r.outsideCurrentMonth&&r.showDaysOutsideCurrentMonth&&t.dayOutsideMonth,r.outsideCurrentMonth&&!r.showDaysOutsideCurrentMonth&&t.hiddenDaySpacingFiller]},oO=ie(go,{name:"MuiPickersDay",slot:"Root",overridesResolver:zb})(jb),iO=ie("div",{name:"MuiPickersDay",slot:"Root",overridesResolver:zb})(({theme:e})=>K({},jb({theme:e}),{opacity:0,pointerEvents:"none"})),Ys=()=>{},sO=k.forwardRef(function(t,r){const o=ot({props:t,name:"MuiPickersDay"}),{autoFocus:s=!1,className:a,day:c,disabled:u=!1,disableHighlightToday:f=!1,disableMargin:p=!1,isAnimating:h,onClick:g,onDaySelect:b,onFocus:S=Ys,onBlur:v=Ys,onKeyDown:x=Ys,onMouseDown:w=Ys,onMouseEnter:T=Ys,outsideCurrentMonth:R,selected:P=!1,showDaysOutsideCurrentMonth:M=!1,children:D,today:$=!1}=o,O=We(o,nO),N=K({},o,{autoFocus:s,disabled:u,disableHighlightToday:f,disableMargin:p,selected:P,showDaysOutsideCurrentMonth:M,today:$}),U=rO(N),C=ft(),A=k.useRef(null),H=rt(A,r);Nt(()=>{s&&!u&&!h&&!R&&A.current.focus()},[s,u,h,R]);const W=F=>{w(F),R&&F.preventDefault()},V=F=>{u||b(c),R&&F.currentTarget.focus(),g&&g(F)};return R&&!M?I.jsx(iO,{className:Me(U.root,U.hiddenDaySpacingFiller,a),ownerState:N,role:O.role}):I.jsx(oO,K({className:Me(U.root,a),ref:H,centerRipple:!0,disabled:u,tabIndex:P?0:-1,onKeyDown:F=>x(F,c),onFocus:F=>S(F,c),onBlur:F=>v(F,c),onMouseEnter:F=>T(F,c),onClick:V,onMouseDown:W},O,{ownerState:N,children:D||C.format(c,"dayOfMonth")}))}),aO=k.memo(sO),lO=e=>Fe("MuiPickersSlideTransition",e),zn=Ae("MuiPickersSlideTransition",["root","slideEnter-left","slideEnter-right","slideEnterActive","slideExit","slideExitActiveLeft-left","slideExitActiveLeft-right"]),cO=["children","className","reduceAnimations","slideDirection","transKey","classes"],uO=e=>{const{classes:t,slideDirection:r}=e,o={root:["root"],exit:["slideExit"],enterActive:["slideEnterActive"],enter:[`slideEnter-${r}`],exitActive:[`slideExitActiveLeft-${r}`]};return Le(o,lO,t)},dO=ie(Ma,{name:"MuiPickersSlideTransition",slot:"Root",overridesResolver:(e,t)=>[t.root,{[`.${zn["slideEnter-left"]}`]:t["slideEnter-left"]},{[`.${zn["slideEnter-right"]}`]:t["slideEnter-right"]},{[`.${zn.slideEnterActive}`]:t.slideEnterActive},{[`.${zn.slideExit}`]:t.slideExit},{[`.${zn["slideExitActiveLeft-left"]}`]:t["slideExitActiveLeft-left"]},{[`.${zn["slideExitActiveLeft-right"]}`]:t["slideExitActiveLeft-right"]}]})(({theme:e})=>{const t=e.transitions.create("transform",{duration:e.transitions.duration.complex,easing:"cubic-bezier(0.35, 0.8, 0.4, 1)"});return{display:"block",position:"relative",overflowX:"hidden","& > *":{position:"absolute",top:0,right:0,left:0},[`& .${zn["slideEnter-left"]}`]:{willChange:"transform",transform:"translate(100%)",zIndex:1},[`& .${zn["slideEnter-right"]}`]:{willChange:"transform",transform:"translate(-100%)",zIndex:1},[`& .${zn.slideEnterActive}`]:{transform:"translate(0%)",transition:t},[`& .${zn.slideExit}`]:{transform:"translate(0%)"},[`& .${zn["slideExitActiveLeft-left"]}`]:{willChange:"transform",transform:"translate(-100%)",transition:t,zIndex:0},[`& .${zn["slideExitActiveLeft-right"]}`]:{willChange:"transform",transform:"translate(100%)",transition:t,zIndex:0}}});function fO(e){const t=ot({props:e,name:"MuiPickersSlideTransition"}),{children:r,className:o,reduceAnimations:s,transKey:a}=t,c=We(t,cO),u=uO(t),f=Ko();if(s)return I.jsx("div",{className:Me(u.root,o),children:r});const p={exit:u.exit,enterActive:u.enterActive,enter:u.enter,exitActive:u.exitActive};return I.jsx(dO,{className:Me(u.root,o),childFactory:h=>k.cloneElement(h,{classNames:p}),role:"presentation",children:I.jsx(gp,K({mountOnEnter:!0,unmountOnExit:!0,timeout:f.transitions.duration.complex,classNames:p},c,{children:r}),a)})}const pO=e=>Fe("MuiDayCalendar",e);Ae("MuiDayCalendar",["root","header","weekDayLabel","loadingContainer","slideTransition","monthContainer","weekContainer","weekNumberLabel","weekNumber"]);const mO=["parentProps","day","focusableDay","selectedDays","isDateDisabled","currentMonthNumber","isViewFocused"],hO=["ownerState"],gO=e=>{const{classes:t}=e;return Le({root:["root"],header:["header"],weekDayLabel:["weekDayLabel"],loadingContainer:["loadingContainer"],slideTransition:["slideTransition"],monthContainer:["monthContainer"],weekContainer:["weekContainer"],weekNumberLabel:["weekNumberLabel"],weekNumber:["weekNumber"]},pO,t)},_b=(ya+iu*2)*6,yO=ie("div",{name:"MuiDayCalendar",slot:"Root",overridesResolver:(e,t)=>t.root})({}),vO=ie("div",{name:"MuiDayCalendar",slot:"Header",overridesResolver:(e,t)=>t.header})({display:"flex",justifyContent:"center",alignItems:"center"}),bO=ie(Hn,{name:"MuiDayCalendar",slot:"WeekDayLabel",overridesResolver:(e,t)=>t.weekDayLabel})(({theme:e})=>({width:36,height:40,margin:"0 2px",textAlign:"center",display:"flex",justifyContent:"center",alignItems:"center",color:(e.vars||e).palette.text.secondary})),xO=ie(Hn,{name:"MuiDayCalendar",slot:"WeekNumberLabel",overridesResolver:(e,t)=>t.weekNumberLabel})(({theme:e})=>({width:36,height:40,margin:"0 2px",textAlign:"center",display:"flex",justifyContent:"center",alignItems:"center",color:e.palette.text.disabled})),wO=ie(Hn,{name:"MuiDayCalendar",slot:"WeekNumber",overridesResolver:(e,t)=>t.weekNumber})(({theme:e})=>K({},e.typography.caption,{width:ya,height:ya,padding:0,margin:`0 ${iu}px`,color:e.palette.text.disabled,fontSize:"0.75rem",alignItems:"center",justifyContent:"center",display:"inline-flex"})),SO=ie("div",{name:"MuiDayCalendar",slot:"LoadingContainer",overridesResolver:(e,t)=>t.loadingContainer})({display:"flex",justifyContent:"center",alignItems:"center",minHeight:_b}),CO=ie(fO,{name:"MuiDayCalendar",slot:"SlideTransition",overridesResolver:(e,t)=>t.slideTransition})({minHeight:_b}),kO=ie("div",{name:"MuiDayCalendar",slot:"MonthContainer",overridesResolver:(e,t)=>t.monthContainer})({overflow:"hidden"}),TO=ie("div",{name:"MuiDayCalendar",slot:"WeekContainer",overridesResolver:(e,t)=>t.weekContainer})({margin:`${iu}px 0`,display:"flex",justifyContent:"center"});function PO(e){let{parentProps:t,day:r,focusableDay:o,selectedDays:s,isDateDisabled:a,currentMonthNumber:c,isViewFocused:u}=e,f=We(e,mO);const{disabled:p,disableHighlightToday:h,isMonthSwitchingAnimating:g,showDaysOutsideCurrentMonth:b,slots:S,slotProps:v,timezone:x}=t,w=ft(),T=Go(x),R=o!==null&&w.isSameDay(r,o),P=s.some(H=>w.isSameDay(H,r)),M=w.isSameDay(r,T),D=(S==null?void 0:S.day)??aO,$=Je({elementType:D,externalSlotProps:v==null?void 0:v.day,additionalProps:K({disableHighlightToday:h,showDaysOutsideCurrentMonth:b,role:"gridcell",isAnimating:g,"data-timestamp":w.toJsDate(r).valueOf()},f),ownerState:K({},t,{day:r,selected:P})}),O=We($,hO),N=k.useMemo(()=>p||a(r),[p,a,r]),U=k.useMemo(()=>w.getMonth(r)!==c,[w,r,c]),C=k.useMemo(()=>{const H=w.startOfMonth(w.setMonth(r,c));return b?w.isSameDay(r,w.startOfWeek(H)):w.isSameDay(r,H)},[c,r,b,w]),A=k.useMemo(()=>{const H=w.endOfMonth(w.setMonth(r,c));return b?w.isSameDay(r,w.endOfWeek(H)):w.isSameDay(r,H)},[c,r,b,w]);return I.jsx(D,K({},O,{day:r,disabled:N,autoFocus:u&&R,today:M,outsideCurrentMonth:U,isFirstVisibleCell:C,isLastVisibleCell:A,selected:P,tabIndex:R?0:-1,"aria-selected":P,"aria-current":M?"date":void 0}))}function MO(e){const t=ot({props:e,name:"MuiDayCalendar"}),r=ft(),{onFocusedDayChange:o,className:s,currentMonth:a,selectedDays:c,focusedDay:u,loading:f,onSelectedDaysChange:p,onMonthSwitchingAnimationEnd:h,readOnly:g,reduceAnimations:b,renderLoading:S=()=>I.jsx("span",{children:"..."}),slideDirection:v,TransitionProps:x,disablePast:w,disableFuture:T,minDate:R,maxDate:P,shouldDisableDate:M,shouldDisableMonth:D,shouldDisableYear:$,dayOfWeekFormatter:O=he=>r.format(he,"weekdayShort").charAt(0).toUpperCase(),hasFocus:N,onFocusedViewChange:U,gridLabelId:C,displayWeekNumber:A,fixedWeekNumber:H,autoFocus:W,timezone:V}=t,F=Go(V),B=gO(t),Y=an(),j=Bb({shouldDisableDate:M,shouldDisableMonth:D,shouldDisableYear:$,minDate:R,maxDate:P,disablePast:w,disableFuture:T,timezone:V}),_=Sn(),[q,L]=Ur({name:"DayCalendar",state:"hasFocus",controlled:N,default:W??!1}),[Q,te]=k.useState(()=>u||F),ae=$e(he=>{g||p(he)}),Z=he=>{j(he)||(o(he),te(he),U==null||U(!0),L(!0))},le=$e((he,de)=>{switch(he.key){case"ArrowUp":Z(r.addDays(de,-7)),he.preventDefault();break;case"ArrowDown":Z(r.addDays(de,7)),he.preventDefault();break;case"ArrowLeft":{const ge=r.addDays(de,Y?1:-1),we=r.addMonths(de,Y?1:-1),Ce=sa({utils:r,date:ge,minDate:Y?ge:r.startOfMonth(we),maxDate:Y?r.endOfMonth(we):ge,isDateDisabled:j,timezone:V});Z(Ce||ge),he.preventDefault();break}case"ArrowRight":{const ge=r.addDays(de,Y?-1:1),we=r.addMonths(de,Y?-1:1),Ce=sa({utils:r,date:ge,minDate:Y?r.startOfMonth(we):ge,maxDate:Y?ge:r.endOfMonth(we),isDateDisabled:j,timezone:V});Z(Ce||ge),he.preventDefault();break}case"Home":Z(r.startOfWeek(de)),he.preventDefault();break;case"End":Z(r.endOfWeek(de)),he.preventDefault();break;case"PageUp":Z(r.addMonths(de,1)),he.preventDefault();break;case"PageDown":Z(r.addMonths(de,-1)),he.preventDefault();break}}),ue=$e((he,de)=>Z(de)),J=$e((he,de)=>{q&&r.isSameDay(Q,de)&&(U==null||U(!1))}),ne=r.getMonth(a),fe=r.getYear(a),be=k.useMemo(()=>c.filter(he=>!!he).map(he=>r.startOfDay(he)),[r,c]),ve=`${fe}-${ne}`,ee=k.useMemo(()=>k.createRef(),[ve]),me=k.useMemo(()=>{const he=r.startOfMonth(a),de=r.endOfMonth(a);return j(Q)||r.isAfterDay(Q,de)||r.isBeforeDay(Q,he)?sa({utils:r,date:Q,minDate:he,maxDate:de,disablePast:w,disableFuture:T,isDateDisabled:j,timezone:V}):Q},[a,T,w,Q,j,r,V]),xe=k.useMemo(()=>{const he=r.getWeekArray(a);let de=r.addMonths(a,1);for(;H&&he.length<H;){const ge=r.getWeekArray(de),we=r.isSameDay(he[he.length-1][0],ge[0][0]);ge.slice(we?1:0).forEach(Ce=>{he.length<H&&he.push(Ce)}),de=r.addMonths(de,1)}return he},[a,H,r]);return I.jsxs(yO,{role:"grid","aria-labelledby":C,className:B.root,children:[I.jsxs(vO,{role:"row",className:B.header,children:[A&&I.jsx(xO,{variant:"caption",role:"columnheader","aria-label":_.calendarWeekNumberHeaderLabel,className:B.weekNumberLabel,children:_.calendarWeekNumberHeaderText}),IE(r,F).map((he,de)=>I.jsx(bO,{variant:"caption",role:"columnheader","aria-label":r.format(he,"weekday"),className:B.weekDayLabel,children:O(he)},de.toString()))]}),f?I.jsx(SO,{className:B.loadingContainer,children:S()}):I.jsx(CO,K({transKey:ve,onExited:h,reduceAnimations:b,slideDirection:v,className:Me(s,B.slideTransition)},x,{nodeRef:ee,children:I.jsx(kO,{ref:ee,role:"rowgroup",className:B.monthContainer,children:xe.map((he,de)=>I.jsxs(TO,{role:"row",className:B.weekContainer,"aria-rowindex":de+1,children:[A&&I.jsx(wO,{className:B.weekNumber,role:"rowheader","aria-label":_.calendarWeekNumberAriaLabelText(r.getWeekNumber(he[0])),children:_.calendarWeekNumberText(r.getWeekNumber(he[0]))}),he.map((ge,we)=>I.jsx(PO,{parentProps:t,day:ge,selectedDays:be,focusableDay:me,onKeyDown:le,onFocus:ue,onBlur:J,onDaySelect:ae,isDateDisabled:j,currentMonthNumber:ne,isViewFocused:q,"aria-colindex":we+1},ge.toString()))]},`week-${he[0]}`))})}))]})}function RO(e){return Fe("MuiPickersMonth",e)}const Zl=Ae("MuiPickersMonth",["root","monthButton","disabled","selected"]),DO=["autoFocus","className","children","disabled","selected","value","tabIndex","onClick","onKeyDown","onFocus","onBlur","aria-current","aria-label","monthsPerRow","slots","slotProps"],EO=e=>{const{disabled:t,selected:r,classes:o}=e;return Le({root:["root"],monthButton:["monthButton",t&&"disabled",r&&"selected"]},RO,o)},IO=ie("div",{name:"MuiPickersMonth",slot:"Root",overridesResolver:(e,t)=>[t.root]})({display:"flex",alignItems:"center",justifyContent:"center",flexBasis:"33.3%",variants:[{props:{monthsPerRow:4},style:{flexBasis:"25%"}}]}),OO=ie("button",{name:"MuiPickersMonth",slot:"MonthButton",overridesResolver:(e,t)=>[t.monthButton,{[`&.${Zl.disabled}`]:t.disabled},{[`&.${Zl.selected}`]:t.selected}]})(({theme:e})=>K({color:"unset",backgroundColor:"transparent",border:0,outline:0},e.typography.subtitle1,{margin:"8px 0",height:36,width:72,borderRadius:18,cursor:"pointer","&:focus":{backgroundColor:e.vars?`rgba(${e.vars.palette.action.activeChannel} / ${e.vars.palette.action.hoverOpacity})`:nt(e.palette.action.active,e.palette.action.hoverOpacity)},"&:hover":{backgroundColor:e.vars?`rgba(${e.vars.palette.action.activeChannel} / ${e.vars.palette.action.hoverOpacity})`:nt(e.palette.action.active,e.palette.action.hoverOpacity)},"&:disabled":{cursor:"auto",pointerEvents:"none"},[`&.${Zl.disabled}`]:{color:(e.vars||e).palette.text.secondary},[`&.${Zl.selected}`]:{color:(e.vars||e).palette.primary.contrastText,backgroundColor:(e.vars||e).palette.primary.main,"&:focus, &:hover":{backgroundColor:(e.vars||e).palette.primary.dark}}})),$O=k.memo(function(t){const r=ot({props:t,name:"MuiPickersMonth"}),{autoFocus:o,className:s,children:a,disabled:c,selected:u,value:f,tabIndex:p,onClick:h,onKeyDown:g,onFocus:b,onBlur:S,"aria-current":v,"aria-label":x,slots:w,slotProps:T}=r,R=We(r,DO),P=k.useRef(null),M=EO(r);Nt(()=>{var O;o&&((O=P.current)==null||O.focus())},[o]);const D=(w==null?void 0:w.monthButton)??OO,$=Je({elementType:D,externalSlotProps:T==null?void 0:T.monthButton,additionalProps:{children:a,disabled:c,tabIndex:p,ref:P,type:"button",role:"radio","aria-current":v,"aria-checked":u,"aria-label":x,onClick:O=>h(O,f),onKeyDown:O=>g(O,f),onFocus:O=>b(O,f),onBlur:O=>S(O,f)},ownerState:r,className:M.monthButton});return I.jsx(IO,K({className:Me(M.root,s),ownerState:r},R,{children:I.jsx(D,K({},$))}))});function AO(e){return Fe("MuiMonthCalendar",e)}Ae("MuiMonthCalendar",["root"]);const NO=["className","value","defaultValue","referenceDate","disabled","disableFuture","disablePast","maxDate","minDate","onChange","shouldDisableMonth","readOnly","disableHighlightToday","autoFocus","onMonthFocus","hasFocus","onFocusedViewChange","monthsPerRow","timezone","gridLabelId","slots","slotProps"],LO=e=>{const{classes:t}=e;return Le({root:["root"]},AO,t)};function FO(e,t){const r=ft(),o=Ia(),s=ot({props:e,name:t});return K({disableFuture:!1,disablePast:!1},s,{minDate:Gn(r,s.minDate,o.minDate),maxDate:Gn(r,s.maxDate,o.maxDate)})}const BO=ie("div",{name:"MuiMonthCalendar",slot:"Root",overridesResolver:(e,t)=>t.root})({display:"flex",flexWrap:"wrap",alignContent:"stretch",padding:"0 4px",width:su,boxSizing:"border-box"}),VO=k.forwardRef(function(t,r){const o=FO(t,"MuiMonthCalendar"),{className:s,value:a,defaultValue:c,referenceDate:u,disabled:f,disableFuture:p,disablePast:h,maxDate:g,minDate:b,onChange:S,shouldDisableMonth:v,readOnly:x,autoFocus:w=!1,onMonthFocus:T,hasFocus:R,onFocusedViewChange:P,monthsPerRow:M=3,timezone:D,gridLabelId:$,slots:O,slotProps:N}=o,U=We(o,NO),{value:C,handleValueChange:A,timezone:H}=qi({name:"MonthCalendar",timezone:D,value:a,defaultValue:c,referenceDate:u,onChange:S,valueManager:sn}),W=Go(H),V=an(),F=ft(),B=k.useMemo(()=>sn.getInitialReferenceValue({value:C,utils:F,props:o,timezone:H,referenceDate:u,granularity:lr.month}),[]),Y=o,j=LO(Y),_=k.useMemo(()=>F.getMonth(W),[F,W]),q=k.useMemo(()=>C!=null?F.getMonth(C):null,[C,F]),[L,Q]=k.useState(()=>q||F.getMonth(B)),[te,ae]=Ur({name:"MonthCalendar",state:"hasFocus",controlled:R,default:w??!1}),Z=$e(ve=>{ae(ve),P&&P(ve)}),le=k.useCallback(ve=>{const ee=F.startOfMonth(h&&F.isAfter(W,b)?W:b),me=F.startOfMonth(p&&F.isBefore(W,g)?W:g),xe=F.startOfMonth(ve);return F.isBefore(xe,ee)||F.isAfter(xe,me)?!0:v?v(xe):!1},[p,h,g,b,W,v,F]),ue=$e((ve,ee)=>{if(x)return;const me=F.setMonth(C??B,ee);A(me)}),J=$e(ve=>{le(F.setMonth(C??B,ve))||(Q(ve),Z(!0),T&&T(ve))});k.useEffect(()=>{Q(ve=>q!==null&&ve!==q?q:ve)},[q]);const ne=$e((ve,ee)=>{switch(ve.key){case"ArrowUp":J((12+ee-3)%12),ve.preventDefault();break;case"ArrowDown":J((12+ee+3)%12),ve.preventDefault();break;case"ArrowLeft":J((12+ee+(V?1:-1))%12),ve.preventDefault();break;case"ArrowRight":J((12+ee+(V?-1:1))%12),ve.preventDefault();break}}),fe=$e((ve,ee)=>{J(ee)}),be=$e((ve,ee)=>{L===ee&&Z(!1)});return I.jsx(BO,K({ref:r,className:Me(j.root,s),ownerState:Y,role:"radiogroup","aria-labelledby":$},U,{children:Op(F,C??B).map(ve=>{const ee=F.getMonth(ve),me=F.format(ve,"monthShort"),xe=F.format(ve,"month"),he=ee===q,de=f||le(ve);return I.jsx($O,{selected:he,value:ee,onClick:ue,onKeyDown:ne,autoFocus:te&&ee===L,disabled:de,tabIndex:ee===L&&!de?0:-1,onFocus:fe,onBlur:be,"aria-current":_===ee?"date":void 0,"aria-label":xe,monthsPerRow:M,slots:O,slotProps:N,children:me},me)})}))});function jO(e){return Fe("MuiPickersYear",e)}const Jl=Ae("MuiPickersYear",["root","yearButton","selected","disabled"]),zO=["autoFocus","className","children","disabled","selected","value","tabIndex","onClick","onKeyDown","onFocus","onBlur","aria-current","yearsPerRow","slots","slotProps"],_O=e=>{const{disabled:t,selected:r,classes:o}=e;return Le({root:["root"],yearButton:["yearButton",t&&"disabled",r&&"selected"]},jO,o)},WO=ie("div",{name:"MuiPickersYear",slot:"Root",overridesResolver:(e,t)=>[t.root]})({display:"flex",alignItems:"center",justifyContent:"center",flexBasis:"33.3%",variants:[{props:{yearsPerRow:4},style:{flexBasis:"25%"}}]}),UO=ie("button",{name:"MuiPickersYear",slot:"YearButton",overridesResolver:(e,t)=>[t.yearButton,{[`&.${Jl.disabled}`]:t.disabled},{[`&.${Jl.selected}`]:t.selected}]})(({theme:e})=>K({color:"unset",backgroundColor:"transparent",border:0,outline:0},e.typography.subtitle1,{margin:"6px 0",height:36,width:72,borderRadius:18,cursor:"pointer","&:focus":{backgroundColor:e.vars?`rgba(${e.vars.palette.action.activeChannel} / ${e.vars.palette.action.focusOpacity})`:nt(e.palette.action.active,e.palette.action.focusOpacity)},"&:hover":{backgroundColor:e.vars?`rgba(${e.vars.palette.action.activeChannel} / ${e.vars.palette.action.hoverOpacity})`:nt(e.palette.action.active,e.palette.action.hoverOpacity)},"&:disabled":{cursor:"auto",pointerEvents:"none"},[`&.${Jl.disabled}`]:{color:(e.vars||e).palette.text.secondary},[`&.${Jl.selected}`]:{color:(e.vars||e).palette.primary.contrastText,backgroundColor:(e.vars||e).palette.primary.main,"&:focus, &:hover":{backgroundColor:(e.vars||e).palette.primary.dark}}})),HO=k.memo(function(t){const r=ot({props:t,name:"MuiPickersYear"}),{autoFocus:o,className:s,children:a,disabled:c,selected:u,value:f,tabIndex:p,onClick:h,onKeyDown:g,onFocus:b,onBlur:S,"aria-current":v,slots:x,slotProps:w}=r,T=We(r,zO),R=k.useRef(null),P=_O(r);Nt(()=>{var $;o&&(($=R.current)==null||$.focus())},[o]);const M=(x==null?void 0:x.yearButton)??UO,D=Je({elementType:M,externalSlotProps:w==null?void 0:w.yearButton,additionalProps:{children:a,disabled:c,tabIndex:p,ref:R,type:"button",role:"radio","aria-current":v,"aria-checked":u,onClick:$=>h($,f),onKeyDown:$=>g($,f),onFocus:$=>b($,f),onBlur:$=>S($,f)},ownerState:r,className:P.yearButton});return I.jsx(WO,K({className:Me(P.root,s),ownerState:r},T,{children:I.jsx(M,K({},D))}))});function YO(e){return Fe("MuiYearCalendar",e)}Ae("MuiYearCalendar",["root"]);const KO=["autoFocus","className","value","defaultValue","referenceDate","disabled","disableFuture","disablePast","maxDate","minDate","onChange","readOnly","shouldDisableYear","disableHighlightToday","onYearFocus","hasFocus","onFocusedViewChange","yearsOrder","yearsPerRow","timezone","gridLabelId","slots","slotProps"],qO=e=>{const{classes:t}=e;return Le({root:["root"]},YO,t)};function GO(e,t){const r=ft(),o=Ia(),s=ot({props:e,name:t});return K({disablePast:!1,disableFuture:!1},s,{yearsPerRow:s.yearsPerRow??3,minDate:Gn(r,s.minDate,o.minDate),maxDate:Gn(r,s.maxDate,o.maxDate)})}const QO=ie("div",{name:"MuiYearCalendar",slot:"Root",overridesResolver:(e,t)=>t.root})({display:"flex",flexDirection:"row",flexWrap:"wrap",overflowY:"auto",height:"100%",padding:"0 4px",width:su,maxHeight:zI,boxSizing:"border-box",position:"relative"}),XO=k.forwardRef(function(t,r){const o=GO(t,"MuiYearCalendar"),{autoFocus:s,className:a,value:c,defaultValue:u,referenceDate:f,disabled:p,disableFuture:h,disablePast:g,maxDate:b,minDate:S,onChange:v,readOnly:x,shouldDisableYear:w,onYearFocus:T,hasFocus:R,onFocusedViewChange:P,yearsOrder:M="asc",yearsPerRow:D,timezone:$,gridLabelId:O,slots:N,slotProps:U}=o,C=We(o,KO),{value:A,handleValueChange:H,timezone:W}=qi({name:"YearCalendar",timezone:$,value:c,defaultValue:u,referenceDate:f,onChange:v,valueManager:sn}),V=Go(W),F=an(),B=ft(),Y=k.useMemo(()=>sn.getInitialReferenceValue({value:A,utils:B,props:o,timezone:W,referenceDate:f,granularity:lr.year}),[]),j=o,_=qO(j),q=k.useMemo(()=>B.getYear(V),[B,V]),L=k.useMemo(()=>A!=null?B.getYear(A):null,[A,B]),[Q,te]=k.useState(()=>L||B.getYear(Y)),[ae,Z]=Ur({name:"YearCalendar",state:"hasFocus",controlled:R,default:s??!1}),le=$e(ge=>{Z(ge),P&&P(ge)}),ue=k.useCallback(ge=>{if(g&&B.isBeforeYear(ge,V)||h&&B.isAfterYear(ge,V)||S&&B.isBeforeYear(ge,S)||b&&B.isAfterYear(ge,b))return!0;if(!w)return!1;const we=B.startOfYear(ge);return w(we)},[h,g,b,S,V,w,B]),J=$e((ge,we)=>{if(x)return;const Ce=B.setYear(A??Y,we);H(Ce)}),ne=$e(ge=>{ue(B.setYear(A??Y,ge))||(te(ge),le(!0),T==null||T(ge))});k.useEffect(()=>{te(ge=>L!==null&&ge!==L?L:ge)},[L]);const fe=M!=="desc"?D*1:D*-1,be=F&&M==="asc"||!F&&M==="desc"?-1:1,ve=$e((ge,we)=>{switch(ge.key){case"ArrowUp":ne(we-fe),ge.preventDefault();break;case"ArrowDown":ne(we+fe),ge.preventDefault();break;case"ArrowLeft":ne(we-be),ge.preventDefault();break;case"ArrowRight":ne(we+be),ge.preventDefault();break}}),ee=$e((ge,we)=>{ne(we)}),me=$e((ge,we)=>{Q===we&&le(!1)}),xe=k.useRef(null),he=rt(r,xe);k.useEffect(()=>{if(s||xe.current===null)return;const ge=xe.current.querySelector('[tabindex="0"]');if(!ge)return;const we=ge.offsetHeight,Ce=ge.offsetTop,Ie=xe.current.clientHeight,Oe=xe.current.scrollTop,mt=Ce+we;we>Ie||Ce<Oe||(xe.current.scrollTop=mt-Ie/2-we/2)},[s]);const de=B.getYearRange([S,b]);return M==="desc"&&de.reverse(),I.jsx(QO,K({ref:he,className:Me(_.root,a),ownerState:j,role:"radiogroup","aria-labelledby":O},C,{children:de.map(ge=>{const we=B.getYear(ge),Ce=we===L,Ie=p||ue(ge);return I.jsx(HO,{selected:Ce,value:we,onClick:J,onKeyDown:ve,autoFocus:ae&&we===Q,disabled:Ie,tabIndex:we===Q&&!Ie?0:-1,onFocus:ee,onBlur:me,"aria-current":q===we?"date":void 0,yearsPerRow:D,slots:N,slotProps:U,children:B.format(ge,"year")},B.format(ge,"year"))})}))});function Oa({onChange:e,onViewChange:t,openTo:r,view:o,views:s,autoFocus:a,focusedView:c,onFocusedViewChange:u}){const f=k.useRef(r),p=k.useRef(s),h=k.useRef(s.includes(r)?r:s[0]),[g,b]=Ur({name:"useViews",state:"view",controlled:o,default:h.current}),S=k.useRef(a?g:null),[v,x]=Ur({name:"useViews",state:"focusedView",controlled:c,default:S.current});k.useEffect(()=>{(f.current&&f.current!==r||p.current&&p.current.some(O=>!s.includes(O)))&&(b(s.includes(r)?r:s[0]),p.current=s,f.current=r)},[r,b,g,s]);const w=s.indexOf(g),T=s[w-1]??null,R=s[w+1]??null,P=$e((O,N)=>{x(N?O:U=>O===U?null:U),u==null||u(O,N)}),M=$e(O=>{P(O,!0),O!==g&&(b(O),t&&t(O))}),D=$e(()=>{R&&M(R)}),$=$e((O,N,U)=>{const C=N==="finish",A=U?s.indexOf(U)<s.length-1:!!R;if(e(O,C&&A?"partial":N,U),U&&U!==g){const W=s[s.indexOf(U)+1];W&&M(W)}else C&&D()});return{view:g,setView:M,focusedView:v,setFocusedView:P,nextView:R,previousView:T,defaultView:s.includes(r)?r:s[0],goToNextView:D,setValueAndGoToNextView:$}}const ZO=e=>Fe("MuiPickersCalendarHeader",e),JO=Ae("MuiPickersCalendarHeader",["root","labelContainer","label","switchViewButton","switchViewIcon"]);function e$(e){return Fe("MuiPickersArrowSwitcher",e)}Ae("MuiPickersArrowSwitcher",["root","spacer","button","previousIconButton","nextIconButton","leftArrowIcon","rightArrowIcon"]);const t$=["children","className","slots","slotProps","isNextDisabled","isNextHidden","onGoToNext","nextLabel","isPreviousDisabled","isPreviousHidden","onGoToPrevious","previousLabel","labelId"],n$=["ownerState"],r$=["ownerState"],o$=ie("div",{name:"MuiPickersArrowSwitcher",slot:"Root",overridesResolver:(e,t)=>t.root})({display:"flex"}),i$=ie("div",{name:"MuiPickersArrowSwitcher",slot:"Spacer",overridesResolver:(e,t)=>t.spacer})(({theme:e})=>({width:e.spacing(3)})),dv=ie(Hi,{name:"MuiPickersArrowSwitcher",slot:"Button",overridesResolver:(e,t)=>t.button})({variants:[{props:{hidden:!0},style:{visibility:"hidden"}}]}),s$=e=>{const{classes:t}=e;return Le({root:["root"],spacer:["spacer"],button:["button"],previousIconButton:["previousIconButton"],nextIconButton:["nextIconButton"],leftArrowIcon:["leftArrowIcon"],rightArrowIcon:["rightArrowIcon"]},e$,t)},Wb=k.forwardRef(function(t,r){const o=an(),s=ot({props:t,name:"MuiPickersArrowSwitcher"}),{children:a,className:c,slots:u,slotProps:f,isNextDisabled:p,isNextHidden:h,onGoToNext:g,nextLabel:b,isPreviousDisabled:S,isPreviousHidden:v,onGoToPrevious:x,previousLabel:w,labelId:T}=s,R=We(s,t$),P=s,M=s$(P),D={isDisabled:p,isHidden:h,goTo:g,label:b},$={isDisabled:S,isHidden:v,goTo:x,label:w},O=(u==null?void 0:u.previousIconButton)??dv,N=Je({elementType:O,externalSlotProps:f==null?void 0:f.previousIconButton,additionalProps:{size:"medium",title:$.label,"aria-label":$.label,disabled:$.isDisabled,edge:"end",onClick:$.goTo},ownerState:K({},P,{hidden:$.isHidden}),className:Me(M.button,M.previousIconButton)}),U=(u==null?void 0:u.nextIconButton)??dv,C=Je({elementType:U,externalSlotProps:f==null?void 0:f.nextIconButton,additionalProps:{size:"medium",title:D.label,"aria-label":D.label,disabled:D.isDisabled,edge:"start",onClick:D.goTo},ownerState:K({},P,{hidden:D.isHidden}),className:Me(M.button,M.nextIconButton)}),A=(u==null?void 0:u.leftArrowIcon)??y2,H=Je({elementType:A,externalSlotProps:f==null?void 0:f.leftArrowIcon,additionalProps:{fontSize:"inherit"},ownerState:P,className:M.leftArrowIcon}),W=We(H,n$),V=(u==null?void 0:u.rightArrowIcon)??v2,F=Je({elementType:V,externalSlotProps:f==null?void 0:f.rightArrowIcon,additionalProps:{fontSize:"inherit"},ownerState:P,className:M.rightArrowIcon}),B=We(F,r$);return I.jsxs(o$,K({ref:r,className:Me(M.root,c),ownerState:P},R,{children:[I.jsx(O,K({},N,{children:o?I.jsx(V,K({},B)):I.jsx(A,K({},W))})),a?I.jsx(Hn,{variant:"subtitle1",component:"span",id:T,children:a}):I.jsx(i$,{className:M.spacer,ownerState:P}),I.jsx(U,K({},C,{children:o?I.jsx(A,K({},W)):I.jsx(V,K({},B))}))]}))}),a$=["slots","slotProps","currentMonth","disabled","disableFuture","disablePast","maxDate","minDate","onMonthChange","onViewChange","view","reduceAnimations","views","labelId","className","timezone","format"],l$=["ownerState"],c$=e=>{const{classes:t}=e;return Le({root:["root"],labelContainer:["labelContainer"],label:["label"],switchViewButton:["switchViewButton"],switchViewIcon:["switchViewIcon"]},ZO,t)},u$=ie("div",{name:"MuiPickersCalendarHeader",slot:"Root",overridesResolver:(e,t)=>t.root})({display:"flex",alignItems:"center",marginTop:12,marginBottom:4,paddingLeft:24,paddingRight:12,maxHeight:40,minHeight:40}),d$=ie("div",{name:"MuiPickersCalendarHeader",slot:"LabelContainer",overridesResolver:(e,t)=>t.labelContainer})(({theme:e})=>K({display:"flex",overflow:"hidden",alignItems:"center",cursor:"pointer",marginRight:"auto"},e.typography.body1,{fontWeight:e.typography.fontWeightMedium})),f$=ie("div",{name:"MuiPickersCalendarHeader",slot:"Label",overridesResolver:(e,t)=>t.label})({marginRight:6}),p$=ie(Hi,{name:"MuiPickersCalendarHeader",slot:"SwitchViewButton",overridesResolver:(e,t)=>t.switchViewButton})({marginRight:"auto",variants:[{props:{view:"year"},style:{[`.${JO.switchViewIcon}`]:{transform:"rotate(180deg)"}}}]}),m$=ie(g2,{name:"MuiPickersCalendarHeader",slot:"SwitchViewIcon",overridesResolver:(e,t)=>t.switchViewIcon})(({theme:e})=>({willChange:"transform",transition:e.transitions.create("transform"),transform:"rotate(0deg)"})),h$=k.forwardRef(function(t,r){const o=Sn(),s=ft(),a=ot({props:t,name:"MuiPickersCalendarHeader"}),{slots:c,slotProps:u,currentMonth:f,disabled:p,disableFuture:h,disablePast:g,maxDate:b,minDate:S,onMonthChange:v,onViewChange:x,view:w,reduceAnimations:T,views:R,labelId:P,className:M,timezone:D,format:$=`${s.formats.month} ${s.formats.year}`}=a,O=We(a,a$),N=a,U=c$(a),C=(c==null?void 0:c.switchViewButton)??p$,A=Je({elementType:C,externalSlotProps:u==null?void 0:u.switchViewButton,additionalProps:{size:"small","aria-label":o.calendarViewSwitchingButtonAriaLabel(w)},ownerState:N,className:U.switchViewButton}),H=(c==null?void 0:c.switchViewIcon)??m$,W=Je({elementType:H,externalSlotProps:u==null?void 0:u.switchViewIcon,ownerState:N,className:U.switchViewIcon}),V=We(W,l$),F=()=>v(s.addMonths(f,1),"left"),B=()=>v(s.addMonths(f,-1),"right"),Y=VI(f,{disableFuture:h,maxDate:b,timezone:D}),j=jI(f,{disablePast:g,minDate:S,timezone:D}),_=()=>{if(!(R.length===1||!x||p))if(R.length===2)x(R.find(L=>L!==w)||R[0]);else{const L=R.indexOf(w)!==0?0:1;x(R[L])}};if(R.length===1&&R[0]==="year")return null;const q=s.formatByString(f,$);return I.jsxs(u$,K({},O,{ownerState:N,className:Me(U.root,M),ref:r,children:[I.jsxs(d$,{role:"presentation",onClick:_,ownerState:N,"aria-live":"polite",className:U.labelContainer,children:[I.jsx(Vb,{reduceAnimations:T,transKey:q,children:I.jsx(f$,{id:P,ownerState:N,className:U.label,children:q})}),R.length>1&&!p&&I.jsx(C,K({},A,{children:I.jsx(H,K({},V))}))]}),I.jsx(Ki,{in:w==="day",children:I.jsx(Wb,{slots:c,slotProps:u,onGoToPrevious:B,isPreviousDisabled:j,previousLabel:o.previousMonth,onGoToNext:F,isNextDisabled:Y,nextLabel:o.nextMonth})})]}))}),lu=ie("div")({overflow:"hidden",width:su,maxHeight:au,display:"flex",flexDirection:"column",margin:"0 auto"}),g$="@media (prefers-reduced-motion: reduce)",Oi=typeof navigator<"u"&&navigator.userAgent.match(/android\s(\d+)|OS\s(\d+)/i),fv=Oi&&Oi[1]?parseInt(Oi[1],10):null,pv=Oi&&Oi[2]?parseInt(Oi[2],10):null,y$=fv&&fv<10||pv&&pv<13||!1,Ub=()=>Z0(g$,{defaultMatches:!1})||y$,v$=e=>Fe("MuiDateCalendar",e);Ae("MuiDateCalendar",["root","viewTransitionContainer"]);const b$=["autoFocus","onViewChange","value","defaultValue","referenceDate","disableFuture","disablePast","onChange","onYearChange","onMonthChange","reduceAnimations","shouldDisableDate","shouldDisableMonth","shouldDisableYear","view","views","openTo","className","disabled","readOnly","minDate","maxDate","disableHighlightToday","focusedView","onFocusedViewChange","showDaysOutsideCurrentMonth","fixedWeekNumber","dayOfWeekFormatter","slots","slotProps","loading","renderLoading","displayWeekNumber","yearsOrder","yearsPerRow","monthsPerRow","timezone"],x$=e=>{const{classes:t}=e;return Le({root:["root"],viewTransitionContainer:["viewTransitionContainer"]},v$,t)};function w$(e,t){const r=ft(),o=Ia(),s=Ub(),a=ot({props:e,name:t});return K({},a,{loading:a.loading??!1,disablePast:a.disablePast??!1,disableFuture:a.disableFuture??!1,openTo:a.openTo??"day",views:a.views??["year","day"],reduceAnimations:a.reduceAnimations??s,renderLoading:a.renderLoading??(()=>I.jsx("span",{children:"..."})),minDate:Gn(r,a.minDate,o.minDate),maxDate:Gn(r,a.maxDate,o.maxDate)})}const S$=ie(lu,{name:"MuiDateCalendar",slot:"Root",overridesResolver:(e,t)=>t.root})({display:"flex",flexDirection:"column",height:au}),C$=ie(Vb,{name:"MuiDateCalendar",slot:"ViewTransitionContainer",overridesResolver:(e,t)=>t.viewTransitionContainer})({}),k$=k.forwardRef(function(t,r){const o=ft(),s=Yr(),a=w$(t,"MuiDateCalendar"),{autoFocus:c,onViewChange:u,value:f,defaultValue:p,referenceDate:h,disableFuture:g,disablePast:b,onChange:S,onYearChange:v,onMonthChange:x,reduceAnimations:w,shouldDisableDate:T,shouldDisableMonth:R,shouldDisableYear:P,view:M,views:D,openTo:$,className:O,disabled:N,readOnly:U,minDate:C,maxDate:A,disableHighlightToday:H,focusedView:W,onFocusedViewChange:V,showDaysOutsideCurrentMonth:F,fixedWeekNumber:B,dayOfWeekFormatter:Y,slots:j,slotProps:_,loading:q,renderLoading:L,displayWeekNumber:Q,yearsOrder:te,yearsPerRow:ae,monthsPerRow:Z,timezone:le}=a,ue=We(a,b$),{value:J,handleValueChange:ne,timezone:fe}=qi({name:"DateCalendar",timezone:le,value:f,defaultValue:p,referenceDate:h,onChange:S,valueManager:sn}),{view:be,setView:ve,focusedView:ee,setFocusedView:me,goToNextView:xe,setValueAndGoToNextView:he}=Oa({view:M,views:D,openTo:$,onChange:ne,onViewChange:u,autoFocus:c,focusedView:W,onFocusedViewChange:V}),{referenceDate:de,calendarState:ge,changeFocusedDay:we,changeMonth:Ce,handleChangeMonth:Ie,isDateDisabled:Oe,onMonthSwitchingAnimationEnd:mt}=XI({value:J,referenceDate:h,reduceAnimations:w,onMonthChange:x,minDate:C,maxDate:A,shouldDisableDate:T,disablePast:b,disableFuture:g,timezone:fe}),lt=N&&J||C,tt=N&&J||A,ht=`${s}-grid-label`,Tt=ee!==null,Rt=(j==null?void 0:j.calendarHeader)??h$,Xt=Je({elementType:Rt,externalSlotProps:_==null?void 0:_.calendarHeader,additionalProps:{views:D,view:be,currentMonth:ge.currentMonth,onViewChange:ve,onMonthChange:(Ue,bt)=>Ie({newMonth:Ue,direction:bt}),minDate:lt,maxDate:tt,disabled:N,disablePast:b,disableFuture:g,reduceAnimations:w,timezone:fe,labelId:ht},ownerState:a}),Wt=$e(Ue=>{const bt=o.startOfMonth(Ue),Bt=o.endOfMonth(Ue),Ot=Oe(Ue)?sa({utils:o,date:Ue,minDate:o.isBefore(C,bt)?bt:C,maxDate:o.isAfter(A,Bt)?Bt:A,disablePast:b,disableFuture:g,isDateDisabled:Oe,timezone:fe}):Ue;Ot?(he(Ot,"finish"),x==null||x(bt)):(xe(),Ce(bt)),we(Ot,!0)}),Xe=$e(Ue=>{const bt=o.startOfYear(Ue),Bt=o.endOfYear(Ue),Ot=Oe(Ue)?sa({utils:o,date:Ue,minDate:o.isBefore(C,bt)?bt:C,maxDate:o.isAfter(A,Bt)?Bt:A,disablePast:b,disableFuture:g,isDateDisabled:Oe,timezone:fe}):Ue;Ot?(he(Ot,"finish"),v==null||v(Ot)):(xe(),Ce(bt)),we(Ot,!0)}),On=$e(Ue=>ne(Ue&&Ec(o,Ue,J??de),"finish",be));k.useEffect(()=>{J!=null&&o.isValid(J)&&Ce(J)},[J]);const un=a,$n=x$(un),Se={disablePast:b,disableFuture:g,maxDate:A,minDate:C},De={disableHighlightToday:H,readOnly:U,disabled:N,timezone:fe,gridLabelId:ht,slots:j,slotProps:_},_e=k.useRef(be);k.useEffect(()=>{_e.current!==be&&(ee===_e.current&&me(be,!0),_e.current=be)},[ee,me,be]);const qe=k.useMemo(()=>[J],[J]);return I.jsxs(S$,K({ref:r,className:Me($n.root,O),ownerState:un},ue,{children:[I.jsx(Rt,K({},Xt,{slots:j,slotProps:_})),I.jsx(C$,{reduceAnimations:w,className:$n.viewTransitionContainer,transKey:be,ownerState:un,children:I.jsxs("div",{children:[be==="year"&&I.jsx(XO,K({},Se,De,{value:J,onChange:Xe,shouldDisableYear:P,hasFocus:Tt,onFocusedViewChange:Ue=>me("year",Ue),yearsOrder:te,yearsPerRow:ae,referenceDate:de})),be==="month"&&I.jsx(VO,K({},Se,De,{hasFocus:Tt,className:O,value:J,onChange:Wt,shouldDisableMonth:R,onFocusedViewChange:Ue=>me("month",Ue),monthsPerRow:Z,referenceDate:de})),be==="day"&&I.jsx(MO,K({},ge,Se,De,{onMonthSwitchingAnimationEnd:mt,onFocusedDayChange:we,reduceAnimations:w,selectedDays:qe,onSelectedDaysChange:On,shouldDisableDate:T,shouldDisableMonth:R,shouldDisableYear:P,hasFocus:Tt,onFocusedViewChange:Ue=>me("day",Ue),showDaysOutsideCurrentMonth:F,fixedWeekNumber:B,dayOfWeekFormatter:Y,displayWeekNumber:Q,loading:q,renderLoading:L}))]})})]}))}),$i=({view:e,onViewChange:t,views:r,focusedView:o,onFocusedViewChange:s,value:a,defaultValue:c,referenceDate:u,onChange:f,className:p,classes:h,disableFuture:g,disablePast:b,minDate:S,maxDate:v,shouldDisableDate:x,shouldDisableMonth:w,shouldDisableYear:T,reduceAnimations:R,onMonthChange:P,monthsPerRow:M,onYearChange:D,yearsOrder:$,yearsPerRow:O,slots:N,slotProps:U,loading:C,renderLoading:A,disableHighlightToday:H,readOnly:W,disabled:V,showDaysOutsideCurrentMonth:F,dayOfWeekFormatter:B,sx:Y,autoFocus:j,fixedWeekNumber:_,displayWeekNumber:q,timezone:L})=>I.jsx(k$,{view:e,onViewChange:t,views:r.filter(ji),focusedView:o&&ji(o)?o:null,onFocusedViewChange:s,value:a,defaultValue:c,referenceDate:u,onChange:f,className:p,classes:h,disableFuture:g,disablePast:b,minDate:S,maxDate:v,shouldDisableDate:x,shouldDisableMonth:w,shouldDisableYear:T,reduceAnimations:R,onMonthChange:P,monthsPerRow:M,onYearChange:D,yearsOrder:$,yearsPerRow:O,slots:N,slotProps:U,loading:C,renderLoading:A,disableHighlightToday:H,readOnly:W,disabled:V,showDaysOutsideCurrentMonth:F,dayOfWeekFormatter:B,sx:Y,autoFocus:j,fixedWeekNumber:_,displayWeekNumber:q,timezone:L});function T$(e){return Fe("MuiPickersPopper",e)}Ae("MuiPickersPopper",["root","paper"]);const P$=["PaperComponent","popperPlacement","ownerState","children","paperSlotProps","paperClasses","onPaperClick","onPaperTouchStart"],M$=e=>{const{classes:t}=e;return Le({root:["root"],paper:["paper"]},T$,t)},R$=ie(lM,{name:"MuiPickersPopper",slot:"Root",overridesResolver:(e,t)=>t.root})(({theme:e})=>({zIndex:e.zIndex.modal})),D$=ie(Vo,{name:"MuiPickersPopper",slot:"Paper",overridesResolver:(e,t)=>t.paper})({outline:0,transformOrigin:"top center",variants:[{props:({placement:e})=>["top","top-start","top-end"].includes(e),style:{transformOrigin:"bottom center"}}]});function E$(e,t){return t.documentElement.clientWidth<e.clientX||t.documentElement.clientHeight<e.clientY}function I$(e,t){const r=k.useRef(!1),o=k.useRef(!1),s=k.useRef(null),a=k.useRef(!1);k.useEffect(()=>{if(!e)return;function f(){a.current=!0}return document.addEventListener("mousedown",f,!0),document.addEventListener("touchstart",f,!0),()=>{document.removeEventListener("mousedown",f,!0),document.removeEventListener("touchstart",f,!0),a.current=!1}},[e]);const c=$e(f=>{if(!a.current)return;const p=o.current;o.current=!1;const h=Qt(s.current);if(!s.current||"clientX"in f&&E$(f,h))return;if(r.current){r.current=!1;return}let g;f.composedPath?g=f.composedPath().indexOf(s.current)>-1:g=!h.documentElement.contains(f.target)||s.current.contains(f.target),!g&&!p&&t(f)}),u=()=>{o.current=!0};return k.useEffect(()=>{if(e){const f=Qt(s.current),p=()=>{r.current=!0};return f.addEventListener("touchstart",c),f.addEventListener("touchmove",p),()=>{f.removeEventListener("touchstart",c),f.removeEventListener("touchmove",p)}}},[e,c]),k.useEffect(()=>{if(e){const f=Qt(s.current);return f.addEventListener("click",c),()=>{f.removeEventListener("click",c),o.current=!1}}},[e,c]),[s,u,u]}const O$=k.forwardRef((e,t)=>{const{PaperComponent:r,popperPlacement:o,ownerState:s,children:a,paperSlotProps:c,paperClasses:u,onPaperClick:f,onPaperTouchStart:p}=e,h=We(e,P$),g=K({},s,{placement:o}),b=Je({elementType:r,externalSlotProps:c,additionalProps:{tabIndex:-1,elevation:8,ref:t},className:u,ownerState:g});return I.jsx(r,K({},h,b,{onClick:S=>{var v;f(S),(v=b.onClick)==null||v.call(b,S)},onTouchStart:S=>{var v;p(S),(v=b.onTouchStart)==null||v.call(b,S)},ownerState:g,children:a}))});function $$(e){const t=ot({props:e,name:"MuiPickersPopper"}),{anchorEl:r,children:o,containerRef:s=null,shouldRestoreFocus:a,onBlur:c,onDismiss:u,open:f,role:p,placement:h,slots:g,slotProps:b,reduceAnimations:S}=t;k.useEffect(()=>{function F(B){f&&B.key==="Escape"&&u()}return document.addEventListener("keydown",F),()=>{document.removeEventListener("keydown",F)}},[u,f]);const v=k.useRef(null);k.useEffect(()=>{p==="tooltip"||a&&!a()||(f?v.current=yn(document):v.current&&v.current instanceof HTMLElement&&setTimeout(()=>{v.current instanceof HTMLElement&&v.current.focus()}))},[f,p,a]);const[x,w,T]=I$(f,c??u),R=k.useRef(null),P=rt(R,s),M=rt(P,x),D=t,$=M$(D),O=Ub(),N=S??O,U=F=>{F.key==="Escape"&&(F.stopPropagation(),u())},C=(g==null?void 0:g.desktopTransition)??N?Ki:Dc,A=(g==null?void 0:g.desktopTrapFocus)??q0,H=(g==null?void 0:g.desktopPaper)??D$,W=(g==null?void 0:g.popper)??R$,V=Je({elementType:W,externalSlotProps:b==null?void 0:b.popper,additionalProps:{transition:!0,role:p,open:f,anchorEl:r,placement:h,onKeyDown:U},className:$.root,ownerState:t});return I.jsx(W,K({},V,{children:({TransitionProps:F,placement:B})=>I.jsx(A,K({open:f,disableAutoFocus:!0,disableRestoreFocus:!0,disableEnforceFocus:p==="tooltip",isEnabled:()=>!0},b==null?void 0:b.desktopTrapFocus,{children:I.jsx(C,K({},F,b==null?void 0:b.desktopTransition,{children:I.jsx(O$,{PaperComponent:H,ownerState:D,popperPlacement:B,ref:M,onPaperClick:w,onPaperTouchStart:T,paperClasses:$.paper,paperSlotProps:b==null?void 0:b.desktopPaper,children:o})}))}))}))}const A$=({open:e,onOpen:t,onClose:r})=>{const o=k.useRef(typeof e=="boolean").current,[s,a]=k.useState(!1);k.useEffect(()=>{if(o){if(typeof e!="boolean")throw new Error("You must not mix controlling and uncontrolled mode for `open` prop");a(e)}},[o,e]);const c=k.useCallback(u=>{o||a(u),u&&t&&t(),!u&&r&&r()},[o,t,r]);return{isOpen:s,setIsOpen:c}},N$=e=>{const{action:t,hasChanged:r,dateState:o,isControlled:s}=e,a=!s&&!o.hasBeenModifiedSinceMount;return t.name==="setValueFromField"?!0:t.name==="setValueFromAction"?a&&["accept","today","clear"].includes(t.pickerAction)?!0:r(o.lastPublishedValue):t.name==="setValueFromView"&&t.selectionState!=="shallow"||t.name==="setValueFromShortcut"?a?!0:r(o.lastPublishedValue):!1},L$=e=>{const{action:t,hasChanged:r,dateState:o,isControlled:s,closeOnSelect:a}=e,c=!s&&!o.hasBeenModifiedSinceMount;return t.name==="setValueFromAction"?c&&["accept","today","clear"].includes(t.pickerAction)?!0:r(o.lastCommittedValue):t.name==="setValueFromView"&&t.selectionState==="finish"&&a?c?!0:r(o.lastCommittedValue):t.name==="setValueFromShortcut"?t.changeImportance==="accept"&&r(o.lastCommittedValue):!1},F$=e=>{const{action:t,closeOnSelect:r}=e;return t.name==="setValueFromAction"?!0:t.name==="setValueFromView"?t.selectionState==="finish"&&r:t.name==="setValueFromShortcut"?t.changeImportance==="accept":!1},B$=({props:e,valueManager:t,valueType:r,wrapperVariant:o,validator:s})=>{const{onAccept:a,onChange:c,value:u,defaultValue:f,closeOnSelect:p=o==="desktop",timezone:h,referenceDate:g}=e,{current:b}=k.useRef(f),{current:S}=k.useRef(u!==void 0),[v,x]=k.useState(h),w=ft(),T=qo(),{isOpen:R,setIsOpen:P}=A$(e),{timezone:M,value:D,handleValueChange:$}=Fp({timezone:h,value:u,defaultValue:b,referenceDate:g,onChange:c,valueManager:t}),[O,N]=k.useState(()=>{let ne;return D!==void 0?ne=D:b!==void 0?ne=b:ne=t.emptyValue,{draft:ne,lastPublishedValue:ne,lastCommittedValue:ne,lastControlledValue:u,hasBeenModifiedSinceMount:!1}}),U=t.getTimezone(w,O.draft);v!==h&&(x(h),h&&U&&h!==U&&N(ne=>K({},ne,{draft:t.setTimezone(w,h,ne.draft)})));const{getValidationErrorForNewValue:C}=kb({props:e,validator:s,timezone:M,value:O.draft,onError:e.onError}),A=$e(ne=>{const fe={action:ne,dateState:O,hasChanged:he=>!t.areValuesEqual(w,ne.value,he),isControlled:S,closeOnSelect:p},be=N$(fe),ve=L$(fe),ee=F$(fe);N(he=>K({},he,{draft:ne.value,lastPublishedValue:be?ne.value:he.lastPublishedValue,lastCommittedValue:ve?ne.value:he.lastCommittedValue,hasBeenModifiedSinceMount:!0}));let me=null;const xe=()=>(me||(me={validationError:ne.name==="setValueFromField"?ne.context.validationError:C(ne.value)},ne.name==="setValueFromShortcut"&&(me.shortcut=ne.shortcut)),me);be&&$(ne.value,xe()),ve&&a&&a(ne.value,xe()),ee&&P(!1)});if(O.lastControlledValue!==u){const ne=t.areValuesEqual(w,O.draft,D);N(fe=>K({},fe,{lastControlledValue:u},ne?{}:{lastCommittedValue:D,lastPublishedValue:D,draft:D,hasBeenModifiedSinceMount:!0}))}const H=$e(()=>{A({value:t.emptyValue,name:"setValueFromAction",pickerAction:"clear"})}),W=$e(()=>{A({value:O.lastPublishedValue,name:"setValueFromAction",pickerAction:"accept"})}),V=$e(()=>{A({value:O.lastPublishedValue,name:"setValueFromAction",pickerAction:"dismiss"})}),F=$e(()=>{A({value:O.lastCommittedValue,name:"setValueFromAction",pickerAction:"cancel"})}),B=$e(()=>{A({value:t.getTodayValue(w,M,r),name:"setValueFromAction",pickerAction:"today"})}),Y=$e(ne=>{ne.preventDefault(),P(!0)}),j=$e(ne=>{ne==null||ne.preventDefault(),P(!1)}),_=$e((ne,fe="partial")=>A({name:"setValueFromView",value:ne,selectionState:fe})),q=$e((ne,fe,be)=>A({name:"setValueFromShortcut",value:ne,changeImportance:fe,shortcut:be})),L=$e((ne,fe)=>A({name:"setValueFromField",value:ne,context:fe})),Q={onClear:H,onAccept:W,onDismiss:V,onCancel:F,onSetToday:B,onOpen:Y,onClose:j},te={value:O.draft,onChange:L},ae=k.useMemo(()=>t.cleanValue(w,O.draft),[w,t,O.draft]),Z={value:ae,onChange:_,onClose:j,open:R},ue=K({},Q,{value:ae,onChange:_,onSelectShortcut:q,isValid:ne=>{const fe=s({adapter:T,value:ne,timezone:M,props:e});return!t.hasError(fe)}}),J=k.useMemo(()=>({onOpen:Y,onClose:j,open:R}),[R,j,Y]);return{open:R,fieldProps:te,viewProps:Z,layoutProps:ue,actions:Q,contextValue:J}},V$=["className","sx"],j$=({props:e,propsFromPickerValue:t,additionalViewProps:r,autoFocusView:o,rendererInterceptor:s,fieldRef:a})=>{const{onChange:c,open:u,onClose:f}=t,{view:p,views:h,openTo:g,onViewChange:b,viewRenderers:S,timezone:v}=e,x=We(e,V$),{view:w,setView:T,defaultView:R,focusedView:P,setFocusedView:M,setValueAndGoToNextView:D}=Oa({view:p,views:h,openTo:g,onChange:c,onViewChange:b,autoFocus:o}),{hasUIView:$,viewModeLookup:O}=k.useMemo(()=>h.reduce((V,F)=>{let B;return S[F]!=null?B="UI":B="field",V.viewModeLookup[F]=B,B==="UI"&&(V.hasUIView=!0),V},{hasUIView:!1,viewModeLookup:{}}),[S,h]),N=k.useMemo(()=>h.reduce((V,F)=>S[F]!=null&&zi(F)?V+1:V,0),[S,h]),U=O[w],C=$e(()=>U==="UI"),[A,H]=k.useState(U==="UI"?w:null);return A!==w&&O[w]==="UI"&&H(w),Nt(()=>{U==="field"&&u&&(f(),setTimeout(()=>{var V,F;(V=a==null?void 0:a.current)==null||V.setSelectedSections(w),(F=a==null?void 0:a.current)==null||F.focusField(w)}))},[w]),Nt(()=>{if(!u)return;let V=w;U==="field"&&A!=null&&(V=A),V!==R&&O[V]==="UI"&&O[R]==="UI"&&(V=R),V!==w&&T(V),M(V,!0)},[u]),{hasUIView:$,shouldRestoreFocus:C,layoutProps:{views:h,view:A,onViewChange:T},renderCurrentView:()=>{if(A==null)return null;const V=S[A];if(V==null)return null;const F=K({},x,r,t,{views:h,timezone:v,onChange:D,view:A,onViewChange:T,focusedView:P,onFocusedViewChange:M,showViewSwitcher:N>1,timeViewsCount:N});return s?s(S,A,F):V(F)}}};function mv(){return typeof window>"u"?"portrait":window.screen&&window.screen.orientation&&window.screen.orientation.angle?Math.abs(window.screen.orientation.angle)===90?"landscape":"portrait":window.orientation&&Math.abs(Number(window.orientation))===90?"landscape":"portrait"}const z$=(e,t)=>{const[r,o]=k.useState(mv);return Nt(()=>{const a=()=>{o(mv())};return window.addEventListener("orientationchange",a),()=>{window.removeEventListener("orientationchange",a)}},[]),c2(e,["hours","minutes","seconds"])?!1:(t||r)==="landscape"},_$=({props:e,propsFromPickerValue:t,propsFromPickerViews:r,wrapperVariant:o})=>{const{orientation:s}=e,a=z$(r.views,s),c=an();return{layoutProps:K({},r,t,{isLandscape:a,isRtl:c,wrapperVariant:o,disabled:e.disabled,readOnly:e.readOnly})}};function W$(e){const{props:t,pickerValueResponse:r}=e;return k.useMemo(()=>({value:r.viewProps.value,open:r.open,disabled:t.disabled??!1,readOnly:t.readOnly??!1}),[r.viewProps.value,r.open,t.disabled,t.readOnly])}const Hb=({props:e,valueManager:t,valueType:r,wrapperVariant:o,additionalViewProps:s,validator:a,autoFocusView:c,rendererInterceptor:u,fieldRef:f})=>{const p=B$({props:e,valueManager:t,valueType:r,wrapperVariant:o,validator:a}),h=j$({props:e,additionalViewProps:s,autoFocusView:c,fieldRef:f,propsFromPickerValue:p.viewProps,rendererInterceptor:u}),g=_$({props:e,wrapperVariant:o,propsFromPickerValue:p.layoutProps,propsFromPickerViews:h.layoutProps}),b=W$({props:e,pickerValueResponse:p});return{open:p.open,actions:p.actions,fieldProps:p.fieldProps,renderCurrentView:h.renderCurrentView,hasUIView:h.hasUIView,shouldRestoreFocus:h.shouldRestoreFocus,layoutProps:g.layoutProps,contextValue:p.contextValue,ownerState:b}};function Yb(e){return Fe("MuiPickersLayout",e)}const ar=Ae("MuiPickersLayout",["root","landscape","contentWrapper","toolbar","actionBar","tabs","shortcuts"]),U$=["onAccept","onClear","onCancel","onSetToday","actions"];function H$(e){const{onAccept:t,onClear:r,onCancel:o,onSetToday:s,actions:a}=e,c=We(e,U$),u=Sn();if(a==null||a.length===0)return null;const f=a==null?void 0:a.map(p=>{switch(p){case"clear":return I.jsx(Fo,{onClick:r,children:u.clearButtonLabel},p);case"cancel":return I.jsx(Fo,{onClick:o,children:u.cancelButtonLabel},p);case"accept":return I.jsx(Fo,{onClick:t,children:u.okButtonLabel},p);case"today":return I.jsx(Fo,{onClick:s,children:u.todayButtonLabel},p);default:return null}});return I.jsx(wR,K({},c,{children:f}))}const Y$=["items","changeImportance","isLandscape","onChange","isValid"],K$=["getValue"];function q$(e){const{items:t,changeImportance:r="accept",onChange:o,isValid:s}=e,a=We(e,Y$);if(t==null||t.length===0)return null;const c=t.map(u=>{let{getValue:f}=u,p=We(u,K$);const h=f({isValid:s});return K({},p,{label:p.label,onClick:()=>{o(h,r,p)},disabled:!s(h)})});return I.jsx(tb,K({dense:!0,sx:[{maxHeight:au,maxWidth:200,overflow:"auto"},...Array.isArray(a.sx)?a.sx:[a.sx]]},a,{children:c.map(u=>I.jsx(mD,{children:I.jsx(mM,K({},u))},u.id??u.label))}))}function G$(e){return e.view!==null}const Q$=e=>{const{classes:t,isLandscape:r}=e;return Le({root:["root",r&&"landscape"],contentWrapper:["contentWrapper"],toolbar:["toolbar"],actionBar:["actionBar"],tabs:["tabs"],landscape:["landscape"],shortcuts:["shortcuts"]},Yb,t)},Kb=e=>{const{wrapperVariant:t,onAccept:r,onClear:o,onCancel:s,onSetToday:a,view:c,views:u,onViewChange:f,value:p,onChange:h,onSelectShortcut:g,isValid:b,isLandscape:S,disabled:v,readOnly:x,children:w,slots:T,slotProps:R}=e,P=Q$(e),M=(T==null?void 0:T.actionBar)??H$,D=Je({elementType:M,externalSlotProps:R==null?void 0:R.actionBar,additionalProps:{onAccept:r,onClear:o,onCancel:s,onSetToday:a,actions:t==="desktop"?[]:["cancel","accept"]},className:P.actionBar,ownerState:K({},e,{wrapperVariant:t})}),$=I.jsx(M,K({},D)),O=T==null?void 0:T.toolbar,N=Je({elementType:O,externalSlotProps:R==null?void 0:R.toolbar,additionalProps:{isLandscape:S,onChange:h,value:p,view:c,onViewChange:f,views:u,disabled:v,readOnly:x},className:P.toolbar,ownerState:K({},e,{wrapperVariant:t})}),U=G$(N)&&O?I.jsx(O,K({},N)):null,C=w,A=T==null?void 0:T.tabs,H=c&&A?I.jsx(A,K({view:c,onViewChange:f,className:P.tabs},R==null?void 0:R.tabs)):null,W=(T==null?void 0:T.shortcuts)??q$,V=Je({elementType:W,externalSlotProps:R==null?void 0:R.shortcuts,additionalProps:{isValid:b,isLandscape:S,onChange:g},className:P.shortcuts,ownerState:{isValid:b,isLandscape:S,onChange:g,wrapperVariant:t}}),F=c&&W?I.jsx(W,K({},V)):null;return{toolbar:U,content:C,tabs:H,actionBar:$,shortcuts:F}},X$=e=>{const{isLandscape:t,classes:r}=e;return Le({root:["root",t&&"landscape"],contentWrapper:["contentWrapper"]},Yb,r)},qb=ie("div",{name:"MuiPickersLayout",slot:"Root",overridesResolver:(e,t)=>t.root})({display:"grid",gridAutoColumns:"max-content auto max-content",gridAutoRows:"max-content auto max-content",[`& .${ar.actionBar}`]:{gridColumn:"1 / 4",gridRow:3},variants:[{props:{isLandscape:!0},style:{[`& .${ar.toolbar}`]:{gridColumn:1,gridRow:"2 / 3"},[`.${ar.shortcuts}`]:{gridColumn:"2 / 4",gridRow:1}}},{props:{isLandscape:!0,isRtl:!0},style:{[`& .${ar.toolbar}`]:{gridColumn:3}}},{props:{isLandscape:!1},style:{[`& .${ar.toolbar}`]:{gridColumn:"2 / 4",gridRow:1},[`& .${ar.shortcuts}`]:{gridColumn:1,gridRow:"2 / 3"}}},{props:{isLandscape:!1,isRtl:!0},style:{[`& .${ar.shortcuts}`]:{gridColumn:3}}}]}),Gb=ie("div",{name:"MuiPickersLayout",slot:"ContentWrapper",overridesResolver:(e,t)=>t.contentWrapper})({gridColumn:2,gridRow:2,display:"flex",flexDirection:"column"}),Qb=k.forwardRef(function(t,r){const o=ot({props:t,name:"MuiPickersLayout"}),{toolbar:s,content:a,tabs:c,actionBar:u,shortcuts:f}=Kb(o),{sx:p,className:h,isLandscape:g,wrapperVariant:b}=o,S=X$(o);return I.jsxs(qb,{ref:r,sx:p,className:Me(S.root,h),ownerState:o,children:[g?f:s,g?s:f,I.jsx(Gb,{className:S.contentWrapper,children:b==="desktop"?I.jsxs(k.Fragment,{children:[a,c]}):I.jsxs(k.Fragment,{children:[c,a]})}),u]})}),Z$=["props","getOpenDialogAriaText"],J$=["ownerState"],eA=["ownerState"],tA=e=>{var xe;let{props:t,getOpenDialogAriaText:r}=e,o=We(e,Z$);const{slots:s,slotProps:a,className:c,sx:u,format:f,formatDensity:p,enableAccessibleFieldDOMStructure:h,selectedSections:g,onSelectedSectionsChange:b,timezone:S,name:v,label:x,inputRef:w,readOnly:T,disabled:R,autoFocus:P,localeText:M,reduceAnimations:D}=t,$=k.useRef(null),O=k.useRef(null),N=Yr(),U=((xe=a==null?void 0:a.toolbar)==null?void 0:xe.hidden)??!1,{open:C,actions:A,hasUIView:H,layoutProps:W,renderCurrentView:V,shouldRestoreFocus:F,fieldProps:B,contextValue:Y,ownerState:j}=Hb(K({},o,{props:t,fieldRef:O,autoFocusView:!0,additionalViewProps:{},wrapperVariant:"desktop"})),_=s.inputAdornment??J0,q=Je({elementType:_,externalSlotProps:a==null?void 0:a.inputAdornment,additionalProps:{position:"end"},ownerState:t}),L=We(q,J$),Q=s.openPickerButton??Hi,te=Je({elementType:Q,externalSlotProps:a==null?void 0:a.openPickerButton,additionalProps:{disabled:R||T,onClick:C?A.onClose:A.onOpen,"aria-label":r(B.value),edge:L.position},ownerState:t}),ae=We(te,eA),Z=s.openPickerIcon,le=Je({elementType:Z,externalSlotProps:a==null?void 0:a.openPickerIcon,ownerState:j}),ue=s.field,J=Je({elementType:ue,externalSlotProps:a==null?void 0:a.field,additionalProps:K({},B,U&&{id:N},{readOnly:T,disabled:R,className:c,sx:u,format:f,formatDensity:p,enableAccessibleFieldDOMStructure:h,selectedSections:g,onSelectedSectionsChange:b,timezone:S,label:x,name:v,autoFocus:P&&!t.open,focused:C?!0:void 0},w?{inputRef:w}:{}),ownerState:t});H&&(J.InputProps=K({},J.InputProps,{ref:$},!t.disableOpenPicker&&{[`${L.position}Adornment`]:I.jsx(_,K({},L,{children:I.jsx(Q,K({},ae,{children:I.jsx(Z,K({},le))}))}))}));const ne=K({textField:s.textField,clearIcon:s.clearIcon,clearButton:s.clearButton},J.slots),fe=s.layout??Qb;let be=N;U&&(x?be=`${N}-label`:be=void 0);const ve=K({},a,{toolbar:K({},a==null?void 0:a.toolbar,{titleId:N}),popper:K({"aria-labelledby":be},a==null?void 0:a.popper)}),ee=rt(O,J.unstableFieldRef);return{renderPicker:()=>I.jsxs(Tb,{contextValue:Y,localeText:M,children:[I.jsx(ue,K({},J,{slots:ne,slotProps:ve,unstableFieldRef:ee})),I.jsx($$,K({role:"dialog",placement:"bottom-start",anchorEl:$.current},A,{open:C,slots:s,slotProps:ve,shouldRestoreFocus:F,reduceAnimations:D,children:I.jsx(fe,K({},W,ve==null?void 0:ve.layout,{slots:s,slotProps:ve,children:V()}))}))]})}},nA=["views","format"],Xb=(e,t,r)=>{let{views:o,format:s}=t,a=We(t,nA);if(s)return s;const c=[],u=[];if(o.forEach(h=>{zi(h)?u.push(h):ji(h)&&c.push(h)}),u.length===0)return ev(e,K({views:c},a));if(c.length===0)return nv(e,K({views:u},a));const f=nv(e,K({views:u},a));return`${ev(e,K({views:c},a))} ${f}`},rA=(e,t,r)=>r?t.filter(o=>!Zs(o)||o==="hours"):e?[...t,"meridiem"]:t,oA=(e,t)=>24*60/((e.hours??1)*(e.minutes??5))<=t;function iA({thresholdToRenderTimeInASingleColumn:e,ampm:t,timeSteps:r,views:o}){const s=e??24,a=K({hours:1,minutes:5,seconds:5},r),c=oA(a,s);return{thresholdToRenderTimeInASingleColumn:s,timeSteps:a,shouldRenderTimeInASingleColumn:c,views:rA(t,o,c)}}function sA(e){return Fe("MuiTimeClock",e)}Ae("MuiTimeClock",["root","arrowSwitcher"]);const _i=220,zr=36,va={x:_i/2,y:_i/2},Zb={x:va.x,y:0},aA=Zb.x-va.x,lA=Zb.y-va.y,cA=e=>e*(180/Math.PI),Jb=(e,t,r)=>{const o=t-va.x,s=r-va.y,a=Math.atan2(aA,lA)-Math.atan2(o,s);let c=cA(a);c=Math.round(c/e)*e,c%=360;const u=Math.floor(c/e)||0,f=o**2+s**2,p=Math.sqrt(f);return{value:u,distance:p}},uA=(e,t,r=1)=>{const o=r*6;let{value:s}=Jb(o,e,t);return s=s*r%60,s},dA=(e,t,r)=>{const{value:o,distance:s}=Jb(30,e,t);let a=o||12;return r?a%=12:s<_i/2-zr&&(a+=12,a%=24),a};function fA(e){return Fe("MuiClockPointer",e)}Ae("MuiClockPointer",["root","thumb"]);const pA=["className","hasSelected","isInner","type","viewValue"],mA=e=>{const{classes:t}=e;return Le({root:["root"],thumb:["thumb"]},fA,t)},hA=ie("div",{name:"MuiClockPointer",slot:"Root",overridesResolver:(e,t)=>t.root})(({theme:e})=>({width:2,backgroundColor:(e.vars||e).palette.primary.main,position:"absolute",left:"calc(50% - 1px)",bottom:"50%",transformOrigin:"center bottom 0px",variants:[{props:{shouldAnimate:!0},style:{transition:e.transitions.create(["transform","height"])}}]})),gA=ie("div",{name:"MuiClockPointer",slot:"Thumb",overridesResolver:(e,t)=>t.thumb})(({theme:e})=>({width:4,height:4,backgroundColor:(e.vars||e).palette.primary.contrastText,borderRadius:"50%",position:"absolute",top:-21,left:`calc(50% - ${zr/2}px)`,border:`${(zr-4)/2}px solid ${(e.vars||e).palette.primary.main}`,boxSizing:"content-box",variants:[{props:{hasSelected:!0},style:{backgroundColor:(e.vars||e).palette.primary.main}}]}));function yA(e){const t=ot({props:e,name:"MuiClockPointer"}),{className:r,isInner:o,type:s,viewValue:a}=t,c=We(t,pA),u=k.useRef(s);k.useEffect(()=>{u.current=s},[s]);const f=K({},t,{shouldAnimate:u.current!==s}),p=mA(f),h=()=>{let b=360/(s==="hours"?12:60)*a;return s==="hours"&&a>12&&(b-=360),{height:Math.round((o?.26:.4)*_i),transform:`rotateZ(${b}deg)`}};return I.jsx(hA,K({style:h(),className:Me(p.root,r),ownerState:f},c,{children:I.jsx(gA,{ownerState:f,className:p.thumb})}))}function vA(e){return Fe("MuiClock",e)}Ae("MuiClock",["root","clock","wrapper","squareMask","pin","amButton","pmButton","meridiemText","selected"]);const bA=e=>{const{classes:t,meridiemMode:r}=e;return Le({root:["root"],clock:["clock"],wrapper:["wrapper"],squareMask:["squareMask"],pin:["pin"],amButton:["amButton",r==="am"&&"selected"],pmButton:["pmButton",r==="pm"&&"selected"],meridiemText:["meridiemText"]},vA,t)},xA=ie("div",{name:"MuiClock",slot:"Root",overridesResolver:(e,t)=>t.root})(({theme:e})=>({display:"flex",justifyContent:"center",alignItems:"center",margin:e.spacing(2)})),wA=ie("div",{name:"MuiClock",slot:"Clock",overridesResolver:(e,t)=>t.clock})({backgroundColor:"rgba(0,0,0,.07)",borderRadius:"50%",height:220,width:220,flexShrink:0,position:"relative",pointerEvents:"none"}),SA=ie("div",{name:"MuiClock",slot:"Wrapper",overridesResolver:(e,t)=>t.wrapper})({"&:focus":{outline:"none"}}),CA=ie("div",{name:"MuiClock",slot:"SquareMask",overridesResolver:(e,t)=>t.squareMask})({width:"100%",height:"100%",position:"absolute",pointerEvents:"auto",outline:0,touchAction:"none",userSelect:"none",variants:[{props:{disabled:!1},style:{"@media (pointer: fine)":{cursor:"pointer",borderRadius:"50%"},"&:active":{cursor:"move"}}}]}),kA=ie("div",{name:"MuiClock",slot:"Pin",overridesResolver:(e,t)=>t.pin})(({theme:e})=>({width:6,height:6,borderRadius:"50%",backgroundColor:(e.vars||e).palette.primary.main,position:"absolute",top:"50%",left:"50%",transform:"translate(-50%, -50%)"})),ex=(e,t)=>({zIndex:1,bottom:8,paddingLeft:4,paddingRight:4,width:zr,variants:[{props:{meridiemMode:t},style:{backgroundColor:(e.vars||e).palette.primary.main,color:(e.vars||e).palette.primary.contrastText,"&:hover":{backgroundColor:(e.vars||e).palette.primary.light}}}]}),TA=ie(Hi,{name:"MuiClock",slot:"AmButton",overridesResolver:(e,t)=>t.amButton})(({theme:e})=>K({},ex(e,"am"),{position:"absolute",left:8})),PA=ie(Hi,{name:"MuiClock",slot:"PmButton",overridesResolver:(e,t)=>t.pmButton})(({theme:e})=>K({},ex(e,"pm"),{position:"absolute",right:8})),hv=ie(Hn,{name:"MuiClock",slot:"meridiemText",overridesResolver:(e,t)=>t.meridiemText})({overflow:"hidden",whiteSpace:"nowrap",textOverflow:"ellipsis"});function MA(e){const t=ot({props:e,name:"MuiClock"}),{ampm:r,ampmInClock:o,autoFocus:s,children:a,value:c,handleMeridiemChange:u,isTimeDisabled:f,meridiemMode:p,minutesStep:h=1,onChange:g,selectedId:b,type:S,viewValue:v,viewRange:[x,w],disabled:T=!1,readOnly:R,className:P}=t,M=t,D=ft(),$=Sn(),O=k.useRef(!1),N=bA(M),U=f(v,S),C=!r&&S==="hours"&&(v<1||v>12),A=(te,ae)=>{T||R||f(te,S)||g(te,ae)},H=(te,ae)=>{let{offsetX:Z,offsetY:le}=te;if(Z===void 0){const J=te.target.getBoundingClientRect();Z=te.changedTouches[0].clientX-J.left,le=te.changedTouches[0].clientY-J.top}const ue=S==="seconds"||S==="minutes"?uA(Z,le,h):dA(Z,le,!!r);A(ue,ae)},W=te=>{O.current=!0,H(te,"shallow")},V=te=>{O.current&&(H(te,"finish"),O.current=!1),te.preventDefault()},F=te=>{te.buttons>0&&H(te.nativeEvent,"shallow")},B=te=>{O.current&&(O.current=!1),H(te.nativeEvent,"finish")},Y=k.useMemo(()=>S==="hours"?!0:v%5===0,[S,v]),j=S==="minutes"?h:1,_=k.useRef(null);Nt(()=>{s&&_.current.focus()},[s]);const q=te=>Math.max(x,Math.min(w,te)),L=te=>(te+(w+1))%(w+1),Q=te=>{if(!O.current)switch(te.key){case"Home":A(x,"partial"),te.preventDefault();break;case"End":A(w,"partial"),te.preventDefault();break;case"ArrowUp":A(L(v+j),"partial"),te.preventDefault();break;case"ArrowDown":A(L(v-j),"partial"),te.preventDefault();break;case"PageUp":A(q(v+5),"partial"),te.preventDefault();break;case"PageDown":A(q(v-5),"partial"),te.preventDefault();break;case"Enter":case" ":A(v,"finish"),te.preventDefault();break}};return I.jsxs(xA,{className:Me(N.root,P),children:[I.jsxs(wA,{className:N.clock,children:[I.jsx(CA,{onTouchMove:W,onTouchStart:W,onTouchEnd:V,onMouseUp:B,onMouseMove:F,ownerState:{disabled:T},className:N.squareMask}),!U&&I.jsxs(k.Fragment,{children:[I.jsx(kA,{className:N.pin}),c!=null&&I.jsx(yA,{type:S,viewValue:v,isInner:C,hasSelected:Y})]}),I.jsx(SA,{"aria-activedescendant":b,"aria-label":$.clockLabelText(S,c,D,c==null?null:D.format(c,"fullTime")),ref:_,role:"listbox",onKeyDown:Q,tabIndex:0,className:N.wrapper,children:a})]}),r&&o&&I.jsxs(k.Fragment,{children:[I.jsx(TA,{onClick:R?void 0:()=>u("am"),disabled:T||p===null,ownerState:M,className:N.amButton,title:jr(D,"am"),children:I.jsx(hv,{variant:"caption",className:N.meridiemText,children:jr(D,"am")})}),I.jsx(PA,{disabled:T||p===null,onClick:R?void 0:()=>u("pm"),ownerState:M,className:N.pmButton,title:jr(D,"pm"),children:I.jsx(hv,{variant:"caption",className:N.meridiemText,children:jr(D,"pm")})})]})]})}function RA(e){return Fe("MuiClockNumber",e)}const ec=Ae("MuiClockNumber",["root","selected","disabled"]),DA=["className","disabled","index","inner","label","selected"],EA=e=>{const{classes:t,selected:r,disabled:o}=e;return Le({root:["root",r&&"selected",o&&"disabled"]},RA,t)},IA=ie("span",{name:"MuiClockNumber",slot:"Root",overridesResolver:(e,t)=>[t.root,{[`&.${ec.disabled}`]:t.disabled},{[`&.${ec.selected}`]:t.selected}]})(({theme:e})=>({height:zr,width:zr,position:"absolute",left:`calc((100% - ${zr}px) / 2)`,display:"inline-flex",justifyContent:"center",alignItems:"center",borderRadius:"50%",color:(e.vars||e).palette.text.primary,fontFamily:e.typography.fontFamily,"&:focused":{backgroundColor:(e.vars||e).palette.background.paper},[`&.${ec.selected}`]:{color:(e.vars||e).palette.primary.contrastText},[`&.${ec.disabled}`]:{pointerEvents:"none",color:(e.vars||e).palette.text.disabled},variants:[{props:{inner:!0},style:K({},e.typography.body2,{color:(e.vars||e).palette.text.secondary})}]}));function tx(e){const t=ot({props:e,name:"MuiClockNumber"}),{className:r,disabled:o,index:s,inner:a,label:c,selected:u}=t,f=We(t,DA),p=t,h=EA(p),g=s%12/12*Math.PI*2-Math.PI/2,b=(_i-zr-2)/2*(a?.65:1),S=Math.round(Math.cos(g)*b),v=Math.round(Math.sin(g)*b);return I.jsx(IA,K({className:Me(h.root,r),"aria-disabled":o?!0:void 0,"aria-selected":u?!0:void 0,role:"option",style:{transform:`translate(${S}px, ${v+(_i-zr)/2}px`},ownerState:p},f,{children:c}))}const OA=({ampm:e,value:t,getClockNumberText:r,isDisabled:o,selectedId:s,utils:a})=>{const c=t?a.getHours(t):null,u=[],f=e?1:0,p=e?12:23,h=g=>c===null?!1:e?g===12?c===12||c===0:c===g||c-12===g:c===g;for(let g=f;g<=p;g+=1){let b=g.toString();g===0&&(b="00");const S=!e&&(g===0||g>12);b=a.formatNumber(b);const v=h(g);u.push(I.jsx(tx,{id:v?s:void 0,index:g,inner:S,selected:v,disabled:o(g),label:b,"aria-label":r(b)},g))}return u},gv=({utils:e,value:t,isDisabled:r,getClockNumberText:o,selectedId:s})=>{const a=e.formatNumber;return[[5,a("05")],[10,a("10")],[15,a("15")],[20,a("20")],[25,a("25")],[30,a("30")],[35,a("35")],[40,a("40")],[45,a("45")],[50,a("50")],[55,a("55")],[0,a("00")]].map(([c,u],f)=>{const p=c===t;return I.jsx(tx,{label:u,id:p?s:void 0,index:f+1,inner:!1,disabled:r(c),selected:p,"aria-label":o(u)},c)})},zp=({value:e,referenceDate:t,utils:r,props:o,timezone:s})=>{const a=k.useMemo(()=>sn.getInitialReferenceValue({value:e,utils:r,props:o,referenceDate:t,granularity:lr.day,timezone:s,getTodayDate:()=>$p(r,s,"date")}),[]);return e??a},$A=["ampm","ampmInClock","autoFocus","slots","slotProps","value","defaultValue","referenceDate","disableIgnoringDatePartForTimeValidation","maxTime","minTime","disableFuture","disablePast","minutesStep","shouldDisableTime","showViewSwitcher","onChange","view","views","openTo","onViewChange","focusedView","onFocusedViewChange","className","disabled","readOnly","timezone"],AA=e=>{const{classes:t}=e;return Le({root:["root"],arrowSwitcher:["arrowSwitcher"]},sA,t)},NA=ie(lu,{name:"MuiTimeClock",slot:"Root",overridesResolver:(e,t)=>t.root})({display:"flex",flexDirection:"column",position:"relative"}),LA=ie(Wb,{name:"MuiTimeClock",slot:"ArrowSwitcher",overridesResolver:(e,t)=>t.arrowSwitcher})({position:"absolute",right:12,top:15}),FA=["hours","minutes"],BA=k.forwardRef(function(t,r){const o=ft(),s=ot({props:t,name:"MuiTimeClock"}),{ampm:a=o.is12HourCycleInCurrentLocale(),ampmInClock:c=!1,autoFocus:u,slots:f,slotProps:p,value:h,defaultValue:g,referenceDate:b,disableIgnoringDatePartForTimeValidation:S=!1,maxTime:v,minTime:x,disableFuture:w,disablePast:T,minutesStep:R=1,shouldDisableTime:P,showViewSwitcher:M,onChange:D,view:$,views:O=FA,openTo:N,onViewChange:U,focusedView:C,onFocusedViewChange:A,className:H,disabled:W,readOnly:V,timezone:F}=s,B=We(s,$A),{value:Y,handleValueChange:j,timezone:_}=qi({name:"TimeClock",timezone:F,value:h,defaultValue:g,referenceDate:b,onChange:D,valueManager:sn}),q=zp({value:Y,referenceDate:b,utils:o,props:s,timezone:_}),L=Sn(),Q=Go(_),{view:te,setView:ae,previousView:Z,nextView:le,setValueAndGoToNextView:ue}=Oa({view:$,views:O,openTo:N,onViewChange:U,onChange:j,focusedView:C,onFocusedViewChange:A}),{meridiemMode:J,handleMeridiemChange:ne}=jp(q,a,ue),fe=k.useCallback((xe,he)=>{const de=Ea(S,o),ge=he==="hours"||he==="minutes"&&O.includes("seconds"),we=({start:Ie,end:Oe})=>!(x&&de(x,Oe)||v&&de(Ie,v)||w&&de(Ie,Q)||T&&de(Q,ge?Oe:Ie)),Ce=(Ie,Oe=1)=>{if(Ie%Oe!==0)return!1;if(P)switch(he){case"hours":return!P(o.setHours(q,Ie),"hours");case"minutes":return!P(o.setMinutes(q,Ie),"minutes");case"seconds":return!P(o.setSeconds(q,Ie),"seconds");default:return!1}return!0};switch(he){case"hours":{const Ie=ga(xe,J,a),Oe=o.setHours(q,Ie);if(o.getHours(Oe)!==Ie)return!0;const mt=o.setSeconds(o.setMinutes(Oe,0),0),lt=o.setSeconds(o.setMinutes(Oe,59),59);return!we({start:mt,end:lt})||!Ce(Ie)}case"minutes":{const Ie=o.setMinutes(q,xe),Oe=o.setSeconds(Ie,0),mt=o.setSeconds(Ie,59);return!we({start:Oe,end:mt})||!Ce(xe,R)}case"seconds":{const Ie=o.setSeconds(q,xe);return!we({start:Ie,end:Ie})||!Ce(xe)}default:throw new Error("not supported")}},[a,q,S,v,J,x,R,P,o,w,T,Q,O]),be=Yr(),ve=k.useMemo(()=>{switch(te){case"hours":{const xe=(ge,we)=>{const Ce=ga(ge,J,a);ue(o.setHours(q,Ce),we,"hours")},he=o.getHours(q);let de;return a?he>12?de=[12,23]:de=[0,11]:de=[0,23],{onChange:xe,viewValue:he,children:OA({value:Y,utils:o,ampm:a,onChange:xe,getClockNumberText:L.hoursClockNumberText,isDisabled:ge=>W||fe(ge,"hours"),selectedId:be}),viewRange:de}}case"minutes":{const xe=o.getMinutes(q),he=(de,ge)=>{ue(o.setMinutes(q,de),ge,"minutes")};return{viewValue:xe,onChange:he,children:gv({utils:o,value:xe,onChange:he,getClockNumberText:L.minutesClockNumberText,isDisabled:de=>W||fe(de,"minutes"),selectedId:be}),viewRange:[0,59]}}case"seconds":{const xe=o.getSeconds(q),he=(de,ge)=>{ue(o.setSeconds(q,de),ge,"seconds")};return{viewValue:xe,onChange:he,children:gv({utils:o,value:xe,onChange:he,getClockNumberText:L.secondsClockNumberText,isDisabled:de=>W||fe(de,"seconds"),selectedId:be}),viewRange:[0,59]}}default:throw new Error("You must provide the type for ClockView")}},[te,o,Y,a,L.hoursClockNumberText,L.minutesClockNumberText,L.secondsClockNumberText,J,ue,q,fe,be,W]),ee=s,me=AA(ee);return I.jsxs(NA,K({ref:r,className:Me(me.root,H),ownerState:ee},B,{children:[I.jsx(MA,K({autoFocus:u??!!C,ampmInClock:c&&O.includes("hours"),value:Y,type:te,ampm:a,minutesStep:R,isTimeDisabled:fe,meridiemMode:J,handleMeridiemChange:ne,selectedId:be,disabled:W,readOnly:V},ve)),M&&I.jsx(LA,{className:me.arrowSwitcher,slots:f,slotProps:p,onGoToPrevious:()=>ae(Z),isPreviousDisabled:!Z,previousLabel:L.openPreviousView,onGoToNext:()=>ae(le),isNextDisabled:!le,nextLabel:L.openNextView,ownerState:ee})]}))});function VA(e){return Fe("MuiDigitalClock",e)}const jA=Ae("MuiDigitalClock",["root","list","item"]),zA=["ampm","timeStep","autoFocus","slots","slotProps","value","defaultValue","referenceDate","disableIgnoringDatePartForTimeValidation","maxTime","minTime","disableFuture","disablePast","minutesStep","shouldDisableTime","onChange","view","openTo","onViewChange","focusedView","onFocusedViewChange","className","disabled","readOnly","views","skipDisabled","timezone"],_A=e=>{const{classes:t}=e;return Le({root:["root"],list:["list"],item:["item"]},VA,t)},WA=ie(lu,{name:"MuiDigitalClock",slot:"Root",overridesResolver:(e,t)=>t.root})({overflowY:"auto",width:"100%","@media (prefers-reduced-motion: no-preference)":{scrollBehavior:"auto"},maxHeight:Lb,variants:[{props:{alreadyRendered:!0},style:{"@media (prefers-reduced-motion: no-preference)":{scrollBehavior:"smooth"}}}]}),UA=ie(Rp,{name:"MuiDigitalClock",slot:"List",overridesResolver:(e,t)=>t.list})({padding:0}),HA=ie(ib,{name:"MuiDigitalClock",slot:"Item",overridesResolver:(e,t)=>t.item})(({theme:e})=>({padding:"8px 16px",margin:"2px 4px","&:first-of-type":{marginTop:4},"&:hover":{backgroundColor:e.vars?`rgba(${e.vars.palette.primary.mainChannel} / ${e.vars.palette.action.hoverOpacity})`:nt(e.palette.primary.main,e.palette.action.hoverOpacity)},"&.Mui-selected":{backgroundColor:(e.vars||e).palette.primary.main,color:(e.vars||e).palette.primary.contrastText,"&:focus-visible, &:hover":{backgroundColor:(e.vars||e).palette.primary.dark}},"&.Mui-focusVisible":{backgroundColor:e.vars?`rgba(${e.vars.palette.primary.mainChannel} / ${e.vars.palette.action.focusOpacity})`:nt(e.palette.primary.main,e.palette.action.focusOpacity)}})),YA=k.forwardRef(function(t,r){const o=ft(),s=k.useRef(null),a=rt(r,s),c=k.useRef(null),u=ot({props:t,name:"MuiDigitalClock"}),{ampm:f=o.is12HourCycleInCurrentLocale(),timeStep:p=30,autoFocus:h,slots:g,slotProps:b,value:S,defaultValue:v,referenceDate:x,disableIgnoringDatePartForTimeValidation:w=!1,maxTime:T,minTime:R,disableFuture:P,disablePast:M,minutesStep:D=1,shouldDisableTime:$,onChange:O,view:N,openTo:U,onViewChange:C,focusedView:A,onFocusedViewChange:H,className:W,disabled:V,readOnly:F,views:B=["hours"],skipDisabled:Y=!1,timezone:j}=u,_=We(u,zA),{value:q,handleValueChange:L,timezone:Q}=qi({name:"DigitalClock",timezone:j,value:S,defaultValue:v,referenceDate:x,onChange:O,valueManager:sn}),te=Sn(),ae=Go(Q),Z=k.useMemo(()=>K({},u,{alreadyRendered:!!s.current}),[u]),le=_A(Z),ue=(g==null?void 0:g.digitalClockItem)??HA,J=Je({elementType:ue,externalSlotProps:b==null?void 0:b.digitalClockItem,ownerState:{},className:le.item}),ne=zp({value:q,referenceDate:x,utils:o,props:u,timezone:Q}),fe=$e(de=>L(de,"finish","hours")),{setValueAndGoToNextView:be}=Oa({view:N,views:B,openTo:U,onViewChange:C,onChange:fe,focusedView:A,onFocusedViewChange:H}),ve=$e(de=>{be(de,"finish")});k.useEffect(()=>{if(s.current===null)return;const de=s.current.querySelector('[role="listbox"] [role="option"][tabindex="0"], [role="listbox"] [role="option"][aria-selected="true"]');if(!de)return;const ge=de.offsetTop;(h||A)&&de.focus(),s.current.scrollTop=ge-4});const ee=k.useCallback(de=>{const ge=Ea(w,o),we=()=>!(R&&ge(R,de)||T&&ge(de,T)||P&&ge(de,ae)||M&&ge(ae,de)),Ce=()=>o.getMinutes(de)%D!==0?!1:$?!$(de,"hours"):!0;return!we()||!Ce()},[w,o,R,T,P,ae,M,D,$]),me=k.useMemo(()=>{const de=[];let we=o.startOfDay(ne);for(;o.isSameDay(ne,we);)de.push(we),we=o.addMinutes(we,p);return de},[ne,p,o]),xe=me.findIndex(de=>o.isEqual(de,ne)),he=de=>{switch(de.key){case"PageUp":{const ge=Ic(c.current)-5,we=c.current.children,Ce=Math.max(0,ge),Ie=we[Ce];Ie&&Ie.focus(),de.preventDefault();break}case"PageDown":{const ge=Ic(c.current)+5,we=c.current.children,Ce=Math.min(we.length-1,ge),Ie=we[Ce];Ie&&Ie.focus(),de.preventDefault();break}}};return I.jsx(WA,K({ref:a,className:Me(le.root,W),ownerState:Z},_,{children:I.jsx(UA,{ref:c,role:"listbox","aria-label":te.timePickerToolbarTitle,className:le.list,onKeyDown:he,children:me.map((de,ge)=>{if(Y&&ee(de))return null;const we=o.isEqual(de,q),Ce=o.format(de,f?"fullTime12h":"fullTime24h"),Ie=xe===ge||xe===-1&&ge===0?0:-1;return I.jsx(ue,K({onClick:()=>!F&&ve(de),selected:we,disabled:V||ee(de),disableRipple:F,role:"option","aria-disabled":F,"aria-selected":we,tabIndex:Ie},J,{children:Ce}),`${de.valueOf()}-${Ce}`)})})}))});function KA(e){return Fe("MuiMultiSectionDigitalClock",e)}const yv=Ae("MuiMultiSectionDigitalClock",["root"]);function qA(e){return Fe("MuiMultiSectionDigitalClockSection",e)}const GA=Ae("MuiMultiSectionDigitalClockSection",["root","item"]),QA=["autoFocus","onChange","className","disabled","readOnly","items","active","slots","slotProps","skipDisabled"],XA=e=>{const{classes:t}=e;return Le({root:["root"],item:["item"]},qA,t)},ZA=ie(Rp,{name:"MuiMultiSectionDigitalClockSection",slot:"Root",overridesResolver:(e,t)=>t.root})(({theme:e})=>({maxHeight:Lb,width:56,padding:0,overflow:"hidden","@media (prefers-reduced-motion: no-preference)":{scrollBehavior:"auto"},"@media (pointer: fine)":{"&:hover":{overflowY:"auto"}},"@media (pointer: none), (pointer: coarse)":{overflowY:"auto"},"&:not(:first-of-type)":{borderLeft:`1px solid ${(e.vars||e).palette.divider}`},"&::after":{display:"block",content:'""',height:"calc(100% - 40px - 6px)"},variants:[{props:{alreadyRendered:!0},style:{"@media (prefers-reduced-motion: no-preference)":{scrollBehavior:"smooth"}}}]})),JA=ie(ib,{name:"MuiMultiSectionDigitalClockSection",slot:"Item",overridesResolver:(e,t)=>t.item})(({theme:e})=>({padding:8,margin:"2px 4px",width:Js,justifyContent:"center","&:first-of-type":{marginTop:4},"&:hover":{backgroundColor:e.vars?`rgba(${e.vars.palette.primary.mainChannel} / ${e.vars.palette.action.hoverOpacity})`:nt(e.palette.primary.main,e.palette.action.hoverOpacity)},"&.Mui-selected":{backgroundColor:(e.vars||e).palette.primary.main,color:(e.vars||e).palette.primary.contrastText,"&:focus-visible, &:hover":{backgroundColor:(e.vars||e).palette.primary.dark}},"&.Mui-focusVisible":{backgroundColor:e.vars?`rgba(${e.vars.palette.primary.mainChannel} / ${e.vars.palette.action.focusOpacity})`:nt(e.palette.primary.main,e.palette.action.focusOpacity)}})),eN=k.forwardRef(function(t,r){const o=k.useRef(null),s=rt(r,o),a=k.useRef(null),c=ot({props:t,name:"MuiMultiSectionDigitalClockSection"}),{autoFocus:u,onChange:f,className:p,disabled:h,readOnly:g,items:b,active:S,slots:v,slotProps:x,skipDisabled:w}=c,T=We(c,QA),R=k.useMemo(()=>K({},c,{alreadyRendered:!!o.current}),[c]),P=XA(R),M=(v==null?void 0:v.digitalClockSectionItem)??JA;k.useEffect(()=>{if(o.current===null)return;const O=o.current.querySelector('[role="option"][tabindex="0"], [role="option"][aria-selected="true"]');if(S&&u&&O&&O.focus(),!O||a.current===O)return;a.current=O;const N=O.offsetTop;o.current.scrollTop=N-4});const D=b.findIndex(O=>O.isFocused(O.value)),$=O=>{switch(O.key){case"PageUp":{const N=Ic(o.current)-5,U=o.current.children,C=Math.max(0,N),A=U[C];A&&A.focus(),O.preventDefault();break}case"PageDown":{const N=Ic(o.current)+5,U=o.current.children,C=Math.min(U.length-1,N),A=U[C];A&&A.focus(),O.preventDefault();break}}};return I.jsx(ZA,K({ref:s,className:Me(P.root,p),ownerState:R,autoFocusItem:u&&S,role:"listbox",onKeyDown:$},T,{children:b.map((O,N)=>{var W;const U=(W=O.isDisabled)==null?void 0:W.call(O,O.value),C=h||U;if(w&&C)return null;const A=O.isSelected(O.value),H=D===N||D===-1&&N===0?0:-1;return I.jsx(M,K({onClick:()=>!g&&f(O.value),selected:A,disabled:C,disableRipple:g,role:"option","aria-disabled":g||C||void 0,"aria-label":O.ariaLabel,"aria-selected":A,tabIndex:H,className:P.item},x==null?void 0:x.digitalClockSectionItem,{children:O.label}),O.label)})}))}),tN=({now:e,value:t,utils:r,ampm:o,isDisabled:s,resolveAriaLabel:a,timeStep:c,valueOrReferenceDate:u})=>{const f=t?r.getHours(t):null,p=[],h=(S,v)=>{const x=v??f;return x===null?!1:o?S===12?x===12||x===0:x===S||x-12===S:x===S},g=S=>h(S,r.getHours(u)),b=o?11:23;for(let S=0;S<=b;S+=c){let v=r.format(r.setHours(e,S),o?"hours12h":"hours24h");const x=a(parseInt(v,10).toString());v=r.formatNumber(v),p.push({value:S,label:v,isSelected:h,isDisabled:s,isFocused:g,ariaLabel:x})}return p},vv=({value:e,utils:t,isDisabled:r,timeStep:o,resolveLabel:s,resolveAriaLabel:a,hasValue:c=!0})=>{const u=p=>e===null?!1:c&&e===p,f=p=>e===p;return[...Array.from({length:Math.ceil(60/o)},(p,h)=>{const g=o*h;return{value:g,label:t.formatNumber(s(g)),isDisabled:r,isSelected:u,isFocused:f,ariaLabel:a(g.toString())}})]},nN=["ampm","timeSteps","autoFocus","slots","slotProps","value","defaultValue","referenceDate","disableIgnoringDatePartForTimeValidation","maxTime","minTime","disableFuture","disablePast","minutesStep","shouldDisableTime","onChange","view","views","openTo","onViewChange","focusedView","onFocusedViewChange","className","disabled","readOnly","skipDisabled","timezone"],rN=e=>{const{classes:t}=e;return Le({root:["root"]},KA,t)},oN=ie(lu,{name:"MuiMultiSectionDigitalClock",slot:"Root",overridesResolver:(e,t)=>t.root})(({theme:e})=>({display:"flex",flexDirection:"row",width:"100%",borderBottom:`1px solid ${(e.vars||e).palette.divider}`})),iN=k.forwardRef(function(t,r){const o=ft(),s=an(),a=ot({props:t,name:"MuiMultiSectionDigitalClock"}),{ampm:c=o.is12HourCycleInCurrentLocale(),timeSteps:u,autoFocus:f,slots:p,slotProps:h,value:g,defaultValue:b,referenceDate:S,disableIgnoringDatePartForTimeValidation:v=!1,maxTime:x,minTime:w,disableFuture:T,disablePast:R,minutesStep:P=1,shouldDisableTime:M,onChange:D,view:$,views:O=["hours","minutes"],openTo:N,onViewChange:U,focusedView:C,onFocusedViewChange:A,className:H,disabled:W,readOnly:V,skipDisabled:F=!1,timezone:B}=a,Y=We(a,nN),{value:j,handleValueChange:_,timezone:q}=qi({name:"MultiSectionDigitalClock",timezone:B,value:g,defaultValue:b,referenceDate:S,onChange:D,valueManager:sn}),L=Sn(),Q=Go(q),te=k.useMemo(()=>K({hours:1,minutes:5,seconds:5},u),[u]),ae=zp({value:j,referenceDate:S,utils:o,props:a,timezone:q}),Z=$e((we,Ce,Ie)=>_(we,Ce,Ie)),le=k.useMemo(()=>!c||!O.includes("hours")||O.includes("meridiem")?O:[...O,"meridiem"],[c,O]),{view:ue,setValueAndGoToNextView:J,focusedView:ne}=Oa({view:$,views:le,openTo:N,onViewChange:U,onChange:Z,focusedView:C,onFocusedViewChange:A}),fe=$e(we=>{J(we,"finish","meridiem")}),{meridiemMode:be,handleMeridiemChange:ve}=jp(ae,c,fe,"finish"),ee=k.useCallback((we,Ce)=>{const Ie=Ea(v,o),Oe=Ce==="hours"||Ce==="minutes"&&le.includes("seconds"),mt=({start:tt,end:ht})=>!(w&&Ie(w,ht)||x&&Ie(tt,x)||T&&Ie(tt,Q)||R&&Ie(Q,Oe?ht:tt)),lt=(tt,ht=1)=>{if(tt%ht!==0)return!1;if(M)switch(Ce){case"hours":return!M(o.setHours(ae,tt),"hours");case"minutes":return!M(o.setMinutes(ae,tt),"minutes");case"seconds":return!M(o.setSeconds(ae,tt),"seconds");default:return!1}return!0};switch(Ce){case"hours":{const tt=ga(we,be,c),ht=o.setHours(ae,tt);if(o.getHours(ht)!==tt)return!0;const Tt=o.setSeconds(o.setMinutes(ht,0),0),Rt=o.setSeconds(o.setMinutes(ht,59),59);return!mt({start:Tt,end:Rt})||!lt(tt)}case"minutes":{const tt=o.setMinutes(ae,we),ht=o.setSeconds(tt,0),Tt=o.setSeconds(tt,59);return!mt({start:ht,end:Tt})||!lt(we,P)}case"seconds":{const tt=o.setSeconds(ae,we);return!mt({start:tt,end:tt})||!lt(we)}default:throw new Error("not supported")}},[c,ae,v,x,be,w,P,M,o,T,R,Q,le]),me=k.useCallback(we=>{switch(we){case"hours":return{onChange:Ce=>{const Ie=ga(Ce,be,c);J(o.setHours(ae,Ie),"finish","hours")},items:tN({now:Q,value:j,ampm:c,utils:o,isDisabled:Ce=>ee(Ce,"hours"),timeStep:te.hours,resolveAriaLabel:L.hoursClockNumberText,valueOrReferenceDate:ae})};case"minutes":return{onChange:Ce=>{J(o.setMinutes(ae,Ce),"finish","minutes")},items:vv({value:o.getMinutes(ae),utils:o,isDisabled:Ce=>ee(Ce,"minutes"),resolveLabel:Ce=>o.format(o.setMinutes(Q,Ce),"minutes"),timeStep:te.minutes,hasValue:!!j,resolveAriaLabel:L.minutesClockNumberText})};case"seconds":return{onChange:Ce=>{J(o.setSeconds(ae,Ce),"finish","seconds")},items:vv({value:o.getSeconds(ae),utils:o,isDisabled:Ce=>ee(Ce,"seconds"),resolveLabel:Ce=>o.format(o.setSeconds(Q,Ce),"seconds"),timeStep:te.seconds,hasValue:!!j,resolveAriaLabel:L.secondsClockNumberText})};case"meridiem":{const Ce=jr(o,"am"),Ie=jr(o,"pm");return{onChange:ve,items:[{value:"am",label:Ce,isSelected:()=>!!j&&be==="am",isFocused:()=>!!ae&&be==="am",ariaLabel:Ce},{value:"pm",label:Ie,isSelected:()=>!!j&&be==="pm",isFocused:()=>!!ae&&be==="pm",ariaLabel:Ie}]}}default:throw new Error(`Unknown view: ${we} found.`)}},[Q,j,c,o,te.hours,te.minutes,te.seconds,L.hoursClockNumberText,L.minutesClockNumberText,L.secondsClockNumberText,be,J,ae,ee,ve]),xe=k.useMemo(()=>{if(!s)return le;const we=le.filter(Ce=>Ce!=="meridiem");return we.reverse(),le.includes("meridiem")&&we.push("meridiem"),we},[s,le]),he=k.useMemo(()=>le.reduce((we,Ce)=>K({},we,{[Ce]:me(Ce)}),{}),[le,me]),de=a,ge=rN(de);return I.jsx(oN,K({ref:r,className:Me(ge.root,H),ownerState:de,role:"group"},Y,{children:xe.map(we=>I.jsx(eN,{items:he[we].items,onChange:he[we].onChange,active:ue===we,autoFocus:f??ne===we,disabled:W,readOnly:V,slots:p,slotProps:h,skipDisabled:F,"aria-label":L.selectViewText(we)},we))}))}),vf=({view:e,onViewChange:t,focusedView:r,onFocusedViewChange:o,views:s,value:a,defaultValue:c,referenceDate:u,onChange:f,className:p,classes:h,disableFuture:g,disablePast:b,minTime:S,maxTime:v,shouldDisableTime:x,minutesStep:w,ampm:T,ampmInClock:R,slots:P,slotProps:M,readOnly:D,disabled:$,sx:O,autoFocus:N,showViewSwitcher:U,disableIgnoringDatePartForTimeValidation:C,timezone:A})=>I.jsx(BA,{view:e,onViewChange:t,focusedView:r&&zi(r)?r:null,onFocusedViewChange:o,views:s.filter(zi),value:a,defaultValue:c,referenceDate:u,onChange:f,className:p,classes:h,disableFuture:g,disablePast:b,minTime:S,maxTime:v,shouldDisableTime:x,minutesStep:w,ampm:T,ampmInClock:R,slots:P,slotProps:M,readOnly:D,disabled:$,sx:O,autoFocus:N,showViewSwitcher:U,disableIgnoringDatePartForTimeValidation:C,timezone:A}),sN=({view:e,onViewChange:t,focusedView:r,onFocusedViewChange:o,views:s,value:a,defaultValue:c,referenceDate:u,onChange:f,className:p,classes:h,disableFuture:g,disablePast:b,minTime:S,maxTime:v,shouldDisableTime:x,minutesStep:w,ampm:T,slots:R,slotProps:P,readOnly:M,disabled:D,sx:$,autoFocus:O,disableIgnoringDatePartForTimeValidation:N,timeSteps:U,skipDisabled:C,timezone:A})=>I.jsx(YA,{view:e,onViewChange:t,focusedView:r,onFocusedViewChange:o,views:s.filter(zi),value:a,defaultValue:c,referenceDate:u,onChange:f,className:p,classes:h,disableFuture:g,disablePast:b,minTime:S,maxTime:v,shouldDisableTime:x,minutesStep:w,ampm:T,slots:R,slotProps:P,readOnly:M,disabled:D,sx:$,autoFocus:O,disableIgnoringDatePartForTimeValidation:N,timeStep:U==null?void 0:U.minutes,skipDisabled:C,timezone:A}),bv=({view:e,onViewChange:t,focusedView:r,onFocusedViewChange:o,views:s,value:a,defaultValue:c,referenceDate:u,onChange:f,className:p,classes:h,disableFuture:g,disablePast:b,minTime:S,maxTime:v,shouldDisableTime:x,minutesStep:w,ampm:T,slots:R,slotProps:P,readOnly:M,disabled:D,sx:$,autoFocus:O,disableIgnoringDatePartForTimeValidation:N,timeSteps:U,skipDisabled:C,timezone:A})=>I.jsx(iN,{view:e,onViewChange:t,focusedView:r,onFocusedViewChange:o,views:s.filter(zi),value:a,defaultValue:c,referenceDate:u,onChange:f,className:p,classes:h,disableFuture:g,disablePast:b,minTime:S,maxTime:v,shouldDisableTime:x,minutesStep:w,ampm:T,slots:R,slotProps:P,readOnly:M,disabled:D,sx:$,autoFocus:O,disableIgnoringDatePartForTimeValidation:N,timeSteps:U,skipDisabled:C,timezone:A}),aN=k.forwardRef(function(t,r){var x;const o=an(),{toolbar:s,tabs:a,content:c,actionBar:u,shortcuts:f}=Kb(t),{sx:p,className:h,isLandscape:g,classes:b}=t,S=u&&(((x=u.props.actions)==null?void 0:x.length)??0)>0,v=K({},t,{isRtl:o});return I.jsxs(qb,{ref:r,className:Me(ar.root,b==null?void 0:b.root,h),sx:[{[`& .${ar.tabs}`]:{gridRow:4,gridColumn:"1 / 4"},[`& .${ar.actionBar}`]:{gridRow:5}},...Array.isArray(p)?p:[p]],ownerState:v,children:[g?f:s,g?s:f,I.jsxs(Gb,{className:Me(ar.contentWrapper,b==null?void 0:b.contentWrapper),sx:{display:"grid"},children:[c,a,S&&I.jsx(Rc,{sx:{gridRow:3,gridColumn:"1 / 4"}})]}),u]})}),lN=["openTo","focusedView","timeViewsCount"],cN=function(t,r,o){var h,g;const{openTo:s,focusedView:a,timeViewsCount:c}=o,u=We(o,lN),f=K({},u,{focusedView:null,sx:[{[`&.${yv.root}`]:{borderBottom:0},[`&.${yv.root}, .${GA.root}, &.${jA.root}`]:{maxHeight:au}}]}),p=Zs(r);return I.jsxs(k.Fragment,{children:[(h=t[p?"day":r])==null?void 0:h.call(t,K({},o,{view:p?"day":r,focusedView:a&&ji(a)?a:null,views:o.views.filter(ji),sx:[{gridColumn:1},...f.sx]})),c>0&&I.jsxs(k.Fragment,{children:[I.jsx(Rc,{orientation:"vertical",sx:{gridColumn:2}}),(g=t[p?r:"hours"])==null?void 0:g.call(t,K({},f,{view:p?r:"hours",focusedView:a&&Zs(a)?a:null,openTo:Zs(s)?s:"hours",views:o.views.filter(Zs),sx:[{gridColumn:3},...f.sx]}))]})]})},nx=k.forwardRef(function(t,r){var R,P,M,D;const o=Sn(),s=ft(),a=Fb(t,"MuiDesktopDateTimePicker"),{shouldRenderTimeInASingleColumn:c,thresholdToRenderTimeInASingleColumn:u,views:f,timeSteps:p}=iA(a),h=c?sN:bv,g=K({day:$i,month:$i,year:$i,hours:h,minutes:h,seconds:h,meridiem:h},a.viewRenderers),b=a.ampmInClock??!0,v=((R=g.hours)==null?void 0:R.name)===bv.name?f:f.filter($=>$!=="meridiem"),x=c?[]:["accept"],w=K({},a,{viewRenderers:g,format:Xb(s,a),views:v,yearsPerRow:a.yearsPerRow??4,ampmInClock:b,timeSteps:p,thresholdToRenderTimeInASingleColumn:u,shouldRenderTimeInASingleColumn:c,slots:K({field:$b,layout:aN,openPickerIcon:b2},a.slots),slotProps:K({},a.slotProps,{field:$=>{var O;return K({},fa((O=a.slotProps)==null?void 0:O.field,$),wb(a),{ref:r})},toolbar:K({hidden:!0,ampmInClock:b,toolbarVariant:"desktop"},(P=a.slotProps)==null?void 0:P.toolbar),tabs:K({hidden:!0},(M=a.slotProps)==null?void 0:M.tabs),actionBar:$=>{var O;return K({actions:x},fa((O=a.slotProps)==null?void 0:O.actionBar,$))}})}),{renderPicker:T}=tA({props:w,valueManager:sn,valueType:"date-time",getOpenDialogAriaText:Sb({utils:s,formatKey:"fullDate",contextTranslation:o.openDatePickerDialogue,propsTranslation:(D=w.localeText)==null?void 0:D.openDatePickerDialogue}),validator:ru,rendererInterceptor:cN});return T()});nx.propTypes={ampm:re.bool,ampmInClock:re.bool,autoFocus:re.bool,className:re.string,closeOnSelect:re.bool,dayOfWeekFormatter:re.func,defaultValue:re.object,disabled:re.bool,disableFuture:re.bool,disableHighlightToday:re.bool,disableIgnoringDatePartForTimeValidation:re.bool,disableOpenPicker:re.bool,disablePast:re.bool,displayWeekNumber:re.bool,enableAccessibleFieldDOMStructure:re.any,fixedWeekNumber:re.number,format:re.string,formatDensity:re.oneOf(["dense","spacious"]),inputRef:b0,label:re.node,loading:re.bool,localeText:re.object,maxDate:re.object,maxDateTime:re.object,maxTime:re.object,minDate:re.object,minDateTime:re.object,minTime:re.object,minutesStep:re.number,monthsPerRow:re.oneOf([3,4]),name:re.string,onAccept:re.func,onChange:re.func,onClose:re.func,onError:re.func,onMonthChange:re.func,onOpen:re.func,onSelectedSectionsChange:re.func,onViewChange:re.func,onYearChange:re.func,open:re.bool,openTo:re.oneOf(["day","hours","meridiem","minutes","month","seconds","year"]),orientation:re.oneOf(["landscape","portrait"]),readOnly:re.bool,reduceAnimations:re.bool,referenceDate:re.object,renderLoading:re.func,selectedSections:re.oneOfType([re.oneOf(["all","day","empty","hours","meridiem","minutes","month","seconds","weekDay","year"]),re.number]),shouldDisableDate:re.func,shouldDisableMonth:re.func,shouldDisableTime:re.func,shouldDisableYear:re.func,showDaysOutsideCurrentMonth:re.bool,skipDisabled:re.bool,slotProps:re.object,slots:re.object,sx:re.oneOfType([re.arrayOf(re.oneOfType([re.func,re.object,re.bool])),re.func,re.object]),thresholdToRenderTimeInASingleColumn:re.number,timeSteps:re.shape({hours:re.number,minutes:re.number,seconds:re.number}),timezone:re.string,value:re.object,view:re.oneOf(["day","hours","meridiem","minutes","month","seconds","year"]),viewRenderers:re.shape({day:re.func,hours:re.func,meridiem:re.func,minutes:re.func,month:re.func,seconds:re.func,year:re.func}),views:re.arrayOf(re.oneOf(["day","hours","minutes","month","seconds","year"]).isRequired),yearsOrder:re.oneOf(["asc","desc"]),yearsPerRow:re.oneOf([3,4])};const uN=ie(yR)({[`& .${oa.container}`]:{outline:0},[`& .${oa.paper}`]:{outline:0,minWidth:su}}),dN=ie(PR)({"&:first-of-type":{padding:0}});function fN(e){const{children:t,onDismiss:r,open:o,slots:s,slotProps:a}=e,c=(s==null?void 0:s.dialog)??uN,u=(s==null?void 0:s.mobileTransition)??Ki;return I.jsx(c,K({open:o,onClose:r},a==null?void 0:a.dialog,{TransitionComponent:u,TransitionProps:a==null?void 0:a.mobileTransition,PaperComponent:s==null?void 0:s.mobilePaper,PaperProps:a==null?void 0:a.mobilePaper,children:I.jsx(dN,{children:t})}))}const pN=["props","getOpenDialogAriaText"],mN=e=>{var L;let{props:t,getOpenDialogAriaText:r}=e,o=We(e,pN);const{slots:s,slotProps:a,className:c,sx:u,format:f,formatDensity:p,enableAccessibleFieldDOMStructure:h,selectedSections:g,onSelectedSectionsChange:b,timezone:S,name:v,label:x,inputRef:w,readOnly:T,disabled:R,localeText:P}=t,M=k.useRef(null),D=Yr(),$=((L=a==null?void 0:a.toolbar)==null?void 0:L.hidden)??!1,{open:O,actions:N,layoutProps:U,renderCurrentView:C,fieldProps:A,contextValue:H}=Hb(K({},o,{props:t,fieldRef:M,autoFocusView:!0,additionalViewProps:{},wrapperVariant:"mobile"})),W=s.field,V=Je({elementType:W,externalSlotProps:a==null?void 0:a.field,additionalProps:K({},A,$&&{id:D},!(R||T)&&{onClick:N.onOpen,onKeyDown:u2(N.onOpen)},{readOnly:T??!0,disabled:R,className:c,sx:u,format:f,formatDensity:p,enableAccessibleFieldDOMStructure:h,selectedSections:g,onSelectedSectionsChange:b,timezone:S,label:x,name:v},w?{inputRef:w}:{}),ownerState:t});V.inputProps=K({},V.inputProps,{"aria-label":r(A.value)});const F=K({textField:s.textField},V.slots),B=s.layout??Qb;let Y=D;$&&(x?Y=`${D}-label`:Y=void 0);const j=K({},a,{toolbar:K({},a==null?void 0:a.toolbar,{titleId:D}),mobilePaper:K({"aria-labelledby":Y},a==null?void 0:a.mobilePaper)}),_=rt(M,V.unstableFieldRef);return{renderPicker:()=>I.jsxs(Tb,{contextValue:H,localeText:P,children:[I.jsx(W,K({},V,{slots:F,slotProps:j,unstableFieldRef:_})),I.jsx(fN,K({},N,{open:O,slots:s,slotProps:j,children:I.jsx(B,K({},U,j==null?void 0:j.layout,{slots:s,slotProps:j,children:C()}))}))]})}},rx=k.forwardRef(function(t,r){var h,g,b;const o=Sn(),s=ft(),a=Fb(t,"MuiMobileDateTimePicker"),c=K({day:$i,month:$i,year:$i,hours:vf,minutes:vf,seconds:vf},a.viewRenderers),u=a.ampmInClock??!1,f=K({},a,{viewRenderers:c,format:Xb(s,a),ampmInClock:u,slots:K({field:$b},a.slots),slotProps:K({},a.slotProps,{field:S=>{var v;return K({},fa((v=a.slotProps)==null?void 0:v.field,S),wb(a),{ref:r})},toolbar:K({hidden:!1,ampmInClock:u},(h=a.slotProps)==null?void 0:h.toolbar),tabs:K({hidden:!1},(g=a.slotProps)==null?void 0:g.tabs)})}),{renderPicker:p}=mN({props:f,valueManager:sn,valueType:"date-time",getOpenDialogAriaText:Sb({utils:s,formatKey:"fullDate",contextTranslation:o.openDatePickerDialogue,propsTranslation:(b=f.localeText)==null?void 0:b.openDatePickerDialogue}),validator:ru});return p()});rx.propTypes={ampm:re.bool,ampmInClock:re.bool,autoFocus:re.bool,className:re.string,closeOnSelect:re.bool,dayOfWeekFormatter:re.func,defaultValue:re.object,disabled:re.bool,disableFuture:re.bool,disableHighlightToday:re.bool,disableIgnoringDatePartForTimeValidation:re.bool,disableOpenPicker:re.bool,disablePast:re.bool,displayWeekNumber:re.bool,enableAccessibleFieldDOMStructure:re.any,fixedWeekNumber:re.number,format:re.string,formatDensity:re.oneOf(["dense","spacious"]),inputRef:b0,label:re.node,loading:re.bool,localeText:re.object,maxDate:re.object,maxDateTime:re.object,maxTime:re.object,minDate:re.object,minDateTime:re.object,minTime:re.object,minutesStep:re.number,monthsPerRow:re.oneOf([3,4]),name:re.string,onAccept:re.func,onChange:re.func,onClose:re.func,onError:re.func,onMonthChange:re.func,onOpen:re.func,onSelectedSectionsChange:re.func,onViewChange:re.func,onYearChange:re.func,open:re.bool,openTo:re.oneOf(["day","hours","minutes","month","seconds","year"]),orientation:re.oneOf(["landscape","portrait"]),readOnly:re.bool,reduceAnimations:re.bool,referenceDate:re.object,renderLoading:re.func,selectedSections:re.oneOfType([re.oneOf(["all","day","empty","hours","meridiem","minutes","month","seconds","weekDay","year"]),re.number]),shouldDisableDate:re.func,shouldDisableMonth:re.func,shouldDisableTime:re.func,shouldDisableYear:re.func,showDaysOutsideCurrentMonth:re.bool,slotProps:re.object,slots:re.object,sx:re.oneOfType([re.arrayOf(re.oneOfType([re.func,re.object,re.bool])),re.func,re.object]),timezone:re.string,value:re.object,view:re.oneOf(["day","hours","minutes","month","seconds","year"]),viewRenderers:re.shape({day:re.func,hours:re.func,minutes:re.func,month:re.func,seconds:re.func,year:re.func}),views:re.arrayOf(re.oneOf(["day","hours","minutes","month","seconds","year"]).isRequired),yearsOrder:re.oneOf(["asc","desc"]),yearsPerRow:re.oneOf([3,4])};const hN=["desktopModeMediaQuery"],xv=k.forwardRef(function(t,r){const o=ot({props:t,name:"MuiDateTimePicker"}),{desktopModeMediaQuery:s=d2}=o,a=We(o,hN);return Z0(s,{defaultMatches:!0})?I.jsx(nx,K({ref:r},a)):I.jsx(rx,K({ref:r},a))});var cc={exports:{}},gN=cc.exports,wv;function yN(){return wv||(wv=1,function(e,t){(function(r,o){e.exports=o()})(gN,function(){var r=1e3,o=6e4,s=36e5,a="millisecond",c="second",u="minute",f="hour",p="day",h="week",g="month",b="quarter",S="year",v="date",x="Invalid Date",w=/^(\d{4})[-/]?(\d{1,2})?[-/]?(\d{0,2})[Tt\s]*(\d{1,2})?:?(\d{1,2})?:?(\d{1,2})?[.:]?(\d+)?$/,T=/\[([^\]]+)]|Y{1,4}|M{1,4}|D{1,2}|d{1,4}|H{1,2}|h{1,2}|a|A|m{1,2}|s{1,2}|Z{1,2}|SSS/g,R={name:"en",weekdays:"Sunday_Monday_Tuesday_Wednesday_Thursday_Friday_Saturday".split("_"),months:"January_February_March_April_May_June_July_August_September_October_November_December".split("_"),ordinal:function(V){var F=["th","st","nd","rd"],B=V%100;return"["+V+(F[(B-20)%10]||F[B]||F[0])+"]"}},P=function(V,F,B){var Y=String(V);return!Y||Y.length>=F?V:""+Array(F+1-Y.length).join(B)+V},M={s:P,z:function(V){var F=-V.utcOffset(),B=Math.abs(F),Y=Math.floor(B/60),j=B%60;return(F<=0?"+":"-")+P(Y,2,"0")+":"+P(j,2,"0")},m:function V(F,B){if(F.date()<B.date())return-V(B,F);var Y=12*(B.year()-F.year())+(B.month()-F.month()),j=F.clone().add(Y,g),_=B-j<0,q=F.clone().add(Y+(_?-1:1),g);return+(-(Y+(B-j)/(_?j-q:q-j))||0)},a:function(V){return V<0?Math.ceil(V)||0:Math.floor(V)},p:function(V){return{M:g,y:S,w:h,d:p,D:v,h:f,m:u,s:c,ms:a,Q:b}[V]||String(V||"").toLowerCase().replace(/s$/,"")},u:function(V){return V===void 0}},D="en",$={};$[D]=R;var O="$isDayjsObject",N=function(V){return V instanceof H||!(!V||!V[O])},U=function V(F,B,Y){var j;if(!F)return D;if(typeof F=="string"){var _=F.toLowerCase();$[_]&&(j=_),B&&($[_]=B,j=_);var q=F.split("-");if(!j&&q.length>1)return V(q[0])}else{var L=F.name;$[L]=F,j=L}return!Y&&j&&(D=j),j||!Y&&D},C=function(V,F){if(N(V))return V.clone();var B=typeof F=="object"?F:{};return B.date=V,B.args=arguments,new H(B)},A=M;A.l=U,A.i=N,A.w=function(V,F){return C(V,{locale:F.$L,utc:F.$u,x:F.$x,$offset:F.$offset})};var H=function(){function V(B){this.$L=U(B.locale,null,!0),this.parse(B),this.$x=this.$x||B.x||{},this[O]=!0}var F=V.prototype;return F.parse=function(B){this.$d=function(Y){var j=Y.date,_=Y.utc;if(j===null)return new Date(NaN);if(A.u(j))return new Date;if(j instanceof Date)return new Date(j);if(typeof j=="string"&&!/Z$/i.test(j)){var q=j.match(w);if(q){var L=q[2]-1||0,Q=(q[7]||"0").substring(0,3);return _?new Date(Date.UTC(q[1],L,q[3]||1,q[4]||0,q[5]||0,q[6]||0,Q)):new Date(q[1],L,q[3]||1,q[4]||0,q[5]||0,q[6]||0,Q)}}return new Date(j)}(B),this.init()},F.init=function(){var B=this.$d;this.$y=B.getFullYear(),this.$M=B.getMonth(),this.$D=B.getDate(),this.$W=B.getDay(),this.$H=B.getHours(),this.$m=B.getMinutes(),this.$s=B.getSeconds(),this.$ms=B.getMilliseconds()},F.$utils=function(){return A},F.isValid=function(){return this.$d.toString()!==x},F.isSame=function(B,Y){var j=C(B);return this.startOf(Y)<=j&&j<=this.endOf(Y)},F.isAfter=function(B,Y){return C(B)<this.startOf(Y)},F.isBefore=function(B,Y){return this.endOf(Y)<C(B)},F.$g=function(B,Y,j){return A.u(B)?this[Y]:this.set(j,B)},F.unix=function(){return Math.floor(this.valueOf()/1e3)},F.valueOf=function(){return this.$d.getTime()},F.startOf=function(B,Y){var j=this,_=!!A.u(Y)||Y,q=A.p(B),L=function(ne,fe){var be=A.w(j.$u?Date.UTC(j.$y,fe,ne):new Date(j.$y,fe,ne),j);return _?be:be.endOf(p)},Q=function(ne,fe){return A.w(j.toDate()[ne].apply(j.toDate("s"),(_?[0,0,0,0]:[23,59,59,999]).slice(fe)),j)},te=this.$W,ae=this.$M,Z=this.$D,le="set"+(this.$u?"UTC":"");switch(q){case S:return _?L(1,0):L(31,11);case g:return _?L(1,ae):L(0,ae+1);case h:var ue=this.$locale().weekStart||0,J=(te<ue?te+7:te)-ue;return L(_?Z-J:Z+(6-J),ae);case p:case v:return Q(le+"Hours",0);case f:return Q(le+"Minutes",1);case u:return Q(le+"Seconds",2);case c:return Q(le+"Milliseconds",3);default:return this.clone()}},F.endOf=function(B){return this.startOf(B,!1)},F.$set=function(B,Y){var j,_=A.p(B),q="set"+(this.$u?"UTC":""),L=(j={},j[p]=q+"Date",j[v]=q+"Date",j[g]=q+"Month",j[S]=q+"FullYear",j[f]=q+"Hours",j[u]=q+"Minutes",j[c]=q+"Seconds",j[a]=q+"Milliseconds",j)[_],Q=_===p?this.$D+(Y-this.$W):Y;if(_===g||_===S){var te=this.clone().set(v,1);te.$d[L](Q),te.init(),this.$d=te.set(v,Math.min(this.$D,te.daysInMonth())).$d}else L&&this.$d[L](Q);return this.init(),this},F.set=function(B,Y){return this.clone().$set(B,Y)},F.get=function(B){return this[A.p(B)]()},F.add=function(B,Y){var j,_=this;B=Number(B);var q=A.p(Y),L=function(ae){var Z=C(_);return A.w(Z.date(Z.date()+Math.round(ae*B)),_)};if(q===g)return this.set(g,this.$M+B);if(q===S)return this.set(S,this.$y+B);if(q===p)return L(1);if(q===h)return L(7);var Q=(j={},j[u]=o,j[f]=s,j[c]=r,j)[q]||1,te=this.$d.getTime()+B*Q;return A.w(te,this)},F.subtract=function(B,Y){return this.add(-1*B,Y)},F.format=function(B){var Y=this,j=this.$locale();if(!this.isValid())return j.invalidDate||x;var _=B||"YYYY-MM-DDTHH:mm:ssZ",q=A.z(this),L=this.$H,Q=this.$m,te=this.$M,ae=j.weekdays,Z=j.months,le=j.meridiem,ue=function(fe,be,ve,ee){return fe&&(fe[be]||fe(Y,_))||ve[be].slice(0,ee)},J=function(fe){return A.s(L%12||12,fe,"0")},ne=le||function(fe,be,ve){var ee=fe<12?"AM":"PM";return ve?ee.toLowerCase():ee};return _.replace(T,function(fe,be){return be||function(ve){switch(ve){case"YY":return String(Y.$y).slice(-2);case"YYYY":return A.s(Y.$y,4,"0");case"M":return te+1;case"MM":return A.s(te+1,2,"0");case"MMM":return ue(j.monthsShort,te,Z,3);case"MMMM":return ue(Z,te);case"D":return Y.$D;case"DD":return A.s(Y.$D,2,"0");case"d":return String(Y.$W);case"dd":return ue(j.weekdaysMin,Y.$W,ae,2);case"ddd":return ue(j.weekdaysShort,Y.$W,ae,3);case"dddd":return ae[Y.$W];case"H":return String(L);case"HH":return A.s(L,2,"0");case"h":return J(1);case"hh":return J(2);case"a":return ne(L,Q,!0);case"A":return ne(L,Q,!1);case"m":return String(Q);case"mm":return A.s(Q,2,"0");case"s":return String(Y.$s);case"ss":return A.s(Y.$s,2,"0");case"SSS":return A.s(Y.$ms,3,"0");case"Z":return q}return null}(fe)||q.replace(":","")})},F.utcOffset=function(){return 15*-Math.round(this.$d.getTimezoneOffset()/15)},F.diff=function(B,Y,j){var _,q=this,L=A.p(Y),Q=C(B),te=(Q.utcOffset()-this.utcOffset())*o,ae=this-Q,Z=function(){return A.m(q,Q)};switch(L){case S:_=Z()/12;break;case g:_=Z();break;case b:_=Z()/3;break;case h:_=(ae-te)/6048e5;break;case p:_=(ae-te)/864e5;break;case f:_=ae/s;break;case u:_=ae/o;break;case c:_=ae/r;break;default:_=ae}return j?_:A.a(_)},F.daysInMonth=function(){return this.endOf(g).$D},F.$locale=function(){return $[this.$L]},F.locale=function(B,Y){if(!B)return this.$L;var j=this.clone(),_=U(B,Y,!0);return _&&(j.$L=_),j},F.clone=function(){return A.w(this.$d,this)},F.toDate=function(){return new Date(this.valueOf())},F.toJSON=function(){return this.isValid()?this.toISOString():null},F.toISOString=function(){return this.$d.toISOString()},F.toString=function(){return this.$d.toUTCString()},V}(),W=H.prototype;return C.prototype=W,[["$ms",a],["$s",c],["$m",u],["$H",f],["$W",p],["$M",g],["$y",S],["$D",v]].forEach(function(V){W[V[1]]=function(F){return this.$g(F,V[0],V[1])}}),C.extend=function(V,F){return V.$i||(V(F,H,C),V.$i=!0),C},C.locale=U,C.isDayjs=N,C.unix=function(V){return C(1e3*V)},C.en=$[D],C.Ls=$,C.p={},C})}(cc)),cc.exports}var vN=yN();const kt=dr(vN);var uc={exports:{}},bN=uc.exports,Sv;function xN(){return Sv||(Sv=1,function(e,t){(function(r,o){e.exports=o()})(bN,function(){var r="week",o="year";return function(s,a,c){var u=a.prototype;u.week=function(f){if(f===void 0&&(f=null),f!==null)return this.add(7*(f-this.week()),"day");var p=this.$locale().yearStart||1;if(this.month()===11&&this.date()>25){var h=c(this).startOf(o).add(1,o).date(p),g=c(this).endOf(r);if(h.isBefore(g))return 1}var b=c(this).startOf(o).date(p).startOf(r).subtract(1,"millisecond"),S=this.diff(b,r,!0);return S<0?c(this).startOf("week").week():Math.ceil(S)},u.weeks=function(f){return f===void 0&&(f=null),this.week(f)}}})}(uc)),uc.exports}var wN=xN();const SN=dr(wN);var dc={exports:{}},CN=dc.exports,Cv;function kN(){return Cv||(Cv=1,function(e,t){(function(r,o){e.exports=o()})(CN,function(){var r={LTS:"h:mm:ss A",LT:"h:mm A",L:"MM/DD/YYYY",LL:"MMMM D, YYYY",LLL:"MMMM D, YYYY h:mm A",LLLL:"dddd, MMMM D, YYYY h:mm A"},o=/(\[[^[]*\])|([-_:/.,()\s]+)|(A|a|Q|YYYY|YY?|ww?|MM?M?M?|Do|DD?|hh?|HH?|mm?|ss?|S{1,3}|z|ZZ?)/g,s=/\d/,a=/\d\d/,c=/\d\d?/,u=/\d*[^-_:/,()\s\d]+/,f={},p=function(w){return(w=+w)+(w>68?1900:2e3)},h=function(w){return function(T){this[w]=+T}},g=[/[+-]\d\d:?(\d\d)?|Z/,function(w){(this.zone||(this.zone={})).offset=function(T){if(!T||T==="Z")return 0;var R=T.match(/([+-]|\d\d)/g),P=60*R[1]+(+R[2]||0);return P===0?0:R[0]==="+"?-P:P}(w)}],b=function(w){var T=f[w];return T&&(T.indexOf?T:T.s.concat(T.f))},S=function(w,T){var R,P=f.meridiem;if(P){for(var M=1;M<=24;M+=1)if(w.indexOf(P(M,0,T))>-1){R=M>12;break}}else R=w===(T?"pm":"PM");return R},v={A:[u,function(w){this.afternoon=S(w,!1)}],a:[u,function(w){this.afternoon=S(w,!0)}],Q:[s,function(w){this.month=3*(w-1)+1}],S:[s,function(w){this.milliseconds=100*+w}],SS:[a,function(w){this.milliseconds=10*+w}],SSS:[/\d{3}/,function(w){this.milliseconds=+w}],s:[c,h("seconds")],ss:[c,h("seconds")],m:[c,h("minutes")],mm:[c,h("minutes")],H:[c,h("hours")],h:[c,h("hours")],HH:[c,h("hours")],hh:[c,h("hours")],D:[c,h("day")],DD:[a,h("day")],Do:[u,function(w){var T=f.ordinal,R=w.match(/\d+/);if(this.day=R[0],T)for(var P=1;P<=31;P+=1)T(P).replace(/\[|\]/g,"")===w&&(this.day=P)}],w:[c,h("week")],ww:[a,h("week")],M:[c,h("month")],MM:[a,h("month")],MMM:[u,function(w){var T=b("months"),R=(b("monthsShort")||T.map(function(P){return P.slice(0,3)})).indexOf(w)+1;if(R<1)throw new Error;this.month=R%12||R}],MMMM:[u,function(w){var T=b("months").indexOf(w)+1;if(T<1)throw new Error;this.month=T%12||T}],Y:[/[+-]?\d+/,h("year")],YY:[a,function(w){this.year=p(w)}],YYYY:[/\d{4}/,h("year")],Z:g,ZZ:g};function x(w){var T,R;T=w,R=f&&f.formats;for(var P=(w=T.replace(/(\[[^\]]+])|(LTS?|l{1,4}|L{1,4})/g,function(C,A,H){var W=H&&H.toUpperCase();return A||R[H]||r[H]||R[W].replace(/(\[[^\]]+])|(MMMM|MM|DD|dddd)/g,function(V,F,B){return F||B.slice(1)})})).match(o),M=P.length,D=0;D<M;D+=1){var $=P[D],O=v[$],N=O&&O[0],U=O&&O[1];P[D]=U?{regex:N,parser:U}:$.replace(/^\[|\]$/g,"")}return function(C){for(var A={},H=0,W=0;H<M;H+=1){var V=P[H];if(typeof V=="string")W+=V.length;else{var F=V.regex,B=V.parser,Y=C.slice(W),j=F.exec(Y)[0];B.call(A,j),C=C.replace(j,"")}}return function(_){var q=_.afternoon;if(q!==void 0){var L=_.hours;q?L<12&&(_.hours+=12):L===12&&(_.hours=0),delete _.afternoon}}(A),A}}return function(w,T,R){R.p.customParseFormat=!0,w&&w.parseTwoDigitYear&&(p=w.parseTwoDigitYear);var P=T.prototype,M=P.parse;P.parse=function(D){var $=D.date,O=D.utc,N=D.args;this.$u=O;var U=N[1];if(typeof U=="string"){var C=N[2]===!0,A=N[3]===!0,H=C||A,W=N[2];A&&(W=N[2]),f=this.$locale(),!C&&W&&(f=R.Ls[W]),this.$d=function(Y,j,_,q){try{if(["x","X"].indexOf(j)>-1)return new Date((j==="X"?1e3:1)*Y);var L=x(j)(Y),Q=L.year,te=L.month,ae=L.day,Z=L.hours,le=L.minutes,ue=L.seconds,J=L.milliseconds,ne=L.zone,fe=L.week,be=new Date,ve=ae||(Q||te?1:be.getDate()),ee=Q||be.getFullYear(),me=0;Q&&!te||(me=te>0?te-1:be.getMonth());var xe,he=Z||0,de=le||0,ge=ue||0,we=J||0;return ne?new Date(Date.UTC(ee,me,ve,he,de,ge,we+60*ne.offset*1e3)):_?new Date(Date.UTC(ee,me,ve,he,de,ge,we)):(xe=new Date(ee,me,ve,he,de,ge,we),fe&&(xe=q(xe).week(fe).toDate()),xe)}catch{return new Date("")}}($,U,O,R),this.init(),W&&W!==!0&&(this.$L=this.locale(W).$L),H&&$!=this.format(U)&&(this.$d=new Date("")),f={}}else if(U instanceof Array)for(var V=U.length,F=1;F<=V;F+=1){N[1]=U[F-1];var B=R.apply(this,N);if(B.isValid()){this.$d=B.$d,this.$L=B.$L,this.init();break}F===V&&(this.$d=new Date(""))}else M.call(this,D)}}})}(dc)),dc.exports}var TN=kN();const PN=dr(TN);var fc={exports:{}},MN=fc.exports,kv;function RN(){return kv||(kv=1,function(e,t){(function(r,o){e.exports=o()})(MN,function(){var r={LTS:"h:mm:ss A",LT:"h:mm A",L:"MM/DD/YYYY",LL:"MMMM D, YYYY",LLL:"MMMM D, YYYY h:mm A",LLLL:"dddd, MMMM D, YYYY h:mm A"};return function(o,s,a){var c=s.prototype,u=c.format;a.en.formats=r,c.format=function(f){f===void 0&&(f="YYYY-MM-DDTHH:mm:ssZ");var p=this.$locale().formats,h=function(g,b){return g.replace(/(\[[^\]]+])|(LTS?|l{1,4}|L{1,4})/g,function(S,v,x){var w=x&&x.toUpperCase();return v||b[x]||r[x]||b[w].replace(/(\[[^\]]+])|(MMMM|MM|DD|dddd)/g,function(T,R,P){return R||P.slice(1)})})}(f,p===void 0?{}:p);return u.call(this,h)}}})}(fc)),fc.exports}var DN=RN();const EN=dr(DN);var pc={exports:{}},IN=pc.exports,Tv;function ON(){return Tv||(Tv=1,function(e,t){(function(r,o){e.exports=o()})(IN,function(){return function(r,o,s){o.prototype.isBetween=function(a,c,u,f){var p=s(a),h=s(c),g=(f=f||"()")[0]==="(",b=f[1]===")";return(g?this.isAfter(p,u):!this.isBefore(p,u))&&(b?this.isBefore(h,u):!this.isAfter(h,u))||(g?this.isBefore(p,u):!this.isAfter(p,u))&&(b?this.isAfter(h,u):!this.isBefore(h,u))}}})}(pc)),pc.exports}var $N=ON();const AN=dr($N);var mc={exports:{}},NN=mc.exports,Pv;function LN(){return Pv||(Pv=1,function(e,t){(function(r,o){e.exports=o()})(NN,function(){return function(r,o){var s=o.prototype,a=s.format;s.format=function(c){var u=this,f=this.$locale();if(!this.isValid())return a.bind(this)(c);var p=this.$utils(),h=(c||"YYYY-MM-DDTHH:mm:ssZ").replace(/\[([^\]]+)]|Q|wo|ww|w|WW|W|zzz|z|gggg|GGGG|Do|X|x|k{1,2}|S/g,function(g){switch(g){case"Q":return Math.ceil((u.$M+1)/3);case"Do":return f.ordinal(u.$D);case"gggg":return u.weekYear();case"GGGG":return u.isoWeekYear();case"wo":return f.ordinal(u.week(),"W");case"w":case"ww":return p.s(u.week(),g==="w"?1:2,"0");case"W":case"WW":return p.s(u.isoWeek(),g==="W"?1:2,"0");case"k":case"kk":return p.s(String(u.$H===0?24:u.$H),g==="k"?1:2,"0");case"X":return Math.floor(u.$d.getTime()/1e3);case"x":return u.$d.getTime();case"z":return"["+u.offsetName()+"]";case"zzz":return"["+u.offsetName("long")+"]";default:return g}});return a.bind(this)(h)}}})}(mc)),mc.exports}var FN=LN();const BN=dr(FN);kt.extend(EN);kt.extend(SN);kt.extend(AN);kt.extend(BN);const VN={YY:"year",YYYY:{sectionType:"year",contentType:"digit",maxLength:4},M:{sectionType:"month",contentType:"digit",maxLength:2},MM:"month",MMM:{sectionType:"month",contentType:"letter"},MMMM:{sectionType:"month",contentType:"letter"},D:{sectionType:"day",contentType:"digit",maxLength:2},DD:"day",Do:{sectionType:"day",contentType:"digit-with-letter"},d:{sectionType:"weekDay",contentType:"digit",maxLength:2},dd:{sectionType:"weekDay",contentType:"letter"},ddd:{sectionType:"weekDay",contentType:"letter"},dddd:{sectionType:"weekDay",contentType:"letter"},A:"meridiem",a:"meridiem",H:{sectionType:"hours",contentType:"digit",maxLength:2},HH:"hours",h:{sectionType:"hours",contentType:"digit",maxLength:2},hh:"hours",m:{sectionType:"minutes",contentType:"digit",maxLength:2},mm:"minutes",s:{sectionType:"seconds",contentType:"digit",maxLength:2},ss:"seconds"},jN={year:"YYYY",month:"MMMM",monthShort:"MMM",dayOfMonth:"D",dayOfMonthFull:"Do",weekday:"dddd",weekdayShort:"dd",hours24h:"HH",hours12h:"hh",meridiem:"A",minutes:"mm",seconds:"ss",fullDate:"ll",keyboardDate:"L",shortDate:"MMM D",normalDate:"D MMMM",normalDateWithWeekday:"ddd, MMM D",fullTime:"LT",fullTime12h:"hh:mm A",fullTime24h:"HH:mm",keyboardDateTime:"L LT",keyboardDateTime12h:"L hh:mm A",keyboardDateTime24h:"L HH:mm"},bf=["Missing UTC plugin","To be able to use UTC or timezones, you have to enable the `utc` plugin","Find more information on https://mui.com/x/react-date-pickers/timezone/#day-js-and-utc"].join(`
-`),Mv=["Missing timezone plugin","To be able to use timezones, you have to enable both the `utc` and the `timezone` plugin","Find more information on https://mui.com/x/react-date-pickers/timezone/#day-js-and-timezone"].join(`
-`),zN=(e,t)=>t?(...r)=>e(...r).locale(t):e;class _N{constructor({locale:t,formats:r}={}){this.isMUIAdapter=!0,this.isTimezoneCompatible=!0,this.lib="dayjs",this.dayjs=void 0,this.locale=void 0,this.formats=void 0,this.escapedCharacters={start:"[",end:"]"},this.formatTokenMap=VN,this.setLocaleToValue=o=>{const s=this.getCurrentLocaleCode();return s===o.locale()?o:o.locale(s)},this.hasUTCPlugin=()=>typeof kt.utc<"u",this.hasTimezonePlugin=()=>typeof kt.tz<"u",this.isSame=(o,s,a)=>{const c=this.setTimezone(s,this.getTimezone(o));return o.format(a)===c.format(a)},this.cleanTimezone=o=>{switch(o){case"default":return;case"system":return kt.tz.guess();default:return o}},this.createSystemDate=o=>{if(this.hasUTCPlugin()&&this.hasTimezonePlugin()){const s=kt.tz.guess();return s!=="UTC"?kt.tz(o,s):kt(o)}return kt(o)},this.createUTCDate=o=>{if(!this.hasUTCPlugin())throw new Error(bf);return kt.utc(o)},this.createTZDate=(o,s)=>{if(!this.hasUTCPlugin())throw new Error(bf);if(!this.hasTimezonePlugin())throw new Error(Mv);const a=o!==void 0&&!o.endsWith("Z");return kt(o).tz(this.cleanTimezone(s),a)},this.getLocaleFormats=()=>{const o=kt.Ls,s=this.locale||"en";let a=o[s];return a===void 0&&(a=o.en),a.formats},this.adjustOffset=o=>{if(!this.hasTimezonePlugin())return o;const s=this.getTimezone(o);if(s!=="UTC"){const a=o.tz(this.cleanTimezone(s),!0);if(a.$offset===(o.$offset??0))return o;o.$offset=a.$offset}return o},this.date=(o,s="default")=>{if(o===null)return null;let a;return s==="UTC"?a=this.createUTCDate(o):s==="system"||s==="default"&&!this.hasTimezonePlugin()?a=this.createSystemDate(o):a=this.createTZDate(o,s),this.locale===void 0?a:a.locale(this.locale)},this.getInvalidDate=()=>kt(new Date("Invalid date")),this.getTimezone=o=>{var s;if(this.hasTimezonePlugin()){const a=(s=o.$x)==null?void 0:s.$timezone;if(a)return a}return this.hasUTCPlugin()&&o.isUTC()?"UTC":"system"},this.setTimezone=(o,s)=>{if(this.getTimezone(o)===s)return o;if(s==="UTC"){if(!this.hasUTCPlugin())throw new Error(bf);return o.utc()}if(s==="system")return o.local();if(!this.hasTimezonePlugin()){if(s==="default")return o;throw new Error(Mv)}return kt.tz(o,this.cleanTimezone(s))},this.toJsDate=o=>o.toDate(),this.parse=(o,s)=>o===""?null:this.dayjs(o,s,this.locale,!0),this.getCurrentLocaleCode=()=>this.locale||"en",this.is12HourCycleInCurrentLocale=()=>/A|a/.test(this.getLocaleFormats().LT||""),this.expandFormat=o=>{const s=this.getLocaleFormats(),a=c=>c.replace(/(\[[^\]]+])|(MMMM|MM|DD|dddd)/g,(u,f,p)=>f||p.slice(1));return o.replace(/(\[[^\]]+])|(LTS?|l{1,4}|L{1,4})/g,(c,u,f)=>{const p=f&&f.toUpperCase();return u||s[f]||a(s[p])})},this.isValid=o=>o==null?!1:o.isValid(),this.format=(o,s)=>this.formatByString(o,this.formats[s]),this.formatByString=(o,s)=>this.dayjs(o).format(s),this.formatNumber=o=>o,this.isEqual=(o,s)=>o===null&&s===null?!0:o===null||s===null?!1:o.toDate().getTime()===s.toDate().getTime(),this.isSameYear=(o,s)=>this.isSame(o,s,"YYYY"),this.isSameMonth=(o,s)=>this.isSame(o,s,"YYYY-MM"),this.isSameDay=(o,s)=>this.isSame(o,s,"YYYY-MM-DD"),this.isSameHour=(o,s)=>o.isSame(s,"hour"),this.isAfter=(o,s)=>o>s,this.isAfterYear=(o,s)=>this.hasUTCPlugin()?!this.isSameYear(o,s)&&o.utc()>s.utc():o.isAfter(s,"year"),this.isAfterDay=(o,s)=>this.hasUTCPlugin()?!this.isSameDay(o,s)&&o.utc()>s.utc():o.isAfter(s,"day"),this.isBefore=(o,s)=>o<s,this.isBeforeYear=(o,s)=>this.hasUTCPlugin()?!this.isSameYear(o,s)&&o.utc()<s.utc():o.isBefore(s,"year"),this.isBeforeDay=(o,s)=>this.hasUTCPlugin()?!this.isSameDay(o,s)&&o.utc()<s.utc():o.isBefore(s,"day"),this.isWithinRange=(o,[s,a])=>o>=s&&o<=a,this.startOfYear=o=>this.adjustOffset(o.startOf("year")),this.startOfMonth=o=>this.adjustOffset(o.startOf("month")),this.startOfWeek=o=>this.adjustOffset(this.setLocaleToValue(o).startOf("week")),this.startOfDay=o=>this.adjustOffset(o.startOf("day")),this.endOfYear=o=>this.adjustOffset(o.endOf("year")),this.endOfMonth=o=>this.adjustOffset(o.endOf("month")),this.endOfWeek=o=>this.adjustOffset(this.setLocaleToValue(o).endOf("week")),this.endOfDay=o=>this.adjustOffset(o.endOf("day")),this.addYears=(o,s)=>this.adjustOffset(s<0?o.subtract(Math.abs(s),"year"):o.add(s,"year")),this.addMonths=(o,s)=>this.adjustOffset(s<0?o.subtract(Math.abs(s),"month"):o.add(s,"month")),this.addWeeks=(o,s)=>this.adjustOffset(s<0?o.subtract(Math.abs(s),"week"):o.add(s,"week")),this.addDays=(o,s)=>this.adjustOffset(s<0?o.subtract(Math.abs(s),"day"):o.add(s,"day")),this.addHours=(o,s)=>this.adjustOffset(s<0?o.subtract(Math.abs(s),"hour"):o.add(s,"hour")),this.addMinutes=(o,s)=>this.adjustOffset(s<0?o.subtract(Math.abs(s),"minute"):o.add(s,"minute")),this.addSeconds=(o,s)=>this.adjustOffset(s<0?o.subtract(Math.abs(s),"second"):o.add(s,"second")),this.getYear=o=>o.year(),this.getMonth=o=>o.month(),this.getDate=o=>o.date(),this.getHours=o=>o.hour(),this.getMinutes=o=>o.minute(),this.getSeconds=o=>o.second(),this.getMilliseconds=o=>o.millisecond(),this.setYear=(o,s)=>this.adjustOffset(o.set("year",s)),this.setMonth=(o,s)=>this.adjustOffset(o.set("month",s)),this.setDate=(o,s)=>this.adjustOffset(o.set("date",s)),this.setHours=(o,s)=>this.adjustOffset(o.set("hour",s)),this.setMinutes=(o,s)=>this.adjustOffset(o.set("minute",s)),this.setSeconds=(o,s)=>this.adjustOffset(o.set("second",s)),this.setMilliseconds=(o,s)=>this.adjustOffset(o.set("millisecond",s)),this.getDaysInMonth=o=>o.daysInMonth(),this.getWeekArray=o=>{const s=this.startOfWeek(this.startOfMonth(o)),a=this.endOfWeek(this.endOfMonth(o));let c=0,u=s;const f=[];for(;u<a;){const p=Math.floor(c/7);f[p]=f[p]||[],f[p].push(u),u=this.addDays(u,1),c+=1}return f},this.getWeekNumber=o=>o.week(),this.getYearRange=([o,s])=>{const a=this.startOfYear(o),c=this.endOfYear(s),u=[];let f=a;for(;this.isBefore(f,c);)u.push(f),f=this.addYears(f,1);return u},this.dayjs=zN(kt,t),this.locale=t,this.formats=K({},jN,r),kt.extend(PN)}getDayOfWeek(t){return t.day()+1}}var hc={exports:{}},WN=hc.exports,Rv;function UN(){return Rv||(Rv=1,function(e,t){(function(r,o){e.exports=o()})(WN,function(){var r="minute",o=/[+-]\d\d(?::?\d\d)?/g,s=/([+-]|\d\d)/g;return function(a,c,u){var f=c.prototype;u.utc=function(x){var w={date:x,utc:!0,args:arguments};return new c(w)},f.utc=function(x){var w=u(this.toDate(),{locale:this.$L,utc:!0});return x?w.add(this.utcOffset(),r):w},f.local=function(){return u(this.toDate(),{locale:this.$L,utc:!1})};var p=f.parse;f.parse=function(x){x.utc&&(this.$u=!0),this.$utils().u(x.$offset)||(this.$offset=x.$offset),p.call(this,x)};var h=f.init;f.init=function(){if(this.$u){var x=this.$d;this.$y=x.getUTCFullYear(),this.$M=x.getUTCMonth(),this.$D=x.getUTCDate(),this.$W=x.getUTCDay(),this.$H=x.getUTCHours(),this.$m=x.getUTCMinutes(),this.$s=x.getUTCSeconds(),this.$ms=x.getUTCMilliseconds()}else h.call(this)};var g=f.utcOffset;f.utcOffset=function(x,w){var T=this.$utils().u;if(T(x))return this.$u?0:T(this.$offset)?g.call(this):this.$offset;if(typeof x=="string"&&(x=function(D){D===void 0&&(D="");var $=D.match(o);if(!$)return null;var O=(""+$[0]).match(s)||["-",0,0],N=O[0],U=60*+O[1]+ +O[2];return U===0?0:N==="+"?U:-U}(x),x===null))return this;var R=Math.abs(x)<=16?60*x:x,P=this;if(w)return P.$offset=R,P.$u=x===0,P;if(x!==0){var M=this.$u?this.toDate().getTimezoneOffset():-1*this.utcOffset();(P=this.local().add(R+M,r)).$offset=R,P.$x.$localOffset=M}else P=this.utc();return P};var b=f.format;f.format=function(x){var w=x||(this.$u?"YYYY-MM-DDTHH:mm:ss[Z]":"");return b.call(this,w)},f.valueOf=function(){var x=this.$utils().u(this.$offset)?0:this.$offset+(this.$x.$localOffset||this.$d.getTimezoneOffset());return this.$d.valueOf()-6e4*x},f.isUTC=function(){return!!this.$u},f.toISOString=function(){return this.toDate().toISOString()},f.toString=function(){return this.toDate().toUTCString()};var S=f.toDate;f.toDate=function(x){return x==="s"&&this.$offset?u(this.format("YYYY-MM-DD HH:mm:ss:SSS")).toDate():S.call(this)};var v=f.diff;f.diff=function(x,w,T){if(x&&this.$u===x.$u)return v.call(this,x,w,T);var R=this.local(),P=u(x).local();return v.call(R,P,w,T)}}})}(hc)),hc.exports}var HN=UN();const YN=dr(HN);var gc={exports:{}},KN=gc.exports,Dv;function qN(){return Dv||(Dv=1,function(e,t){(function(r,o){e.exports=o()})(KN,function(){var r={year:0,month:1,day:2,hour:3,minute:4,second:5},o={};return function(s,a,c){var u,f=function(b,S,v){v===void 0&&(v={});var x=new Date(b),w=function(T,R){R===void 0&&(R={});var P=R.timeZoneName||"short",M=T+"|"+P,D=o[M];return D||(D=new Intl.DateTimeFormat("en-US",{hour12:!1,timeZone:T,year:"numeric",month:"2-digit",day:"2-digit",hour:"2-digit",minute:"2-digit",second:"2-digit",timeZoneName:P}),o[M]=D),D}(S,v);return w.formatToParts(x)},p=function(b,S){for(var v=f(b,S),x=[],w=0;w<v.length;w+=1){var T=v[w],R=T.type,P=T.value,M=r[R];M>=0&&(x[M]=parseInt(P,10))}var D=x[3],$=D===24?0:D,O=x[0]+"-"+x[1]+"-"+x[2]+" "+$+":"+x[4]+":"+x[5]+":000",N=+b;return(c.utc(O).valueOf()-(N-=N%1e3))/6e4},h=a.prototype;h.tz=function(b,S){b===void 0&&(b=u);var v,x=this.utcOffset(),w=this.toDate(),T=w.toLocaleString("en-US",{timeZone:b}),R=Math.round((w-new Date(T))/1e3/60),P=15*-Math.round(w.getTimezoneOffset()/15)-R;if(!Number(P))v=this.utcOffset(0,S);else if(v=c(T,{locale:this.$L}).$set("millisecond",this.$ms).utcOffset(P,!0),S){var M=v.utcOffset();v=v.add(x-M,"minute")}return v.$x.$timezone=b,v},h.offsetName=function(b){var S=this.$x.$timezone||c.tz.guess(),v=f(this.valueOf(),S,{timeZoneName:b}).find(function(x){return x.type.toLowerCase()==="timezonename"});return v&&v.value};var g=h.startOf;h.startOf=function(b,S){if(!this.$x||!this.$x.$timezone)return g.call(this,b,S);var v=c(this.format("YYYY-MM-DD HH:mm:ss:SSS"),{locale:this.$L});return g.call(v,b,S).tz(this.$x.$timezone,!0)},c.tz=function(b,S,v){var x=v&&S,w=v||S||u,T=p(+c(),w);if(typeof b!="string")return c(b).tz(w);var R=function($,O,N){var U=$-60*O*1e3,C=p(U,N);if(O===C)return[U,O];var A=p(U-=60*(C-O)*1e3,N);return C===A?[U,C]:[$-60*Math.min(C,A)*1e3,Math.max(C,A)]}(c.utc(b,x).valueOf(),T,w),P=R[0],M=R[1],D=c(P).utcOffset(M);return D.$x.$timezone=w,D},c.tz.guess=function(){return Intl.DateTimeFormat().resolvedOptions().timeZone},c.tz.setDefault=function(b){u=b}}})}(gc)),gc.exports}var GN=qN();const QN=dr(GN);function ox(e,t){return function(){return e.apply(t,arguments)}}const{toString:XN}=Object.prototype,{getPrototypeOf:_p}=Object,cu=(e=>t=>{const r=XN.call(t);return e[r]||(e[r]=r.slice(8,-1).toLowerCase())})(Object.create(null)),mr=e=>(e=e.toLowerCase(),t=>cu(t)===e),uu=e=>t=>typeof t===e,{isArray:Gi}=Array,ba=uu("undefined");function ZN(e){return e!==null&&!ba(e)&&e.constructor!==null&&!ba(e.constructor)&&En(e.constructor.isBuffer)&&e.constructor.isBuffer(e)}const ix=mr("ArrayBuffer");function JN(e){let t;return typeof ArrayBuffer<"u"&&ArrayBuffer.isView?t=ArrayBuffer.isView(e):t=e&&e.buffer&&ix(e.buffer),t}const eL=uu("string"),En=uu("function"),sx=uu("number"),du=e=>e!==null&&typeof e=="object",tL=e=>e===!0||e===!1,yc=e=>{if(cu(e)!=="object")return!1;const t=_p(e);return(t===null||t===Object.prototype||Object.getPrototypeOf(t)===null)&&!(Symbol.toStringTag in e)&&!(Symbol.iterator in e)},nL=mr("Date"),rL=mr("File"),oL=mr("Blob"),iL=mr("FileList"),sL=e=>du(e)&&En(e.pipe),aL=e=>{let t;return e&&(typeof FormData=="function"&&e instanceof FormData||En(e.append)&&((t=cu(e))==="formdata"||t==="object"&&En(e.toString)&&e.toString()==="[object FormData]"))},lL=mr("URLSearchParams"),[cL,uL,dL,fL]=["ReadableStream","Request","Response","Headers"].map(mr),pL=e=>e.trim?e.trim():e.replace(/^[\s\uFEFF\xA0]+|[\s\uFEFF\xA0]+$/g,"");function $a(e,t,{allOwnKeys:r=!1}={}){if(e===null||typeof e>"u")return;let o,s;if(typeof e!="object"&&(e=[e]),Gi(e))for(o=0,s=e.length;o<s;o++)t.call(null,e[o],o,e);else{const a=r?Object.getOwnPropertyNames(e):Object.keys(e),c=a.length;let u;for(o=0;o<c;o++)u=a[o],t.call(null,e[u],u,e)}}function ax(e,t){t=t.toLowerCase();const r=Object.keys(e);let o=r.length,s;for(;o-- >0;)if(s=r[o],t===s.toLowerCase())return s;return null}const Bo=typeof globalThis<"u"?globalThis:typeof self<"u"?self:typeof window<"u"?window:global,lx=e=>!ba(e)&&e!==Bo;function Hf(){const{caseless:e}=lx(this)&&this||{},t={},r=(o,s)=>{const a=e&&ax(t,s)||s;yc(t[a])&&yc(o)?t[a]=Hf(t[a],o):yc(o)?t[a]=Hf({},o):Gi(o)?t[a]=o.slice():t[a]=o};for(let o=0,s=arguments.length;o<s;o++)arguments[o]&&$a(arguments[o],r);return t}const mL=(e,t,r,{allOwnKeys:o}={})=>($a(t,(s,a)=>{r&&En(s)?e[a]=ox(s,r):e[a]=s},{allOwnKeys:o}),e),hL=e=>(e.charCodeAt(0)===65279&&(e=e.slice(1)),e),gL=(e,t,r,o)=>{e.prototype=Object.create(t.prototype,o),e.prototype.constructor=e,Object.defineProperty(e,"super",{value:t.prototype}),r&&Object.assign(e.prototype,r)},yL=(e,t,r,o)=>{let s,a,c;const u={};if(t=t||{},e==null)return t;do{for(s=Object.getOwnPropertyNames(e),a=s.length;a-- >0;)c=s[a],(!o||o(c,e,t))&&!u[c]&&(t[c]=e[c],u[c]=!0);e=r!==!1&&_p(e)}while(e&&(!r||r(e,t))&&e!==Object.prototype);return t},vL=(e,t,r)=>{e=String(e),(r===void 0||r>e.length)&&(r=e.length),r-=t.length;const o=e.indexOf(t,r);return o!==-1&&o===r},bL=e=>{if(!e)return null;if(Gi(e))return e;let t=e.length;if(!sx(t))return null;const r=new Array(t);for(;t-- >0;)r[t]=e[t];return r},xL=(e=>t=>e&&t instanceof e)(typeof Uint8Array<"u"&&_p(Uint8Array)),wL=(e,t)=>{const o=(e&&e[Symbol.iterator]).call(e);let s;for(;(s=o.next())&&!s.done;){const a=s.value;t.call(e,a[0],a[1])}},SL=(e,t)=>{let r;const o=[];for(;(r=e.exec(t))!==null;)o.push(r);return o},CL=mr("HTMLFormElement"),kL=e=>e.toLowerCase().replace(/[-_\s]([a-z\d])(\w*)/g,function(r,o,s){return o.toUpperCase()+s}),Ev=(({hasOwnProperty:e})=>(t,r)=>e.call(t,r))(Object.prototype),TL=mr("RegExp"),cx=(e,t)=>{const r=Object.getOwnPropertyDescriptors(e),o={};$a(r,(s,a)=>{let c;(c=t(s,a,e))!==!1&&(o[a]=c||s)}),Object.defineProperties(e,o)},PL=e=>{cx(e,(t,r)=>{if(En(e)&&["arguments","caller","callee"].indexOf(r)!==-1)return!1;const o=e[r];if(En(o)){if(t.enumerable=!1,"writable"in t){t.writable=!1;return}t.set||(t.set=()=>{throw Error("Can not rewrite read-only method '"+r+"'")})}})},ML=(e,t)=>{const r={},o=s=>{s.forEach(a=>{r[a]=!0})};return Gi(e)?o(e):o(String(e).split(t)),r},RL=()=>{},DL=(e,t)=>e!=null&&Number.isFinite(e=+e)?e:t,xf="abcdefghijklmnopqrstuvwxyz",Iv="0123456789",ux={DIGIT:Iv,ALPHA:xf,ALPHA_DIGIT:xf+xf.toUpperCase()+Iv},EL=(e=16,t=ux.ALPHA_DIGIT)=>{let r="";const{length:o}=t;for(;e--;)r+=t[Math.random()*o|0];return r};function IL(e){return!!(e&&En(e.append)&&e[Symbol.toStringTag]==="FormData"&&e[Symbol.iterator])}const OL=e=>{const t=new Array(10),r=(o,s)=>{if(du(o)){if(t.indexOf(o)>=0)return;if(!("toJSON"in o)){t[s]=o;const a=Gi(o)?[]:{};return $a(o,(c,u)=>{const f=r(c,s+1);!ba(f)&&(a[u]=f)}),t[s]=void 0,a}}return o};return r(e,0)},$L=mr("AsyncFunction"),AL=e=>e&&(du(e)||En(e))&&En(e.then)&&En(e.catch),dx=((e,t)=>e?setImmediate:t?((r,o)=>(Bo.addEventListener("message",({source:s,data:a})=>{s===Bo&&a===r&&o.length&&o.shift()()},!1),s=>{o.push(s),Bo.postMessage(r,"*")}))(`axios@${Math.random()}`,[]):r=>setTimeout(r))(typeof setImmediate=="function",En(Bo.postMessage)),NL=typeof queueMicrotask<"u"?queueMicrotask.bind(Bo):typeof process<"u"&&process.nextTick||dx,pe={isArray:Gi,isArrayBuffer:ix,isBuffer:ZN,isFormData:aL,isArrayBufferView:JN,isString:eL,isNumber:sx,isBoolean:tL,isObject:du,isPlainObject:yc,isReadableStream:cL,isRequest:uL,isResponse:dL,isHeaders:fL,isUndefined:ba,isDate:nL,isFile:rL,isBlob:oL,isRegExp:TL,isFunction:En,isStream:sL,isURLSearchParams:lL,isTypedArray:xL,isFileList:iL,forEach:$a,merge:Hf,extend:mL,trim:pL,stripBOM:hL,inherits:gL,toFlatObject:yL,kindOf:cu,kindOfTest:mr,endsWith:vL,toArray:bL,forEachEntry:wL,matchAll:SL,isHTMLForm:CL,hasOwnProperty:Ev,hasOwnProp:Ev,reduceDescriptors:cx,freezeMethods:PL,toObjectSet:ML,toCamelCase:kL,noop:RL,toFiniteNumber:DL,findKey:ax,global:Bo,isContextDefined:lx,ALPHABET:ux,generateString:EL,isSpecCompliantForm:IL,toJSONObject:OL,isAsyncFn:$L,isThenable:AL,setImmediate:dx,asap:NL};function Ge(e,t,r,o,s){Error.call(this),Error.captureStackTrace?Error.captureStackTrace(this,this.constructor):this.stack=new Error().stack,this.message=e,this.name="AxiosError",t&&(this.code=t),r&&(this.config=r),o&&(this.request=o),s&&(this.response=s,this.status=s.status?s.status:null)}pe.inherits(Ge,Error,{toJSON:function(){return{message:this.message,name:this.name,description:this.description,number:this.number,fileName:this.fileName,lineNumber:this.lineNumber,columnNumber:this.columnNumber,stack:this.stack,config:pe.toJSONObject(this.config),code:this.code,status:this.status}}});const fx=Ge.prototype,px={};["ERR_BAD_OPTION_VALUE","ERR_BAD_OPTION","ECONNABORTED","ETIMEDOUT","ERR_NETWORK","ERR_FR_TOO_MANY_REDIRECTS","ERR_DEPRECATED","ERR_BAD_RESPONSE","ERR_BAD_REQUEST","ERR_CANCELED","ERR_NOT_SUPPORT","ERR_INVALID_URL"].forEach(e=>{px[e]={value:e}});Object.defineProperties(Ge,px);Object.defineProperty(fx,"isAxiosError",{value:!0});Ge.from=(e,t,r,o,s,a)=>{const c=Object.create(fx);return pe.toFlatObject(e,c,function(f){return f!==Error.prototype},u=>u!=="isAxiosError"),Ge.call(c,e.message,t,r,o,s),c.cause=e,c.name=e.name,a&&Object.assign(c,a),c};const LL=null;function Yf(e){return pe.isPlainObject(e)||pe.isArray(e)}function mx(e){return pe.endsWith(e,"[]")?e.slice(0,-2):e}function Ov(e,t,r){return e?e.concat(t).map(function(s,a){return s=mx(s),!r&&a?"["+s+"]":s}).join(r?".":""):t}function FL(e){return pe.isArray(e)&&!e.some(Yf)}const BL=pe.toFlatObject(pe,{},null,function(t){return/^is[A-Z]/.test(t)});function fu(e,t,r){if(!pe.isObject(e))throw new TypeError("target must be an object");t=t||new FormData,r=pe.toFlatObject(r,{metaTokens:!0,dots:!1,indexes:!1},!1,function(x,w){return!pe.isUndefined(w[x])});const o=r.metaTokens,s=r.visitor||h,a=r.dots,c=r.indexes,f=(r.Blob||typeof Blob<"u"&&Blob)&&pe.isSpecCompliantForm(t);if(!pe.isFunction(s))throw new TypeError("visitor must be a function");function p(v){if(v===null)return"";if(pe.isDate(v))return v.toISOString();if(!f&&pe.isBlob(v))throw new Ge("Blob is not supported. Use a Buffer instead.");return pe.isArrayBuffer(v)||pe.isTypedArray(v)?f&&typeof Blob=="function"?new Blob([v]):Buffer.from(v):v}function h(v,x,w){let T=v;if(v&&!w&&typeof v=="object"){if(pe.endsWith(x,"{}"))x=o?x:x.slice(0,-2),v=JSON.stringify(v);else if(pe.isArray(v)&&FL(v)||(pe.isFileList(v)||pe.endsWith(x,"[]"))&&(T=pe.toArray(v)))return x=mx(x),T.forEach(function(P,M){!(pe.isUndefined(P)||P===null)&&t.append(c===!0?Ov([x],M,a):c===null?x:x+"[]",p(P))}),!1}return Yf(v)?!0:(t.append(Ov(w,x,a),p(v)),!1)}const g=[],b=Object.assign(BL,{defaultVisitor:h,convertValue:p,isVisitable:Yf});function S(v,x){if(!pe.isUndefined(v)){if(g.indexOf(v)!==-1)throw Error("Circular reference detected in "+x.join("."));g.push(v),pe.forEach(v,function(T,R){(!(pe.isUndefined(T)||T===null)&&s.call(t,T,pe.isString(R)?R.trim():R,x,b))===!0&&S(T,x?x.concat(R):[R])}),g.pop()}}if(!pe.isObject(e))throw new TypeError("data must be an object");return S(e),t}function $v(e){const t={"!":"%21","'":"%27","(":"%28",")":"%29","~":"%7E","%20":"+","%00":"\0"};return encodeURIComponent(e).replace(/[!'()~]|%20|%00/g,function(o){return t[o]})}function Wp(e,t){this._pairs=[],e&&fu(e,this,t)}const hx=Wp.prototype;hx.append=function(t,r){this._pairs.push([t,r])};hx.toString=function(t){const r=t?function(o){return t.call(this,o,$v)}:$v;return this._pairs.map(function(s){return r(s[0])+"="+r(s[1])},"").join("&")};function VL(e){return encodeURIComponent(e).replace(/%3A/gi,":").replace(/%24/g,"$").replace(/%2C/gi,",").replace(/%20/g,"+").replace(/%5B/gi,"[").replace(/%5D/gi,"]")}function gx(e,t,r){if(!t)return e;const o=r&&r.encode||VL;pe.isFunction(r)&&(r={serialize:r});const s=r&&r.serialize;let a;if(s?a=s(t,r):a=pe.isURLSearchParams(t)?t.toString():new Wp(t,r).toString(o),a){const c=e.indexOf("#");c!==-1&&(e=e.slice(0,c)),e+=(e.indexOf("?")===-1?"?":"&")+a}return e}class Av{constructor(){this.handlers=[]}use(t,r,o){return this.handlers.push({fulfilled:t,rejected:r,synchronous:o?o.synchronous:!1,runWhen:o?o.runWhen:null}),this.handlers.length-1}eject(t){this.handlers[t]&&(this.handlers[t]=null)}clear(){this.handlers&&(this.handlers=[])}forEach(t){pe.forEach(this.handlers,function(o){o!==null&&t(o)})}}const yx={silentJSONParsing:!0,forcedJSONParsing:!0,clarifyTimeoutError:!1},jL=typeof URLSearchParams<"u"?URLSearchParams:Wp,zL=typeof FormData<"u"?FormData:null,_L=typeof Blob<"u"?Blob:null,WL={isBrowser:!0,classes:{URLSearchParams:jL,FormData:zL,Blob:_L},protocols:["http","https","file","blob","url","data"]},Up=typeof window<"u"&&typeof document<"u",Kf=typeof navigator=="object"&&navigator||void 0,UL=Up&&(!Kf||["ReactNative","NativeScript","NS"].indexOf(Kf.product)<0),HL=typeof WorkerGlobalScope<"u"&&self instanceof WorkerGlobalScope&&typeof self.importScripts=="function",YL=Up&&window.location.href||"http://localhost",KL=Object.freeze(Object.defineProperty({__proto__:null,hasBrowserEnv:Up,hasStandardBrowserEnv:UL,hasStandardBrowserWebWorkerEnv:HL,navigator:Kf,origin:YL},Symbol.toStringTag,{value:"Module"})),rn={...KL,...WL};function qL(e,t){return fu(e,new rn.classes.URLSearchParams,Object.assign({visitor:function(r,o,s,a){return rn.isNode&&pe.isBuffer(r)?(this.append(o,r.toString("base64")),!1):a.defaultVisitor.apply(this,arguments)}},t))}function GL(e){return pe.matchAll(/\w+|\[(\w*)]/g,e).map(t=>t[0]==="[]"?"":t[1]||t[0])}function QL(e){const t={},r=Object.keys(e);let o;const s=r.length;let a;for(o=0;o<s;o++)a=r[o],t[a]=e[a];return t}function vx(e){function t(r,o,s,a){let c=r[a++];if(c==="__proto__")return!0;const u=Number.isFinite(+c),f=a>=r.length;return c=!c&&pe.isArray(s)?s.length:c,f?(pe.hasOwnProp(s,c)?s[c]=[s[c],o]:s[c]=o,!u):((!s[c]||!pe.isObject(s[c]))&&(s[c]=[]),t(r,o,s[c],a)&&pe.isArray(s[c])&&(s[c]=QL(s[c])),!u)}if(pe.isFormData(e)&&pe.isFunction(e.entries)){const r={};return pe.forEachEntry(e,(o,s)=>{t(GL(o),s,r,0)}),r}return null}function XL(e,t,r){if(pe.isString(e))try{return(t||JSON.parse)(e),pe.trim(e)}catch(o){if(o.name!=="SyntaxError")throw o}return(0,JSON.stringify)(e)}const Aa={transitional:yx,adapter:["xhr","http","fetch"],transformRequest:[function(t,r){const o=r.getContentType()||"",s=o.indexOf("application/json")>-1,a=pe.isObject(t);if(a&&pe.isHTMLForm(t)&&(t=new FormData(t)),pe.isFormData(t))return s?JSON.stringify(vx(t)):t;if(pe.isArrayBuffer(t)||pe.isBuffer(t)||pe.isStream(t)||pe.isFile(t)||pe.isBlob(t)||pe.isReadableStream(t))return t;if(pe.isArrayBufferView(t))return t.buffer;if(pe.isURLSearchParams(t))return r.setContentType("application/x-www-form-urlencoded;charset=utf-8",!1),t.toString();let u;if(a){if(o.indexOf("application/x-www-form-urlencoded")>-1)return qL(t,this.formSerializer).toString();if((u=pe.isFileList(t))||o.indexOf("multipart/form-data")>-1){const f=this.env&&this.env.FormData;return fu(u?{"files[]":t}:t,f&&new f,this.formSerializer)}}return a||s?(r.setContentType("application/json",!1),XL(t)):t}],transformResponse:[function(t){const r=this.transitional||Aa.transitional,o=r&&r.forcedJSONParsing,s=this.responseType==="json";if(pe.isResponse(t)||pe.isReadableStream(t))return t;if(t&&pe.isString(t)&&(o&&!this.responseType||s)){const c=!(r&&r.silentJSONParsing)&&s;try{return JSON.parse(t)}catch(u){if(c)throw u.name==="SyntaxError"?Ge.from(u,Ge.ERR_BAD_RESPONSE,this,null,this.response):u}}return t}],timeout:0,xsrfCookieName:"XSRF-TOKEN",xsrfHeaderName:"X-XSRF-TOKEN",maxContentLength:-1,maxBodyLength:-1,env:{FormData:rn.classes.FormData,Blob:rn.classes.Blob},validateStatus:function(t){return t>=200&&t<300},headers:{common:{Accept:"application/json, text/plain, */*","Content-Type":void 0}}};pe.forEach(["delete","get","head","post","put","patch"],e=>{Aa.headers[e]={}});const ZL=pe.toObjectSet(["age","authorization","content-length","content-type","etag","expires","from","host","if-modified-since","if-unmodified-since","last-modified","location","max-forwards","proxy-authorization","referer","retry-after","user-agent"]),JL=e=>{const t={};let r,o,s;return e&&e.split(`
-`).forEach(function(c){s=c.indexOf(":"),r=c.substring(0,s).trim().toLowerCase(),o=c.substring(s+1).trim(),!(!r||t[r]&&ZL[r])&&(r==="set-cookie"?t[r]?t[r].push(o):t[r]=[o]:t[r]=t[r]?t[r]+", "+o:o)}),t},Nv=Symbol("internals");function Ks(e){return e&&String(e).trim().toLowerCase()}function vc(e){return e===!1||e==null?e:pe.isArray(e)?e.map(vc):String(e)}function eF(e){const t=Object.create(null),r=/([^\s,;=]+)\s*(?:=\s*([^,;]+))?/g;let o;for(;o=r.exec(e);)t[o[1]]=o[2];return t}const tF=e=>/^[-_a-zA-Z0-9^`|~,!#$%&'*+.]+$/.test(e.trim());function wf(e,t,r,o,s){if(pe.isFunction(o))return o.call(this,t,r);if(s&&(t=r),!!pe.isString(t)){if(pe.isString(o))return t.indexOf(o)!==-1;if(pe.isRegExp(o))return o.test(t)}}function nF(e){return e.trim().toLowerCase().replace(/([a-z\d])(\w*)/g,(t,r,o)=>r.toUpperCase()+o)}function rF(e,t){const r=pe.toCamelCase(" "+t);["get","set","has"].forEach(o=>{Object.defineProperty(e,o+r,{value:function(s,a,c){return this[o].call(this,t,s,a,c)},configurable:!0})})}class xn{constructor(t){t&&this.set(t)}set(t,r,o){const s=this;function a(u,f,p){const h=Ks(f);if(!h)throw new Error("header name must be a non-empty string");const g=pe.findKey(s,h);(!g||s[g]===void 0||p===!0||p===void 0&&s[g]!==!1)&&(s[g||f]=vc(u))}const c=(u,f)=>pe.forEach(u,(p,h)=>a(p,h,f));if(pe.isPlainObject(t)||t instanceof this.constructor)c(t,r);else if(pe.isString(t)&&(t=t.trim())&&!tF(t))c(JL(t),r);else if(pe.isHeaders(t))for(const[u,f]of t.entries())a(f,u,o);else t!=null&&a(r,t,o);return this}get(t,r){if(t=Ks(t),t){const o=pe.findKey(this,t);if(o){const s=this[o];if(!r)return s;if(r===!0)return eF(s);if(pe.isFunction(r))return r.call(this,s,o);if(pe.isRegExp(r))return r.exec(s);throw new TypeError("parser must be boolean|regexp|function")}}}has(t,r){if(t=Ks(t),t){const o=pe.findKey(this,t);return!!(o&&this[o]!==void 0&&(!r||wf(this,this[o],o,r)))}return!1}delete(t,r){const o=this;let s=!1;function a(c){if(c=Ks(c),c){const u=pe.findKey(o,c);u&&(!r||wf(o,o[u],u,r))&&(delete o[u],s=!0)}}return pe.isArray(t)?t.forEach(a):a(t),s}clear(t){const r=Object.keys(this);let o=r.length,s=!1;for(;o--;){const a=r[o];(!t||wf(this,this[a],a,t,!0))&&(delete this[a],s=!0)}return s}normalize(t){const r=this,o={};return pe.forEach(this,(s,a)=>{const c=pe.findKey(o,a);if(c){r[c]=vc(s),delete r[a];return}const u=t?nF(a):String(a).trim();u!==a&&delete r[a],r[u]=vc(s),o[u]=!0}),this}concat(...t){return this.constructor.concat(this,...t)}toJSON(t){const r=Object.create(null);return pe.forEach(this,(o,s)=>{o!=null&&o!==!1&&(r[s]=t&&pe.isArray(o)?o.join(", "):o)}),r}[Symbol.iterator](){return Object.entries(this.toJSON())[Symbol.iterator]()}toString(){return Object.entries(this.toJSON()).map(([t,r])=>t+": "+r).join(`
-`)}get[Symbol.toStringTag](){return"AxiosHeaders"}static from(t){return t instanceof this?t:new this(t)}static concat(t,...r){const o=new this(t);return r.forEach(s=>o.set(s)),o}static accessor(t){const o=(this[Nv]=this[Nv]={accessors:{}}).accessors,s=this.prototype;function a(c){const u=Ks(c);o[u]||(rF(s,c),o[u]=!0)}return pe.isArray(t)?t.forEach(a):a(t),this}}xn.accessor(["Content-Type","Content-Length","Accept","Accept-Encoding","User-Agent","Authorization"]);pe.reduceDescriptors(xn.prototype,({value:e},t)=>{let r=t[0].toUpperCase()+t.slice(1);return{get:()=>e,set(o){this[r]=o}}});pe.freezeMethods(xn);function Sf(e,t){const r=this||Aa,o=t||r,s=xn.from(o.headers);let a=o.data;return pe.forEach(e,function(u){a=u.call(r,a,s.normalize(),t?t.status:void 0)}),s.normalize(),a}function bx(e){return!!(e&&e.__CANCEL__)}function Qi(e,t,r){Ge.call(this,e??"canceled",Ge.ERR_CANCELED,t,r),this.name="CanceledError"}pe.inherits(Qi,Ge,{__CANCEL__:!0});function xx(e,t,r){const o=r.config.validateStatus;!r.status||!o||o(r.status)?e(r):t(new Ge("Request failed with status code "+r.status,[Ge.ERR_BAD_REQUEST,Ge.ERR_BAD_RESPONSE][Math.floor(r.status/100)-4],r.config,r.request,r))}function oF(e){const t=/^([-+\w]{1,25})(:?\/\/|:)/.exec(e);return t&&t[1]||""}function iF(e,t){e=e||10;const r=new Array(e),o=new Array(e);let s=0,a=0,c;return t=t!==void 0?t:1e3,function(f){const p=Date.now(),h=o[a];c||(c=p),r[s]=f,o[s]=p;let g=a,b=0;for(;g!==s;)b+=r[g++],g=g%e;if(s=(s+1)%e,s===a&&(a=(a+1)%e),p-c<t)return;const S=h&&p-h;return S?Math.round(b*1e3/S):void 0}}function sF(e,t){let r=0,o=1e3/t,s,a;const c=(p,h=Date.now())=>{r=h,s=null,a&&(clearTimeout(a),a=null),e.apply(null,p)};return[(...p)=>{const h=Date.now(),g=h-r;g>=o?c(p,h):(s=p,a||(a=setTimeout(()=>{a=null,c(s)},o-g)))},()=>s&&c(s)]}const Oc=(e,t,r=3)=>{let o=0;const s=iF(50,250);return sF(a=>{const c=a.loaded,u=a.lengthComputable?a.total:void 0,f=c-o,p=s(f),h=c<=u;o=c;const g={loaded:c,total:u,progress:u?c/u:void 0,bytes:f,rate:p||void 0,estimated:p&&u&&h?(u-c)/p:void 0,event:a,lengthComputable:u!=null,[t?"download":"upload"]:!0};e(g)},r)},Lv=(e,t)=>{const r=e!=null;return[o=>t[0]({lengthComputable:r,total:e,loaded:o}),t[1]]},Fv=e=>(...t)=>pe.asap(()=>e(...t)),aF=rn.hasStandardBrowserEnv?((e,t)=>r=>(r=new URL(r,rn.origin),e.protocol===r.protocol&&e.host===r.host&&(t||e.port===r.port)))(new URL(rn.origin),rn.navigator&&/(msie|trident)/i.test(rn.navigator.userAgent)):()=>!0,lF=rn.hasStandardBrowserEnv?{write(e,t,r,o,s,a){const c=[e+"="+encodeURIComponent(t)];pe.isNumber(r)&&c.push("expires="+new Date(r).toGMTString()),pe.isString(o)&&c.push("path="+o),pe.isString(s)&&c.push("domain="+s),a===!0&&c.push("secure"),document.cookie=c.join("; ")},read(e){const t=document.cookie.match(new RegExp("(^|;\\s*)("+e+")=([^;]*)"));return t?decodeURIComponent(t[3]):null},remove(e){this.write(e,"",Date.now()-864e5)}}:{write(){},read(){return null},remove(){}};function cF(e){return/^([a-z][a-z\d+\-.]*:)?\/\//i.test(e)}function uF(e,t){return t?e.replace(/\/?\/$/,"")+"/"+t.replace(/^\/+/,""):e}function wx(e,t){return e&&!cF(t)?uF(e,t):t}const Bv=e=>e instanceof xn?{...e}:e;function Yo(e,t){t=t||{};const r={};function o(p,h,g,b){return pe.isPlainObject(p)&&pe.isPlainObject(h)?pe.merge.call({caseless:b},p,h):pe.isPlainObject(h)?pe.merge({},h):pe.isArray(h)?h.slice():h}function s(p,h,g,b){if(pe.isUndefined(h)){if(!pe.isUndefined(p))return o(void 0,p,g,b)}else return o(p,h,g,b)}function a(p,h){if(!pe.isUndefined(h))return o(void 0,h)}function c(p,h){if(pe.isUndefined(h)){if(!pe.isUndefined(p))return o(void 0,p)}else return o(void 0,h)}function u(p,h,g){if(g in t)return o(p,h);if(g in e)return o(void 0,p)}const f={url:a,method:a,data:a,baseURL:c,transformRequest:c,transformResponse:c,paramsSerializer:c,timeout:c,timeoutMessage:c,withCredentials:c,withXSRFToken:c,adapter:c,responseType:c,xsrfCookieName:c,xsrfHeaderName:c,onUploadProgress:c,onDownloadProgress:c,decompress:c,maxContentLength:c,maxBodyLength:c,beforeRedirect:c,transport:c,httpAgent:c,httpsAgent:c,cancelToken:c,socketPath:c,responseEncoding:c,validateStatus:u,headers:(p,h,g)=>s(Bv(p),Bv(h),g,!0)};return pe.forEach(Object.keys(Object.assign({},e,t)),function(h){const g=f[h]||s,b=g(e[h],t[h],h);pe.isUndefined(b)&&g!==u||(r[h]=b)}),r}const Sx=e=>{const t=Yo({},e);let{data:r,withXSRFToken:o,xsrfHeaderName:s,xsrfCookieName:a,headers:c,auth:u}=t;t.headers=c=xn.from(c),t.url=gx(wx(t.baseURL,t.url),e.params,e.paramsSerializer),u&&c.set("Authorization","Basic "+btoa((u.username||"")+":"+(u.password?unescape(encodeURIComponent(u.password)):"")));let f;if(pe.isFormData(r)){if(rn.hasStandardBrowserEnv||rn.hasStandardBrowserWebWorkerEnv)c.setContentType(void 0);else if((f=c.getContentType())!==!1){const[p,...h]=f?f.split(";").map(g=>g.trim()).filter(Boolean):[];c.setContentType([p||"multipart/form-data",...h].join("; "))}}if(rn.hasStandardBrowserEnv&&(o&&pe.isFunction(o)&&(o=o(t)),o||o!==!1&&aF(t.url))){const p=s&&a&&lF.read(a);p&&c.set(s,p)}return t},dF=typeof XMLHttpRequest<"u",fF=dF&&function(e){return new Promise(function(r,o){const s=Sx(e);let a=s.data;const c=xn.from(s.headers).normalize();let{responseType:u,onUploadProgress:f,onDownloadProgress:p}=s,h,g,b,S,v;function x(){S&&S(),v&&v(),s.cancelToken&&s.cancelToken.unsubscribe(h),s.signal&&s.signal.removeEventListener("abort",h)}let w=new XMLHttpRequest;w.open(s.method.toUpperCase(),s.url,!0),w.timeout=s.timeout;function T(){if(!w)return;const P=xn.from("getAllResponseHeaders"in w&&w.getAllResponseHeaders()),D={data:!u||u==="text"||u==="json"?w.responseText:w.response,status:w.status,statusText:w.statusText,headers:P,config:e,request:w};xx(function(O){r(O),x()},function(O){o(O),x()},D),w=null}"onloadend"in w?w.onloadend=T:w.onreadystatechange=function(){!w||w.readyState!==4||w.status===0&&!(w.responseURL&&w.responseURL.indexOf("file:")===0)||setTimeout(T)},w.onabort=function(){w&&(o(new Ge("Request aborted",Ge.ECONNABORTED,e,w)),w=null)},w.onerror=function(){o(new Ge("Network Error",Ge.ERR_NETWORK,e,w)),w=null},w.ontimeout=function(){let M=s.timeout?"timeout of "+s.timeout+"ms exceeded":"timeout exceeded";const D=s.transitional||yx;s.timeoutErrorMessage&&(M=s.timeoutErrorMessage),o(new Ge(M,D.clarifyTimeoutError?Ge.ETIMEDOUT:Ge.ECONNABORTED,e,w)),w=null},a===void 0&&c.setContentType(null),"setRequestHeader"in w&&pe.forEach(c.toJSON(),function(M,D){w.setRequestHeader(D,M)}),pe.isUndefined(s.withCredentials)||(w.withCredentials=!!s.withCredentials),u&&u!=="json"&&(w.responseType=s.responseType),p&&([b,v]=Oc(p,!0),w.addEventListener("progress",b)),f&&w.upload&&([g,S]=Oc(f),w.upload.addEventListener("progress",g),w.upload.addEventListener("loadend",S)),(s.cancelToken||s.signal)&&(h=P=>{w&&(o(!P||P.type?new Qi(null,e,w):P),w.abort(),w=null)},s.cancelToken&&s.cancelToken.subscribe(h),s.signal&&(s.signal.aborted?h():s.signal.addEventListener("abort",h)));const R=oF(s.url);if(R&&rn.protocols.indexOf(R)===-1){o(new Ge("Unsupported protocol "+R+":",Ge.ERR_BAD_REQUEST,e));return}w.send(a||null)})},pF=(e,t)=>{const{length:r}=e=e?e.filter(Boolean):[];if(t||r){let o=new AbortController,s;const a=function(p){if(!s){s=!0,u();const h=p instanceof Error?p:this.reason;o.abort(h instanceof Ge?h:new Qi(h instanceof Error?h.message:h))}};let c=t&&setTimeout(()=>{c=null,a(new Ge(`timeout ${t} of ms exceeded`,Ge.ETIMEDOUT))},t);const u=()=>{e&&(c&&clearTimeout(c),c=null,e.forEach(p=>{p.unsubscribe?p.unsubscribe(a):p.removeEventListener("abort",a)}),e=null)};e.forEach(p=>p.addEventListener("abort",a));const{signal:f}=o;return f.unsubscribe=()=>pe.asap(u),f}},mF=function*(e,t){let r=e.byteLength;if(r<t){yield e;return}let o=0,s;for(;o<r;)s=o+t,yield e.slice(o,s),o=s},hF=async function*(e,t){for await(const r of gF(e))yield*mF(r,t)},gF=async function*(e){if(e[Symbol.asyncIterator]){yield*e;return}const t=e.getReader();try{for(;;){const{done:r,value:o}=await t.read();if(r)break;yield o}}finally{await t.cancel()}},Vv=(e,t,r,o)=>{const s=hF(e,t);let a=0,c,u=f=>{c||(c=!0,o&&o(f))};return new ReadableStream({async pull(f){try{const{done:p,value:h}=await s.next();if(p){u(),f.close();return}let g=h.byteLength;if(r){let b=a+=g;r(b)}f.enqueue(new Uint8Array(h))}catch(p){throw u(p),p}},cancel(f){return u(f),s.return()}},{highWaterMark:2})},pu=typeof fetch=="function"&&typeof Request=="function"&&typeof Response=="function",Cx=pu&&typeof ReadableStream=="function",yF=pu&&(typeof TextEncoder=="function"?(e=>t=>e.encode(t))(new TextEncoder):async e=>new Uint8Array(await new Response(e).arrayBuffer())),kx=(e,...t)=>{try{return!!e(...t)}catch{return!1}},vF=Cx&&kx(()=>{let e=!1;const t=new Request(rn.origin,{body:new ReadableStream,method:"POST",get duplex(){return e=!0,"half"}}).headers.has("Content-Type");return e&&!t}),jv=64*1024,qf=Cx&&kx(()=>pe.isReadableStream(new Response("").body)),$c={stream:qf&&(e=>e.body)};pu&&(e=>{["text","arrayBuffer","blob","formData","stream"].forEach(t=>{!$c[t]&&($c[t]=pe.isFunction(e[t])?r=>r[t]():(r,o)=>{throw new Ge(`Response type '${t}' is not supported`,Ge.ERR_NOT_SUPPORT,o)})})})(new Response);const bF=async e=>{if(e==null)return 0;if(pe.isBlob(e))return e.size;if(pe.isSpecCompliantForm(e))return(await new Request(rn.origin,{method:"POST",body:e}).arrayBuffer()).byteLength;if(pe.isArrayBufferView(e)||pe.isArrayBuffer(e))return e.byteLength;if(pe.isURLSearchParams(e)&&(e=e+""),pe.isString(e))return(await yF(e)).byteLength},xF=async(e,t)=>{const r=pe.toFiniteNumber(e.getContentLength());return r??bF(t)},wF=pu&&(async e=>{let{url:t,method:r,data:o,signal:s,cancelToken:a,timeout:c,onDownloadProgress:u,onUploadProgress:f,responseType:p,headers:h,withCredentials:g="same-origin",fetchOptions:b}=Sx(e);p=p?(p+"").toLowerCase():"text";let S=pF([s,a&&a.toAbortSignal()],c),v;const x=S&&S.unsubscribe&&(()=>{S.unsubscribe()});let w;try{if(f&&vF&&r!=="get"&&r!=="head"&&(w=await xF(h,o))!==0){let D=new Request(t,{method:"POST",body:o,duplex:"half"}),$;if(pe.isFormData(o)&&($=D.headers.get("content-type"))&&h.setContentType($),D.body){const[O,N]=Lv(w,Oc(Fv(f)));o=Vv(D.body,jv,O,N)}}pe.isString(g)||(g=g?"include":"omit");const T="credentials"in Request.prototype;v=new Request(t,{...b,signal:S,method:r.toUpperCase(),headers:h.normalize().toJSON(),body:o,duplex:"half",credentials:T?g:void 0});let R=await fetch(v);const P=qf&&(p==="stream"||p==="response");if(qf&&(u||P&&x)){const D={};["status","statusText","headers"].forEach(U=>{D[U]=R[U]});const $=pe.toFiniteNumber(R.headers.get("content-length")),[O,N]=u&&Lv($,Oc(Fv(u),!0))||[];R=new Response(Vv(R.body,jv,O,()=>{N&&N(),x&&x()}),D)}p=p||"text";let M=await $c[pe.findKey($c,p)||"text"](R,e);return!P&&x&&x(),await new Promise((D,$)=>{xx(D,$,{data:M,headers:xn.from(R.headers),status:R.status,statusText:R.statusText,config:e,request:v})})}catch(T){throw x&&x(),T&&T.name==="TypeError"&&/fetch/i.test(T.message)?Object.assign(new Ge("Network Error",Ge.ERR_NETWORK,e,v),{cause:T.cause||T}):Ge.from(T,T&&T.code,e,v)}}),Gf={http:LL,xhr:fF,fetch:wF};pe.forEach(Gf,(e,t)=>{if(e){try{Object.defineProperty(e,"name",{value:t})}catch{}Object.defineProperty(e,"adapterName",{value:t})}});const zv=e=>`- ${e}`,SF=e=>pe.isFunction(e)||e===null||e===!1,Tx={getAdapter:e=>{e=pe.isArray(e)?e:[e];const{length:t}=e;let r,o;const s={};for(let a=0;a<t;a++){r=e[a];let c;if(o=r,!SF(r)&&(o=Gf[(c=String(r)).toLowerCase()],o===void 0))throw new Ge(`Unknown adapter '${c}'`);if(o)break;s[c||"#"+a]=o}if(!o){const a=Object.entries(s).map(([u,f])=>`adapter ${u} `+(f===!1?"is not supported by the environment":"is not available in the build"));let c=t?a.length>1?`since :
-`+a.map(zv).join(`
-`):" "+zv(a[0]):"as no adapter specified";throw new Ge("There is no suitable adapter to dispatch the request "+c,"ERR_NOT_SUPPORT")}return o},adapters:Gf};function Cf(e){if(e.cancelToken&&e.cancelToken.throwIfRequested(),e.signal&&e.signal.aborted)throw new Qi(null,e)}function _v(e){return Cf(e),e.headers=xn.from(e.headers),e.data=Sf.call(e,e.transformRequest),["post","put","patch"].indexOf(e.method)!==-1&&e.headers.setContentType("application/x-www-form-urlencoded",!1),Tx.getAdapter(e.adapter||Aa.adapter)(e).then(function(o){return Cf(e),o.data=Sf.call(e,e.transformResponse,o),o.headers=xn.from(o.headers),o},function(o){return bx(o)||(Cf(e),o&&o.response&&(o.response.data=Sf.call(e,e.transformResponse,o.response),o.response.headers=xn.from(o.response.headers))),Promise.reject(o)})}const Px="1.7.9",mu={};["object","boolean","number","function","string","symbol"].forEach((e,t)=>{mu[e]=function(o){return typeof o===e||"a"+(t<1?"n ":" ")+e}});const Wv={};mu.transitional=function(t,r,o){function s(a,c){return"[Axios v"+Px+"] Transitional option '"+a+"'"+c+(o?". "+o:"")}return(a,c,u)=>{if(t===!1)throw new Ge(s(c," has been removed"+(r?" in "+r:"")),Ge.ERR_DEPRECATED);return r&&!Wv[c]&&(Wv[c]=!0,console.warn(s(c," has been deprecated since v"+r+" and will be removed in the near future"))),t?t(a,c,u):!0}};mu.spelling=function(t){return(r,o)=>(console.warn(`${o} is likely a misspelling of ${t}`),!0)};function CF(e,t,r){if(typeof e!="object")throw new Ge("options must be an object",Ge.ERR_BAD_OPTION_VALUE);const o=Object.keys(e);let s=o.length;for(;s-- >0;){const a=o[s],c=t[a];if(c){const u=e[a],f=u===void 0||c(u,a,e);if(f!==!0)throw new Ge("option "+a+" must be "+f,Ge.ERR_BAD_OPTION_VALUE);continue}if(r!==!0)throw new Ge("Unknown option "+a,Ge.ERR_BAD_OPTION)}}const bc={assertOptions:CF,validators:mu},Sr=bc.validators;class _o{constructor(t){this.defaults=t,this.interceptors={request:new Av,response:new Av}}async request(t,r){try{return await this._request(t,r)}catch(o){if(o instanceof Error){let s={};Error.captureStackTrace?Error.captureStackTrace(s):s=new Error;const a=s.stack?s.stack.replace(/^.+\n/,""):"";try{o.stack?a&&!String(o.stack).endsWith(a.replace(/^.+\n.+\n/,""))&&(o.stack+=`
-`+a):o.stack=a}catch{}}throw o}}_request(t,r){typeof t=="string"?(r=r||{},r.url=t):r=t||{},r=Yo(this.defaults,r);const{transitional:o,paramsSerializer:s,headers:a}=r;o!==void 0&&bc.assertOptions(o,{silentJSONParsing:Sr.transitional(Sr.boolean),forcedJSONParsing:Sr.transitional(Sr.boolean),clarifyTimeoutError:Sr.transitional(Sr.boolean)},!1),s!=null&&(pe.isFunction(s)?r.paramsSerializer={serialize:s}:bc.assertOptions(s,{encode:Sr.function,serialize:Sr.function},!0)),bc.assertOptions(r,{baseUrl:Sr.spelling("baseURL"),withXsrfToken:Sr.spelling("withXSRFToken")},!0),r.method=(r.method||this.defaults.method||"get").toLowerCase();let c=a&&pe.merge(a.common,a[r.method]);a&&pe.forEach(["delete","get","head","post","put","patch","common"],v=>{delete a[v]}),r.headers=xn.concat(c,a);const u=[];let f=!0;this.interceptors.request.forEach(function(x){typeof x.runWhen=="function"&&x.runWhen(r)===!1||(f=f&&x.synchronous,u.unshift(x.fulfilled,x.rejected))});const p=[];this.interceptors.response.forEach(function(x){p.push(x.fulfilled,x.rejected)});let h,g=0,b;if(!f){const v=[_v.bind(this),void 0];for(v.unshift.apply(v,u),v.push.apply(v,p),b=v.length,h=Promise.resolve(r);g<b;)h=h.then(v[g++],v[g++]);return h}b=u.length;let S=r;for(g=0;g<b;){const v=u[g++],x=u[g++];try{S=v(S)}catch(w){x.call(this,w);break}}try{h=_v.call(this,S)}catch(v){return Promise.reject(v)}for(g=0,b=p.length;g<b;)h=h.then(p[g++],p[g++]);return h}getUri(t){t=Yo(this.defaults,t);const r=wx(t.baseURL,t.url);return gx(r,t.params,t.paramsSerializer)}}pe.forEach(["delete","get","head","options"],function(t){_o.prototype[t]=function(r,o){return this.request(Yo(o||{},{method:t,url:r,data:(o||{}).data}))}});pe.forEach(["post","put","patch"],function(t){function r(o){return function(a,c,u){return this.request(Yo(u||{},{method:t,headers:o?{"Content-Type":"multipart/form-data"}:{},url:a,data:c}))}}_o.prototype[t]=r(),_o.prototype[t+"Form"]=r(!0)});class Hp{constructor(t){if(typeof t!="function")throw new TypeError("executor must be a function.");let r;this.promise=new Promise(function(a){r=a});const o=this;this.promise.then(s=>{if(!o._listeners)return;let a=o._listeners.length;for(;a-- >0;)o._listeners[a](s);o._listeners=null}),this.promise.then=s=>{let a;const c=new Promise(u=>{o.subscribe(u),a=u}).then(s);return c.cancel=function(){o.unsubscribe(a)},c},t(function(a,c,u){o.reason||(o.reason=new Qi(a,c,u),r(o.reason))})}throwIfRequested(){if(this.reason)throw this.reason}subscribe(t){if(this.reason){t(this.reason);return}this._listeners?this._listeners.push(t):this._listeners=[t]}unsubscribe(t){if(!this._listeners)return;const r=this._listeners.indexOf(t);r!==-1&&this._listeners.splice(r,1)}toAbortSignal(){const t=new AbortController,r=o=>{t.abort(o)};return this.subscribe(r),t.signal.unsubscribe=()=>this.unsubscribe(r),t.signal}static source(){let t;return{token:new Hp(function(s){t=s}),cancel:t}}}function kF(e){return function(r){return e.apply(null,r)}}function TF(e){return pe.isObject(e)&&e.isAxiosError===!0}const Qf={Continue:100,SwitchingProtocols:101,Processing:102,EarlyHints:103,Ok:200,Created:201,Accepted:202,NonAuthoritativeInformation:203,NoContent:204,ResetContent:205,PartialContent:206,MultiStatus:207,AlreadyReported:208,ImUsed:226,MultipleChoices:300,MovedPermanently:301,Found:302,SeeOther:303,NotModified:304,UseProxy:305,Unused:306,TemporaryRedirect:307,PermanentRedirect:308,BadRequest:400,Unauthorized:401,PaymentRequired:402,Forbidden:403,NotFound:404,MethodNotAllowed:405,NotAcceptable:406,ProxyAuthenticationRequired:407,RequestTimeout:408,Conflict:409,Gone:410,LengthRequired:411,PreconditionFailed:412,PayloadTooLarge:413,UriTooLong:414,UnsupportedMediaType:415,RangeNotSatisfiable:416,ExpectationFailed:417,ImATeapot:418,MisdirectedRequest:421,UnprocessableEntity:422,Locked:423,FailedDependency:424,TooEarly:425,UpgradeRequired:426,PreconditionRequired:428,TooManyRequests:429,RequestHeaderFieldsTooLarge:431,UnavailableForLegalReasons:451,InternalServerError:500,NotImplemented:501,BadGateway:502,ServiceUnavailable:503,GatewayTimeout:504,HttpVersionNotSupported:505,VariantAlsoNegotiates:506,InsufficientStorage:507,LoopDetected:508,NotExtended:510,NetworkAuthenticationRequired:511};Object.entries(Qf).forEach(([e,t])=>{Qf[t]=e});function Mx(e){const t=new _o(e),r=ox(_o.prototype.request,t);return pe.extend(r,_o.prototype,t,{allOwnKeys:!0}),pe.extend(r,t,null,{allOwnKeys:!0}),r.create=function(s){return Mx(Yo(e,s))},r}const Lt=Mx(Aa);Lt.Axios=_o;Lt.CanceledError=Qi;Lt.CancelToken=Hp;Lt.isCancel=bx;Lt.VERSION=Px;Lt.toFormData=fu;Lt.AxiosError=Ge;Lt.Cancel=Lt.CanceledError;Lt.all=function(t){return Promise.all(t)};Lt.spread=kF;Lt.isAxiosError=TF;Lt.mergeConfig=Yo;Lt.AxiosHeaders=xn;Lt.formToJSON=e=>vx(pe.isHTMLForm(e)?new FormData(e):e);Lt.getAdapter=Tx.getAdapter;Lt.HttpStatusCode=Qf;Lt.default=Lt;kt.extend(YN);kt.extend(QN);function PF(){var h,g,b,S,v;const[e,t]=k.useState(""),[r,o]=k.useState(!1),[s,a]=k.useState(null),[c,u]=k.useState(null),f=async()=>{var x;o(!0),u(null),a(null);try{const w=await Lt.post("/parse-event",{url:e});if(w.status===200){const T=w.data;a({...T,start_time:T.start_time?kt(T.start_time):null,end_time:T.end_time?kt(T.end_time):null})}else if(w.status===422&&w.data.parsed_details){const T=w.data.parsed_details;a({...T,start_time:T.start_time?kt(T.start_time):null,end_time:T.end_time?kt(T.end_time):null}),u({message:"Event details were parsed but have some issues:",issues:w.data.issues})}}catch(w){console.error("Error parsing event:",w.response||w);const T=(x=w.response)==null?void 0:x.data;u(T?{message:T.error,issues:T.issues||[T.details],raw:T.raw_response}:{message:"Failed to parse event",issues:[w.message]})}o(!1)},p=async()=>{var x,w,T;o(!0),u(null);try{const R={...s,start_time:(x=s.start_time)==null?void 0:x.toISOString(),end_time:(w=s.end_time)==null?void 0:w.toISOString()},P=await Lt.post("/create-event",R);alert("Event created successfully!")}catch(R){console.error("Error creating event:",R.response||R);const P=(T=R.response)==null?void 0:T.data;u({message:"Failed to create event",issues:(P==null?void 0:P.issues)||[(P==null?void 0:P.details)||R.message]})}o(!1)};return I.jsx(HM,{maxWidth:"md",children:I.jsxs(Gl,{sx:{my:4},children:[I.jsx(Hn,{variant:"h4",component:"h1",gutterBottom:!0,children:"Event Parser"}),I.jsxs(Vo,{sx:{p:3,mb:3},children:[I.jsx(Xs,{fullWidth:!0,label:"Event Page URL",value:e,onChange:x=>t(x.target.value),sx:{mb:2}}),I.jsx(Fo,{variant:"contained",onClick:f,disabled:r||!e,children:r?I.jsx(Oy,{size:24}):"Parse Event"})]}),c&&I.jsxs(Vo,{sx:{p:3,mb:3,bgcolor:"error.light"},children:[I.jsx(Hn,{variant:"h6",color:"error.contrastText",gutterBottom:!0,children:c.message}),c.issues&&c.issues.length>0&&I.jsx(Gl,{component:"ul",sx:{color:"error.contrastText",mt:1},children:c.issues.map((x,w)=>I.jsx("li",{children:x},w))}),c.raw&&I.jsxs(Gl,{sx:{mt:2},children:[I.jsx(Hn,{color:"error.contrastText",variant:"subtitle2",children:"Raw AI Response:"}),I.jsx(Gl,{component:"pre",sx:{mt:1,p:2,bgcolor:"rgba(0,0,0,0.1)",borderRadius:1,overflow:"auto",maxHeight:200,color:"error.contrastText"},children:c.raw})]})]}),s&&I.jsxs(Vo,{sx:{p:3},children:[I.jsx(Hn,{variant:"h6",gutterBottom:!0,children:"Event Details"}),I.jsxs(cb,{dateAdapter:_N,children:[I.jsx(Xs,{fullWidth:!0,label:"Title",value:s.title||"",onChange:x=>a({...s,title:x.target.value}),sx:{mb:2},error:(h=c==null?void 0:c.issues)==null?void 0:h.includes("Missing required field: title")}),I.jsx(Xs,{fullWidth:!0,multiline:!0,rows:4,label:"Description",value:s.description||"",onChange:x=>a({...s,description:x.target.value}),sx:{mb:2},error:(g=c==null?void 0:c.issues)==null?void 0:g.includes("Missing required field: description")}),I.jsx(xv,{label:"Start Time",value:s.start_time,onChange:x=>a({...s,start_time:x}),sx:{mb:2,width:"100%"},slotProps:{textField:{error:(b=c==null?void 0:c.issues)==null?void 0:b.some(x=>x.includes("start_time"))}}}),I.jsx(xv,{label:"End Time",value:s.end_time,onChange:x=>a({...s,end_time:x}),sx:{mb:2,width:"100%"},slotProps:{textField:{error:(S=c==null?void 0:c.issues)==null?void 0:S.some(x=>x.includes("end_time"))}}}),I.jsx(Xs,{fullWidth:!0,label:"Location",value:s.location||"",onChange:x=>a({...s,location:x.target.value}),sx:{mb:2},error:(v=c==null?void 0:c.issues)==null?void 0:v.includes("Missing required field: location")}),I.jsx(Fo,{variant:"contained",onClick:p,disabled:r||c&&!s,sx:{mt:2},children:r?I.jsx(Oy,{size:24}):"Create Event"})]})]})]})})}IS.createRoot(document.getElementById("root")).render(I.jsx(k.StrictMode,{children:I.jsx(PF,{})}));
@@ -0,0 +1,150 @@
+"""Serve the built frontend from memory with compression and cache headers.
+
+Each file is read once and kept in memory together with its gzip and brotli
+variants. Variants built ahead of time (`index.js.gz`, `index.js.br`, see
+`python static_assets.py`) are used when present; otherwise they're
+compressed on first read. The variant is picked from Accept-Encoding.
+
+Vite puts a content hash in every file name under assets/, so those are
+cached by browsers for a year as immutable. Everything else, index.html in
+particular, must be revalidated and gets a strong ETag so an unchanged page
+costs a 304.
+"""
+import gzip
+import hashlib
+import mimetypes
+import os
+import sys
+import threading
+
+from flask import Response
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+IMMUTABLE_PREFIX = 'assets/'
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+REVALIDATE_CACHE_CONTROL = 'no-cache'
+# Types worth compressing; images other than SVG are already compressed
+COMPRESSIBLE_TYPES = ('text/', 'application/javascript', 'application/json', 'image/svg+xml')
+MIN_COMPRESS_BYTES = 512
+
+
+def _compressible(content_type, size):
+    return size >= MIN_COMPRESS_BYTES and content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+class StaticAssets:
+    """In-memory cache of the files under `root`."""
+
+    def __init__(self, root):
+        self.root = os.path.realpath(root)
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def _resolve(self, path):
+        full_path = os.path.realpath(os.path.join(self.root, path))
+        if not full_path.startswith(self.root + os.sep) or not os.path.isfile(full_path):
+            return None
+        return full_path
+
+    def _read_variant(self, full_path, suffix, compress, body):
+        # A prebuilt variant older than its source is from an earlier build
+        if os.path.isfile(full_path + suffix) and os.path.getmtime(full_path + suffix) >= os.path.getmtime(full_path):
+            with open(full_path + suffix, 'rb') as f:
+                return f.read()
+        return compress(body) if compress else None
+
+    def _load(self, path):
+        full_path = self._resolve(path)
+        if full_path is None:
+            return None
+        mtime = os.path.getmtime(full_path)
+        with open(full_path, 'rb') as f:
+            body = f.read()
+        content_type = mimetypes.guess_type(full_path)[0] or 'application/octet-stream'
+        if content_type.startswith('text/') or content_type == 'application/javascript':
+            content_type += '; charset=utf-8'
+        variants = {None: body}
+        if _compressible(content_type, len(body)):
+            variants['gzip'] = self._read_variant(
+                full_path, '.gz', lambda data: gzip.compress(data, 9, mtime=0), body
+            )
+            # Quality 11 is too slow to run inside a request; prebuilt files use it
+            variants['br'] = self._read_variant(
+                full_path, '.br', (lambda data: brotli.compress(data, quality=5)) if brotli else None, body
+            )
+        return {
+            'variants': {encoding: data for encoding, data in variants.items() if data is not None},
+            'content_type': content_type,
+            'etag': hashlib.sha1(body).hexdigest()[:20],
+            'immutable': path.startswith(IMMUTABLE_PREFIX),
+            'path': full_path,
+            'mtime': mtime,
+        }
+
+    def _stale(self, entry):
+        # Hashed assets never change; index.html and friends are rewritten by each build
+        if entry['immutable']:
+            return False
+        try:
+            return os.path.getmtime(entry['path']) != entry['mtime']
+        except OSError:
+            return True
+
+    def get(self, path):
+        """Return the cached entry for `path`, or None if there's no such file."""
+        entry = self._entries.get(path)
+        if entry is None or self._stale(entry):
+            entry = self._load(path)
+            if entry is not None:
+                with self._lock:
+                    self._entries[path] = entry
+        return entry
+
+    def response(self, path, request):
+        """Build the response for `path`, or None if there's no such file."""
+        entry = self.get(path)
+        if entry is None:
+            return None
+        encoding = None
+        for candidate in ('br', 'gzip'):
+            if candidate in entry['variants'] and request.accept_encodings[candidate]:
+                encoding = candidate
+                break
+        response = Response(entry['variants'][encoding], content_type=entry['content_type'])
+        if encoding:
+            response.content_encoding = encoding
+        if len(entry['variants']) > 1:
+            response.vary.add('Accept-Encoding')
+        response.set_etag(f"{entry['etag']}-{encoding}" if encoding else entry['etag'])
+        response.headers['Cache-Control'] = (
+            IMMUTABLE_CACHE_CONTROL if entry['immutable'] else REVALIDATE_CACHE_CONTROL
+        )
+        return response.make_conditional(request)
+
+
+def precompress(root):
+    """Write .gz (and, with brotli installed, .br) files next to compressible files."""
+    for directory, _, files in os.walk(root):
+        for name in files:
+            if name.endswith(('.gz', '.br')):
+                continue
+            full_path = os.path.join(directory, name)
+            content_type = mimetypes.guess_type(full_path)[0] or ''
+            with open(full_path, 'rb') as f:
+                body = f.read()
+            if not _compressible(content_type, len(body)):
+                continue
+            with open(full_path + '.gz', 'wb') as f:
+                f.write(gzip.compress(body, 9, mtime=0))
+            if brotli:
+                with open(full_path + '.br', 'wb') as f:
+                    f.write(brotli.compress(body, quality=11))
+            print(f"Compressed {os.path.relpath(full_path, root)}")
+
+
+if __name__ == '__main__':
+    precompress(sys.argv[1] if len(sys.argv) > 1 else os.path.join(os.path.dirname(os.path.abspath(__file__)), 'dist'))
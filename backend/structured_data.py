@@ -0,0 +1,253 @@
+"""Event details from structured data embedded in a page.
+
+Many event platforms describe the event as a schema.org `Event` in JSON-LD or
+microdata, and some carry OpenGraph `event:` meta tags. These are read
+in one streaming pass over the raw HTML and mapped onto the same
+title/description/start_time/end_time/location fields the AI parse returns,
+so a complete set can skip the LLM and a partial one narrows what it has to
+find.
+"""
+import html as html_lib
+import json
+import logging
+import re
+from datetime import datetime
+
+from text_extract import VOID_TAGS, feed_html
+
+logger = logging.getLogger(__name__)
+
+EVENT_FIELDS = ['title', 'description', 'start_time', 'end_time', 'location']
+
+TAG_PATTERN = re.compile(r'<[^>]+>')
+WHITESPACE = re.compile(r'\s+')
+SENTENCE_END = re.compile(r'(?<=[.!?])\s+')
+
+# Attributes that hold a microdata property's value, by element
+VALUE_ATTRIBUTES = {
+    'meta': 'content', 'time': 'datetime', 'data': 'value', 'a': 'href',
+    'link': 'href', 'area': 'href', 'img': 'src', 'source': 'src',
+}
+
+
+class _StructuredCollector:
+    """Collects JSON-LD blocks, meta tags and microdata items in one pass."""
+
+    full = False
+
+    def __init__(self):
+        self.json_ld = []
+        self.meta = {}
+        self.items = []
+        self._json_buffer = None
+        self._stack = []  # (tag, opened_item, property_capture) per open element
+        self._items = []  # open microdata items
+        self._captures = []  # open property elements awaiting their text
+
+    def start(self, tag, attrs):
+        tag = tag.lower()
+        if tag == 'meta':
+            key = (attrs.get('property') or attrs.get('name') or '').lower()
+            if key and attrs.get('content') and key not in self.meta:
+                self.meta[key] = attrs.get('content')
+        elif tag == 'script' and (attrs.get('type') or '').lower() == 'application/ld+json':
+            self._json_buffer = []
+
+        prop = attrs.get('itemprop')
+        opened_item = None
+        capture = None
+        if 'itemscope' in attrs:
+            opened_item = {'type': attrs.get('itemtype') or '', 'properties': {}}
+            if prop and self._items:
+                self._items[-1]['properties'].setdefault(prop, opened_item)
+            elif not self._items:
+                self.items.append(opened_item)
+            self._items.append(opened_item)
+        elif prop and self._items:
+            value_attribute = VALUE_ATTRIBUTES.get(tag)
+            if attrs.get('content'):
+                self._items[-1]['properties'].setdefault(prop, attrs.get('content'))
+            elif value_attribute and attrs.get(value_attribute):
+                self._items[-1]['properties'].setdefault(prop, attrs.get(value_attribute))
+            elif tag not in VOID_TAGS:
+                capture = [self._items[-1], prop, []]
+                self._captures.append(capture)
+
+        if tag not in VOID_TAGS:
+            self._stack.append((tag, opened_item, capture))
+
+    def end(self, tag):
+        tag = tag.lower()
+        if tag == 'script' and self._json_buffer is not None:
+            self.json_ld.append(''.join(self._json_buffer))
+            self._json_buffer = None
+        if tag in VOID_TAGS or not any(open_tag == tag for open_tag, _, _ in self._stack):
+            return
+        while self._stack:
+            open_tag, opened_item, capture = self._stack.pop()
+            if opened_item is not None:
+                self._items.pop()
+            if capture is not None:
+                self._captures.remove(capture)
+                item, prop, text = capture
+                value = WHITESPACE.sub(' ', ''.join(text)).strip()
+                if value:
+                    item['properties'].setdefault(prop, value)
+            if open_tag == tag:
+                break
+
+    def data(self, text):
+        if self._json_buffer is not None:
+            self._json_buffer.append(text)
+        for capture in self._captures:
+            capture[2].append(text)
+
+
+def _types(node):
+    node_type = node.get('@type') or node.get('type') or ''
+    types = node_type if isinstance(node_type, list) else [node_type]
+    return [str(t).rsplit('/', 1)[-1] for t in types]
+
+
+def _is_event(node):
+    return any(t == 'Event' or t.endswith('Event') for t in _types(node))
+
+
+def _walk_json_ld(node):
+    """Yield every object in a JSON-LD document, including @graph members."""
+    if isinstance(node, list):
+        for child in node:
+            yield from _walk_json_ld(child)
+    elif isinstance(node, dict):
+        yield node
+        for key in ('@graph', 'subEvent', 'itemListElement', 'item'):
+            if key in node:
+                yield from _walk_json_ld(node[key])
+
+
+def _first(value):
+    if isinstance(value, list):
+        return value[0] if value else None
+    return value
+
+
+def _clean_text(value):
+    if not isinstance(value, str):
+        return ''
+    return WHITESPACE.sub(' ', html_lib.unescape(TAG_PATTERN.sub(' ', value))).strip()
+
+
+def _format_location(value):
+    """Turn a schema.org Place/PostalAddress/VirtualLocation (or text) into a string."""
+    value = _first(value)
+    if isinstance(value, str):
+        return _clean_text(value)
+    if not isinstance(value, dict):
+        return ''
+    properties = value.get('properties', value)
+    address = _first(properties.get('address'))
+    if isinstance(address, dict):
+        address_properties = address.get('properties', address)
+        address = ', '.join(
+            _clean_text(address_properties.get(part))
+            for part in ('streetAddress', 'addressLocality', 'addressRegion', 'postalCode')
+            if _clean_text(address_properties.get(part))
+        )
+    parts = [_clean_text(properties.get('name')), _clean_text(address)]
+    if not any(parts):
+        parts = [_clean_text(properties.get('url'))]
+    unique = []
+    for part in parts:
+        if part and part not in unique:
+            unique.append(part)
+    return ', '.join(unique)
+
+
+def _format_datetime(value):
+    """Return an ISO datetime string, or '' for dates without a time of day."""
+    value = _clean_text(_first(value))
+    if 'T' not in value:
+        return ''
+    try:
+        datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return ''
+    return value
+
+
+def _fields_from_schema(properties):
+    return {
+        'title': _clean_text(_first(properties.get('name'))),
+        'description': _clean_text(_first(properties.get('description'))),
+        'start_time': _format_datetime(properties.get('startDate')),
+        'end_time': _format_datetime(properties.get('endDate')),
+        'location': _format_location(properties.get('location')),
+    }
+
+
+def _fields_from_meta(meta):
+    # og:/twitter: descriptions are link-preview teasers, not event descriptions
+    return {
+        'title': _clean_text(meta.get('og:title') or meta.get('twitter:title')),
+        'start_time': _format_datetime(meta.get('event:start_time')),
+        'end_time': _format_datetime(meta.get('event:end_time')),
+        'location': _clean_text(meta.get('event:location') or meta.get('og:locality')),
+    }
+
+
+def _schema_events(collector):
+    """Return field dicts for every schema.org Event in JSON-LD and microdata."""
+    events = []
+    for block in collector.json_ld:
+        try:
+            document = json.loads(block.strip())
+        except ValueError:
+            logger.debug("Skipping malformed JSON-LD block")
+            continue
+        events.extend(_fields_from_schema(node) for node in _walk_json_ld(document) if _is_event(node))
+
+    pending = list(collector.items)
+    while pending:
+        item = pending.pop(0)
+        if _is_event({'@type': item['type'].split()}):
+            events.append(_fields_from_schema(item['properties']))
+        pending.extend(v for v in item['properties'].values() if isinstance(v, dict))
+    return events
+
+def summarize_description(description, max_sentences=3, max_chars=400):
+    """Shorten a description to a few sentences for brief description styles."""
+    sentences = SENTENCE_END.split(description)
+    summary = ' '.join(sentences[:max_sentences])
+    if len(summary) > max_chars:
+        summary = summary[:max_chars].rsplit(' ', 1)[0] + '...'
+    return summary
+
+
+def extract_structured_event(page_content):
+    """Return the event fields found in the page's structured data.
+
+    Only fields that were found are included. Fields come from the page's
+    schema.org Event (JSON-LD first, then microdata), with meta tags filling any
+    still missing. Meta tags are only read when the page has event data (a
+    schema.org Event or `event:*` tags): every page has an og:title, and on
+    most of them it isn't an event title. Pages describing several different
+    events are listings, so their schema.org data is ignored.
+    """
+    collector = _StructuredCollector()
+    feed_html(page_content, collector)
+
+    candidates = []
+    events = _schema_events(collector)
+    if len({event['title'] for event in events}) == 1:
+        candidates.extend(events)
+    elif events:
+        logger.info(f"Ignoring structured data describing {len(events)} different events")
+    if candidates or any(key.startswith('event:') for key in collector.meta):
+        candidates.append(_fields_from_meta(collector.meta))
+
+    fields = {}
+    for candidate in candidates:
+        for field in EVENT_FIELDS:
+            if field not in fields and candidate.get(field):
+                fields[field] = candidate[field]
+    return fields
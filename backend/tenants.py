@@ -0,0 +1,153 @@
+"""Tenants: the calendars one deployment serves, and who is routed to each.
+
+Each tenant has its own calendar, Google token and time zones. API requests
+are routed by their `X-API-Key` header. The bot serves many chats with one
+key (BOT_API_KEY) and sends `X-Chat-ID` alongside it, and is routed by chat.
+Requests with neither go to the default tenant, so a single-calendar
+deployment needs no tenant file at all.
+
+Calendar clients are pooled per tenant. A tenant's CalendarClientFactory is
+built on first use and kept in an LRU pool of at most `max_clients`; tenants
+idle for `idle_timeout` seconds are evicted and their token refreshers
+stopped, so memory doesn't grow with the number of tenants. Each factory
+lends at most `client_pool_size` clients at once, and loads and refreshes its
+credentials under its own lock, so one tenant's slow token refresh doesn't
+hold up the others.
+"""
+import hmac
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+from calendar_client import CalendarClientFactory
+
+logger = logging.getLogger(__name__)
+
+Tenant = namedtuple(
+    'Tenant', ['name', 'calendar_id', 'timezone', 'feed_timezone', 'token_path', 'credentials_path']
+)
+
+
+class TenantRegistry:
+    """Routes API keys and chats to tenants and pools their Calendar clients."""
+
+    def __init__(self, tenants, default=None, api_keys=None, chat_ids=None, bot_key=None,
+                 max_clients=32, idle_timeout=3600, client_pool_size=10):
+        self._tenants = {tenant.name: tenant for tenant in tenants}
+        self.default = self._tenants[default] if default else tenants[0]
+        self._by_key = {key: self._tenants[name] for key, name in (api_keys or {}).items()}
+        self._by_chat = {str(chat_id): self._tenants[name] for chat_id, name in (chat_ids or {}).items()}
+        self._by_calendar = {tenant.calendar_id: tenant for tenant in tenants}
+        self.bot_key = bot_key
+        self.max_clients = max_clients
+        self.idle_timeout = idle_timeout
+        self.client_pool_size = client_pool_size
+        self._pool = OrderedDict()  # tenant name -> (factory, last used), least recently used first
+        self._lock = threading.Lock()
+        self._built = 0
+        self._evicted = 0
+
+    def get(self, name):
+        """The tenant called `name`, or None."""
+        return self._tenants.get(name)
+
+    def for_calendar(self, calendar_id):
+        """The tenant whose calendar is `calendar_id`, or None."""
+        return self._by_calendar.get(calendar_id)
+
+    def resolve(self, api_key=None, chat_id=None):
+        """The tenant a request is for, or None if it carries an unknown API key.
+
+        The chat id is only trusted from requests carrying the bot's key.
+        """
+        if not api_key:
+            return self.default
+        if self.bot_key and hmac.compare_digest(api_key, self.bot_key):
+            return self._by_chat.get(str(chat_id), self.default) if chat_id else self.default
+        return self._by_key.get(api_key)
+
+    def clients(self, tenant):
+        """The tenant's Calendar client factory, from the pool or built now (without touching its token)."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._pool.pop(tenant.name, None)
+            if entry is None:
+                factory = CalendarClientFactory(
+                    tenant.token_path, tenant.credentials_path, pool_size=self.client_pool_size
+                )
+                self._built += 1
+            else:
+                factory = entry[0]
+            self._pool[tenant.name] = (factory, now)
+            evicted = self._evict(now)
+        for name, idle in evicted:
+            logger.info(f"Evicted the Calendar clients of tenant {name}")
+            idle.close()
+        return factory
+
+    def _evict(self, now):
+        """Drop the least recently used factories past max_clients or idle too long."""
+        evicted = []
+        while len(self._pool) > self.max_clients:
+            name, (factory, _) = self._pool.popitem(last=False)
+            evicted.append((name, factory))
+        while self._pool:
+            name, (factory, used) = next(iter(self._pool.items()))
+            if now - used < self.idle_timeout:
+                break
+            del self._pool[name]
+            evicted.append((name, factory))
+        self._evicted += len(evicted)
+        return evicted
+
+    def stats(self):
+        with self._lock:
+            return {
+                'tenants': len(self._tenants),
+                'pooled_clients': len(self._pool),
+                'clients_built': self._built,
+                'clients_evicted': self._evicted,
+            }
+
+
+def tenants_from_env():
+    """Build the registry from TENANTS_PATH, or a single default tenant from the environment.
+
+    TENANTS_PATH names a JSON list of tenants, each with a `name` and any of
+    `calendar_id`, `timezone`, `feed_timezone`, `token_path`,
+    `credentials_path`, `api_keys` and `chat_ids`. Missing settings fall back
+    to CALENDAR_ID, CALENDAR_TIMEZONE, FEED_TIMEZONE, GOOGLE_TOKEN_PATH and
+    GOOGLE_CREDENTIALS_PATH. The first tenant is the default unless
+    DEFAULT_TENANT names another.
+    """
+    defaults = {
+        'calendar_id': os.getenv('CALENDAR_ID', 'cohere@unforced.org'),
+        'timezone': os.getenv('CALENDAR_TIMEZONE', 'America/Chicago'),
+        'feed_timezone': os.getenv('FEED_TIMEZONE', 'America/Denver'),
+        'token_path': os.getenv('GOOGLE_TOKEN_PATH', 'token.pickle'),
+        'credentials_path': os.getenv('GOOGLE_CREDENTIALS_PATH', 'credentials.json'),
+    }
+    path = os.getenv('TENANTS_PATH')
+    entries = [{'name': 'default'}]
+    if path:
+        with open(path) as f:
+            entries = json.load(f)
+    tenants, api_keys, chat_ids = [], {}, {}
+    for entry in entries:
+        tenant = Tenant(name=entry['name'], **{field: entry.get(field, value) for field, value in defaults.items()})
+        tenants.append(tenant)
+        api_keys.update((key, tenant.name) for key in entry.get('api_keys', []))
+        chat_ids.update((chat_id, tenant.name) for chat_id in entry.get('chat_ids', []))
+    return TenantRegistry(
+        tenants,
+        default=os.getenv('DEFAULT_TENANT') or None,
+        api_keys=api_keys,
+        chat_ids=chat_ids,
+        bot_key=os.getenv('BOT_API_KEY') or None,
+        max_clients=int(os.getenv('TENANT_MAX_CLIENTS', 32)),
+        idle_timeout=float(os.getenv('TENANT_IDLE_TIMEOUT', 3600)),
+        client_pool_size=int(os.getenv('CALENDAR_CLIENT_POOL_SIZE', 10)),
+    )
@@ -0,0 +1,215 @@
+"""Single-pass HTML to text extraction for LLM prompts.
+
+The page is streamed through a SAX-style parser once. Each text node is
+emitted exactly once, block-level tags start a new line, and navigation,
+footers, cookie banners and other boilerplate are dropped. Output stops once
+the token budget is reached.
+
+Boilerplate is recognised by whole words of an element's class names and id
+("cookie-banner", "share_buttons"), never by substrings, and a name that also
+says it holds content ("event-share-container") is kept. The page's own
+containers (body, main, article, role=main) are never dropped, whatever their
+classes, since dropping one would lose the whole page.
+
+lxml's libxml2 parser is used when it is installed, with the standard
+library's html.parser as a fallback.
+"""
+import re
+from html.parser import HTMLParser
+
+try:
+    from lxml import etree
+except ImportError:  # pragma: no cover - lxml is optional
+    etree = None
+
+# Elements whose content never reaches the prompt
+SKIP_TAGS = {
+    'script', 'style', 'noscript', 'template', 'svg', 'iframe', 'object',
+    'canvas', 'nav', 'footer', 'button', 'select', 'option',
+}
+SKIP_ROLES = {'navigation', 'contentinfo', 'search', 'dialog', 'alertdialog'}
+# Words of a class name or id that mark it as boilerplate, unless it also has a content word
+BOILERPLATE_WORDS = {
+    'cookie', 'cookies', 'consent', 'gdpr', 'newsletter', 'subscribe', 'breadcrumb', 'breadcrumbs',
+    'share', 'sharing', 'social', 'advert', 'adverts', 'advertisement', 'promo', 'promos', 'skip',
+}
+CONTENT_WORDS = {'event', 'events', 'content', 'main', 'article', 'post', 'entry', 'description', 'details'}
+# Containers of the page itself, kept even when their classes look like boilerplate
+CONTENT_TAGS = {'html', 'body', 'main', 'article'}
+NAME_WORDS = re.compile(r'[\s_-]+')
+
+# Elements that start a new line of output
+BLOCK_TAGS = {
+    'address', 'article', 'aside', 'blockquote', 'br', 'dd', 'details', 'div',
+    'dl', 'dt', 'figcaption', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header',
+    'hr', 'li', 'main', 'ol', 'p', 'pre', 'section', 'summary', 'table', 'td',
+    'th', 'title', 'tr', 'ul',
+}
+
+VOID_TAGS = {
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta',
+    'param', 'source', 'track', 'wbr',
+}
+
+WHITESPACE = re.compile(r'\s+')
+
+# Rough characters-per-token ratio used to turn a token budget into a size
+CHARS_PER_TOKEN = 4
+DEFAULT_MAX_TOKENS = 6000
+
+
+def _is_boilerplate_name(name):
+    words = set(NAME_WORDS.split(name.lower()))
+    return bool(words & BOILERPLATE_WORDS) and not words & CONTENT_WORDS
+
+
+def _is_boilerplate(tag, attrs):
+    if tag in SKIP_TAGS:
+        return True
+    if attrs.get('aria-hidden') == 'true' or 'hidden' in attrs:
+        return True
+    role = (attrs.get('role') or '').lower()
+    if role in SKIP_ROLES:
+        return True
+    if tag in CONTENT_TAGS or role == 'main':
+        return False
+    names = (attrs.get('class') or '').split()
+    if attrs.get('id'):
+        names.append(attrs['id'])
+    return any(_is_boilerplate_name(name) for name in names)
+
+
+class _TextCollector:
+    """Parser callbacks that build the line list; shared by both backends."""
+
+    def __init__(self, max_chars):
+        self.max_chars = max_chars
+        self.lines = []
+        self.size = 0
+        self.full = False
+        self._seen = set()
+        self._buffer = []
+        self._stack = []  # (tag, skipped) for each open element
+        self._skip_depth = 0
+
+    def _flush(self):
+        if not self._buffer:
+            return
+        line = WHITESPACE.sub(' ', ''.join(self._buffer)).strip()
+        self._buffer = []
+        if not line or line in self._seen or self.full:
+            return
+        self._seen.add(line)
+        remaining = self.max_chars - self.size
+        if len(line) >= remaining:
+            line = line[:remaining].rstrip()
+            self.full = True
+        self.lines.append(line)
+        self.size += len(line) + 1
+
+    def start(self, tag, attrs):
+        tag = tag.lower()
+        if tag in BLOCK_TAGS:
+            self._flush()
+        if tag in VOID_TAGS:
+            return
+        skipped = self._skip_depth > 0 or _is_boilerplate(tag, attrs)
+        if skipped:
+            self._skip_depth += 1
+        self._stack.append((tag, skipped))
+
+    def end(self, tag):
+        tag = tag.lower()
+        if tag in BLOCK_TAGS:
+            self._flush()
+        if tag in VOID_TAGS or not any(open_tag == tag for open_tag, _ in self._stack):
+            return
+        # Close everything up to the matching tag, as browsers do for stray end tags
+        while self._stack:
+            open_tag, skipped = self._stack.pop()
+            if skipped:
+                self._skip_depth -= 1
+            if open_tag == tag:
+                break
+
+    def data(self, text):
+        if not self._skip_depth and not self.full:
+            self._buffer.append(text)
+
+    def close(self):
+        self._flush()
+        return '\n'.join(self.lines)
+
+
+class _StdlibParser(HTMLParser):
+    """html.parser adapter feeding a collector's start/end/data callbacks."""
+
+    def __init__(self, collector):
+        super().__init__(convert_charrefs=True)
+        self.collector = collector
+
+    def handle_starttag(self, tag, attrs):
+        self.collector.start(tag, dict(attrs))
+
+    def handle_startendtag(self, tag, attrs):
+        self.collector.start(tag, dict(attrs))
+        self.collector.end(tag)
+
+    def handle_endtag(self, tag):
+        self.collector.end(tag)
+
+    def handle_data(self, data):
+        self.collector.data(data)
+
+
+class _LxmlTarget:
+    """lxml parser target feeding a collector's start/end/data callbacks."""
+
+    def __init__(self, collector):
+        self.collector = collector
+
+    def start(self, tag, attrib):
+        if isinstance(tag, str):
+            self.collector.start(tag, attrib)
+
+    def end(self, tag):
+        if isinstance(tag, str):
+            self.collector.end(tag)
+
+    def data(self, data):
+        self.collector.data(data)
+
+    def comment(self, text):
+        pass
+
+    def close(self):
+        return None
+
+
+def feed_html(html, collector, backend=None, chunk_size=64 * 1024):
+    """Stream `html` through a parser, calling `collector.start/end/data`.
+
+    Parsing stops early once `collector.full` becomes true. `backend` is 'lxml'
+    or 'stdlib'; by default lxml is used when available.
+    """
+    if not html or not html.strip():
+        return
+    backend = backend or ('lxml' if etree is not None else 'stdlib')
+    if backend == 'lxml':
+        parser = etree.HTMLParser(target=_LxmlTarget(collector), remove_comments=True)
+    else:
+        parser = _StdlibParser(collector)
+
+    for offset in range(0, len(html), chunk_size):
+        if collector.full:
+            return
+        parser.feed(html[offset:offset + chunk_size])
+    if not collector.full:
+        parser.close()
+
+
+def extract_text(html, max_tokens=DEFAULT_MAX_TOKENS, backend=None):
+    """Return the readable text of `html`, one block per line."""
+    collector = _TextCollector(max_tokens * CHARS_PER_TOKEN)
+    feed_html(html, collector, backend)
+    return collector.close()
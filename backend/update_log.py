@@ -0,0 +1,102 @@
+"""Record of Telegram updates the bot has already taken on.
+
+Telegram redelivers a webhook update when it doesn't get a timely 200, and
+behind a load balancer the redelivery can reach a different bot replica. Each
+update id is recorded when it's first dispatched; a replica that sees it
+again skips it. An update is marked before it's handled, so a replica that
+dies mid-update loses it rather than risking a second reply.
+
+The SQLite log can be shared by every replica on the same host using the same
+file, like the pending event store. Replicas on separate hosts share a Redis
+log instead, where one SET NX per update decides which replica handles it.
+"""
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+try:
+    import redis
+except ImportError:  # only needed for PENDING_STORE=redis
+    redis = None
+
+
+class MemoryUpdateLog:
+    """In-process log, for a single bot process."""
+
+    def __init__(self, ttl=86400, max_entries=10000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._seen = OrderedDict()  # update_id -> seen_at
+        self._lock = threading.Lock()
+
+    def first_delivery(self, update_id):
+        """Record `update_id` and return True, or False if it was already recorded."""
+        now = time.time()
+        with self._lock:
+            while self._seen and next(iter(self._seen.values())) <= now - self.ttl:
+                self._seen.popitem(last=False)
+            if update_id in self._seen:
+                return False
+            self._seen[update_id] = now
+            while len(self._seen) > self.max_entries:
+                self._seen.popitem(last=False)
+            return True
+
+
+class SQLiteUpdateLog:
+    """SQLite-backed log shared by every bot process using the same file."""
+
+    def __init__(self, path, ttl=86400):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._inserts = 0
+        self._db = sqlite3.connect(path, timeout=5, isolation_level=None, check_same_thread=False)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute(
+            'CREATE TABLE IF NOT EXISTS seen_updates ('
+            ' update_id INTEGER PRIMARY KEY,'
+            ' seen_at REAL NOT NULL)'
+        )
+        self._db.execute('CREATE INDEX IF NOT EXISTS seen_updates_seen_at ON seen_updates (seen_at)')
+
+    def first_delivery(self, update_id):
+        """Record `update_id` and return True, or False if any replica already recorded it."""
+        now = time.time()
+        with self._lock:
+            # The primary key makes this atomic across processes; only one insert succeeds
+            inserted = self._db.execute(
+                'INSERT OR IGNORE INTO seen_updates (update_id, seen_at) VALUES (?, ?)', (update_id, now)
+            ).rowcount
+            self._inserts += 1
+            if self._inserts % 500 == 0:
+                self._db.execute('DELETE FROM seen_updates WHERE seen_at <= ?', (now - self.ttl,))
+        return bool(inserted)
+
+
+class RedisUpdateLog:
+    """Redis-backed log shared by bot replicas on any host."""
+
+    def __init__(self, url, ttl=86400, prefix='seen_updates'):
+        if redis is None:
+            raise RuntimeError('PENDING_STORE=redis needs the redis package (pip install redis)')
+        self.ttl = ttl
+        self.prefix = prefix
+        self._redis = redis.Redis.from_url(url)
+
+    def first_delivery(self, update_id):
+        """Record `update_id` and return True, or False if any replica already recorded it."""
+        # SET NX succeeds for exactly one replica; the key expires with the TTL
+        return bool(self._redis.set(f'{self.prefix}:{update_id}', 1, nx=True, ex=self.ttl))
+
+
+def update_log_from_env():
+    """Build the update log from PENDING_STORE, PENDING_DB_PATH or REDIS_URL, and SEEN_UPDATE_TTL."""
+    ttl = int(os.getenv('SEEN_UPDATE_TTL', 86400))
+    store = os.getenv('PENDING_STORE', 'sqlite')
+    if store == 'memory':
+        return MemoryUpdateLog(ttl=ttl)
+    if store == 'redis':
+        return RedisUpdateLog(os.getenv('REDIS_URL', 'redis://localhost:6379/0'), ttl=ttl)
+    return SQLiteUpdateLog(os.getenv('PENDING_DB_PATH', 'pending_events.sqlite3'), ttl=ttl)
@@ -0,0 +1,322 @@
+"""Watch list of created events and the pages they were parsed from.
+
+Every calendar event created from a link is watched: a scheduler re-fetches
+its source page (conditionally, through the shared HTTP cache) and hashes the
+extracted text. Only when the hash changes is the page parsed again, and only
+the fields whose parsed value changed are sent to the calendar as a patch, so
+edits made by hand to other fields are kept. A watch starts from the hash of
+the page the event was parsed from, so a change made before the first check
+is caught; one added without it records a baseline on its first check. The
+text of the last version checked is kept, so a check can tell how much of the
+page changed.
+
+Checks are spread out by how soon the event starts (daily for events a month
+away, hourly on the day) and made more frequent for pages that change often.
+Watches end once the event is over, its calendar entry is gone, or its page
+keeps failing.
+
+The watch list lives in SQLite. Any process may run the scheduler once its
+server starts it; a check is leased to one process at a time, like parse jobs.
+"""
+import json
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+from collections import Counter
+
+from local_db import busy_timeout, thread_local
+
+logger = logging.getLogger(__name__)
+
+HOUR = 3600
+DAY = 24 * HOUR
+
+
+def next_interval(seconds_until_start, change_rate, min_interval=15 * 60, max_interval=DAY):
+    """Seconds until the next check of a page.
+
+    Sooner as the event approaches; a page that changed on every check so far
+    is checked four times as often as one that never changed.
+    """
+    if seconds_until_start > 30 * DAY:
+        interval = DAY
+    elif seconds_until_start > 7 * DAY:
+        interval = 12 * HOUR
+    elif seconds_until_start > DAY:
+        interval = 3 * HOUR
+    else:
+        interval = HOUR
+    interval /= 1 + 3 * change_rate
+    return max(min_interval, min(max_interval, interval))
+
+
+def changed_materially(old_text, new_text, threshold=0.05):
+    """Whether at least `threshold` of a page's text, by length, is in lines added or removed.
+
+    Text that's unknown (not yet seen, or not extracted because the page's
+    structured data describes the whole event) counts as changed.
+    """
+    if old_text is None or new_text is None:
+        return True
+    old_lines, new_lines = Counter(old_text.splitlines()), Counter(new_text.splitlines())
+    edits = (old_lines - new_lines) + (new_lines - old_lines)
+    changed = sum(len(line) * count for line, count in edits.items())
+    return changed >= threshold * max(len(old_text) + len(new_text), 1)
+
+
+class EventWatcher:
+    """SQLite watch list with a scheduler, started with `start()`.
+
+    `check(watch)` re-checks one watch (a dict as returned by `get`) and
+    returns a dict with:
+
+    - 'text_hash': hash of the page content just fetched
+    - 'page_text': the page's extracted text, or None if it wasn't extracted
+    - 'details': the page's parsed fields if it was parsed again, else None
+    - 'patched': the fields sent to the calendar
+    - 'start' / 'end': the event's times as epoch seconds, if they changed
+    - 'gone': true if the calendar event no longer exists
+
+    It may raise; the error is recorded and the page is checked again later.
+    """
+
+    def __init__(self, path, check, workers=1, poll_interval=60, lease_seconds=600,
+                 min_interval=15 * 60, max_errors=10):
+        self.path = path
+        self.check = check
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.min_interval = min_interval
+        self.max_errors = max_errors
+        self._local = thread_local()
+        self._wakeup = threading.Condition()
+        self._start_lock = threading.Lock()
+        self._threads = []
+        self._stopping = False
+        self._init_db()
+
+    def _connect(self):
+        db = getattr(self._local, 'db', None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=busy_timeout(10), isolation_level=None)
+            db.row_factory = sqlite3.Row
+            self._local.db = db
+        return db
+
+    def _init_db(self):
+        db = self._connect()
+        db.execute('PRAGMA journal_mode=WAL')
+        db.execute(
+            'CREATE TABLE IF NOT EXISTS watched_events ('
+            ' event_id TEXT PRIMARY KEY,'
+            ' calendar_id TEXT NOT NULL,'
+            ' url TEXT NOT NULL,'
+            ' description_style TEXT NOT NULL,'
+            ' details TEXT NOT NULL,'
+            ' text_hash TEXT,'
+            ' page_text TEXT,'
+            ' starts_at REAL,'
+            ' ends_at REAL,'
+            ' checks INTEGER NOT NULL DEFAULT 0,'
+            ' changes INTEGER NOT NULL DEFAULT 0,'
+            ' patches INTEGER NOT NULL DEFAULT 0,'
+            ' errors INTEGER NOT NULL DEFAULT 0,'
+            ' last_error TEXT,'
+            ' last_checked_at REAL,'
+            ' last_changed_at REAL,'
+            ' next_check_at REAL NOT NULL,'
+            ' lease_until REAL,'
+            ' created_at REAL NOT NULL)'
+        )
+        db.execute('CREATE INDEX IF NOT EXISTS watched_events_due ON watched_events (next_check_at)')
+
+    def start(self):
+        """Start the scheduler threads, once."""
+        with self._start_lock:
+            if self._threads:
+                return
+            for index in range(self.workers):
+                thread = threading.Thread(target=self._work, name=f'event-watcher-{index}', daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def watch(self, event_id, calendar_id, url, details, starts_at, ends_at, description_style='default',
+              text_hash=None):
+        """Watch `url` as the source of `event_id`.
+
+        `details` are the fields the event was created with, and `text_hash`
+        the hash of the page they were parsed from, if known.
+        """
+        now = time.time()
+        self._connect().execute(
+            'INSERT OR REPLACE INTO watched_events'
+            ' (event_id, calendar_id, url, description_style, details, text_hash, starts_at, ends_at,'
+            ' next_check_at, created_at)'
+            ' VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (event_id, calendar_id, url, description_style, json.dumps(details), text_hash, starts_at, ends_at,
+             now + self._interval(starts_at, 0, 0, now), now)
+        )
+
+    def unwatch(self, event_id):
+        """Stop watching an event. Returns whether it was watched."""
+        return bool(self._connect().execute(
+            'DELETE FROM watched_events WHERE event_id = ?', (event_id,)
+        ).rowcount)
+
+    def _watch_dict(self, row, with_text=False):
+        watch = dict(row)
+        watch['details'] = json.loads(watch['details'])
+        watch.pop('lease_until')
+        if not with_text:
+            watch.pop('page_text')
+        return watch
+
+    def get(self, event_id):
+        """Return the watch for `event_id` as a dict, or None."""
+        row = self._connect().execute('SELECT * FROM watched_events WHERE event_id = ?', (event_id,)).fetchone()
+        return self._watch_dict(row) if row else None
+
+    def list(self, limit=100, calendar_id=None):
+        """Watches, of one calendar if given, in the order they're due to be checked."""
+        if calendar_id is None:
+            rows = self._connect().execute(
+                'SELECT * FROM watched_events ORDER BY next_check_at LIMIT ?', (limit,)
+            ).fetchall()
+        else:
+            rows = self._connect().execute(
+                'SELECT * FROM watched_events WHERE calendar_id = ? ORDER BY next_check_at LIMIT ?',
+                (calendar_id, limit)
+            ).fetchall()
+        return [self._watch_dict(row) for row in rows]
+
+    def stats(self):
+        row = self._connect().execute(
+            'SELECT COUNT(*), COALESCE(SUM(checks), 0), COALESCE(SUM(changes), 0), COALESCE(SUM(patches), 0),'
+            ' COALESCE(SUM(errors > 0), 0), MIN(next_check_at) FROM watched_events'
+        ).fetchone()
+        return {
+            'watched': row[0],
+            'checks': row[1],
+            'changes': row[2],
+            'patches': row[3],
+            'failing': row[4],
+            'next_check_in_seconds': round(max(0.0, row[5] - time.time()), 1) if row[5] else None,
+        }
+
+    def _interval(self, starts_at, checks, changes, now):
+        # Smoothed so one early change doesn't mark a page as volatile for good
+        change_rate = changes / (checks + 2)
+        interval = next_interval((starts_at or now) - now, change_rate, self.min_interval)
+        # Jitter keeps watches created together from being checked together
+        return interval * random.uniform(0.9, 1.1)
+
+    def _claim(self):
+        """Lease the most overdue watch and return it, or None if none is due."""
+        now = time.time()
+        db = self._connect()
+        db.execute('BEGIN IMMEDIATE')
+        try:
+            # Events that are over no longer need watching
+            db.execute('DELETE FROM watched_events WHERE ends_at < ?', (now,))
+            row = db.execute(
+                'SELECT * FROM watched_events WHERE next_check_at <= ? AND (lease_until IS NULL OR lease_until < ?)'
+                ' ORDER BY next_check_at LIMIT 1',
+                (now, now)
+            ).fetchone()
+            if row is not None:
+                db.execute(
+                    'UPDATE watched_events SET lease_until = ? WHERE event_id = ?',
+                    (now + self.lease_seconds, row['event_id'])
+                )
+            db.execute('COMMIT')
+        except Exception:
+            db.execute('ROLLBACK')
+            raise
+        return self._watch_dict(row, with_text=True) if row else None
+
+    def _record(self, watch, outcome):
+        now = time.time()
+        if outcome.get('gone'):
+            logger.info(f"Event {watch['event_id']} is gone from the calendar, no longer watching")
+            self.unwatch(watch['event_id'])
+            return
+        changed = outcome['text_hash'] != watch['text_hash'] and watch['text_hash'] is not None
+        checks = watch['checks'] + 1
+        changes = watch['changes'] + int(changed)
+        starts_at = outcome.get('start') or watch['starts_at']
+        details = outcome['details'] if outcome['details'] is not None else watch['details']
+        self._connect().execute(
+            'UPDATE watched_events SET text_hash = ?, page_text = ?, details = ?, starts_at = ?, ends_at = ?,'
+            ' checks = ?, changes = ?, patches = patches + ?, errors = 0, last_error = NULL, last_checked_at = ?,'
+            ' last_changed_at = ?, next_check_at = ?, lease_until = NULL WHERE event_id = ?',
+            (outcome['text_hash'], outcome.get('page_text'), json.dumps(details), starts_at, outcome.get('end') or watch['ends_at'],
+             checks, changes, int(bool(outcome.get('patched'))), now,
+             now if changed else watch['last_changed_at'], now + self._interval(starts_at, checks, changes, now),
+             watch['event_id'])
+        )
+        if outcome.get('patched'):
+            logger.info(f"Patched {', '.join(outcome['patched'])} of event {watch['event_id']} from {watch['url']}")
+
+    def _record_error(self, watch, error):
+        now = time.time()
+        errors = watch['errors'] + 1
+        if errors >= self.max_errors:
+            logger.warning(f"Giving up on {watch['url']} for event {watch['event_id']} after {errors} failed checks")
+            self.unwatch(watch['event_id'])
+            return
+        self._connect().execute(
+            'UPDATE watched_events SET errors = ?, last_error = ?, last_checked_at = ?, next_check_at = ?,'
+            ' lease_until = NULL WHERE event_id = ?',
+            (errors, str(error)[:500], now,
+             now + self._interval(watch['starts_at'], watch['checks'], watch['changes'], now),
+             watch['event_id'])
+        )
+
+    def check_due(self):
+        """Check one due watch. Returns False if none was due."""
+        watch = self._claim()
+        if watch is None:
+            return False
+        try:
+            outcome = self.check(watch)
+        except Exception as e:
+            logger.warning(f"Check of {watch['url']} for event {watch['event_id']} failed: {str(e)}")
+            self._record_error(watch, e)
+        else:
+            self._record(watch, outcome)
+        return True
+
+    def _work(self):
+        while not self._stopping:
+            try:
+                if self.check_due():
+                    continue
+            except sqlite3.Error as e:
+                logger.error(f"Event watcher error: {e}")
+            with self._wakeup:
+                self._wakeup.wait(self.poll_interval)
+
+    def stop(self):
+        """Stop the scheduler threads after their current check."""
+        self._stopping = True
+        with self._wakeup:
+            self._wakeup.notify_all()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        self._stopping = False
+
+
+def watcher_from_env(check):
+    """Build the event watcher from WATCH_* environment variables."""
+    return EventWatcher(
+        path=os.getenv('WATCH_DB_PATH', 'watched_events.sqlite3'),
+        check=check,
+        workers=int(os.getenv('WATCH_WORKERS', 1)),
+        poll_interval=float(os.getenv('WATCH_POLL_INTERVAL', 60)),
+        min_interval=float(os.getenv('WATCH_MIN_INTERVAL', 15 * 60)),
+    )
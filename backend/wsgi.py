@@ -1,4 +1,15 @@
-from app import app
+"""WSGI entrypoint: the app, plus its background parse jobs, watched page checks and first calendar sync.
+
+Gunicorn imports this module in each worker after forking (unless it runs
+with --preload), so their threads run in the process serving requests, and
+jobs queued before a restart are picked up without waiting for a new one.
+Importing app alone, as the benchmarks and scripts do, starts no threads.
+"""
+from app import app, event_watcher, parse_jobs, start_first_sync
+
+parse_jobs.start()
+event_watcher.start()
+start_first_sync()
 
 if __name__ == "__main__":
     app.run()